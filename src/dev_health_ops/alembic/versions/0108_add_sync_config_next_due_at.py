@@ -0,0 +1,52 @@
+"""Add the sync scheduler's due-time index to sync_configurations.
+
+Revision ID: 0108
+Revises: 0107
+Create Date: 2026-10-16 00:00:00
+
+``dispatch_scheduled_syncs`` used to load every active config on each beat
+tick and evaluate them one by one. With ``SYNC_SCHEDULER_DUE_INDEX_ENABLED``
+it selects only configs whose ``next_due_at`` has passed, so the column needs
+the ``(is_active, next_due_at)`` access path declared by the model.
+
+Nullable, no backfill: NULL means "not yet indexed" and is selected as due,
+so the first indexed tick evaluates every config once and stamps it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0108"
+down_revision: str | None = "0107"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+__all__ = ["revision", "down_revision", "branch_labels", "depends_on"]
+
+_TABLE = "sync_configurations"
+_INDEX = "ix_sync_config_active_next_due"
+
+
+def upgrade() -> None:
+    op.add_column(
+        _TABLE,
+        sa.Column(
+            "next_due_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment=(
+                "Scheduler due-time index: earliest time this config needs "
+                "evaluating again. NULL means not yet indexed (due now)."
+            ),
+        ),
+    )
+    op.create_index(_INDEX, _TABLE, ["is_active", "next_due_at"])
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX, table_name=_TABLE)
+    op.drop_column(_TABLE, "next_due_at")
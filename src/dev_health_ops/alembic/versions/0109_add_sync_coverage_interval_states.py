@@ -0,0 +1,89 @@
+"""Add the incrementally maintained sync-coverage interval store.
+
+Revision ID: 0109
+Revises: 0108
+Create Date: 2026-10-16 00:00:00
+
+``sync_coverage_interval_states`` holds pre-merged requested / covered /
+failed intervals per (org, integration, source, effective dataset).
+``finalize_sync_run`` folds each terminal run into it and stamps
+``sync_runs.coverage_applied_at``; coverage reads replay only the units of
+runs that are still unstamped, which the partial index keeps cheap to find.
+
+No backfill: every existing run starts unstamped, so reads behave exactly as
+before until ``dev-hops maintenance sync-coverage-intervals --apply`` seeds
+the store.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0109"
+down_revision: str | None = "0108"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+__all__ = ["revision", "down_revision", "branch_labels", "depends_on"]
+
+_TABLE = "sync_coverage_interval_states"
+_RUNS_TABLE = "sync_runs"
+_RUNS_INDEX = "ix_sync_runs_coverage_unapplied"
+
+
+def upgrade() -> None:
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("org_id", sa.String(), nullable=False),
+        sa.Column("integration_id", sa.Uuid(), nullable=False),
+        sa.Column("source_id", sa.Uuid(), nullable=False),
+        sa.Column("dataset_key", sa.String(), nullable=False),
+        sa.Column("requested", sa.JSON(), nullable=False),
+        sa.Column("covered", sa.JSON(), nullable=False),
+        sa.Column("failed", sa.JSON(), nullable=False),
+        sa.Column("success_marks", sa.JSON(), nullable=False),
+        sa.Column("last_run_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_unit_id", sa.Uuid(), nullable=True),
+        sa.Column("unit_count", sa.Integer(), nullable=False),
+        sa.Column("is_stale", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "org_id",
+            "integration_id",
+            "source_id",
+            "dataset_key",
+            name="uq_sync_coverage_interval_state_pair",
+        ),
+    )
+    op.add_column(
+        _RUNS_TABLE,
+        sa.Column("coverage_applied_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        _RUNS_INDEX,
+        _RUNS_TABLE,
+        ["org_id", "integration_id"],
+        postgresql_where=sa.text("coverage_applied_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(_RUNS_INDEX, table_name=_RUNS_TABLE)
+    op.drop_column(_RUNS_TABLE, "coverage_applied_at")
+    op.drop_table(_TABLE)
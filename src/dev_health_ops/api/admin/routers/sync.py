@@ -923,6 +923,9 @@ async def _upsert_scheduled_job(
         if getattr(config, "is_active") and _config_has_explicit_schedule(config)
         else JobStatus.PAUSED.value
     )
+    # Schedule, timezone or activation may have changed: drop the scheduler's
+    # due-time index so the next tick re-evaluates the config.
+    setattr(config, "next_due_at", None)
     if job is None:
         session.add(
             ScheduledJob(
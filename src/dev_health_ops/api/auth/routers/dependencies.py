@@ -10,6 +10,7 @@ from dev_health_ops.api.services.auth import (
     AuthenticatedUser,
     extract_token_from_header,
 )
+from dev_health_ops.api.services.auth_cache import cached_principal
 from dev_health_ops.api.utils.errors import error_detail
 
 logger = logging.getLogger(__name__)
@@ -55,9 +56,13 @@ async def get_current_user(
         )
 
     auth_service = get_auth_service()
-    try:
+
+    async def _load() -> AuthenticatedUser | None:
         async with get_postgres_session() as db:
-            user = await auth_service.authenticate_access_token(token, db)
+            return await auth_service.authenticate_access_token(token, db)
+
+    try:
+        user = await cached_principal(token, _load)
     except Exception as exc:
         if _db_temporarily_unavailable(exc):
             logger.warning("Database unavailable during access-token authentication")
@@ -87,9 +92,13 @@ async def get_current_user_optional(
         return None
 
     auth_service = get_auth_service()
-    try:
+
+    async def _load() -> AuthenticatedUser | None:
         async with get_postgres_session() as db:
             return await auth_service.authenticate_access_token(token, db)
+
+    try:
+        return await cached_principal(token, _load)
     except Exception as exc:
         if _db_temporarily_unavailable(exc):
             logger.warning("Database unavailable during optional token authentication")
@@ -13,6 +13,7 @@ from dev_health_ops.api.middleware.rate_limit import (
     limiter,
 )
 from dev_health_ops.api.services.auth import AuthenticatedUser
+from dev_health_ops.api.services.auth_cache import invalidate_user
 from dev_health_ops.api.services.refresh_tokens import revoke_token
 from dev_health_ops.api.utils.audit import emit_audit_log
 from dev_health_ops.api.utils.errors import error_detail
@@ -244,6 +245,10 @@ async def logout(
         async with get_postgres_session() as db:
             await revoke_token(db, str(refresh_payload["jti"]))
 
+    logout_user_id = user.user_id if user else (refresh_payload or {}).get("sub")
+    if logout_user_id:
+        await invalidate_user(str(logout_user_id), reason="logout")
+
     if user and user.org_id:
         user_uuid = _parse_uuid(user.user_id)
         org_uuid = _parse_uuid(user.org_id)
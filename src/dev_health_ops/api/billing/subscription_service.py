@@ -11,6 +11,9 @@ from sqlalchemy import Select, func, select
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from dev_health_ops.licensing.entitlement_cache import (
+    invalidate_org_entitlements_on_commit,
+)
 from dev_health_ops.models.billing import BillingPlan, FeatureBundle, PlanFeatureBundle
 from dev_health_ops.models.licensing import OrgLicense
 
@@ -143,6 +146,7 @@ class SubscriptionService:
         org_id = uuid.UUID(str(org_id_value))
         previous_status = await self._get_previous_status(getattr(stripe_sub, "id", ""))
         subscription = await self.upsert_from_stripe(stripe_sub, org_id)
+        invalidate_org_entitlements_on_commit(self.db, org_id, reason="billing_webhook")
 
         try:
             self.db.add(
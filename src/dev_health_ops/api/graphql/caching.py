@@ -73,6 +73,8 @@ def cached_resolver(
 
     The cache is stored in the context's cache backend if available.
     Cache keys are built from the resolver name, org_id, and arguments.
+    When the cache provides ``get_or_compute`` (``TTLCache``), concurrent
+    misses for the same key share a single resolver execution.
 
     Args:
         ttl_seconds: Cache TTL in seconds (default 5 minutes).
@@ -109,6 +111,16 @@ def cached_resolver(
             org_id = getattr(context, "org_id", "unknown")
             cache_key = build_cache_key(prefix, org_id, *args[1:], **kwargs)
 
+            # Coalesce concurrent misses when the cache supports it, so N
+            # identical in-flight requests run the resolver once.
+            get_or_compute = getattr(context.cache, "get_or_compute", None)
+            if callable(get_or_compute):
+                return await get_or_compute(
+                    cache_key,
+                    lambda: func(*args, **kwargs),
+                    to_cache=_make_cacheable,
+                )
+
             # Check cache
             try:
                 cached_value = context.cache.get(cache_key)
@@ -7,7 +7,10 @@ each resolver to repeat the same guard logic.
 
 from __future__ import annotations
 
+import inspect
 import logging
+from collections.abc import Awaitable
+from typing import Any
 
 from graphql.language.ast import (
     FieldNode,
@@ -20,6 +23,12 @@ from graphql.language.ast import (
 )
 from strawberry.extensions import AddValidationRules, SchemaExtension
 
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    current_clickhouse_caller,
+    reset_clickhouse_caller,
+    set_clickhouse_caller,
+)
+
 from .errors import AuthorizationError
 from .security import get_graphql_validation_rules
 
@@ -172,3 +181,44 @@ class OrgIdAuthExtension(SchemaExtension):
                 reset_current_org_id(org_context_token)
             if context.org_id != original_org_id:
                 _rebind_context_org_id(context, original_org_id)
+
+
+async def _attributed(awaitable: Awaitable[Any], caller: str) -> Any:
+    token = set_clickhouse_caller(caller)
+    try:
+        return await awaitable
+    finally:
+        reset_clickhouse_caller(token)
+
+
+class ClickHouseCallerExtension(SchemaExtension):
+    """Attribute ClickHouse queries to the root field whose resolver ran them.
+
+    Every field resolves inside the scope of its root field
+    (``graphql:Query.home``), so nested resolvers that query ClickHouse are
+    charged to the root field too. Naming scopes after root fields rather than
+    operation names keeps the metric label set bounded by the schema.
+    """
+
+    def __init__(self, *, execution_context: object | None = None) -> None:
+        self._root_callers: dict[str | int, str] = {}
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        root_path = info.path
+        while root_path.prev is not None:
+            root_path = root_path.prev
+        if info.path.prev is None:
+            caller = f"graphql:{info.parent_type.name}.{info.field_name}"
+            self._root_callers[root_path.key] = caller
+        else:
+            caller = self._root_callers.get(root_path.key)
+            if caller is None or current_clickhouse_caller().endswith(caller):
+                return _next(root, info, *args, **kwargs)
+        token = set_clickhouse_caller(caller)
+        try:
+            result = _next(root, info, *args, **kwargs)
+        finally:
+            reset_clickhouse_caller(token)
+        if inspect.isawaitable(result):
+            return _attributed(result, caller)
+        return result
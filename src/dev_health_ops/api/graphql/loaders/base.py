@@ -73,10 +73,24 @@ class CachedDataLoader(DataLoader[K, V], Generic[K, V], ABC):
         Uses a single ``mget()`` call per batch when the cache backend
         supports it, falling back to per-key ``get()`` otherwise. Missing
         keys are resolved via ``batch_load`` and then written back to cache.
+        Caches with ``get_or_compute_many`` (``TTLCache``) also coalesce
+        keys another loader is already fetching.
         """
         results: dict[int, V] = {}
         missing_keys: list[tuple[int, K]] = []
 
+        get_or_compute_many = getattr(self._external_cache, "get_or_compute_many", None)
+        if callable(get_or_compute_many):
+            cache_keys = [
+                make_cache_key(self._cache_prefix, self._org_id, key) for key in keys
+            ]
+            by_cache_key = dict(zip(cache_keys, keys))
+
+            async def _load_missing(cache_keys: list[str]) -> list[V]:
+                return await self.batch_load([by_cache_key[ck] for ck in cache_keys])
+
+            return await get_or_compute_many(cache_keys, _load_missing)
+
         if self._external_cache is None:
             missing_keys = [(idx, key) for idx, key in enumerate(keys)]
         else:
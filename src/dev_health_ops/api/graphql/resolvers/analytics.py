@@ -58,8 +58,11 @@ from ..sql.compiler import (
     TimeseriesRequest,
     compile_breakdown,
     compile_flow_matrix,
+    compile_fused_breakdown,
+    compile_fused_timeseries,
     compile_sankey,
     compile_timeseries,
+    fusion_key,
 )
 from ..sql.filter_translation import translate_filters
 
@@ -340,29 +343,38 @@ async def _execute_timeseries_query(
     """Execute a single timeseries query and return results."""
     from dev_health_ops.api.queries.client import query_dicts
 
-    start = ts_req.date_range.start_date
-    end = ts_req.date_range.end_date
+    request = _timeseries_request(ts_req, use_investment)
 
-    request = TimeseriesRequest(
+    sql, params = compile_timeseries(request, org_id, timeout, filters=filters)
+
+    if use_investment:
+        await record_stale_investment_membership_scope(client, org_id=org_id)
+    rows = await query_dicts(client, sql, params)
+    return _timeseries_results(ts_req, rows, "value")
+
+
+def _timeseries_request(
+    ts_req: TimeseriesRequestInput, use_investment: bool
+) -> TimeseriesRequest:
+    return TimeseriesRequest(
         dimension=ts_req.dimension.value,
         measure=ts_req.measure.value,
         interval=ts_req.interval.value,
-        start_date=start,
-        end_date=end,
+        start_date=ts_req.date_range.start_date,
+        end_date=ts_req.date_range.end_date,
         use_investment=use_investment,
     )
 
-    sql, params = compile_timeseries(request, org_id, timeout, filters=filters)
 
-    if use_investment:
-        await record_stale_investment_membership_scope(client, org_id=org_id)
-    rows = await query_dicts(client, sql, params)
+def _timeseries_results(
+    ts_req: TimeseriesRequestInput, rows: list[dict[str, Any]], column: str
+) -> list[TimeseriesResult]:
     grouped: dict[str, list[TimeseriesBucket]] = {}
 
     for row in rows:
         dim_val = str(row.get("dimension_value", ""))
         bucket_date = row.get("bucket")
-        value = float(row.get("value") or 0)
+        value = float(row.get(column) or 0)
 
         if dim_val not in grouped:
             grouped[dim_val] = []
@@ -438,17 +450,7 @@ async def _execute_breakdown_query(
     """Execute a single breakdown query and return results."""
     from dev_health_ops.api.queries.client import query_dicts
 
-    start = bd_req.date_range.start_date
-    end = bd_req.date_range.end_date
-
-    request = BreakdownRequest(
-        dimension=bd_req.dimension.value,
-        measure=bd_req.measure.value,
-        start_date=start,
-        end_date=end,
-        top_n=bd_req.top_n,
-        use_investment=use_investment,
-    )
+    request = _breakdown_request(bd_req, use_investment)
 
     sql, params = compile_breakdown(request, org_id, timeout, filters=filters)
 
@@ -483,6 +485,163 @@ async def _execute_breakdown_query(
     )
 
 
+def _breakdown_request(
+    bd_req: BreakdownRequestInput, use_investment: bool
+) -> BreakdownRequest:
+    return BreakdownRequest(
+        dimension=bd_req.dimension.value,
+        measure=bd_req.measure.value,
+        start_date=bd_req.date_range.start_date,
+        end_date=bd_req.date_range.end_date,
+        top_n=bd_req.top_n,
+        use_investment=use_investment,
+    )
+
+
+def _ranked(
+    rows: list[dict[str, Any]], column: str, *, by_bucket: bool = False
+) -> list[dict[str, Any]]:
+    """Order fused rows as the single-measure templates' ``ORDER BY`` would.
+
+    Timeseries rows go bucket ascending then value descending; breakdown rows
+    value descending. NULL values sort last, as they do in ClickHouse.
+    """
+
+    def _key(row: dict[str, Any]) -> tuple[Any, ...]:
+        value = row.get(column)
+        rank = (value is None, -float(value) if value is not None else 0.0)
+        if not by_bucket:
+            return rank
+        bucket = row.get("bucket")
+        return (bucket is None, bucket, *rank)
+
+    return sorted(rows, key=_key)
+
+
+def _fusion_groups(
+    requests: list[TimeseriesRequest] | list[BreakdownRequest],
+) -> list[list[int]]:
+    """Group sub-request indexes that share a ``fusion_key``, first-seen order."""
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(fusion_key(request), []).append(index)
+    return list(groups.values())
+
+
+async def _execute_fused_timeseries_query(
+    client: Any,
+    ts_reqs: list[TimeseriesRequestInput],
+    org_id: str,
+    timeout: int,
+    use_investment: bool,
+    filters: Any | None,
+) -> list[list[TimeseriesResult]]:
+    """Execute one scan for timeseries sharing a fusion key, split per request."""
+    from dev_health_ops.api.queries.client import query_dicts
+
+    requests = [_timeseries_request(ts_req, use_investment) for ts_req in ts_reqs]
+    sql, params, columns = compile_fused_timeseries(
+        requests, org_id, timeout, filters=filters
+    )
+
+    if use_investment:
+        await record_stale_investment_membership_scope(client, org_id=org_id)
+    rows = await query_dicts(client, sql, params)
+
+    return [
+        _timeseries_results(
+            ts_req,
+            _ranked(rows, columns[request.measure], by_bucket=True),
+            columns[request.measure],
+        )
+        for ts_req, request in zip(ts_reqs, requests, strict=True)
+    ]
+
+
+async def _execute_fused_breakdown_query(
+    client: Any,
+    bd_reqs: list[BreakdownRequestInput],
+    org_id: str,
+    timeout: int,
+    use_investment: bool,
+    filters: Any | None,
+) -> list[BreakdownResult]:
+    """Execute one scan for breakdowns sharing a fusion key, split per request.
+
+    The scan keeps each measure's top N server-side; each request then trims
+    to its own ``top_n``. Display labels are resolved once for every key any
+    of them returns.
+    """
+    from dev_health_ops.api.queries.client import query_dicts
+
+    requests = [_breakdown_request(bd_req, use_investment) for bd_req in bd_reqs]
+    sql, params, columns = compile_fused_breakdown(
+        requests, org_id, timeout, filters=filters
+    )
+
+    if use_investment:
+        await record_stale_investment_membership_scope(client, org_id=org_id)
+    rows = await query_dicts(client, sql, params)
+
+    # Rows arrive once per measure, already cut to the largest requested top_n.
+    top_rows = [
+        _ranked(
+            [
+                row
+                for row in rows
+                if f"value_{row.get('measure_index')}" == columns[request.measure]
+            ],
+            columns[request.measure],
+        )[: request.top_n]
+        for request in requests
+    ]
+    keys = list(
+        dict.fromkeys(
+            str(row.get("dimension_value", "")) for ranked in top_rows for row in ranked
+        )
+    )
+    label_map = await _resolve_breakdown_labels(
+        client, dimension=bd_reqs[0].dimension.value, org_id=org_id, keys=keys
+    )
+
+    return [
+        BreakdownResult(
+            dimension=bd_req.dimension.name,
+            measure=bd_req.measure.name,
+            items=[
+                _build_breakdown_item(
+                    str(row.get("dimension_value", "")),
+                    float(row.get(columns[request.measure]) or 0),
+                    label_map,
+                )
+                for row in ranked
+            ],
+        )
+        for bd_req, request, ranked in zip(bd_reqs, requests, top_rows, strict=True)
+    ]
+
+
+def _scatter_group_results(
+    groups: list[list[int]], results: list[Any], size: int
+) -> list[Any]:
+    """Map per-group results back onto the original sub-request order.
+
+    A single-member group carries its request's result directly; a fused
+    group carries one result per member, or one exception for all of them.
+    """
+    scattered: list[Any] = [None] * size
+    for group, result in zip(groups, results, strict=True):
+        if len(group) == 1:
+            scattered[group[0]] = result
+        elif isinstance(result, BaseException):
+            for index in group:
+                scattered[index] = result
+        else:
+            for index, member_result in zip(group, result, strict=True):
+                scattered[index] = member_result
+    return scattered
+
+
 async def resolve_analytics(
     context: GraphQLContext,
     batch: AnalyticsRequestInput,
@@ -554,28 +713,56 @@ async def resolve_analytics(
         client, org_id=org_id, filters=batch.filters
     )
 
-    timeseries_coros: list[Coroutine[Any, Any, list[TimeseriesResult]]] = [
+    # Fuse sub-requests that read the same source over the same range and
+    # grouping into one scan computing all of their measures; the rest run as
+    # single-measure queries exactly as before.
+    timeseries_groups = _fusion_groups(
+        [_timeseries_request(ts_req, use_investment) for ts_req in batch.timeseries]
+    )
+    breakdown_groups = _fusion_groups(
+        [_breakdown_request(bd_req, use_investment) for bd_req in batch.breakdowns]
+    )
+
+    timeseries_coros: list[Coroutine[Any, Any, Any]] = [
         _execute_timeseries_query(
             client,
-            ts_req,
+            batch.timeseries[group[0]],
             org_id,
             timeout,
             use_investment,
             resolved_filters,
         )
-        for ts_req in batch.timeseries
+        if len(group) == 1
+        else _execute_fused_timeseries_query(
+            client,
+            [batch.timeseries[index] for index in group],
+            org_id,
+            timeout,
+            use_investment,
+            resolved_filters,
+        )
+        for group in timeseries_groups
     ]
 
-    breakdown_coros: list[Coroutine[Any, Any, BreakdownResult]] = [
+    breakdown_coros: list[Coroutine[Any, Any, Any]] = [
         _execute_breakdown_query(
             client,
-            bd_req,
+            batch.breakdowns[group[0]],
+            org_id,
+            timeout,
+            use_investment,
+            resolved_filters,
+        )
+        if len(group) == 1
+        else _execute_fused_breakdown_query(
+            client,
+            [batch.breakdowns[index] for index in group],
             org_id,
             timeout,
             use_investment,
             resolved_filters,
         )
-        for bd_req in batch.breakdowns
+        for group in breakdown_groups
     ]
 
     # Execute all timeseries and breakdown queries in parallel
@@ -585,10 +772,18 @@ async def resolve_analytics(
         return_exceptions=True,
     )
 
-    # Split results back into timeseries and breakdowns
-    num_timeseries = len(batch.timeseries)
-    timeseries_raw = all_results[:num_timeseries]
-    breakdown_raw = all_results[num_timeseries:]
+    # Split results back into timeseries and breakdowns, in request order
+    num_timeseries_groups = len(timeseries_groups)
+    timeseries_raw = _scatter_group_results(
+        timeseries_groups,
+        all_results[:num_timeseries_groups],
+        len(batch.timeseries),
+    )
+    breakdown_raw = _scatter_group_results(
+        breakdown_groups,
+        all_results[num_timeseries_groups:],
+        len(batch.breakdowns),
+    )
 
     # Process timeseries results (flatten nested lists)
     timeseries_results: list[TimeseriesResult] = []
@@ -8,7 +8,11 @@ import strawberry
 from strawberry.types import Info
 
 from .context import GraphQLContext
-from .extensions import ConfiguredValidationRules, OrgIdAuthExtension
+from .extensions import (
+    ClickHouseCallerExtension,
+    ConfiguredValidationRules,
+    OrgIdAuthExtension,
+)
 from .models.ai import (
     AiAttributedPrsResult,
     AIAttributionOverviewResult,
@@ -1029,5 +1033,6 @@ schema = strawberry.Schema(
     extensions=[
         OrgIdAuthExtension,
         ConfiguredValidationRules,
+        ClickHouseCallerExtension,
     ],
 )
@@ -30,6 +30,8 @@ from .templates import (
     flow_matrix_team_nodes_template,
     flow_matrix_work_type_edges_template,
     flow_matrix_work_type_nodes_template,
+    fused_breakdown_template,
+    fused_timeseries_template,
     sankey_edges_template,
     sankey_nodes_template,
     timeseries_template,
@@ -400,6 +402,143 @@ def compile_breakdown(
     return sql, params
 
 
+def fusion_key(request: TimeseriesRequest | BreakdownRequest) -> tuple[Any, ...]:
+    """Key under which sub-requests of one batch can share a single scan.
+
+    Requests in the same batch already share filters and the investment
+    toggle, so they fuse when they read the same source table over the same
+    date range and group by the same dimension (and interval, for
+    timeseries). ``top_n`` is applied per measure within the fused query.
+    """
+    source_table = Measure.source_table(validate_measure(request.measure))
+    if isinstance(request, TimeseriesRequest):
+        return (
+            "timeseries",
+            validate_dimension(request.dimension),
+            validate_bucket_interval(request.interval),
+            request.start_date,
+            request.end_date,
+            request.use_investment,
+            source_table,
+        )
+    return (
+        "breakdown",
+        validate_dimension(request.dimension),
+        request.start_date,
+        request.end_date,
+        request.use_investment,
+        source_table,
+    )
+
+
+def _fused_measures(
+    requests: list[TimeseriesRequest] | list[BreakdownRequest],
+) -> tuple[list[Measure], dict[str, str]]:
+    measures: list[Measure] = []
+    columns: dict[str, str] = {}
+    for request in requests:
+        if request.measure in columns:
+            continue
+        measure = validate_measure(request.measure)
+        if measure not in measures:
+            measures.append(measure)
+        columns[request.measure] = f"value_{measures.index(measure)}"
+    return measures, columns
+
+
+def _fused_context(
+    requests: list[TimeseriesRequest] | list[BreakdownRequest],
+    filters: FilterInput | None,
+) -> tuple[
+    Dimension, list[Measure], dict[str, str], dict[str, Any], str, dict[str, Any]
+]:
+    keys = {fusion_key(request) for request in requests}
+    if not requests or len(keys) != 1:
+        raise ValueError("Fused requests must share a single fusion key")
+    first = requests[0]
+    dimension = validate_dimension(first.dimension)
+    measures, columns = _fused_measures(requests)
+
+    ctx = _get_context_params(
+        [dimension],
+        force_investment=first.use_investment,
+        needs_team_join=_needs_team_join(filters),
+        needs_author_join=_needs_author_join(filters),
+    )
+    filter_clause, filter_params = translate_filters(
+        filters, use_investment=ctx.get("use_investment", False)
+    )
+    testops_table = Measure.source_table(measures[0])
+    if testops_table:
+        ctx["source_table"] = dedup_from(testops_table)
+        ctx["date_filter"] = "day >= %(start_date)s AND day <= %(end_date)s"
+    return dimension, measures, columns, ctx, filter_clause, filter_params
+
+
+def compile_fused_timeseries(
+    requests: list[TimeseriesRequest],
+    org_id: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    filters: FilterInput | None = None,
+) -> tuple[str, dict[str, Any], dict[str, str]]:
+    """
+    Compile timeseries requests sharing a ``fusion_key`` into one query.
+
+    Returns:
+        Tuple of (SQL query string, parameters dict, measure -> value column)
+    """
+    dimension, measures, columns, ctx, filter_clause, filter_params = _fused_context(
+        requests, filters
+    )
+    interval = validate_bucket_interval(requests[0].interval)
+
+    sql = fused_timeseries_template(
+        dimension, measures, interval, filter_clause=filter_clause, **ctx
+    )
+
+    params: dict[str, Any] = {
+        "start_date": requests[0].start_date,
+        "end_date": requests[0].end_date,
+        "timeout": timeout,
+    }
+    params.update(filter_params)
+    params = enforce_org_scope(org_id, params)
+
+    return sql, params, columns
+
+
+def compile_fused_breakdown(
+    requests: list[BreakdownRequest],
+    org_id: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    filters: FilterInput | None = None,
+) -> tuple[str, dict[str, Any], dict[str, str]]:
+    """
+    Compile breakdown requests sharing a ``fusion_key`` into one query.
+
+    Returns:
+        Tuple of (SQL query string, parameters dict, measure -> value column)
+    """
+    dimension, measures, columns, ctx, filter_clause, filter_params = _fused_context(
+        requests, filters
+    )
+
+    sql = fused_breakdown_template(
+        dimension, measures, filter_clause=filter_clause, **ctx
+    )
+
+    params: dict[str, Any] = {
+        "start_date": requests[0].start_date,
+        "end_date": requests[0].end_date,
+        "top_n": max(request.top_n for request in requests),
+        "timeout": timeout,
+    }
+    params.update(filter_params)
+    params = enforce_org_scope(org_id, params)
+
+    return sql, params, columns
+
+
 def compile_sankey(
     request: SankeyRequest,
     org_id: str,
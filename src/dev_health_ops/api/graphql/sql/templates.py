@@ -94,6 +94,105 @@ SETTINGS max_execution_time = %(timeout)s
 """
 
 
+def _fused_measure_columns(
+    measures: list[Measure], use_investment: bool, use_repo_allocation: bool
+) -> str:
+    return ",\n    ".join(
+        f"{Measure.db_expression(measure, use_investment=use_investment, use_repo_allocation=use_repo_allocation)} AS value_{index}"
+        for index, measure in enumerate(measures)
+    )
+
+
+def fused_timeseries_template(
+    dimension: Dimension,
+    measures: list[Measure],
+    interval: BucketInterval,
+    source_table: str = "investment_metrics_daily",
+    date_filter: str = "day >= %(start_date)s AND day <= %(end_date)s",
+    extra_clauses: str = "",
+    with_clause: str = "",
+    use_investment: bool = False,
+    use_repo_allocation: bool = False,
+    filter_clause: str = "",
+) -> str:
+    """Timeseries template computing several measures in one scan.
+
+    Rows match ``timeseries_template`` for each measure, with measure ``i`` in
+    column ``value_i``; ordering is left to the caller, which splits per measure.
+    """
+    dim_col = Dimension.db_column(dimension, use_investment=use_investment)
+    measure_columns = _fused_measure_columns(
+        measures, use_investment, use_repo_allocation
+    )
+    source_alias = source_table.split(" AS ")[-1].strip()
+    trunc_unit = BucketInterval.date_trunc_unit(interval)
+    date_col = date_filter.split(" ")[0]
+
+    return f"""
+{with_clause}
+SELECT
+    date_trunc('{trunc_unit}', {date_col}) AS bucket,
+    {dim_col} AS dimension_value,
+    {measure_columns}
+FROM {source_table}
+{extra_clauses}
+WHERE {date_filter}
+  AND {source_alias}.org_id = %(org_id)s
+{filter_clause}
+GROUP BY bucket, dimension_value
+SETTINGS max_execution_time = %(timeout)s
+"""
+
+
+def fused_breakdown_template(
+    dimension: Dimension,
+    measures: list[Measure],
+    source_table: str = "investment_metrics_daily",
+    date_filter: str = "day >= %(start_date)s AND day <= %(end_date)s",
+    extra_clauses: str = "",
+    with_clause: str = "",
+    use_investment: bool = False,
+    use_repo_allocation: bool = False,
+    filter_clause: str = "",
+) -> str:
+    """Breakdown template computing several measures in one scan.
+
+    The grouped rows are repeated once per measure (``measure_index`` ``i``
+    ranks by ``value_i``) and each copy keeps its own top ``%(top_n)s``, so
+    the caller only splits on ``measure_index``.
+    """
+    dim_col = Dimension.db_column(dimension, use_investment=use_investment)
+    measure_columns = _fused_measure_columns(
+        measures, use_investment, use_repo_allocation
+    )
+    value_columns = [f"value_{index}" for index in range(len(measures))]
+    rank_values = ", ".join(f"toFloat64({column})" for column in value_columns)
+    source_alias = source_table.split(" AS ")[-1].strip()
+
+    return f"""
+{with_clause}
+SELECT
+    measure_index,
+    dimension_value,
+    {", ".join(value_columns)}
+FROM (
+    SELECT
+        {dim_col} AS dimension_value,
+        {measure_columns}
+    FROM {source_table}
+    {extra_clauses}
+    WHERE {date_filter}
+      AND {source_alias}.org_id = %(org_id)s
+    {filter_clause}
+    GROUP BY dimension_value
+)
+ARRAY JOIN range({len(measures)}) AS measure_index
+ORDER BY measure_index, [{rank_values}][measure_index + 1] DESC
+LIMIT %(top_n)s BY measure_index
+SETTINGS max_execution_time = %(timeout)s
+"""
+
+
 def sankey_nodes_template(
     dimensions: list[Dimension],
     measure: Measure,
@@ -78,6 +78,7 @@ def _scope_arguments(kind: str, scope: object, row: Any) -> dict[str, Any]:
             "repo_id",
             "heuristic_window",
             "heuristic_confidence",
+            "incremental",
         },
         "investment.materialize": {
             "from_date",
@@ -29,6 +29,10 @@ from dev_health_ops.api.services.auth import (
     get_auth_service,
     set_current_org_id,
 )
+from dev_health_ops.api.services.auth_cache import (
+    cached_membership,
+    cached_principal,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +45,19 @@ async def get_authenticated_user_from_headers(
             token = extract_token_from_header(value.decode("latin-1"))
             if not token:
                 return None
-            from dev_health_ops.db import get_postgres_session
-
-            async with get_postgres_session() as session:
-                return await get_auth_service().authenticate_access_token(
-                    token, session
-                )
+            return await cached_principal(
+                token, lambda: _authenticate_access_token(token)
+            )
     return None
 
 
+async def _authenticate_access_token(token: str) -> AuthenticatedUser | None:
+    from dev_health_ops.db import get_postgres_session
+
+    async with get_postgres_session() as session:
+        return await get_auth_service().authenticate_access_token(token, session)
+
+
 async def user_is_member_of_org(user_id: str, org_id: str) -> bool:
     """Return True iff the user has an active Membership for org_id."""
     try:
@@ -58,6 +66,14 @@ async def user_is_member_of_org(user_id: str, org_id: str) -> bool:
     except (ValueError, TypeError):
         return False
 
+    return await cached_membership(
+        str(user_uuid),
+        str(org_uuid),
+        lambda: _load_membership(user_uuid, org_uuid),
+    )
+
+
+async def _load_membership(user_uuid: uuid_mod.UUID, org_uuid: uuid_mod.UUID) -> bool:
     from dev_health_ops.db import get_postgres_session
     from dev_health_ops.models.users import Membership
 
@@ -31,6 +31,7 @@ from dev_health_ops.api.services.auth import (
     set_current_org_id,
     set_impersonation_context,
 )
+from dev_health_ops.api.services.auth_cache import cached_principal
 from dev_health_ops.api.services.impersonation_cache import (
     get_active_session,
     set_active_session,
@@ -169,10 +170,14 @@ async def _extract_user(scope: Scope) -> Any | None:
     token = extract_token_from_header(auth_header)
     if not token:
         return None
-    from dev_health_ops.db import get_postgres_session
 
-    async with get_postgres_session() as db:
-        return await get_auth_service().authenticate_access_token(token, db)
+    async def _load() -> Any | None:
+        from dev_health_ops.db import get_postgres_session
+
+        async with get_postgres_session() as db:
+            return await get_auth_service().authenticate_access_token(token, db)
+
+    return await cached_principal(token, _load)
 
 
 async def _expire_session(session: Any, admin_user_id: str) -> None:
@@ -7,19 +7,17 @@ from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
 from typing import Any
 
-import clickhouse_connect
-
+from dev_health_ops.api.queries.client_pool import close_client_pool, get_client_pool
 from dev_health_ops.api.services.auth import get_current_org_id
 from dev_health_ops.api.utils.logging import sanitize_for_log
 from dev_health_ops.metrics.sinks.base import BaseMetricsSink
-from dev_health_ops.metrics.sinks.clickhouse.connection import (
-    clickhouse_client_kwargs,
-    redact_clickhouse_uri,
-)
+from dev_health_ops.metrics.sinks.clickhouse.connection import redact_clickhouse_uri
 from dev_health_ops.metrics.sinks.factory import create_sink
 
 logger = logging.getLogger(__name__)
 
+_QUERY_SETTINGS = {"max_query_size": 1 * 1024 * 1024}
+
 _SHARED_SINK: BaseMetricsSink | None = None
 _SHARED_DSN: str | None = None
 
@@ -67,6 +65,7 @@ async def close_global_client() -> None:
         _SHARED_SINK.close()
     _SHARED_SINK = None
     _SHARED_DSN = None
+    close_client_pool()
 
 
 def require_clickhouse_backend(sink: BaseMetricsSink) -> None:
@@ -151,29 +150,23 @@ async def query_dicts(
     }
     logger.debug("Executing query: %s with params %s", safe_query, safe_params)
 
-    # Create a per-thread ClickHouse client for thread safety.
+    # Check out a pooled ClickHouse client for the worker thread.
     # clickhouse_connect.Client is NOT thread-safe for concurrent queries on the
-    # same instance (internal _active_session state is overwritten). New clients are
-    # cheap because they share a global urllib3.PoolManager for HTTP connections.
+    # same instance (internal _active_session state is overwritten), so the pool
+    # lends each client to one thread at a time and reuses it afterwards instead
+    # of paying client construction on every query.
     dsn = getattr(sink, "dsn", None)
     if isinstance(dsn, str) and dsn:
         _assert_pyformat_safe(query, params)
 
         def _thread_query() -> list[dict[str, Any]]:
-            client = clickhouse_connect.get_client(
-                **clickhouse_client_kwargs(
-                    dsn, settings={"max_query_size": 1 * 1024 * 1024}
-                )
-            )
-            try:
+            with get_client_pool().checkout(dsn, _QUERY_SETTINGS) as client:
                 result = client.query(query, parameters=params)
-                col_names = list(getattr(result, "column_names", []) or [])
-                rows = list(getattr(result, "result_rows", []) or [])
-                if not col_names or not rows:
-                    return []
-                return [dict(zip(col_names, row)) for row in rows]
-            finally:
-                client.close()
+            col_names = list(getattr(result, "column_names", []) or [])
+            rows = list(getattr(result, "result_rows", []) or [])
+            if not col_names or not rows:
+                return []
+            return [dict(zip(col_names, row)) for row in rows]
 
         return await asyncio.to_thread(_thread_query)
 
@@ -0,0 +1,300 @@
+"""Bounded pool of reusable ClickHouse clients for API queries.
+
+``query_dicts`` runs each query on a worker thread. ``clickhouse_connect``
+clients are not safe for concurrent queries on one instance, so every thread
+needs a client of its own. Building one per query costs a client construction
+and a server settings round-trip. Dashboard fan-out pages such as the home
+response fire dozens of queries at once, so that cost dominates their p50.
+
+``ClickHousePool`` keeps idle clients per (DSN, settings) key and hands each
+one to a single thread at a time:
+
+- A checkout pops the most recently returned idle client.
+- A client idle longer than ``health_check_after`` is pinged before reuse.
+- A client idle longer than ``idle_timeout`` is closed rather than reused.
+- A client older than ``max_lifetime`` is closed rather than reused.
+- A client whose query raised is discarded instead of being returned.
+- At most ``max_size`` clients exist per key. A checkout beyond that waits up
+  to ``checkout_timeout`` for one to be returned.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import clickhouse_connect
+
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    instrument_clickhouse_client,
+)
+from dev_health_ops.metrics.prometheus import (
+    CLICKHOUSE_POOL_CHECKOUTS_TOTAL,
+    CLICKHOUSE_POOL_CLIENTS,
+    CLICKHOUSE_POOL_CLOSED_TOTAL,
+)
+from dev_health_ops.metrics.sinks.clickhouse.connection import (
+    clickhouse_client_kwargs,
+)
+
+logger = logging.getLogger(__name__)
+
+_MAX_SIZE_ENV = "CLICKHOUSE_POOL_MAX_SIZE"
+_IDLE_TIMEOUT_ENV = "CLICKHOUSE_POOL_IDLE_TIMEOUT_SECONDS"
+_MAX_LIFETIME_ENV = "CLICKHOUSE_POOL_MAX_LIFETIME_SECONDS"
+_DEFAULT_MAX_SIZE = 32
+_DEFAULT_IDLE_TIMEOUT = 300.0
+_DEFAULT_MAX_LIFETIME = 1800.0
+_DEFAULT_HEALTH_CHECK_AFTER = 30.0
+_DEFAULT_CHECKOUT_TIMEOUT = 30.0
+
+ClientFactory = Callable[[str, dict[str, int]], Any]
+
+
+class ClickHousePoolTimeout(RuntimeError):
+    """Raised when no pooled client becomes available within the timeout."""
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring non-numeric %s=%r", name, raw)
+        return default
+
+
+def _default_factory(dsn: str, settings: dict[str, int]) -> Any:
+    return instrument_clickhouse_client(
+        clickhouse_connect.get_client(
+            **clickhouse_client_kwargs(dsn, settings=settings)
+        ),
+        component="api",
+    )
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    created_at: float
+    returned_at: float
+
+
+@dataclass(frozen=True)
+class _PoolKey:
+    dsn: str
+    settings: tuple[tuple[str, int], ...]
+
+
+class _KeyPool:
+    """Idle clients and the checkout bound for one (DSN, settings) key."""
+
+    def __init__(self, max_size: int) -> None:
+        self.idle: deque[_PooledClient] = deque()
+        self.slots = threading.BoundedSemaphore(max_size)
+
+
+class ClickHousePool:
+    """Thread-safe pool of ClickHouse clients keyed by DSN and settings."""
+
+    def __init__(
+        self,
+        *,
+        max_size: int | None = None,
+        idle_timeout: float | None = None,
+        max_lifetime: float | None = None,
+        health_check_after: float = _DEFAULT_HEALTH_CHECK_AFTER,
+        checkout_timeout: float = _DEFAULT_CHECKOUT_TIMEOUT,
+        factory: ClientFactory = _default_factory,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max(
+            1,
+            int(
+                max_size
+                if max_size is not None
+                else _env_number(_MAX_SIZE_ENV, _DEFAULT_MAX_SIZE)
+            ),
+        )
+        self.idle_timeout = (
+            idle_timeout
+            if idle_timeout is not None
+            else _env_number(_IDLE_TIMEOUT_ENV, _DEFAULT_IDLE_TIMEOUT)
+        )
+        self.max_lifetime = (
+            max_lifetime
+            if max_lifetime is not None
+            else _env_number(_MAX_LIFETIME_ENV, _DEFAULT_MAX_LIFETIME)
+        )
+        self.health_check_after = health_check_after
+        self.checkout_timeout = checkout_timeout
+        self._factory = factory
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pools: dict[_PoolKey, _KeyPool] = {}
+        self._last_sweep = clock()
+
+    def _key_pool(self, key: _PoolKey) -> _KeyPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _KeyPool(self.max_size)
+                self._pools[key] = pool
+            return pool
+
+    def _close(self, entry: _PooledClient, reason: str) -> None:
+        CLICKHOUSE_POOL_CLOSED_TOTAL.labels(reason=reason).inc()
+        try:
+            entry.client.close()
+        except Exception:
+            logger.debug("Error closing pooled ClickHouse client", exc_info=True)
+
+    def _reusable(self, entry: _PooledClient, now: float) -> str | None:
+        """Return why ``entry`` must be closed, or None when it can be reused."""
+        if now - entry.created_at >= self.max_lifetime:
+            return "max_lifetime"
+        idle_for = now - entry.returned_at
+        if idle_for >= self.idle_timeout:
+            return "idle"
+        if idle_for >= self.health_check_after:
+            try:
+                if not entry.client.ping():
+                    return "unhealthy"
+            except Exception:
+                return "unhealthy"
+        return None
+
+    def _take_idle(self, pool: _KeyPool) -> _PooledClient | None:
+        while True:
+            with self._lock:
+                if not pool.idle:
+                    return None
+                entry = pool.idle.pop()
+                CLICKHOUSE_POOL_CLIENTS.labels(state="idle").dec()
+            reason = self._reusable(entry, self._clock())
+            if reason is None:
+                return entry
+            self._close(entry, reason)
+
+    @contextmanager
+    def checkout(
+        self, dsn: str, settings: Mapping[str, int] | None = None
+    ) -> Iterator[Any]:
+        """Lend one client to the calling thread for the duration of the block.
+
+        The client goes back to the pool when the block exits normally and is
+        closed when the block raises, so a broken session is never reused.
+        """
+        settings_dict = dict(settings or {})
+        key = _PoolKey(dsn, tuple(sorted(settings_dict.items())))
+        pool = self._key_pool(key)
+        self._maybe_sweep()
+        if not pool.slots.acquire(timeout=self.checkout_timeout):
+            CLICKHOUSE_POOL_CHECKOUTS_TOTAL.labels(result="timeout").inc()
+            raise ClickHousePoolTimeout(
+                f"No pooled ClickHouse client available within "
+                f"{self.checkout_timeout:.0f}s (max_size={self.max_size})"
+            )
+        try:
+            entry = self._take_idle(pool)
+            if entry is None:
+                CLICKHOUSE_POOL_CHECKOUTS_TOTAL.labels(result="created").inc()
+                now = self._clock()
+                entry = _PooledClient(
+                    self._factory(dsn, settings_dict), created_at=now, returned_at=now
+                )
+            else:
+                CLICKHOUSE_POOL_CHECKOUTS_TOTAL.labels(result="reused").inc()
+
+            CLICKHOUSE_POOL_CLIENTS.labels(state="in_use").inc()
+            try:
+                yield entry.client
+            except BaseException:
+                CLICKHOUSE_POOL_CLIENTS.labels(state="in_use").dec()
+                self._close(entry, "error")
+                raise
+            CLICKHOUSE_POOL_CLIENTS.labels(state="in_use").dec()
+            entry.returned_at = self._clock()
+            with self._lock:
+                retained = self._pools.get(key) is pool
+                if retained:
+                    pool.idle.append(entry)
+                    CLICKHOUSE_POOL_CLIENTS.labels(state="idle").inc()
+            if not retained:
+                self._close(entry, "shutdown")
+        finally:
+            pool.slots.release()
+
+    def _maybe_sweep(self) -> None:
+        # LIFO reuse leaves surplus clients at the bottom of the idle stack;
+        # sweep them periodically so a traffic spike does not pin them open.
+        now = self._clock()
+        with self._lock:
+            if now - self._last_sweep < self.health_check_after:
+                return
+            self._last_sweep = now
+        self.evict_idle()
+
+    def evict_idle(self) -> int:
+        """Close idle clients past their idle timeout or max lifetime."""
+        now = self._clock()
+        stale: list[tuple[_PooledClient, str]] = []
+        with self._lock:
+            for pool in self._pools.values():
+                keep: deque[_PooledClient] = deque()
+                for entry in pool.idle:
+                    if now - entry.created_at >= self.max_lifetime:
+                        stale.append((entry, "max_lifetime"))
+                    elif now - entry.returned_at >= self.idle_timeout:
+                        stale.append((entry, "idle"))
+                    else:
+                        keep.append(entry)
+                pool.idle = keep
+            CLICKHOUSE_POOL_CLIENTS.labels(state="idle").dec(len(stale))
+        for entry, reason in stale:
+            self._close(entry, reason)
+        return len(stale)
+
+    def close(self) -> None:
+        """Close every idle client. Checked-out clients close on return."""
+        with self._lock:
+            entries = [entry for pool in self._pools.values() for entry in pool.idle]
+            self._pools.clear()
+            CLICKHOUSE_POOL_CLIENTS.labels(state="idle").dec(len(entries))
+        for entry in entries:
+            self._close(entry, "shutdown")
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(pool.idle) for pool in self._pools.values())
+
+
+_POOL: ClickHousePool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_client_pool() -> ClickHousePool:
+    """Return the process-wide pool used by ``query_dicts``."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ClickHousePool()
+        return _POOL
+
+
+def close_client_pool() -> None:
+    """Close and forget the process-wide pool."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
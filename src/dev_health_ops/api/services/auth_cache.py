@@ -0,0 +1,289 @@
+"""Short-TTL cache for authenticated principals and org memberships.
+
+Every authenticated request used to open a Postgres session for
+``authenticate_access_token`` and, in ``OrgIdMiddleware``, a second one for
+the membership check -- a dashboard fanning out 30 calls paid 60 round-trips
+for auth alone. With ``AUTH_CACHE_ENABLED`` both lookups are served from an
+in-process TTL/LRU tier, backed by a shared Valkey tier when ``REDIS_URL`` is
+set.
+
+Correctness comes from per-user generations, not from deleting entries:
+
+  * Principal entries are keyed by the SHA-256 of the exact access token and
+    are only ever written after that token passed full validation, so a hit
+    can never authenticate a token that was not verified before. Entries
+    never outlive the token's own ``exp``.
+  * Each entry records the user's generation read BEFORE the Postgres load.
+    Logout, refresh-token revocation, token-version bumps, deactivation,
+    membership changes and impersonation start/stop bump the generation, so
+    an entry filled concurrently with an invalidation is born stale.
+  * ORM changes are picked up by session events and applied after COMMIT;
+    bulk statements that bypass the ORM call ``invalidate_user_on_commit``.
+
+The tiers, generations and commit hooks live in ``core.generation_cache``.
+
+Failure policy matches ``impersonation_cache``: when the shared tier is
+configured but unavailable, the cache is bypassed and every lookup goes to
+Postgres. Without ``REDIS_URL`` invalidations are process-local and the TTL
+is the cross-process staleness bound.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from dev_health_ops.core.generation_cache import (
+    GenerationCache,
+    env_flag_enabled,
+    ttl_from_env,
+)
+from dev_health_ops.metrics.prometheus import (
+    record_auth_cache_invalidation,
+    record_auth_cache_lookup,
+)
+from dev_health_ops.models.users import Membership, User
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_ENABLED_ENV = "AUTH_CACHE_ENABLED"
+PRINCIPAL_TTL_ENV = "AUTH_PRINCIPAL_CACHE_TTL_SECONDS"
+MEMBERSHIP_TTL_ENV = "AUTH_MEMBERSHIP_CACHE_TTL_SECONDS"
+
+_DEFAULT_PRINCIPAL_TTL_SECONDS = 30
+_DEFAULT_MEMBERSHIP_TTL_SECONDS = 60
+
+_LOCAL_MAX_ENTRIES = 10_000
+
+_KEY_PREFIX = "auth:"
+
+_MISS: Any = object()
+
+_AUTH_USER_FIELDS = ("is_active", "is_superuser", "token_version")
+_MEMBERSHIP_FIELDS = ("user_id", "org_id")
+
+
+def auth_cache_enabled() -> bool:
+    return env_flag_enabled(AUTH_CACHE_ENABLED_ENV)
+
+
+# Generations are per user: scopes are user ids.
+_cache = GenerationCache(
+    name="auth",
+    key_prefix=_KEY_PREFIX,
+    enabled=auth_cache_enabled,
+    local_max_entries=_LOCAL_MAX_ENTRIES,
+    record_invalidation=lambda _scope, reason: record_auth_cache_invalidation(
+        reason=reason
+    ),
+    stale_description="principals for up to their TTL",
+)
+
+
+def _principal_key(token: str) -> str:
+    return f"{_KEY_PREFIX}principal:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def _membership_key(user_id: str, org_id: str) -> str:
+    return f"{_KEY_PREFIX}member:{user_id}:{org_id}"
+
+
+def _peek_claims(token: str) -> dict[str, Any] | None:
+    """Unverified payload peek, only used to pick cache keys and lifetimes.
+
+    Never trusted for authentication: a principal hit additionally requires
+    an entry written for this exact token after it passed full validation.
+    """
+    try:
+        payload_segment = token.split(".")[1]
+        padded = payload_segment + "=" * (-len(payload_segment) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+async def _lookup(
+    cache: str, key: str, user_id: str
+) -> tuple[Any, tuple | None, Any | None]:
+    """Return ``(value | _MISS, generation, client)``.
+
+    ``generation`` is None when the entry must not be written back (shared
+    tier configured but unavailable).
+    """
+    local_generation = _cache.local.generation(user_id)
+    shared = await _cache.read_shared(key, (user_id,))
+    if shared is None:
+        record_auth_cache_lookup(cache=cache, result="bypass")
+        return _MISS, None, None
+
+    generation = (shared.generations, local_generation)
+    local = _cache.local.get(key)
+    if local is not None and local[0] == (user_id, generation):
+        record_auth_cache_lookup(cache=cache, result="hit_local")
+        return local[1], generation, shared.client
+
+    if shared.raw is not None:
+        try:
+            data = json.loads(shared.raw)
+        except Exception:
+            logger.warning("Corrupt auth cache entry for %s", user_id)
+            data = None
+        if (
+            isinstance(data, dict)
+            and data.get("user_id") == user_id
+            and data.get("generation") == list(shared.generations or ())
+        ):
+            record_auth_cache_lookup(cache=cache, result="hit_shared")
+            return data.get("value"), generation, shared.client
+
+    record_auth_cache_lookup(cache=cache, result="miss")
+    return _MISS, generation, shared.client
+
+
+async def _store(
+    key: str,
+    user_id: str,
+    generation: tuple,
+    value: Any,
+    ttl: float,
+    client: Any | None,
+) -> None:
+    _cache.local.put(key, (user_id, generation), value, ttl)
+    payload = json.dumps(
+        {"user_id": user_id, "generation": list(generation[0] or ()), "value": value}
+    )
+    await _cache.write_shared(client, key, payload, ttl)
+
+
+async def cached_principal(
+    token: str,
+    load: Callable[[], Awaitable[Any | None]],
+) -> Any | None:
+    """Return the ``AuthenticatedUser`` for ``token`` via the cache.
+
+    ``load`` runs the full validation (``authenticate_access_token``) on a
+    miss. Only successful validations are cached; rejections and loader
+    errors always go back to Postgres on the next request.
+    """
+    from dev_health_ops.api.services.auth import AuthenticatedUser
+
+    if not auth_cache_enabled():
+        return await load()
+    claims = _peek_claims(token)
+    ttl = ttl_from_env(PRINCIPAL_TTL_ENV, _DEFAULT_PRINCIPAL_TTL_SECONDS)
+    user_id = str(claims.get("sub") or "") if claims else ""
+    expires_at = claims.get("exp") if claims else None
+    if not user_id or not isinstance(expires_at, (int, float)) or ttl <= 0:
+        record_auth_cache_lookup(cache="principal", result="bypass")
+        return await load()
+
+    key = _principal_key(token)
+    cached, generation, client = await _lookup("principal", key, user_id)
+    if cached is not _MISS:
+        try:
+            return AuthenticatedUser(**cached)
+        except TypeError:
+            logger.warning("Unreadable auth cache principal for %s", user_id)
+
+    user = await load()
+    lifetime = min(float(ttl), float(expires_at) - time.time())
+    if (
+        user is not None
+        and generation is not None
+        and str(user.user_id) == user_id
+        and lifetime > 0
+    ):
+        await _store(
+            key, user_id, generation, dataclasses.asdict(user), lifetime, client
+        )
+    return user
+
+
+async def cached_membership(
+    user_id: str,
+    org_id: str,
+    load: Callable[[], Awaitable[bool]],
+) -> bool:
+    """Return whether ``user_id`` belongs to ``org_id`` via the cache."""
+    if not auth_cache_enabled():
+        return await load()
+    ttl = ttl_from_env(MEMBERSHIP_TTL_ENV, _DEFAULT_MEMBERSHIP_TTL_SECONDS)
+    if ttl <= 0:
+        return await load()
+
+    key = _membership_key(user_id, org_id)
+    cached, generation, client = await _lookup("membership", key, user_id)
+    if cached is not _MISS:
+        return bool(cached)
+
+    is_member = await load()
+    if generation is not None:
+        await _store(key, user_id, generation, bool(is_member), ttl, client)
+    return is_member
+
+
+async def invalidate_user(user_id: str, *, reason: str) -> None:
+    """Invalidate every cached principal and membership of ``user_id``.
+
+    For state that is already committed. Like ``impersonation_cache``'s
+    writes, this deliberately ignores the circuit breaker: skipping the bump
+    because an earlier READ failed would let a stale entry resurface once
+    the circuit closes.
+    """
+    await _cache.invalidate(str(user_id), reason=reason)
+
+
+def invalidate_user_on_commit(session: Any, user_id: Any, *, reason: str) -> None:
+    """Queue an invalidation that fires only if ``session`` commits.
+
+    For bulk statements (``update``/``delete``) that the ORM events cannot
+    see. Accepts a sync ``Session`` or an ``AsyncSession``.
+    """
+    _cache.invalidate_on_commit(session, str(user_id), reason=reason)
+
+
+def _changed(obj: Any, fields: tuple[str, ...]) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+def _collect_auth_changes(session: Session, flush_context: Any) -> None:
+    for obj in chain(session.new, session.deleted, session.dirty):
+        if isinstance(obj, User):
+            if obj in session.deleted or (
+                obj in session.dirty and _changed(obj, _AUTH_USER_FIELDS)
+            ):
+                invalidate_user_on_commit(session, obj.id, reason="user")
+        elif isinstance(obj, Membership):
+            if obj in session.dirty and not _changed(obj, _MEMBERSHIP_FIELDS):
+                continue
+            history = inspect(obj).attrs.user_id.history
+            for user_id in chain(history.deleted or (), (obj.user_id,)):
+                if user_id is not None:
+                    invalidate_user_on_commit(session, user_id, reason="membership")
+
+
+_cache.listen(_collect_auth_changes)
+
+
+__all__ = [
+    "AUTH_CACHE_ENABLED_ENV",
+    "MEMBERSHIP_TTL_ENV",
+    "PRINCIPAL_TTL_ENV",
+    "auth_cache_enabled",
+    "cached_membership",
+    "cached_principal",
+    "invalidate_user",
+    "invalidate_user_on_commit",
+]
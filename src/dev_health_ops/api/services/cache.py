@@ -6,6 +6,7 @@ Import from there directly for new code.
 
 from dev_health_ops.core.cache import (  # noqa: F401
     CacheBackend,
+    CacheStats,
     GraphQLCacheManager,
     MemoryBackend,
     RedisBackend,
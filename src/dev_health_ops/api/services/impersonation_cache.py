@@ -238,6 +238,13 @@ async def _load_from_db(admin_user_id: str) -> Any:
         return _DB_ERROR
 
 
+async def _invalidate_principal(admin_user_id: str) -> None:
+    """Drop the admin's cached principal so the next request re-reads it."""
+    from dev_health_ops.api.services.auth_cache import invalidate_user
+
+    await invalidate_user(admin_user_id, reason="impersonation")
+
+
 async def set_active_session(
     admin_user_id: str, session: CachedImpersonationSession | None
 ) -> None:
@@ -255,6 +262,7 @@ async def set_active_session(
     keeps replicas correct, so it always attempts Valkey (bounded by the
     0.5s socket timeouts) even right after a read error.
     """
+    await _invalidate_principal(admin_user_id)
     client = _get_client()
     if client is None:
         return
@@ -278,6 +286,7 @@ async def invalidate(admin_user_id: str) -> None:
     ignores the circuit breaker — skipping the DEL because an earlier READ
     failed would let a stale entry resurface once the circuit closes.
     """
+    await _invalidate_principal(admin_user_id)
     client = _get_client()
     if client is None:
         return
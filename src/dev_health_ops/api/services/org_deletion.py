@@ -14,8 +14,12 @@ from typing import Any
 from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from dev_health_ops.api.services.auth_cache import invalidate_user_on_commit
 from dev_health_ops.core.encryption import decrypt_value
 from dev_health_ops.db import get_clickhouse_uri
+from dev_health_ops.licensing.entitlement_cache import (
+    invalidate_org_entitlements_on_commit,
+)
 from dev_health_ops.metrics.sinks.clickhouse import ClickHouseMetricsSink
 from dev_health_ops.models.audit import AuditLog
 from dev_health_ops.models.backfill import BackfillJob
@@ -442,6 +446,16 @@ class OrganizationDeletionService:
 
         if not dry_run:
             await self._disable_scheduled_jobs(org_id_str)
+            member_ids = await self.session.scalars(
+                select(Membership.user_id).where(Membership.org_id == org_uuid)
+            )
+            for member_id in member_ids:
+                invalidate_user_on_commit(
+                    self.session, member_id, reason="org_deletion"
+                )
+            invalidate_org_entitlements_on_commit(
+                self.session, org_uuid, reason="org_deletion"
+            )
             for target in _postgres_targets():
                 count = result.postgres.tables[target.table]
                 if count == 0:
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from dev_health_ops.api.services.auth_cache import invalidate_user_on_commit
 from dev_health_ops.models.refresh_token import RefreshToken
 
 
@@ -137,6 +138,7 @@ async def revoke_all_for_user(db: AsyncSession, user_id: str) -> int:
         .values(revoked_at=datetime.now(timezone.utc))
     )
     result = await db.execute(stmt)
+    invalidate_user_on_commit(db, user_id, reason="revoke_all")
     return int(getattr(result, "rowcount", 0) or 0)
 
 
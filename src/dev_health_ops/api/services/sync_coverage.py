@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import uuid
 from collections import defaultdict
 from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
@@ -28,7 +29,10 @@ from dev_health_ops.models.integrations import (
     SyncRunUnitStatus,
 )
 from dev_health_ops.models.settings import JobStatus, ScheduledJob, SyncConfiguration
-from dev_health_ops.models.sync_coverage import SyncCoverageProjection
+from dev_health_ops.models.sync_coverage import (
+    SyncCoverageIntervalState,
+    SyncCoverageProjection,
+)
 from dev_health_ops.sync.datasets import supported_datasets
 from dev_health_ops.sync.family_flags import (
     family_dataset_keys_from_flags,
@@ -324,6 +328,20 @@ class _CompactPairState:
     covered: list[CoverageInterval] = field(default_factory=list)
     failed: list[CoverageInterval] = field(default_factory=list)
 
+    def apply(self, interval: CoverageInterval, status: str) -> None:
+        """Fold one unit window, in ``(run_time, unit id)`` replay order.
+
+        Shared by the from-scratch scan and the interval store, so both keep
+        the same chronological failure semantics.
+        """
+
+        self.requested.append(interval)
+        if status == SyncRunUnitStatus.SUCCESS.value:
+            self.covered.append(interval)
+            self.failed = subtract_intervals(self.failed, [interval])
+        elif status == SyncRunUnitStatus.FAILED.value:
+            self.failed = merge_intervals([*self.failed, interval])
+
 
 def ensure_utc(value: datetime) -> datetime:
     """Return ``value`` as an aware UTC datetime, treating naive values as UTC."""
@@ -1172,22 +1190,34 @@ async def _stream_compact_unit_windows(
             if effective_key not in scope.dataset_keys:
                 continue
             pair = (str(row.source_id), effective_key)
-            state = states[pair]
-            interval = CoverageInterval(since=since, before=before)
-            state.requested.append(interval)
+            states[pair].apply(
+                CoverageInterval(since=since, before=before), str(row.status)
+            )
             if str(row.status) == SyncRunUnitStatus.SUCCESS.value:
-                state.covered.append(interval)
-                state.failed = subtract_intervals(state.failed, [interval])
                 successful_at = ensure_utc(row.run_time)
                 latest_successful_run_at = max(
                     latest_successful_run_at or successful_at, successful_at
                 )
-            elif str(row.status) == SyncRunUnitStatus.FAILED.value:
-                state.failed = merge_intervals([*state.failed, interval])
 
-    # Reuse the established payload builder with a compact semantic equivalent
-    # of the raw windows. Successful intervals precede unresolved failures so
-    # the latter remain visible exactly as they do after chronological replay.
+    return (
+        _compact_windows_from_states(states, generated_at=generated_at),
+        latest_successful_run_at,
+        row_count,
+    )
+
+
+def _compact_windows_from_states(
+    states: Mapping[tuple[str, str], _CompactPairState],
+    *,
+    generated_at: datetime,
+) -> list[UnitWindow]:
+    """Reuse the established payload builder with a compact semantic
+    equivalent of the raw windows.
+
+    Successful intervals precede unresolved failures so the latter remain
+    visible exactly as they do after chronological replay.
+    """
+
     success_time = datetime.min.replace(tzinfo=timezone.utc)
     failure_time = generated_at + timedelta(microseconds=1)
     windows: list[UnitWindow] = []
@@ -1246,7 +1276,539 @@ async def _stream_compact_unit_windows(
                     run_time=failure_time,
                 )
             )
-    return windows, latest_successful_run_at, row_count
+    return windows
+
+
+# --- Incrementally maintained interval store --------------------------------
+#
+# ``finalize_sync_run`` folds every terminal run into
+# ``sync_coverage_interval_states`` (one pre-merged row per source/effective
+# dataset) and stamps ``SyncRun.coverage_applied_at``. A reader starts from the
+# stored intervals and replays only units of still-unstamped runs, which is
+# exactly the from-scratch scan as long as every replayed terminal unit sorts
+# after the row's last folded key. Anything else (a stale row, an older
+# unstamped failure or success) falls back to the scan.
+SYNC_COVERAGE_INTERVAL_STORE_ENV = "SYNC_COVERAGE_INTERVAL_STORE_ENABLED"
+_OPEN_END = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def interval_store_reads_enabled() -> bool:
+    return (os.getenv(SYNC_COVERAGE_INTERVAL_STORE_ENV) or "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def _intervals_to_json(intervals: Iterable[CoverageInterval]) -> list[list[str]]:
+    return [
+        [interval.since.isoformat(), interval.before.isoformat()]
+        for interval in intervals
+    ]
+
+
+def _intervals_from_json(raw: Iterable[Sequence[str]] | None) -> list[CoverageInterval]:
+    return [
+        CoverageInterval(
+            since=ensure_utc(datetime.fromisoformat(since)),
+            before=ensure_utc(datetime.fromisoformat(before)),
+        )
+        for since, before in raw or ()
+    ]
+
+
+def _add_success_mark(
+    marks: list[tuple[datetime, datetime]], before: datetime, run_time: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Keep the ``(before, run_time)`` Pareto frontier of successful units.
+
+    The latest success visible under a cutoff is the newest ``run_time`` whose
+    ``before`` lies past the cutoff, so a mark dominated on both axes can never
+    answer a query and is dropped.
+    """
+
+    if any(b >= before and t >= run_time for b, t in marks):
+        return marks
+    kept = [(b, t) for b, t in marks if not (before >= b and run_time >= t)]
+    return sorted([*kept, (before, run_time)])
+
+
+def _latest_success_after(
+    marks: Iterable[tuple[datetime, datetime]], cutoff: datetime
+) -> datetime | None:
+    return max((t for b, t in marks if b > cutoff), default=None)
+
+
+def _success_marks_from_json(
+    raw: Iterable[Sequence[str]] | None,
+) -> list[tuple[datetime, datetime]]:
+    return [
+        (
+            ensure_utc(datetime.fromisoformat(before)),
+            ensure_utc(datetime.fromisoformat(run_time)),
+        )
+        for before, run_time in raw or ()
+    ]
+
+
+@dataclass
+class _StoredPairState:
+    """Unclipped fold of every stamped run for one source/dataset pair."""
+
+    state: _CompactPairState = field(default_factory=_CompactPairState)
+    success_marks: list[tuple[datetime, datetime]] = field(default_factory=list)
+    last_key: tuple[datetime, uuid.UUID] | None = None
+    unit_count: int = 0
+
+    def apply(
+        self,
+        interval: CoverageInterval,
+        status: str,
+        *,
+        run_time: datetime,
+        unit_id: uuid.UUID,
+    ) -> None:
+        self.state.apply(interval, status)
+        if status == SyncRunUnitStatus.SUCCESS.value:
+            self.success_marks = _add_success_mark(
+                self.success_marks, interval.before, run_time
+            )
+        self.last_key = (run_time, unit_id)
+        self.unit_count += 1
+
+    def payload(self) -> dict[str, Any]:
+        return {
+            "requested": _intervals_to_json(merge_intervals(self.state.requested)),
+            "covered": _intervals_to_json(merge_intervals(self.state.covered)),
+            "failed": _intervals_to_json(self.state.failed),
+            "success_marks": [
+                [before.isoformat(), run_time.isoformat()]
+                for before, run_time in self.success_marks
+            ],
+            "last_run_time": self.last_key[0] if self.last_key else None,
+            "last_unit_id": self.last_key[1] if self.last_key else None,
+            "unit_count": self.unit_count,
+        }
+
+    @classmethod
+    def from_row(cls, row: SyncCoverageIntervalState) -> _StoredPairState:
+        last_key = (
+            (ensure_utc(row.last_run_time), row.last_unit_id)
+            if row.last_run_time is not None and row.last_unit_id is not None
+            else None
+        )
+        return cls(
+            state=_CompactPairState(
+                requested=_intervals_from_json(row.requested),
+                covered=_intervals_from_json(row.covered),
+                failed=_intervals_from_json(row.failed),
+            ),
+            success_marks=_success_marks_from_json(row.success_marks),
+            last_key=last_key,
+            unit_count=int(row.unit_count or 0),
+        )
+
+
+def _stored_pair_payload(row: SyncCoverageIntervalState) -> dict[str, Any]:
+    return _StoredPairState.from_row(row).payload()
+
+
+def _write_stored_pair(
+    row: SyncCoverageIntervalState, stored: _StoredPairState
+) -> None:
+    for name, value in stored.payload().items():
+        setattr(row, name, value)
+
+
+def _interval_store_lock_statement(org_id: str, integration_id: uuid.UUID) -> Any:
+    return select(
+        func.pg_advisory_xact_lock(
+            func.hashtextextended(
+                f"sync-coverage-intervals:{org_id}:{integration_id}", 0
+            )
+        )
+    )
+
+
+def _unit_interval(
+    since_at: datetime | None, before_at: datetime | None
+) -> CoverageInterval | None:
+    if since_at is None or before_at is None:
+        return None
+    since, before = ensure_utc(since_at), ensure_utc(before_at)
+    if since >= before:
+        return None
+    return CoverageInterval(since=since, before=before)
+
+
+def apply_sync_run_to_coverage_intervals_sync(
+    session: Session, run: SyncRun, units: Iterable[SyncRunUnit]
+) -> int:
+    """Fold a terminal run's units into the interval store, once per run.
+
+    Called inside the finalize transaction. Returns the number of pair rows
+    touched. A run that sorts behind a row's last folded unit cannot be
+    replayed in order, so that row is marked stale instead; reads then fall
+    back to the from-scratch scan until ``sync-coverage-intervals --apply``
+    rebuilds it.
+    """
+
+    if run.coverage_applied_at is not None:
+        return 0
+    run_time = ensure_utc(run.completed_at or run.started_at or run.created_at)
+    folds: dict[tuple[uuid.UUID, str], list[tuple[SyncRunUnit, CoverageInterval]]]
+    folds = defaultdict(list)
+    for unit in sorted(units, key=lambda item: item.id):
+        if unit.status not in REQUESTED_UNIT_STATUSES:
+            continue
+        interval = _unit_interval(unit.since_at, unit.before_at)
+        if interval is None:
+            continue
+        for dataset_key in _effective_dataset_keys_for_unit(unit):
+            folds[(unit.source_id, dataset_key)].append((unit, interval))
+    run.coverage_applied_at = datetime.now(timezone.utc)
+    if not folds:
+        return 0
+
+    org_id = str(run.org_id)
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(_interval_store_lock_statement(org_id, run.integration_id))
+    rows = {
+        (row.source_id, row.dataset_key): row
+        for row in session.execute(
+            select(SyncCoverageIntervalState).where(
+                SyncCoverageIntervalState.org_id == org_id,
+                SyncCoverageIntervalState.integration_id == run.integration_id,
+                SyncCoverageIntervalState.source_id.in_(
+                    {source_id for source_id, _ in folds}
+                ),
+                SyncCoverageIntervalState.dataset_key.in_(
+                    {dataset_key for _, dataset_key in folds}
+                ),
+            )
+        ).scalars()
+    }
+    for (source_id, dataset_key), unit_folds in folds.items():
+        row = rows.get((source_id, dataset_key))
+        if row is None:
+            row = SyncCoverageIntervalState(
+                org_id=org_id,
+                integration_id=run.integration_id,
+                source_id=source_id,
+                dataset_key=dataset_key,
+                is_stale=False,
+            )
+            session.add(row)
+        if row.is_stale:
+            continue
+        stored = _StoredPairState.from_row(row)
+        if stored.last_key is not None and stored.last_key >= (
+            run_time,
+            unit_folds[0][0].id,
+        ):
+            row.is_stale = True
+            logger.warning(
+                "sync_coverage_interval_state_stale",
+                extra={
+                    "org_id": org_id,
+                    "sync_run_id": str(run.id),
+                    "source_id": str(source_id),
+                    "dataset_key": dataset_key,
+                },
+            )
+            continue
+        for unit, interval in unit_folds:
+            stored.apply(interval, unit.status, run_time=run_time, unit_id=unit.id)
+        _write_stored_pair(row, stored)
+    return len(folds)
+
+
+async def _compact_unit_windows_from_store(
+    session: AsyncSession,
+    org_id: str,
+    scope: EffectiveScope,
+    truncated_before: datetime,
+    *,
+    generated_at: datetime,
+) -> tuple[list[UnitWindow], datetime | None, int] | None:
+    """``_stream_compact_unit_windows`` from the interval store.
+
+    Returns ``None`` when the store cannot reproduce the scan exactly, and the
+    caller falls back to it. The row count reports stored intervals plus the
+    replayed unstamped units.
+    """
+
+    if scope.integration_id is None or not scope.sources or not scope.dataset_keys:
+        return [], None, 0
+    source_ids = [source.id for source in scope.sources]
+    rows = (
+        (
+            await session.execute(
+                select(SyncCoverageIntervalState).where(
+                    SyncCoverageIntervalState.org_id == org_id,
+                    SyncCoverageIntervalState.integration_id == scope.integration_id,
+                    SyncCoverageIntervalState.source_id.in_(source_ids),
+                    SyncCoverageIntervalState.dataset_key.in_(scope.dataset_keys),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if any(row.is_stale for row in rows):
+        return None
+
+    states: dict[tuple[str, str], _CompactPairState] = defaultdict(_CompactPairState)
+    last_keys: dict[tuple[str, str], tuple[datetime, uuid.UUID]] = {}
+    latest_successful_run_at: datetime | None = None
+    row_count = 0
+    for row in rows:
+        stored = _StoredPairState.from_row(row)
+        pair = (str(row.source_id), row.dataset_key)
+        states[pair] = _CompactPairState(
+            requested=_clip_intervals(
+                stored.state.requested, truncated_before, _OPEN_END
+            ),
+            covered=_clip_intervals(stored.state.covered, truncated_before, _OPEN_END),
+            failed=_clip_intervals(stored.state.failed, truncated_before, _OPEN_END),
+        )
+        row_count += sum(
+            len(intervals) for intervals in (row.requested, row.covered, row.failed)
+        )
+        if stored.last_key is not None:
+            last_keys[pair] = stored.last_key
+        stored_latest = _latest_success_after(stored.success_marks, truncated_before)
+        if stored_latest is not None:
+            latest_successful_run_at = max(
+                latest_successful_run_at or stored_latest, stored_latest
+            )
+
+    run_time = func.coalesce(
+        SyncRun.completed_at,
+        SyncRun.started_at,
+        SyncRun.created_at,
+    ).label("run_time")
+    stmt = (
+        select(
+            SyncRunUnit.source_id,
+            SyncRunUnit.dataset_key,
+            SyncRunUnit.processor_flags,
+            SyncRunUnit.since_at,
+            SyncRunUnit.before_at,
+            SyncRunUnit.status,
+            run_time,
+            SyncRunUnit.id,
+        )
+        .join(SyncRun, SyncRun.id == SyncRunUnit.sync_run_id)
+        .where(
+            SyncRun.org_id == org_id,
+            SyncRun.integration_id == scope.integration_id,
+            SyncRun.coverage_applied_at.is_(None),
+            SyncRunUnit.org_id == org_id,
+            SyncRunUnit.integration_id == scope.integration_id,
+            SyncRunUnit.source_id.in_(source_ids),
+            SyncRunUnit.dataset_key.in_(
+                _query_dataset_keys_for_scope(scope.dataset_keys)
+            ),
+            SyncRunUnit.status.in_(REQUESTED_UNIT_STATUSES),
+            SyncRunUnit.since_at.is_not(None),
+            SyncRunUnit.before_at.is_not(None),
+            SyncRunUnit.before_at >= truncated_before,
+        )
+        .order_by(run_time.asc(), SyncRunUnit.id.asc())
+        .execution_options(yield_per=1_000)
+    )
+    replayed = 0
+    stream = await session.stream(stmt)
+    async for row in stream:
+        replayed += 1
+        if replayed > MAX_COVERAGE_PROJECTION_ROWS:
+            raise SyncCoverageComplexityError(
+                stage="projection_rows",
+                limit=MAX_COVERAGE_PROJECTION_ROWS,
+                observed=replayed,
+            )
+        since = max(ensure_utc(row.since_at), truncated_before)
+        before = ensure_utc(row.before_at)
+        if since >= before:
+            continue
+        status = str(row.status)
+        key = (ensure_utc(row.run_time), row.id)
+        for effective_key in _effective_dataset_keys(
+            str(row.dataset_key), row.processor_flags
+        ):
+            if effective_key not in scope.dataset_keys:
+                continue
+            pair = (str(row.source_id), effective_key)
+            last_key = last_keys.get(pair)
+            if (
+                status in TERMINAL_UNIT_STATUSES
+                and last_key is not None
+                and key <= last_key
+            ):
+                return None
+            states[pair].apply(CoverageInterval(since=since, before=before), status)
+            if status == SyncRunUnitStatus.SUCCESS.value:
+                latest_successful_run_at = max(
+                    latest_successful_run_at or key[0], key[0]
+                )
+
+    return (
+        _compact_windows_from_states(states, generated_at=generated_at),
+        latest_successful_run_at,
+        row_count + replayed,
+    )
+
+
+@dataclass(frozen=True)
+class IntervalStoreDrift:
+    """One pair whose stored intervals disagree with a from-scratch fold."""
+
+    source_id: uuid.UUID
+    dataset_key: str
+    reason: Literal["missing", "unexpected", "stale", "mismatch"]
+
+
+@dataclass
+class IntervalStoreReport:
+    org_id: str
+    integration_id: uuid.UUID
+    pair_count: int = 0
+    unit_count: int = 0
+    drift: list[IntervalStoreDrift] = field(default_factory=list)
+    rewritten: bool = False
+
+
+def rebuild_sync_coverage_intervals_sync(
+    session: Session,
+    org_id: str,
+    integration_id: uuid.UUID,
+    *,
+    apply: bool = False,
+) -> IntervalStoreReport:
+    """Fold raw units from scratch and compare them with the interval store.
+
+    Units are replayed in the scan's ``(run_time, unit id)`` order through the
+    same reducer finalize uses. Verification folds only stamped runs, since
+    those are exactly what the store claims to hold. With ``apply`` every
+    non-active run is folded, the integration's pair rows are replaced and the
+    folded runs are stamped, which clears stale rows and seeds history that
+    predates the store.
+    """
+
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(_interval_store_lock_statement(org_id, integration_id))
+    run_time = func.coalesce(
+        SyncRun.completed_at,
+        SyncRun.started_at,
+        SyncRun.created_at,
+    ).label("run_time")
+    stmt = (
+        select(
+            SyncRunUnit.sync_run_id,
+            SyncRunUnit.source_id,
+            SyncRunUnit.dataset_key,
+            SyncRunUnit.processor_flags,
+            SyncRunUnit.since_at,
+            SyncRunUnit.before_at,
+            SyncRunUnit.status,
+            run_time,
+            SyncRunUnit.id,
+        )
+        .join(SyncRun, SyncRun.id == SyncRunUnit.sync_run_id)
+        .where(
+            SyncRun.org_id == org_id,
+            SyncRun.integration_id == integration_id,
+            SyncRun.status.not_in(ACTIVE_RUN_STATUSES),
+            SyncRunUnit.org_id == org_id,
+            SyncRunUnit.status.in_(REQUESTED_UNIT_STATUSES),
+        )
+        .order_by(run_time.asc(), SyncRunUnit.id.asc())
+        .execution_options(yield_per=1_000)
+    )
+    if not apply:
+        stmt = stmt.where(SyncRun.coverage_applied_at.is_not(None))
+    rebuilt: dict[tuple[uuid.UUID, str], _StoredPairState] = defaultdict(
+        _StoredPairState
+    )
+    folded_run_ids: set[uuid.UUID] = set()
+    report = IntervalStoreReport(org_id=org_id, integration_id=integration_id)
+    for row in session.execute(stmt):
+        folded_run_ids.add(row.sync_run_id)
+        interval = _unit_interval(row.since_at, row.before_at)
+        if interval is None:
+            continue
+        report.unit_count += 1
+        for dataset_key in _effective_dataset_keys(
+            str(row.dataset_key), row.processor_flags
+        ):
+            rebuilt[(row.source_id, dataset_key)].apply(
+                interval,
+                str(row.status),
+                run_time=ensure_utc(row.run_time),
+                unit_id=row.id,
+            )
+
+    existing = {
+        (row.source_id, row.dataset_key): row
+        for row in session.execute(
+            select(SyncCoverageIntervalState).where(
+                SyncCoverageIntervalState.org_id == org_id,
+                SyncCoverageIntervalState.integration_id == integration_id,
+            )
+        ).scalars()
+    }
+    report.pair_count = len(rebuilt)
+    for pair in sorted({*rebuilt, *existing}, key=lambda item: (str(item[0]), item[1])):
+        row = existing.get(pair)
+        reason: Literal["missing", "unexpected", "stale", "mismatch"] | None = None
+        if row is None:
+            reason = "missing"
+        elif pair not in rebuilt:
+            reason = "unexpected"
+        elif row.is_stale:
+            reason = "stale"
+        elif _stored_pair_payload(row) != rebuilt[pair].payload():
+            reason = "mismatch"
+        if reason is not None:
+            report.drift.append(
+                IntervalStoreDrift(
+                    source_id=pair[0], dataset_key=pair[1], reason=reason
+                )
+            )
+
+    if apply and report.drift:
+        for pair, row in existing.items():
+            if pair not in rebuilt:
+                session.delete(row)
+        for pair, stored in rebuilt.items():
+            row = existing.get(pair)
+            if row is None:
+                row = SyncCoverageIntervalState(
+                    org_id=org_id,
+                    integration_id=integration_id,
+                    source_id=pair[0],
+                    dataset_key=pair[1],
+                )
+                session.add(row)
+            row.is_stale = False
+            _write_stored_pair(row, stored)
+        report.rewritten = True
+    if apply and folded_run_ids:
+        stamped_at = datetime.now(timezone.utc)
+        run_ids = sorted(folded_run_ids)
+        for start in range(0, len(run_ids), 1_000):
+            session.execute(
+                update(SyncRun)
+                .where(
+                    SyncRun.id.in_(run_ids[start : start + 1_000]),
+                    SyncRun.coverage_applied_at.is_(None),
+                )
+                .values(coverage_applied_at=stamped_at)
+            )
+    session.flush()
+    return report
 
 
 async def _active_run_ids(
@@ -2165,17 +2727,27 @@ async def rebuild_sync_coverage_projection(
     )
     schedule = await _active_schedule(session, org_id, config)
     has_schedule = await _has_schedule_row(session, org_id, config)
-    (
-        windows,
-        latest_successful_run_at,
-        raw_row_count,
-    ) = await _stream_compact_unit_windows(
-        session,
-        org_id,
-        effective_scope,
-        truncated_before,
-        generated_at=now,
+    compact = (
+        await _compact_unit_windows_from_store(
+            session,
+            org_id,
+            effective_scope,
+            truncated_before,
+            generated_at=now,
+        )
+        if interval_store_reads_enabled()
+        else None
     )
+    interval_store_hit = compact is not None
+    if compact is None:
+        compact = await _stream_compact_unit_windows(
+            session,
+            org_id,
+            effective_scope,
+            truncated_before,
+            generated_at=now,
+        )
+    windows, latest_successful_run_at, raw_row_count = compact
     active_pairs = await _active_run_ids(session, org_id, effective_scope, query_budget)
     backfill_requested = await _backfill_requested_ranges(
         session,
@@ -2239,6 +2811,7 @@ async def rebuild_sync_coverage_projection(
             "history_lookback_days": lookback_days,
             "raw_unit_row_count": raw_row_count,
             "compact_window_count": len(windows),
+            "interval_store_hit": interval_store_hit,
             "projection_version": SYNC_COVERAGE_PROJECTION_VERSION,
         },
     )
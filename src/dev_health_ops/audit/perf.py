@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 from typing import Any
 
 from dev_health_ops.db import resolve_sink_uri
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    LOG_COMMENT_SOURCE,
+    UNKNOWN_CALLER,
+)
 from dev_health_ops.storage import detect_db_type
 
 logger = logging.getLogger(__name__)
@@ -46,6 +51,66 @@ def _get_setting_value(client: Any, name: str) -> str | None:
     return str(rows[0][0])
 
 
+def _parse_log_comment(value: Any) -> dict[str, str]:
+    """Return the caller tags written by the ClickHouse instrumentation."""
+    if not value:
+        return {}
+    try:
+        parsed = json.loads(str(value))
+    except ValueError:
+        return {}
+    if not isinstance(parsed, dict) or parsed.get("source") != LOG_COMMENT_SOURCE:
+        return {}
+    return {
+        key: str(parsed[key])
+        for key in ("caller", "component", "fingerprint")
+        if parsed.get(key)
+    }
+
+
+def _caller_cost_sql(
+    columns: list[str],
+    time_column: str | None,
+    lookback_minutes: int,
+    limit: int,
+) -> str:
+    """Aggregate tagged query_log rows by caller and query fingerprint."""
+    aggregates = [
+        "JSONExtractString(log_comment, 'caller') AS caller",
+        "JSONExtractString(log_comment, 'fingerprint') AS fingerprint",
+        "count() AS queries",
+        "sum(query_duration_ms) AS total_duration_ms",
+        "max(query_duration_ms) AS max_duration_ms",
+    ]
+    for optional in ("read_rows", "read_bytes", "result_rows", "written_rows"):
+        if optional in columns:
+            aggregates.append(f"sum({optional}) AS {optional}")
+    if "query" in columns:
+        aggregates.append("any(query) AS sample_query")
+
+    filters = [
+        f"JSONExtractString(log_comment, 'source') = '{LOG_COMMENT_SOURCE}'",
+    ]
+    if time_column:
+        filters.append(
+            f"{time_column} >= now() - INTERVAL {int(lookback_minutes)} MINUTE"
+        )
+    if "type" in columns:
+        filters.append("type = 'QueryFinish'")
+    if "is_initial_query" in columns:
+        filters.append("is_initial_query = 1")
+
+    return (
+        "SELECT "
+        + ", ".join(aggregates)
+        + " FROM system.query_log WHERE "
+        + " AND ".join(filters)
+        + " GROUP BY caller, fingerprint"
+        + " ORDER BY total_duration_ms DESC"
+        + f" LIMIT {int(limit)}"
+    )
+
+
 def _pick_time_column(columns: list[str]) -> str | None:
     for candidate in ("event_time", "query_start_time", "event_time_microseconds"):
         if candidate in columns:
@@ -69,6 +134,7 @@ def run_perf_audit(
         "limit": int(limit),
         "log_settings": {},
         "slow_queries": [],
+        "callers": [],
         "notes": [],
     }
 
@@ -129,6 +195,7 @@ def run_perf_audit(
             "result_bytes",
             "memory_usage",
             "exception",
+            "log_comment",
         ):
             if optional in columns:
                 select_columns.append(optional)
@@ -170,10 +237,37 @@ def run_perf_audit(
                     "memory_usage": entry.get("memory_usage"),
                     "exception": entry.get("exception"),
                     "query": _truncate_query(str(query_text)),
+                    **_parse_log_comment(entry.get("log_comment")),
                 }
             )
 
         report["slow_queries"] = slow_queries
+
+        if "log_comment" in columns:
+            result = client.query(
+                _caller_cost_sql(columns, time_column, lookback_minutes, limit)
+            )
+            col_names = _column_names(result)
+            callers = []
+            for row in _result_rows(result):
+                entry = dict(zip(col_names, row))
+                callers.append(
+                    {
+                        "caller": entry.get("caller") or UNKNOWN_CALLER,
+                        "fingerprint": entry.get("fingerprint"),
+                        "queries": entry.get("queries"),
+                        "total_duration_ms": entry.get("total_duration_ms"),
+                        "max_duration_ms": entry.get("max_duration_ms"),
+                        "read_rows": entry.get("read_rows"),
+                        "read_bytes": entry.get("read_bytes"),
+                        "result_rows": entry.get("result_rows"),
+                        "written_rows": entry.get("written_rows"),
+                        "query": _truncate_query(str(entry.get("sample_query") or "")),
+                    }
+                )
+            report["callers"] = callers
+        else:
+            report["notes"].append("query_log missing log_comment column")
         report["status"] = "slow" if slow_queries else "ok"
         return report
     finally:
@@ -224,11 +318,31 @@ def format_perf_report(report: dict[str, Any]) -> str:
                 summary_parts.append(str(event_time))
             if query_kind:
                 summary_parts.append(str(query_kind))
+            if entry.get("caller"):
+                summary_parts.append(f"[{entry['caller']}]")
             summary_parts.append(query or "")
             lines.append("- " + " ".join(summary_parts).strip())
     else:
         lines.append("slow_queries: none")
 
+    callers = report.get("callers") or []
+    if callers:
+        lines.append("callers:")
+        for entry in callers:
+            summary_parts = [
+                str(entry.get("caller") or UNKNOWN_CALLER),
+                str(entry.get("fingerprint") or "?"),
+                f"queries={entry.get('queries')}",
+                f"total_ms={entry.get('total_duration_ms')}",
+                f"max_ms={entry.get('max_duration_ms')}",
+            ]
+            if entry.get("read_rows") is not None:
+                summary_parts.append(f"read_rows={entry['read_rows']}")
+            if entry.get("read_bytes") is not None:
+                summary_parts.append(f"read_bytes={entry['read_bytes']}")
+            summary_parts.append(entry.get("query") or "")
+            lines.append("- " + " ".join(summary_parts).strip())
+
     return "\n".join(lines)
 
 
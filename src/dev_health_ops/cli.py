@@ -185,6 +185,14 @@ def _cmd_maintenance_scrub_error_text(ns: argparse.Namespace) -> int:
     return run_scrub_error_text(ns)
 
 
+def _cmd_maintenance_sync_coverage_intervals(ns: argparse.Namespace) -> int:
+    from dev_health_ops.maintenance.sync_coverage_intervals import (
+        run_sync_coverage_intervals,
+    )
+
+    return run_sync_coverage_intervals(ns)
+
+
 # ---------------------------------------------------------------------------
 # Recommendations commands
 # ---------------------------------------------------------------------------
@@ -434,13 +442,12 @@ def _should_resolve_org(ns: argparse.Namespace) -> bool:
         and getattr(ns, "audit_command", None) == "planner-configs"
     ):
         return False
-    # The error-text scrub defaults to ALL orgs too -- its own --org flag is
-    # an explicit opt-in scope, so a missing --org must never silently
-    # narrow it to a single (first) org.
-    if (
-        getattr(ns, "command", None) == "maintenance"
-        and getattr(ns, "maintenance_command", None) == "scrub-error-text"
-    ):
+    # The error-text scrub and the coverage-interval check default to ALL
+    # orgs too -- their own --org flag is an explicit opt-in scope, so a
+    # missing --org must never silently narrow them to a single (first) org.
+    if getattr(ns, "command", None) == "maintenance" and getattr(
+        ns, "maintenance_command", None
+    ) in {"scrub-error-text", "sync-coverage-intervals"}:
         return False
     # `push` runs against a customer's own FullChaos org over HTTP, usually
     # from a CI runner with no local DB at all -- auto-resolving --org to
@@ -545,6 +552,7 @@ _COMMAND_REQUIREMENTS: dict[tuple[str, ...], frozenset[str]] = {
     ("backfill", "run"): frozenset({_REQ_POSTGRES}),
     ("backfill", "operational"): frozenset({_REQ_CLICKHOUSE}),
     ("maintenance", "scrub-error-text"): frozenset({_REQ_POSTGRES}),
+    ("maintenance", "sync-coverage-intervals"): frozenset({_REQ_POSTGRES}),
     ("maintenance", "backfill-ask-dev-ephemeral-expiry"): frozenset({_REQ_POSTGRES}),
     # --- migrations that connect to a live database ---
     ("migrate", "clickhouse", "upgrade"): frozenset({_REQ_CLICKHOUSE}),
@@ -872,6 +880,25 @@ def build_parser() -> argparse.ArgumentParser:
     )
     scrub_error_text_parser.set_defaults(func=_cmd_maintenance_scrub_error_text)
 
+    sync_coverage_intervals_parser = maintenance_subparsers.add_parser(
+        "sync-coverage-intervals",
+        help=(
+            "Verify the sync-coverage interval store against a from-scratch "
+            "fold of sync run units. Verify-only unless --apply is passed."
+        ),
+    )
+    sync_coverage_intervals_parser.add_argument(
+        "--apply",
+        action="store_true",
+        help=(
+            "Rebuild drifted integrations and stamp the folded runs. Without "
+            "this flag, reports per-integration drift only and mutates nothing."
+        ),
+    )
+    sync_coverage_intervals_parser.set_defaults(
+        func=_cmd_maintenance_sync_coverage_intervals
+    )
+
     backfill_ephemeral_expiry_parser = maintenance_subparsers.add_parser(
         "backfill-ask-dev-ephemeral-expiry",
         help=(
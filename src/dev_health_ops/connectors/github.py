@@ -108,6 +108,9 @@ class GitHubConnector(GitConnector):
             raise ValueError("GitHubConnector requires token or credentials")
 
         self.token = token
+        # Tenant (org id) the sync runs for; processors set it so the
+        # instrumented code clients scope their validator cache keys by it.
+        self.validator_scope = ""
 
         # Initialize PyGithub client
         auth = Auth.Token(token)
@@ -42,6 +42,9 @@ class GitLabConnector:
         self.max_workers = max_workers
         self.url = url
         self.private_token = private_token
+        # Tenant (org id) the sync runs for; processors set it so the
+        # instrumented code clients scope their validator cache keys by it.
+        self.validator_scope = ""
 
         self.gitlab = gitlab.Gitlab(
             url=url,
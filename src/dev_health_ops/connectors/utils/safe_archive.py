@@ -5,22 +5,26 @@ and GitLab. ZIPs from external sources are untrusted input and must be handled
 defensively against:
 
 - **Zip-slip / path traversal** — entry names like ``../../etc/passwd`` or
-  absolute paths. We never extract to disk; we read entries in memory and reject
-  dangerous names outright.
+  absolute paths. We never extract to the archive's paths; entries are read
+  into anonymous spooled temp files and dangerous names are rejected outright.
 - **Decompression bombs** — a tiny archive that inflates to gigabytes. We cap
   per-entry uncompressed size, total uncompressed size, entry count, and the
   per-entry compression ratio.
 
 The reader yields only entries whose names match a caller-supplied predicate
-(e.g. ``*.xml``), so we never inflate files we don't care about.
+(e.g. ``*.xml``), so we never inflate files we don't care about. Entries are
+copied in chunks into ``SpooledTemporaryFile``s, so a large report rolls over
+to disk instead of being held as one ``bytes`` object.
 """
 
 from __future__ import annotations
 
 import io
 import logging
+import tempfile
 import zipfile
 from collections.abc import Callable, Iterator
+from typing import IO
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,9 @@ DEFAULT_MAX_ENTRIES = 2_000
 DEFAULT_MAX_FILE_BYTES = 64 * 1024 * 1024  # 64 MiB per entry (uncompressed)
 DEFAULT_MAX_TOTAL_BYTES = 256 * 1024 * 1024  # 256 MiB total (uncompressed)
 DEFAULT_MAX_COMPRESSION_RATIO = 200  # uncompressed / compressed per entry
+DEFAULT_SPOOL_BYTES = 1024 * 1024  # members larger than this spill to disk
+
+_COPY_CHUNK_BYTES = 64 * 1024
 
 
 def _is_safe_member_name(name: str) -> bool:
@@ -47,25 +54,48 @@ def _is_safe_member_name(name: str) -> bool:
     return True
 
 
-def iter_zip_members(
-    data: bytes,
+def _spool_member(
+    archive: zipfile.ZipFile, info: zipfile.ZipInfo, max_file_bytes: int
+) -> IO[bytes] | None:
+    """Copy one member into a spooled temp file; ``None`` past the byte cap."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=DEFAULT_SPOOL_BYTES)
+    size = 0
+    with archive.open(info) as member:
+        while chunk := member.read(_COPY_CHUNK_BYTES):
+            size += len(chunk)
+            # Second line of defense in case the declared size in the header
+            # understated the real content.
+            if size > max_file_bytes:
+                spooled.close()
+                return None
+            spooled.write(chunk)
+    spooled.seek(0)
+    return spooled  # type: ignore[return-value]
+
+
+def iter_zip_member_files(
+    source: bytes | IO[bytes],
     *,
     name_filter: Callable[[str], bool],
     max_entries: int = DEFAULT_MAX_ENTRIES,
     max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
     max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
     max_compression_ratio: int = DEFAULT_MAX_COMPRESSION_RATIO,
-) -> Iterator[tuple[str, bytes]]:
-    """Yield ``(name, content_bytes)`` for matching, in-bounds ZIP members.
+) -> Iterator[tuple[str, IO[bytes]]]:
+    """Yield ``(name, file)`` for matching, in-bounds ZIP members.
 
-    Entries are skipped (with a warning) rather than raising when they fail a
-    safety check, so one hostile entry doesn't abort ingestion of the rest.
-    Raises ``zipfile.BadZipFile`` only when ``data`` is not a valid ZIP — the
-    caller should treat that as "no reports in this artifact".
+    ``source`` is the archive as bytes or a seekable binary file. Each member
+    is a ``SpooledTemporaryFile`` positioned at its start; the caller owns it
+    and must close it. Entries are skipped (with a warning) rather than
+    raising when they fail a safety check, so one hostile entry doesn't abort
+    ingestion of the rest. Raises ``zipfile.BadZipFile`` only when ``source``
+    is not a valid ZIP — the caller should treat that as "no reports in this
+    artifact".
     """
     total_uncompressed = 0
     processed = 0
-    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+    archive_file = io.BytesIO(source) if isinstance(source, bytes) else source
+    with zipfile.ZipFile(archive_file) as archive:
         infos = archive.infolist()
         if len(infos) > max_entries:
             logger.warning(
@@ -105,20 +135,44 @@ def iter_zip_members(
                     max_total_bytes,
                 )
                 break
-            # Read with an explicit byte cap as a second line of defense in case
-            # the declared size in the header understated the real content.
-            with archive.open(info) as member:
-                content = member.read(max_file_bytes + 1)
-            if len(content) > max_file_bytes:
+            member_file = _spool_member(archive, info, max_file_bytes)
+            if member_file is None:
                 logger.warning(
                     "Skipping archive member %r: actual size exceeds %d cap",
                     name,
                     max_file_bytes,
                 )
                 continue
-            total_uncompressed += len(content)
+            total_uncompressed += member_file.seek(0, io.SEEK_END)
+            member_file.seek(0)
             processed += 1
-            yield name, content
+            yield name, member_file
     logger.debug(
         "Read %d member(s) from archive (%d bytes)", processed, total_uncompressed
     )
+
+
+def iter_zip_members(
+    data: bytes,
+    *,
+    name_filter: Callable[[str], bool],
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+    max_compression_ratio: int = DEFAULT_MAX_COMPRESSION_RATIO,
+) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(name, content_bytes)`` for matching, in-bounds ZIP members.
+
+    Same checks as ``iter_zip_member_files``, with each member read fully into
+    memory.
+    """
+    for name, member_file in iter_zip_member_files(
+        data,
+        name_filter=name_filter,
+        max_entries=max_entries,
+        max_file_bytes=max_file_bytes,
+        max_total_bytes=max_total_bytes,
+        max_compression_ratio=max_compression_ratio,
+    ):
+        with member_file:
+            yield name, member_file.read()
@@ -1,20 +1,30 @@
 """Cache utilities — pure infrastructure, no API or framework dependencies.
 
-Provides TTL-based caching with in-memory and Redis backends. Shared by the
+Provides TTL-based caching with in-memory, Redis and on-disk backends. Shared by the
 API layer, Celery workers, and any other module without creating circular
 imports.
 
+The in-memory backend is LRU-bounded by entry count (and optionally by an
+estimated byte budget) and sweeps expired entries periodically. ``TTLCache``
+coalesces concurrent misses for the same key through ``get_or_compute`` so a
+burst of identical requests runs the underlying query once.
+
 Nothing here imports from dev_health_ops.api.*.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -61,28 +71,118 @@ class CacheBackend(ABC):
         return [self.get(k) for k in keys]
 
 
+def _env_int(name: str, default: int | None) -> int | None:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", name, raw)
+        return default
+    return value if value > 0 else None
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate in-memory cost of a cached value by its JSON length."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
 class MemoryBackend(CacheBackend):
-    """In-memory cache backend (default)."""
+    """In-memory LRU cache backend (default).
 
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[float, Any]] = {}
+    Bounded by ``max_entries`` and, when set, an estimated ``max_bytes``
+    budget (JSON length of each value). Least recently used entries are
+    evicted first. Expired entries are dropped when read and by a sweep that
+    runs at most every ``sweep_interval_seconds`` on writes.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        sweep_interval_seconds: float = 60.0,
+    ) -> None:
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else _env_int("CACHE_MEMORY_MAX_ENTRIES", self.DEFAULT_MAX_ENTRIES)
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else _env_int("CACHE_MEMORY_MAX_BYTES", None)
+        )
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.evictions = 0
+        self.expirations = 0
+        self._store: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Any | None:
-        entry = self._store.get(key)
-        if not entry:
-            return None
-        expires_at, value = entry
-        if time.time() > expires_at:
-            self._store.pop(key, None)
-            return None
-        return value
+        with self._lock:
+            entry = self._store.get(key)
+            if not entry:
+                return None
+            expires_at, value, _size = entry
+            if time.time() > expires_at:
+                self._drop(key)
+                self.expirations += 1
+                return None
+            self._store.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any, ttl_seconds: int) -> None:
-        self._store[key] = (time.time() + ttl_seconds, value)
+        size = _estimate_size(value) if self.max_bytes else 0
+        with self._lock:
+            self._drop(key)
+            self._store[key] = (time.time() + ttl_seconds, value, size)
+            self._bytes += size
+            self._maybe_sweep()
+            self._evict_over_budget()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
 
     def status(self) -> str:
         return "ok"
 
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _drop(self, key: str) -> None:
+        entry = self._store.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict_over_budget(self) -> None:
+        while self._store and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _key, (_expires_at, _value, size) = self._store.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.sweep_interval_seconds:
+            return
+        self._last_sweep = now
+        wall = time.time()
+        expired = [k for k, (exp, _v, _s) in self._store.items() if wall > exp]
+        for key in expired:
+            self._drop(key)
+        self.expirations += len(expired)
+
 
 class RedisBackend(CacheBackend):
     """Redis-backed cache for distributed deployments."""
@@ -161,6 +261,195 @@ class RedisBackend(CacheBackend):
             return "down"
 
 
+class FileBackend(CacheBackend):
+    """On-disk cache backend: one JSON file per key under ``directory``.
+
+    For single-host workers that want entries to survive a restart without a
+    Redis deployment. File names are key digests, so tenant data in keys never
+    reaches the filesystem; writes go through a temp file and ``os.replace``
+    so concurrent writers sharing the directory never expose a torn entry.
+
+    Values are stored in clear (the validator cache keeps provider response
+    bodies, i.e. private repository data), so the directory is created
+    ``0o700`` and every entry is written ``0o600``; point it at a directory
+    only the worker's user can read. Each file's mtime is its expiry, and a
+    sweep that runs at most every ``sweep_interval_seconds`` on writes removes
+    expired entries, then the soonest-expiring ones beyond ``max_entries``.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        directory: str,
+        max_entries: int | None = None,
+        sweep_interval_seconds: float = 60.0,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else _env_int("CACHE_FILE_MAX_ENTRIES", self.DEFAULT_MAX_ENTRIES)
+        )
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.evictions = 0
+        self.expirations = 0
+        self._last_sweep = float("-inf")
+        self._sweep_lock = threading.Lock()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "File cache read failed for key=%s: %s", _safe_key_label(key), e
+            )
+            return None
+        if time.time() > float(entry.get("expires_at", 0)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        expires_at = time.time() + ttl_seconds
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"expires_at": expires_at, "value": value}, handle)
+            os.utime(tmp_path, (expires_at, expires_at))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(
+                "File cache write failed for key=%s: %s", _safe_key_label(key), e
+            )
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._maybe_sweep()
+
+    def status(self) -> str:
+        return "ok" if os.access(self.directory, os.W_OK) else "down"
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.sweep_interval_seconds:
+            return
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = now
+            self._sweep()
+        finally:
+            self._sweep_lock.release()
+
+    def _sweep(self) -> None:
+        wall = time.time()
+        live: list[tuple[float, str]] = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        expires_at = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if expires_at < wall:
+                        if self._remove(entry.path):
+                            self.expirations += 1
+                    else:
+                        live.append((expires_at, entry.path))
+        except OSError as e:
+            logger.warning("File cache sweep failed: %s", e)
+            return
+        if self.max_entries is None or len(live) <= self.max_entries:
+            return
+        live.sort()
+        for _expires_at, path in live[: len(live) - self.max_entries]:
+            if self._remove(path):
+                self.evictions += 1
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
+
+
+@dataclass
+class CacheStats:
+    """Counters for one ``TTLCache``.
+
+    ``coalesced`` counts misses that waited on an in-flight computation for
+    the same key instead of running their own.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class _SingleFlight:
+    """Tracks in-flight computations so concurrent misses share one result."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    def join(self, key: str) -> asyncio.Future[Any] | None:
+        future = self._inflight.get(key)
+        if future is None or future.done():
+            return None
+        if future.get_loop() is not asyncio.get_running_loop():
+            return None
+        return future
+
+    def lead(self, key: str) -> asyncio.Future[Any]:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    def finish(
+        self,
+        key: str,
+        future: asyncio.Future[Any],
+        *,
+        value: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+            # Waiters re-raise it; mark it retrieved so a lone leader does
+            # not log "exception was never retrieved".
+            future.exception()
+        else:
+            future.set_result(value)
+
+
 class TTLCache:
     """Cache with configurable backend (memory or Redis)."""
 
@@ -171,6 +460,8 @@ class TTLCache:
     ) -> None:
         self.ttl_seconds = ttl_seconds
         self._backend = backend or MemoryBackend()
+        self._stats = CacheStats()
+        self._flights = _SingleFlight()
 
     def get(self, key: str) -> Any | None:
         return self._backend.get(key)
@@ -186,6 +477,108 @@ class TTLCache:
         """Returns the status of the underlying backend."""
         return self._backend.status()
 
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/coalesced counters plus backend evictions."""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            coalesced=self._stats.coalesced,
+            evictions=int(getattr(self._backend, "evictions", 0)),
+        )
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        to_cache: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Return the cached value for ``key`` or compute and store it.
+
+        Concurrent callers that miss on the same key while a computation is
+        in flight await that computation instead of starting their own.
+        ``to_cache`` converts the computed value before it is stored; the
+        caller (and every coalesced waiter) receives the unconverted value.
+        ``None`` results are returned but never cached.
+        """
+        (value,) = await self.get_or_compute_many(
+            [key],
+            lambda _missing: _single(compute),
+            to_cache=to_cache,
+        )
+        return value
+
+    async def get_or_compute_many(
+        self,
+        keys: Sequence[str],
+        compute_many: Callable[[list[str]], Awaitable[Sequence[Any]]],
+        *,
+        to_cache: Callable[[Any], Any] | None = None,
+    ) -> list[Any]:
+        """Batch form of ``get_or_compute``.
+
+        Cached keys are read with one ``mget``. Keys already being computed
+        elsewhere are awaited; the rest are passed to a single
+        ``compute_many`` call, which must return values aligned with its
+        argument.
+        """
+        results: list[Any] = list(self._backend.mget(list(keys)))
+        waiting: list[tuple[int, asyncio.Future[Any]]] = []
+        leading: dict[str, asyncio.Future[Any]] = {}
+        lead_indices: dict[str, list[int]] = {}
+        for idx, (key, cached) in enumerate(zip(keys, results)):
+            if cached is not None:
+                self._stats.hits += 1
+                continue
+            if key in lead_indices:
+                lead_indices[key].append(idx)
+                continue
+            future = self._flights.join(key)
+            if future is not None:
+                self._stats.coalesced += 1
+                waiting.append((idx, future))
+                continue
+            self._stats.misses += 1
+            leading[key] = self._flights.lead(key)
+            lead_indices[key] = [idx]
+
+        if leading:
+            missing = list(leading)
+            try:
+                computed = list(await compute_many(missing))
+            except BaseException as exc:
+                for key, future in leading.items():
+                    self._flights.finish(key, future, error=exc)
+                raise
+            for key, value in zip(missing, computed):
+                if value is not None:
+                    try:
+                        self.set(key, to_cache(value) if to_cache else value)
+                    except Exception as e:
+                        logger.debug(
+                            "Cache set failed for %s: %s", _safe_key_label(key), e
+                        )
+                self._flights.finish(key, leading[key], value=value)
+                for idx in lead_indices[key]:
+                    results[idx] = value
+
+        for idx, future in waiting:
+            try:
+                results[idx] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled; compute this key ourselves.
+                (results[idx],) = await self.get_or_compute_many(
+                    [keys[idx]], compute_many, to_cache=to_cache
+                )
+        return results
+
+
+async def _single(compute: Callable[[], Awaitable[Any]]) -> list[Any]:
+    return [await compute()]
+
 
 def create_cache(
     ttl_seconds: int,
@@ -239,6 +632,16 @@ class GraphQLCacheManager:
         """
         return self._cache.get(key)
 
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        to_cache: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Get a cached query result, coalescing concurrent misses."""
+        return await self._cache.get_or_compute(key, compute, to_cache=to_cache)
+
     def set_query_result(
         self,
         key: str,
@@ -0,0 +1,317 @@
+"""Generation-invalidated read-through cache with a Valkey shared tier.
+
+The building blocks behind ``api.services.auth_cache`` and
+``licensing.entitlement_cache``: a process-local TTL/LRU tier, per-scope
+generation counters mirrored in Valkey, a short circuit breaker for the
+shared tier, and SQLAlchemy session hooks that bump generations only after
+COMMIT.
+
+An entry records the generations of its scopes read BEFORE the value was
+loaded; any bump of one of those scopes makes it stale. Generation keys
+outlive every entry (``GENERATION_TTL_SECONDS`` > ``MAX_TTL_SECONDS``), so an
+expired generation key read as 0 again can never revive an entry written
+under generation 0.
+
+Failure policy matches ``impersonation_cache``: when ``REDIS_URL`` is set but
+Valkey is unavailable, reads bypass the cache for ``CIRCUIT_SECONDS``.
+Invalidation writes ignore the breaker -- a bump skipped because an earlier
+read failed would let a stale entry resurface once it closes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+MAX_TTL_SECONDS = 3600
+GENERATION_TTL_SECONDS = 24 * 3600
+CIRCUIT_SECONDS = 5.0
+
+
+def env_flag_enabled(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def ttl_from_env(name: str, default: int) -> int:
+    """``name`` as whole seconds, clamped to ``[0, MAX_TTL_SECONDS]``."""
+    try:
+        ttl = int(os.getenv(name) or default)
+    except ValueError:
+        ttl = default
+    return max(0, min(ttl, MAX_TTL_SECONDS))
+
+
+class LocalTier:
+    """Process-local TTL/LRU entries plus process-local scope generations.
+
+    Each entry carries a ``tag`` (typically the generations it was loaded
+    under) that the caller compares before trusting the value.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    def generation(self, scope: str) -> int:
+        return self._generations.get(scope, 0)
+
+    def bump(self, scope: str) -> None:
+        self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def get(self, key: str) -> tuple[Any, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, tag, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return tag, value
+
+    def put(self, key: str, tag: Any, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, tag, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generations.clear()
+
+
+@dataclass(frozen=True)
+class SharedRead:
+    """One shared-tier read: the raw entry and its scopes' generations.
+
+    ``generations`` is None (and ``client`` too) when no shared tier is
+    configured.
+    """
+
+    raw: Any
+    generations: tuple[int, ...] | None
+    client: Any | None
+
+
+class GenerationCache:
+    """Shared tier, circuit breaker and commit-time invalidation for one cache.
+
+    ``name`` labels logs and the ``Session.info`` key; ``record_invalidation``
+    is called with ``(scope, reason)`` for every applied bump.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        key_prefix: str,
+        enabled: Callable[[], bool],
+        local_max_entries: int,
+        record_invalidation: Callable[[str, str], None],
+        stale_description: str,
+    ) -> None:
+        self.name = name
+        self.key_prefix = key_prefix
+        self.local = LocalTier(local_max_entries)
+        self.client: Any | None = None
+        self.sync_client: Any | None = None
+        self.circuit_open_until = 0.0
+        self._enabled = enabled
+        self._record_invalidation = record_invalidation
+        self._stale_description = stale_description
+        # Session.info key holding {scope: reason} until the transaction commits.
+        self._pending_info_key = f"{name}_cache_pending_invalidations"
+        # Keeps fire-and-forget generation bumps alive until they finish.
+        self._background_tasks: set[asyncio.Task[None]] = set()
+
+    def generation_key(self, scope: str) -> str:
+        return f"{self.key_prefix}gen:{scope}"
+
+    def local_generations(self, scopes: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self.local.generation(scope) for scope in scopes)
+
+    def get_client(self) -> Any | None:
+        """Lazily create the shared Valkey client; None when unconfigured."""
+        if self.client is not None:
+            return self.client
+        redis_url = os.getenv("REDIS_URL", "")
+        if not redis_url:
+            return None
+        import valkey.asyncio as aioredis
+
+        self.client = aioredis.from_url(
+            redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+        return self.client
+
+    def get_sync_client(self) -> Any | None:
+        """Blocking client for commits that happen outside an event loop."""
+        if self.sync_client is not None:
+            return self.sync_client
+        redis_url = os.getenv("REDIS_URL", "")
+        if not redis_url:
+            return None
+        import valkey
+
+        self.sync_client = valkey.Valkey.from_url(
+            redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+        return self.sync_client
+
+    def circuit_is_open(self) -> bool:
+        return time.monotonic() < self.circuit_open_until
+
+    def trip_circuit(self, exc: Exception) -> None:
+        self.circuit_open_until = time.monotonic() + CIRCUIT_SECONDS
+        logger.warning(
+            "Valkey %s cache unavailable, bypassing for %.0fs: %s",
+            self.name,
+            CIRCUIT_SECONDS,
+            exc,
+        )
+
+    async def read_shared(self, key: str, scopes: Iterable[str]) -> SharedRead | None:
+        """Read ``key`` and its scopes' shared generations in one round-trip.
+
+        Returns None when the cache must be bypassed (breaker open or Valkey
+        failing).
+        """
+        client = self.get_client()
+        if client is None:
+            return SharedRead(raw=None, generations=None, client=None)
+        if self.circuit_is_open():
+            return None
+        try:
+            raw, *generations = await client.mget(
+                key, *(self.generation_key(scope) for scope in scopes)
+            )
+        except Exception as exc:
+            self.trip_circuit(exc)
+            return None
+        return SharedRead(
+            raw=raw,
+            generations=tuple(int(value or 0) for value in generations),
+            client=client,
+        )
+
+    async def write_shared(
+        self, client: Any | None, key: str, payload: str, ttl: float
+    ) -> None:
+        if client is None or self.circuit_is_open():
+            return
+        try:
+            await client.set(key, payload, ex=max(1, int(ttl)))
+        except Exception as exc:
+            self.trip_circuit(exc)
+
+    def _log_failed_bump(self, scopes: list[str], *, exc_info: bool) -> None:
+        logger.error(
+            "Failed to invalidate %s cache for %d scope(s) — replicas may "
+            "serve stale %s",
+            self.name,
+            len(scopes),
+            self._stale_description,
+            exc_info=exc_info,
+        )
+
+    async def bump_shared(self, scopes: list[str]) -> None:
+        client = self.get_client()
+        if client is None:
+            return
+        try:
+            for scope in scopes:
+                await client.incr(self.generation_key(scope))
+                await client.expire(self.generation_key(scope), GENERATION_TTL_SECONDS)
+        except Exception as exc:
+            self.trip_circuit(exc)
+            self._log_failed_bump(scopes, exc_info=False)
+
+    def bump_shared_sync(self, scopes: list[str]) -> None:
+        client = self.get_sync_client()
+        if client is None:
+            return
+        try:
+            for scope in scopes:
+                client.incr(self.generation_key(scope))
+                client.expire(self.generation_key(scope), GENERATION_TTL_SECONDS)
+        except Exception:
+            self._log_failed_bump(scopes, exc_info=True)
+
+    def bump_local(self, pending: dict[str, str]) -> None:
+        for scope, reason in pending.items():
+            self.local.bump(scope)
+            self._record_invalidation(scope, reason)
+
+    async def invalidate(self, scope: str, *, reason: str) -> None:
+        """Invalidate ``scope`` for state that is already committed."""
+        self.bump_local({scope: reason})
+        if self._enabled():
+            await self.bump_shared([scope])
+
+    def invalidate_on_commit(self, session: Any, scope: str, *, reason: str) -> None:
+        """Queue an invalidation that fires only if ``session`` commits.
+
+        Accepts a sync ``Session`` or an ``AsyncSession``.
+        """
+        sync_session = getattr(session, "sync_session", session)
+        sync_session.info.setdefault(self._pending_info_key, {})[scope] = reason
+
+    def dispatch(self, pending: dict[str, str]) -> None:
+        self.bump_local(pending)
+        if not self._enabled() or not os.getenv("REDIS_URL", ""):
+            return
+        scopes = list(pending)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.bump_shared_sync(scopes)
+            return
+        task = loop.create_task(self.bump_shared(scopes))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _apply_pending(self, session: Session) -> None:
+        pending = session.info.pop(self._pending_info_key, None)
+        if pending:
+            self.dispatch(pending)
+
+    def _discard_pending(self, session: Session) -> None:
+        session.info.pop(self._pending_info_key, None)
+
+    def listen(self, collect: Callable[[Session, Any], None]) -> None:
+        """Register ``collect`` as an ``after_flush`` hook on every Session.
+
+        ``collect`` queues invalidations with :meth:`invalidate_on_commit`;
+        they are applied after COMMIT and dropped on rollback.
+        """
+        event.listen(Session, "after_flush", collect)
+        event.listen(Session, "after_commit", self._apply_pending)
+        event.listen(Session, "after_rollback", self._discard_pending)
+
+
+__all__ = [
+    "CIRCUIT_SECONDS",
+    "GENERATION_TTL_SECONDS",
+    "MAX_TTL_SECONDS",
+    "GenerationCache",
+    "LocalTier",
+    "SharedRead",
+    "env_flag_enabled",
+    "ttl_from_env",
+]
@@ -21,6 +21,7 @@ from dev_health_ops.metrics.compute_work_item_state_durations import (
 )
 from dev_health_ops.metrics.job_daily import run_daily_metrics_job
 from dev_health_ops.metrics.schemas import WorkUnitInvestmentRecord
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
 from dev_health_ops.models.teams import Team
 from dev_health_ops.providers.operational_migration import (
     IssueIncidentSource,
@@ -1492,6 +1493,9 @@ async def run_fixtures_generation(ns: argparse.Namespace) -> int:
                 end_day = now.date()
                 start_day = end_day - timedelta(days=ns.days - 1)
 
+                timeline = WorkItemTimeline(
+                    fixture_data["work_items"], fixture_data["transitions"]
+                )
                 for day_offset in range(ns.days):
                     day = start_day + timedelta(days=day_offset)
                     state_durations = compute_work_item_state_durations_daily(
@@ -1500,6 +1504,7 @@ async def run_fixtures_generation(ns: argparse.Namespace) -> int:
                         transitions=fixture_data["transitions"],
                         computed_at=computed_at,
                         team_resolver=team_resolver,
+                        timeline=timeline,
                     )
                     if state_durations:
                         sink.write_work_item_state_durations(state_durations)
@@ -0,0 +1,269 @@
+"""Per-org entitlement snapshots, cached in-process and in Valkey.
+
+``get_org_entitlements_from_db`` runs the OrgLicense, Organization.tier,
+feature-decision and Subscription queries on every call, and every
+``require_feature`` hit on an async endpoint repeats the OrgLicense /
+Organization lookups. With ``ENTITLEMENT_CACHE_ENABLED`` both read one
+``OrgEntitlementSnapshot`` per org -- tier, features, limits and trial
+state -- computed once and served from memory, backed by a shared Valkey
+tier when ``REDIS_URL`` is set.
+
+Invalidation uses ``core.generation_cache``, like ``api.services.auth_cache``:
+every snapshot records its org's generation (and a global one) read before
+the Postgres load, and committed writes to OrgLicense, Organization.tier,
+Subscription and OrgFeatureOverride bump the org's generation, FeatureFlag
+writes the global one. Bulk statements and billing webhooks call
+``invalidate_org_entitlements_on_commit``. A snapshot also never outlives
+the next org-override expiry, license expiry or trial end, each of which
+changes the entitlements without any write.
+
+When the shared tier is configured but unavailable the cache is bypassed
+(fail-correct). Without ``REDIS_URL`` invalidations are process-local and
+``ENTITLEMENT_CACHE_TTL_SECONDS`` bounds cross-process staleness.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from dev_health_ops.core.generation_cache import (
+    GenerationCache,
+    env_flag_enabled,
+    ttl_from_env,
+)
+from dev_health_ops.licensing.registry import get_features_for_tier
+from dev_health_ops.licensing.types import LicenseTier
+from dev_health_ops.metrics.prometheus import (
+    record_entitlement_cache_invalidation,
+    record_entitlement_cache_lookup,
+)
+
+logger = logging.getLogger(__name__)
+
+ENTITLEMENT_CACHE_ENABLED_ENV = "ENTITLEMENT_CACHE_ENABLED"
+ENTITLEMENT_CACHE_TTL_ENV = "ENTITLEMENT_CACHE_TTL_SECONDS"
+
+_DEFAULT_TTL_SECONDS = 60
+
+_LOCAL_MAX_ENTRIES = 4096
+
+_KEY_PREFIX = "entitlements:"
+_GLOBAL_SCOPE = "*"
+
+
+def entitlement_cache_enabled() -> bool:
+    return env_flag_enabled(ENTITLEMENT_CACHE_ENABLED_ENV)
+
+
+def _ttl_seconds() -> int:
+    return ttl_from_env(ENTITLEMENT_CACHE_TTL_ENV, _DEFAULT_TTL_SECONDS)
+
+
+@dataclass(frozen=True)
+class OrgEntitlementSnapshot:
+    """Everything the entitlement and per-org gating paths read for one org.
+
+    ``tier_source`` is where ``raw_tier`` came from (``license``,
+    ``organization`` or ``none``); ``tier`` is the resolved tier, COMMUNITY
+    when the raw value is missing or invalid.
+    """
+
+    tier: str
+    tier_source: str
+    raw_tier: str | None
+    features: dict[str, bool]
+    limits: dict[str, int]
+    license_features_override: dict[str, bool] = field(default_factory=dict)
+    is_licensed: bool = False
+    is_trialing: bool = False
+    trial_ends_at: str | None = None
+
+    def entitlements(self) -> dict[str, Any]:
+        """The ``get_org_entitlements_from_db`` payload."""
+        return {
+            "tier": self.tier,
+            "features": dict(self.features),
+            "limits": dict(self.limits),
+            "is_licensed": self.is_licensed,
+            "in_grace_period": False,
+            "is_trialing": self.is_trialing,
+            "trial_ends_at": self.trial_ends_at,
+        }
+
+    def tier_allows(self, feature: str) -> bool:
+        """The ``require_feature`` per-org check: tier features, then the
+        license's own ``features_override``. An unparseable stored tier
+        denies everything, as the uncached check does."""
+        if self.tier_source == "none" or not self.raw_tier:
+            return False
+        try:
+            tier = LicenseTier(self.raw_tier)
+        except ValueError:
+            return False
+        if get_features_for_tier(tier).get(feature, False):
+            return True
+        return bool(self.license_features_override.get(feature))
+
+
+# Scopes are org ids plus ``_GLOBAL_SCOPE`` for FeatureFlag writes.
+_cache = GenerationCache(
+    name="entitlement",
+    key_prefix=_KEY_PREFIX,
+    enabled=entitlement_cache_enabled,
+    local_max_entries=_LOCAL_MAX_ENTRIES,
+    record_invalidation=lambda scope, reason: record_entitlement_cache_invalidation(
+        reason=reason, scope="global" if scope == _GLOBAL_SCOPE else "org"
+    ),
+    stale_description="entitlements for up to ENTITLEMENT_CACHE_TTL_SECONDS",
+)
+
+
+def _snapshot_key(org_id: str) -> str:
+    return f"{_KEY_PREFIX}snapshot:{org_id}"
+
+
+def _decode(value: Any) -> OrgEntitlementSnapshot | None:
+    try:
+        return OrgEntitlementSnapshot(**value)
+    except TypeError:
+        return None
+
+
+async def cached_org_entitlements(
+    org_id: uuid.UUID,
+    load: Callable[[], Awaitable[tuple[OrgEntitlementSnapshot, datetime | None]]],
+) -> OrgEntitlementSnapshot:
+    """Return the org's snapshot, running ``load`` on a miss.
+
+    ``load`` returns the snapshot plus the instant it stops being valid
+    without any write (the next override expiry), or None. Loader errors
+    propagate and are never cached.
+    """
+    if not entitlement_cache_enabled() or _ttl_seconds() <= 0:
+        snapshot, _ = await load()
+        return snapshot
+
+    org_key = str(org_id)
+    key = _snapshot_key(org_key)
+    scopes = (org_key, _GLOBAL_SCOPE)
+    shared = await _cache.read_shared(key, scopes)
+    if shared is None:
+        record_entitlement_cache_lookup(result="bypass")
+        snapshot, _ = await load()
+        return snapshot
+
+    generation = (shared.generations, _cache.local_generations(scopes))
+    local = _cache.local.get(key)
+    if local is not None and local[0] == generation:
+        cached = _decode(local[1])
+        if cached is not None:
+            record_entitlement_cache_lookup(result="hit_local")
+            return cached
+
+    if shared.raw is not None:
+        try:
+            data = json.loads(shared.raw)
+        except Exception:
+            logger.warning("Corrupt entitlement cache entry for org %s", org_key)
+            data = None
+        if (
+            isinstance(data, dict)
+            and data.get("generation") == list(shared.generations or ())
+            and (cached := _decode(data.get("value"))) is not None
+        ):
+            record_entitlement_cache_lookup(result="hit_shared")
+            _cache.local.put(key, generation, data["value"], _ttl_seconds())
+            return cached
+
+    record_entitlement_cache_lookup(result="miss")
+    snapshot, valid_until = await load()
+    lifetime = float(_ttl_seconds())
+    if valid_until is not None:
+        lifetime = min(lifetime, (valid_until - datetime.now(UTC)).total_seconds())
+    if lifetime <= 0:
+        return snapshot
+
+    value = dataclasses.asdict(snapshot)
+    _cache.local.put(key, generation, value, lifetime)
+    if shared.generations is not None:
+        payload = json.dumps({"generation": list(shared.generations), "value": value})
+        await _cache.write_shared(shared.client, key, payload, lifetime)
+    return snapshot
+
+
+async def invalidate_org_entitlements(org_id: Any, *, reason: str) -> None:
+    """Invalidate ``org_id``'s snapshot for already-committed state.
+
+    Ignores the circuit breaker, like every invalidation write in
+    ``impersonation_cache``: a skipped bump would resurface once it closes.
+    """
+    await _cache.invalidate(str(org_id), reason=reason)
+
+
+def invalidate_org_entitlements_on_commit(
+    session: Any, org_id: Any, *, reason: str
+) -> None:
+    """Queue an invalidation that fires only if ``session`` commits.
+
+    ``org_id=None`` invalidates every org (global feature-flag changes).
+    Accepts a sync ``Session`` or an ``AsyncSession``.
+    """
+    scope = _GLOBAL_SCOPE if org_id is None else str(org_id)
+    _cache.invalidate_on_commit(session, scope, reason=reason)
+
+
+def _collect_entitlement_changes(session: Session, flush_context: Any) -> None:
+    from dev_health_ops.models.licensing import (
+        FeatureFlag,
+        OrgFeatureOverride,
+        OrgLicense,
+    )
+    from dev_health_ops.models.subscriptions import Subscription
+    from dev_health_ops.models.users import Organization
+
+    for obj in chain(session.new, session.deleted, session.dirty):
+        if isinstance(obj, FeatureFlag):
+            invalidate_org_entitlements_on_commit(session, None, reason="feature_flag")
+        elif isinstance(obj, (OrgLicense, OrgFeatureOverride, Subscription)):
+            history = inspect(obj).attrs.org_id.history
+            reason = {
+                OrgLicense: "license",
+                OrgFeatureOverride: "feature_override",
+                Subscription: "subscription",
+            }[type(obj)]
+            for org_id in chain(history.deleted or (), (obj.org_id,)):
+                if org_id is not None:
+                    invalidate_org_entitlements_on_commit(
+                        session, org_id, reason=reason
+                    )
+        elif isinstance(obj, Organization) and (
+            obj in session.deleted or inspect(obj).attrs.tier.history.has_changes()
+        ):
+            invalidate_org_entitlements_on_commit(
+                session, obj.id, reason="organization"
+            )
+
+
+_cache.listen(_collect_entitlement_changes)
+
+
+__all__ = [
+    "ENTITLEMENT_CACHE_ENABLED_ENV",
+    "ENTITLEMENT_CACHE_TTL_ENV",
+    "OrgEntitlementSnapshot",
+    "cached_org_entitlements",
+    "entitlement_cache_enabled",
+    "invalidate_org_entitlements",
+    "invalidate_org_entitlements_on_commit",
+]
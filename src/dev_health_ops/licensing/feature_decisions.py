@@ -150,15 +150,45 @@ async def evaluate_org_features_async(
     org_id: uuid.UUID,
     feature_keys: Sequence[str],
 ) -> dict[str, FeatureDecision]:
+    decisions, _ = await evaluate_org_features_until_async(
+        session, org_id, feature_keys
+    )
+    return decisions
+
+
+def _next_override_expiry(rows: FeatureRows, evaluated_at: datetime) -> datetime | None:
+    expiries = (_normalize_utc(override.expires_at) for override in rows.overrides)
+    return min(
+        (expiry for expiry in expiries if expiry is not None and expiry > evaluated_at),
+        default=None,
+    )
+
+
+async def evaluate_org_features_until_async(
+    session: AsyncSession,
+    org_id: uuid.UUID,
+    feature_keys: Sequence[str],
+) -> tuple[dict[str, FeatureDecision], datetime | None]:
+    """Evaluate ``feature_keys`` and report how long the decisions hold.
+
+    The second element is the earliest future org-override expiry -- the
+    next instant the same rows would decide differently -- or None when no
+    override will expire. A storage error returns the evaluation time, so
+    callers that cache decisions never keep the fail-closed ones.
+    """
     keys = _unique_keys(feature_keys)
+    evaluated_at = datetime.now(UTC)
     try:
         rows = await load_feature_rows_async(session, org_id, keys)
     except SQLAlchemyError:
         return {
             key: closed_feature_decision(key, FeatureDecisionReason.STORAGE_ERROR)
             for key in keys
-        }
-    return _decisions_from_rows(keys, rows, datetime.now(UTC))
+        }, evaluated_at
+    return (
+        _decisions_from_rows(keys, rows, evaluated_at),
+        _next_override_expiry(rows, evaluated_at),
+    )
 
 
 def evaluate_org_feature_sync(
@@ -5,13 +5,21 @@ import logging
 import os
 import uuid
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 from typing import Any, ParamSpec, TypeVar, cast
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dev_health_ops.licensing.feature_decisions import evaluate_org_features_async
+from dev_health_ops.licensing.entitlement_cache import (
+    OrgEntitlementSnapshot,
+    cached_org_entitlements,
+    entitlement_cache_enabled,
+)
+from dev_health_ops.licensing.feature_decisions import (
+    evaluate_org_features_until_async,
+)
 from dev_health_ops.licensing.registry import (
     CANONICAL_INCIDENT_INGESTION_FEATURE,
     EXPLICIT_PURCHASE_FEATURES,
@@ -348,6 +356,22 @@ def get_entitlements() -> dict:
 async def get_org_entitlements_from_db(
     org_id: uuid.UUID, session: AsyncSession
 ) -> dict[str, Any]:
+    snapshot = await get_org_entitlement_snapshot(org_id, session)
+    return snapshot.entitlements()
+
+
+async def get_org_entitlement_snapshot(
+    org_id: uuid.UUID, session: AsyncSession
+) -> OrgEntitlementSnapshot:
+    """Resolve the org's entitlements, through the cache when it is enabled."""
+    return await cached_org_entitlements(
+        org_id, lambda: _load_org_entitlement_snapshot(org_id, session)
+    )
+
+
+async def _load_org_entitlement_snapshot(
+    org_id: uuid.UUID, session: AsyncSession
+) -> tuple[OrgEntitlementSnapshot, datetime | None]:
     from dev_health_ops.models.licensing import OrgLicense
     from dev_health_ops.models.subscriptions import Subscription
     from dev_health_ops.models.users import Organization
@@ -358,7 +382,11 @@ async def get_org_entitlements_from_db(
     org_license = org_license_result.scalar_one_or_none()
 
     tier = LicenseTier.COMMUNITY
+    tier_source = "none"
+    raw_tier: str | None = None
     if org_license is not None:
+        tier_source = "license"
+        raw_tier = org_license.tier
         try:
             tier = LicenseTier(org_license.tier)
         except ValueError:
@@ -373,6 +401,8 @@ async def get_org_entitlements_from_db(
         )
         org_tier = org_tier_result.scalar_one_or_none()
         if org_tier is not None:
+            tier_source = "organization"
+            raw_tier = org_tier
             try:
                 tier = LicenseTier(org_tier)
             except ValueError:
@@ -392,7 +422,9 @@ async def get_org_entitlements_from_db(
             "customer_push_ingest",
         }
     )
-    decisions = await evaluate_org_features_async(session, org_id, decision_keys)
+    decisions, valid_until = await evaluate_org_features_until_async(
+        session, org_id, decision_keys
+    )
     for feature_key, decision in decisions.items():
         features[feature_key] = decision.allowed
 
@@ -412,19 +444,51 @@ async def get_org_entitlements_from_db(
         else None
     )
 
-    return {
-        "tier": tier.value,
-        "features": features,
-        "limits": {
+    raw_override = org_license.features_override if org_license is not None else None
+    snapshot = OrgEntitlementSnapshot(
+        tier=tier.value,
+        tier_source=tier_source,
+        raw_tier=raw_tier,
+        features=features,
+        limits={
             "users": limits.users,
             "repos": limits.repos,
             "api_rate": limits.api_rate,
         },
-        "is_licensed": bool(org_license is not None and org_license.is_valid),
-        "in_grace_period": False,
-        "is_trialing": is_trialing,
-        "trial_ends_at": trial_ends_at,
-    }
+        license_features_override=(
+            {str(key): bool(value) for key, value in raw_override.items()}
+            if isinstance(raw_override, dict)
+            else {}
+        ),
+        is_licensed=bool(org_license is not None and org_license.is_valid),
+        is_trialing=is_trialing,
+        trial_ends_at=trial_ends_at,
+    )
+    # is_licensed and the trial state flip at these instants without a write.
+    return snapshot, _earliest_expiry(
+        valid_until,
+        org_license.expires_at if org_license is not None else None,
+        subscription.trial_end if subscription is not None else None,
+    )
+
+
+def _earliest_expiry(
+    valid_until: datetime | None, *expiries: datetime | None
+) -> datetime | None:
+    """``valid_until`` capped at the earliest of ``expiries`` still ahead."""
+    now = datetime.now(UTC)
+    upcoming = [
+        expiry if expiry.tzinfo is not None else expiry.replace(tzinfo=UTC)
+        for expiry in expiries
+        if expiry is not None
+    ]
+    return min(
+        [
+            *(expiry for expiry in upcoming if expiry > now),
+            *([valid_until] if valid_until is not None else []),
+        ],
+        default=None,
+    )
 
 
 def has_feature(feature: str, *, log_denial: bool = True) -> bool:
@@ -509,6 +573,15 @@ async def _check_org_feature_async(feature: str, kwargs: dict[str, Any]) -> bool
     org_id_str = kwargs.get("org_id")
     if not session or not org_id_str:
         return False
+    if entitlement_cache_enabled():
+        try:
+            snapshot = await get_org_entitlement_snapshot(
+                uuid.UUID(org_id_str), session
+            )
+        except Exception:
+            logger.debug("Per-org feature check failed for feature=%s", feature)
+            return False
+        return snapshot.tier_allows(feature)
     try:
         from sqlalchemy import select as sa_select
 
@@ -0,0 +1,132 @@
+"""``dev-hops maintenance sync-coverage-intervals``.
+
+Checks the incrementally maintained ``sync_coverage_interval_states`` store
+against a from-scratch fold of raw ``sync_run_units`` -- the same
+``merge_intervals`` / ``subtract_intervals`` replay the coverage scan runs --
+and, with ``--apply``, rewrites drifted pairs.
+
+  * Verify-only by default: every (org, integration) pair row is compared
+    with a fold of the runs it claims to hold (``coverage_applied_at`` set)
+    and reported as ``missing``, ``unexpected``, ``stale`` or ``mismatch``.
+    Nothing is written; the exit code is 1 when any drift is found.
+  * ``--apply`` folds every non-active run, replaces the integration's rows
+    and stamps the folded runs. This is also how history that predates the
+    store is seeded, and how rows marked stale by an out-of-order finalize
+    are repaired.
+  * ``--org`` optionally scopes to one organization; omitted, ALL
+    organizations are processed. Each integration commits on its own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import uuid
+
+from sqlalchemy import select
+
+from dev_health_ops.api.services.sync_coverage import (
+    IntervalStoreReport,
+    rebuild_sync_coverage_intervals_sync,
+)
+from dev_health_ops.maintenance.scrub_error_text import _resolve_org_id
+from dev_health_ops.models.integrations import SyncRun
+
+logger = logging.getLogger(__name__)
+
+
+def collect_reports(
+    ns: argparse.Namespace,
+) -> tuple[list[IntervalStoreReport] | None, bool]:
+    """Verify (or rebuild, per ``ns``) every integration in scope.
+
+    Returns the per-integration reports plus a failure flag; ``(None, True)``
+    when no database URI is configured.
+    """
+    from dev_health_ops.db import get_postgres_session_sync_for_uri
+
+    db_uri = (
+        getattr(ns, "db", None)
+        or os.getenv("POSTGRES_URI")
+        or os.getenv("DATABASE_URI")
+    )
+    if not db_uri:
+        logger.error(
+            "PostgreSQL URI not configured. Pass --db or set POSTGRES_URI/DATABASE_URI."
+        )
+        return None, True
+
+    apply = bool(getattr(ns, "apply", False))
+    org_id = _resolve_org_id(ns)
+    reports: list[IntervalStoreReport] = []
+    had_failure = False
+
+    with get_postgres_session_sync_for_uri(db_uri) as session:
+        stmt = select(SyncRun.org_id, SyncRun.integration_id).distinct()
+        if org_id is not None:
+            stmt = stmt.where(SyncRun.org_id == org_id)
+        scopes: list[tuple[str, uuid.UUID]] = sorted(
+            ((str(org), integration) for org, integration in session.execute(stmt)),
+            key=lambda scope: (scope[0], str(scope[1])),
+        )
+        for scope_org_id, integration_id in scopes:
+            try:
+                reports.append(
+                    rebuild_sync_coverage_intervals_sync(
+                        session, scope_org_id, integration_id, apply=apply
+                    )
+                )
+                session.commit()
+            except Exception:
+                logger.exception(
+                    "sync-coverage-intervals failed for org=%s integration=%s",
+                    scope_org_id,
+                    integration_id,
+                )
+                had_failure = True
+                session.rollback()
+
+    return reports, had_failure
+
+
+def _print_report(reports: list[IntervalStoreReport], *, apply: bool) -> None:
+    print(
+        f"{'org':<24s} {'integration':<38s} {'pairs':>7s} "
+        f"{'units':>10s} {'drifted':>8s}"
+    )
+    for report in reports:
+        print(
+            f"{report.org_id:<24s} {str(report.integration_id):<38s} "
+            f"{report.pair_count:>7d} {report.unit_count:>10d} "
+            f"{len(report.drift):>8d}"
+        )
+        for drift in report.drift:
+            print(f"    {drift.reason:<10s} {drift.source_id} {drift.dataset_key}")
+    drifted = sum(1 for report in reports if report.drift)
+    if apply:
+        rewritten = sum(1 for report in reports if report.rewritten)
+        print(f"Rewrote {rewritten} integration(s).")
+    elif drifted:
+        print()
+        print("Verify-only: pass --apply to rebuild the drifted integrations.")
+
+
+def run_sync_coverage_intervals(ns: argparse.Namespace) -> int:
+    reports, had_failure = collect_reports(ns)
+    if reports is None:
+        return 1
+    org_id = _resolve_org_id(ns)
+    scope = f"org={org_id}" if org_id else "ALL organizations"
+    print(f"Org scope: {scope}")
+    apply = bool(getattr(ns, "apply", False))
+    _print_report(reports, apply=apply)
+    if had_failure:
+        return 1
+    return 0 if apply or not any(report.drift for report in reports) else 1
+
+
+__all__ = [
+    "collect_reports",
+    "run_sync_coverage_intervals",
+]
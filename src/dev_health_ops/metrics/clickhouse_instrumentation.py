@@ -0,0 +1,255 @@
+"""Shared observation layer for every ClickHouse call the service makes.
+
+Clients built by the API pool, ``ClickHouseMetricsSink`` and
+``ClickHouseStore`` are wrapped in :class:`InstrumentedClickHouseClient`, so
+``query_dicts`` and ``ClickHouseDataLoader`` (which run on those clients) are
+covered as well. Each query, insert and command:
+
+- is reduced to a fingerprint: literals, numbers, comments and ``IN`` lists
+  stripped, whitespace collapsed, then hashed,
+- is tagged with a ``query_id`` prefixed by that fingerprint and a
+  ``log_comment`` carrying the caller, so ``system.query_log`` rows can be
+  joined back to the code that issued them (see ``audit perf``),
+- records latency, result rows, server-side read rows/bytes and written
+  rows/bytes from the response summary, labelled by caller.
+
+The caller is a context variable. Celery tasks, GraphQL root resolvers and
+job stages set it with :func:`clickhouse_caller`; nested scopes are joined
+with ``/`` (``task:metrics.daily/daily_metrics.read``). Queries outside any
+scope are attributed to ``unknown``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import time
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any
+
+from dev_health_ops.metrics.prometheus import (
+    clickhouse_query_timer,
+    record_clickhouse_query_cost,
+)
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_CALLER = "unknown"
+QUERY_ID_PREFIX = "dho-"
+LOG_COMMENT_SOURCE = "dev-health-ops"
+
+_CALLER: ContextVar[str] = ContextVar("clickhouse_caller", default="")
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_VALUE_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def current_clickhouse_caller() -> str:
+    """Return the caller tag ClickHouse queries are currently attributed to."""
+    return _CALLER.get() or UNKNOWN_CALLER
+
+
+def set_clickhouse_caller(name: str) -> Token[str]:
+    """Open a caller scope nested in the current one. Pair with a reset."""
+    parent = _CALLER.get()
+    return _CALLER.set(f"{parent}/{name}" if parent else name)
+
+
+def reset_clickhouse_caller(token: Token[str]) -> None:
+    _CALLER.reset(token)
+
+
+@contextmanager
+def clickhouse_caller(name: str) -> Iterator[None]:
+    """Attribute ClickHouse queries issued inside the block to ``name``."""
+    token = set_clickhouse_caller(name)
+    try:
+        yield
+    finally:
+        reset_clickhouse_caller(token)
+
+
+def normalize_query(sql: str) -> str:
+    """Reduce ``sql`` to its shape so queries differing only in literals match."""
+    normalized = _COMMENT_RE.sub(" ", sql or "")
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _VALUE_LIST_RE.sub("(?)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip().lower()
+
+
+@lru_cache(maxsize=2048)
+def query_fingerprint(sql: str) -> str:
+    """Return a short stable hash of the normalized query text."""
+    return hashlib.sha256(normalize_query(sql).encode("utf-8")).hexdigest()[:16]
+
+
+def _insert_statement(table: Any, column_names: Any, database: Any) -> str:
+    target = f"{database}.{table}" if database else str(table)
+    if isinstance(column_names, str):
+        columns = column_names
+    else:
+        columns = ", ".join(str(name) for name in column_names or ())
+    return f"INSERT INTO {target} ({columns})"
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _result_stats(result: Any) -> dict[str, int]:
+    stats: dict[str, int] = {}
+    summary = getattr(result, "summary", None)
+    if isinstance(summary, Mapping):
+        for key in ("read_rows", "read_bytes", "written_rows", "written_bytes"):
+            stats[key] = _as_int(summary.get(key))
+    row_count = getattr(result, "row_count", None)
+    if isinstance(row_count, int):
+        stats["result_rows"] = row_count
+    return stats
+
+
+class InstrumentedClickHouseClient:
+    """Proxy around a clickhouse-connect client that observes every call.
+
+    ``query``, ``command`` and ``insert`` are tagged and measured; everything
+    else (``ping``, ``close``, streaming reads) is delegated untouched.
+    """
+
+    def __init__(self, client: Any, *, component: str) -> None:
+        self._client = client
+        self._component = component
+        self._log_comment_allowed: bool | None = None
+
+    @property
+    def wrapped(self) -> Any:
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def __repr__(self) -> str:
+        return f"InstrumentedClickHouseClient({self._client!r})"
+
+    # The trailing integer is the position of ``settings`` among the remaining
+    # positional arguments in the clickhouse-connect signature.
+    def query(self, query: str | None = None, *args: Any, **kwargs: Any) -> Any:
+        return self._observe(
+            "select", query or "", self._client.query, (query,), args, kwargs, 1
+        )
+
+    def command(self, cmd: str, *args: Any, **kwargs: Any) -> Any:
+        return self._observe(
+            "command", cmd, self._client.command, (cmd,), args, kwargs, 2
+        )
+
+    def insert(
+        self, table: str | None = None, data: Any = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        column_names = kwargs.get("column_names", args[0] if args else "*")
+        database = kwargs.get("database", args[1] if len(args) > 1 else None)
+        return self._observe(
+            "insert",
+            _insert_statement(table, column_names, database),
+            self._client.insert,
+            (table, data),
+            args,
+            kwargs,
+            5,
+        )
+
+    def _observe(
+        self,
+        query_type: str,
+        statement: str,
+        method: Callable[..., Any],
+        leading: tuple[Any, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        settings_index: int,
+    ) -> Any:
+        caller = current_clickhouse_caller()
+        fingerprint = query_fingerprint(statement)
+        call_args = list(args)
+        kwargs = dict(kwargs)
+        if len(call_args) > settings_index:
+            call_args[settings_index] = self._tag(
+                call_args[settings_index], caller=caller, fingerprint=fingerprint
+            )
+        else:
+            kwargs["settings"] = self._tag(
+                kwargs.get("settings"), caller=caller, fingerprint=fingerprint
+            )
+        start = time.perf_counter()
+        result = None
+        try:
+            with clickhouse_query_timer(query_type):
+                result = method(*leading, *call_args, **kwargs)
+            return result
+        finally:
+            stats = _result_stats(result) if result is not None else {}
+            try:
+                record_clickhouse_query_cost(
+                    caller=caller,
+                    query_type=query_type,
+                    duration_seconds=time.perf_counter() - start,
+                    **stats,
+                )
+            except Exception:
+                logger.debug("ClickHouse query metrics failed", exc_info=True)
+
+    def _tag(
+        self, settings: dict[str, Any] | None, *, caller: str, fingerprint: str
+    ) -> dict[str, Any]:
+        tagged = dict(settings or {})
+        tagged.setdefault(
+            "query_id", f"{QUERY_ID_PREFIX}{fingerprint}-{uuid.uuid4().hex[:16]}"
+        )
+        if self._can_set_log_comment():
+            tagged.setdefault(
+                "log_comment",
+                json.dumps(
+                    {
+                        "source": LOG_COMMENT_SOURCE,
+                        "caller": caller,
+                        "component": self._component,
+                        "fingerprint": fingerprint,
+                    },
+                    separators=(",", ":"),
+                ),
+            )
+        return tagged
+
+    def _can_set_log_comment(self) -> bool:
+        # A readonly profile rejects every setting change, and the driver
+        # raises on readonly settings by default, so only tag where allowed.
+        if self._log_comment_allowed is None:
+            server_settings = getattr(self._client, "server_settings", None)
+            setting = (
+                server_settings.get("log_comment")
+                if isinstance(server_settings, Mapping)
+                else None
+            )
+            self._log_comment_allowed = not getattr(setting, "readonly", 0)
+        return self._log_comment_allowed
+
+
+def instrument_clickhouse_client(
+    client: Any, *, component: str
+) -> InstrumentedClickHouseClient:
+    """Wrap ``client`` unless it is already instrumented."""
+    if isinstance(client, InstrumentedClickHouseClient):
+        return client
+    return InstrumentedClickHouseClient(client, component=component)
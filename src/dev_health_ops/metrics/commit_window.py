@@ -0,0 +1,367 @@
+"""Columnar, day-bucketed window of commit-stat rows.
+
+``run_daily_metrics_job`` computes the 30-day knowledge/quality rollups (rework
+churn, single-owner files, bus factor, ownership Gini, file hotspots) for every
+active repo. Scanning the full list of row dicts once per repo per metric made
+that O(repos x window rows x 5) on every backfill day. ``CommitStatWindow``
+keeps the window as NumPy columns with interned repo/author/file/commit codes,
+one slice per day, so a backfill slides one day in and one day out and every
+rollup is a single grouped pass over all repos.
+
+The grouped primitives here are deliberately metric-agnostic; the formulas live
+next to their list-based counterparts in ``knowledge``, ``quality`` and
+``hotspots`` (``*_by_repo`` functions) and must stay result-identical to them.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from dev_health_ops.metrics.schemas import CommitStatRow
+from dev_health_ops.providers.identity import IdentityResolver, normalize_git_identity
+
+# Bucket used by ``from_rows`` for an ad-hoc, undated window.
+_UNDATED = date.min
+
+
+class _Interner:
+    """Assigns dense integer codes to hashable values in first-seen order."""
+
+    __slots__ = ("_codes", "values")
+
+    def __init__(self) -> None:
+        self._codes: dict[object, int] = {}
+        self.values: list[object] = []
+
+    def code(self, value: object) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def retain(self, live: np.ndarray) -> np.ndarray:
+        """Keep only the values whose codes are in ``live``, renumbered densely.
+
+        Relative order is preserved. Returns an old-code -> new-code lookup
+        array (-1 for dropped values).
+        """
+        kept = np.unique(live[live >= 0])
+        remap = np.full(len(self.values), -1, dtype=np.int64)
+        remap[kept] = np.arange(kept.size, dtype=np.int64)
+        self.values = [self.values[c] for c in kept.tolist()]
+        self._codes = {value: code for code, value in enumerate(self.values)}
+        return remap
+
+
+@dataclass(frozen=True)
+class _Columns:
+    repo: np.ndarray
+    commit: np.ndarray
+    # -1 when the row has no file_path.
+    file: np.ndarray
+    # ``author_email or author_name or "unknown"`` (knowledge metrics).
+    identity: np.ndarray
+    # ``identity.strip()`` (hotspot contributor counts).
+    contributor: np.ndarray
+    # ``normalize_git_identity`` (single-owner files).
+    owner: np.ndarray
+    additions: np.ndarray
+    deletions: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.repo.shape[0])
+
+
+_EMPTY_INT = np.zeros(0, dtype=np.int64)
+
+
+def _empty_columns() -> _Columns:
+    return _Columns(*([_EMPTY_INT] * 8))
+
+
+def _remap_optional(lookup: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """``lookup[codes]`` that leaves -1 ("no value") codes as -1."""
+    out = np.full_like(codes, -1)
+    present = codes >= 0
+    out[present] = lookup[codes[present]]
+    return out
+
+
+def _group_ids(*codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Dense group id per row for the tuple of code columns.
+
+    Returns ``(inverse, first_row)`` where ``first_row[g]`` is the first row
+    index belonging to group ``g``. Columns are folded pairwise and
+    re-densified after every step so the composite key never overflows int64.
+    """
+    key = codes[0].astype(np.int64, copy=False)
+    for column in codes[1:]:
+        _, key = np.unique(key, return_inverse=True)
+        base = int(column.max()) + 2 if column.size else 1
+        key = key.astype(np.int64) * base + (column.astype(np.int64) + 1)
+    _, first_row, inverse = np.unique(key, return_index=True, return_inverse=True)
+    return inverse.reshape(-1), first_row
+
+
+@dataclass(frozen=True)
+class AuthorChurnRollup:
+    """Raw (unclamped) churn per (repo, identity) group."""
+
+    repo: np.ndarray
+    churn: np.ndarray
+
+
+@dataclass(frozen=True)
+class FileRollup:
+    """Per (repo, file) aggregates for rows that carry a file_path.
+
+    Groups are ordered by the first row in window order that touched the file,
+    which is the dict insertion order the list-based helpers produce.
+    """
+
+    repo: np.ndarray
+    file: np.ndarray
+    paths: list[str]
+    # Sum of max(0, additions) + max(0, deletions).
+    churn: np.ndarray
+    rows: np.ndarray
+    distinct_commits: np.ndarray
+    distinct_contributors: np.ndarray
+    # Largest per-owner distinct-commit count and the sum over owners.
+    owner_max_commits: np.ndarray
+    owner_total_commits: np.ndarray
+
+
+class CommitStatWindow:
+    """Sliding window of commit-stat rows stored as per-day NumPy columns."""
+
+    def __init__(self, *, identity_resolver: IdentityResolver | None = None) -> None:
+        self._identity_resolver = identity_resolver
+        self._repos = _Interner()
+        self._commits = _Interner()
+        self._files = _Interner()
+        self._identities = _Interner()
+        self._slices: dict[date, _Columns] = {}
+        self._columns: _Columns | None = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[CommitStatRow],
+        *,
+        identity_resolver: IdentityResolver | None = None,
+    ) -> CommitStatWindow:
+        window = cls(identity_resolver=identity_resolver)
+        window.add_day(_UNDATED, rows)
+        return window
+
+    @property
+    def days(self) -> list[date]:
+        return sorted(self._slices)
+
+    def __contains__(self, day: object) -> bool:
+        return day in self._slices
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._slices.values())
+
+    def repo_id(self, code: int) -> uuid.UUID:
+        return self._repos.values[code]  # type: ignore[return-value]
+
+    def add_day(self, day: date, rows: Iterable[CommitStatRow]) -> None:
+        """Encode ``rows`` as the slice for ``day``, replacing any existing one."""
+        repo: list[int] = []
+        commit: list[int] = []
+        file: list[int] = []
+        identity: list[int] = []
+        contributor: list[int] = []
+        owner: list[int] = []
+        additions: list[int] = []
+        deletions: list[int] = []
+        for row in rows:
+            repo_value = row["repo_id"]
+            if not isinstance(repo_value, uuid.UUID):
+                repo_value = uuid.UUID(str(repo_value))
+            repo.append(self._repos.code(repo_value))
+            commit.append(self._commits.code(str(row.get("commit_hash"))))
+            path = row.get("file_path")
+            file.append(self._files.code(path) if path else -1)
+            email = row.get("author_email")
+            name = row.get("author_name")
+            raw_identity = email or name or "unknown"
+            identity.append(self._identities.code(raw_identity))
+            contributor.append(self._identities.code(raw_identity.strip()))
+            owner.append(
+                self._identities.code(
+                    normalize_git_identity(email, name, self._identity_resolver)
+                )
+            )
+            additions.append(int(row.get("additions") or 0))
+            deletions.append(int(row.get("deletions") or 0))
+
+        self._slices[day] = _Columns(
+            repo=np.asarray(repo, dtype=np.int64),
+            commit=np.asarray(commit, dtype=np.int64),
+            file=np.asarray(file, dtype=np.int64),
+            identity=np.asarray(identity, dtype=np.int64),
+            contributor=np.asarray(contributor, dtype=np.int64),
+            owner=np.asarray(owner, dtype=np.int64),
+            additions=np.asarray(additions, dtype=np.int64),
+            deletions=np.asarray(deletions, dtype=np.int64),
+        )
+        self._columns = None
+
+    def evict_before(self, day: date) -> int:
+        """Drop every day slice older than ``day``; returns slices removed."""
+        stale = [d for d in self._slices if d < day]
+        for d in stale:
+            del self._slices[d]
+        if stale:
+            self._columns = None
+            self._compact()
+        return len(stale)
+
+    def _compact(self) -> None:
+        """Drop interned values no remaining slice references.
+
+        Without this the interners grow with every day ever slid through the
+        window (every commit hash of a long backfill), not with the window.
+        """
+        slices = list(self._slices.values())
+
+        def live(*fields: str) -> np.ndarray:
+            arrays = [getattr(s, f) for s in slices for f in fields]
+            return np.concatenate(arrays) if arrays else _EMPTY_INT
+
+        repo = self._repos.retain(live("repo"))
+        commit = self._commits.retain(live("commit"))
+        file = self._files.retain(live("file"))
+        identity = self._identities.retain(live("identity", "contributor", "owner"))
+        for d, cols in self._slices.items():
+            self._slices[d] = _Columns(
+                repo=repo[cols.repo],
+                commit=commit[cols.commit],
+                file=_remap_optional(file, cols.file),
+                identity=identity[cols.identity],
+                contributor=identity[cols.contributor],
+                owner=identity[cols.owner],
+                additions=cols.additions,
+                deletions=cols.deletions,
+            )
+
+    def columns(self) -> _Columns:
+        """Concatenated columns in day order (cached until the window changes)."""
+        if self._columns is None:
+            slices = [self._slices[d] for d in sorted(self._slices)]
+            if not slices:
+                self._columns = _empty_columns()
+            elif len(slices) == 1:
+                self._columns = slices[0]
+            else:
+                self._columns = _Columns(
+                    *(
+                        np.concatenate([getattr(s, f) for s in slices])
+                        for f in _Columns.__dataclass_fields__
+                    )
+                )
+        return self._columns
+
+    def author_churn(self) -> AuthorChurnRollup:
+        cols = self.columns()
+        if not len(cols):
+            return AuthorChurnRollup(repo=_EMPTY_INT, churn=_EMPTY_INT)
+        group, first_row = _group_ids(cols.repo, cols.identity)
+        churn = np.bincount(
+            group, weights=cols.additions + cols.deletions, minlength=first_row.size
+        ).astype(np.int64)
+        return AuthorChurnRollup(repo=cols.repo[first_row], churn=churn)
+
+    def file_rollup(self) -> FileRollup:
+        cols = self.columns()
+        has_file = cols.file >= 0
+        repo = cols.repo[has_file]
+        file = cols.file[has_file]
+        if not repo.size:
+            return FileRollup(
+                repo=_EMPTY_INT,
+                file=_EMPTY_INT,
+                paths=[],
+                churn=_EMPTY_INT,
+                rows=_EMPTY_INT,
+                distinct_commits=_EMPTY_INT,
+                distinct_contributors=_EMPTY_INT,
+                owner_max_commits=_EMPTY_INT,
+                owner_total_commits=_EMPTY_INT,
+            )
+        commit = cols.commit[has_file]
+        clamped = np.maximum(cols.additions[has_file], 0) + np.maximum(
+            cols.deletions[has_file], 0
+        )
+
+        group, first_row = _group_ids(repo, file)
+        # Re-number groups in first-appearance order.
+        order = np.argsort(first_row, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        group = rank[group]
+        first_row = first_row[order]
+        n_groups = first_row.size
+
+        churn = np.bincount(group, weights=clamped, minlength=n_groups).astype(np.int64)
+        rows = np.bincount(group, minlength=n_groups).astype(np.int64)
+        distinct_commits = self._distinct_per_group(group, commit, n_groups)
+        distinct_contributors = self._distinct_per_group(
+            group, cols.contributor[has_file], n_groups
+        )
+
+        owner_group, owner_first = _group_ids(group, cols.owner[has_file])
+        _, owner_commit_first = _group_ids(owner_group, commit)
+        owner_commits = np.bincount(
+            owner_group[owner_commit_first], minlength=owner_first.size
+        )
+        owner_file_group = group[owner_first]
+        owner_total = np.bincount(
+            owner_file_group, weights=owner_commits, minlength=n_groups
+        ).astype(np.int64)
+        owner_max = np.zeros(n_groups, dtype=np.int64)
+        np.maximum.at(owner_max, owner_file_group, owner_commits)
+
+        file_codes = file[first_row]
+        return FileRollup(
+            repo=repo[first_row],
+            file=file_codes,
+            paths=[self._files.values[c] for c in file_codes.tolist()],
+            churn=churn,
+            rows=rows,
+            distinct_commits=distinct_commits,
+            distinct_contributors=distinct_contributors,
+            owner_max_commits=owner_max,
+            owner_total_commits=owner_total,
+        )
+
+    @staticmethod
+    def _distinct_per_group(
+        group: np.ndarray, values: np.ndarray, n_groups: int
+    ) -> np.ndarray:
+        _, first_row = _group_ids(group, values)
+        return np.bincount(group[first_row], minlength=n_groups).astype(np.int64)
+
+
+def group_by_repo(repo_codes: np.ndarray) -> Sequence[tuple[int, np.ndarray]]:
+    """``(repo_code, row_indices)`` pairs, indices kept in ascending order."""
+    if not repo_codes.size:
+        return []
+    order = np.argsort(repo_codes, kind="stable")
+    sorted_codes = repo_codes[order]
+    bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+    return [
+        (int(sorted_codes[chunk[0]]), order[chunk])
+        for chunk in np.split(np.arange(order.size), bounds)
+    ]
@@ -16,6 +16,7 @@ from dev_health_ops.metrics.schemas import (
 )
 from dev_health_ops.providers.identity import IdentityResolver, normalize_git_identity
 from dev_health_ops.providers.teams import RepoPatternTeamResolver, TeamResolver
+from dev_health_ops.utils import AGGREGATE_STATS_MARKER
 from dev_health_ops.utils.datetime import to_utc
 
 
@@ -204,7 +205,8 @@ def compute_daily_metrics(
         agg.deletions += deletions
 
         file_path = row.get("file_path")
-        if file_path:
+        # Aggregate-only rows carry a commit's totals, not a real file.
+        if file_path and file_path != AGGREGATE_STATS_MARKER:
             agg.files.add(str(file_path))
 
     # 2) Roll up commit aggregates to per-user.
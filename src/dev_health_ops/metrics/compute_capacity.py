@@ -5,7 +5,6 @@ Forecasts work completion using historical throughput data.
 
 from __future__ import annotations
 
-import random
 import statistics
 import uuid
 from collections.abc import Sequence
@@ -13,6 +12,8 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from dev_health_ops.metrics.sinks.clickhouse.idempotency import WORK_ITEMS_DEDUPED
 
 if TYPE_CHECKING:
@@ -134,6 +135,168 @@ class ThroughputHistory:
         return self.coefficient_of_variation > cv_threshold
 
 
+# Upper bound on samples drawn per block (int64: 16 MiB). A single team at the
+# default 10,000 simulations draws ~200 days per block; a batch of hundreds of
+# teams is simulated a slice of rows at a time instead of allocating
+# teams x simulations x days at once.
+_DRAW_BLOCK_SAMPLES = 1 << 21
+_MIN_BLOCK_DAYS = 32
+
+
+def _throughput_matrix(
+    throughput_histories: Sequence[Sequence[int]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pad per-team histories into one matrix for fancy-indexed sampling.
+
+    Returns ``(values, lengths)``; row ``t`` of ``values`` holds team ``t``'s
+    throughputs in its first ``lengths[t]`` columns.
+    """
+    lengths = np.array([len(h) for h in throughput_histories], dtype=np.intp)
+    if lengths.size == 0 or int(lengths.min()) == 0:
+        raise ValueError("throughput_history cannot be empty")
+    values = np.zeros((lengths.size, int(lengths.max())), dtype=np.int64)
+    for row, history in enumerate(throughput_histories):
+        values[row, : len(history)] = history
+    return values, lengths
+
+
+def _draw(
+    rng: np.random.Generator,
+    values: np.ndarray,
+    lengths: np.ndarray,
+    teams: np.ndarray,
+    days: int,
+) -> np.ndarray:
+    """Sample ``days`` daily throughputs for each row of ``teams``.
+
+    Equivalent to ``random.choice(history)`` per simulated day: each column is
+    an independent uniform pick from that row's team history.
+    """
+    picks = (rng.random((teams.size, days)) * lengths[teams, None]).astype(np.intp)
+    picks += (teams * values.shape[1])[:, None]
+    return np.take(values, picks)
+
+
+def monte_carlo_forecast_days_batch(
+    throughput_histories: Sequence[Sequence[int]],
+    target_items: Sequence[int],
+    simulations: int = 10000,
+    max_days: int = 365,
+    seed: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run the completion-days simulation for many teams at once.
+
+    Samples are drawn in blocks of days for every still-running simulation of
+    every team; a cumulative sum over each block finds the day the target was
+    reached. Simulations that finish drop out of later blocks.
+
+    Args:
+        throughput_histories: One list of daily throughput values per team.
+        target_items: Number of items to complete, per team.
+        simulations: Number of simulation runs per team (default 10,000).
+        max_days: Maximum days to simulate before stopping (default 365).
+        seed: Seed for the NumPy ``Generator`` (optional). Results for a team
+            depend on the whole batch, not just its own inputs.
+
+    Returns:
+        Tuple of (completion_days, hit_max_days): an int array of shape
+        ``(teams, simulations)`` and a bool array of shape ``(teams,)`` that
+        is True where any of the team's simulations hit ``max_days``.
+    """
+    if len(target_items) != len(throughput_histories):
+        raise ValueError("target_items must have one entry per throughput history")
+    values, lengths = _throughput_matrix(throughput_histories)
+    rng = np.random.default_rng(seed)
+
+    teams = len(throughput_histories)
+    remaining = np.repeat(np.asarray(target_items, dtype=np.int64), simulations).clip(
+        min=0
+    )
+    completion_days = np.zeros(teams * simulations, dtype=np.int64)
+    # Simulations are advanced in slices small enough that every block spans
+    # at least _MIN_BLOCK_DAYS; one-day blocks over millions of rows spend
+    # their time on bookkeeping rather than sampling.
+    slice_rows = _DRAW_BLOCK_SAMPLES // _MIN_BLOCK_DAYS
+    for start in range(0, remaining.size, slice_rows):
+        rows = np.arange(start, min(start + slice_rows, remaining.size))
+        active = rows[remaining[rows] > 0]
+        elapsed = 0
+        while active.size and elapsed < max_days:
+            block = min(max_days - elapsed, _DRAW_BLOCK_SAMPLES // active.size)
+            progress = np.cumsum(
+                _draw(rng, values, lengths, active // simulations, block), axis=1
+            )
+            reached = progress >= remaining[active, None]
+            finished = reached.any(axis=1)
+
+            done = active[finished]
+            completion_days[done] = elapsed + reached[finished].argmax(axis=1) + 1
+            remaining[done] = 0
+
+            running = active[~finished]
+            remaining[running] -= progress[~finished, -1]
+            elapsed += block
+            completion_days[running] = elapsed
+            active = running
+
+    hit_max = (remaining > 0).reshape(teams, simulations).any(axis=1)
+    return completion_days.reshape(teams, simulations), hit_max
+
+
+def monte_carlo_forecast_items_batch(
+    throughput_histories: Sequence[Sequence[int]],
+    days_available: Sequence[int],
+    simulations: int = 10000,
+    seed: int | None = None,
+) -> np.ndarray:
+    """Run the items-completed simulation for many teams at once.
+
+    The total of ``days_available`` uniform picks from a history only depends
+    on how often each distinct throughput value was picked, so each simulation
+    draws those counts from one multinomial instead of sampling every day. The
+    result has exactly the distribution of the day-by-day simulation.
+
+    Args:
+        throughput_histories: One list of daily throughput values per team.
+        days_available: Number of days until the target date, per team.
+        simulations: Number of simulation runs per team (default 10,000).
+        seed: Seed for the NumPy ``Generator`` (optional). Results for a team
+            depend on the whole batch, not just its own inputs.
+
+    Returns:
+        Int array of shape ``(teams, simulations)`` with items completed.
+    """
+    if len(days_available) != len(throughput_histories):
+        raise ValueError("days_available must have one entry per throughput history")
+    if any(not history for history in throughput_histories):
+        raise ValueError("throughput_history cannot be empty")
+    rng = np.random.default_rng(seed)
+
+    distinct = [
+        np.unique(np.asarray(history, dtype=np.int64), return_counts=True)
+        for history in throughput_histories
+    ]
+    width = max((len(observed) for observed, _ in distinct), default=1)
+    # Right-aligned so the implicit last multinomial category is always a real
+    # value; the zero-probability padding columns never receive a pick.
+    values = np.zeros((len(distinct), width), dtype=np.int64)
+    pvals = np.zeros((len(distinct), width), dtype=np.float64)
+    for row, (observed, counts) in enumerate(distinct):
+        values[row, width - len(observed) :] = observed
+        pvals[row, width - len(observed) :] = counts / counts.sum()
+    horizon = np.asarray(days_available, dtype=np.int64).clip(min=0)
+
+    totals = np.zeros((len(distinct), simulations), dtype=np.int64)
+    chunk = max(1, _DRAW_BLOCK_SAMPLES // max(1, simulations * width))
+    for start in range(0, len(distinct), chunk):
+        rows = slice(start, start + chunk)
+        picks = rng.multinomial(
+            horizon[rows], pvals[rows], size=(simulations, pvals[rows].shape[0])
+        )
+        totals[rows] = (picks * values[rows]).sum(axis=2).T
+    return totals
+
+
 def monte_carlo_forecast_days(
     throughput_history: Sequence[int],
     target_items: int,
@@ -163,29 +326,14 @@ def monte_carlo_forecast_days(
     if target_items <= 0:
         return [0] * simulations, False
 
-    if seed is not None:
-        random.seed(seed)
-
-    completion_days: list[int] = []
-    hit_max = False
-
-    throughputs = list(throughput_history)
-
-    for _ in range(simulations):
-        remaining = target_items
-        days = 0
-
-        while remaining > 0 and days < max_days:
-            daily_throughput = random.choice(throughputs)
-            remaining -= daily_throughput
-            days += 1
-
-        if remaining > 0:
-            hit_max = True
-
-        completion_days.append(days)
-
-    return completion_days, hit_max
+    completion_days, hit_max = monte_carlo_forecast_days_batch(
+        [throughput_history],
+        [target_items],
+        simulations=simulations,
+        max_days=max_days,
+        seed=seed,
+    )
+    return completion_days[0].tolist(), bool(hit_max[0])
 
 
 def monte_carlo_forecast_items(
@@ -213,19 +361,10 @@ def monte_carlo_forecast_items(
     if days_available <= 0:
         return [0] * simulations
 
-    if seed is not None:
-        random.seed(seed)
-
-    items_completed: list[int] = []
-    throughputs = list(throughput_history)
-
-    for _ in range(simulations):
-        total = 0
-        for _ in range(days_available):
-            total += random.choice(throughputs)
-        items_completed.append(total)
-
-    return items_completed
+    items_completed = monte_carlo_forecast_items_batch(
+        [throughput_history], [days_available], simulations=simulations, seed=seed
+    )
+    return items_completed[0].tolist()
 
 
 def _percentile(sorted_values: Sequence[int], p: float) -> int:
@@ -253,6 +392,154 @@ def compute_percentiles(
     return [_percentile(sorted_vals, p) for p in percentiles]
 
 
+def _row_percentiles(values: np.ndarray, percentiles: Sequence[float]) -> np.ndarray:
+    """:func:`compute_percentiles` applied to every row of a 2-D array.
+
+    Uses the same rank interpolation and integer truncation so a row yields
+    exactly what ``compute_percentiles(row.tolist(), percentiles)`` would.
+    """
+    ordered = np.sort(values, axis=1)
+    last = ordered.shape[1] - 1
+    columns = []
+    for p in percentiles:
+        if p <= 0:
+            columns.append(ordered[:, 0])
+            continue
+        if p >= 100:
+            columns.append(ordered[:, -1])
+            continue
+        rank = last * (p / 100.0)
+        lo = int(rank)
+        hi = min(lo + 1, last)
+        frac = rank - lo
+        columns.append(
+            (ordered[:, lo] * (1.0 - frac) + ordered[:, hi] * frac).astype(np.int64)
+        )
+    return np.stack(columns, axis=1)
+
+
+@dataclass(frozen=True)
+class CapacityForecastRequest:
+    """Inputs of one forecast in a :func:`forecast_capacity_batch` call."""
+
+    history: ThroughputHistory
+    target_items: int | None = None
+    target_date: date | None = None
+    backlog_size: int = 0
+    team_id: str | None = None
+    work_scope_id: str | None = None
+
+
+def forecast_capacity_batch(
+    requests: Sequence[CapacityForecastRequest],
+    simulations: int = 10000,
+    seed: int | None = None,
+    today: date | None = None,
+) -> list[ForecastResult]:
+    """Compute many capacity forecasts with one batched simulation per mode.
+
+    All fixed-scope requests share one :func:`monte_carlo_forecast_days_batch`
+    call and all fixed-date requests one :func:`monte_carlo_forecast_items_batch`
+    call, so recomputing every team/scope costs a handful of array passes
+    instead of a Python loop per simulated day. Each request is validated as
+    :func:`forecast_capacity` would validate it; results follow request order.
+
+    With a ``seed`` the batch is reproducible as a whole, but a request's
+    quantiles can differ (within sampling tolerance) from a single-request
+    call with the same seed, because the requests share one generator.
+    """
+    for request in requests:
+        if request.target_items is None and request.target_date is None:
+            raise ValueError("Must provide either target_items or target_date")
+        if not request.history.daily_throughputs:
+            raise ValueError("Cannot forecast with empty throughput history")
+
+    now = datetime.now(timezone.utc)
+    if today is None:
+        today = now.date()
+
+    # Fixed-scope forecast: "When will we finish N items?"
+    scope_rows = [
+        i for i, request in enumerate(requests) if request.target_items is not None
+    ]
+    day_percentiles: dict[int, list[int]] = {}
+    if scope_rows:
+        completion_days, _ = monte_carlo_forecast_days_batch(
+            [requests[i].history.daily_throughputs for i in scope_rows],
+            [requests[i].target_items or 0 for i in scope_rows],
+            simulations=simulations,
+            seed=seed,
+        )
+        quantiles = _row_percentiles(completion_days, [50, 85, 95])
+        day_percentiles = dict(zip(scope_rows, quantiles.tolist(), strict=True))
+
+    # Fixed-date forecast: "How many items by date X?"
+    days_available = {
+        i: (request.target_date - today).days
+        for i, request in enumerate(requests)
+        if request.target_date is not None
+    }
+    date_rows = [i for i, days in days_available.items() if days > 0]
+    item_percentiles: dict[int, list[int]] = {}
+    if date_rows:
+        items_results = monte_carlo_forecast_items_batch(
+            [requests[i].history.daily_throughputs for i in date_rows],
+            [days_available[i] for i in date_rows],
+            simulations=simulations,
+            # Offset so the two batches do not replay the same stream.
+            seed=None if seed is None else seed + 1,
+        )
+        # Note: For items, p50 is optimistic, p95 is conservative (fewer items)
+        # So we flip the percentiles: p50=50th (median), p85=15th, p95=5th
+        quantiles = _row_percentiles(items_results, [50, 15, 5])
+        item_percentiles = dict(zip(date_rows, quantiles.tolist(), strict=True))
+
+    results: list[ForecastResult] = []
+    for i, request in enumerate(requests):
+        p50_days = p85_days = p95_days = None
+        p50_date = p85_date = p95_date = None
+        if i in day_percentiles:
+            p50_days, p85_days, p95_days = day_percentiles[i]
+            p50_date = today + timedelta(days=p50_days)
+            p85_date = today + timedelta(days=p85_days)
+            p95_date = today + timedelta(days=p95_days)
+
+        p50_items = p85_items = p95_items = None
+        if i in item_percentiles:
+            p50_items, p85_items, p95_items = item_percentiles[i]
+        elif request.target_date is not None:
+            p50_items = p85_items = p95_items = 0
+
+        history = request.history
+        results.append(
+            ForecastResult(
+                forecast_id=str(uuid.uuid4()),
+                computed_at=now,
+                team_id=request.team_id,
+                work_scope_id=request.work_scope_id,
+                backlog_size=request.backlog_size,
+                target_items=request.target_items,
+                target_date=request.target_date,
+                history_days=history.days_of_history,
+                simulation_count=simulations,
+                p50_days=p50_days,
+                p85_days=p85_days,
+                p95_days=p95_days,
+                p50_date=p50_date,
+                p85_date=p85_date,
+                p95_date=p95_date,
+                p50_items=p50_items,
+                p85_items=p85_items,
+                p95_items=p95_items,
+                throughput_mean=history.mean,
+                throughput_stddev=history.stddev,
+                insufficient_history=not history.is_sufficient(),
+                high_variance=history.is_high_variance(),
+            )
+        )
+    return results
+
+
 def forecast_capacity(
     history: ThroughputHistory,
     target_items: int | None = None,
@@ -293,83 +580,22 @@ def forecast_capacity(
         ValueError: If neither target_items nor target_date provided,
                    or if history is empty.
     """
-    if target_items is None and target_date is None:
-        raise ValueError("Must provide either target_items or target_date")
-
-    if not history.daily_throughputs:
-        raise ValueError("Cannot forecast with empty throughput history")
-
-    now = datetime.now(timezone.utc)
-    if today is None:
-        today = now.date()
-    forecast_id = str(uuid.uuid4())
-
-    p50_days: int | None = None
-    p85_days: int | None = None
-    p95_days: int | None = None
-    p50_date: date | None = None
-    p85_date: date | None = None
-    p95_date: date | None = None
-    p50_items: int | None = None
-    p85_items: int | None = None
-    p95_items: int | None = None
-
-    # Fixed-scope forecast: "When will we finish N items?"
-    if target_items is not None:
-        completion_days, _ = monte_carlo_forecast_days(
-            history.daily_throughputs,
-            target_items,
-            simulations=simulations,
-            seed=seed,
-        )
-        percentiles = compute_percentiles(completion_days, [50, 85, 95])
-        p50_days, p85_days, p95_days = percentiles
-
-        p50_date = today + timedelta(days=p50_days)
-        p85_date = today + timedelta(days=p85_days)
-        p95_date = today + timedelta(days=p95_days)
-
-    # Fixed-date forecast: "How many items by date X?"
-    if target_date is not None:
-        days_available = (target_date - today).days
-        if days_available > 0:
-            items_results = monte_carlo_forecast_items(
-                history.daily_throughputs,
-                days_available,
-                simulations=simulations,
-                seed=seed,
+    [result] = forecast_capacity_batch(
+        [
+            CapacityForecastRequest(
+                history=history,
+                target_items=target_items,
+                target_date=target_date,
+                backlog_size=backlog_size,
+                team_id=team_id,
+                work_scope_id=work_scope_id,
             )
-            # Note: For items, p50 is optimistic, p95 is conservative (fewer items)
-            # So we flip the percentiles: p50=50th (median), p85=15th, p95=5th
-            percentiles = compute_percentiles(items_results, [50, 15, 5])
-            p50_items, p85_items, p95_items = percentiles
-        else:
-            p50_items = p85_items = p95_items = 0
-
-    return ForecastResult(
-        forecast_id=forecast_id,
-        computed_at=now,
-        team_id=team_id,
-        work_scope_id=work_scope_id,
-        backlog_size=backlog_size,
-        target_items=target_items,
-        target_date=target_date,
-        history_days=history.days_of_history,
-        simulation_count=simulations,
-        p50_days=p50_days,
-        p85_days=p85_days,
-        p95_days=p95_days,
-        p50_date=p50_date,
-        p85_date=p85_date,
-        p95_date=p95_date,
-        p50_items=p50_items,
-        p85_items=p85_items,
-        p95_items=p95_items,
-        throughput_mean=history.mean,
-        throughput_stddev=history.stddev,
-        insufficient_history=not history.is_sufficient(),
-        high_variance=history.is_high_variance(),
+        ],
+        simulations=simulations,
+        seed=seed,
+        today=today,
     )
+    return result
 
 
 async def load_throughput_history_clickhouse(
@@ -6,9 +6,10 @@ from datetime import date, datetime, time, timedelta, timezone
 
 from dev_health_ops.metrics.compute_work_items import (
     TeamAttributionContext,
-    resolve_team_attribution,
+    TeamAttributionEngine,
 )
 from dev_health_ops.metrics.schemas import WorkItemStateDurationDailyRecord
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
 from dev_health_ops.models.work_items import (
     WorkItem,
     WorkItemStatusCategory,
@@ -31,11 +32,7 @@ def _utc_day_window(day: date) -> tuple[datetime, datetime]:
 
 
 def _resolve_team(
-    item: WorkItem,
-    team_resolver: TeamResolver | None,
-    project_key_resolver: ProjectKeyTeamResolver | None,
-    linked_issue_resolver: LinkedIssueTeamResolver | None,
-    attribution_context: TeamAttributionContext | None,
+    item: WorkItem, attribution_engine: TeamAttributionEngine
 ) -> tuple[str, str]:
     """Resolve an item's team using the same cascade as the cycle-time compute.
 
@@ -43,13 +40,7 @@ def _resolve_team(
     attributed to the same team in state-duration rows as in
     ``work_item_cycle_times``.
     """
-    team_id, team_name, _ = resolve_team_attribution(
-        item,
-        team_resolver,
-        project_key_resolver,
-        linked_issue_resolver=linked_issue_resolver,
-        attribution_context=attribution_context,
-    )
+    team_id, team_name, _ = attribution_engine.resolve(item)
     return normalize_team_id(team_id), normalize_team_name(team_name)
 
 
@@ -115,6 +106,8 @@ def compute_work_item_state_durations_daily(
     project_key_resolver: ProjectKeyTeamResolver | None = None,
     linked_issue_resolver: LinkedIssueTeamResolver | None = None,
     attribution_context: TeamAttributionContext | None = None,
+    timeline: WorkItemTimeline | None = None,
+    attribution_engine: TeamAttributionEngine | None = None,
 ) -> list[WorkItemStateDurationDailyRecord]:
     """
     Compute per-day time-in-state totals from status transitions.
@@ -122,15 +115,24 @@ def compute_work_item_state_durations_daily(
     Output rows are keyed for Grafana aggregation:
     (day, provider, work_scope_id, team_id, status)
 
+    ``timeline`` is a ``WorkItemTimeline`` over ``work_items``/``transitions``
+    shared across days; only items whose status history can overlap the day
+    are segmented.
+
     Null/missing behavior:
     - if an item has no status transitions, it contributes no time-in-state rows.
     """
     start, end = _utc_day_window(day)
     computed_at_utc = to_utc(computed_at)
-
-    transitions_by_id: dict[str, list[WorkItemStatusTransition]] = defaultdict(list)
-    for tr in transitions:
-        transitions_by_id[tr.work_item_id].append(tr)
+    if timeline is None:
+        timeline = WorkItemTimeline(work_items, transitions)
+    if attribution_engine is None:
+        attribution_engine = TeamAttributionEngine(
+            team_resolver,
+            project_key_resolver,
+            linked_issue_resolver,
+            attribution_context,
+        )
 
     totals: dict[tuple[str, str, str, WorkItemStatusCategory], float] = defaultdict(
         float
@@ -140,18 +142,10 @@ def compute_work_item_state_durations_daily(
     )
     team_name_by_key: dict[tuple[str, str, str], str] = {}
 
-    for item in work_items:
-        item_transitions = transitions_by_id.get(item.work_item_id) or []
-        if not item_transitions:
-            continue
+    for item in timeline.with_status_history_during(start, end):
+        item_transitions = timeline.transitions_for(item.work_item_id)
 
-        team_id, team_name = _resolve_team(
-            item,
-            team_resolver,
-            project_key_resolver,
-            linked_issue_resolver,
-            attribution_context,
-        )
+        team_id, team_name = _resolve_team(item, attribution_engine)
         work_scope_id = item.work_scope_id or ""
         team_name_by_key[(item.provider, work_scope_id, team_id)] = team_name
 
@@ -14,6 +14,7 @@ from dev_health_ops.metrics.schemas import (
     WorkItemTeamAttributionRecord,
     WorkItemUserMetricsDailyRecord,
 )
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
 from dev_health_ops.models.work_items import (
     WorkItem,
     WorkItemDependency,
@@ -487,6 +488,83 @@ def resolve_team_attribution(
     return primary.team_id, primary.team_name, marked_rows
 
 
+class TeamAttributionEngine:
+    """Run-scoped memo over :func:`resolve_team_attribution`.
+
+    Attribution only depends on the resolvers fixed for the run and on a few
+    fields of the item, so each distinct item is resolved once and every
+    per-day compute (and every day) reuses the result. Items reloaded as new
+    objects on later days still hit, because the cache is keyed by those
+    fields rather than by identity.
+    """
+
+    def __init__(
+        self,
+        team_resolver: TeamResolver | None = None,
+        project_key_resolver: ProjectKeyTeamResolver | None = None,
+        linked_issue_resolver: LinkedIssueTeamResolver | None = None,
+        attribution_context: TeamAttributionContext | None = None,
+    ) -> None:
+        self.team_resolver = team_resolver
+        self.project_key_resolver = project_key_resolver
+        self.linked_issue_resolver = linked_issue_resolver
+        self.attribution_context = attribution_context
+        self._cache: dict[
+            tuple[object, ...],
+            tuple[str | None, str | None, tuple[TeamAttributionCandidate, ...]],
+        ] = {}
+        self.resolutions = 0
+        self.hits = 0
+
+    @staticmethod
+    def cache_key(item: WorkItem) -> tuple[object, ...]:
+        """The item fields :func:`resolve_team_attribution` reads."""
+        return (
+            item.work_item_id,
+            item.provider,
+            item.native_team_key,
+            item.work_scope_id,
+            item.project_key,
+            item.project_id,
+            item.repo_id,
+            tuple(item.assignees),
+        )
+
+    def resolve(
+        self, item: WorkItem
+    ) -> tuple[str | None, str | None, list[TeamAttributionCandidate]]:
+        key = self.cache_key(item)
+        cached = self._cache.get(key)
+        if cached is None:
+            team_id, team_name, candidates = resolve_team_attribution(
+                item,
+                self.team_resolver,
+                self.project_key_resolver,
+                linked_issue_resolver=self.linked_issue_resolver,
+                attribution_context=self.attribution_context,
+            )
+            cached = (team_id, team_name, tuple(candidates))
+            self._cache[key] = cached
+            self.resolutions += 1
+        else:
+            self.hits += 1
+        return cached[0], cached[1], list(cached[2])
+
+
+def _attribution_engine(
+    engine: TeamAttributionEngine | None,
+    team_resolver: TeamResolver | None,
+    project_key_resolver: ProjectKeyTeamResolver | None,
+    linked_issue_resolver: LinkedIssueTeamResolver | None,
+    attribution_context: TeamAttributionContext | None,
+) -> TeamAttributionEngine:
+    if engine is not None:
+        return engine
+    return TeamAttributionEngine(
+        team_resolver, project_key_resolver, linked_issue_resolver, attribution_context
+    )
+
+
 def resolve_base_team(
     item: WorkItem,
     team_resolver: TeamResolver | None,
@@ -773,6 +851,8 @@ def compute_work_item_metrics_daily(
     project_key_resolver: ProjectKeyTeamResolver | None = None,
     linked_issue_resolver: LinkedIssueTeamResolver | None = None,
     attribution_context: TeamAttributionContext | None = None,
+    timeline: WorkItemTimeline | None = None,
+    attribution_engine: TeamAttributionEngine | None = None,
 ) -> tuple[
     list[WorkItemMetricsDailyRecord],
     list[WorkItemUserMetricsDailyRecord],
@@ -785,12 +865,25 @@ def compute_work_item_metrics_daily(
     - created_at, updated_at always set
     - started_at/completed_at best-effort derived (may be None)
 
+    ``timeline`` is a ``WorkItemTimeline`` over ``work_items``/``transitions``
+    and ``attribution_engine`` a ``TeamAttributionEngine`` over the resolvers,
+    both built once per run; without them they are built for this call.
+
     Null behavior:
     - cycle-time percentiles ignore items missing started_at or completed_at
     - WIP metrics ignore items missing started_at
     """
     start, end = _utc_day_window(day)
     computed_at_utc = to_utc(computed_at)
+    if timeline is None:
+        timeline = WorkItemTimeline(work_items, transitions)
+    engine = _attribution_engine(
+        attribution_engine,
+        team_resolver,
+        project_key_resolver,
+        linked_issue_resolver,
+        attribution_context,
+    )
 
     # Aggregations keyed by (provider, work_scope_id, team_id).
     by_group: dict[tuple[str, str, str | None], GroupBucket] = {}
@@ -798,12 +891,9 @@ def compute_work_item_metrics_daily(
 
     cycle_time_records: list[WorkItemCycleTimeRecord] = []
 
-    # Pre-index transitions by work_item_id for faster lookup
-    transitions_by_item: dict[str, list[WorkItemStatusTransition]] = {}
-    for t in transitions:
-        transitions_by_item.setdefault(t.work_item_id, []).append(t)
-
-    for item in work_items:
+    # Only items created, started or completed today, or in progress at the
+    # end of the day, can contribute.
+    for item in timeline.touched_during(start, end):
         work_scope_id = item.work_scope_id or ""
         created_at = to_utc(item.created_at)
         started_at = to_utc(item.started_at) if item.started_at else None
@@ -815,13 +905,7 @@ def compute_work_item_metrics_daily(
             continue
 
         assignee = item.assignees[0] if item.assignees else None
-        team_id, team_name, _ = resolve_team_attribution(
-            item,
-            team_resolver,
-            project_key_resolver,
-            linked_issue_resolver=linked_issue_resolver,
-            attribution_context=attribution_context,
-        )
+        team_id, team_name, _ = engine.resolve(item)
         team_id_norm = normalize_team_id(team_id)
         team_name_norm = normalize_team_name(team_name)
 
@@ -949,7 +1033,7 @@ def compute_work_item_metrics_daily(
 
             # Calculate flow breakdown if cycle_hours is available
             if cycle_duration_hours is not None and cycle_duration_hours > 0:
-                item_transitions = transitions_by_item.get(item.work_item_id, [])
+                item_transitions = timeline.transitions_for(item.work_item_id)
                 calculated_active_h, calculated_wait_h = _calculate_flow_breakdown(
                     item, item_transitions
                 )
@@ -1122,24 +1206,31 @@ def compute_estimate_coverage_metrics_daily(
     project_key_resolver: ProjectKeyTeamResolver | None = None,
     linked_issue_resolver: LinkedIssueTeamResolver | None = None,
     attribution_context: TeamAttributionContext | None = None,
+    timeline: WorkItemTimeline | None = None,
+    attribution_engine: TeamAttributionEngine | None = None,
 ) -> list[EstimateCoverageMetricsDailyRecord]:
     _start, end = _utc_day_window(day)
     computed_at_utc = to_utc(computed_at)
     by_group: dict[tuple[str, str, str | None], EstimateCoverageBucket] = {}
+    if timeline is None:
+        timeline = WorkItemTimeline(work_items)
+    engine = _attribution_engine(
+        attribution_engine,
+        team_resolver,
+        project_key_resolver,
+        linked_issue_resolver,
+        attribution_context,
+    )
 
-    for item in work_items:
+    # Items closed before the day still open (empty) buckets for their group,
+    # so every item created by the end of the day is visited.
+    for item in timeline.created_before(end):
         created_at = to_utc(item.created_at)
         terminal_at = _earliest_utc(item.completed_at, item.closed_at)
         if created_at >= end:
             continue
 
-        team_id, team_name, _ = resolve_team_attribution(
-            item,
-            team_resolver,
-            project_key_resolver,
-            linked_issue_resolver=linked_issue_resolver,
-            attribution_context=attribution_context,
-        )
+        team_id, team_name, _ = engine.resolve(item)
         team_id_norm = normalize_team_id(team_id)
         team_name_norm = normalize_team_name(team_name)
         key = (item.provider, item.work_scope_id or "", team_id_norm)
@@ -1194,17 +1285,19 @@ def compute_work_item_team_attributions(
     project_key_resolver: ProjectKeyTeamResolver | None = None,
     linked_issue_resolver: LinkedIssueTeamResolver | None = None,
     attribution_context: TeamAttributionContext | None = None,
+    attribution_engine: TeamAttributionEngine | None = None,
 ) -> list[WorkItemTeamAttributionRecord]:
     computed_at_utc = to_utc(computed_at)
+    engine = _attribution_engine(
+        attribution_engine,
+        team_resolver,
+        project_key_resolver,
+        linked_issue_resolver,
+        attribution_context,
+    )
     records: list[WorkItemTeamAttributionRecord] = []
     for item in work_items:
-        _, _, candidates = resolve_team_attribution(
-            item,
-            team_resolver,
-            project_key_resolver,
-            linked_issue_resolver=linked_issue_resolver,
-            attribution_context=attribution_context,
-        )
+        _, _, candidates = engine.resolve(item)
         for candidate in candidates:
             records.append(
                 WorkItemTeamAttributionRecord(
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import TypedDict
 
+from dev_health_ops.metrics.commit_window import CommitStatWindow, group_by_repo
 from dev_health_ops.metrics.schemas import (
     CommitStatRow,
     FileComplexitySnapshot,
@@ -110,23 +111,81 @@ def compute_file_hotspots(
     return sorted(records, key=lambda r: r.hotspot_score, reverse=True)
 
 
-def compute_file_risk_hotspots(
+def compute_file_hotspots_by_repo(
     *,
-    repo_id: uuid.UUID,
+    window: CommitStatWindow,
     day: date,
-    window_stats: Sequence[CommitStatRow],
-    complexity_map: dict[str, FileComplexitySnapshot],
-    blame_map: dict[str, float] | None = None,
     computed_at: datetime,
-) -> list[FileHotspotDaily]:
+) -> dict[uuid.UUID, list[FileMetricsRecord]]:
     """
-    Compute risk score merging churn (30d) and complexity.
+    File hotspots for every repo in ``window`` in one grouped pass.
 
-    risk_score = z(churn) + z(complexity)
+    Result-identical (including tie order) to ``compute_file_hotspots`` per
+    repo over the window's rows.
+    """
+    files = window.file_rollup()
+    alpha, beta, gamma = 0.4, 0.3, 0.3
+    results: dict[uuid.UUID, list[FileMetricsRecord]] = {}
+    for repo_code, idx in group_by_repo(files.repo):
+        repo_id = window.repo_id(repo_code)
+        records: list[FileMetricsRecord] = []
+        for i in idx.tolist():
+            path = files.paths[i]
+            if path == AGGREGATE_STATS_MARKER:
+                continue
+            churn = int(files.churn[i])
+            contributors = int(files.distinct_contributors[i])
+            commits_count = int(files.distinct_commits[i])
+            hotspot_score = (
+                (alpha * math.log1p(churn))
+                + (beta * contributors)
+                + (gamma * commits_count)
+            )
+            records.append(
+                FileMetricsRecord(
+                    repo_id=repo_id,
+                    day=day,
+                    path=path,
+                    churn=churn,
+                    contributors=contributors,
+                    commits_count=commits_count,
+                    hotspot_score=float(hotspot_score),
+                    computed_at=computed_at,
+                )
+            )
+        results[repo_id] = sorted(records, key=lambda r: r.hotspot_score, reverse=True)
+    return results
 
-    Blame concentration can be provided (e.g., derived from git blame data).
+
+def compute_file_churn_by_repo(
+    window: CommitStatWindow,
+) -> dict[uuid.UUID, dict[str, ChurnStats]]:
     """
-    # 1. Aggregate churn per file
+    Per-file churn/commit-row counts for every repo in ``window``.
+
+    This is the churn map ``compute_file_risk_hotspots`` builds from
+    ``window_stats``; pass a repo's entry to
+    ``compute_file_risk_hotspots_from_churn`` to skip that scan.
+    """
+    files = window.file_rollup()
+    results: dict[uuid.UUID, dict[str, ChurnStats]] = {}
+    for repo_code, idx in group_by_repo(files.repo):
+        churn_map: dict[str, ChurnStats] = {}
+        for i in idx.tolist():
+            path = files.paths[i]
+            if path == AGGREGATE_STATS_MARKER:
+                continue
+            churn_map[path] = {
+                "churn": int(files.churn[i]),
+                "commits": int(files.rows[i]),
+            }
+        results[window.repo_id(repo_code)] = churn_map
+    return results
+
+
+def _churn_map_from_rows(
+    repo_id: uuid.UUID, window_stats: Sequence[CommitStatRow]
+) -> dict[str, ChurnStats]:
     churn_map: dict[str, ChurnStats] = {}
     for row in window_stats:
         if row["repo_id"] != repo_id:
@@ -149,7 +208,49 @@ def compute_file_risk_hotspots(
         dels = max(0, int(row.get("deletions") or 0))
         churn_map[path]["churn"] += adds + dels
         churn_map[path]["commits"] += 1
+    return churn_map
+
+
+def compute_file_risk_hotspots(
+    *,
+    repo_id: uuid.UUID,
+    day: date,
+    window_stats: Sequence[CommitStatRow],
+    complexity_map: dict[str, FileComplexitySnapshot],
+    blame_map: dict[str, float] | None = None,
+    computed_at: datetime,
+) -> list[FileHotspotDaily]:
+    """
+    Compute risk score merging churn (30d) and complexity.
+
+    risk_score = z(churn) + z(complexity)
 
+    Blame concentration can be provided (e.g., derived from git blame data).
+    """
+    # 1. Aggregate churn per file
+    return compute_file_risk_hotspots_from_churn(
+        repo_id=repo_id,
+        day=day,
+        churn_map=_churn_map_from_rows(repo_id, window_stats),
+        complexity_map=complexity_map,
+        blame_map=blame_map,
+        computed_at=computed_at,
+    )
+
+
+def compute_file_risk_hotspots_from_churn(
+    *,
+    repo_id: uuid.UUID,
+    day: date,
+    churn_map: dict[str, ChurnStats],
+    complexity_map: dict[str, FileComplexitySnapshot],
+    blame_map: dict[str, float] | None = None,
+    computed_at: datetime,
+) -> list[FileHotspotDaily]:
+    """
+    ``compute_file_risk_hotspots`` over a precomputed per-file churn map
+    (see ``compute_file_churn_by_repo``) instead of raw ``window_stats``.
+    """
     # 2. Merge keys (union of churned files and complex files)
     all_files = set(churn_map.keys()) | set(complexity_map.keys())
 
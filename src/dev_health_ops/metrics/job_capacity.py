@@ -12,8 +12,9 @@ from dev_health_ops.metrics.capacity_queries import (
     load_throughput_from_sink,
 )
 from dev_health_ops.metrics.compute_capacity import (
+    CapacityForecastRequest,
     ForecastResult,
-    forecast_capacity,
+    forecast_capacity_batch,
 )
 from dev_health_ops.metrics.schemas import CapacityForecastRecord
 from dev_health_ops.metrics.sinks.factory import create_sink
@@ -68,7 +69,7 @@ async def run_capacity_forecast(
     try:
         setattr(sink, "org_id", org_id)
         logger.info("Running capacity forecast for org_id=%s", org_id)
-        results: list[ForecastResult] = []
+        requests: list[CapacityForecastRequest] = []
 
         if all_teams:
             scopes = await discover_team_scopes(sink)
@@ -77,7 +78,7 @@ async def run_capacity_forecast(
             scopes = [(team_id, work_scope_id)]
 
         for tid, wsid in scopes:
-            logger.info(f"Computing forecast for team={tid}, scope={wsid}")
+            logger.info(f"Loading forecast inputs for team={tid}, scope={wsid}")
 
             history = await load_throughput_from_sink(
                 sink, team_id=tid, work_scope_id=wsid, history_days=history_days
@@ -94,24 +95,32 @@ async def run_capacity_forecast(
                 logger.warning(f"No target items for team={tid}, scope={wsid}")
                 continue
 
-            result = forecast_capacity(
-                history=history,
-                target_items=items,
-                target_date=target_date,
-                backlog_size=backlog,
-                team_id=tid,
-                work_scope_id=wsid,
-                simulations=simulations,
-                seed=seed,
+            requests.append(
+                CapacityForecastRequest(
+                    history=history,
+                    target_items=items,
+                    target_date=target_date,
+                    backlog_size=backlog,
+                    team_id=tid,
+                    work_scope_id=wsid,
+                )
             )
-            results.append(result)
 
+        # Every scope is simulated in one batch: a per-team Python loop over
+        # simulations x days dominated recompute time for large orgs.
+        results = forecast_capacity_batch(requests, simulations=simulations, seed=seed)
+        logger.info(f"Computed {len(results)} forecast(s)")
+
+        for result in results:
             if result.insufficient_history:
                 logger.warning(
-                    f"Insufficient history ({result.history_days} days) for team={tid}"
+                    f"Insufficient history ({result.history_days} days) "
+                    f"for team={result.team_id}"
                 )
             if result.high_variance:
-                logger.warning(f"High throughput variance detected for team={tid}")
+                logger.warning(
+                    f"High throughput variance detected for team={result.team_id}"
+                )
 
         if persist and results:
             records = [
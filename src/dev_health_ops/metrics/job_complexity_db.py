@@ -133,6 +133,13 @@ def _load_blame_contents(
     paths: Sequence[str] | None,
     limit: int | None,
 ) -> list[tuple[str, str]]:
+    """Rebuild file text from per-line ``git_blame`` rows.
+
+    Paths blamed in compact form (``git_blame_hunks``) carry no line text; any
+    per-line rows left for them predate the compact sync and would rebuild a
+    stale file, so they are excluded. Compact-mode local syncs, full and
+    blame-only alike, write ``git_files.contents``, which the job reads first.
+    """
     query = """
         SELECT
           path,
@@ -146,6 +153,10 @@ def _load_blame_contents(
         FROM git_blame
         WHERE repo_id = {repo_id:UUID}
           AND org_id = {org_id:String}
+          AND path NOT IN (
+            SELECT path FROM git_blame_hunks
+            WHERE repo_id = {repo_id:UUID} AND org_id = {org_id:String}
+          )
     """
     params: dict = {"repo_id": str(repo_id), "org_id": org_id}
     if paths:
@@ -181,6 +192,10 @@ def _has_blame_line_text(client: Any, repo_id: uuid.UUID, org_id: str) -> bool:
           AND org_id = {org_id:String}
           AND line IS NOT NULL
           AND line != ''
+          AND path NOT IN (
+            SELECT path FROM git_blame_hunks
+            WHERE repo_id = {repo_id:UUID} AND org_id = {org_id:String}
+          )
         LIMIT 1
         """,
         {"repo_id": str(repo_id), "org_id": org_id},
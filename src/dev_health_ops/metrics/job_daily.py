@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import logging
 import os
 import uuid
-from collections.abc import Iterable
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -22,6 +24,8 @@ from dev_health_ops.metrics.active_incidents import (
 )
 from dev_health_ops.metrics.ai_impact import compute_ai_impact_metrics_daily
 from dev_health_ops.metrics.benchmarking.runner import run_benchmarking_for_day
+from dev_health_ops.metrics.clickhouse_instrumentation import clickhouse_caller
+from dev_health_ops.metrics.commit_window import CommitStatWindow
 from dev_health_ops.metrics.compounding_risk import build_compounding_risk_rows_for_day
 from dev_health_ops.metrics.compute import compute_daily_metrics
 from dev_health_ops.metrics.compute_cicd import compute_cicd_metrics_daily
@@ -48,6 +52,7 @@ from dev_health_ops.metrics.compute_work_item_state_durations import (
     compute_work_item_state_durations_daily,
 )
 from dev_health_ops.metrics.compute_work_items import (
+    TeamAttributionEngine,
     build_linked_issue_team_resolver,
     compute_estimate_coverage_metrics_daily,
     compute_work_item_metrics_daily,
@@ -55,8 +60,9 @@ from dev_health_ops.metrics.compute_work_items import (
 )
 from dev_health_ops.metrics.dependencies import get_metrics_dependencies
 from dev_health_ops.metrics.hotspots import (
-    compute_file_hotspots,
-    compute_file_risk_hotspots,
+    compute_file_churn_by_repo,
+    compute_file_hotspots_by_repo,
+    compute_file_risk_hotspots_from_churn,
 )
 from dev_health_ops.metrics.identity import (
     get_team_resolver,
@@ -65,18 +71,21 @@ from dev_health_ops.metrics.identity import (
 )
 from dev_health_ops.metrics.job_compounding_risk import _fetch_repo_metrics_for_day
 from dev_health_ops.metrics.knowledge import (
-    compute_bus_factor,
-    compute_code_ownership_gini,
+    compute_bus_factor_by_repo,
+    compute_code_ownership_gini_by_repo,
 )
 from dev_health_ops.metrics.loaders import DataLoader, to_utc
 from dev_health_ops.metrics.loaders.clickhouse import ClickHouseDataLoader
+from dev_health_ops.metrics.loaders.window_cache import WindowCachedTestOpsLoader
+from dev_health_ops.metrics.prometheus import record_work_item_team_attributions
 from dev_health_ops.metrics.quality import (
-    compute_rework_churn_ratio,
-    compute_single_owner_file_ratio,
+    compute_rework_churn_ratio_by_repo,
+    compute_single_owner_file_ratio_by_repo,
 )
 from dev_health_ops.metrics.reviews import compute_review_edges_daily
 from dev_health_ops.metrics.schemas import FileComplexitySnapshot
 from dev_health_ops.metrics.sinks.clickhouse import ClickHouseMetricsSink
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
 from dev_health_ops.metrics.work_items import DiscoveredRepo
 from dev_health_ops.providers.identity import load_identity_resolver
 from dev_health_ops.providers.teams import (
@@ -669,8 +678,17 @@ def _load_blame_map_for_repo(
     (CHAOS-2376 round-2: cross-org leak). Returns an empty map (callers treat
     concentration as ``NULL``) on any query failure so a missing/unmigrated
     table never aborts the daily job.
+
+    Paths synced in compact form (``git_blame_hunks``, migration 077) are read
+    from their latest hunk generation, weighted by ``line_count``, and take
+    precedence over any per-line rows left from an earlier line-mode sync.
     """
-    query = """
+    params: dict[str, Any] = {"repo_id": str(repo_id)}
+    scope = "repo_id = {repo_id:UUID}"
+    if org_id:
+        scope += " AND org_id = {org_id:String}"
+        params["org_id"] = org_id
+    query = f"""
         SELECT
             path,
             max(author_lines) / sum(author_lines) AS concentration
@@ -679,24 +697,45 @@ def _load_blame_map_for_repo(
             SELECT
                 path,
                 author,
-                count() AS author_lines
+                sum(lines) AS author_lines
             FROM
             (
                 SELECT
                     path,
-                    line_no,
-                    argMax(
-                        coalesce(author_email, author_name, ''),
-                        last_synced
-                    ) AS author
-                FROM git_blame
-                WHERE repo_id = {repo_id:UUID}
-    """
-    params: dict[str, Any] = {"repo_id": str(repo_id)}
-    if org_id:
-        query += "                  AND org_id = {org_id:String}\n"
-        params["org_id"] = org_id
-    query += """                GROUP BY path, line_no
+                    author,
+                    count() AS lines
+                FROM
+                (
+                    SELECT
+                        path,
+                        line_no,
+                        argMax(
+                            coalesce(author_email, author_name, ''),
+                            last_synced
+                        ) AS author
+                    FROM git_blame
+                    WHERE {scope}
+                      AND path NOT IN (
+                          SELECT path FROM git_blame_hunks WHERE {scope}
+                      )
+                    GROUP BY path, line_no
+                )
+                GROUP BY path, author
+                UNION ALL
+                SELECT
+                    path,
+                    coalesce(author_email, author_name, '') AS author,
+                    sum(line_count) AS lines
+                FROM git_blame_hunks
+                WHERE {scope}
+                  AND line_count > 0
+                  AND (path, last_synced) IN (
+                      SELECT path, max(last_synced)
+                      FROM git_blame_hunks
+                      WHERE {scope}
+                      GROUP BY path
+                  )
+                GROUP BY path, author
             )
             WHERE author != ''
             GROUP BY path, author
@@ -726,6 +765,188 @@ def _load_blame_map_for_repo(
     return blame_map
 
 
+# Day-level read concurrency for run_daily_metrics_job. Concurrent mode fans a
+# day's independent loader reads out with asyncio.gather and keeps up to
+# ``max_inflight_days`` days of reads in flight (the current day plus
+# prefetched upcoming days) while the current day computes and writes.
+# Compute and writes always run strictly in day order.
+_CONCURRENT_READS_ENV = "DAILY_METRICS_CONCURRENT_READS"
+_MAX_INFLIGHT_DAYS_ENV = "DAILY_METRICS_MAX_INFLIGHT_DAYS"
+_DEFAULT_MAX_INFLIGHT_DAYS = 2
+# Cap on concurrent per-day commit reads while filling the 30-day lookback.
+_WINDOW_FILL_CONCURRENCY = 4
+
+
+def _resolve_read_concurrency(
+    concurrent_reads: bool | None, max_inflight_days: int | None
+) -> tuple[bool, int]:
+    """Resolve the read-concurrency mode from arguments, then the environment.
+
+    Sequential mode (``concurrent_reads=False``) always runs one day at a
+    time and issues reads one after another, matching the historical
+    behaviour.
+    """
+    if concurrent_reads is None:
+        raw = (os.getenv(_CONCURRENT_READS_ENV) or "").strip().lower()
+        concurrent_reads = raw not in {"0", "false", "no", "off"}
+    if max_inflight_days is None:
+        raw_days = os.getenv(_MAX_INFLIGHT_DAYS_ENV)
+        try:
+            max_inflight_days = (
+                int(raw_days) if raw_days else _DEFAULT_MAX_INFLIGHT_DAYS
+            )
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", _MAX_INFLIGHT_DAYS_ENV, raw_days)
+            max_inflight_days = _DEFAULT_MAX_INFLIGHT_DAYS
+    if not concurrent_reads:
+        return False, 1
+    return True, max(1, max_inflight_days)
+
+
+@dataclass
+class _DayInputs:
+    """Loader reads for one metrics day."""
+
+    commit_rows: list[Any]
+    pr_rows: list[Any]
+    review_rows: list[Any]
+    pipeline_rows: list[Any]
+    deployment_rows: list[Any]
+    testops_pipeline_rows: list[Any]
+    testops_job_rows: list[Any]
+    testops_suite_rows: list[Any]
+    testops_case_rows: list[Any]
+    coverage_rows: list[Any]
+    prior_coverage_rows: list[Any]
+    incident_rows: list[Any]
+    work_items: list[Any] = field(default_factory=list)
+    work_item_transitions: list[Any] = field(default_factory=list)
+    ai_attribution_rows: list[Any] = field(default_factory=list)
+
+
+async def _load_day_inputs(
+    loader: Any,
+    day: date,
+    *,
+    repo_id: uuid.UUID | None,
+    repo_name: str | None,
+    load_work_items: bool,
+    concurrent: bool,
+) -> _DayInputs:
+    """Issue every independent loader read for ``day``.
+
+    The reads share no state, so concurrent mode awaits them together; the
+    ClickHouse loader runs each query on its own per-thread client.
+    """
+    start, end = _utc_day_window(day)
+    h_start = datetime.combine(day - timedelta(days=29), time.min, tzinfo=timezone.utc)
+    prior_start = datetime.combine(
+        day - timedelta(days=30), time.min, tzinfo=timezone.utc
+    )
+
+    async def _empty_pair() -> tuple[list[Any], list[Any]]:
+        return [], []
+
+    async def _empty_list() -> list[Any]:
+        return []
+
+    reads = [
+        lambda: loader.load_git_rows(start, end, repo_id=repo_id, repo_name=repo_name),
+        lambda: loader.load_cicd_data(start, end, repo_id=repo_id, repo_name=repo_name),
+        lambda: loader.load_testops_pipeline_data(start, end, repo_id=repo_id),
+        lambda: loader.load_testops_test_data(h_start, end, repo_id=repo_id),
+        lambda: loader.load_testops_coverage_data(start, end, repo_id=repo_id),
+        lambda: loader.load_testops_coverage_data(prior_start, start, repo_id=repo_id),
+        lambda: loader.load_incidents(start, end, repo_id=repo_id, repo_name=repo_name),
+        lambda: (
+            loader.load_work_items(start, end, repo_id, repo_name)
+            if load_work_items
+            else _empty_pair()
+        ),
+        lambda: (
+            loader.load_ai_pr_attributions(start=start, end=end, repo_id=repo_id)
+            if hasattr(loader, "load_ai_pr_attributions")
+            else _empty_list()
+        ),
+    ]
+    with clickhouse_caller("daily_metrics.read"):
+        if concurrent:
+            results = await asyncio.gather(*(read() for read in reads))
+        else:
+            results = [await read() for read in reads]
+
+    (
+        (commit_rows, pr_rows, review_rows),
+        (pipeline_rows, deployment_rows),
+        (testops_pipeline_rows, testops_job_rows),
+        (testops_suite_rows, testops_case_rows),
+        coverage_rows,
+        prior_coverage_rows,
+        incident_rows,
+        (work_items, work_item_transitions),
+        ai_attribution_rows,
+    ) = results
+    return _DayInputs(
+        commit_rows=commit_rows,
+        pr_rows=pr_rows,
+        review_rows=review_rows,
+        pipeline_rows=pipeline_rows,
+        deployment_rows=deployment_rows,
+        testops_pipeline_rows=testops_pipeline_rows,
+        testops_job_rows=testops_job_rows,
+        testops_suite_rows=testops_suite_rows,
+        testops_case_rows=testops_case_rows,
+        coverage_rows=coverage_rows,
+        prior_coverage_rows=prior_coverage_rows,
+        incident_rows=incident_rows,
+        work_items=work_items,
+        work_item_transitions=work_item_transitions,
+        ai_attribution_rows=ai_attribution_rows,
+    )
+
+
+class _DayReadPipeline:
+    """Keeps a bounded window of day reads in flight ahead of the consumer.
+
+    ``get(day)`` returns the inputs for ``day`` (days must be requested in
+    order) and schedules reads for up to ``max_inflight_days - 1`` upcoming
+    days so their round-trips overlap the current day's compute and writes.
+    """
+
+    def __init__(
+        self,
+        days: list[date],
+        load: Callable[[date], Coroutine[Any, Any, _DayInputs]],
+        *,
+        max_inflight_days: int,
+    ) -> None:
+        self._days = days
+        self._load = load
+        self._max_inflight = max(1, max_inflight_days)
+        self._tasks: dict[date, asyncio.Task[_DayInputs]] = {}
+        self._next = 0
+
+    def _schedule_through(self, index: int) -> None:
+        while self._next < len(self._days) and self._next <= index:
+            d = self._days[self._next]
+            self._tasks[d] = asyncio.create_task(self._load(d))
+            self._next += 1
+
+    async def get(self, day: date) -> _DayInputs:
+        index = self._days.index(day)
+        self._schedule_through(index + self._max_inflight - 1)
+        return await self._tasks.pop(day)
+
+    async def aclose(self) -> None:
+        """Cancel reads that were prefetched but never consumed."""
+        pending = list(self._tasks.values())
+        self._tasks.clear()
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def run_daily_metrics_job(
     *,
     db_url: str | None = None,
@@ -738,6 +959,8 @@ async def run_daily_metrics_job(
     provider: str = "auto",
     org_id: str,
     skip_finalize: bool = False,
+    concurrent_reads: bool | None = None,
+    max_inflight_days: int | None = None,
 ) -> None:
     db_url = db_url or os.getenv("DATABASE_URI") or os.getenv("DATABASE_URL")
     if not db_url:
@@ -805,25 +1028,39 @@ async def run_daily_metrics_job(
     business_start = int(os.getenv("BUSINESS_HOURS_START", "9"))
     business_end = int(os.getenv("BUSINESS_HOURS_END", "17"))
 
-    daily_commit_cache: dict[date, list[Any]] = {}
-
-    async def _get_cached_commits_for_window(
-        window_start: date, window_end: date
-    ) -> list[Any]:
-        """Load commits for date range using per-day cache to avoid redundant fetches."""
-        result = []
-        current = window_start
-        while current <= window_end:
-            if current not in daily_commit_cache:
-                d_start = datetime.combine(current, time.min, tzinfo=timezone.utc)
-                d_end = d_start + timedelta(days=1)
-                rows, _, _ = await loader.load_git_rows(
-                    d_start, d_end, repo_id=repo_id, repo_name=repo_name
-                )
-                daily_commit_cache[current] = rows
-            result.extend(daily_commit_cache[current])
-            current += timedelta(days=1)
-        return result
+    # Columnar 30-day commit-stat window shared by the knowledge/quality/hotspot
+    # rollups. Each backfill day slides one day in and evicts days that fell
+    # out of the lookback, so a day's rows are loaded and encoded only once.
+    commit_window = CommitStatWindow()
+
+    concurrent_reads, max_inflight_days = _resolve_read_concurrency(
+        concurrent_reads, max_inflight_days
+    )
+    window_fill_limit = asyncio.Semaphore(
+        _WINDOW_FILL_CONCURRENCY if concurrent_reads else 1
+    )
+
+    async def _load_commit_day(current: date) -> list[Any]:
+        d_start, d_end = _utc_day_window(current)
+        async with window_fill_limit:
+            rows, _, _ = await loader.load_git_rows(
+                d_start, d_end, repo_id=repo_id, repo_name=repo_name
+            )
+        return rows
+
+    async def _slide_commit_window(window_start: date, window_end: date) -> None:
+        """Ensure every day in [window_start, window_end] is loaded, evict older."""
+        commit_window.evict_before(window_start)
+        missing = [
+            window_start + timedelta(days=i)
+            for i in range((window_end - window_start).days + 1)
+            if window_start + timedelta(days=i) not in commit_window
+        ]
+        if not missing:
+            return
+        loaded = await asyncio.gather(*(_load_commit_day(m) for m in missing))
+        for current, rows in zip(missing, loaded):
+            commit_window.add_day(current, rows)
 
     # Rolling buffer for pipeline stability (7-day window)
     pipeline_metrics_buffer: list[Any] = []
@@ -898,183 +1135,231 @@ async def run_daily_metrics_job(
                 )
                 linked_issue_resolver = None
 
-    for d in days:
-        logger.info("Computing metrics for day=%s", d.isoformat())
-        start, end = _utc_day_window(d)
-
-        commit_rows, pr_rows, review_rows = await loader.load_git_rows(
-            start, end, repo_id=repo_id, repo_name=repo_name
-        )
-        daily_commit_cache[d] = commit_rows
+    # Resolvers are fixed for the run, so each work item's team is resolved
+    # once and reused by every compute on every day.
+    attribution_engine = TeamAttributionEngine(
+        team_resolver,
+        project_key_resolver,
+        linked_issue_resolver,
+        team_attribution_context,
+    )
 
-        testops_loader: Any = loader
-        pipeline_rows, deployment_rows = await loader.load_cicd_data(
-            start, end, repo_id=repo_id, repo_name=repo_name
-        )
-        h_start_date = d - timedelta(days=29)
-        (
-            testops_pipeline_rows,
-            testops_job_rows,
-        ) = await testops_loader.load_testops_pipeline_data(start, end, repo_id=repo_id)
-        (
-            testops_suite_rows,
-            testops_case_rows,
-        ) = await testops_loader.load_testops_test_data(
-            datetime.combine(h_start_date, time.min, tzinfo=timezone.utc),
-            end,
+    # Day-bucketed cache for the overlapping 30-day testops lookbacks (suite
+    # results and prior coverage): each day slice is read once per run.
+    window_loader = WindowCachedTestOpsLoader(loader)
+    read_pipeline = _DayReadPipeline(
+        days,
+        lambda read_day: _load_day_inputs(
+            window_loader,
+            read_day,
             repo_id=repo_id,
-        )
-        coverage_rows = await testops_loader.load_testops_coverage_data(
-            start, end, repo_id=repo_id
-        )
-        prior_coverage_rows = await testops_loader.load_testops_coverage_data(
-            datetime.combine(d - timedelta(days=30), time.min, tzinfo=timezone.utc),
-            start,
-            repo_id=repo_id,
-        )
-        incident_rows = await loader.load_incidents(
-            start, end, repo_id=repo_id, repo_name=repo_name
-        )
-
-        h_commit_rows = await _get_cached_commits_for_window(h_start_date, d)
-
-        work_items: list[Any] = []
-        work_item_transitions: list[Any] = []
-        if load_work_items_enabled and load_work_items_from_db:
-            work_items, work_item_transitions = await loader.load_work_items(
-                start, end, repo_id, repo_name
-            )
-
-        mttr_by_repo: dict[uuid.UUID, float] = {}
-        bug_times: dict[uuid.UUID, list[float]] = {}
-        for item in work_items:
-            if item.type == "bug" and item.completed_at and item.started_at:
-                comp_dt = _to_utc(item.completed_at)
-                if start <= comp_dt < end:
-                    rid = getattr(item, "repo_id", None)
-                    if rid:
-                        bug_times.setdefault(rid, []).append(
-                            (comp_dt - _to_utc(item.started_at)).total_seconds()
-                            / 3600.0
-                        )
-        for rid, times in bug_times.items():
-            mttr_by_repo[rid] = sum(times) / len(times)
-
-        # Build active_repos from ALL data sources, not just commits.
-        # Repos with CI/CD or deployment data but no commits in the window
-        # were previously excluded, causing missing metrics (gh-377).
-        active_repos: set[uuid.UUID] = {r["repo_id"] for r in commit_rows}
-        active_repos |= {r["repo_id"] for r in pipeline_rows if "repo_id" in r}
-        active_repos |= {r["repo_id"] for r in deployment_rows if "repo_id" in r}
-        rework_ratio_by_repo: dict[uuid.UUID, float] = {}
-        single_owner_ratio_by_repo: dict[uuid.UUID, float] = {}
-        bus_factor_by_repo: dict[uuid.UUID, int] = {}
-        gini_by_repo: dict[uuid.UUID, float] = {}
-
-        all_file_metrics = []
-        for r_id in active_repos:
-            rework_ratio_by_repo[r_id] = compute_rework_churn_ratio(
-                repo_id=str(r_id), window_stats=h_commit_rows
-            )
-            single_owner_ratio_by_repo[r_id] = compute_single_owner_file_ratio(
-                repo_id=str(r_id), window_stats=h_commit_rows
-            )
-            bus_factor_by_repo[r_id] = compute_bus_factor(
-                repo_id=str(r_id), window_stats=h_commit_rows
+            repo_name=repo_name,
+            load_work_items=load_work_items_enabled and load_work_items_from_db,
+            concurrent=concurrent_reads,
+        ),
+        max_inflight_days=max_inflight_days,
+    )
+    try:
+        for d in days:
+            logger.info("Computing metrics for day=%s", d.isoformat())
+            start, end = _utc_day_window(d)
+
+            # The earliest window still needed is day d's prior-coverage
+            # lookback; prefetched days only need later slices.
+            window_loader.evict_before(d - timedelta(days=30))
+            inputs = await read_pipeline.get(d)
+            commit_rows = inputs.commit_rows
+            pr_rows = inputs.pr_rows
+            review_rows = inputs.review_rows
+            commit_window.add_day(d, commit_rows)
+
+            pipeline_rows = inputs.pipeline_rows
+            deployment_rows = inputs.deployment_rows
+            h_start_date = d - timedelta(days=29)
+            testops_pipeline_rows = inputs.testops_pipeline_rows
+            testops_job_rows = inputs.testops_job_rows
+            testops_suite_rows = inputs.testops_suite_rows
+            testops_case_rows = inputs.testops_case_rows
+            coverage_rows = inputs.coverage_rows
+            prior_coverage_rows = inputs.prior_coverage_rows
+            incident_rows = inputs.incident_rows
+
+            await _slide_commit_window(h_start_date, d)
+
+            work_items: list[Any] = inputs.work_items
+            work_item_transitions: list[Any] = inputs.work_item_transitions
+
+            mttr_by_repo: dict[uuid.UUID, float] = {}
+            bug_times: dict[uuid.UUID, list[float]] = {}
+            for item in work_items:
+                if item.type == "bug" and item.completed_at and item.started_at:
+                    comp_dt = _to_utc(item.completed_at)
+                    if start <= comp_dt < end:
+                        rid = getattr(item, "repo_id", None)
+                        if rid:
+                            bug_times.setdefault(rid, []).append(
+                                (comp_dt - _to_utc(item.started_at)).total_seconds()
+                                / 3600.0
+                            )
+            for rid, times in bug_times.items():
+                mttr_by_repo[rid] = sum(times) / len(times)
+
+            # Build active_repos from ALL data sources, not just commits.
+            # Repos with CI/CD or deployment data but no commits in the window
+            # were previously excluded, causing missing metrics (gh-377).
+            active_repos: set[uuid.UUID] = {r["repo_id"] for r in commit_rows}
+            active_repos |= {r["repo_id"] for r in pipeline_rows if "repo_id" in r}
+            active_repos |= {r["repo_id"] for r in deployment_rows if "repo_id" in r}
+            # One grouped pass per rollup over the columnar window instead of a
+            # full window scan per repo per metric. Active repos with no rows in
+            # the window keep the list helpers' empty-window defaults.
+            rework_by_window = compute_rework_churn_ratio_by_repo(commit_window)
+            single_owner_by_window = compute_single_owner_file_ratio_by_repo(
+                commit_window
             )
-            gini_by_repo[r_id] = compute_code_ownership_gini(
-                repo_id=str(r_id), window_stats=h_commit_rows
+            bus_factor_by_window = compute_bus_factor_by_repo(commit_window)
+            gini_by_window = compute_code_ownership_gini_by_repo(commit_window)
+            file_metrics_by_window = compute_file_hotspots_by_repo(
+                window=commit_window, day=d, computed_at=computed_at
             )
-            file_metrics = compute_file_hotspots(
-                repo_id=r_id,
+            rework_ratio_by_repo: dict[uuid.UUID, float] = {}
+            single_owner_ratio_by_repo: dict[uuid.UUID, float] = {}
+            bus_factor_by_repo: dict[uuid.UUID, int] = {}
+            gini_by_repo: dict[uuid.UUID, float] = {}
+
+            all_file_metrics = []
+            for r_id in active_repos:
+                rework_ratio_by_repo[r_id] = rework_by_window.get(r_id, 0.0)
+                single_owner_ratio_by_repo[r_id] = single_owner_by_window.get(r_id, 0.0)
+                bus_factor_by_repo[r_id] = bus_factor_by_window.get(r_id, 0)
+                gini_by_repo[r_id] = gini_by_window.get(r_id, 0.0)
+                all_file_metrics.extend(file_metrics_by_window.get(r_id, []))
+
+            # file_hotspot_daily (risk treemap + hotspot drilldown on /complexity)
+            # is computed live here by merging the 30d churn window with the latest
+            # complexity snapshot per file, so real OAuth orgs get data instead of
+            # only fixtures (CHAOS-2376).
+            #
+            # The risk-hotspot pass is NOT gated on active_repos: a repo's risk can
+            # come purely from static complexity (compute_file_risk_hotspots unions
+            # complexity-only files with churned files), and discovered repos can
+            # have complexity snapshots with zero same-day commits/pipelines/
+            # deployments -- common right after onboarding or on quiet-but-risky
+            # repos. Gating on active_repos there left /complexity empty/stale for
+            # those repos. Iterate over active_repos UNION all discovered repos so
+            # idle complexity-only repos still produce rows; compute_file_risk_
+            # hotspots returns [] when a repo has neither churn nor complexity, so
+            # this never fabricates rows for genuinely empty repos (CHAOS-2376
+            # round-4).
+            all_file_hotspots = []
+            churn_by_window = compute_file_churn_by_repo(commit_window)
+            hotspot_repos = _hotspot_repo_ids(active_repos, repo_names_by_id)
+            for r_id in hotspot_repos:
+                complexity_map = _load_complexity_map_for_repo(
+                    primary_sink=primary_sink,
+                    org_id=org_id,
+                    repo_id=r_id,
+                    day=d,
+                )
+                # Ownership concentration per file from git_blame (backfilled on
+                # onboarding) feeds blame_concentration so the /complexity
+                # Ownership-risk dimension is non-NULL for real orgs (CHAOS-2376).
+                blame_map = _load_blame_map_for_repo(
+                    primary_sink=primary_sink,
+                    org_id=org_id,
+                    repo_id=r_id,
+                )
+                file_hotspots = compute_file_risk_hotspots_from_churn(
+                    repo_id=r_id,
+                    day=d,
+                    churn_map=churn_by_window.get(r_id, {}),
+                    complexity_map=complexity_map,
+                    blame_map=blame_map,
+                    computed_at=computed_at,
+                )
+                all_file_hotspots.extend(file_hotspots)
+
+            result = compute_daily_metrics(
                 day=d,
-                window_stats=h_commit_rows,
+                commit_stat_rows=commit_rows,
+                pull_request_rows=pr_rows,
+                pull_request_review_rows=review_rows,
                 computed_at=computed_at,
+                include_commit_metrics=include_commit_metrics,
+                team_resolver=team_resolver,
+                repo_team_resolver=repo_team_resolver,
+                repo_names_by_id=repo_names_by_id,
+                identity_resolver=identity,
+                mttr_by_repo=mttr_by_repo,
+                rework_churn_ratio_by_repo=rework_ratio_by_repo,
+                single_owner_file_ratio_by_repo=single_owner_ratio_by_repo,
+                bus_factor_by_repo=bus_factor_by_repo,
+                code_ownership_gini_by_repo=gini_by_repo,
             )
-            all_file_metrics.extend(file_metrics)
-
-        # file_hotspot_daily (risk treemap + hotspot drilldown on /complexity)
-        # is computed live here by merging the 30d churn window with the latest
-        # complexity snapshot per file, so real OAuth orgs get data instead of
-        # only fixtures (CHAOS-2376).
-        #
-        # The risk-hotspot pass is NOT gated on active_repos: a repo's risk can
-        # come purely from static complexity (compute_file_risk_hotspots unions
-        # complexity-only files with churned files), and discovered repos can
-        # have complexity snapshots with zero same-day commits/pipelines/
-        # deployments -- common right after onboarding or on quiet-but-risky
-        # repos. Gating on active_repos there left /complexity empty/stale for
-        # those repos. Iterate over active_repos UNION all discovered repos so
-        # idle complexity-only repos still produce rows; compute_file_risk_
-        # hotspots returns [] when a repo has neither churn nor complexity, so
-        # this never fabricates rows for genuinely empty repos (CHAOS-2376
-        # round-4).
-        all_file_hotspots = []
-        hotspot_repos = _hotspot_repo_ids(active_repos, repo_names_by_id)
-        for r_id in hotspot_repos:
-            complexity_map = _load_complexity_map_for_repo(
-                primary_sink=primary_sink,
-                org_id=org_id,
-                repo_id=r_id,
-                day=d,
-            )
-            # Ownership concentration per file from git_blame (backfilled on
-            # onboarding) feeds blame_concentration so the /complexity
-            # Ownership-risk dimension is non-NULL for real orgs (CHAOS-2376).
-            blame_map = _load_blame_map_for_repo(
-                primary_sink=primary_sink,
-                org_id=org_id,
-                repo_id=r_id,
-            )
-            file_hotspots = compute_file_risk_hotspots(
-                repo_id=r_id,
+
+            team_metrics = compute_team_wellbeing_metrics_daily(
                 day=d,
-                window_stats=h_commit_rows,
-                complexity_map=complexity_map,
-                blame_map=blame_map,
+                commit_stat_rows=commit_rows,
+                team_resolver=team_resolver,
+                repo_team_resolver=repo_team_resolver,
+                repo_names_by_id=repo_names_by_id,
                 computed_at=computed_at,
+                business_timezone=business_tz,
+                business_hours_start=business_start,
+                business_hours_end=business_end,
             )
-            all_file_hotspots.extend(file_hotspots)
-
-        result = compute_daily_metrics(
-            day=d,
-            commit_stat_rows=commit_rows,
-            pull_request_rows=pr_rows,
-            pull_request_review_rows=review_rows,
-            computed_at=computed_at,
-            include_commit_metrics=include_commit_metrics,
-            team_resolver=team_resolver,
-            repo_team_resolver=repo_team_resolver,
-            repo_names_by_id=repo_names_by_id,
-            identity_resolver=identity,
-            mttr_by_repo=mttr_by_repo,
-            rework_churn_ratio_by_repo=rework_ratio_by_repo,
-            single_owner_file_ratio_by_repo=single_owner_ratio_by_repo,
-            bus_factor_by_repo=bus_factor_by_repo,
-            code_ownership_gini_by_repo=gini_by_repo,
-        )
 
-        team_metrics = compute_team_wellbeing_metrics_daily(
-            day=d,
-            commit_stat_rows=commit_rows,
-            team_resolver=team_resolver,
-            repo_team_resolver=repo_team_resolver,
-            repo_names_by_id=repo_names_by_id,
-            computed_at=computed_at,
-            business_timezone=business_tz,
-            business_hours_start=business_start,
-            business_hours_end=business_end,
-        )
-
-        wi_metrics: list[Any] = []
-        wi_user_metrics: list[Any] = []
-        wi_cycle_times: list[Any] = []
-        estimate_coverage_metrics: list[Any] = []
-        wi_team_attributions: list[Any] = []
-        wi_state_durations: list[Any] = []
-        if work_items:
-            wi_metrics, wi_user_metrics, wi_cycle_times = (
-                compute_work_item_metrics_daily(
+            wi_metrics: list[Any] = []
+            wi_user_metrics: list[Any] = []
+            wi_cycle_times: list[Any] = []
+            estimate_coverage_metrics: list[Any] = []
+            wi_team_attributions: list[Any] = []
+            wi_state_durations: list[Any] = []
+            if work_items:
+                # One index over the day's loaded window, shared by the
+                # metrics, estimate-coverage and state-duration computes.
+                timeline = WorkItemTimeline(work_items, work_item_transitions)
+                wi_metrics, wi_user_metrics, wi_cycle_times = (
+                    compute_work_item_metrics_daily(
+                        day=d,
+                        work_items=work_items,
+                        transitions=work_item_transitions,
+                        computed_at=computed_at,
+                        team_resolver=team_resolver,
+                        project_key_resolver=project_key_resolver,
+                        linked_issue_resolver=linked_issue_resolver,
+                        attribution_context=team_attribution_context,
+                        timeline=timeline,
+                        attribution_engine=attribution_engine,
+                    )
+                )
+                wi_team_attributions = compute_work_item_team_attributions(
+                    work_items=work_items,
+                    computed_at=computed_at,
+                    team_resolver=team_resolver,
+                    project_key_resolver=project_key_resolver,
+                    linked_issue_resolver=linked_issue_resolver,
+                    attribution_context=team_attribution_context,
+                    attribution_engine=attribution_engine,
+                )
+                estimate_coverage_metrics = compute_estimate_coverage_metrics_daily(
+                    day=d,
+                    work_items=work_items,
+                    computed_at=computed_at,
+                    team_resolver=team_resolver,
+                    project_key_resolver=project_key_resolver,
+                    linked_issue_resolver=linked_issue_resolver,
+                    attribution_context=team_attribution_context,
+                    timeline=timeline,
+                    attribution_engine=attribution_engine,
+                )
+                # CHAOS-2377: the state-duration rollup powers /metrics Flow Sankey +
+                # Flame and the Operating Review state-duration panel. The compute
+                # already exists (and is used by the fixtures runner + job_work_items)
+                # but was never invoked in the live scheduled daily job, so the table
+                # stayed empty for real orgs. Reuse the work_items / transitions
+                # already loaded for this day.
+                wi_state_durations = compute_work_item_state_durations_daily(
                     day=d,
                     work_items=work_items,
                     transitions=work_item_transitions,
@@ -1083,365 +1368,346 @@ async def run_daily_metrics_job(
                     project_key_resolver=project_key_resolver,
                     linked_issue_resolver=linked_issue_resolver,
                     attribution_context=team_attribution_context,
+                    timeline=timeline,
+                    attribution_engine=attribution_engine,
                 )
+
+            review_edges = compute_review_edges_daily(
+                day=d,
+                pull_request_rows=pr_rows,
+                pull_request_review_rows=review_rows,
+                computed_at=computed_at,
             )
-            wi_team_attributions = compute_work_item_team_attributions(
-                work_items=work_items,
+            cicd_metrics = compute_cicd_metrics_daily(
+                day=d, pipeline_runs=pipeline_rows, computed_at=computed_at
+            )
+            testops_pipeline_metrics = compute_pipeline_metrics_daily(
+                day=d,
+                pipeline_runs=testops_pipeline_rows,
+                job_runs=testops_job_rows,
                 computed_at=computed_at,
-                team_resolver=team_resolver,
-                project_key_resolver=project_key_resolver,
-                linked_issue_resolver=linked_issue_resolver,
-                attribution_context=team_attribution_context,
+                repo_team_resolver=repo_team_resolver,
+                repo_names_by_id=repo_names_by_id,
             )
-            estimate_coverage_metrics = compute_estimate_coverage_metrics_daily(
+            testops_test_metrics = compute_test_metrics_daily(
                 day=d,
-                work_items=work_items,
+                suite_results=testops_suite_rows,
+                case_results=testops_case_rows,
                 computed_at=computed_at,
-                team_resolver=team_resolver,
-                project_key_resolver=project_key_resolver,
-                linked_issue_resolver=linked_issue_resolver,
-                attribution_context=team_attribution_context,
+                repo_team_resolver=repo_team_resolver,
+                repo_names_by_id=repo_names_by_id,
             )
-            # CHAOS-2377: the state-duration rollup powers /metrics Flow Sankey +
-            # Flame and the Operating Review state-duration panel. The compute
-            # already exists (and is used by the fixtures runner + job_work_items)
-            # but was never invoked in the live scheduled daily job, so the table
-            # stayed empty for real orgs. Reuse the work_items / transitions
-            # already loaded for this day.
-            wi_state_durations = compute_work_item_state_durations_daily(
+            testops_coverage_metrics = compute_coverage_metrics_daily(
                 day=d,
-                work_items=work_items,
-                transitions=work_item_transitions,
+                snapshots=coverage_rows,
+                prior_snapshots=prior_coverage_rows,
                 computed_at=computed_at,
-                team_resolver=team_resolver,
-                project_key_resolver=project_key_resolver,
-                linked_issue_resolver=linked_issue_resolver,
-                attribution_context=team_attribution_context,
+                repo_team_resolver=repo_team_resolver,
+                repo_names_by_id=repo_names_by_id,
             )
-
-        review_edges = compute_review_edges_daily(
-            day=d,
-            pull_request_rows=pr_rows,
-            pull_request_review_rows=review_rows,
-            computed_at=computed_at,
-        )
-        cicd_metrics = compute_cicd_metrics_daily(
-            day=d, pipeline_runs=pipeline_rows, computed_at=computed_at
-        )
-        testops_pipeline_metrics = compute_pipeline_metrics_daily(
-            day=d,
-            pipeline_runs=testops_pipeline_rows,
-            job_runs=testops_job_rows,
-            computed_at=computed_at,
-            repo_team_resolver=repo_team_resolver,
-            repo_names_by_id=repo_names_by_id,
-        )
-        testops_test_metrics = compute_test_metrics_daily(
-            day=d,
-            suite_results=testops_suite_rows,
-            case_results=testops_case_rows,
-            computed_at=computed_at,
-            repo_team_resolver=repo_team_resolver,
-            repo_names_by_id=repo_names_by_id,
-        )
-        testops_coverage_metrics = compute_coverage_metrics_daily(
-            day=d,
-            snapshots=coverage_rows,
-            prior_snapshots=prior_coverage_rows,
-            computed_at=computed_at,
-            repo_team_resolver=repo_team_resolver,
-            repo_names_by_id=repo_names_by_id,
-        )
-        deploy_metrics = compute_deploy_metrics_daily(
-            day=d, deployments=deployment_rows, computed_at=computed_at
-        )
-        incident_metrics = compute_incident_metrics_daily(
-            day=d, incidents=incident_rows, computed_at=computed_at
-        )
-        ai_policy_events, ai_governance_coverage = build_governance_rows_for_day(
-            primary_sink, org_id=org_id, day=d
-        )
-        ai_attribution_rows = []
-        ai_loader: Any = loader
-        if hasattr(ai_loader, "load_ai_pr_attributions"):
-            ai_attribution_rows = await ai_loader.load_ai_pr_attributions(
+            deploy_metrics = compute_deploy_metrics_daily(
+                day=d, deployments=deployment_rows, computed_at=computed_at
+            )
+            incident_metrics = compute_incident_metrics_daily(
+                day=d, incidents=incident_rows, computed_at=computed_at
+            )
+            ai_policy_events, ai_governance_coverage = build_governance_rows_for_day(
+                primary_sink, org_id=org_id, day=d
+            )
+            ai_attribution_rows = inputs.ai_attribution_rows
+
+            # CHAOS-2187: extract AI workflow runs + Work Graph edges from today's
+            # PRs/reviews so ai_workflow_issue_edges, ai_workflow_artifact_edges,
+            # and work_graph_pr_review_outcome_edges are populated by ingestion.
+            # Infrastructure failures (ClickHouse query errors) propagate and fail
+            # the job: there is no persisted job-health table to record a partial
+            # day, and empty edge tables are indistinguishable from "no AI
+            # activity today" — swallowing here would be silent partial data.
+            # Row-local issues (malformed repo ids) are skipped inside the helper,
+            # mirroring the per-row handling in the pr_commit_stats build below.
+            (
+                ai_workflow_runs,
+                ai_workflow_artifact_edges,
+                ai_workflow_issue_edges,
+                ai_review_outcome_edges,
+                ai_pr_deployment_edges,
+                ai_deployment_incident_edges,
+            ) = _extract_ai_workflow_for_day(
+                primary_sink=primary_sink,
+                org_id=org_id,
                 start=start,
                 end=end,
                 repo_id=repo_id,
+                repo_provider_by_id=repo_provider_by_id,
             )
 
-        # CHAOS-2187: extract AI workflow runs + Work Graph edges from today's
-        # PRs/reviews so ai_workflow_issue_edges, ai_workflow_artifact_edges,
-        # and work_graph_pr_review_outcome_edges are populated by ingestion.
-        # Infrastructure failures (ClickHouse query errors) propagate and fail
-        # the job: there is no persisted job-health table to record a partial
-        # day, and empty edge tables are indistinguishable from "no AI
-        # activity today" — swallowing here would be silent partial data.
-        # Row-local issues (malformed repo ids) are skipped inside the helper,
-        # mirroring the per-row handling in the pr_commit_stats build below.
-        (
-            ai_workflow_runs,
-            ai_workflow_artifact_edges,
-            ai_workflow_issue_edges,
-            ai_review_outcome_edges,
-            ai_pr_deployment_edges,
-            ai_deployment_incident_edges,
-        ) = _extract_ai_workflow_for_day(
-            primary_sink=primary_sink,
-            org_id=org_id,
-            start=start,
-            end=end,
-            repo_id=repo_id,
-            repo_provider_by_id=repo_provider_by_id,
-        )
+            # Build pr_commit_stats: {(repo_id, pr_number) -> [{"file_path": ...}]} so that
+            # compute_ai_impact_metrics_daily can determine which PRs touched test files.
+            #
+            # Design notes (CHAOS-2183):
+            #  • We join work_graph_pr_commit with git_commit_stats rather than using the
+            #    day-scoped commit_rows — a PR merged today may have test commits from prior
+            #    days (window-mismatch false-gap bug).
+            #  • Query is bounded to today's in-window PR numbers (not all-time), so the
+            #    scan is proportional to the batch size, not the full table.
+            #  • LEFT JOIN ensures PRs whose commits have no file-stat rows still appear in
+            #    the result (they get file_path=NULL → has_test_change=False, a real gap).
+            #  • UUID parsing is per-row so one malformed row is skipped, not fatal.
+            #  • On any outer exception, pr_commit_stats stays None and ai_impact treats
+            #    test_gap as unavailable (None), preventing the 100%-inflation false alarm.
+            pr_commit_stats: dict[tuple[uuid.UUID, int], list[Any]] | None = None
+            try:
+                # Identify which PRs fall inside today's UTC window (mirrors the logic in
+                # compute_ai_impact_metrics_daily so the sets are consistent).
+                in_window_prs: set[tuple[str, int]] = set()
+                for pr in pr_rows:
+                    merged_at_raw = pr.get("merged_at")
+                    event_at = _to_utc(
+                        merged_at_raw if merged_at_raw is not None else pr["created_at"]
+                    )
+                    if start <= event_at < end:
+                        in_window_prs.add((str(pr["repo_id"]), int(pr["number"])))
 
-        # Build pr_commit_stats: {(repo_id, pr_number) -> [{"file_path": ...}]} so that
-        # compute_ai_impact_metrics_daily can determine which PRs touched test files.
-        #
-        # Design notes (CHAOS-2183):
-        #  • We join work_graph_pr_commit with git_commit_stats rather than using the
-        #    day-scoped commit_rows — a PR merged today may have test commits from prior
-        #    days (window-mismatch false-gap bug).
-        #  • Query is bounded to today's in-window PR numbers (not all-time), so the
-        #    scan is proportional to the batch size, not the full table.
-        #  • LEFT JOIN ensures PRs whose commits have no file-stat rows still appear in
-        #    the result (they get file_path=NULL → has_test_change=False, a real gap).
-        #  • UUID parsing is per-row so one malformed row is skipped, not fatal.
-        #  • On any outer exception, pr_commit_stats stays None and ai_impact treats
-        #    test_gap as unavailable (None), preventing the 100%-inflation false alarm.
-        pr_commit_stats: dict[tuple[uuid.UUID, int], list[Any]] | None = None
-        try:
-            # Identify which PRs fall inside today's UTC window (mirrors the logic in
-            # compute_ai_impact_metrics_daily so the sets are consistent).
-            in_window_prs: set[tuple[str, int]] = set()
-            for pr in pr_rows:
-                merged_at_raw = pr.get("merged_at")
-                event_at = _to_utc(
-                    merged_at_raw if merged_at_raw is not None else pr["created_at"]
-                )
-                if start <= event_at < end:
-                    in_window_prs.add((str(pr["repo_id"]), int(pr["number"])))
-
-            if in_window_prs:
-                # Scope to just today's PR numbers (+ optional repo filter).
-                pr_numbers: list[int] = list({pr_num for _, pr_num in in_window_prs})
-                pc_params: dict[str, Any] = {
-                    "org_id": org_id,
-                    "pr_numbers": pr_numbers,
-                }
-                pc_repo_filter = ""
-                if repo_id is not None:
-                    pc_params["repo_id"] = str(repo_id)
-                    pc_repo_filter = " AND p.repo_id = {repo_id:UUID}"
-
-                # LEFT JOIN so PRs with commits that have no file stats still appear
-                # (file_path=NULL → not a test path → has_test_change=False for that PR).
-                # commit_hash + committer_when (from git_commits, org-scoped) feed
-                # follow-up-commit derivation (CHAOS-2437); committer_when is
-                # de-duplicated per commit downstream so RMT version rows are
-                # harmless. git_commit_stats carries no org_id column, so its join
-                # stays on (repo_id, commit_hash) -- p is already org-scoped by the
-                # WHERE clause.
-                raw_link_rows = primary_sink.query_dicts(
-                    "SELECT p.repo_id, p.pr_number, p.commit_hash, p.evidence,"
-                    " c.committer_when, s.file_path"
-                    " FROM work_graph_pr_commit AS p"
-                    " LEFT JOIN git_commit_stats AS s"
-                    "   ON s.repo_id = p.repo_id AND s.commit_hash = p.commit_hash"
-                    " LEFT JOIN git_commits AS c"
-                    "   ON c.repo_id = p.repo_id AND c.hash = p.commit_hash"
-                    "   AND c.org_id = p.org_id"
-                    f" WHERE p.org_id = {{org_id:String}}{pc_repo_filter}"
-                    "   AND p.pr_number IN {pr_numbers:Array(UInt32)}",
-                    pc_params,
-                )
+                if in_window_prs:
+                    # Scope to just today's PR numbers (+ optional repo filter).
+                    pr_numbers: list[int] = list(
+                        {pr_num for _, pr_num in in_window_prs}
+                    )
+                    pc_params: dict[str, Any] = {
+                        "org_id": org_id,
+                        "pr_numbers": pr_numbers,
+                    }
+                    pc_repo_filter = ""
+                    if repo_id is not None:
+                        pc_params["repo_id"] = str(repo_id)
+                        pc_repo_filter = " AND p.repo_id = {repo_id:UUID}"
+
+                    # LEFT JOIN so PRs with commits that have no file stats still appear
+                    # (file_path=NULL → not a test path → has_test_change=False for that PR).
+                    # commit_hash + committer_when (from git_commits, org-scoped) feed
+                    # follow-up-commit derivation (CHAOS-2437); committer_when is
+                    # de-duplicated per commit downstream so RMT version rows are
+                    # harmless. git_commit_stats carries no org_id column, so its join
+                    # stays on (repo_id, commit_hash) -- p is already org-scoped by the
+                    # WHERE clause.
+                    raw_link_rows = primary_sink.query_dicts(
+                        "SELECT p.repo_id, p.pr_number, p.commit_hash, p.evidence,"
+                        " c.committer_when, s.file_path"
+                        " FROM work_graph_pr_commit AS p"
+                        " LEFT JOIN git_commit_stats AS s"
+                        "   ON s.repo_id = p.repo_id AND s.commit_hash = p.commit_hash"
+                        " LEFT JOIN git_commits AS c"
+                        "   ON c.repo_id = p.repo_id AND c.hash = p.commit_hash"
+                        "   AND c.org_id = p.org_id"
+                        f" WHERE p.org_id = {{org_id:String}}{pc_repo_filter}"
+                        "   AND p.pr_number IN {pr_numbers:Array(UInt32)}",
+                        pc_params,
+                    )
 
-                built: dict[tuple[uuid.UUID, int], list[Any]] = {}
-                for link in raw_link_rows:
-                    rid_str = str(link.get("repo_id") or "")
-                    pr_num_raw = link.get("pr_number")
-                    if not rid_str or pr_num_raw is None:
-                        continue
-                    pr_num = int(pr_num_raw)
-                    # Filter cross-repo collisions (pr_number is per-repo, not global).
-                    if (rid_str, pr_num) not in in_window_prs:
-                        continue
-                    try:
-                        rid = uuid.UUID(rid_str)
-                    except (ValueError, AttributeError):
-                        # One malformed row → skip it, don't abort the whole build.
-                        logger.debug(
-                            "Skipping malformed repo_id in work_graph_pr_commit: %r",
-                            rid_str,
+                    built: dict[tuple[uuid.UUID, int], list[Any]] = {}
+                    for link in raw_link_rows:
+                        rid_str = str(link.get("repo_id") or "")
+                        pr_num_raw = link.get("pr_number")
+                        if not rid_str or pr_num_raw is None:
+                            continue
+                        pr_num = int(pr_num_raw)
+                        # Filter cross-repo collisions (pr_number is per-repo, not global).
+                        if (rid_str, pr_num) not in in_window_prs:
+                            continue
+                        try:
+                            rid = uuid.UUID(rid_str)
+                        except (ValueError, AttributeError):
+                            # One malformed row → skip it, don't abort the whole build.
+                            logger.debug(
+                                "Skipping malformed repo_id in work_graph_pr_commit: %r",
+                                rid_str,
+                            )
+                            continue
+                        built.setdefault((rid, pr_num), []).append(
+                            {
+                                "file_path": link.get("file_path"),
+                                "commit_hash": link.get("commit_hash"),
+                                "committer_when": link.get("committer_when"),
+                                "evidence": link.get("evidence"),
+                            }
                         )
-                        continue
-                    built.setdefault((rid, pr_num), []).append(
-                        {
-                            "file_path": link.get("file_path"),
-                            "commit_hash": link.get("commit_hash"),
-                            "committer_when": link.get("committer_when"),
-                            "evidence": link.get("evidence"),
-                        }
-                    )
-                pr_commit_stats = built
-            else:
-                pr_commit_stats = {}
+                    pr_commit_stats = built
+                else:
+                    pr_commit_stats = {}
 
-        except Exception as exc:
-            logger.warning(
-                "pr_commit_stats build failed, test_gap_rate unavailable for day=%s: %s",
-                d,
-                exc,
+            except Exception as exc:
+                logger.warning(
+                    "pr_commit_stats build failed, test_gap_rate unavailable for day=%s: %s",
+                    d,
+                    exc,
+                )
+                # pr_commit_stats stays None → _test_changes_by_pr returns {} → every PR
+                # gets has_test_change=None → test_gap_rate=None (unavailable, not 100%).
+
+            ai_impact_metrics = compute_ai_impact_metrics_daily(
+                day=d,
+                org_id=org_id,
+                pull_request_rows=pr_rows,
+                pull_request_review_rows=review_rows,
+                ai_attribution_rows=ai_attribution_rows,
+                incident_rows=incident_rows,
+                commit_stat_rows=commit_rows,
+                computed_at=computed_at,
+                team_resolver=lambda _repo_id, repo_name, _identity: (
+                    repo_team_resolver.resolve(repo_name)
+                ),
+                repo_names_by_id=repo_names_by_id,
+                pr_commit_stats=pr_commit_stats,
             )
-            # pr_commit_stats stays None → _test_changes_by_pr returns {} → every PR
-            # gets has_test_change=None → test_gap_rate=None (unavailable, not 100%).
 
-        ai_impact_metrics = compute_ai_impact_metrics_daily(
-            day=d,
-            org_id=org_id,
-            pull_request_rows=pr_rows,
-            pull_request_review_rows=review_rows,
-            ai_attribution_rows=ai_attribution_rows,
-            incident_rows=incident_rows,
-            commit_stat_rows=commit_rows,
-            computed_at=computed_at,
-            team_resolver=lambda _repo_id, repo_name, _identity: (
-                repo_team_resolver.resolve(repo_name)
-            ),
-            repo_names_by_id=repo_names_by_id,
-            pr_commit_stats=pr_commit_stats,
-        )
+            for s in sinks:
+                s.write_repo_metrics(result.repo_metrics)
+                s.write_user_metrics(result.user_metrics)
+                if include_commit_metrics:
+                    s.write_commit_metrics(result.commit_metrics)
+                s.write_team_metrics(team_metrics)
+                if wi_metrics:
+                    s.write_work_item_metrics(wi_metrics)
+                if estimate_coverage_metrics:
+                    s.write_estimate_coverage_metrics(estimate_coverage_metrics)
+                if wi_user_metrics:
+                    s.write_work_item_user_metrics(wi_user_metrics)
+                if wi_cycle_times:
+                    s.write_work_item_cycle_times(wi_cycle_times)
+                if wi_team_attributions and hasattr(
+                    s, "write_work_item_team_attributions"
+                ):
+                    s.write_work_item_team_attributions(wi_team_attributions)
+                if wi_state_durations:
+                    s.write_work_item_state_durations(wi_state_durations)
+                s.write_review_edges(review_edges)
+                s.write_cicd_metrics(cicd_metrics)
+                s.write_testops_pipeline_metrics(testops_pipeline_metrics)
+                s.write_testops_test_metrics(testops_test_metrics)
+                s.write_testops_coverage_metrics(testops_coverage_metrics)
+                s.write_deploy_metrics(deploy_metrics)
+                s.write_incident_metrics(incident_metrics)
+                s.write_ai_policy_events(ai_policy_events)
+                s.write_ai_governance_coverage_daily(ai_governance_coverage)
+                if ai_impact_metrics:
+                    s.write_ai_impact_metrics(ai_impact_metrics)
+                if ai_workflow_runs and hasattr(s, "write_ai_workflow_runs"):
+                    s.write_ai_workflow_runs(ai_workflow_runs)
+                if ai_workflow_artifact_edges and hasattr(
+                    s, "write_ai_workflow_artifact_edges"
+                ):
+                    s.write_ai_workflow_artifact_edges(ai_workflow_artifact_edges)
+                if ai_workflow_issue_edges and hasattr(
+                    s, "write_ai_workflow_issue_edges"
+                ):
+                    s.write_ai_workflow_issue_edges(ai_workflow_issue_edges)
+                if ai_review_outcome_edges and hasattr(
+                    s, "write_work_graph_pr_review_outcome_edges"
+                ):
+                    s.write_work_graph_pr_review_outcome_edges(ai_review_outcome_edges)
+                if ai_pr_deployment_edges and hasattr(
+                    s, "write_work_graph_pr_deployment_edges"
+                ):
+                    s.write_work_graph_pr_deployment_edges(ai_pr_deployment_edges)
+                if ai_deployment_incident_edges and hasattr(
+                    s, "write_work_graph_deployment_incident_edges"
+                ):
+                    s.write_work_graph_deployment_incident_edges(
+                        ai_deployment_incident_edges
+                    )
+                if all_file_metrics:
+                    s.write_file_metrics(all_file_metrics)
+                if all_file_hotspots and hasattr(s, "write_file_hotspot_daily"):
+                    s.write_file_hotspot_daily(all_file_hotspots)
+
+            _write_compounding_risk_for_day(
+                sinks=sinks,
+                primary_sink=primary_sink,
+                day=d,
+                org_id=org_id,
+                repo_metrics_rows=result.repo_metrics,
+                computed_at=computed_at,
+                repo_names_by_id=repo_names_by_id,
+                repo_team_resolver=repo_team_resolver,
+            )
 
-        for s in sinks:
-            s.write_repo_metrics(result.repo_metrics)
-            s.write_user_metrics(result.user_metrics)
-            if include_commit_metrics:
-                s.write_commit_metrics(result.commit_metrics)
-            s.write_team_metrics(team_metrics)
-            if wi_metrics:
-                s.write_work_item_metrics(wi_metrics)
-            if estimate_coverage_metrics:
-                s.write_estimate_coverage_metrics(estimate_coverage_metrics)
-            if wi_user_metrics:
-                s.write_work_item_user_metrics(wi_user_metrics)
-            if wi_cycle_times:
-                s.write_work_item_cycle_times(wi_cycle_times)
-            if wi_team_attributions and hasattr(s, "write_work_item_team_attributions"):
-                s.write_work_item_team_attributions(wi_team_attributions)
-            if wi_state_durations:
-                s.write_work_item_state_durations(wi_state_durations)
-            s.write_review_edges(review_edges)
-            s.write_cicd_metrics(cicd_metrics)
-            s.write_testops_pipeline_metrics(testops_pipeline_metrics)
-            s.write_testops_test_metrics(testops_test_metrics)
-            s.write_testops_coverage_metrics(testops_coverage_metrics)
-            s.write_deploy_metrics(deploy_metrics)
-            s.write_incident_metrics(incident_metrics)
-            s.write_ai_policy_events(ai_policy_events)
-            s.write_ai_governance_coverage_daily(ai_governance_coverage)
-            if ai_impact_metrics:
-                s.write_ai_impact_metrics(ai_impact_metrics)
-            if ai_workflow_runs and hasattr(s, "write_ai_workflow_runs"):
-                s.write_ai_workflow_runs(ai_workflow_runs)
-            if ai_workflow_artifact_edges and hasattr(
-                s, "write_ai_workflow_artifact_edges"
-            ):
-                s.write_ai_workflow_artifact_edges(ai_workflow_artifact_edges)
-            if ai_workflow_issue_edges and hasattr(s, "write_ai_workflow_issue_edges"):
-                s.write_ai_workflow_issue_edges(ai_workflow_issue_edges)
-            if ai_review_outcome_edges and hasattr(
-                s, "write_work_graph_pr_review_outcome_edges"
-            ):
-                s.write_work_graph_pr_review_outcome_edges(ai_review_outcome_edges)
-            if ai_pr_deployment_edges and hasattr(
-                s, "write_work_graph_pr_deployment_edges"
-            ):
-                s.write_work_graph_pr_deployment_edges(ai_pr_deployment_edges)
-            if ai_deployment_incident_edges and hasattr(
-                s, "write_work_graph_deployment_incident_edges"
-            ):
-                s.write_work_graph_deployment_incident_edges(
-                    ai_deployment_incident_edges
+            # TestOps risk metrics (release confidence, quality drag, pipeline stability)
+            release_conf = compute_release_confidence(
+                day=d,
+                pipeline_metrics=testops_pipeline_metrics,
+                test_metrics=testops_test_metrics,
+                coverage_metrics=testops_coverage_metrics,
+                computed_at=computed_at,
+            )
+            quality_drag = compute_quality_drag(
+                day=d,
+                pipeline_metrics=testops_pipeline_metrics,
+                test_metrics=testops_test_metrics,
+                computed_at=computed_at,
+            )
+            pipeline_metrics_buffer.extend(testops_pipeline_metrics)
+            # Keep only the last 7 days of pipeline metrics
+            cutoff = d - timedelta(days=6)
+            pipeline_metrics_buffer = [
+                m for m in pipeline_metrics_buffer if m.day >= cutoff
+            ]
+            pipeline_stab = compute_pipeline_stability(
+                day=d,
+                pipeline_metrics_7d=pipeline_metrics_buffer,
+                computed_at=computed_at,
+            )
+            for s in sinks:
+                if release_conf:
+                    s.write_release_confidence(release_conf)
+                if quality_drag:
+                    s.write_quality_drag(quality_drag)
+                if pipeline_stab:
+                    s.write_pipeline_stability(pipeline_stab)
+
+            # Benchmarking (baselines, maturity, anomalies, period comparisons,
+            # correlations, insights). Reads from ClickHouse via the sink.
+            for s in sinks:
+                try:
+                    run_benchmarking_for_day(
+                        s,
+                        as_of_day=d,
+                        computed_at=computed_at,
+                        org_id=org_id,
+                    )
+                except Exception as exc:
+                    logger.warning("Benchmarking run failed for day=%s: %s", d, exc)
+
+            if not skip_finalize:
+                ic_metrics = compute_ic_metrics_daily(
+                    git_metrics=result.user_metrics,
+                    wi_metrics=wi_user_metrics,
+                    team_map=load_team_map(),
                 )
-            if all_file_metrics:
-                s.write_file_metrics(all_file_metrics)
-            if all_file_hotspots and hasattr(s, "write_file_hotspot_daily"):
-                s.write_file_hotspot_daily(all_file_hotspots)
-
-        _write_compounding_risk_for_day(
-            sinks=sinks,
-            primary_sink=primary_sink,
-            day=d,
-            org_id=org_id,
-            repo_metrics_rows=result.repo_metrics,
-            computed_at=computed_at,
-            repo_names_by_id=repo_names_by_id,
-            repo_team_resolver=repo_team_resolver,
-        )
+                for s in sinks:
+                    s.write_user_metrics(ic_metrics)
 
-        # TestOps risk metrics (release confidence, quality drag, pipeline stability)
-        release_conf = compute_release_confidence(
-            day=d,
-            pipeline_metrics=testops_pipeline_metrics,
-            test_metrics=testops_test_metrics,
-            coverage_metrics=testops_coverage_metrics,
-            computed_at=computed_at,
-        )
-        quality_drag = compute_quality_drag(
-            day=d,
-            pipeline_metrics=testops_pipeline_metrics,
-            test_metrics=testops_test_metrics,
-            computed_at=computed_at,
-        )
-        pipeline_metrics_buffer.extend(testops_pipeline_metrics)
-        # Keep only the last 7 days of pipeline metrics
-        cutoff = d - timedelta(days=6)
-        pipeline_metrics_buffer = [
-            m for m in pipeline_metrics_buffer if m.day >= cutoff
-        ]
-        pipeline_stab = compute_pipeline_stability(
-            day=d,
-            pipeline_metrics_7d=pipeline_metrics_buffer,
-            computed_at=computed_at,
-        )
-        for s in sinks:
-            if release_conf:
-                s.write_release_confidence(release_conf)
-            if quality_drag:
-                s.write_quality_drag(quality_drag)
-            if pipeline_stab:
-                s.write_pipeline_stability(pipeline_stab)
-
-        # Benchmarking (baselines, maturity, anomalies, period comparisons,
-        # correlations, insights). Reads from ClickHouse via the sink.
-        for s in sinks:
-            try:
-                run_benchmarking_for_day(
-                    s,
+                rolling_stats = await loader.load_user_metrics_rolling_30d(as_of=d)
+                ic_landscape = compute_ic_landscape_rolling(
                     as_of_day=d,
-                    computed_at=computed_at,
-                    org_id=org_id,
+                    rolling_stats=rolling_stats,
+                    team_map=load_team_map(),
                 )
-            except Exception as exc:
-                logger.warning("Benchmarking run failed for day=%s: %s", d, exc)
-
-        if not skip_finalize:
-            ic_metrics = compute_ic_metrics_daily(
-                git_metrics=result.user_metrics,
-                wi_metrics=wi_user_metrics,
-                team_map=load_team_map(),
+                for s in sinks:
+                    s.write_ic_landscape_rolling(ic_landscape)
+    finally:
+        await read_pipeline.aclose()
+        window_loader.log_stats()
+        if attribution_engine.resolutions:
+            logger.info(
+                "Team attribution: %d items resolved, %d lookups served from cache",
+                attribution_engine.resolutions,
+                attribution_engine.hits,
             )
-            for s in sinks:
-                s.write_user_metrics(ic_metrics)
-
-            rolling_stats = await loader.load_user_metrics_rolling_30d(as_of=d)
-            ic_landscape = compute_ic_landscape_rolling(
-                as_of_day=d,
-                rolling_stats=rolling_stats,
-                team_map=load_team_map(),
+            record_work_item_team_attributions(
+                job="daily",
+                resolved=attribution_engine.resolutions,
+                cached=attribution_engine.hits,
             )
-            for s in sinks:
-                s.write_ic_landscape_rolling(ic_landscape)
 
 
 async def run_daily_metrics_finalize(
@@ -1567,7 +1833,8 @@ async def run_daily_metrics_finalize(
     for s in sinks_list:
         s.write_user_metrics(ic_metrics)
 
-    rolling_stats = await loader.load_user_metrics_rolling_30d(as_of=day)
+    with clickhouse_caller("daily_metrics.finalize"):
+        rolling_stats = await loader.load_user_metrics_rolling_30d(as_of=day)
     ic_landscape = compute_ic_landscape_rolling(
         as_of_day=day,
         rolling_stats=rolling_stats,
@@ -6,7 +6,7 @@ import json
 import logging
 import re
 import uuid
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import replace
@@ -19,6 +19,7 @@ from dev_health_ops.metrics.compute_work_item_state_durations import (
     compute_work_item_state_durations_daily,
 )
 from dev_health_ops.metrics.compute_work_items import (
+    TeamAttributionEngine,
     build_linked_issue_team_resolver,
     compute_estimate_coverage_metrics_daily,
     compute_work_item_metrics_daily,
@@ -30,14 +31,16 @@ from dev_health_ops.metrics.job_daily import (
 )
 from dev_health_ops.metrics.loaders.base import to_dataclass
 from dev_health_ops.metrics.loaders.clickhouse import ClickHouseDataLoader
+from dev_health_ops.metrics.prometheus import record_work_item_team_attributions
 from dev_health_ops.metrics.sinks.clickhouse import ClickHouseMetricsSink
 from dev_health_ops.metrics.work_item_engine_destinations import (
     compute_work_item_engine_destinations_daily,
 )
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
 from dev_health_ops.metrics.work_items import (
     fetch_github_project_v2_items,
     fetch_gitlab_work_items,
-    fetch_jira_work_items_with_extras,
+    iter_jira_work_items_with_extras,
     parse_github_projects_v2_env,
 )
 from dev_health_ops.models.work_items import WorkItem
@@ -366,20 +369,151 @@ def read_work_item_partial_observations(
     return read_partial_observations(exc)
 
 
-def _merge_github_project_v2_rows(
-    repository_items: list[WorkItem],
-    repository_transitions: list[Any],
-    project_items: list[WorkItem],
-    project_transitions: list[Any] | None,
-) -> tuple[list[WorkItem], list[Any]]:
-    """Preserve the active producer's ordered last-wins/append composition."""
-    by_id = {item.work_item_id: item for item in repository_items}
-    for item in project_items:
-        by_id[item.work_item_id] = item
-    return list(by_id.values()), [
-        *repository_transitions,
-        *(project_transitions or []),
-    ]
+# Rows buffered per raw work-item table before they are written to the sinks.
+WORK_ITEM_SYNC_CHUNK_SIZE = 5000
+
+# Raw row kinds buffered by ``_WorkItemSyncStream``, in flush order.
+_RAW_WORK_ITEM_KINDS = (
+    "work_items",
+    "transitions",
+    "dependencies",
+    "reopen_events",
+    "interactions",
+    "sprints",
+    "ai_attributions",
+)
+
+
+class _WorkItemSyncStream:
+    """Stamp raw work-item rows and write them in fixed-size chunks.
+
+    Provider batches are stamped with the run's ``org_id`` and handed to
+    ``write`` once ``chunk_size`` rows of a kind are pending, so a full
+    resync never holds
+    the instance's comments, reopen events, sprints or descriptions at once.
+    Only what the per-day computes and the linked-issue resolver read is
+    retained: one summary per work item (without its description), the
+    status transitions and the dependency edges.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str, list[Any]], None],
+        *,
+        org_id: str,
+        chunk_size: int = WORK_ITEM_SYNC_CHUNK_SIZE,
+    ) -> None:
+        self._write_rows = write
+        self._org_id = org_id
+        self._chunk_size = max(1, chunk_size)
+        self._pending: dict[str, list[Any]] = {
+            kind: [] for kind in _RAW_WORK_ITEM_KINDS
+        }
+        self.counts: dict[str, int] = dict.fromkeys(self._pending, 0)
+        self._summaries: dict[str, WorkItem] = {}
+        self._pinned_ids: set[str] = set()
+        self.transitions: list[Any] = []
+        self.dependencies: dict[tuple[str, str, str], Any] = {}
+
+    @property
+    def work_items(self) -> list[WorkItem]:
+        return list(self._summaries.values())
+
+    def add_batch(self, batch: Any) -> None:
+        self.add(
+            work_items=batch.work_items,
+            transitions=batch.status_transitions,
+            dependencies=batch.dependencies,
+            reopen_events=batch.reopen_events,
+            interactions=batch.interactions,
+            sprints=batch.sprints,
+            ai_attributions=getattr(batch, "ai_attributions", ()),
+        )
+
+    def add(
+        self,
+        *,
+        work_items: Iterable[Any] = (),
+        transitions: Iterable[Any] = (),
+        dependencies: Iterable[Any] = (),
+        reopen_events: Iterable[Any] = (),
+        interactions: Iterable[Any] = (),
+        sprints: Iterable[Any] = (),
+        ai_attributions: Iterable[Any] = (),
+        pin: bool = False,
+    ) -> None:
+        """Queue rows for writing; full chunks are written immediately.
+
+        ``pin`` makes these work items win over rows with the same id added
+        later (GitHub Projects v2 cards over their repository issues).
+        """
+        for item in work_items:
+            if item.work_item_id in self._pinned_ids:
+                continue
+            if pin:
+                self._pinned_ids.add(item.work_item_id)
+            item = self._stamp(item)
+            self._summaries[item.work_item_id] = (
+                replace(item, description=None)
+                if getattr(item, "description", None)
+                else item
+            )
+            self._queue("work_items", item)
+        for tr in transitions:
+            tr = self._stamp(tr)
+            self.transitions.append(tr)
+            self._queue("transitions", tr)
+        for dep in dependencies:
+            dep = self._stamp(dep)
+            self.dependencies[
+                (
+                    dep.source_work_item_id,
+                    dep.target_work_item_id,
+                    dep.relationship_type,
+                )
+            ] = dep
+            self._queue("dependencies", dep)
+        for kind, rows in (
+            ("reopen_events", reopen_events),
+            ("interactions", interactions),
+            ("sprints", sprints),
+        ):
+            for row in rows:
+                self._queue(kind, self._stamp(row))
+        # AI attribution records are written as the provider emitted them.
+        for record in ai_attributions:
+            self._queue("ai_attributions", record)
+
+    def flush(self) -> None:
+        """Write every pending row and log what the run wrote."""
+        for kind in _RAW_WORK_ITEM_KINDS:
+            self._write(kind)
+        for kind, count in self.counts.items():
+            if count:
+                logger.info("Work item sync: wrote %d %s", count, kind)
+
+    def _stamp(self, row: Any) -> Any:
+        # Leaving rows at the dataclass default ("") collapses unrelated
+        # organizations onto the same ClickHouse tenant key and makes
+        # org-scoped reads miss the data.
+        if self._org_id and hasattr(row, "org_id"):
+            return replace(row, org_id=self._org_id)
+        return row
+
+    def _queue(self, kind: str, row: Any) -> None:
+        pending = self._pending[kind]
+        pending.append(row)
+        self.counts[kind] += 1
+        if len(pending) >= self._chunk_size:
+            self._write(kind)
+
+    def _write(self, kind: str) -> None:
+        rows = self._pending[kind]
+        if not rows:
+            return
+        self._pending[kind] = []
+        logger.debug("Work item sync: writing %d %s", len(rows), kind)
+        self._write_rows(kind, rows)
 
 
 def run_work_items_sync_job(
@@ -403,11 +537,14 @@ def run_work_items_sync_job(
     fetch_milestones: bool | None = None,
     comments_limit: int | None = None,
     require_source: bool = False,
+    chunk_size: int = WORK_ITEM_SYNC_CHUNK_SIZE,
 ) -> dict[str, Any] | None:
     """
     Sync work tracking facts from provider APIs and write derived work item tables.
 
     This job exists so `metrics daily` does not need to call external APIs.
+    Raw provider rows are written in ``chunk_size`` slices as they are
+    fetched, so memory stays bounded on large instances.
     """
     if not db_url:
         raise ValueError("Database URI is required (pass --db or set DATABASE_URI).")
@@ -822,29 +959,53 @@ def run_work_items_sync_job(
                 )
             )
 
-        work_items: list[Any] = []
-        transitions: list[Any] = []
-        dependencies: list[Any] = []
-        reopen_events: list[Any] = []
-        interactions: list[Any] = []
-        sprints: list[Any] = []
-        # AI attribution records collected across all provider batches.
-        # Populated when providers emit attribution signals (GitHub PRs).
-        # Written to sink via write_ai_attribution() at end of sync loop.
-        ai_attributions: list[Any] = []
+        def _write_raw_rows(kind: str, rows: list[Any]) -> None:
+            for s in sinks:
+                if kind == "work_items" and hasattr(s, "write_work_items"):
+                    _ensure_unit_lease_for_write("work_items")
+                    s.write_work_items(rows)
+                elif kind == "transitions" and hasattr(
+                    s, "write_work_item_transitions"
+                ):
+                    _ensure_unit_lease_for_write("work_item_transitions")
+                    s.write_work_item_transitions(rows)
+                elif kind == "dependencies" and hasattr(
+                    s, "write_work_item_dependencies"
+                ):
+                    _ensure_unit_lease_for_write("work_item_dependencies")
+                    s.write_work_item_dependencies(rows)
+                elif kind == "reopen_events" and hasattr(
+                    s, "write_work_item_reopen_events"
+                ):
+                    _ensure_unit_lease_for_write("work_item_reopen_events")
+                    s.write_work_item_reopen_events(rows)
+                elif kind == "interactions" and hasattr(
+                    s, "write_work_item_interactions"
+                ):
+                    _ensure_unit_lease_for_write("work_item_interactions")
+                    s.write_work_item_interactions(rows)
+                elif kind == "sprints" and hasattr(s, "write_sprints"):
+                    _ensure_unit_lease_for_write("sprints")
+                    s.write_sprints(rows)
+                # AI attribution records — gated with hasattr so this is a
+                # no-op until CHAOS-1579 (storage-worker) lands
+                # write_ai_attribution.
+                elif kind == "ai_attributions" and hasattr(s, "write_ai_attribution"):
+                    _ensure_unit_lease_for_write("ai_attribution")
+                    s.write_ai_attribution(rows)
+
+        # Provider rows are stamped and written in chunks as they arrive; only
+        # item summaries, transitions and dependency edges are kept for the
+        # derived tables below.
+        stream = _WorkItemSyncStream(
+            _write_raw_rows, org_id=org_id, chunk_size=chunk_size
+        )
 
         if "jira" in provider_set:
             jira_client = _build_jira_work_client(
                 org_id=org_id, credentials=credentials
             )
-            (
-                items,
-                tr,
-                dep,
-                reopen,
-                interaction,
-                sprint_rows,
-            ) = fetch_jira_work_items_with_extras(
+            for batch in iter_jira_work_items_with_extras(
                 since=since_dt,
                 until=until_dt,
                 status_mapping=status_mapping,
@@ -856,14 +1017,9 @@ def run_work_items_sync_job(
                 use_env_query_options=not bool(org_id or credentials),
                 reference_sprints=reference_sprints,
                 reference_sink=primary_sink,
-            )
+            ):
+                stream.add_batch(batch)
             provider_usage_observations.extend(drain_provider_usage(jira_client))
-            work_items.extend(items)
-            transitions.extend(tr)
-            dependencies.extend(dep)
-            reopen_events.extend(reopen)
-            interactions.extend(interaction)
-            sprints.extend(sprint_rows)
 
         if "github" in provider_set:
             from uuid import UUID
@@ -882,6 +1038,17 @@ def run_work_items_sync_job(
                     org_id=org_id, credentials=credentials
                 ),
             )
+            projects = parse_github_projects_v2_env()
+            if projects:
+                # Project cards win over the repository rows of the same item,
+                # so they are ingested first and pin their ids.
+                proj_items, proj_tr = fetch_github_project_v2_items(
+                    projects=projects,
+                    status_mapping=status_mapping,
+                    identity=identity,
+                )
+                stream.add(work_items=proj_items, transitions=proj_tr, pin=True)
+
             github_org_id = UUID(org_id) if org_id else None
             for discovered_repo in discovered_repos:
                 if discovered_repo.source != "github":
@@ -903,13 +1070,7 @@ def run_work_items_sync_job(
                     ),
                 )
                 for batch in github_provider.iter_ingest(ctx):
-                    work_items.extend(batch.work_items)
-                    transitions.extend(batch.status_transitions)
-                    dependencies.extend(batch.dependencies)
-                    reopen_events.extend(batch.reopen_events)
-                    interactions.extend(batch.interactions)
-                    sprints.extend(batch.sprints)
-                    ai_attributions.extend(batch.ai_attributions)
+                    stream.add_batch(batch)
                     raw_github_usage = batch.observations.get("github_usage")
                     if isinstance(raw_github_usage, list):
                         github_usage_observations.extend(
@@ -923,17 +1084,6 @@ def run_work_items_sync_job(
                             if isinstance(item, dict)
                         )
 
-            projects = parse_github_projects_v2_env()
-            if projects:
-                proj_items, proj_tr = fetch_github_project_v2_items(
-                    projects=projects,
-                    status_mapping=status_mapping,
-                    identity=identity,
-                )
-                work_items, transitions = _merge_github_project_v2_rows(
-                    work_items, transitions, proj_items, proj_tr
-                )
-
         if "gitlab" in provider_set:
             # gl_token/gl_url were already resolved above (before the
             # CHAOS-2801 instance-scoping block) so the unit's authenticated
@@ -951,9 +1101,6 @@ def run_work_items_sync_job(
                 usage_observations=provider_usage_observations,
                 id_scoped_project_ids=gitlab_id_scoped_project_ids,
             )
-            work_items.extend(items)
-            transitions.extend(tr)
-            ai_attributions.extend(gl_ai_attributions)
             # Extract dependency edges (same-provider refs + cross-provider
             # external keys) from each GitLab work item's description so GitLab
             # items participate in linked-issue team inheritance like GitHub.
@@ -962,14 +1109,23 @@ def run_work_items_sync_job(
                 extract_gitlab_dependencies,
             )
 
-            for wi in items:
-                dependencies.extend(
-                    extract_gitlab_dependencies(
-                        work_item_id=wi.work_item_id,
-                        issue=wi,
-                        project_full_path=(wi.project_id or wi.project_key or ""),
-                    )
+            gitlab_dependencies = [
+                dep
+                for wi in items
+                for dep in extract_gitlab_dependencies(
+                    work_item_id=wi.work_item_id,
+                    issue=wi,
+                    project_full_path=(wi.project_id or wi.project_key or ""),
                 )
+            ]
+            stream.add(
+                work_items=items,
+                transitions=tr,
+                dependencies=gitlab_dependencies,
+                ai_attributions=gl_ai_attributions,
+            )
+            # Release the full rows; the stream keeps what the computes need.
+            del items, tr, gl_ai_attributions, gitlab_dependencies
 
         if "synthetic" in provider_set:
             from dev_health_ops.metrics.work_items import fetch_synthetic_work_items
@@ -977,8 +1133,7 @@ def run_work_items_sync_job(
             items, tr = fetch_synthetic_work_items(
                 repos=discovered_repos, days=backfill_days + 1
             )
-            work_items.extend(items)
-            transitions.extend(tr)
+            stream.add(work_items=items, transitions=tr)
 
         if "linear" in provider_set:
             from dev_health_ops.providers.base import IngestionContext, IngestionWindow
@@ -1022,17 +1177,9 @@ def run_work_items_sync_job(
                     or batch.dependencies
                 ):
                     linear_page_count += 1
-                work_items.extend(batch.work_items)
-                transitions.extend(batch.status_transitions)
-                reopen_events.extend(batch.reopen_events)
-                interactions.extend(batch.interactions)
-                sprints.extend(batch.sprints)
                 # PR/MR -> issue edges from Linear attachments (links to source
                 # control) drive linked-issue team inheritance for the PR/MR.
-                dependencies.extend(batch.dependencies)
-                # Collect any AI attribution records in the batch.
-                if hasattr(batch, "ai_attributions"):
-                    ai_attributions.extend(batch.ai_attributions)
+                stream.add_batch(batch)
                 fetched_items += len(batch.work_items)
                 fetched_transitions += len(batch.status_transitions)
                 fetched_sprints += len(batch.sprints)
@@ -1044,100 +1191,15 @@ def run_work_items_sync_job(
             )
             provider_usage_observations.extend(drain_provider_usage(linear_client))
 
+        stream.flush()
+        work_items = stream.work_items
+        transitions = stream.transitions
         logger.info(
             "Work item sync: fetched %d items and %d transitions (providers=%s)",
-            len(work_items),
-            len(transitions),
+            stream.counts["work_items"],
+            stream.counts["transitions"],
             sorted(provider_set),
         )
-        providers_label = ",".join(sorted(provider_set))
-        if dependencies:
-            logger.info(
-                "%s: extracted %d dependency edges", providers_label, len(dependencies)
-            )
-        if reopen_events:
-            logger.info(
-                "%s: extracted %d reopen events", providers_label, len(reopen_events)
-            )
-        if interactions:
-            logger.info(
-                "%s: extracted %d interaction events",
-                providers_label,
-                len(interactions),
-            )
-        if sprints:
-            logger.info(
-                "%s: extracted %d sprint records", providers_label, len(sprints)
-            )
-
-        # Stamp org_id on every tenant-partitioned raw work-item row before
-        # writing to sinks. Leaving reopen, interaction, or sprint rows at the
-        # dataclass default ("") collapses unrelated organizations onto the
-        # same ClickHouse tenant key and makes org-scoped reads miss the data.
-        if org_id:
-            work_items = [
-                replace(wi, org_id=org_id) if hasattr(wi, "org_id") else wi
-                for wi in work_items
-            ]
-            transitions = [
-                replace(t, org_id=org_id) if hasattr(t, "org_id") else t
-                for t in transitions
-            ]
-            dependencies = [
-                replace(dep, org_id=org_id) if hasattr(dep, "org_id") else dep
-                for dep in dependencies
-            ]
-            reopen_events = [
-                replace(event, org_id=org_id) if hasattr(event, "org_id") else event
-                for event in reopen_events
-            ]
-            interactions = [
-                replace(event, org_id=org_id) if hasattr(event, "org_id") else event
-                for event in interactions
-            ]
-            sprints = [
-                replace(sprint, org_id=org_id) if hasattr(sprint, "org_id") else sprint
-                for sprint in sprints
-            ]
-
-        # Write raw work items and transitions to sinks
-        for s in sinks:
-            if hasattr(s, "write_work_items") and work_items:
-                _ensure_unit_lease_for_write("work_items")
-                logger.info(
-                    "Writing %d work items to %s", len(work_items), type(s).__name__
-                )
-                s.write_work_items(work_items)
-            if hasattr(s, "write_work_item_transitions") and transitions:
-                _ensure_unit_lease_for_write("work_item_transitions")
-                logger.info(
-                    "Writing %d transitions to %s", len(transitions), type(s).__name__
-                )
-                s.write_work_item_transitions(transitions)
-
-        for s in sinks:
-            if dependencies and hasattr(s, "write_work_item_dependencies"):
-                _ensure_unit_lease_for_write("work_item_dependencies")
-                s.write_work_item_dependencies(dependencies)
-            if reopen_events and hasattr(s, "write_work_item_reopen_events"):
-                _ensure_unit_lease_for_write("work_item_reopen_events")
-                s.write_work_item_reopen_events(reopen_events)
-            if interactions and hasattr(s, "write_work_item_interactions"):
-                _ensure_unit_lease_for_write("work_item_interactions")
-                s.write_work_item_interactions(interactions)
-            if sprints and hasattr(s, "write_sprints"):
-                _ensure_unit_lease_for_write("sprints")
-                s.write_sprints(sprints)
-            # AI attribution records — gated with hasattr so this is a no-op
-            # until CHAOS-1579 (storage-worker) lands write_ai_attribution.
-            if ai_attributions and hasattr(s, "write_ai_attribution"):
-                _ensure_unit_lease_for_write("ai_attribution")
-                logger.info(
-                    "Writing %d AI attribution records to %s",
-                    len(ai_attributions),
-                    type(s).__name__,
-                )
-                s.write_ai_attribution(ai_attributions)
 
         # Build the linked-issue team-inheritance fallback once for the whole
         # run: PRs/MRs that map to no team of their own inherit the team of an
@@ -1152,15 +1214,7 @@ def run_work_items_sync_job(
         # those are loaded from ClickHouse — bounded to the referenced targets,
         # never a full-history scan — and unioned with the fresh items.
         donor_by_id: dict[str, Any] = {}
-        merged_deps: dict[tuple[str, str, str], Any] = {}
-        for dep in dependencies:
-            merged_deps[
-                (
-                    dep.source_work_item_id,
-                    dep.target_work_item_id,
-                    dep.relationship_type,
-                )
-            ] = dep
+        merged_deps = stream.dependencies
 
         # Load only the donor items referenced by a fresh edge target — bounded
         # to the linked surface, under tenant scope, degrading gracefully.
@@ -1227,6 +1281,30 @@ def run_work_items_sync_job(
             attribution_context=team_attribution_context,
         )
 
+        # Index once so each day only visits the items active on it, and
+        # resolve each item's team once for every day and compute.
+        timeline = WorkItemTimeline(work_items, transitions)
+        attribution_engine = TeamAttributionEngine(
+            team_resolver,
+            pk_resolver,
+            linked_issue_resolver,
+            team_attribution_context,
+        )
+        # Candidate rows are not day-scoped, so they are written once per run.
+        wi_team_attributions = (
+            compute_work_item_team_attributions(
+                work_items=work_items,
+                computed_at=computed_at,
+                attribution_engine=attribution_engine,
+            )
+            if days
+            else []
+        )
+        if wi_team_attributions:
+            for s in sinks:
+                if hasattr(s, "write_work_item_team_attributions"):
+                    _ensure_unit_lease_for_write("work_item_team_attributions")
+                    s.write_work_item_team_attributions(wi_team_attributions)
         for d in days:
             wi_metrics, wi_user_metrics, wi_cycle_times = (
                 compute_work_item_metrics_daily(
@@ -1238,6 +1316,8 @@ def run_work_items_sync_job(
                     project_key_resolver=pk_resolver,
                     linked_issue_resolver=linked_issue_resolver,
                     attribution_context=team_attribution_context,
+                    timeline=timeline,
+                    attribution_engine=attribution_engine,
                 )
             )
             estimate_coverage_metrics = compute_estimate_coverage_metrics_daily(
@@ -1248,14 +1328,8 @@ def run_work_items_sync_job(
                 project_key_resolver=pk_resolver,
                 linked_issue_resolver=linked_issue_resolver,
                 attribution_context=team_attribution_context,
-            )
-            wi_team_attributions = compute_work_item_team_attributions(
-                work_items=work_items,
-                computed_at=computed_at,
-                team_resolver=team_resolver,
-                project_key_resolver=pk_resolver,
-                linked_issue_resolver=linked_issue_resolver,
-                attribution_context=team_attribution_context,
+                timeline=timeline,
+                attribution_engine=attribution_engine,
             )
             wi_state_durations = compute_work_item_state_durations_daily(
                 day=d,
@@ -1266,6 +1340,8 @@ def run_work_items_sync_job(
                 project_key_resolver=pk_resolver,
                 linked_issue_resolver=linked_issue_resolver,
                 attribution_context=team_attribution_context,
+                timeline=timeline,
+                attribution_engine=attribution_engine,
             )
 
             (
@@ -1283,6 +1359,8 @@ def run_work_items_sync_job(
                 project_key_resolver=pk_resolver,
                 linked_issue_resolver=linked_issue_resolver,
                 attribution_context=team_attribution_context,
+                timeline=timeline,
+                attribution_engine=attribution_engine,
             )
 
             for s in sinks:
@@ -1300,11 +1378,6 @@ def run_work_items_sync_job(
                 if wi_cycle_times:
                     _ensure_unit_lease_for_write("work_item_cycle_times")
                     s.write_work_item_cycle_times(wi_cycle_times)
-                if wi_team_attributions and hasattr(
-                    s, "write_work_item_team_attributions"
-                ):
-                    _ensure_unit_lease_for_write("work_item_team_attributions")
-                    s.write_work_item_team_attributions(wi_team_attributions)
                 if wi_state_durations:
                     _ensure_unit_lease_for_write("work_item_state_durations_daily")
                     s.write_work_item_state_durations(wi_state_durations)
@@ -1321,6 +1394,16 @@ def run_work_items_sync_job(
                 if hasattr(s, "write_investment_metrics") and investment_metrics_rows:
                     _ensure_unit_lease_for_write("investment_metrics_daily")
                     s.write_investment_metrics(investment_metrics_rows)
+        logger.info(
+            "Team attribution: %d items resolved, %d lookups served from cache",
+            attribution_engine.resolutions,
+            attribution_engine.hits,
+        )
+        record_work_item_team_attributions(
+            job="work_items",
+            resolved=attribution_engine.resolutions,
+            cached=attribution_engine.hits,
+        )
         observations = _build_work_item_observations(
             github_usage=github_usage_observations,
             provider_usage=provider_usage_observations,
@@ -3,6 +3,9 @@ from __future__ import annotations
 import uuid
 from collections import defaultdict
 
+import numpy as np
+
+from dev_health_ops.metrics.commit_window import CommitStatWindow, group_by_repo
 from dev_health_ops.metrics.schemas import CommitStatRow
 
 
@@ -110,3 +113,54 @@ def compute_code_ownership_gini(
 
     # Clamp to [0, 1] just in case of float precision issues
     return max(0.0, min(1.0, gini))
+
+
+def compute_bus_factor_by_repo(
+    window: CommitStatWindow,
+    threshold_percent: float = 0.5,
+) -> dict[uuid.UUID, int]:
+    """
+    Bus factor for every repo in ``window`` in one grouped pass.
+
+    Result-identical to calling ``compute_bus_factor`` per repo over the
+    window's rows; repos absent from the window are absent from the result.
+    """
+    rollup = window.author_churn()
+    results: dict[uuid.UUID, int] = {}
+    for repo_code, idx in group_by_repo(rollup.repo):
+        churns = np.sort(rollup.churn[idx])[::-1]
+        total_churn = int(churns.sum())
+        if total_churn == 0:
+            results[window.repo_id(repo_code)] = 0
+            continue
+        reached = np.flatnonzero(np.cumsum(churns) >= total_churn * threshold_percent)
+        results[window.repo_id(repo_code)] = (
+            int(reached[0]) + 1 if reached.size else int(churns.size)
+        )
+    return results
+
+
+def compute_code_ownership_gini_by_repo(
+    window: CommitStatWindow,
+) -> dict[uuid.UUID, float]:
+    """
+    Ownership Gini for every repo in ``window`` in one grouped pass.
+
+    Result-identical to calling ``compute_code_ownership_gini`` per repo.
+    """
+    rollup = window.author_churn()
+    results: dict[uuid.UUID, float] = {}
+    for repo_code, idx in group_by_repo(rollup.repo):
+        churns = np.sort(rollup.churn[idx][rollup.churn[idx] > 0])
+        n = int(churns.size)
+        if n == 0:
+            results[window.repo_id(repo_code)] = 0.0
+            continue
+        numerator = int(np.dot(np.arange(1, n + 1, dtype=np.int64), churns))
+        denominator = n * int(churns.sum())
+        if denominator == 0:
+            results[window.repo_id(repo_code)] = 0.0
+            continue
+        gini = (2 * numerator) / denominator - (n + 1) / n
+        results[window.repo_id(repo_code)] = max(0.0, min(1.0, gini))
+    return results
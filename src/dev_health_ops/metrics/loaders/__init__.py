@@ -22,6 +22,11 @@ from dev_health_ops.metrics.loaders.validation import (
     validate_rows,
     validate_typed_dict,
 )
+from dev_health_ops.metrics.loaders.window_cache import (
+    DayWindowCache,
+    WindowCachedTestOpsLoader,
+    WindowCacheStats,
+)
 
 __all__ = [
     "DataLoader",
@@ -35,4 +40,7 @@ __all__ = [
     "validate_rows",
     "validate_or_raise",
     "validate_typed_dict",
+    "DayWindowCache",
+    "WindowCachedTestOpsLoader",
+    "WindowCacheStats",
 ]
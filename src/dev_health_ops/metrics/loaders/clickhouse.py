@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import date, datetime, timedelta, timezone
@@ -163,9 +164,13 @@ class ClickHouseDataLoader(AIImpactClickHouseLoader, DataLoader):
         {org_filter}
         """
 
-        commit_dicts = await _clickhouse_query_dicts(self.client, commit_query, params)
-        pr_dicts = await _clickhouse_query_dicts(self.client, pr_query, params)
-        review_dicts = await _clickhouse_query_dicts(self.client, review_query, params)
+        # Independent reads: query_dicts runs each on its own per-thread
+        # client, so the three round-trips overlap instead of serializing.
+        commit_dicts, pr_dicts, review_dicts = await asyncio.gather(
+            _clickhouse_query_dicts(self.client, commit_query, params),
+            _clickhouse_query_dicts(self.client, pr_query, params),
+            _clickhouse_query_dicts(self.client, review_query, params),
+        )
 
         commit_rows: list[CommitStatRow] = []
         for r in commit_dicts:
@@ -264,8 +269,10 @@ class ClickHouseDataLoader(AIImpactClickHouseLoader, DataLoader):
         {org_filter}
         """
 
-        item_dicts = await _clickhouse_query_dicts(self.client, item_query, params)
-        trans_dicts = await _clickhouse_query_dicts(self.client, trans_query, params)
+        item_dicts, trans_dicts = await asyncio.gather(
+            _clickhouse_query_dicts(self.client, item_query, params),
+            _clickhouse_query_dicts(self.client, trans_query, params),
+        )
 
         items = [to_dataclass(WorkItem, d) for d in item_dicts]
         transitions = [to_dataclass(WorkItemStatusTransition, t) for t in trans_dicts]
@@ -650,8 +657,10 @@ class ClickHouseDataLoader(AIImpactClickHouseLoader, DataLoader):
         {org_filter}
         """
 
-        pipes_dicts = await _clickhouse_query_dicts(self.client, pipe_query, params)
-        deploys_dicts = await _clickhouse_query_dicts(self.client, deploy_query, params)
+        pipes_dicts, deploys_dicts = await asyncio.gather(
+            _clickhouse_query_dicts(self.client, pipe_query, params),
+            _clickhouse_query_dicts(self.client, deploy_query, params),
+        )
 
         # ClickHouse dicts can be directly cast if they match keys
         pipes: list[PipelineRunRow] = [dict(p) for p in pipes_dicts]  # type: ignore
@@ -760,10 +769,10 @@ class ClickHouseDataLoader(AIImpactClickHouseLoader, DataLoader):
         {self._org_filter(alias="p")}
         """
 
-        pipeline_dicts = await _clickhouse_query_dicts(
-            self.client, pipeline_query, params
+        pipeline_dicts, job_dicts = await asyncio.gather(
+            _clickhouse_query_dicts(self.client, pipeline_query, params),
+            _clickhouse_query_dicts(self.client, job_query, params),
         )
-        job_dicts = await _clickhouse_query_dicts(self.client, job_query, params)
         return (
             [cast(PipelineRunExtendedRow, dict(row)) for row in pipeline_dicts],
             [cast(JobRunRow, dict(row)) for row in job_dicts],
@@ -843,8 +852,10 @@ class ClickHouseDataLoader(AIImpactClickHouseLoader, DataLoader):
         {self._org_filter(alias="s")}
         """
 
-        suite_dicts = await _clickhouse_query_dicts(self.client, suite_query, params)
-        case_dicts = await _clickhouse_query_dicts(self.client, case_query, params)
+        suite_dicts, case_dicts = await asyncio.gather(
+            _clickhouse_query_dicts(self.client, suite_query, params),
+            _clickhouse_query_dicts(self.client, case_query, params),
+        )
         return (
             [cast(TestSuiteResultRow, dict(row)) for row in suite_dicts],
             [cast(TestCaseResultRow, dict(row)) for row in case_dicts],
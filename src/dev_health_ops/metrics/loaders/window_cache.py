@@ -0,0 +1,184 @@
+"""Day-bucketed window cache for overlapping loader lookbacks.
+
+A daily-metrics backfill asks for the same rolling windows over and over: the
+30-day test-suite window ending on each day and the 30-day prior-coverage
+window before it. Re-reading the full window every day reads each row about
+30 times over a 60-day backfill. ``DayWindowCache`` loads each UTC day slice of
+a table once, serves any day-aligned ``[start, end)`` window by concatenating
+the cached slices, and evicts slices once no remaining window can need them.
+
+Slices are only valid for loaders whose filter is a plain ``>= start AND <
+end`` range on a single timestamp, so the union of day slices equals the
+window query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SliceLoader = Callable[[datetime, datetime, Any], Awaitable[tuple[list[Any], ...]]]
+
+
+@dataclass
+class WindowCacheStats:
+    """Slice-level counters for one cached table."""
+
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    uncached_windows: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _aligned_day(value: datetime) -> date | None:
+    """The UTC date of ``value`` when it falls exactly on midnight UTC."""
+    utc = value.astimezone(timezone.utc) if value.tzinfo else value
+    if utc.time() != time.min:
+        return None
+    return utc.date()
+
+
+def _failed(task: asyncio.Task[Any]) -> bool:
+    """True once ``task`` was cancelled or raised, so its slice is refetched."""
+    # ``exception()`` raises CancelledError on a cancelled task.
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+
+class DayWindowCache:
+    """Serves day-aligned windows of one table from per-day cached slices.
+
+    Each slice is loaded at most once per scope (concurrent requests for the
+    same slice share one in-flight load). Windows whose bounds are not on UTC
+    midnight bypass the cache and are loaded directly.
+    """
+
+    def __init__(self, name: str, load_slice: SliceLoader) -> None:
+        self._load_slice = load_slice
+        self._slices: dict[
+            tuple[Hashable, date], asyncio.Task[tuple[list[Any], ...]]
+        ] = {}
+        self.stats = WindowCacheStats(name=name)
+
+    async def window(
+        self, start: datetime, end: datetime, scope: Hashable = None
+    ) -> tuple[list[Any], ...]:
+        first = _aligned_day(start)
+        stop = _aligned_day(end)
+        if first is None or stop is None or stop <= first:
+            self.stats.uncached_windows += 1
+            return await self._load_slice(start, end, scope)
+
+        days = [first + timedelta(days=i) for i in range((stop - first).days)]
+        parts = await asyncio.gather(*(self._slice(day, scope) for day in days))
+        merged: list[list[Any]] = [[] for _ in parts[0]]
+        for slice_parts in parts:
+            for column, rows in zip(merged, slice_parts):
+                column.extend(rows)
+        return tuple(merged)
+
+    def _slice(self, day: date, scope: Hashable) -> asyncio.Task[tuple[list[Any], ...]]:
+        key = (scope, day)
+        task = self._slices.get(key)
+        if task is not None and not _failed(task):
+            self.stats.hits += 1
+            return task
+        self.stats.misses += 1
+        start = _day_start(day)
+        task = asyncio.ensure_future(
+            self._load_slice(start, start + timedelta(days=1), scope)
+        )
+        self._slices[key] = task
+        return task
+
+    def evict_before(self, day: date) -> int:
+        """Drop cached slices older than ``day`` for every scope."""
+        stale = [key for key in self._slices if key[1] < day]
+        for key in stale:
+            task = self._slices.pop(key)
+            if not task.done():
+                task.cancel()
+        self.stats.evictions += len(stale)
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._slices)
+
+
+class WindowCachedTestOpsLoader:
+    """Wraps a metrics loader so testops window reads go through day caches.
+
+    ``load_testops_test_data`` and ``load_testops_coverage_data`` are served
+    from ``DayWindowCache`` instances keyed by ``repo_id``; every other
+    attribute is delegated to the wrapped loader unchanged.
+    """
+
+    def __init__(self, loader: Any) -> None:
+        self._loader = loader
+        self.test_data = DayWindowCache("testops_test_data", self._load_test_slice)
+        self.coverage = DayWindowCache(
+            "testops_coverage_data", self._load_coverage_slice
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    async def _load_test_slice(
+        self, start: datetime, end: datetime, repo_id: Any
+    ) -> tuple[list[Any], ...]:
+        return tuple(
+            await self._loader.load_testops_test_data(start, end, repo_id=repo_id)
+        )
+
+    async def _load_coverage_slice(
+        self, start: datetime, end: datetime, repo_id: Any
+    ) -> tuple[list[Any], ...]:
+        rows = await self._loader.load_testops_coverage_data(
+            start, end, repo_id=repo_id
+        )
+        return (rows,)
+
+    async def load_testops_test_data(
+        self, start: datetime, end: datetime, repo_id: uuid.UUID | None
+    ) -> tuple[list[Any], list[Any]]:
+        suites, cases = await self.test_data.window(start, end, repo_id)
+        return suites, cases
+
+    async def load_testops_coverage_data(
+        self, start: datetime, end: datetime, repo_id: uuid.UUID | None
+    ) -> list[Any]:
+        (rows,) = await self.coverage.window(start, end, repo_id)
+        return rows
+
+    def evict_before(self, day: date) -> None:
+        self.test_data.evict_before(day)
+        self.coverage.evict_before(day)
+
+    def log_stats(self) -> None:
+        for stats in (self.test_data.stats, self.coverage.stats):
+            logger.info(
+                "Loader window cache %s: hits=%d misses=%d hit_ratio=%.2f "
+                "evictions=%d uncached_windows=%d",
+                stats.name,
+                stats.hits,
+                stats.misses,
+                stats.hit_ratio,
+                stats.evictions,
+                stats.uncached_windows,
+            )
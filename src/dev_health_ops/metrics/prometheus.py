@@ -2,7 +2,8 @@
 
 Defines application-level counters, histograms, and gauges for:
   - Celery task execution
-  - ClickHouse query latency
+  - Sync scheduler tick cost and dispatch lag
+  - ClickHouse query latency and API client pool usage
   - LLM API calls (OpenAI / Anthropic)
   - GitHub API calls (requests by endpoint/status, rate limit remaining)
 
@@ -98,6 +99,38 @@ if _PROMETHEUS_AVAILABLE:
         ["result"],
     )
 
+    # ---------------------------------------------------------------------------
+    # Sync scheduler metrics
+    # ---------------------------------------------------------------------------
+    SYNC_SCHEDULER_TICK_DURATION_SECONDS = _prometheus_client_module.Histogram(
+        "devhealth_sync_scheduler_tick_duration_seconds",
+        "dispatch_scheduled_syncs tick duration, by selection mode (scan or due_index)",
+        ["mode"],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    )
+
+    SYNC_SCHEDULER_EVALUATED_CONFIGS = _prometheus_client_module.Gauge(
+        "devhealth_sync_scheduler_evaluated_configs",
+        "Sync configs evaluated by the most recent scheduler tick",
+        ["mode"],
+    )
+
+    SYNC_SCHEDULER_OLDEST_DUE_LAG_SECONDS = _prometheus_client_module.Gauge(
+        "devhealth_sync_scheduler_oldest_due_lag_seconds",
+        "How far past its indexed next_due_at the oldest config selected by the "
+        "most recent due_index tick was. A value that keeps growing means the "
+        "batch size cannot keep up with the beat interval.",
+        ["mode"],
+    )
+
+    SYNC_SCHEDULER_DISPATCH_LAG_SECONDS = _prometheus_client_module.Histogram(
+        "devhealth_sync_scheduler_dispatch_lag_seconds",
+        "Seconds between the cron occurrence a sync config became due at and "
+        "the tick that dispatched it",
+        ["mode"],
+        buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 900.0, 3600.0),
+    )
+
     # ---------------------------------------------------------------------------
     # ClickHouse metrics
     # ---------------------------------------------------------------------------
@@ -114,6 +147,45 @@ if _PROMETHEUS_AVAILABLE:
         ["query_type", "status"],
     )
 
+    CLICKHOUSE_CALLER_QUERY_SECONDS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_clickhouse_caller_query_seconds_total",
+        "Cumulative ClickHouse query time by calling resolver, job stage or "
+        "Celery task",
+        ["caller", "query_type"],
+    )
+
+    CLICKHOUSE_QUERY_ROWS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_clickhouse_query_rows_total",
+        "ClickHouse rows by caller. kind is result (returned to the client), "
+        "read (scanned by the server) or written.",
+        ["caller", "query_type", "kind"],
+    )
+
+    CLICKHOUSE_QUERY_BYTES_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_clickhouse_query_bytes_total",
+        "ClickHouse bytes read or written by the server, by caller.",
+        ["caller", "query_type", "kind"],
+    )
+
+    CLICKHOUSE_POOL_CHECKOUTS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_clickhouse_pool_checkouts_total",
+        "API ClickHouse client pool checkouts by result (reused, created, timeout)",
+        ["result"],
+    )
+
+    CLICKHOUSE_POOL_CLOSED_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_clickhouse_pool_closed_total",
+        "API ClickHouse pooled clients closed, by reason (idle, max_lifetime, "
+        "unhealthy, error, shutdown)",
+        ["reason"],
+    )
+
+    CLICKHOUSE_POOL_CLIENTS = _prometheus_client_module.Gauge(
+        "devhealth_clickhouse_pool_clients",
+        "API ClickHouse pooled clients currently idle or checked out",
+        ["state"],
+    )
+
     # ---------------------------------------------------------------------------
     # LLM metrics
     # ---------------------------------------------------------------------------
@@ -338,13 +410,61 @@ if _PROMETHEUS_AVAILABLE:
         ["provider"],
     )
 
+    # ---------------------------------------------------------------------------
+    # API auth cache
+    # ---------------------------------------------------------------------------
+    AUTH_CACHE_LOOKUPS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_auth_cache_lookups_total",
+        "Authenticated-principal and org-membership cache lookups on the API "
+        "request path. result is hit_local, hit_shared, miss, or bypass "
+        "(token not cacheable, or the shared tier unavailable).",
+        ["cache", "result"],
+    )
+    AUTH_CACHE_INVALIDATIONS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_auth_cache_invalidations_total",
+        "Per-user auth cache generation bumps, by the event that caused them.",
+        ["reason"],
+    )
+    ENTITLEMENT_CACHE_LOOKUPS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_entitlement_cache_lookups_total",
+        "Org entitlement snapshot lookups. result is hit_local, hit_shared, "
+        "miss, or bypass (shared tier unavailable).",
+        ["result"],
+    )
+    ENTITLEMENT_CACHE_INVALIDATIONS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_entitlement_cache_invalidations_total",
+        "Org entitlement generation bumps, by the kind of write that caused "
+        "them. scope=global for feature-flag changes that affect every org.",
+        ["reason", "scope"],
+    )
+
+    # ---------------------------------------------------------------------------
+    # Work item metrics jobs
+    # ---------------------------------------------------------------------------
+    WORK_ITEM_TEAM_ATTRIBUTIONS_TOTAL = _prometheus_client_module.Counter(
+        "devhealth_work_item_team_attributions_total",
+        "Work item team attribution lookups per metrics job. result is "
+        "resolved (attribution cascade ran) or cached (run-scoped reuse).",
+        ["job", "result"],
+    )
+
 else:
     # Graceful no-ops when prometheus_client is unavailable
     CELERY_TASKS_TOTAL = _noop_counter()
     CELERY_TASK_DURATION_SECONDS = _noop_histogram()
     REPORT_RUN_LEASE_EXPIRED_TOTAL = _noop_counter()
+    SYNC_SCHEDULER_TICK_DURATION_SECONDS = _noop_histogram()
+    SYNC_SCHEDULER_EVALUATED_CONFIGS = _noop_gauge()
+    SYNC_SCHEDULER_OLDEST_DUE_LAG_SECONDS = _noop_gauge()
+    SYNC_SCHEDULER_DISPATCH_LAG_SECONDS = _noop_histogram()
     CLICKHOUSE_QUERY_DURATION_SECONDS = _noop_histogram()
     CLICKHOUSE_QUERIES_TOTAL = _noop_counter()
+    CLICKHOUSE_CALLER_QUERY_SECONDS_TOTAL = _noop_counter()
+    CLICKHOUSE_QUERY_ROWS_TOTAL = _noop_counter()
+    CLICKHOUSE_QUERY_BYTES_TOTAL = _noop_counter()
+    CLICKHOUSE_POOL_CHECKOUTS_TOTAL = _noop_counter()
+    CLICKHOUSE_POOL_CLOSED_TOTAL = _noop_counter()
+    CLICKHOUSE_POOL_CLIENTS = _noop_gauge()
     LLM_REQUESTS_TOTAL = _noop_counter()
     LLM_TOKENS_TOTAL = _noop_counter()
     LLM_REQUEST_DURATION_SECONDS = _noop_histogram()
@@ -371,6 +491,11 @@ else:
     ASK_DEV_RETENTION_SWEEP_LAST_SUCCESS_TIMESTAMP = _noop_gauge()
     RECOMMENDATIONS_READINESS_GATE_FAIL_OPEN_TOTAL = _noop_counter()
     INTEGRATION_CREDENTIAL_DECRYPT_FAILED_TOTAL = _noop_counter()
+    AUTH_CACHE_LOOKUPS_TOTAL = _noop_counter()
+    AUTH_CACHE_INVALIDATIONS_TOTAL = _noop_counter()
+    ENTITLEMENT_CACHE_LOOKUPS_TOTAL = _noop_counter()
+    ENTITLEMENT_CACHE_INVALIDATIONS_TOTAL = _noop_counter()
+    WORK_ITEM_TEAM_ATTRIBUTIONS_TOTAL = _noop_counter()
 
 
 # ---------------------------------------------------------------------------
@@ -387,6 +512,26 @@ def record_celery_task(task_name: str, state: str, duration_seconds: float) -> N
         )
 
 
+def record_sync_scheduler_tick(
+    *,
+    mode: str,
+    evaluated: int,
+    duration_seconds: float,
+    oldest_due_lag_seconds: float | None = None,
+) -> None:
+    """Record one dispatch_scheduled_syncs tick."""
+    SYNC_SCHEDULER_TICK_DURATION_SECONDS.labels(mode=mode).observe(duration_seconds)
+    SYNC_SCHEDULER_EVALUATED_CONFIGS.labels(mode=mode).set(evaluated)
+    if oldest_due_lag_seconds is not None:
+        SYNC_SCHEDULER_OLDEST_DUE_LAG_SECONDS.labels(mode=mode).set(
+            max(0.0, oldest_due_lag_seconds)
+        )
+
+
+def record_sync_scheduler_dispatch_lag(*, mode: str, lag_seconds: float) -> None:
+    SYNC_SCHEDULER_DISPATCH_LAG_SECONDS.labels(mode=mode).observe(max(0.0, lag_seconds))
+
+
 def record_llm_call(
     provider: str,
     model: str,
@@ -449,6 +594,61 @@ def record_investment_membership_scope_stale(
     )
 
 
+def record_auth_cache_lookup(*, cache: str, result: str) -> None:
+    AUTH_CACHE_LOOKUPS_TOTAL.labels(cache=cache, result=result).inc()
+
+
+def record_auth_cache_invalidation(*, reason: str, count: int = 1) -> None:
+    AUTH_CACHE_INVALIDATIONS_TOTAL.labels(reason=reason).inc(count)
+
+
+def record_entitlement_cache_lookup(*, result: str) -> None:
+    ENTITLEMENT_CACHE_LOOKUPS_TOTAL.labels(result=result).inc()
+
+
+def record_entitlement_cache_invalidation(*, reason: str, scope: str) -> None:
+    ENTITLEMENT_CACHE_INVALIDATIONS_TOTAL.labels(reason=reason, scope=scope).inc()
+
+
+def record_work_item_team_attributions(*, job: str, resolved: int, cached: int) -> None:
+    if resolved:
+        WORK_ITEM_TEAM_ATTRIBUTIONS_TOTAL.labels(job=job, result="resolved").inc(
+            resolved
+        )
+    if cached:
+        WORK_ITEM_TEAM_ATTRIBUTIONS_TOTAL.labels(job=job, result="cached").inc(cached)
+
+
+def record_clickhouse_query_cost(
+    *,
+    caller: str,
+    query_type: str,
+    duration_seconds: float,
+    result_rows: int = 0,
+    read_rows: int = 0,
+    read_bytes: int = 0,
+    written_rows: int = 0,
+    written_bytes: int = 0,
+) -> None:
+    CLICKHOUSE_CALLER_QUERY_SECONDS_TOTAL.labels(
+        caller=caller, query_type=query_type
+    ).inc(duration_seconds)
+    for kind, rows in (
+        ("result", result_rows),
+        ("read", read_rows),
+        ("written", written_rows),
+    ):
+        if rows:
+            CLICKHOUSE_QUERY_ROWS_TOTAL.labels(
+                caller=caller, query_type=query_type, kind=kind
+            ).inc(rows)
+    for kind, size in (("read", read_bytes), ("written", written_bytes)):
+        if size:
+            CLICKHOUSE_QUERY_BYTES_TOTAL.labels(
+                caller=caller, query_type=query_type, kind=kind
+            ).inc(size)
+
+
 @contextmanager
 def clickhouse_query_timer(query_type: str = "query") -> Generator[None, None, None]:
     """Context manager that records ClickHouse query latency."""
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import uuid
 from collections import defaultdict
 from collections.abc import Sequence
 from typing import TypedDict
 
+import numpy as np
+
+from dev_health_ops.metrics.commit_window import CommitStatWindow, group_by_repo
 from dev_health_ops.metrics.schemas import CommitStatRow
 from dev_health_ops.providers.identity import IdentityResolver, normalize_git_identity
 
@@ -85,3 +89,50 @@ def compute_single_owner_file_ratio(
             single_owner_files += 1
 
     return float(single_owner_files) / float(len(file_authors))
+
+
+def compute_rework_churn_ratio_by_repo(
+    window: CommitStatWindow,
+) -> dict[uuid.UUID, float]:
+    """
+    Rework churn ratio for every repo in ``window`` in one grouped pass.
+
+    Result-identical to ``compute_rework_churn_ratio`` per repo; repos with no
+    file-level rows in the window are absent from the result.
+    """
+    files = window.file_rollup()
+    results: dict[uuid.UUID, float] = {}
+    for repo_code, idx in group_by_repo(files.repo):
+        churn = files.churn[idx]
+        total_churn = int(churn.sum())
+        if total_churn == 0:
+            results[window.repo_id(repo_code)] = 0.0
+            continue
+        rework_churn = int(churn[files.distinct_commits[idx] > 1].sum())
+        results[window.repo_id(repo_code)] = float(rework_churn) / float(total_churn)
+    return results
+
+
+def compute_single_owner_file_ratio_by_repo(
+    window: CommitStatWindow,
+    owner_threshold: float = 0.75,
+) -> dict[uuid.UUID, float]:
+    """
+    Single-owner file ratio for every repo in ``window`` in one grouped pass.
+
+    Owner identities are normalized with the window's identity resolver, so
+    build the window with the resolver ``compute_single_owner_file_ratio``
+    would have received.
+    """
+    files = window.file_rollup()
+    results: dict[uuid.UUID, float] = {}
+    for repo_code, idx in group_by_repo(files.repo):
+        totals = files.owner_total_commits[idx]
+        dominated = (totals > 0) & (
+            files.owner_max_commits[idx] / np.maximum(totals, 1)
+            >= float(owner_threshold)
+        )
+        results[window.repo_id(repo_code)] = float(
+            int(np.count_nonzero(dominated))
+        ) / float(idx.size)
+    return results
@@ -855,6 +855,28 @@ class WorkGraphProjectionRunRecord:
     completed_at: datetime
 
 
+@dataclass(frozen=True)
+class WorkGraphIssueKeyRecord:
+    provider: str
+    repo_id: str
+    issue_key: str
+    work_item_id: str
+    last_synced: datetime
+    org_id: str = ""
+
+
+@dataclass(frozen=True)
+class WorkGraphEdgeRemovalRecord:
+    """Endpoints of a work-graph edge the builder deleted."""
+
+    source_type: str
+    source_id: str
+    target_type: str
+    target_id: str
+    removed_at: datetime
+    org_id: str = ""
+
+
 @dataclass(frozen=True)
 class WorkGraphIssuePRRecord:
     repo_id: UUID
@@ -975,6 +997,23 @@ class WorkUnitScopedMembershipRunRecord:
     completed_at: datetime
 
 
+@dataclass(frozen=True)
+class WorkUnitComponentIndexRecord:
+    """One node's connected component and work unit in ``work_unit_component_index``.
+
+    ``component_key`` identifies the unsplit connected component; ``work_unit_id``
+    is empty for a hub node dropped by the oversized-component split. Both are
+    empty for a node that no longer has any edge (a tombstone).
+    """
+
+    org_id: str
+    node_type: str
+    node_id: str
+    component_key: str
+    work_unit_id: str
+    last_synced: datetime
+
+
 @dataclass(frozen=True)
 class WorkUnitInvestmentEvidenceQuoteRecord:
     work_unit_id: str
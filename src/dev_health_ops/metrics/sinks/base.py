@@ -47,6 +47,8 @@ from dev_health_ops.metrics.schemas import (
     TeamRepoOwnershipRecord,
     TelemetrySignalBucketRecord,
     WorkGraphEdgeRecord,
+    WorkGraphEdgeRemovalRecord,
+    WorkGraphIssueKeyRecord,
     WorkGraphIssuePRRecord,
     WorkGraphPRCommitRecord,
     WorkItemCycleTimeRecord,
@@ -54,6 +56,7 @@ from dev_health_ops.metrics.schemas import (
     WorkItemStateDurationDailyRecord,
     WorkItemTeamAttributionRecord,
     WorkItemUserMetricsDailyRecord,
+    WorkUnitComponentIndexRecord,
     WorkUnitInvestmentEvidenceQuoteRecord,
     WorkUnitInvestmentRecord,
     WorkUnitMembershipRecord,
@@ -421,6 +424,33 @@ class BaseMetricsSink(ABC):
         """
         return 0
 
+    def copy_work_unit_memberships(
+        self,
+        org_id: str,
+        *,
+        from_run_id: str,
+        to_run_id: str,
+        exclude_work_unit_ids: Sequence[str],
+        computed_at: datetime,
+    ) -> None:
+        """Carry a previous run's membership rows into a new run.
+
+        Copies only rows whose (node, work unit) pair is still current in
+        ``work_unit_component_index`` and whose work unit is not excluded, so an
+        incremental projection re-emits just its dirty units.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support membership run copies"
+        )
+
+    def write_work_unit_component_index(
+        self, rows: Sequence[WorkUnitComponentIndexRecord]
+    ) -> None:
+        """Write node→component rows of the persisted investment component index."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support the work unit component index"
+        )
+
     # -------------------------------------------------------------------------
     # Investment explanation caching
     # -------------------------------------------------------------------------
@@ -457,6 +487,14 @@ class BaseMetricsSink(ABC):
             f"{self.__class__.__name__} does not support work graph edges"
         )
 
+    def write_work_graph_edge_removals(
+        self, rows: Sequence[WorkGraphEdgeRemovalRecord]
+    ) -> None:
+        """Record the endpoints of edges about to be deleted."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support work graph edge removals"
+        )
+
     def write_work_graph_issue_pr(self, rows: Sequence[WorkGraphIssuePRRecord]) -> None:
         """Write derived issue↔PR link rows."""
         raise NotImplementedError(
@@ -470,6 +508,14 @@ class BaseMetricsSink(ABC):
             f"{self.__class__.__name__} does not support work graph PR↔commit links"
         )
 
+    def write_work_graph_issue_keys(
+        self, rows: Sequence[WorkGraphIssueKeyRecord]
+    ) -> None:
+        """Upsert rows of the incremental build's issue-key index."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support the work graph issue-key index"
+        )
+
     # -------------------------------------------------------------------------
     # Capacity planning forecasts
     # -------------------------------------------------------------------------
@@ -21,6 +21,9 @@ from typing import Any
 import clickhouse_connect
 
 from dev_health_ops.clickhouse_dedup import dedup_from
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    instrument_clickhouse_client,
+)
 from dev_health_ops.metrics.schemas import (
     ManualAttributionFallbackRecord,
     MemberRecord,
@@ -88,8 +91,11 @@ class ClickHouseCore(BaseMetricsSink):
             settings = {
                 "max_query_size": 1 * 1024 * 1024,  # 1MB
             }
-            self.client = clickhouse_connect.get_client(
-                **clickhouse_client_kwargs(dsn, settings=settings)
+            self.client = instrument_clickhouse_client(
+                clickhouse_connect.get_client(
+                    **clickhouse_client_kwargs(dsn, settings=settings)
+                ),
+                component="metrics_sink",
             )
 
     def close(self) -> None:
@@ -3,7 +3,8 @@ InvestmentMixin — investment classification, metrics, and work unit write meth
 
 Tables: investment_classifications_daily, investment_metrics_daily,
         issue_type_metrics_daily, work_unit_investments,
-        work_unit_investment_quotes, investment_explanations.
+        work_unit_investment_quotes, investment_explanations,
+        work_unit_component_index.
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from dev_health_ops.metrics.schemas import (
     InvestmentExplanationRecord,
     InvestmentMetricsRecord,
     IssueTypeMetricsRecord,
+    WorkUnitComponentIndexRecord,
     WorkUnitInvestmentEvidenceQuoteRecord,
     WorkUnitInvestmentRecord,
     WorkUnitMembershipRecord,
@@ -322,6 +324,70 @@ class InvestmentMixin(_ClickHouseSinkBase):
         )
         return len(drop_marker_run_ids)
 
+    def copy_work_unit_memberships(
+        self,
+        org_id: str,
+        *,
+        from_run_id: str,
+        to_run_id: str,
+        exclude_work_unit_ids: Sequence[str],
+        computed_at: datetime,
+    ) -> None:
+        """Carry a previous run's membership rows into a new run, server-side.
+
+        Only rows whose (node, work unit) pair is still current in
+        ``work_unit_component_index`` are copied, so nodes that moved to another
+        unit (or lost every edge) are dropped exactly as a full projection
+        would drop them.
+        """
+        self.client.command(
+            """
+            INSERT INTO work_unit_membership (
+                org_id, node_type, node_id, work_unit_id, category_kind,
+                category, weight, is_dominant, categorization_status,
+                computed_at, run_id
+            )
+            SELECT
+                org_id, node_type, node_id, work_unit_id, category_kind,
+                category, weight, is_dominant, categorization_status,
+                {computed_at:DateTime64(3, 'UTC')}, {to_run_id:String}
+            FROM work_unit_membership
+            WHERE org_id = {org_id:String}
+              AND run_id = {from_run_id:String}
+              AND work_unit_id NOT IN {exclude:Array(String)}
+              AND (node_type, node_id, work_unit_id) IN (
+                  SELECT node_type, node_id, work_unit_id
+                  FROM work_unit_component_index FINAL
+                  WHERE org_id = {org_id:String} AND work_unit_id != ''
+              )
+            """,
+            parameters={
+                "org_id": org_id,
+                "from_run_id": from_run_id,
+                "to_run_id": to_run_id,
+                "exclude": list(exclude_work_unit_ids),
+                "computed_at": computed_at,
+            },
+        )
+
+    def write_work_unit_component_index(
+        self, rows: Sequence[WorkUnitComponentIndexRecord]
+    ) -> None:
+        if not rows:
+            return
+        self._insert_rows(
+            "work_unit_component_index",
+            [
+                "org_id",
+                "node_type",
+                "node_id",
+                "component_key",
+                "work_unit_id",
+                "last_synced",
+            ],
+            rows,
+        )
+
     def write_investment_explanation(self, record: InvestmentExplanationRecord) -> None:
         """Write or replace an investment explanation to the cache."""
         self._insert_rows(
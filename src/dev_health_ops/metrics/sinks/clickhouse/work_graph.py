@@ -7,9 +7,9 @@ Tables: repo_metrics_daily, ic_landscape_rolling_30d, file_metrics_daily,
         work_item_state_durations_daily, work_item_dependencies,
         work_item_reopen_events, work_item_interactions, sprints, worklogs,
         review_edges_daily, file_complexity_snapshots, repo_complexity_daily,
-        file_hotspot_daily, work_graph_edges, work_graph_issue_pr,
-        work_graph_pr_commit, work_items, work_item_transitions,
-        capacity_forecasts.
+        file_hotspot_daily, work_graph_edges, work_graph_edge_removals,
+        work_graph_issue_pr, work_graph_pr_commit, work_graph_issue_key_index,
+        work_items, work_item_transitions, capacity_forecasts.
 """
 
 from __future__ import annotations
@@ -34,6 +34,8 @@ from dev_health_ops.metrics.schemas import (
     ReviewEdgeDailyRecord,
     TeamMetricsDailyRecord,
     WorkGraphEdgeRecord,
+    WorkGraphEdgeRemovalRecord,
+    WorkGraphIssueKeyRecord,
     WorkGraphIssuePRRecord,
     WorkGraphPRCommitRecord,
     WorkGraphProjectionRunRecord,
@@ -653,6 +655,38 @@ class WorkGraphMixin(_ClickHouseSinkBase):
                 "work_graph_pr_commit", matrix, column_names=column_names
             )
 
+    def write_work_graph_edge_removals(
+        self, rows: Sequence[WorkGraphEdgeRemovalRecord]
+    ) -> None:
+        self._insert_rows(
+            "work_graph_edge_removals",
+            [
+                "org_id",
+                "source_type",
+                "source_id",
+                "target_type",
+                "target_id",
+                "removed_at",
+            ],
+            rows,
+        )
+
+    def write_work_graph_issue_keys(
+        self, rows: Sequence[WorkGraphIssueKeyRecord]
+    ) -> None:
+        self._insert_rows(
+            "work_graph_issue_key_index",
+            [
+                "provider",
+                "repo_id",
+                "issue_key",
+                "work_item_id",
+                "last_synced",
+                "org_id",
+            ],
+            rows,
+        )
+
     def write_work_items(self, work_items: Sequence[Any]) -> None:
         """Write raw work items to the work_items table."""
         if not work_items:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from dev_health_ops.metrics.testops_schemas import (
@@ -14,6 +15,7 @@ from dev_health_ops.models.git import (
     CiPipelineRun,
     Deployment,
     GitBlame,
+    GitBlameHunk,
     GitCommit,
     GitCommitStat,
     GitFile,
@@ -57,6 +59,37 @@ class IngestionSink:
     async def insert_blame_data(self, blame_data: list[GitBlame]) -> None:
         await self._store.insert_blame_data(blame_data)
 
+    @property
+    def supports_blame_hunks(self) -> bool:
+        """Whether the store can persist compact ``git_blame_hunks`` rows."""
+        return callable(getattr(self._store, "insert_blame_hunks", None))
+
+    async def get_blame_hunk_blobs(self, repo_id: Any) -> dict[str, str]:
+        """Blob SHA per path from the latest compact blame sync.
+
+        Stores that do not implement the read return an empty mapping, which
+        makes the next compact sync re-blame every file."""
+        getter = getattr(self._store, "get_blame_hunk_blobs", None)
+        if getter is None:
+            return {}
+        result = await getter(repo_id)
+        return dict(result or {})
+
+    async def insert_blame_hunks(self, hunks: list[GitBlameHunk]) -> None:
+        await self._store.insert_blame_hunks(hunks)
+
+    async def prune_blame_hunks(
+        self, repo_id: Any, paths: list[str], synced_at: datetime
+    ) -> None:
+        """Drop generations older than ``synced_at`` for re-blamed ``paths``.
+
+        A no-op on stores without the delete; readers still select the
+        latest generation per path."""
+        pruner = getattr(self._store, "prune_blame_hunks", None)
+        if pruner is None:
+            return
+        await pruner(repo_id, paths, synced_at)
+
     async def insert_git_pull_requests(
         self, pull_requests: list[GitPullRequest]
     ) -> None:
@@ -16,13 +16,14 @@ from typing import Any
 from dev_health_ops.analytics.investment import InvestmentClassifier
 from dev_health_ops.metrics.compute_work_items import (
     TeamAttributionContext,
-    resolve_team_attribution,
+    TeamAttributionEngine,
 )
 from dev_health_ops.metrics.schemas import (
     InvestmentClassificationRecord,
     InvestmentMetricsRecord,
     IssueTypeMetricsRecord,
 )
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
 from dev_health_ops.models.work_items import WorkItem, WorkItemType
 from dev_health_ops.providers.status_mapping import StatusMapping
 from dev_health_ops.providers.teams import (
@@ -46,25 +47,35 @@ def compute_work_item_engine_destinations_daily(
     project_key_resolver: ProjectKeyTeamResolver | None = None,
     linked_issue_resolver: LinkedIssueTeamResolver | None = None,
     attribution_context: TeamAttributionContext | None = None,
+    timeline: WorkItemTimeline | None = None,
+    attribution_engine: TeamAttributionEngine | None = None,
 ) -> tuple[
     list[IssueTypeMetricsRecord],
     list[InvestmentClassificationRecord],
     list[InvestmentMetricsRecord],
 ]:
-    """Compute the three config-engine surfaces for exactly one UTC day."""
+    """Compute the three config-engine surfaces for exactly one UTC day.
+
+    Issue-type rows exist for every (repo, provider, team, type) key in
+    ``work_items``, so keys are seeded from all of them; counts and
+    investment classification only visit the day's items via ``timeline``.
+    """
+    if timeline is None:
+        timeline = WorkItemTimeline(work_items)
+    if attribution_engine is None:
+        attribution_engine = TeamAttributionEngine(
+            team_resolver,
+            project_key_resolver,
+            linked_issue_resolver,
+            attribution_context,
+        )
 
     issue_type_stats: dict[
         tuple[uuid.UUID, Any, str, WorkItemType], dict[str, Any]
     ] = {}
 
     def _get_team(work_item: WorkItem) -> str:
-        team_id, _, _ = resolve_team_attribution(
-            work_item,
-            team_resolver,
-            project_key_resolver,
-            linked_issue_resolver=linked_issue_resolver,
-            attribution_context=attribution_context,
-        )
+        team_id, _, _ = attribution_engine.resolve(work_item)
         return normalize_team_id(team_id)
 
     def _normalize_investment_team_id(team_id: str | None) -> str | None:
@@ -74,7 +85,8 @@ def compute_work_item_engine_destinations_daily(
 
     start_dt = to_utc(datetime.combine(day, time.min, tzinfo=timezone.utc))
     end_dt = start_dt + timedelta(days=1)
-    for item in work_items:
+    issue_type_keys: dict[int, tuple[uuid.UUID, Any, str, WorkItemType]] = {}
+    for item in timeline.items:
         repo_id = getattr(item, "repo_id", None) or uuid.UUID(int=0)
         provider = item.provider
         team_id = _get_team(item)
@@ -85,6 +97,7 @@ def compute_work_item_engine_destinations_daily(
         )
 
         key = (repo_id, provider, team_id, normalized_type)
+        issue_type_keys[id(item)] = key
         if key not in issue_type_stats:
             issue_type_stats[key] = {
                 "created": 0,
@@ -93,25 +106,22 @@ def compute_work_item_engine_destinations_daily(
                 "cycle_hours": [],
             }
 
-        stats = issue_type_stats[key]
-        created = to_utc(item.created_at)
-        if start_dt <= created < end_dt:
-            stats["created"] += 1
+    for item in timeline.created_between(start_dt, end_dt):
+        issue_type_stats[issue_type_keys[id(item)]]["created"] += 1
 
-        if item.completed_at:
+    for item in timeline.completed_between(start_dt, end_dt):
+        stats = issue_type_stats[issue_type_keys[id(item)]]
+        stats["completed"] += 1
+        if item.started_at:
             completed = to_utc(item.completed_at)
-            if start_dt <= completed < end_dt:
-                stats["completed"] += 1
-                if item.started_at:
-                    started = to_utc(item.started_at)
-                    hours = (completed - started).total_seconds() / 3600.0
-                    if hours >= 0:
-                        stats["cycle_hours"].append(hours)
-
-        if created < end_dt and (
-            not item.completed_at or to_utc(item.completed_at) >= start_dt
-        ):
-            stats["active"] += 1
+            started = to_utc(item.started_at)
+            hours = (completed - started).total_seconds() / 3600.0
+            if hours >= 0:
+                stats["cycle_hours"].append(hours)
+
+    active_items = timeline.active_during(start_dt, end_dt)
+    for item in active_items:
+        issue_type_stats[issue_type_keys[id(item)]]["active"] += 1
 
     issue_type_metrics_rows: list[IssueTypeMetricsRecord] = []
     for (
@@ -144,15 +154,8 @@ def compute_work_item_engine_destinations_daily(
     investment_classifications: list[InvestmentClassificationRecord] = []
     investment_metrics: dict[tuple[Any, str, str, str], dict[str, Any]] = {}
 
-    for item in work_items:
+    for item in active_items:
         repo_id = getattr(item, "repo_id", None) or uuid.UUID(int=0)
-        created = to_utc(item.created_at)
-        if not (
-            created < end_dt
-            and (not item.completed_at or to_utc(item.completed_at) >= start_dt)
-        ):
-            continue
-
         classification = investment_classifier.classify(
             {
                 "labels": getattr(item, "labels", []),
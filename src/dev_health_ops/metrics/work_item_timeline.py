@@ -0,0 +1,215 @@
+"""Time index over a run's work items and status transitions.
+
+The per-day work-item computes used to scan the whole item and transition
+history for every day of a backfill. ``WorkItemTimeline`` sorts items by
+created/started/completed time and transitions by occurred time once per run,
+so each day only touches the items that were created, started, completed,
+open or transitioned on that day.
+
+Every query returns items in the order they were given to the timeline, so
+per-day output (dict insertion order, cycle-time records, investment rows)
+is the same as iterating the full list and filtering.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from dev_health_ops.models.work_items import WorkItem, WorkItemStatusTransition
+from dev_health_ops.utils.datetime import to_utc
+
+
+class _Events:
+    """Item positions sorted by a single timestamp."""
+
+    def __init__(self, events: Iterable[tuple[datetime, int]]) -> None:
+        ordered = sorted(events)
+        self._times = [at for at, _ in ordered]
+        self._positions = [position for _, position in ordered]
+
+    def between(self, start: datetime, end: datetime) -> list[int]:
+        """Positions with ``start <= at < end``."""
+        lo = bisect_left(self._times, start)
+        hi = bisect_left(self._times, end)
+        return self._positions[lo:hi]
+
+    def before(self, end: datetime) -> list[int]:
+        """Positions with ``at < end``."""
+        return self._positions[: bisect_left(self._times, end)]
+
+
+class _Intervals:
+    """Item positions keyed by ``[lo, hi)`` intervals; ``hi=None`` never ends.
+
+    A query walks whichever side of the index is smaller (intervals that
+    began in time, or bounded intervals that had not yet ended) and filters
+    it by the other bound, so recent days over a long closed history stay
+    cheap.
+    """
+
+    def __init__(
+        self, intervals: Iterable[tuple[datetime, datetime | None, int]]
+    ) -> None:
+        bounded: list[tuple[datetime, datetime, int]] = []
+        unbounded: list[tuple[datetime, int]] = []
+        for lo, hi, position in intervals:
+            if hi is None:
+                unbounded.append((lo, position))
+            else:
+                bounded.append((lo, hi, position))
+        self._unbounded = _Events(unbounded)
+        self._bounded_by_lo = _Events((lo, position) for lo, _, position in bounded)
+        self._bounded_his = sorted((hi, position) for _, hi, position in bounded)
+        self._his = [hi for hi, _ in self._bounded_his]
+        self._lo_of = {position: lo for lo, _, position in bounded}
+        self._hi_of = {position: hi for _, hi, position in bounded}
+
+    def active(
+        self, lo_before: datetime, hi_from: datetime, *, hi_inclusive: bool = True
+    ) -> list[int]:
+        """Positions with ``lo < lo_before`` and ``hi >= hi_from`` (or ``>``)."""
+        positions = self._unbounded.before(lo_before)
+        begun = self._bounded_by_lo.before(lo_before)
+        cut = (bisect_left if hi_inclusive else bisect_right)(self._his, hi_from)
+        if len(begun) <= len(self._his) - cut:
+            if hi_inclusive:
+                positions += [p for p in begun if self._hi_of[p] >= hi_from]
+            else:
+                positions += [p for p in begun if self._hi_of[p] > hi_from]
+        else:
+            positions += [
+                p for _, p in self._bounded_his[cut:] if self._lo_of[p] < lo_before
+            ]
+        return positions
+
+
+class WorkItemTimeline:
+    """Items and transitions of one run, indexed for per-day interval queries.
+
+    Build it once per run (or per loaded window) and pass it to the per-day
+    computes instead of letting each of them filter the full history.
+    """
+
+    def __init__(
+        self,
+        work_items: Sequence[WorkItem],
+        transitions: Sequence[WorkItemStatusTransition] = (),
+    ) -> None:
+        self.items: tuple[WorkItem, ...] = tuple(work_items)
+
+        transitions_by_id: dict[str, list[WorkItemStatusTransition]] = {}
+        for tr in transitions:
+            transitions_by_id.setdefault(tr.work_item_id, []).append(tr)
+        for item_transitions in transitions_by_id.values():
+            item_transitions.sort(key=lambda tr: to_utc(tr.occurred_at))
+        self._transitions_by_id = transitions_by_id
+
+        created: list[tuple[datetime, int]] = []
+        started: list[tuple[datetime, int]] = []
+        completed: list[tuple[datetime, int]] = []
+        transitioned: list[tuple[datetime, int]] = []
+        open_intervals: list[tuple[datetime, datetime | None, int]] = []
+        uncompleted_intervals: list[tuple[datetime, datetime | None, int]] = []
+        in_progress_intervals: list[tuple[datetime, datetime | None, int]] = []
+        history_intervals: list[tuple[datetime, datetime | None, int]] = []
+
+        for position, item in enumerate(self.items):
+            created_at = to_utc(item.created_at)
+            started_at = to_utc(item.started_at) if item.started_at else None
+            completed_at = to_utc(item.completed_at) if item.completed_at else None
+            closed_at = to_utc(item.closed_at) if item.closed_at else None
+            terminal_at = min(
+                (at for at in (completed_at, closed_at) if at is not None),
+                default=None,
+            )
+
+            created.append((created_at, position))
+            open_intervals.append((created_at, terminal_at, position))
+            uncompleted_intervals.append((created_at, completed_at, position))
+            if started_at is not None:
+                started.append((started_at, position))
+                in_progress_intervals.append((started_at, terminal_at, position))
+            if completed_at is not None:
+                completed.append((completed_at, position))
+
+            item_transitions = transitions_by_id.get(item.work_item_id)
+            if item_transitions:
+                first_at = to_utc(item_transitions[0].occurred_at)
+                last_at = to_utc(item_transitions[-1].occurred_at)
+                transitioned.extend(
+                    (to_utc(tr.occurred_at), position) for tr in item_transitions
+                )
+                # Status segments run from creation (or an earlier transition)
+                # to completion; open items run up to ``computed_at``, which
+                # the caller owns, so they never end here.
+                history_intervals.append(
+                    (
+                        min(created_at, first_at),
+                        max(completed_at, last_at) if completed_at else None,
+                        position,
+                    )
+                )
+
+        self._created = _Events(created)
+        self._started = _Events(started)
+        self._completed = _Events(completed)
+        self._transitioned = _Events(transitioned)
+        self._open = _Intervals(open_intervals)
+        self._uncompleted = _Intervals(uncompleted_intervals)
+        self._in_progress = _Intervals(in_progress_intervals)
+        self._history = _Intervals(history_intervals)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _select(self, *selections: Iterable[int]) -> list[WorkItem]:
+        positions = set().union(*selections)
+        return [self.items[position] for position in sorted(positions)]
+
+    def transitions_for(self, work_item_id: str) -> list[WorkItemStatusTransition]:
+        """Transitions of one item, oldest first."""
+        return self._transitions_by_id.get(work_item_id, [])
+
+    def created_before(self, end: datetime) -> list[WorkItem]:
+        return self._select(self._created.before(end))
+
+    def created_between(self, start: datetime, end: datetime) -> list[WorkItem]:
+        return self._select(self._created.between(start, end))
+
+    def started_between(self, start: datetime, end: datetime) -> list[WorkItem]:
+        return self._select(self._started.between(start, end))
+
+    def completed_between(self, start: datetime, end: datetime) -> list[WorkItem]:
+        return self._select(self._completed.between(start, end))
+
+    def transitioned_between(self, start: datetime, end: datetime) -> list[WorkItem]:
+        return self._select(self._transitioned.between(start, end))
+
+    def open_at(self, at: datetime) -> list[WorkItem]:
+        """Items created before ``at`` and not completed or closed before it."""
+        return self._select(self._open.active(at, at))
+
+    def in_progress_at(self, at: datetime) -> list[WorkItem]:
+        """Items started before ``at`` and not completed or closed before it."""
+        return self._select(self._in_progress.active(at, at))
+
+    def active_during(self, start: datetime, end: datetime) -> list[WorkItem]:
+        """Items created before ``end`` and not completed before ``start``."""
+        return self._select(self._uncompleted.active(end, start))
+
+    def touched_during(self, start: datetime, end: datetime) -> list[WorkItem]:
+        """Items created, started or completed in the window, or in progress at its end."""
+        return self._select(
+            self._created.between(start, end),
+            self._started.between(start, end),
+            self._completed.between(start, end),
+            self._in_progress.active(end, end),
+        )
+
+    def with_status_history_during(
+        self, start: datetime, end: datetime
+    ) -> list[WorkItem]:
+        """Items with transitions whose status segments may overlap the window."""
+        return self._select(self._history.active(end, start, hi_inclusive=False))
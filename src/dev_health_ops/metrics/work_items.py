@@ -4,7 +4,7 @@ import logging
 import os
 import random
 import uuid
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -19,12 +19,16 @@ from dev_health_ops.models.work_items import (
     WorkItemReopenEvent,
     WorkItemStatusTransition,
 )
+from dev_health_ops.providers.base import ProviderBatch
 from dev_health_ops.providers.identity import IdentityResolver
 from dev_health_ops.providers.status_mapping import StatusMapping
 from dev_health_ops.utils.datetime import to_utc
 
 logger = logging.getLogger(__name__)
 
+# Issues per batch yielded by ``iter_jira_work_items_with_extras``.
+JIRA_INGEST_BATCH_SIZE = 500
+
 
 @dataclass(frozen=True)
 class DiscoveredRepo:
@@ -103,6 +107,59 @@ def fetch_jira_work_items_with_extras(
     """
     Fetch Jira issues updated since `since` and normalize into WorkItems.
 
+    Collects every batch of :func:`iter_jira_work_items_with_extras`; the sync
+    job consumes the iterator directly so large instances stay bounded.
+    """
+    work_items: list[WorkItem] = []
+    transitions: list[WorkItemStatusTransition] = []
+    dependencies: list[WorkItemDependency] = []
+    reopen_events: list[WorkItemReopenEvent] = []
+    interactions: list[WorkItemInteractionEvent] = []
+    sprints: list[Sprint] = []
+    for batch in iter_jira_work_items_with_extras(
+        since=since,
+        until=until,
+        status_mapping=status_mapping,
+        identity=identity,
+        project_keys=project_keys,
+        client=client,
+        jql_override=jql_override,
+        fetch_all=fetch_all,
+        use_env_query_options=use_env_query_options,
+        reference_sprints=reference_sprints,
+        reference_sink=reference_sink,
+    ):
+        work_items.extend(batch.work_items)
+        transitions.extend(batch.status_transitions)
+        dependencies.extend(batch.dependencies)
+        reopen_events.extend(batch.reopen_events)
+        interactions.extend(batch.interactions)
+        sprints.extend(batch.sprints)
+    return work_items, transitions, dependencies, reopen_events, interactions, sprints
+
+
+def iter_jira_work_items_with_extras(
+    *,
+    since: datetime,
+    until: datetime | None = None,
+    status_mapping: StatusMapping,
+    identity: IdentityResolver,
+    project_keys: Sequence[str] | None = None,
+    client: Any | None = None,
+    jql_override: str | None = None,
+    fetch_all: bool | None = None,
+    use_env_query_options: bool = True,
+    reference_sprints: Sequence[Sprint] | None = None,
+    reference_sink: Any | None = None,
+    batch_size: int = JIRA_INGEST_BATCH_SIZE,
+) -> Iterator[ProviderBatch]:
+    """
+    Yield Jira issues updated since `since` as normalized batches.
+
+    Each batch carries up to ``batch_size`` issues with their transitions,
+    dependency edges, reopen events and comments; referenced sprints follow
+    in a final batch once every issue has been seen.
+
     Jira configuration is provided via env vars:
     - JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN
     - optional: JIRA_PROJECT_KEYS (comma-separated)
@@ -156,22 +213,19 @@ def fetch_jira_work_items_with_extras(
             logger.info(
                 "JiraProvider does not fetch dependency edges; set JIRA_USE_PROVIDER=0 to use legacy dependency ingestion"
             )
-        return (
-            batch_work_items,
-            batch_status_transitions,
-            batch_dependencies,
-            batch_reopen_events,
-            batch_interactions,
-            batch_sprints,
+        yield ProviderBatch(
+            work_items=batch_work_items,
+            status_transitions=batch_status_transitions,
+            dependencies=batch_dependencies,
+            reopen_events=batch_reopen_events,
+            interactions=batch_interactions,
+            sprints=batch_sprints,
         )
+        return
 
     jira_client: Any = client or deps.jira_client_factory()
-    work_items: list[WorkItem] = []
-    transitions: list[WorkItemStatusTransition] = []
-    dependencies: list[WorkItemDependency] = []
-    reopen_events: list[WorkItemReopenEvent] = []
-    interactions: list[WorkItemInteractionEvent] = []
-    sprints: list[Sprint] = []
+    batch = ProviderBatch()
+    fetched_items = 0
 
     fetch_comments = _env_flag("JIRA_FETCH_COMMENTS", True)
     comments_limit = int(os.getenv("JIRA_COMMENTS_LIMIT", "0"))  # 0 means no limit
@@ -235,14 +289,14 @@ def fetch_jira_work_items_with_extras(
                 identity=identity,
                 repo_id=None,
             )
-            work_items.append(wi)
-            transitions.extend(wi_transitions)
-            dependencies.extend(
+            batch.work_items.append(wi)
+            batch.status_transitions.extend(wi_transitions)
+            batch.dependencies.extend(
                 deps.jira_extract_dependencies(
                     issue=issue, work_item_id=wi.work_item_id
                 )
             )
-            reopen_events.extend(
+            batch.reopen_events.extend(
                 deps.jira_detect_reopen_events(
                     work_item_id=wi.work_item_id,
                     transitions=wi_transitions,
@@ -263,7 +317,7 @@ def fetch_jira_work_items_with_extras(
                             identity=identity,
                         )
                         if event:
-                            interactions.append(event)
+                            batch.interactions.append(event)
                             comment_count += 1
                 except Exception as exc:
                     logger.warning(
@@ -275,6 +329,13 @@ def fetch_jira_work_items_with_extras(
             if wi.sprint_id:
                 sprint_ids.add(wi.sprint_id)
 
+            if len(batch.work_items) >= batch_size:
+                fetched_items += len(batch.work_items)
+                yield batch
+                batch = ProviderBatch()
+
+    fetched_items += len(batch.work_items)
+    sprints = batch.sprints
     fetched_sprints: list[Sprint] = []
     for sprint_id in sorted(sprint_ids):
         if sprint_id in sprint_cache:
@@ -293,12 +354,12 @@ def fetch_jira_work_items_with_extras(
     if reference_sink is not None and fetched_sprints:
         reference_sink.write_sprints(fetched_sprints)
 
-    logger.info("Fetched %d Jira work items (since %s)", len(work_items), updated_since)
+    logger.info("Fetched %d Jira work items (since %s)", fetched_items, updated_since)
     try:
         jira_client.close()
     except Exception as exc:
         logger.warning("Failed to close Jira client: %s", exc)
-    return work_items, transitions, dependencies, reopen_events, interactions, sprints
+    yield batch
 
 
 def fetch_jira_work_items(
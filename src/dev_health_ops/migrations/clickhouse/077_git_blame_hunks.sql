@@ -0,0 +1,25 @@
+-- Migration 077: compact line-range blame for local repositories.
+--
+-- `git_blame` stores one row per source line including the line text, which
+-- makes it the largest raw table on monorepos. `git_blame_hunks` stores one
+-- row per contiguous range of lines last touched by the same commit, without
+-- text. Every hunk written for a file in one sync shares `last_synced`,
+-- readers use only the latest generation per path, so hunks from an older
+-- blame of the same file never leak into the current view. `blob_sha` lets
+-- the next sync skip files whose HEAD blob is unchanged. A row with
+-- `line_count = 0` and an empty `blob_sha` marks a deleted file.
+
+CREATE TABLE IF NOT EXISTS git_blame_hunks (
+    org_id LowCardinality(String),
+    repo_id UUID,
+    path String,
+    start_line UInt32,
+    line_count UInt32,
+    commit_hash String,
+    author_email Nullable(String),
+    author_name Nullable(String),
+    author_when Nullable(DateTime64(3, 'UTC')),
+    blob_sha String,
+    last_synced DateTime64(3, 'UTC')
+) ENGINE = ReplacingMergeTree(last_synced)
+ORDER BY (org_id, repo_id, path, start_line);
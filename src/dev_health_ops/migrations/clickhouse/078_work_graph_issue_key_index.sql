@@ -0,0 +1,23 @@
+-- Migration 078: persisted issue-key index for incremental work-graph builds.
+--
+-- Text parsing resolves `ABC-123` / `#123` references to work_item_id values.
+-- A full build rebuilds those lookups from `work_items FINAL` on every run,
+-- while the incremental build upserts only the work items synced since its
+-- last watermark and reads back just the keys referenced by changed text.
+-- `repo_id` is empty for Jira keys, which are org-wide. `issue_key` is the
+-- upper-cased Jira key or the GitHub/GitLab issue number. Rows with
+-- `provider = 'pr'` record PR numbers already seen in a repo, so only keys
+-- and PRs new to the index trigger a re-scan of older text.
+--
+-- Per-source watermarks reuse `work_graph_projection_runs` (migration 071)
+-- with `projection_name = 'incremental:<source table>'`.
+
+CREATE TABLE IF NOT EXISTS work_graph_issue_key_index (
+    org_id LowCardinality(String),
+    provider LowCardinality(String),
+    repo_id String,
+    issue_key String,
+    work_item_id String,
+    last_synced DateTime64(3, 'UTC')
+) ENGINE = ReplacingMergeTree(last_synced)
+ORDER BY (org_id, issue_key, provider, repo_id);
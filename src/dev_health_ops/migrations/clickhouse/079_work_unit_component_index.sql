@@ -0,0 +1,24 @@
+-- Migration 079: persisted connected-component index for investment work units.
+--
+-- One row per work-graph node: the key of its unsplit connected component
+-- (`component_key`, the work_unit_id hash of the component's full node set)
+-- and the work unit it belongs to after the oversized-component split.
+-- `work_unit_id` is empty for a hub node the split dropped, and both keys are
+-- empty for a node that no longer has any edge.
+--
+-- The materializer and membership backfill update this index from edges
+-- synced since their last run (watermark in `work_graph_projection_runs`,
+-- `projection_name = 'investment_components'`) instead of rebuilding every
+-- component from all of `work_graph_edges`.
+
+CREATE TABLE IF NOT EXISTS work_unit_component_index (
+    org_id LowCardinality(String),
+    node_type LowCardinality(String),
+    node_id String,
+    component_key String,
+    work_unit_id String,
+    last_synced DateTime64(3, 'UTC'),
+    INDEX idx_component_key component_key TYPE bloom_filter(0.01) GRANULARITY 1,
+    INDEX idx_work_unit_id work_unit_id TYPE bloom_filter(0.01) GRANULARITY 1
+) ENGINE = ReplacingMergeTree(last_synced)
+ORDER BY (org_id, node_type, node_id);
@@ -0,0 +1,22 @@
+-- Migration 080: endpoints of work-graph edges removed by the builder.
+--
+-- The builder deletes stale edges with `ALTER TABLE work_graph_edges DELETE`,
+-- which leaves no `last_synced` trace for incremental readers. Before each such
+-- delete it records the endpoints of the doomed edges here, and the investment
+-- component index (`work_unit_component_index`) seeds its dirty region from
+-- these rows as well as from edges synced past its watermark.
+--
+-- Rows only need to outlive the gap between two component index updates, so
+-- they expire after 30 days. An index that falls further behind is repaired by
+-- its `verify` rebuild.
+
+CREATE TABLE IF NOT EXISTS work_graph_edge_removals (
+    org_id LowCardinality(String),
+    source_type LowCardinality(String),
+    source_id String,
+    target_type LowCardinality(String),
+    target_id String,
+    removed_at DateTime64(3, 'UTC')
+) ENGINE = MergeTree
+ORDER BY (org_id, removed_at)
+TTL toDateTime(removed_at) + INTERVAL 30 DAY;
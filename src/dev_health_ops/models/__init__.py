@@ -36,7 +36,16 @@ from .external_ingest import (
     ExternalIngestBatchPayload,
     ExternalIngestRejection,
 )
-from .git import Base, GitBlame, GitBlameMixin, GitCommit, GitCommitStat, GitFile, Repo
+from .git import (
+    Base,
+    GitBlame,
+    GitBlameHunk,
+    GitBlameMixin,
+    GitCommit,
+    GitCommitStat,
+    GitFile,
+    Repo,
+)
 from .health_rule_governance import HealthRuleCalibration, HealthRuleVersionFingerprint
 from .impersonation import ImpersonationSession
 from .ingest_auth import (
@@ -113,7 +122,7 @@ from .sso import (
     SSOProviderStatus,
 )
 from .subscriptions import Subscription, SubscriptionEvent
-from .sync_coverage import SyncCoverageProjection
+from .sync_coverage import SyncCoverageIntervalState, SyncCoverageProjection
 from .teams import JiraProjectOpsTeamLink, Team
 from .users import (
     AuthProvider,
@@ -166,6 +175,7 @@ __all__ = [
     "BillingNotification",
     "BYOLLMBudgetReservation",
     "GitBlame",
+    "GitBlameHunk",
     "GitBlameMixin",
     "GitCommit",
     "GitCommitStat",
@@ -226,6 +236,7 @@ __all__ = [
     "SSOProviderStatus",
     "STANDARD_FEATURES",
     "SyncConfiguration",
+    "SyncCoverageIntervalState",
     "SyncCoverageProjection",
     "SyncComputeCheckpoint",
     "SyncComputeCheckpointStatus",
@@ -2,6 +2,7 @@ import hashlib
 import logging
 import os
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -485,6 +486,103 @@ class GitBlameMixin:
             logging.warning(f"Error processing {rel_path}: {e}")
         return blame_data
 
+    @staticmethod
+    def fetch_blame_hunks(
+        repo_path: str,
+        filepath: str,
+        repo_uuid: uuid.UUID,
+        blob_sha: str,
+        repo: GitRepo | None = None,
+    ) -> list["GitBlameHunk"]:
+        """
+        Fetch blame for a file as contiguous line ranges instead of lines.
+
+        Adjacent blame groups attributed to the same commit are merged, and no
+        line text is kept.
+
+        :param repo_path: Path to the git repository.
+        :param filepath: Path to the file to fetch blame data for.
+        :param repo_uuid: UUID of the repository.
+        :param blob_sha: HEAD blob SHA of the file, recorded on every hunk so
+            the next sync can skip the file when it is unchanged.
+        :param repo: Optional existing Repo instance to reuse.
+        :return: List of GitBlameHunk records ordered by start line.
+        :raises git.GitCommandError: If git cannot blame the file. Unlike
+            ``fetch_blame`` the error propagates, so the caller can retry the
+            file on the next sync instead of recording it as empty.
+        """
+        hunks: list[GitBlameHunk] = []
+        if repo is None:
+            repo = GitRepo(repo_path)
+        rel_path = os.path.relpath(filepath, repo_path)
+        blame_info = repo.blame("HEAD", rel_path) or []
+        next_line = 1
+        for item in blame_info:
+            if not isinstance(item, (list, tuple)) or len(item) < 2:
+                continue
+            commit, lines = item[0], item[1]
+            if not isinstance(commit, Commit) or not isinstance(lines, list):
+                continue
+            if not lines:
+                continue
+            hexsha = getattr(commit, "hexsha", "unknown")
+            if hunks and hunks[-1].commit_hash == hexsha:
+                hunks[-1].line_count += len(lines)
+            else:
+                hunks.append(
+                    GitBlameHunk(
+                        repo_id=repo_uuid,
+                        path=rel_path,
+                        start_line=next_line,
+                        line_count=len(lines),
+                        commit_hash=hexsha,
+                        author_email=getattr(commit.author, "email", "unknown"),
+                        author_name=getattr(commit.author, "name", "unknown"),
+                        author_when=getattr(
+                            commit, "committed_datetime", datetime.now(timezone.utc)
+                        ),
+                        blob_sha=blob_sha,
+                    )
+                )
+            next_line += len(lines)
+        return hunks
+
+
+@dataclass
+class GitBlameHunk:
+    """A contiguous range of lines last touched by one commit.
+
+    The compact alternative to per-line ``GitBlame`` rows. A file's blame is
+    the set of hunks written in one sync (sharing ``last_synced``). A hunk
+    with ``line_count == 0`` and an empty ``blob_sha`` is a tombstone for a
+    file that no longer exists at HEAD.
+    """
+
+    repo_id: uuid.UUID
+    path: str
+    start_line: int
+    line_count: int
+    commit_hash: str
+    author_email: str | None
+    author_name: str | None
+    author_when: datetime | None
+    blob_sha: str
+    last_synced: datetime | None = None
+
+    @classmethod
+    def tombstone(cls, repo_id: uuid.UUID, path: str) -> "GitBlameHunk":
+        return cls(
+            repo_id=repo_id,
+            path=path,
+            start_line=0,
+            line_count=0,
+            commit_hash="",
+            author_email=None,
+            author_name=None,
+            author_when=None,
+            blob_sha="",
+        )
+
 
 class GitBlame(Base, GitBlameMixin):
     __tablename__ = "git_blame"
@@ -19,6 +19,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     event,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -223,6 +224,12 @@ class SyncRun(Base):
     # jobcontract.Envelope.trace_parent (CHAOS-3993). NULL for a run planned
     # before this column existed, or while tracing was disabled.
     trace_parent: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Set when finalize (or the interval-store rebuild) folded this run's units
+    # into ``sync_coverage_interval_states``. Coverage reads replay the units
+    # of runs still NULL here on top of the stored intervals.
+    coverage_applied_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -248,6 +255,12 @@ class SyncRun(Base):
             "ix_sync_runs_org_integration_status", "org_id", "integration_id", "status"
         ),
         Index("ix_sync_runs_status_id", "status", "id"),
+        Index(
+            "ix_sync_runs_coverage_unapplied",
+            "org_id",
+            "integration_id",
+            postgresql_where=text("coverage_applied_at IS NULL"),
+        ),
     )
 
 
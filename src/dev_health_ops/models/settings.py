@@ -381,6 +381,14 @@ class SyncConfiguration(Base):
         nullable=True,
         comment="Stats from last sync (items synced, duration, etc.)",
     )
+    next_due_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment=(
+            "Scheduler due-time index: earliest time this config needs "
+            "evaluating again. NULL means not yet indexed (due now)."
+        ),
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -432,6 +440,7 @@ class SyncConfiguration(Base):
             "org_id", "provider", "name", name="uq_sync_config_org_provider_name"
         ),
         Index("ix_sync_config_org_provider", "org_id", "provider"),
+        Index("ix_sync_config_active_next_due", "is_active", "next_due_at"),
     )
 
     def __init__(
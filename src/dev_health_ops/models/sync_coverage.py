@@ -6,6 +6,7 @@ from typing import Any
 
 from sqlalchemy import (
     JSON,
+    Boolean,
     DateTime,
     ForeignKey,
     Index,
@@ -74,3 +75,55 @@ class SyncCoverageProjection(Base):
             "updated_at",
         ),
     )
+
+
+class SyncCoverageIntervalState(Base):
+    """Pre-merged coverage intervals for one (source, effective dataset) pair.
+
+    ``finalize_sync_run`` folds each terminal run's units into the matching
+    rows in the same transaction, using the reducer the from-scratch coverage
+    scan uses, so a reader can replay O(intervals) instead of O(units).
+    Intervals are stored unclipped as ``[since, before]`` ISO pairs; the
+    lookback cutoff is applied at read time.
+    """
+
+    __tablename__ = "sync_coverage_interval_states"
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID, primary_key=True, default=uuid.uuid4)
+    org_id: Mapped[str] = mapped_column(String, nullable=False)
+    integration_id: Mapped[uuid.UUID] = mapped_column(GUID, nullable=False)
+    source_id: Mapped[uuid.UUID] = mapped_column(GUID, nullable=False)
+    dataset_key: Mapped[str] = mapped_column(String, nullable=False)
+    requested: Mapped[list[Any]] = mapped_column(JSON, nullable=False, default=list)
+    covered: Mapped[list[Any]] = mapped_column(JSON, nullable=False, default=list)
+    failed: Mapped[list[Any]] = mapped_column(JSON, nullable=False, default=list)
+    # ``[before, run_time]`` pairs no other success dominates on both axes, so
+    # the latest successful run touching any lookback window stays exact.
+    success_marks: Mapped[list[Any]] = mapped_column(JSON, nullable=False, default=list)
+    # Replay key of the last folded unit. Failures depend on replay order, so
+    # a run folded behind this key marks the row stale until it is rebuilt.
+    last_run_time: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_unit_id: Mapped[uuid.UUID | None] = mapped_column(GUID, nullable=True)
+    unit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    is_stale: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "org_id",
+            "integration_id",
+            "source_id",
+            "dataset_key",
+            name="uq_sync_coverage_interval_state_pair",
+        ),
+    )
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+from ._source import ReportSource
 from .coverage import (
     CoverageFileRecord,
     CoverageReport,
+    iter_cobertura_files,
+    iter_lcov_files,
     parse_cobertura_xml,
     parse_coverage_report,
     parse_lcov_report,
 )
-from .junit import ParsedTestCase, ParsedTestSuite, parse_junit_xml
+from .junit import (
+    ParsedTestCase,
+    ParsedTestSuite,
+    iter_junit_suites,
+    parse_junit_xml,
+)
 
 __all__ = [
     "CoverageFileRecord",
     "CoverageReport",
     "ParsedTestCase",
     "ParsedTestSuite",
+    "ReportSource",
+    "iter_cobertura_files",
+    "iter_junit_suites",
+    "iter_lcov_files",
     "parse_cobertura_xml",
     "parse_coverage_report",
     "parse_junit_xml",
@@ -0,0 +1,118 @@
+"""Report sources for the streaming JUnit/coverage parsers.
+
+A report source is a filesystem path, inline content (``str``/``bytes``), or an
+open file object (text or binary, e.g. a spooled ZIP member). The parsers read
+it as a UTF-8 text stream in chunks so a large artifact never has to be held
+as one string, and XML is fed to defusedxml's ``iterparse`` with DTDs, entity
+declarations and external references forbidden, under a byte cap.
+"""
+
+from __future__ import annotations
+
+import errno
+import io
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+from defusedxml.ElementTree import iterparse as _defused_iterparse
+
+ReportSource = str | bytes | Path | IO[str] | IO[bytes]
+
+_READ_CHUNK_CHARS = 64 * 1024
+
+
+def _is_existing_path(value: str) -> bool:
+    # Inline report content longer than NAME_MAX/PATH_MAX makes ``exists()``
+    # raise ENAMETOOLONG; that just means "not a path" (CHAOS-2412).
+    try:
+        return Path(value).exists()
+    except OSError as exc:
+        if exc.errno != errno.ENAMETOOLONG:
+            raise
+        return False
+
+
+@contextmanager
+def open_report_text(source: ReportSource) -> Iterator[IO[str]]:
+    """Open ``source`` as a UTF-8 text stream.
+
+    File objects passed in are not closed; a binary one is wrapped for the
+    duration of the block and detached afterwards so the caller keeps it.
+    """
+    if isinstance(source, Path):
+        with source.open(encoding="utf-8") as handle:
+            yield handle
+    elif isinstance(source, bytes):
+        yield io.TextIOWrapper(io.BytesIO(source), encoding="utf-8")
+    elif isinstance(source, str):
+        if _is_existing_path(source):
+            with open(source, encoding="utf-8") as handle:
+                yield handle
+        else:
+            yield io.StringIO(source)
+    elif isinstance(source.read(0), bytes):
+        wrapper = io.TextIOWrapper(source, encoding="utf-8")  # type: ignore[arg-type]
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()
+    else:
+        yield source  # type: ignore[misc]
+
+
+def rewindable(stream: IO[str]) -> IO[str]:
+    """Return ``stream`` if it can seek back to the start, else a buffered copy."""
+    if stream.seekable():
+        return stream
+    return io.StringIO(stream.read())
+
+
+def stream_contains(stream: IO[str], marker: str) -> bool:
+    """Scan a seekable stream for ``marker`` chunk by chunk, then rewind it."""
+    stream.seek(0)
+    tail = ""
+    try:
+        while chunk := stream.read(_READ_CHUNK_CHARS):
+            if marker in tail + chunk:
+                return True
+            tail = chunk[-(len(marker) - 1) :] if len(marker) > 1 else ""
+        return False
+    finally:
+        stream.seek(0)
+
+
+class _CappedReader:
+    """Text reader that fails once more than ``max_bytes`` of UTF-8 was read."""
+
+    def __init__(self, stream: IO[str], *, max_bytes: int, label: str) -> None:
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._label = label
+        self._read_bytes = 0
+
+    def read(self, size: int = -1) -> str:
+        chunk = self._stream.read(size)
+        self._read_bytes += len(chunk.encode("utf-8", errors="ignore"))
+        if self._read_bytes > self._max_bytes:
+            raise ValueError(
+                f"{self._label} too large: exceeds {self._max_bytes} byte limit"
+            )
+        return chunk
+
+
+def iter_xml_events(
+    stream: IO[str],
+    events: tuple[str, ...],
+    *,
+    max_bytes: int,
+    label: str,
+) -> Iterator[tuple[str, Any]]:
+    """``iterparse`` an untrusted XML stream with entity/DTD attacks disabled."""
+    # defusedxml defaults: forbid_entities=True, forbid_external=True.
+    return _defused_iterparse(
+        _CappedReader(stream, max_bytes=max_bytes, label=label),
+        events=events,
+        forbid_dtd=True,
+    )
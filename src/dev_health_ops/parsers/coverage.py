@@ -1,27 +1,25 @@
 from __future__ import annotations
 
-import errno
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any
+from typing import IO, Any
 from xml.etree import ElementTree as ET  # types only — parsing uses defusedxml
 
-from defusedxml.ElementTree import fromstring as _defused_fromstring
+from dev_health_ops.parsers._source import (
+    ReportSource,
+    iter_xml_events,
+    open_report_text,
+    rewindable,
+    stream_contains,
+)
 
 # Coverage XML (cobertura/clover) is downloaded from untrusted CI artifacts;
 # parse with defusedxml and cap document size to block XXE / entity-expansion
 # bombs and memory exhaustion (CHAOS-2370).
 _MAX_XML_BYTES = 64 * 1024 * 1024  # 64 MiB per report
 
-
-def _safe_fromstring(text: str) -> ET.Element:
-    encoded_len = len(text.encode("utf-8", errors="ignore"))
-    if encoded_len > _MAX_XML_BYTES:
-        raise ValueError(
-            f"Coverage XML too large: {encoded_len} bytes exceeds "
-            f"{_MAX_XML_BYTES} byte limit"
-        )
-    return _defused_fromstring(text, forbid_dtd=True)
+# Enough of a report to see an LCOV record prefix past leading blank lines.
+_SNIFF_CHARS = 4096
 
 
 @dataclass(frozen=True)
@@ -47,29 +45,6 @@ class CoverageReport:
     files: list[CoverageFileRecord] = field(default_factory=list)
 
 
-def _read_text(source: str | bytes | Path) -> str:
-    if isinstance(source, Path):
-        return source.read_text(encoding="utf-8")
-    if isinstance(source, bytes):
-        return source.decode("utf-8")
-    path = Path(source)
-    # ``source`` may be either a filesystem path OR the full report content
-    # inline (e.g. an in-memory coverage.xml body). A realistically-sized
-    # inline report exceeds PATH_MAX/NAME_MAX, so ``path.exists()`` raises
-    # OSError(ENAMETOOLONG) rather than returning False -- treat that the
-    # same as "not a path" instead of letting it propagate (CHAOS-3406,
-    # mirrors the guard in parsers/junit.py CHAOS-2412).
-    try:
-        path_exists = path.exists()
-    except OSError as exc:
-        if exc.errno != errno.ENAMETOOLONG:
-            raise
-        path_exists = False
-    if path_exists:
-        return path.read_text(encoding="utf-8")
-    return source
-
-
 def _safe_int(value: Any) -> int | None:
     if value in (None, ""):
         return None
@@ -87,9 +62,7 @@ def _condition_counts(value: str | None) -> tuple[int | None, int | None]:
     return _safe_int(total), _safe_int(covered)
 
 
-def parse_lcov_report(source: str | bytes | Path) -> CoverageReport:
-    content = _read_text(source)
-    files: list[CoverageFileRecord] = []
+def _iter_lcov_records(lines: Iterable[str]) -> Iterator[CoverageFileRecord]:
     current_path: str | None = None
     line_totals: set[int] = set()
     covered_lines: set[int] = set()
@@ -100,25 +73,23 @@ def parse_lcov_report(source: str | bytes | Path) -> CoverageReport:
     functions_total: int | None = None
     functions_covered: int | None = None
 
-    def flush() -> None:
+    def flush() -> CoverageFileRecord | None:
         nonlocal current_path, line_totals, covered_lines, lines_total, lines_covered
         nonlocal branches_total, branches_covered, functions_total, functions_covered
         if current_path is None:
-            return
+            return None
         file_lines_total = lines_total if lines_total is not None else len(line_totals)
         file_lines_covered = (
             lines_covered if lines_covered is not None else len(covered_lines)
         )
-        files.append(
-            CoverageFileRecord(
-                file_path=current_path,
-                lines_total=file_lines_total,
-                lines_covered=file_lines_covered,
-                branches_total=branches_total,
-                branches_covered=branches_covered,
-                functions_total=functions_total,
-                functions_covered=functions_covered,
-            )
+        record = CoverageFileRecord(
+            file_path=current_path,
+            lines_total=file_lines_total,
+            lines_covered=file_lines_covered,
+            branches_total=branches_total,
+            branches_covered=branches_covered,
+            functions_total=functions_total,
+            functions_covered=functions_covered,
         )
         current_path = None
         line_totals = set()
@@ -129,17 +100,20 @@ def parse_lcov_report(source: str | bytes | Path) -> CoverageReport:
         branches_covered = None
         functions_total = None
         functions_covered = None
+        return record
 
-    for raw_line in content.splitlines():
+    for raw_line in lines:
         line = raw_line.strip()
         if not line:
             continue
         if line == "end_of_record":
-            flush()
+            if record := flush():
+                yield record
             continue
         prefix, _, value = line.partition(":")
         if prefix == "SF":
-            flush()
+            if record := flush():
+                yield record
             current_path = value.strip()
         elif prefix == "DA":
             parts = value.split(",")
@@ -161,8 +135,12 @@ def parse_lcov_report(source: str | bytes | Path) -> CoverageReport:
             functions_total = _safe_int(value)
         elif prefix == "FNH":
             functions_covered = _safe_int(value)
-    flush()
+    if record := flush():
+        yield record
+
 
+def _lcov_report(stream: IO[str]) -> CoverageReport:
+    files = list(_iter_lcov_records(stream))
     return CoverageReport(
         report_format="lcov",
         lines_total=sum(record.lines_total or 0 for record in files) or None,
@@ -176,38 +154,81 @@ def parse_lcov_report(source: str | bytes | Path) -> CoverageReport:
     )
 
 
-def parse_cobertura_xml(source: str | bytes | Path) -> CoverageReport:
-    root = _safe_fromstring(_read_text(source))
-    files: dict[str, CoverageFileRecord] = {}
+def iter_lcov_files(source: ReportSource) -> Iterator[CoverageFileRecord]:
+    """Yield one record per LCOV ``SF:`` section, reading the report line by line."""
+    with open_report_text(source) as stream:
+        yield from _iter_lcov_records(stream)
+
+
+def parse_lcov_report(source: ReportSource) -> CoverageReport:
+    with open_report_text(source) as stream:
+        return _lcov_report(stream)
+
+
+def _class_record(class_element: ET.Element) -> CoverageFileRecord | None:
+    filename = class_element.get("filename")
+    if not filename:
+        return None
+    lines = class_element.findall("./lines/line")
+    line_total = len(lines)
+    line_covered = sum(1 for line in lines if (_safe_int(line.get("hits")) or 0) > 0)
+    branch_total = 0
+    branch_covered = 0
+    for line in lines:
+        total, covered = _condition_counts(line.get("condition-coverage"))
+        branch_total += total or 0
+        branch_covered += covered or 0
+    return CoverageFileRecord(
+        file_path=filename,
+        lines_total=line_total or None,
+        lines_covered=line_covered,
+        branches_total=branch_total or None,
+        branches_covered=branch_covered or None,
+    )
+
 
-    for class_element in root.findall(".//class"):
-        filename = class_element.get("filename")
-        if not filename:
+def _iter_cobertura_records(
+    stream: IO[str], root_attributes: dict[str, str]
+) -> Iterator[CoverageFileRecord]:
+    """Yield a record per ``<class>`` as it closes, dropping it from the tree.
+
+    The root element's attributes (report totals) are copied into
+    ``root_attributes`` as soon as its start tag has been parsed.
+    """
+    events = iter_xml_events(
+        stream,
+        ("start", "end"),
+        max_bytes=_MAX_XML_BYTES,
+        label="Coverage XML",
+    )
+    elements: list[ET.Element] = []
+    for event, element in events:
+        if event == "start":
+            if not elements:
+                root_attributes.update(element.attrib)
+            elements.append(element)
             continue
-        lines = class_element.findall("./lines/line")
-        line_total = len(lines)
-        line_covered = sum(
-            1 for line in lines if (_safe_int(line.get("hits")) or 0) > 0
-        )
-        branch_total = 0
-        branch_covered = 0
-        for line in lines:
-            total, covered = _condition_counts(line.get("condition-coverage"))
-            branch_total += total or 0
-            branch_covered += covered or 0
-        files[filename] = CoverageFileRecord(
-            file_path=filename,
-            lines_total=line_total or None,
-            lines_covered=line_covered,
-            branches_total=branch_total or None,
-            branches_covered=branch_covered or None,
-        )
+        elements.pop()
+        if element.tag != "class" or not elements:
+            continue
+        record = _class_record(element)
+        element.clear()
+        elements[-1].remove(element)
+        if record is not None:
+            yield record
+
+
+def _cobertura_report(stream: IO[str]) -> CoverageReport:
+    root_attributes: dict[str, str] = {}
+    files: dict[str, CoverageFileRecord] = {}
+    for record in _iter_cobertura_records(stream, root_attributes):
+        files[record.file_path] = record
 
     file_records = list(files.values())
-    lines_total = _safe_int(root.get("lines-valid"))
-    lines_covered = _safe_int(root.get("lines-covered"))
-    branches_total = _safe_int(root.get("branches-valid"))
-    branches_covered = _safe_int(root.get("branches-covered"))
+    lines_total = _safe_int(root_attributes.get("lines-valid"))
+    lines_covered = _safe_int(root_attributes.get("lines-covered"))
+    branches_total = _safe_int(root_attributes.get("branches-valid"))
+    branches_covered = _safe_int(root_attributes.get("branches-covered"))
 
     if lines_total is None:
         lines_total = sum(record.lines_total or 0 for record in file_records) or None
@@ -234,15 +255,33 @@ def parse_cobertura_xml(source: str | bytes | Path) -> CoverageReport:
     )
 
 
+def iter_cobertura_files(source: ReportSource) -> Iterator[CoverageFileRecord]:
+    """Yield a record per Cobertura ``<class>`` as it is parsed.
+
+    A file that appears under several classes is yielded once per class;
+    ``parse_cobertura_xml`` keeps the last one.
+    """
+    with open_report_text(source) as stream:
+        yield from _iter_cobertura_records(stream, {})
+
+
+def parse_cobertura_xml(source: ReportSource) -> CoverageReport:
+    with open_report_text(source) as stream:
+        return _cobertura_report(stream)
+
+
 def parse_coverage_report(
-    source: str | bytes | Path,
+    source: ReportSource,
     report_format: str | None = None,
 ) -> CoverageReport:
-    content = _read_text(source)
     normalized_format = (report_format or "").strip().lower()
 
-    if normalized_format == "lcov" or content.lstrip().startswith(("TN:", "SF:")):
-        return parse_lcov_report(content)
-    if normalized_format == "cobertura" or "<coverage" in content:
-        return parse_cobertura_xml(content)
+    with open_report_text(source) as opened:
+        stream = rewindable(opened)
+        head = stream.read(_SNIFF_CHARS)
+        stream.seek(0)
+        if normalized_format == "lcov" or head.lstrip().startswith(("TN:", "SF:")):
+            return _lcov_report(stream)
+        if normalized_format == "cobertura" or stream_contains(stream, "<coverage"):
+            return _cobertura_report(stream)
     raise ValueError("Unsupported coverage report format")
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import errno
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET  # types only — parsing uses defusedxml
 
-from defusedxml.ElementTree import fromstring as _defused_fromstring
+from dev_health_ops.parsers._source import (
+    ReportSource,
+    iter_xml_events,
+    open_report_text,
+)
 
 CANONICAL_TEST_STATUSES = {"passed", "failed", "skipped", "error", "quarantined"}
 
@@ -18,18 +21,6 @@ CANONICAL_TEST_STATUSES = {"passed", "failed", "skipped", "error", "quarantined"
 _MAX_XML_BYTES = 64 * 1024 * 1024  # 64 MiB per report
 
 
-def _safe_fromstring(text: str) -> ET.Element:
-    """Parse XML from an untrusted source with entity/DTD attacks disabled."""
-    encoded_len = len(text.encode("utf-8", errors="ignore"))
-    if encoded_len > _MAX_XML_BYTES:
-        raise ValueError(
-            f"XML report too large: {encoded_len} bytes exceeds "
-            f"{_MAX_XML_BYTES} byte limit"
-        )
-    # defusedxml defaults: forbid_entities=True, forbid_external=True.
-    return _defused_fromstring(text, forbid_dtd=True)
-
-
 @dataclass(frozen=True)
 class ParsedTestCase:
     case_name: str
@@ -63,23 +54,6 @@ class ParsedTestSuite:
     cases: list[ParsedTestCase] = field(default_factory=list)
 
 
-def _read_text(source: str | bytes | Path) -> str:
-    if isinstance(source, Path):
-        return source.read_text(encoding="utf-8")
-    if isinstance(source, bytes):
-        return source.decode("utf-8")
-    path = Path(source)
-    try:
-        path_exists = path.exists()
-    except OSError as exc:
-        if exc.errno != errno.ENAMETOOLONG:
-            raise
-        path_exists = False
-    if path_exists:
-        return path.read_text(encoding="utf-8")
-    return source
-
-
 def _safe_float(value: Any) -> float | None:
     if value in (None, ""):
         return None
@@ -161,82 +135,111 @@ def _infer_framework(suite: ET.Element, cases: list[ParsedTestCase]) -> str | No
     return "junit"
 
 
-def parse_junit_xml(source: str | bytes | Path) -> list[ParsedTestSuite]:
-    root = _safe_fromstring(_read_text(source))
-    suites: list[ParsedTestSuite] = []
-
-    candidate_suites: list[ET.Element] = []
-    if root.tag == "testsuite":
-        candidate_suites.append(root)
-    candidate_suites.extend(root.findall(".//testsuite"))
-
-    seen_ids: set[int] = set()
-    for suite in candidate_suites:
-        suite_id = id(suite)
-        if suite_id in seen_ids:
-            continue
-        seen_ids.add(suite_id)
-
-        testcases = [child for child in suite.findall("testcase")]
-        if not testcases:
-            continue
-
-        parsed_cases: list[ParsedTestCase] = []
-        for testcase in testcases:
-            status, detail = _canonical_status(testcase)
-            if status not in CANONICAL_TEST_STATUSES:
-                status = "error"
-
-            parsed_cases.append(
-                ParsedTestCase(
-                    case_name=testcase.get("name") or "unnamed",
-                    class_name=testcase.get("classname"),
-                    duration_seconds=_safe_float(testcase.get("time")),
-                    status=status,
-                    failure_message=detail.get("message")
-                    if detail is not None
-                    else None,
-                    failure_type=detail.get("type") if detail is not None else None,
-                    stack_trace=_normalized_text(detail),
-                    system_out=_normalized_text(testcase.find("system-out")),
-                    system_err=_normalized_text(testcase.find("system-err")),
-                    file_path=testcase.get("file") or suite.get("file"),
-                )
-            )
-
-        counts = {status: 0 for status in CANONICAL_TEST_STATUSES}
-        for case in parsed_cases:
-            counts[case.status] += 1
-
-        started_at = _parse_timestamp(suite.get("timestamp"))
-        duration_seconds = _safe_float(suite.get("time"))
-        finished_at = (
-            started_at + timedelta(seconds=duration_seconds)
-            if started_at is not None and duration_seconds is not None
-            else None
+def _parse_case(testcase: ET.Element, suite: ET.Element) -> ParsedTestCase:
+    status, detail = _canonical_status(testcase)
+    if status not in CANONICAL_TEST_STATUSES:
+        status = "error"
+    return ParsedTestCase(
+        case_name=testcase.get("name") or "unnamed",
+        class_name=testcase.get("classname"),
+        duration_seconds=_safe_float(testcase.get("time")),
+        status=status,
+        failure_message=detail.get("message") if detail is not None else None,
+        failure_type=detail.get("type") if detail is not None else None,
+        stack_trace=_normalized_text(detail),
+        system_out=_normalized_text(testcase.find("system-out")),
+        system_err=_normalized_text(testcase.find("system-err")),
+        file_path=testcase.get("file") or suite.get("file"),
+    )
+
+
+def _parse_suite(
+    suite: ET.Element, parsed_cases: list[ParsedTestCase]
+) -> ParsedTestSuite:
+    counts = {status: 0 for status in CANONICAL_TEST_STATUSES}
+    for case in parsed_cases:
+        counts[case.status] += 1
+
+    started_at = _parse_timestamp(suite.get("timestamp"))
+    duration_seconds = _safe_float(suite.get("time"))
+    finished_at = (
+        started_at + timedelta(seconds=duration_seconds)
+        if started_at is not None and duration_seconds is not None
+        else None
+    )
+
+    return ParsedTestSuite(
+        suite_name=suite.get("name") or "unnamed",
+        framework=_infer_framework(suite, parsed_cases),
+        duration_seconds=duration_seconds,
+        started_at=started_at,
+        finished_at=finished_at,
+        total_count=len(parsed_cases),
+        passed_count=counts["passed"],
+        failed_count=counts["failed"],
+        skipped_count=counts["skipped"],
+        error_count=counts["error"],
+        quarantined_count=counts["quarantined"],
+        system_out=_normalized_text(suite.find("system-out")),
+        system_err=_normalized_text(suite.find("system-err")),
+        file_path=suite.get("file")
+        or next((case.file_path for case in parsed_cases if case.file_path), None),
+        cases=parsed_cases,
+    )
+
+
+def iter_junit_suites(source: ReportSource) -> Iterator[ParsedTestSuite]:
+    """Yield the suites of a JUnit XML report as they are parsed.
+
+    Each ``<testcase>`` is parsed and dropped from the tree as soon as it
+    closes, and each ``<testsuite>`` once it has been yielded, so memory is
+    bounded by the largest suite rather than the whole report. Suites come out
+    in document order of their opening tags; suites without test cases are
+    skipped.
+    """
+    with open_report_text(source) as stream:
+        events = iter_xml_events(
+            stream,
+            ("start", "end"),
+            max_bytes=_MAX_XML_BYTES,
+            label="XML report",
         )
-
-        suites.append(
-            ParsedTestSuite(
-                suite_name=suite.get("name") or "unnamed",
-                framework=_infer_framework(suite, parsed_cases),
-                duration_seconds=duration_seconds,
-                started_at=started_at,
-                finished_at=finished_at,
-                total_count=len(parsed_cases),
-                passed_count=counts["passed"],
-                failed_count=counts["failed"],
-                skipped_count=counts["skipped"],
-                error_count=counts["error"],
-                quarantined_count=counts["quarantined"],
-                system_out=_normalized_text(suite.find("system-out")),
-                system_err=_normalized_text(suite.find("system-err")),
-                file_path=suite.get("file")
-                or next(
-                    (case.file_path for case in parsed_cases if case.file_path), None
-                ),
-                cases=parsed_cases,
-            )
-        )
-
-    return suites
+        elements: list[ET.Element] = []
+        # Open ``<testsuite>`` elements: (document position, parsed cases).
+        open_suites: list[tuple[int, list[ParsedTestCase]]] = []
+        # Nested suites wait for their outermost suite so the output keeps
+        # document order.
+        pending: list[tuple[int, ParsedTestSuite]] = []
+        position = 0
+        for event, element in events:
+            if event == "start":
+                elements.append(element)
+                if element.tag == "testsuite":
+                    open_suites.append((position, []))
+                    position += 1
+                continue
+
+            elements.pop()
+            parent = elements[-1] if elements else None
+            if element.tag == "testcase":
+                if parent is not None and parent.tag == "testsuite":
+                    open_suites[-1][1].append(_parse_case(element, parent))
+                    parent.remove(element)
+            elif element.tag == "testsuite":
+                suite_position, parsed_cases = open_suites.pop()
+                if parsed_cases:
+                    pending.append(
+                        (suite_position, _parse_suite(element, parsed_cases))
+                    )
+                element.clear()
+                if parent is not None:
+                    parent.remove(element)
+                if not open_suites:
+                    pending.sort(key=lambda entry: entry[0])
+                    for _, parsed_suite in pending:
+                        yield parsed_suite
+                    pending.clear()
+
+
+def parse_junit_xml(source: ReportSource) -> list[ParsedTestSuite]:
+    return list(iter_junit_suites(source))
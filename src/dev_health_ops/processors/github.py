@@ -1,9 +1,12 @@
 import asyncio
+import contextlib
 import logging
 import zipfile
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import IO, TYPE_CHECKING, Any, Protocol
+from urllib.parse import urlparse
 
 from dev_health_ops.analytics.complexity import (
     DEFAULT_COMPLEXITY_CONFIG_PATH,
@@ -48,6 +51,7 @@ from dev_health_ops.processors.storage_protocol import GitSyncStore
 from dev_health_ops.processors.testops_ingest import (
     MAX_ARTIFACTS_PER_RUN,
     MAX_RUNS_PER_SYNC,
+    close_report_members,
     ingest_report_members,
 )
 from dev_health_ops.providers.github.client import GitHubAuth, GitHubWorkClient
@@ -71,7 +75,11 @@ if TYPE_CHECKING:
         GitHubConnector,
     )
     from dev_health_ops.connectors.models import Repository
-    from dev_health_ops.connectors.utils import RateLimitConfig, RateLimitGate
+    from dev_health_ops.connectors.utils import (
+        RateLimitConfig,
+        RateLimitGate,
+        create_rate_limit_gate,
+    )
     from dev_health_ops.providers.github.code_client import (
         GitHubCodeClient,
         GitHubRepositoryData,
@@ -85,13 +93,18 @@ elif CONNECTORS_AVAILABLE:
         GitHubConnector,
     )
     from dev_health_ops.connectors.models import Repository
-    from dev_health_ops.connectors.utils import RateLimitConfig, RateLimitGate
+    from dev_health_ops.connectors.utils import (
+        RateLimitConfig,
+        RateLimitGate,
+        create_rate_limit_gate,
+    )
 else:
     BatchResult = None
     GitHubConnector = None
     Repository = None
     RateLimitConfig = None
     RateLimitGate = None
+    create_rate_limit_gate = None
 
     class ConnectorException(Exception):
         pass
@@ -214,6 +227,37 @@ async def _fetch_github_commits_async(
             )
 
 
+class GitHubCommitStatDetail(StrEnum):
+    """How much diff detail the commit-stat sync fetches per commit."""
+
+    # One REST commit-detail call per commit; one row per changed file.
+    FILES = "files"
+    # One aliased GraphQL query per ``_COMMIT_TOTALS_PER_QUERY`` commits; one
+    # ``AGGREGATE_STATS_MARKER`` row per commit carrying its diff totals.
+    TOTALS = "totals"
+
+
+# Concurrent commit-detail requests per repo. GitHub's secondary limits punish
+# bursts of concurrent requests, so the pool stays small and every worker
+# waits on a shared rate-limit gate before each call.
+_COMMIT_STATS_CONCURRENCY = 4
+_COMMIT_TOTALS_CONCURRENCY = 2
+_COMMIT_TOTALS_PER_QUERY = 50
+
+
+def _github_rate_limit_gate(connector: Any) -> "RateLimitGate":
+    """Gate shared by every process syncing against the connector's host."""
+    rest_base_url = getattr(connector, "_rest_base_url", None)
+    raw_base_url = rest_base_url() if callable(rest_base_url) else None
+    base_url = raw_base_url if isinstance(raw_base_url, str) else None
+    host = urlparse(base_url or "https://api.github.com").hostname
+    return create_rate_limit_gate(
+        "github",
+        host=host or "api.github.com",
+        config=RateLimitConfig(initial_backoff_seconds=1.0),
+    )
+
+
 async def _fetch_github_commit_stats_async(
     connector: Any,
     owner: str,
@@ -223,38 +267,119 @@ async def _fetch_github_commit_stats_async(
     max_stats: int,
     since: datetime | None = None,
     usage_sink: list[dict[str, Any]] | None = None,
+    *,
+    detail: GitHubCommitStatDetail = GitHubCommitStatDetail.FILES,
+    collector: AsyncBatchCollector[GitCommitStat] | None = None,
+    gate: "RateLimitGate | None" = None,
+    concurrency: int | None = None,
 ) -> list[GitCommitStat]:
+    """Fetch commit stats for the first ``max_stats`` commits in the window.
+
+    Requests run on a small worker pool (``concurrency``, defaulting per
+    ``detail``) sharing one client and one rate-limit ``gate``: each worker
+    waits on the gate before every call, and a ``RateLimitException`` (primary
+    or secondary) penalizes it with the server's retry-after, cancels the
+    other workers and propagates. Any other per-commit failure skips that
+    commit, as the sequential fetch did.
+
+    With ``collector``, each commit's rows are handed to it as soon as they
+    arrive (flushing every ``batch_size`` rows) and nothing is returned;
+    without one, every row is returned in commit order.
+    """
+    window: list[str] = []
+    for commit in raw_commits[:max_stats]:
+        commit_when = getattr(commit, "committer_when", None) or getattr(
+            commit, "author_when", None
+        )
+        if (
+            since is not None
+            and isinstance(commit_when, datetime)
+            and commit_when.astimezone(timezone.utc) < since
+        ):
+            continue
+        window.append(commit.sha)
+
+    if detail == GitHubCommitStatDetail.TOTALS:
+        chunk_size = _COMMIT_TOTALS_PER_QUERY
+        default_concurrency = _COMMIT_TOTALS_CONCURRENCY
+    else:
+        chunk_size = 1
+        default_concurrency = _COMMIT_STATS_CONCURRENCY
+    chunks = [
+        window[start : start + chunk_size]
+        for start in range(0, len(window), chunk_size)
+    ]
+    results: list[list[GitCommitStat]] = [[] for _ in chunks]
+
     client = _github_code_client_from_connector(connector)
     try:
-        stats_objects: list[GitCommitStat] = []
-        for commit in raw_commits[:max_stats]:
-            commit_when = getattr(commit, "committer_when", None) or getattr(
-                commit, "author_when", None
-            )
-            if (
-                since is not None
-                and isinstance(commit_when, datetime)
-                and commit_when.astimezone(timezone.utc) < since
-            ):
-                continue
-            try:
-                file_stats = await client.get_commit_file_stats(
-                    owner, repo_name, commit.sha
+        if not chunks:
+            return []
+        if gate is None:
+            gate = _github_rate_limit_gate(connector)
+        collector_lock = asyncio.Lock()
+        pending = iter(enumerate(chunks))
+
+        async def _fetch_chunk(shas: list[str]) -> list[GitCommitStat]:
+            if detail == GitHubCommitStatDetail.TOTALS:
+                totals = await client.get_commit_totals(
+                    owner, repo_name, shas, batch_size=chunk_size
                 )
-            except (RateLimitException, RateLimitExceededException):
-                raise
-            except Exception as exc:
-                logging.debug(
-                    "Failed commit stat fetch for %s/%s@%s: %s",
-                    owner,
-                    repo_name,
-                    commit.sha,
-                    exc,
-                )
-                continue
-            for stat in file_stats:
-                stats_objects.append(_github_commit_stat_to_model(stat, repo_id))
-        return stats_objects
+                return [
+                    GitCommitStat(
+                        repo_id=repo_id,
+                        commit_hash=total.commit_hash,
+                        file_path=AGGREGATE_STATS_MARKER,
+                        additions=total.additions,
+                        deletions=total.deletions,
+                        old_file_mode="unknown",
+                        new_file_mode="unknown",
+                    )
+                    for total in totals
+                ]
+            file_stats = await client.get_commit_file_stats(owner, repo_name, shas[0])
+            return [_github_commit_stat_to_model(stat, repo_id) for stat in file_stats]
+
+        async def _worker() -> None:
+            # ``pending`` is shared: each worker pulls the next chunk when it
+            # is free, so one slow commit never stalls the others.
+            for index, shas in pending:
+                await gate.wait_async()
+                try:
+                    stats = await _fetch_chunk(shas)
+                except (RateLimitException, RateLimitExceededException) as exc:
+                    gate.penalize(getattr(exc, "retry_after_seconds", None))
+                    raise
+                except Exception as exc:
+                    logging.warning(
+                        "Dropped commit stats for %d commit(s) of %s/%s (first %s): %s",
+                        len(shas),
+                        owner,
+                        repo_name,
+                        shas[0],
+                        exc,
+                    )
+                    continue
+                if collector is None:
+                    results[index] = stats
+                    continue
+                async with collector_lock:
+                    for stat in stats:
+                        collector.add(stat)
+                    await collector.maybe_flush()
+
+        workers = [
+            asyncio.create_task(_worker())
+            for _ in range(max(1, min(concurrency or default_concurrency, len(chunks))))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return [stat for stats in results for stat in stats]
     finally:
         observations = client.drain_usage_observations()
         await client.close()
@@ -454,14 +579,25 @@ def _github_code_client_from_connector(connector) -> "GitHubCodeClient":
     ``self.token`` (and, for GHE, its REST base URL onto
     ``_rest_base_url()``), so this helper reuses that resolution rather than
     duplicating GitHub App auth in the httpx client (CHAOS-2773 CS3 scope).
+
+    The process-wide validator cache (``PROVIDER_VALIDATOR_CACHE_URL``) is
+    attached when configured; its keys carry the credential fingerprint and
+    the connector's ``validator_scope`` (the sync's org id), so tenants never
+    share an entry even when they share a credential.
     """
     rest_base_url = getattr(connector, "_rest_base_url", None)
     raw_base_url = rest_base_url() if callable(rest_base_url) else None
     base_url = raw_base_url if isinstance(raw_base_url, str) else None
     token = getattr(connector, "token", None)
+    scope = getattr(connector, "validator_scope", "")
+    from dev_health_ops.providers._conditional import default_validator_cache
     from dev_health_ops.providers.github.code_client import GitHubCodeClient
 
-    return GitHubCodeClient(auth=GitHubAuth(token=token, base_url=base_url))
+    return GitHubCodeClient(
+        auth=GitHubAuth(token=token, base_url=base_url),
+        validator_cache=default_validator_cache(),
+        validator_scope=scope if isinstance(scope, str) else "",
+    )
 
 
 def _github_provider_instance_id(connector) -> str:
@@ -1498,7 +1634,11 @@ async def _sync_github_commit_stats(
     raw_commits: list[Any] | None = None,
     window_truncated: bool = False,
     usage_sink: list[dict[str, Any]] | None = None,
+    detail: GitHubCommitStatDetail = GitHubCommitStatDetail.FILES,
 ) -> int:
+    """Fetch and store commit stats, writing them in ``BATCH_SIZE`` batches
+    while the fetch is still running rather than after it; returns the number
+    of rows written."""
     if raw_commits is None:
         raw_commits, _, window_truncated = await _fetch_github_commits_async(
             connector,
@@ -1522,20 +1662,24 @@ async def _sync_github_commit_stats(
             stats_limit,
         )
         return 0
-    stats_objects = await _fetch_github_commit_stats_async(
-        connector,
-        owner,
-        repo_name,
-        raw_commits,
-        db_repo.id,
-        stats_limit,
-        since,
-        usage_sink,
-    )
-    if stats_objects:
-        await ingestion_sink.insert_git_commit_stats(stats_objects)
-        logging.info("Stored %d commit stats from GitHub", len(stats_objects))
-    return len(stats_objects)
+    async with AsyncBatchCollector(ingestion_sink.insert_git_commit_stats) as collector:
+        remaining = await _fetch_github_commit_stats_async(
+            connector,
+            owner,
+            repo_name,
+            raw_commits,
+            db_repo.id,
+            stats_limit,
+            since,
+            usage_sink,
+            detail=detail,
+            collector=collector,
+        )
+        for stat in remaining:
+            collector.add(stat)
+    if collector.total:
+        logging.info("Stored %d commit stats from GitHub", collector.total)
+    return collector.total
 
 
 def _is_report_name(name: str) -> bool:
@@ -1559,21 +1703,24 @@ def _fetch_github_test_artifacts_sync(
     default_branch: str | None,
     max_runs: int,
     until: datetime | None = None,
-) -> list[tuple[str, list[tuple[str, bytes]], datetime | None, datetime | None]]:
+) -> Iterator[
+    tuple[str, list[tuple[str, IO[bytes]]], datetime | None, datetime | None]
+]:
     """Blocking: download + extract JUnit/coverage report files per workflow run.
 
-    Returns ``[(run_id, members, started_at, finished_at), ...]``. Branch + date
+    Yields ``(run_id, members, started_at, finished_at)`` one run at a time,
+    where each member is a ``(filename, spooled_file)`` pair the caller must
+    close (``ingest_report_members`` does). Nothing is fetched until the
+    caller advances the generator, so a run's files are ingested and closed
+    before the next run is downloaded. Branch + date
     filtering is pushed SERVER-SIDE (``get_workflow_runs(branch=, created=)``) so
     we never paginate deep history of off-branch runs (Codex review item D), and
     a flat ``max_runs`` cap bounds the scan. ``run_id`` is ``str(run.id)`` and the
     run timestamps date the suites (which otherwise lack timestamps).
     """
     # Lazy import to avoid a connectors/providers import cycle at module load.
-    from dev_health_ops.connectors.utils.safe_archive import iter_zip_members
+    from dev_health_ops.connectors.utils.safe_archive import iter_zip_member_files
 
-    results: list[
-        tuple[str, list[tuple[str, bytes]], datetime | None, datetime | None]
-    ] = []
     since_aware = _as_utc(since)
 
     list_kwargs: dict[str, Any] = {}
@@ -1590,7 +1737,7 @@ def _fetch_github_test_artifacts_sync(
         logging.warning(
             "Could not list workflow runs for %s/%s: %s", owner, repo_name, exc
         )
-        return results
+        return
 
     scanned = 0
     for run in runs:
@@ -1613,7 +1760,7 @@ def _fetch_github_test_artifacts_sync(
         except Exception as exc:
             logging.debug("Artifact list failed for run %s: %s", run_id, exc)
             continue
-        members: list[tuple[str, bytes]] = []
+        members: list[tuple[str, IO[bytes]]] = []
         for artifact in artifacts:
             artifact_id = artifact.get("id")
             if artifact_id is None:
@@ -1626,13 +1773,15 @@ def _fetch_github_test_artifacts_sync(
             if not data:
                 continue
             try:
-                members.extend(iter_zip_members(data, name_filter=_is_report_name))
+                members.extend(iter_zip_member_files(data, name_filter=_is_report_name))
             except zipfile.BadZipFile:
                 logging.debug("Artifact %s is not a valid zip", artifact_id)
                 continue
+            except BaseException:
+                close_report_members(members)
+                raise
         if members:
-            results.append((str(run_id), members, run_started, run_finished))
-    return results
+            yield str(run_id), members, run_started, run_finished
 
 
 async def _sync_github_test_reports(
@@ -1711,47 +1860,78 @@ async def _sync_github_test_reports(
     # (2) JUnit + coverage from artifacts (best-effort; artifacts may be
     # expired/absent — those repos legitimately show empty test metrics).
     default_branch = getattr(gh_repo, "default_branch", None)
-    raw = await loop.run_in_executor(
-        None,
-        _fetch_github_test_artifacts_sync,
-        connector,
-        gh_repo,
-        owner,
-        repo_name,
-        since,
-        default_branch,
-        MAX_RUNS_PER_SYNC,
-        until,
-    )
-    suite_rows: list[Any] = []
-    case_rows: list[Any] = []
-    coverage_rows: list[Any] = []
-    for run_id_str, members, run_started, run_finished in raw:
-        suites, cases, coverage = await ingest_report_members(
-            members,
-            repo_id=repo_id,
-            run_id=run_id_str,
-            org_id=org_id,
-            started_at=run_started,
-            finished_at=run_finished,
+    runs = iter(
+        _fetch_github_test_artifacts_sync(
+            connector,
+            gh_repo,
+            owner,
+            repo_name,
+            since,
+            default_branch,
+            MAX_RUNS_PER_SYNC,
+            until,
         )
-        suite_rows.extend(suites)
-        case_rows.extend(cases)
-        coverage_rows.extend(coverage)
-    if suite_rows:
-        await ingestion_sink.insert_test_suite_results(suite_rows)
-    if case_rows:
-        await ingestion_sink.insert_test_case_results(case_rows)
-    if coverage_rows:
-        await ingestion_sink.insert_coverage_snapshots(coverage_rows)
+    )
+    run: (
+        tuple[str, list[tuple[str, IO[bytes]]], datetime | None, datetime | None] | None
+    ) = None
+    try:
+        # Each run is downloaded on the executor only once the previous one is
+        # ingested, so at most one run's spooled files are open at a time.
+        run = await loop.run_in_executor(None, next, runs, None)
+        if run is None:
+            logging.info(
+                "TestOps GitHub %s/%s: no test report artifacts", owner, repo_name
+            )
+            return
+        run_count = 0
+        # Rows go to the sink in ``BATCH_SIZE`` batches as runs are parsed, so
+        # a sync never holds every run's cases at once.
+        async with (
+            AsyncBatchCollector(ingestion_sink.insert_test_suite_results) as suite_rows,
+            AsyncBatchCollector(ingestion_sink.insert_test_case_results) as case_rows,
+            AsyncBatchCollector(
+                ingestion_sink.insert_coverage_snapshots
+            ) as coverage_rows,
+        ):
+            while run is not None:
+                run_id_str, members, run_started, run_finished = run
+                run_count += 1
+                suites, cases, coverage = await ingest_report_members(
+                    members,
+                    repo_id=repo_id,
+                    run_id=run_id_str,
+                    org_id=org_id,
+                    started_at=run_started,
+                    finished_at=run_finished,
+                )
+                for suite in suites:
+                    suite_rows.add(suite)
+                for case in cases:
+                    case_rows.add(case)
+                for snapshot in coverage:
+                    coverage_rows.add(snapshot)
+                await suite_rows.maybe_flush()
+                await case_rows.maybe_flush()
+                await coverage_rows.maybe_flush()
+                run = await loop.run_in_executor(None, next, runs, None)
+    finally:
+        if run is not None:
+            # Already closed unless the failure came before its ingestion.
+            close_report_members(run[1])
+        close = getattr(runs, "close", None)
+        if close is not None:
+            # A cancelled executor step may still be running the generator.
+            with contextlib.suppress(ValueError):
+                close()
     logging.info(
         "TestOps GitHub %s/%s: %d suites, %d cases, %d coverage from %d runs",
         owner,
         repo_name,
-        len(suite_rows),
-        len(case_rows),
-        len(coverage_rows),
-        len(raw),
+        suite_rows.total,
+        case_rows.total,
+        coverage_rows.total,
+        run_count,
     )
 
 
@@ -1804,6 +1984,7 @@ async def process_github_repo(
     sync_files: bool | None = None,
     sync_blame: bool | None = None,
     usage_sink: list[dict[str, Any]] | None = None,
+    commit_stats_detail: GitHubCommitStatDetail = GitHubCommitStatDetail.FILES,
 ) -> GitHubFilesInventoryStatus | None:
     """
     Process a GitHub repository using the GitHub connector.
@@ -1815,6 +1996,10 @@ async def process_github_repo(
     legacy CLI batch/webhook entry points that do not own a sink) still
     drains any such client but only logs the observations, never persisting
     them.
+
+    ``commit_stats_detail=TOTALS`` stores one aggregate row per commit from
+    batched GraphQL instead of per-file rows, for callers that only need
+    churn totals.
     """
     if not CONNECTORS_AVAILABLE:
         raise RuntimeError("Connectors unavailable. Install required dependencies.")
@@ -1837,6 +2022,7 @@ async def process_github_repo(
         if isinstance(token, GitHubCredentials)
         else GitHubConnector(token=token)
     )
+    connector.validator_scope = str(getattr(store, "org_id", "") or "")
     try:
         with connector:
             # 1. Fetch Repo Info
@@ -1917,6 +2103,7 @@ async def process_github_repo(
                     raw_commits=raw_commits,
                     window_truncated=window_truncated,
                     usage_sink=usage_sink,
+                    detail=commit_stats_detail,
                 )
 
             if sync_prs:
@@ -2097,6 +2284,7 @@ async def process_github_repos_batch(
     backfill_missing: bool = True,
     since: datetime | None = None,
     usage_sink: list[dict[str, Any]] | None = None,
+    commit_stats_detail: GitHubCommitStatDetail = GitHubCommitStatDetail.FILES,
 ) -> None:
     """
     Process multiple GitHub repositories using batch processing with
@@ -2115,6 +2303,7 @@ async def process_github_repos_batch(
         if isinstance(token, GitHubCredentials)
         else GitHubConnector(token=token)
     )
+    connector.validator_scope = str(getattr(store, "org_id", "") or "")
     loop = asyncio.get_running_loop()
     ingestion_sink = IngestionSink(store)
 
@@ -2230,6 +2419,7 @@ async def process_github_repos_batch(
                         raw_commits=raw_commits,
                         window_truncated=window_truncated,
                         usage_sink=usage_sink,
+                        detail=commit_stats_detail,
                     )
             except (RateLimitException, RateLimitExceededException):
                 raise
@@ -3,7 +3,7 @@ import logging
 import zipfile
 from datetime import datetime, timezone
 from functools import partial
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import IO, TYPE_CHECKING, Any, NamedTuple, cast
 
 from dev_health_ops.analytics.complexity import (
     DEFAULT_COMPLEXITY_CONFIG_PATH,
@@ -50,6 +50,7 @@ from dev_health_ops.processors.storage_protocol import GitSyncStore
 from dev_health_ops.processors.testops_ingest import (
     MAX_ARTIFACTS_PER_RUN,
     MAX_RUNS_PER_SYNC,
+    close_report_members,
     ingest_report_members,
 )
 from dev_health_ops.processors.testops_tests import process_gitlab_test_report
@@ -1228,11 +1229,15 @@ def _gitlab_code_client_from_connector(connector):
     ``processors/github.py::_github_code_client_from_connector`` so both
     provider pathfinders expose the same factory seam -- also the monkeypatch
     point for the security-family unit tests."""
+    from dev_health_ops.providers._conditional import default_validator_cache
     from dev_health_ops.providers.gitlab.code_client import GitLabCodeClient
 
+    scope = getattr(connector, "validator_scope", "")
     return GitLabCodeClient(
         private_token=str(connector.private_token or ""),
         base_url=connector.url,
+        validator_cache=default_validator_cache(),
+        validator_scope=scope if isinstance(scope, str) else "",
     )
 
 
@@ -1898,15 +1903,16 @@ def _fetch_gitlab_test_reports_sync(
     usage_sink: list[dict[str, Any]] | None = None,
 ) -> tuple[
     list[tuple[str, dict[str, Any], datetime | None, datetime | None]],
-    list[tuple[str, list[tuple[str, bytes]]]],
+    list[tuple[str, list[tuple[str, IO[bytes]]]]],
 ]:
     """Blocking: collect native test reports + coverage artifact members.
 
     Returns ``(test_reports, coverage_members)`` where ``test_reports`` is
     ``[(run_id, test_report_json, started_at, finished_at), ...]`` (GitLab's
     parsed JUnit JSON + the pipeline timestamps used to date the suites) and
-    ``coverage_members`` is ``[(run_id, [(filename, bytes), ...]), ...]`` from
-    job artifact ZIPs. ``run_id`` is ``str(pipeline["id"])`` so rows join to
+    ``coverage_members`` is ``[(run_id, [(filename, spooled_file), ...]), ...]``
+    from job artifact ZIPs; the caller must close the files
+    (``ingest_report_members`` does). ``run_id`` is ``str(pipeline["id"])`` so rows join to
     the pipeline. Bounded to the default branch and ``max_pipelines``
     pipelines.
 
@@ -1928,7 +1934,7 @@ def _fetch_gitlab_test_reports_sync(
     drained per-request usage observations in a ``finally:`` on BOTH the
     success and failure path.
     """
-    from dev_health_ops.connectors.utils.safe_archive import iter_zip_members
+    from dev_health_ops.connectors.utils.safe_archive import iter_zip_member_files
 
     since_aware = since
     if since_aware is not None and since_aware.tzinfo is None:
@@ -1938,12 +1944,12 @@ def _fetch_gitlab_test_reports_sync(
 
     async def _run() -> tuple[
         list[tuple[str, dict[str, Any], datetime | None, datetime | None]],
-        list[tuple[str, list[tuple[str, bytes]]]],
+        list[tuple[str, list[tuple[str, IO[bytes]]]]],
     ]:
         test_reports: list[
             tuple[str, dict[str, Any], datetime | None, datetime | None]
         ] = []
-        coverage_members: list[tuple[str, list[tuple[str, bytes]]]] = []
+        coverage_members: list[tuple[str, list[tuple[str, IO[bytes]]]]] = []
 
         async with _gitlab_code_client_from_connector(connector) as client:
             try:
@@ -2013,7 +2019,7 @@ def _fetch_gitlab_test_reports_sync(
                         )
                     except Exception:
                         jobs = []
-                    members: list[tuple[str, bytes]] = []
+                    members: list[tuple[str, IO[bytes]]] = []
                     artifact_jobs = 0
                     for job in jobs:
                         if artifact_jobs >= MAX_ARTIFACTS_PER_RUN:
@@ -2039,7 +2045,7 @@ def _fetch_gitlab_test_reports_sync(
                             continue
                         try:
                             members.extend(
-                                iter_zip_members(data, name_filter=_is_report_name)
+                                iter_zip_member_files(data, name_filter=_is_report_name)
                             )
                         except zipfile.BadZipFile:
                             continue
@@ -2047,6 +2053,10 @@ def _fetch_gitlab_test_reports_sync(
                         coverage_members.append((run_id, members))
 
                 return test_reports, coverage_members
+            except BaseException:
+                for _, run_members in coverage_members:
+                    close_report_members(run_members)
+                raise
             finally:
                 drained_observations.extend(client.drain_usage_observations())
 
@@ -2145,46 +2155,61 @@ async def _sync_gitlab_test_reports(
         usage_sink,
     )
 
-    suite_rows: list[Any] = []
-    case_rows: list[Any] = []
-    coverage_rows: list[Any] = []
-    for run_id, report, started_at, finished_at in test_reports:
-        if (
-            until is not None
-            and isinstance(started_at, datetime)
-            and started_at.astimezone(timezone.utc) > until
+    if not test_reports and not coverage_members:
+        logging.info("TestOps GitLab project %s: no test reports", project_id)
+        return
+    # Rows go to the sink in ``BATCH_SIZE`` batches as pipelines are parsed,
+    # so a sync never holds every pipeline's cases at once.
+    try:
+        async with (
+            AsyncBatchCollector(ingestion_sink.insert_test_suite_results) as suite_rows,
+            AsyncBatchCollector(ingestion_sink.insert_test_case_results) as case_rows,
+            AsyncBatchCollector(
+                ingestion_sink.insert_coverage_snapshots
+            ) as coverage_rows,
         ):
-            continue
-
-        suites, cases = await process_gitlab_test_report(
-            repo_id=repo_id,
-            run_id=run_id,
-            report=report,
-            org_id=org_id,
-            started_at=started_at,
-            finished_at=finished_at,
-        )
-        suite_rows.extend(suites)
-        case_rows.extend(cases)
-    for run_id, members in coverage_members:
-        # Keep only coverage rows; suites/cases come from the native report.
-        _, _, coverage = await ingest_report_members(
-            members, repo_id=repo_id, run_id=run_id, org_id=org_id
-        )
-        coverage_rows.extend(coverage)
-
-    if suite_rows:
-        await ingestion_sink.insert_test_suite_results(suite_rows)
-    if case_rows:
-        await ingestion_sink.insert_test_case_results(case_rows)
-    if coverage_rows:
-        await ingestion_sink.insert_coverage_snapshots(coverage_rows)
+            for run_id, report, started_at, finished_at in test_reports:
+                if (
+                    until is not None
+                    and isinstance(started_at, datetime)
+                    and started_at.astimezone(timezone.utc) > until
+                ):
+                    continue
+
+                suites, cases = await process_gitlab_test_report(
+                    repo_id=repo_id,
+                    run_id=run_id,
+                    report=report,
+                    org_id=org_id,
+                    started_at=started_at,
+                    finished_at=finished_at,
+                )
+                for suite in suites:
+                    suite_rows.add(suite)
+                for case in cases:
+                    case_rows.add(case)
+                await suite_rows.maybe_flush()
+                await case_rows.maybe_flush()
+            for run_id, members in coverage_members:
+                # Keep only coverage rows; suites/cases come from the native
+                # report.
+                _, _, coverage = await ingest_report_members(
+                    members, repo_id=repo_id, run_id=run_id, org_id=org_id
+                )
+                for snapshot in coverage:
+                    coverage_rows.add(snapshot)
+                await coverage_rows.maybe_flush()
+    finally:
+        # Every pipeline's artifacts are spooled by one client pass before
+        # parsing starts; a failure part-way must not leak the rest's files.
+        for _, members in coverage_members:
+            close_report_members(members)
     logging.info(
         "TestOps GitLab project %s: %d suites, %d cases, %d coverage",
         project_id,
-        len(suite_rows),
-        len(case_rows),
-        len(coverage_rows),
+        suite_rows.total,
+        case_rows.total,
+        coverage_rows.total,
     )
 
 
@@ -2261,6 +2286,7 @@ async def process_gitlab_project(
 
     connector_cls = cast(Any, GitLabConnector)
     connector = connector_cls(url=gitlab_url, private_token=token)
+    connector.validator_scope = str(getattr(store, "org_id", "") or "")
     try:
         # 1. Fetch Project Info
         logging.info("Fetching project information...")
@@ -2550,6 +2576,7 @@ async def process_gitlab_projects_batch(
     logging.info("=== GitLab Batch Project Processing ===")
     connector_cls = cast(Any, GitLabConnector)
     connector = connector_cls(url=gitlab_url, private_token=token)
+    connector.validator_scope = str(getattr(store, "org_id", "") or "")
     loop = asyncio.get_running_loop()
     ingestion_sink = IngestionSink(store)
 
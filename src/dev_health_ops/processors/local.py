@@ -10,6 +10,7 @@ from typing import Any
 from dev_health_ops.metrics.sinks.ingestion import IngestionSink
 from dev_health_ops.models.git import (
     GitBlame,
+    GitBlameHunk,
     GitCommit,
     GitCommitStat,
     GitFile,
@@ -27,6 +28,13 @@ from dev_health_ops.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Local blame storage: "lines" writes one git_blame row per line (with text);
+# "hunks" writes compact git_blame_hunks ranges and re-blames only files whose
+# HEAD blob changed since the previous compact sync.
+BLAME_MODE_LINES = "lines"
+BLAME_MODE_HUNKS = "hunks"
+_BLAME_MODE_ENV = "LOCAL_BLAME_MODE"
+
 _GITHUB_MERGE_PR_RE = re.compile(
     r"^Merge pull request #(?P<number>\d+)\b",
     re.MULTILINE,
@@ -582,6 +590,128 @@ async def process_files_and_blame(
         logging.warning(f"Failed to process {len(failed_files)} files")
 
 
+def resolve_blame_mode(blame_mode: str | None, ingestion_sink: IngestionSink) -> str:
+    """Pick the blame storage mode, falling back to lines when unsupported."""
+    mode = (blame_mode or os.getenv(_BLAME_MODE_ENV) or BLAME_MODE_LINES).lower()
+    if mode not in (BLAME_MODE_LINES, BLAME_MODE_HUNKS):
+        raise ValueError(
+            f"Unknown blame mode {mode!r}; expected "
+            f"{BLAME_MODE_LINES!r} or {BLAME_MODE_HUNKS!r}"
+        )
+    if mode == BLAME_MODE_HUNKS and not ingestion_sink.supports_blame_hunks:
+        logging.warning(
+            "Compact blame is not supported by this store; using per-line blame"
+        )
+        return BLAME_MODE_LINES
+    return mode
+
+
+def _head_blob_shas(repo_obj: Any) -> dict[str, str]:
+    """Map every file tracked at HEAD to its blob SHA."""
+    try:
+        tree = repo_obj.head.commit.tree
+    except ValueError:
+        # Repository without commits.
+        return {}
+    return {item.path: item.hexsha for item in tree.traverse() if item.type == "blob"}
+
+
+def _blame_hunks_sync(
+    repo_root: str, rel_path: str, repo_id: uuid.UUID, blob_sha: str
+) -> list[GitBlameHunk]:
+    hunks = GitBlame.fetch_blame_hunks(
+        repo_root, os.path.join(repo_root, rel_path), repo_id, blob_sha, repo=None
+    )
+    if not hunks:
+        # Empty file: record the blob so it is not re-blamed every sync.
+        hunks = [GitBlameHunk.tombstone(repo_id, rel_path)]
+        hunks[0].blob_sha = blob_sha
+    return hunks
+
+
+async def process_blame_hunks(
+    repo: Repo,
+    repo_obj: Any,
+    ingestion_sink: IngestionSink,
+    repo_root_path: str,
+) -> None:
+    """
+    Incrementally blame a local repo into compact line-range hunks.
+
+    Only files whose HEAD blob differs from the previous compact sync are
+    re-blamed; files removed from HEAD get a tombstone hunk. Every hunk from
+    this run shares one ``last_synced`` so readers can select each file's
+    latest generation, and older generations of the rewritten files are
+    pruned in a single delete once this run's rows are stored.
+    """
+    head_blobs = _head_blob_shas(repo_obj)
+    known_blobs = await ingestion_sink.get_blame_hunk_blobs(repo.id)
+    changed = sorted(
+        path for path, sha in head_blobs.items() if known_blobs.get(path) != sha
+    )
+    deleted = sorted(
+        path for path, sha in known_blobs.items() if sha and path not in head_blobs
+    )
+    logging.info(
+        "Compact blame: %d changed, %d deleted, %d unchanged files",
+        len(changed),
+        len(deleted),
+        len(head_blobs) - len(changed),
+    )
+
+    synced_at = datetime.now(timezone.utc)
+    hunk_batch: list[GitBlameHunk] = [
+        GitBlameHunk.tombstone(repo.id, path) for path in deleted
+    ]
+    written: list[str] = list(deleted)
+    failed = 0
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+    async def _worker(rel_path: str) -> list[GitBlameHunk]:
+        async with semaphore:
+            return await loop.run_in_executor(
+                None,
+                _blame_hunks_sync,
+                repo_root_path,
+                rel_path,
+                repo.id,
+                head_blobs[rel_path],
+            )
+
+    chunk_size = BATCH_SIZE * 2
+    for i in range(0, len(changed), chunk_size):
+        chunk = changed[i : i + chunk_size]
+        results = await asyncio.gather(
+            *(_worker(path) for path in chunk), return_exceptions=True
+        )
+        for path, result in zip(chunk, results):
+            if isinstance(result, BaseException):
+                # Nothing is written, so the file is retried next sync.
+                logging.debug(f"Compact blame failed for {path}: {result}")
+                failed += 1
+                continue
+            hunk_batch.extend(result)
+            written.append(path)
+        if len(hunk_batch) >= BATCH_SIZE:
+            for hunk in hunk_batch:
+                hunk.last_synced = synced_at
+            await ingestion_sink.insert_blame_hunks(hunk_batch)
+            hunk_batch = []
+
+    if hunk_batch:
+        for hunk in hunk_batch:
+            hunk.last_synced = synced_at
+        await ingestion_sink.insert_blame_hunks(hunk_batch)
+    # One mutation per sync, limited to paths that had an older generation:
+    # ClickHouse rewrites every affected part per ALTER ... DELETE.
+    superseded = [path for path in written if path in known_blobs]
+    if superseded:
+        await ingestion_sink.prune_blame_hunks(repo.id, superseded, synced_at)
+    if failed:
+        logging.warning(f"Failed to blame {failed} files")
+
+
 async def process_local_repo(
     store: Any,
     repo_path: str,
@@ -590,11 +720,14 @@ async def process_local_repo(
     sync_git: bool = True,
     sync_prs: bool = True,
     sync_blame: bool = True,
+    blame_mode: str | None = None,
 ) -> None:
     """
     Orchestrate the local repository sync pipeline.
 
-    Use the sync_* flags to control which stages run.
+    Use the sync_* flags to control which stages run. ``blame_mode`` selects
+    per-line ("lines") or compact incremental ("hunks") blame storage and
+    defaults to ``LOCAL_BLAME_MODE`` or "lines".
     """
     repo_root = Path(repo_path).resolve()
     logging.info("Processing local repository at %s", repo_root)
@@ -630,8 +763,9 @@ async def process_local_repo(
         await process_git_commit_stats(repo, ingestion_sink, commits_for_stats, since)
 
     if sync_blame or fetch_blame:
+        mode = resolve_blame_mode(blame_mode, ingestion_sink)
         files_for_blame = set()
-        if fetch_blame:
+        if fetch_blame and mode == BLAME_MODE_LINES:
             files_for_blame = set(collect_changed_files(repo_root, commits_iter))
 
         all_files_path = []
@@ -652,6 +786,8 @@ async def process_local_repo(
             ingestion_sink,
             str(repo_root),
         )
+        if mode == BLAME_MODE_HUNKS:
+            await process_blame_hunks(repo, repo_obj, ingestion_sink, str(repo_root))
 
     logging.info("Local repository processing complete.")
 
@@ -660,9 +796,15 @@ async def process_local_blame(
     store: Any,
     repo_path: str,
     since: datetime | None = None,
+    blame_mode: str | None = None,
 ) -> None:
     """
     Backfill git blame data without syncing commits or PRs.
+
+    In "hunks" mode only files whose HEAD blob changed since the previous
+    compact sync are re-blamed, regardless of ``since``. File contents are
+    still written to ``git_files`` because compact hunks carry no line text
+    for the complexity scan.
     """
     repo_root = Path(repo_path).resolve()
     logging.info("Processing local blame at %s", repo_root)
@@ -679,11 +821,6 @@ async def process_local_blame(
     from git import Repo as GitPythonRepo
 
     repo_obj = GitPythonRepo(str(repo_root))
-    commits_iter = list(iter_commits_since(repo_obj, since))
-    files_for_blame = (
-        set(collect_changed_files(repo_root, commits_iter)) if commits_iter else set()
-    )
-
     all_files_path = []
     for root, _, files in os.walk(str(repo_root)):
         root_path = Path(root)
@@ -693,6 +830,19 @@ async def process_local_blame(
             file_path = (root_path / file).resolve()
             all_files_path.append(file_path)
 
+    if resolve_blame_mode(blame_mode, ingestion_sink) == BLAME_MODE_HUNKS:
+        await process_files_and_blame(
+            repo, all_files_path, set(), ingestion_sink, str(repo_root)
+        )
+        await process_blame_hunks(repo, repo_obj, ingestion_sink, str(repo_root))
+        logging.info("Local blame sync complete.")
+        return
+
+    commits_iter = list(iter_commits_since(repo_obj, since))
+    files_for_blame = (
+        set(collect_changed_files(repo_root, commits_iter)) if commits_iter else set()
+    )
+
     if not files_for_blame:
         files_for_blame_path = set(all_files_path)
     else:
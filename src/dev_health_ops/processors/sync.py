@@ -12,6 +12,7 @@ from dev_health_ops.db import resolve_sink_uri
 from dev_health_ops.fixtures.demo_identity import DEFAULT_DEMO_REPO_NAME
 from dev_health_ops.metrics.sinks.ingestion import IngestionSink
 from dev_health_ops.processors.github import (
+    GitHubCommitStatDetail,
     process_github_repo,
     process_github_repos_batch,
 )
@@ -198,6 +199,9 @@ async def sync_github_target(ns: argparse.Namespace, target: str) -> int:
     since = resolve_since_datetime(ns)
     max_commits = resolve_max_commits(ns)
     flags = _sync_flags_for_target(target)
+    commit_stats_detail = GitHubCommitStatDetail(
+        getattr(ns, "commit_stats_detail", None) or GitHubCommitStatDetail.FILES
+    )
 
     async def _handler(store):
         if ns.search:
@@ -224,6 +228,7 @@ async def sync_github_target(ns: argparse.Namespace, target: str) -> int:
                 "blame_only": flags["blame_only"],
                 "backfill_missing": True,
                 "since": since,
+                "commit_stats_detail": commit_stats_detail,
             }
             if max_commits is not None:
                 batch_kwargs["max_commits_per_repo"] = max_commits
@@ -249,6 +254,7 @@ async def sync_github_target(ns: argparse.Namespace, target: str) -> int:
             sync_security=flags["sync_security"],
             sync_tests=flags["sync_tests"],
             since=since,
+            commit_stats_detail=commit_stats_detail,
         )
 
     await run_with_store(db_uri, db_type, _handler, org_id=getattr(ns, "org", None))
@@ -433,6 +439,13 @@ def _add_sync_target_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--max-repos", type=int)
     parser.add_argument("--use-async", action="store_true")
     parser.add_argument("--max-commits-per-repo", type=int)
+    parser.add_argument(
+        "--commit-stats-detail",
+        choices=[detail.value for detail in GitHubCommitStatDetail],
+        default=GitHubCommitStatDetail.FILES.value,
+        help="GitHub commit stats: per-file rows, or one totals row per commit "
+        "fetched in batched GraphQL queries (GitHub provider).",
+    )
     parser.add_argument(
         "--repo-name",
         help=f"Synthetic repo name (default: {DEFAULT_DEMO_REPO_NAME}).",
@@ -6,6 +6,7 @@ from collections import Counter
 from collections.abc import Mapping
 
 from dev_health_ops.metrics.testops_schemas import CoverageSnapshotRow
+from dev_health_ops.parsers import ReportSource
 from dev_health_ops.parsers.coverage import CoverageReport, parse_coverage_report
 from dev_health_ops.processors.testops_tests import attribute_service_from_path
 
@@ -49,7 +50,7 @@ async def process_coverage_report(
     *,
     repo_id: uuid.UUID,
     run_id: str,
-    source: str,
+    source: ReportSource,
     report_format: str | None = None,
     commit_hash: str | None = None,
     branch: str | None = None,
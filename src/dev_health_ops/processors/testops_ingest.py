@@ -1,10 +1,10 @@
 """Shared TestOps report-ingestion helpers (CHAOS-2370).
 
-GitHub and GitLab both end up with a set of in-memory report files (JUnit XML
-and coverage XML) extracted from CI artifacts. This module classifies those
-files and turns them into insert-ready rows, reusing the canonical
-``process_test_report`` / ``process_coverage_report`` builders so both providers
-emit identical row shapes and coherence guarantees.
+GitHub and GitLab both end up with a set of report files (JUnit XML and
+coverage XML) extracted from CI artifacts into spooled temp files. This module
+classifies those files and turns them into insert-ready rows, reusing the
+canonical ``process_test_report`` / ``process_coverage_report`` builders so
+both providers emit identical row shapes and coherence guarantees.
 
 Volume caps live here (and in ``connectors.utils.safe_archive``) so a single
 sync can't download/parse an unbounded number of artifacts.
@@ -12,10 +12,12 @@ sync can't download/parse an unbounded number of artifacts.
 
 from __future__ import annotations
 
+import io
 import logging
 import uuid
 from collections.abc import Iterable
 from datetime import datetime
+from typing import IO
 
 from dev_health_ops.metrics.testops_schemas import (
     CoverageSnapshotRow,
@@ -60,6 +62,12 @@ def classify_report(filename: str, text: str) -> str | None:
     return None
 
 
+def _member_text(content: bytes | IO[bytes]) -> IO[str]:
+    """Decode an artifact member leniently; closing the result closes ``content``."""
+    binary = io.BytesIO(content) if isinstance(content, bytes) else content
+    return io.TextIOWrapper(binary, encoding="utf-8", errors="replace")  # type: ignore[arg-type]
+
+
 def _coverage_is_coherent(row: CoverageSnapshotRow) -> bool:
     """Reject coverage rows with impossible values (Codex review item I).
 
@@ -83,7 +91,7 @@ def _coverage_is_coherent(row: CoverageSnapshotRow) -> bool:
 
 
 async def ingest_report_members(
-    members: Iterable[tuple[str, bytes]],
+    members: Iterable[tuple[str, bytes | IO[bytes]]],
     *,
     repo_id: uuid.UUID,
     run_id: str,
@@ -96,6 +104,10 @@ async def ingest_report_members(
 ]:
     """Parse extracted artifact members into insert-ready rows.
 
+    Members are ``(filename, content)`` where ``content`` is bytes or a binary
+    file (e.g. from ``iter_zip_member_files``); files are streamed through the
+    parsers and closed, including any left unread past the per-run cap.
+
     ``run_id`` MUST match the pipeline run's id so suite/case/coverage rows join
     to the pipeline. ``started_at`` / ``finished_at`` (the CI run's timestamps)
     date suites whose JUnit XML lacks a ``timestamp`` attribute. A single
@@ -106,60 +118,69 @@ async def ingest_report_members(
     coverage_rows: list[CoverageSnapshotRow] = []
 
     processed = 0
-    for filename, content in members:
-        if processed >= MAX_REPORTS_PER_RUN:
-            logger.warning(
-                "Hit per-run report cap (%d) for run %s; skipping remainder",
-                MAX_REPORTS_PER_RUN,
-                run_id,
-            )
-            break
-        try:
-            text = content.decode("utf-8", errors="replace")
-        except Exception:  # pragma: no cover - decode is defensive
-            continue
-        kind = classify_report(filename, text)
-        if kind is None:
-            continue
-        processed += 1
-        try:
-            if kind == "junit":
-                suites, cases = await process_test_report(
-                    repo_id=repo_id,
-                    run_id=run_id,
-                    source=text,
-                    team_id=team_id,
-                    org_id=org_id,
-                    started_at=started_at,
-                    finished_at=finished_at,
-                )
-                suite_rows.extend(suites)
-                case_rows.extend(cases)
-            else:  # coverage
-                coverage = await process_coverage_report(
-                    repo_id=repo_id,
-                    run_id=run_id,
-                    source=text,
-                    team_id=team_id,
-                    org_id=org_id,
-                    report_path=filename,
-                )
-                if _coverage_is_coherent(coverage):
-                    coverage_rows.append(coverage)
-                else:
+    remaining = iter(members)
+    try:
+        for filename, content in remaining:
+            with _member_text(content) as text:
+                if processed >= MAX_REPORTS_PER_RUN:
+                    logger.warning(
+                        "Hit per-run report cap (%d) for run %s; skipping remainder",
+                        MAX_REPORTS_PER_RUN,
+                        run_id,
+                    )
+                    break
+                kind = classify_report(filename, text.read(2048))
+                if kind is None:
+                    continue
+                text.seek(0)
+                processed += 1
+                try:
+                    if kind == "junit":
+                        suites, cases = await process_test_report(
+                            repo_id=repo_id,
+                            run_id=run_id,
+                            source=text,
+                            team_id=team_id,
+                            org_id=org_id,
+                            started_at=started_at,
+                            finished_at=finished_at,
+                        )
+                        suite_rows.extend(suites)
+                        case_rows.extend(cases)
+                    else:  # coverage
+                        coverage = await process_coverage_report(
+                            repo_id=repo_id,
+                            run_id=run_id,
+                            source=text,
+                            team_id=team_id,
+                            org_id=org_id,
+                            report_path=filename,
+                        )
+                        if _coverage_is_coherent(coverage):
+                            coverage_rows.append(coverage)
+                        else:
+                            logger.warning(
+                                "Dropping incoherent coverage row from %s (run %s)",
+                                filename,
+                                run_id,
+                            )
+                except Exception as exc:
                     logger.warning(
-                        "Dropping incoherent coverage row from %s (run %s)",
+                        "Failed to parse %s report %s (run %s): %s",
+                        kind,
                         filename,
                         run_id,
+                        exc,
                     )
-        except Exception as exc:
-            logger.warning(
-                "Failed to parse %s report %s (run %s): %s",
-                kind,
-                filename,
-                run_id,
-                exc,
-            )
-            continue
+                    continue
+    finally:
+        close_report_members(remaining)
 
     return suite_rows, case_rows, coverage_rows
+
+
+def close_report_members(members: Iterable[tuple[str, bytes | IO[bytes]]]) -> None:
+    """Close the spooled files among ``members`` (closing twice is harmless)."""
+    for _, content in members:
+        if not isinstance(content, bytes):
+            content.close()
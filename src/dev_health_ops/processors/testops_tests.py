@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import uuid
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from typing import Any
 
 from dev_health_ops.metrics.testops_schemas import TestCaseResultRow, TestSuiteResultRow
+from dev_health_ops.parsers import ReportSource
 from dev_health_ops.parsers.junit import (
     CANONICAL_TEST_STATUSES,
     ParsedTestCase,
     ParsedTestSuite,
-    parse_junit_xml,
+    iter_junit_suites,
 )
 
 # GitLab's native test_report API reports case status as one of these strings;
@@ -151,7 +152,7 @@ def _parsed_suites_from_gitlab_report(
 
 
 def _build_rows_from_parsed(
-    parsed_suites: list[ParsedTestSuite],
+    parsed_suites: Iterable[ParsedTestSuite],
     *,
     repo_id: uuid.UUID,
     run_id: str,
@@ -236,7 +237,7 @@ async def process_test_report(
     *,
     repo_id: uuid.UUID,
     run_id: str,
-    source: str,
+    source: ReportSource,
     environment: str | None = None,
     framework: str | None = None,
     team_id: str | None = None,
@@ -247,12 +248,13 @@ async def process_test_report(
 ) -> tuple[list[TestSuiteResultRow], list[TestCaseResultRow]]:
     """Parse a JUnit XML report (from a CI artifact) into insert-ready rows.
 
-    ``started_at`` / ``finished_at`` are the CI run's timestamps, used to date
-    suites that carry no ``timestamp`` of their own (see _build_rows_from_parsed).
+    ``source`` may be an open file; suites are turned into rows as they are
+    parsed. ``started_at`` / ``finished_at`` are the CI run's timestamps, used
+    to date suites that carry no ``timestamp`` of their own (see
+    _build_rows_from_parsed).
     """
-    parsed_suites = parse_junit_xml(source)
     return _build_rows_from_parsed(
-        parsed_suites,
+        iter_junit_suites(source),
         repo_id=repo_id,
         run_id=run_id,
         environment=environment,
@@ -0,0 +1,245 @@
+"""Conditional-request validator cache for provider REST transports.
+
+Incremental syncs re-read the same repo metadata, workflow-run pages,
+deployments and alert pages on every run. ``InstrumentedRESTCore`` can send
+``If-None-Match`` / ``If-Modified-Since`` for those GETs when it is given a
+:class:`ValidatorCache`: a successful response's ``ETag`` / ``Last-Modified``
+is stored together with a compressed copy of its body, and a later
+``304 Not Modified`` is answered by replaying that body. GitHub does not count
+a 304 against the primary rate limit, so every hit is rate-limit headroom.
+
+Storage is any ``core.cache.CacheBackend``: Redis for shared workers, the
+on-disk ``FileBackend`` for a single host, or memory in tests. Keys combine
+the tenant scope (org id), a fingerprint of the credential headers (never the
+token itself) and the full request URL, so neither tenants nor credentials
+with different visibility share an entry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import functools
+import hashlib
+import logging
+import os
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from dev_health_ops.core.cache import (
+    CacheBackend,
+    FileBackend,
+    MemoryBackend,
+    RedisBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+#: ``redis://...`` / ``rediss://...``, ``file:///path`` (or a bare path), or
+#: ``memory``. Unset disables conditional requests.
+VALIDATOR_CACHE_URL_ENV = "PROVIDER_VALIDATOR_CACHE_URL"
+VALIDATOR_CACHE_TTL_ENV = "PROVIDER_VALIDATOR_CACHE_TTL_SECONDS"
+DEFAULT_VALIDATOR_TTL_SECONDS = 7 * 24 * 3600
+
+# Compressed-body ceiling; larger pages are simply not cached.
+MAX_CACHED_BODY_BYTES = 1024 * 1024
+
+_KEY_PREFIX = "provider_validator"
+
+# Headers that identify the caller. Only their digest enters the cache key.
+_CREDENTIAL_HEADER_NAMES = ("authorization", "private-token", "job-token")
+
+# Response headers a replay must carry for callers and paginators to behave
+# exactly as on the original 200 (Link / X-Next-Page drive pagination).
+_REPLAYED_HEADER_NAMES = (
+    "content-type",
+    "link",
+    "x-next-page",
+    "x-page",
+    "x-per-page",
+    "x-total",
+    "x-total-pages",
+)
+
+
+def credential_fingerprint(headers: Mapping[str, str]) -> str:
+    """Stable digest of the credential-bearing request headers."""
+    lowered = {str(k).lower(): str(v) for k, v in headers.items()}
+    material = "\n".join(
+        f"{name}={lowered[name]}"
+        for name in _CREDENTIAL_HEADER_NAMES
+        if name in lowered
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+def validator_cache_key(*, scope: str, fingerprint: str, url: str) -> str:
+    digest = hashlib.sha256(f"{scope}\n{fingerprint}\n{url}".encode()).hexdigest()
+    return f"{_KEY_PREFIX}:{digest}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored 200 response and the validators to revalidate it with."""
+
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: bytes
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def replay(self, not_modified: httpx.Response) -> httpx.Response:
+        """Build the 200 the server would have sent instead of ``not_modified``.
+
+        The 304's own validators and rate-limit headers win over the cached
+        ones; payload and pagination headers come from the cache.
+        """
+        headers = dict(self.headers)
+        for name, value in not_modified.headers.items():
+            if name.lower() not in _REPLAYED_HEADER_NAMES:
+                headers[name] = value
+        headers.pop("content-length", None)
+        headers.pop("content-encoding", None)
+        return httpx.Response(
+            200,
+            headers=headers,
+            content=self.body,
+            request=not_modified.request,
+        )
+
+    def to_value(self) -> dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "headers": self.headers,
+            "body": base64.b64encode(zlib.compress(self.body)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_value(cls, value: Any) -> CachedResponse | None:
+        if not isinstance(value, Mapping):
+            return None
+        try:
+            body = zlib.decompress(base64.b64decode(str(value["body"])))
+        except (KeyError, ValueError, zlib.error):
+            return None
+        headers = value.get("headers")
+        return cls(
+            etag=value.get("etag") or None,
+            last_modified=value.get("last_modified") or None,
+            headers=dict(headers) if isinstance(headers, Mapping) else {},
+            body=body,
+        )
+
+
+class ValidatorCache:
+    """ETag / Last-Modified store over a ``CacheBackend``.
+
+    :meth:`lookup_async` / :meth:`store_async` are what the async transport
+    calls: Redis round trips and ``FileBackend`` file I/O (including its
+    periodic sweep) run in a worker thread instead of on the event loop. The
+    in-process ``MemoryBackend`` is called inline.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: int = DEFAULT_VALIDATOR_TTL_SECONDS,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._blocking = not isinstance(backend, MemoryBackend)
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        return CachedResponse.from_value(self.backend.get(key))
+
+    async def lookup_async(self, key: str) -> CachedResponse | None:
+        if not self._blocking:
+            return self.lookup(key)
+        return await asyncio.to_thread(self.lookup, key)
+
+    async def store_async(self, key: str, response: httpx.Response) -> bool:
+        if not self._blocking:
+            return self.store(key, response)
+        return await asyncio.to_thread(self.store, key, response)
+
+    def store(self, key: str, response: httpx.Response) -> bool:
+        """Store a 200 that carries a validator; return whether it was kept."""
+        if response.status_code != 200:
+            return False
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+        entry = CachedResponse(
+            etag=etag,
+            last_modified=last_modified,
+            headers={
+                name: response.headers[name]
+                for name in _REPLAYED_HEADER_NAMES
+                if name in response.headers
+            },
+            body=response.content,
+        )
+        value = entry.to_value()
+        if len(value["body"]) > MAX_CACHED_BODY_BYTES:
+            return False
+        self.backend.set(key, value, self.ttl_seconds)
+        return True
+
+
+def create_validator_cache(
+    url: str | None = None, *, ttl_seconds: int | None = None
+) -> ValidatorCache | None:
+    """Build a validator cache from ``url`` (or ``PROVIDER_VALIDATOR_CACHE_URL``).
+
+    Returns ``None`` when neither is set, which leaves conditional requests off.
+    """
+    url = (url or os.getenv(VALIDATOR_CACHE_URL_ENV) or "").strip()
+    if not url:
+        return None
+    if ttl_seconds is None:
+        raw_ttl = os.getenv(VALIDATOR_CACHE_TTL_ENV, "").strip()
+        try:
+            ttl_seconds = int(raw_ttl) if raw_ttl else DEFAULT_VALIDATOR_TTL_SECONDS
+        except ValueError:
+            logger.warning(
+                "Ignoring non-integer %s=%r", VALIDATOR_CACHE_TTL_ENV, raw_ttl
+            )
+            ttl_seconds = DEFAULT_VALIDATOR_TTL_SECONDS
+
+    backend: CacheBackend
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        backend = RedisBackend(url)
+    elif url == "memory":
+        backend = MemoryBackend()
+    else:
+        backend = FileBackend(url.removeprefix("file://"))
+    return ValidatorCache(backend, ttl_seconds=ttl_seconds)
+
+
+@functools.lru_cache(maxsize=1)
+def default_validator_cache() -> ValidatorCache | None:
+    """Process-wide cache from the environment, shared by every client."""
+    return create_validator_cache()
+
+
+__all__ = [
+    "CachedResponse",
+    "ValidatorCache",
+    "create_validator_cache",
+    "credential_fingerprint",
+    "default_validator_cache",
+    "validator_cache_key",
+]
@@ -49,6 +49,12 @@ from dev_health_ops.exceptions import (
     PaginationException,
     RateLimitException,
 )
+from dev_health_ops.providers._conditional import (
+    CachedResponse,
+    ValidatorCache,
+    credential_fingerprint,
+    validator_cache_key,
+)
 from dev_health_ops.providers._ratelimit import resolve_retry_after_seconds
 from dev_health_ops.providers.usage import OperationResolver, UsageRecorder
 from dev_health_ops.sync.budget_types import BudgetDimension
@@ -235,6 +241,17 @@ class InstrumentedRESTCore:
         non-retryable status) BEFORE the built-in default classification. May
         raise a domain-specific exception (e.g. GitHub's 403 triage); if it
         returns without raising, the default classification below still runs.
+    :param validator_cache: Optional conditional-request cache
+        (``providers/_conditional.py``). When set, every parameterised GET
+        sends the stored ``If-None-Match`` / ``If-Modified-Since`` and a 304
+        is answered with the stored body as a 200, so callers and both
+        paginators never see it. Each such replay is recorded as a
+        ``conditional_hit`` on the usage observation.
+    :param validator_scope: Tenant scope (org id) mixed into validator cache
+        keys alongside the credential fingerprint and URL.
+    :param not_modified_is_rate_limited: ``False`` for providers that do not
+        charge a 304 against the primary rate limit (GitHub); such hits are
+        also recorded as ``rate_limit_exempt``.
     """
 
     base_url: str
@@ -251,9 +268,13 @@ class InstrumentedRESTCore:
     resolve_retry_after: ResolveRetryAfter | None = None
     classify_error: ClassifyError | None = None
     transport: httpx.AsyncBaseTransport | None = None
+    validator_cache: ValidatorCache | None = None
+    validator_scope: str = ""
+    not_modified_is_rate_limited: bool = True
 
     def __post_init__(self) -> None:
         self._usage = UsageRecorder(resolver=self.resolver)
+        self._credential_fingerprint = credential_fingerprint(self.headers)
         self._client: httpx.AsyncClient | None = None
         self._bare_client: httpx.AsyncClient | None = None
 
@@ -340,6 +361,19 @@ class InstrumentedRESTCore:
         delay = self.initial_backoff_seconds
         last_network_exc: Exception | None = None
 
+        cache_key: str | None = None
+        cached: CachedResponse | None = None
+        if self.validator_cache is not None and method.upper() == "GET":
+            cache_key = validator_cache_key(
+                scope=self.validator_scope,
+                fingerprint=self._credential_fingerprint,
+                url=str(client.build_request(method, path, params=params).url),
+            )
+            cached = await self.validator_cache.lookup_async(cache_key)
+            if cached is not None:
+                # Caller-supplied validators win over the stored ones.
+                headers = {**cached.conditional_headers(), **(headers or {})}
+
         for attempt in range(self.max_retries):
             try:
                 response = await client.request(
@@ -363,9 +397,17 @@ class InstrumentedRESTCore:
                     f"{self.provider} request failed on {operation}: {exc}"
                 ) from exc
 
+            if response.status_code == 304 and cached is not None:
+                self._record_response_usage(
+                    response, operation=operation, conditional_hit=True
+                )
+                return cached.replay(response)
+
             self._record_response_usage(response, operation=operation)
 
             if response.status_code < 300:
+                if cache_key is not None and self.validator_cache is not None:
+                    await self.validator_cache.store_async(cache_key, response)
                 return response
 
             if response.status_code < 400:
@@ -660,7 +702,11 @@ class InstrumentedRESTCore:
     # ------------------------------------------------------------------
 
     def _record_response_usage(
-        self, response: httpx.Response, *, operation: str
+        self,
+        response: httpx.Response,
+        *,
+        operation: str,
+        conditional_hit: bool = False,
     ) -> None:
         safe_headers = _diagnostic_headers(
             response.headers, self.diagnostic_header_names
@@ -671,6 +717,8 @@ class InstrumentedRESTCore:
             headers=safe_headers,
             rate_limit=_default_rate_limit_fields(safe_headers),
             status=response.status_code,
+            conditional_hit=conditional_hit,
+            rate_limit_exempt=conditional_hit and not self.not_modified_is_rate_limited,
         )
 
     def drain_usage_observations(self) -> list[dict[str, Any]]:
@@ -37,6 +37,7 @@ from dev_health_ops.exceptions import (
     NotFoundException,
     RateLimitException,
 )
+from dev_health_ops.providers._conditional import ValidatorCache
 from dev_health_ops.providers._http import (
     GITHUB_DIAGNOSTIC_HEADER_NAMES,
     InstrumentedRESTCore,
@@ -48,9 +49,11 @@ from dev_health_ops.providers.github.graphql import (
     BLAME_QUERY,
     blame_variables,
     build_blob_texts_query,
+    build_commit_totals_query,
     github_graphql_url,
     parse_blame_response,
     parse_blob_texts_response,
+    parse_commit_totals_response,
     raise_for_graphql_errors,
 )
 from dev_health_ops.providers.github.ratelimit import (
@@ -130,6 +133,13 @@ class GitHubCommitFileStatData:
     new_file_mode: str = "unknown"
 
 
+@dataclass(frozen=True)
+class GitHubCommitTotalsData:
+    commit_hash: str
+    additions: int
+    deletions: int
+
+
 @dataclass(frozen=True)
 class GitHubPullData:
     pull_id: str
@@ -595,10 +605,20 @@ class GitHubCodeClient:
         straight through to the owned ``InstrumentedRESTCore`` -- the seam
         parity tests use to mock GitHub's REST API (``httpx.MockTransport``),
         never live network (offline gate).
+    :param validator_cache: Optional conditional-request cache
+        (``providers/_conditional.py``). GitHub does not charge 304s against
+        the primary rate limit, so revalidated reads are recorded as
+        rate-limit exempt.
+    :param validator_scope: Tenant scope (org id) for validator cache keys.
     """
 
     def __init__(
-        self, *, auth: GitHubAuth, transport: httpx.AsyncBaseTransport | None = None
+        self,
+        *,
+        auth: GitHubAuth,
+        transport: httpx.AsyncBaseTransport | None = None,
+        validator_cache: ValidatorCache | None = None,
+        validator_scope: str = "",
     ) -> None:
         if not auth.token:
             raise ValueError("GitHubCodeClient requires a resolved token")
@@ -623,6 +643,9 @@ class GitHubCodeClient:
             resolve_retry_after=_resolve_github_retry_after,
             is_retryable_status=_github_is_retryable_status,
             transport=transport,
+            validator_cache=validator_cache,
+            validator_scope=validator_scope,
+            not_modified_is_rate_limited=False,
         )
 
     async def get_repo(self, owner: str, repo: str) -> GitHubRepositoryData:
@@ -1107,6 +1130,48 @@ class GitHubCodeClient:
             if isinstance(file_item, Mapping) and file_item.get("filename")
         ]
 
+    async def get_commit_totals(
+        self,
+        owner: str,
+        repo: str,
+        shas: list[str],
+        *,
+        batch_size: int = 50,
+    ) -> list[GitHubCommitTotalsData]:
+        """Fetch ``additions`` / ``deletions`` for many commits with one
+        aliased GraphQL query per ``batch_size`` shas, instead of one REST
+        commit-detail call each. Totals only -- callers that need per-file
+        rows use :meth:`get_commit_file_stats`. Shas the repository does not
+        resolve are omitted.
+        """
+        totals: list[GitHubCommitTotalsData] = []
+        for start in range(0, len(shas), batch_size):
+            chunk = shas[start : start + batch_size]
+            operation = (
+                f"{COMMIT_STATS_ROUTE_FAMILY}:POST /graphql "
+                f"(commit_totals x{len(chunk)})"
+            )
+            response = await self._core.request(
+                "POST",
+                self._graphql_url,
+                operation=operation,
+                headers={"Authorization": f"Bearer {self.auth.token}"},
+                json={
+                    "query": build_commit_totals_query(chunk),
+                    "variables": {"owner": owner, "repo": repo},
+                },
+            )
+            envelope = response.json()
+            raise_for_graphql_errors(envelope, operation=operation)
+            batch = parse_commit_totals_response(envelope.get("data") or {}, chunk)
+            totals.extend(
+                GitHubCommitTotalsData(
+                    commit_hash=sha, additions=additions, deletions=deletions
+                )
+                for sha, (additions, deletions) in batch.items()
+            )
+        return totals
+
     async def get_file_contents(
         self,
         owner: str,
@@ -1334,6 +1399,7 @@ __all__ = [
     "GitHubCodeClient",
     "GitHubCommitData",
     "GitHubCommitFileStatData",
+    "GitHubCommitTotalsData",
     "GitHubDeploymentData",
     "GitHubIssueData",
     "GitHubPullData",
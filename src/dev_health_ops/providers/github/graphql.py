@@ -32,7 +32,7 @@ from typing import Any
 from urllib.parse import urlsplit, urlunsplit
 
 from dev_health_ops.connectors.models import BlameRange, FileBlame
-from dev_health_ops.exceptions import APIException
+from dev_health_ops.exceptions import APIException, RateLimitException
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +104,21 @@ def build_blob_texts_query(ref: str, paths: list[str]) -> str:
     )
 
 
+def build_commit_totals_query(shas: list[str]) -> str:
+    """Build one query resolving ``additions`` / ``deletions`` for many
+    commits via field aliases (the ``build_blob_texts_query`` shape). A
+    GraphQL ``Commit`` carries only diff totals, never per-file detail."""
+    fields = [
+        f"c{i}: object(oid: {json.dumps(sha)}) "
+        "{ ... on Commit { additions deletions } }"
+        for i, sha in enumerate(shas)
+    ]
+    return (
+        "query($owner: String!, $repo: String!) {\n"
+        "  repository(owner: $owner, name: $repo) {\n" + "\n".join(fields) + "\n  }\n}"
+    )
+
+
 def raise_for_graphql_errors(envelope: Mapping[str, Any], *, operation: str) -> None:
     """Raise ``APIException`` for a GraphQL-level ``errors`` array.
 
@@ -112,6 +127,10 @@ def raise_for_graphql_errors(envelope: Mapping[str, Any], *, operation: str) ->
     loop never sees it -- this must be checked explicitly by the caller after
     a successful ``request()``, mirroring ``connectors/utils/graphql.py``'s
     ``"errors" in data`` check.
+
+    Primary (``type: RATE_LIMITED``) and secondary rate limits also arrive
+    this way; they raise ``RateLimitException`` so callers back off instead of
+    treating them as an ordinary failed query.
     """
     errors = envelope.get("errors") if isinstance(envelope, Mapping) else None
     if not errors:
@@ -119,9 +138,18 @@ def raise_for_graphql_errors(envelope: Mapping[str, Any], *, operation: str) ->
     error_messages = [
         e.get("message", str(e)) if isinstance(e, Mapping) else str(e) for e in errors
     ]
-    raise APIException(
-        f"GitHub GraphQL errors on {operation}: {'; '.join(error_messages)}"
-    )
+    message = f"GitHub GraphQL errors on {operation}: {'; '.join(error_messages)}"
+    if any(_is_rate_limit_error(e) for e in errors):
+        raise RateLimitException(message)
+    raise APIException(message)
+
+
+def _is_rate_limit_error(error: Any) -> bool:
+    if not isinstance(error, Mapping):
+        return False
+    if error.get("type") == "RATE_LIMITED":
+        return True
+    return "rate limit" in str(error.get("message", "")).lower()
 
 
 def parse_blob_texts_response(
@@ -142,6 +170,23 @@ def parse_blob_texts_response(
     return contents
 
 
+def parse_commit_totals_response(
+    payload: Mapping[str, Any], shas: list[str]
+) -> dict[str, tuple[int, int]]:
+    """Map each resolved sha to ``(additions, deletions)``. Unknown commits
+    (``object`` resolves to ``null``) are omitted."""
+    repo_data = payload.get("repository") or {}
+    totals: dict[str, tuple[int, int]] = {}
+    for i, sha in enumerate(shas):
+        commit = repo_data.get(f"c{i}") or {}
+        additions = commit.get("additions")
+        deletions = commit.get("deletions")
+        if additions is None or deletions is None:
+            continue
+        totals[sha] = (int(additions), int(deletions))
+    return totals
+
+
 def _parse_blame_commit_datetime(value: object) -> datetime | None:
     if not isinstance(value, str) or not value:
         return None
@@ -187,8 +232,10 @@ __all__ = [
     "GITHUB_GRAPHQL_PATH",
     "blame_variables",
     "build_blob_texts_query",
+    "build_commit_totals_query",
     "github_graphql_url",
     "parse_blame_response",
     "parse_blob_texts_response",
+    "parse_commit_totals_response",
     "raise_for_graphql_errors",
 ]
@@ -70,6 +70,7 @@ from dev_health_ops.exceptions import (
     NotFoundException,
     RateLimitException,
 )
+from dev_health_ops.providers._conditional import ValidatorCache
 from dev_health_ops.providers._http import (
     GITLAB_DIAGNOSTIC_HEADER_NAMES,
     InstrumentedRESTCore,
@@ -480,6 +481,9 @@ class GitLabCodeClient:
     :param max_retries: Maximum retry attempts on 429 / header-qualified 403
         / 5xx errors.
     :param transport: Optional httpx transport override (tests only).
+    :param validator_cache: Optional conditional-request cache
+        (``providers/_conditional.py``) for revalidating unchanged GETs.
+    :param validator_scope: Tenant scope (org id) for validator cache keys.
     """
 
     def __init__(
@@ -490,6 +494,8 @@ class GitLabCodeClient:
         timeout: float = _DEFAULT_TIMEOUT_SECONDS,
         max_retries: int = _DEFAULT_MAX_RETRIES,
         transport: httpx.AsyncBaseTransport | None = None,
+        validator_cache: ValidatorCache | None = None,
+        validator_scope: str = "",
     ) -> None:
         # Deferred import mirrors providers/gitlab/feature_flags.py: budget.py
         # is the source of truth for the route-family vocabulary, imported
@@ -509,6 +515,8 @@ class GitLabCodeClient:
             resolve_retry_after=_resolve_retry_after,
             classify_error=_classify_error,
             transport=transport,
+            validator_cache=validator_cache,
+            validator_scope=validator_scope,
         )
         self._graphql_url = f"{base_url.rstrip('/')}/api/graphql"
 
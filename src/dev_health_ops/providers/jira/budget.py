@@ -7,6 +7,7 @@ from collections.abc import Callable, Mapping
 from urllib.parse import urlparse
 
 from dev_health_ops.providers.usage import OperationResolver, UsageRouteFamily
+from dev_health_ops.providers.utils import env_int
 from dev_health_ops.sync.budget_types import (
     BudgetBucketKey,
     BudgetDimension,
@@ -115,13 +116,22 @@ def _dataset_estimates(
     }:
         return ()
 
+    search_slices = env_int("JIRA_SEARCH_SLICES", 1)
+    search_notes: tuple[str, ...] = (
+        "Jira work-item listing uses REST /search/jql pagination",
+    )
+    if search_slices > 1:
+        search_notes += (
+            "JIRA_SEARCH_SLICES adds one first-page search per extra slice, "
+            "plus one created-range probe on full resyncs",
+        )
     estimates: list[BudgetEstimate] = [
         _estimate(
             bucket(BudgetDimension.SEARCH),
-            _scaled_units(2, span_days),
+            _scaled_units(2, span_days) + (search_slices if search_slices > 1 else 0),
             _CONFIDENCE_MEDIUM,
             "jira_jql",
-            notes=("Jira work-item listing uses REST /search/jql pagination",),
+            notes=search_notes,
         ),
         _estimate(
             bucket(BudgetDimension.REST_CORE),
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+import re
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from functools import partial
 from typing import Any, Literal
 from urllib.parse import quote, urlparse
 
 import requests
+from anyio.from_thread import start_blocking_portal
 from anyio.to_thread import run_sync
 from pydantic import JsonValue
 
@@ -23,8 +28,9 @@ from dev_health_ops.providers._ratelimit import (
     penalize_from_response,
 )
 from dev_health_ops.providers.jira.jsm_models import parse_jsm_native_incident
+from dev_health_ops.providers.normalize_common import parse_jira_datetime
 from dev_health_ops.providers.usage import UsageRecorder
-from dev_health_ops.providers.utils import EnvSpec, read_env_spec
+from dev_health_ops.providers.utils import EnvSpec, env_int, read_env_spec
 from dev_health_ops.sync.budget_types import BudgetDimension
 from dev_health_ops.sync.rate_limit_signal import RateLimitSignal
 
@@ -56,6 +62,16 @@ _JSM_INCIDENT_FIELDS = (
 )
 _JSM_INCIDENTS_API_ORIGIN = "https://api.atlassian.com"
 
+# Concurrent search (``iter_issues_async``). Both default to 1, which keeps the
+# sequential ``iter_issues`` walk.
+JIRA_SEARCH_FAN_OUT_ENV = "JIRA_SEARCH_FAN_OUT"
+JIRA_SEARCH_SLICES_ENV = "JIRA_SEARCH_SLICES"
+_MAX_SEARCH_FAN_OUT = 16
+_MAX_SEARCH_SLICES = 64
+_ORDER_BY_RE = re.compile(r"\bORDER\s+BY\b", re.IGNORECASE)
+# Sentinel queued once every search slice has been drained.
+_SEARCH_DONE = object()
+
 
 def _require_jira() -> Any:
     try:
@@ -154,6 +170,8 @@ class JiraClient:
         gate: RateLimitGate | None = None,
         org_id: str | None = None,
         max_retries_429: int = 3,
+        search_fan_out: int = 1,
+        search_slices: int = 1,
     ) -> None:
         import requests
 
@@ -168,10 +186,14 @@ class JiraClient:
             config=RateLimitConfig(initial_backoff_seconds=1.0),
         )
         self.max_retries_429 = max(0, int(max_retries_429))
+        self.search_fan_out = max(1, min(_MAX_SEARCH_FAN_OUT, int(search_fan_out)))
+        self.search_slices = max(1, min(_MAX_SEARCH_SLICES, int(search_slices)))
 
         from dev_health_ops.providers.jira.budget import JIRA_USAGE_RESOLVER
 
         self._usage = UsageRecorder(resolver=JIRA_USAGE_RESOLVER)
+        # Concurrent search records usage from worker threads.
+        self._usage_lock = threading.Lock()
 
         self.session = requests.Session()
         self.session.auth = (auth.email, auth.api_token)
@@ -199,6 +221,8 @@ class JiraClient:
                 api_token=str(env["api_token"]),
             ),
             org_id=org_id,
+            search_fan_out=env_int(JIRA_SEARCH_FAN_OUT_ENV, 1),
+            search_slices=env_int(JIRA_SEARCH_SLICES_ENV, 1),
         )
 
     def close(self) -> None:
@@ -307,13 +331,14 @@ class JiraClient:
     ) -> None:
         # Aggregation/keying by route_family lives in the shared recorder
         # (CHAOS-2754); this client only owns the header extraction below.
-        self._usage.record(
-            transport=transport,
-            operation=operation,
-            headers=headers,
-            rate_limit=rate_limit,
-            status=status,
-        )
+        with self._usage_lock:
+            self._usage.record(
+                transport=transport,
+                operation=operation,
+                headers=headers,
+                rate_limit=rate_limit,
+                status=status,
+            )
 
     def _record_rest_usage(
         self,
@@ -345,7 +370,8 @@ class JiraClient:
         )
 
     def drain_usage_observations(self) -> list[dict[str, Any]]:
-        return self._usage.drain()
+        with self._usage_lock:
+            return self._usage.drain()
 
     def search_issues_page(
         self,
@@ -380,13 +406,30 @@ class JiraClient:
         fields: Iterable[str] | None = None,
         expand_changelog: bool = True,
         limit: int | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
     ) -> Iterator[dict[str, Any]]:
         """
         Iterate issues matching a JQL query with pagination.
 
+        With ``search_fan_out > 1`` this drives :meth:`iter_issues_async` on a
+        background event loop (see there for slicing and changelog handling);
+        ``updated_since`` / ``updated_until`` only matter in that mode.
+
         NOTE: Jira may truncate changelogs on large issues. For full history,
         callers may need to fetch per-issue changelogs separately.
         """
+        if self.search_fan_out > 1:
+            yield from self._iter_issues_via_portal(
+                jql=jql,
+                fields=fields,
+                expand_changelog=expand_changelog,
+                limit=limit,
+                updated_since=updated_since,
+                updated_until=updated_until,
+            )
+            return
+
         start_at = 0
         fetched = 0
         expand = "changelog" if expand_changelog else None
@@ -425,6 +468,254 @@ class JiraClient:
                 logger.debug("Jira search complete (isLast=true); fetched=%d", fetched)
                 break
 
+    def _iter_issues_via_portal(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """Bridge :meth:`iter_issues_async` to synchronous callers.
+
+        The portal's event loop runs in its own thread, so page prefetching
+        continues while the caller processes the issue it was handed.
+        """
+        with start_blocking_portal() as portal:
+            issues = self.iter_issues_async(**kwargs)
+            try:
+                while True:
+                    try:
+                        issue = portal.call(issues.__anext__)
+                    except StopAsyncIteration:
+                        return
+                    yield issue
+            finally:
+                portal.call(issues.aclose)
+
+    async def iter_issues_async(
+        self,
+        *,
+        jql: str,
+        fields: Iterable[str] | None = None,
+        expand_changelog: bool = True,
+        limit: int | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate issues matching a JQL query with concurrent page fetches.
+
+        - When ``search_slices > 1`` and ``updated_since`` is given, the query
+          is partitioned into ``updated`` ranges (see
+          :func:`slice_jql_by_updated`) that are searched in parallel.
+        - When ``search_slices > 1`` without ``updated_since`` (a full
+          resync), one probe finds the oldest ``created`` issue and the query
+          is partitioned into ``created`` ranges from there to now. Enhanced
+          search never reports ``total``, so this is what parallelises the
+          largest walks.
+        - Within a slice, a first page that reports ``total`` (offset paging)
+          lets the remaining offsets be fetched concurrently. Enhanced search
+          pages that only carry ``nextPageToken`` are walked in order.
+        - With ``expand_changelog``, issues whose inline changelog was
+          truncated get their full history from the changelog endpoint.
+
+        At most ``search_fan_out`` requests are in flight. Every request goes
+        through ``_request_json``, so the shared gate, 429 handling and usage
+        observations apply unchanged. Issues are yielded in completion order
+        and de-duplicated by id across slices.
+        """
+        fields = list(fields) if fields else None
+        expand = "changelog" if expand_changelog else None
+        semaphore = asyncio.Semaphore(self.search_fan_out)
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=2 * self.search_fan_out)
+
+        async def fetch_page(slice_jql: str, **page: Any) -> dict[str, Any]:
+            async with semaphore:
+                result = await run_sync(
+                    partial(
+                        self.search_issues_page,
+                        jql=slice_jql,
+                        max_results=self.per_page,
+                        fields=fields,
+                        expand=expand,
+                        **page,
+                    )
+                )
+            return result if isinstance(result, dict) else {}
+
+        async def publish(page: Mapping[str, Any]) -> int:
+            issues = [
+                issue for issue in page.get("issues") or [] if isinstance(issue, dict)
+            ]
+            if expand_changelog:
+                issues = list(
+                    await asyncio.gather(
+                        *(
+                            self._complete_changelog(issue, semaphore)
+                            for issue in issues
+                        )
+                    )
+                )
+            if issues:
+                await queue.put(issues)
+            return len(issues)
+
+        async def search_slice(slice_jql: str) -> None:
+            first = await fetch_page(slice_jql, start_at=0)
+            page_size = await publish(first)
+            if not page_size or first.get("isLast") is True:
+                return
+            total = first.get("total")
+            if isinstance(total, int) and not first.get("nextPageToken"):
+                pending = [
+                    asyncio.create_task(fetch_page(slice_jql, start_at=offset))
+                    for offset in range(page_size, total, page_size)
+                ]
+                try:
+                    for next_page in asyncio.as_completed(pending):
+                        await publish(await next_page)
+                finally:
+                    for task in pending:
+                        task.cancel()
+                return
+
+            start_at = page_size
+            token = first.get("nextPageToken")
+            seen_tokens: set[str] = set()
+            while True:
+                if token:
+                    if str(token) in seen_tokens:
+                        raise RuntimeError("Jira search nextPageToken did not advance")
+                    seen_tokens.add(str(token))
+                    page = await fetch_page(
+                        slice_jql, start_at=0, next_page_token=token
+                    )
+                else:
+                    page = await fetch_page(slice_jql, start_at=start_at)
+                fetched = await publish(page)
+                if not fetched or page.get("isLast") is True:
+                    return
+                token = page.get("nextPageToken")
+                start_at += fetched
+
+        async def search_all(slice_jqls: Sequence[str]) -> None:
+            tasks = [asyncio.create_task(search_slice(q)) for q in slice_jqls]
+            try:
+                await asyncio.gather(*tasks)
+            except Exception as exc:
+                for task in tasks:
+                    task.cancel()
+                await queue.put(exc)
+                return
+            await queue.put(_SEARCH_DONE)
+
+        slice_jqls = [jql]
+        if self.search_slices > 1 and updated_since is not None:
+            slice_jqls = slice_jql_by_updated(
+                jql,
+                updated_slice_bounds(
+                    updated_since,
+                    updated_until or datetime.now(UTC),
+                    self.search_slices,
+                ),
+            )
+        elif self.search_slices > 1:
+            oldest = await run_sync(partial(self._earliest_created, jql))
+            if oldest is not None:
+                slice_jqls = slice_jql_by_field(
+                    jql,
+                    "created",
+                    updated_slice_bounds(
+                        oldest,
+                        updated_until or datetime.now(UTC),
+                        self.search_slices,
+                    ),
+                )
+        logger.debug(
+            "Jira concurrent search: slices=%d fan_out=%d",
+            len(slice_jqls),
+            self.search_fan_out,
+        )
+
+        producer = asyncio.create_task(search_all(slice_jqls))
+        seen: set[str] = set()
+        fetched = 0
+        try:
+            while True:
+                item = await queue.get()
+                if item is _SEARCH_DONE:
+                    logger.debug("Jira concurrent search complete; fetched=%d", fetched)
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                for issue in item:
+                    issue_id = str(issue.get("id") or issue.get("key") or "")
+                    if issue_id:
+                        if issue_id in seen:
+                            continue
+                        seen.add(issue_id)
+                    yield issue
+                    fetched += 1
+                    if limit is not None and fetched >= int(limit):
+                        return
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
+    def _earliest_created(self, jql: str) -> datetime | None:
+        """``created`` of the oldest issue ``jql`` matches, from one probe."""
+        match = _ORDER_BY_RE.search(jql)
+        where = (jql[: match.start()] if match else jql).strip()
+        probe = f"({where}) ORDER BY created ASC" if where else "ORDER BY created ASC"
+        page = self.search_issues_page(
+            jql=probe, start_at=0, max_results=1, fields=["created"]
+        )
+        issues = page.get("issues") if isinstance(page, dict) else None
+        if not issues or not isinstance(issues[0], dict):
+            return None
+        fields = issues[0].get("fields") or {}
+        return parse_jira_datetime(fields.get("created"))
+
+    async def _complete_changelog(
+        self, issue: dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """Replace a truncated inline changelog with the full history."""
+        changelog = issue.get("changelog")
+        if not isinstance(changelog, dict):
+            return issue
+        histories = changelog.get("histories") or []
+        total = changelog.get("total")
+        if not isinstance(total, int) or total <= len(histories):
+            return issue
+        issue_key = str(issue.get("key") or issue.get("id") or "")
+        if not issue_key:
+            return issue
+        async with semaphore:
+            full = await run_sync(
+                partial(self.fetch_issue_changelog, issue_id_or_key=issue_key)
+            )
+        return {
+            **issue,
+            "changelog": {
+                "startAt": 0,
+                "maxResults": len(full),
+                "total": len(full),
+                "histories": full,
+            },
+        }
+
+    def fetch_issue_changelog(self, *, issue_id_or_key: str) -> list[dict[str, Any]]:
+        """Fetch an issue's full changelog, following ``isLast`` pagination."""
+        histories: list[dict[str, Any]] = []
+        start_at = 0
+        while True:
+            page = self._request_json(
+                path=f"/rest/api/3/issue/{issue_id_or_key}/changelog",
+                params={"startAt": start_at, "maxResults": self.per_page},
+            )
+            values = [
+                value for value in page.get("values") or [] if isinstance(value, dict)
+            ]
+            histories.extend(values)
+            if not values or page.get("isLast") is not False:
+                return histories
+            start_at += len(values)
+
     def fetch_issue_comments_page(
         self,
         *,
@@ -865,3 +1156,51 @@ def build_jira_jql(
     if where:
         return f"{where} ORDER BY updated DESC"
     return "ORDER BY updated DESC"
+
+
+def updated_slice_bounds(start: datetime, end: datetime, slices: int) -> list[datetime]:
+    """Interior boundaries splitting ``[start, end)`` into ``slices`` ranges."""
+    if slices <= 1 or end <= start:
+        return []
+    step = (end - start) / slices
+    return [start + step * index for index in range(1, slices)]
+
+
+def slice_jql_by_updated(jql: str, bounds: Sequence[datetime]) -> list[str]:
+    """Partition ``jql`` by ``updated`` time (see :func:`slice_jql_by_field`)."""
+    return slice_jql_by_field(jql, "updated", bounds)
+
+
+def slice_jql_by_field(jql: str, field: str, bounds: Sequence[datetime]) -> list[str]:
+    """
+    Partition ``jql`` into ``len(bounds) + 1`` queries by a date ``field``.
+
+    The first slice is open below and the last open above, so every issue the
+    original query matches falls in exactly one slice whatever its own
+    filters are. Boundaries are minute-resolution JQL literals, which Jira
+    reads in the querying user's time zone; that only shifts where the cuts
+    fall, not the partition itself.
+    """
+    literals = sorted(
+        {
+            (bound.astimezone(UTC) if bound.tzinfo else bound).strftime(
+                "%Y-%m-%d %H:%M"
+            )
+            for bound in bounds
+        }
+    )
+    if not literals:
+        return [jql]
+
+    match = _ORDER_BY_RE.search(jql)
+    where = (jql[: match.start()] if match else jql).strip()
+    order_by = f" {jql[match.start() :].strip()}" if match else ""
+    clauses = [f'{field} < "{literals[0]}"']
+    clauses.extend(
+        f'{field} >= "{lower}" AND {field} < "{upper}"'
+        for lower, upper in zip(literals, literals[1:], strict=False)
+    )
+    clauses.append(f'{field} >= "{literals[-1]}"')
+    if where:
+        return [f"({where}) AND {clause}{order_by}" for clause in clauses]
+    return [f"{clause}{order_by}" for clause in clauses]
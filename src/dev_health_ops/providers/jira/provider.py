@@ -73,6 +73,9 @@ class JiraProvider(ProviderWithClient[JiraClient]):
         - JIRA_FETCH_ALL: fetch all issues (ignores time window)
         - JIRA_FETCH_COMMENTS: whether to fetch comments (default: true)
         - JIRA_COMMENTS_LIMIT: max comments per issue (0 = no limit)
+        - JIRA_SEARCH_FAN_OUT: concurrent search requests (default: 1, sequential)
+        - JIRA_SEARCH_SLICES: split the search into N parallel searches (by
+          updated window, or by created range on a JIRA_FETCH_ALL resync)
         - ATLASSIAN_CLIENT_ENABLED: use new atlassian-client library
         - ATLASSIAN_GQL_ENABLED: enable GraphQL worklog enrichment (REST fallback)
         """
@@ -195,7 +198,11 @@ class JiraProvider(ProviderWithClient[JiraClient]):
             fetched_count = 0
             for jql in jqls:
                 logger.debug("Jira: JQL=%s", jql)
-                for issue in client.iter_issues(jql=jql, expand_changelog=True):
+                for issue in client.iter_issues(
+                    jql=jql,
+                    expand_changelog=True,
+                    updated_since=None if fetch_all else ctx.window.updated_since,
+                ):
                     if ctx.limit is not None and fetched_count >= ctx.limit:
                         break
 
@@ -164,11 +164,20 @@ class UsageRecorder:
         headers: dict[str, str],
         rate_limit: dict[str, Any],
         status: int | None = None,
+        conditional_hit: bool = False,
+        rate_limit_exempt: bool = False,
     ) -> None:
         """Aggregate one request into its route-family bucket.
 
         No-ops when there is nothing worth recording (no diagnostic headers, no
         rate-limit signal, and no status) so callers can invoke unconditionally.
+
+        ``conditional_hit`` marks a ``304 Not Modified`` answered from the
+        validator cache (``providers/_conditional.py``); ``rate_limit_exempt``
+        marks a request the provider does not charge against its primary rate
+        limit (GitHub's 304s). Both are still counted in ``request_count`` --
+        it stays a physical round-trip count -- and are additionally tallied
+        in ``conditional_hit_count`` / ``rate_limit_exempt_count``.
         """
 
         if not headers and not rate_limit and status is None:
@@ -194,6 +203,14 @@ class UsageRecorder:
             }
             self._observations[key] = observation
         observation["request_count"] = int(observation["request_count"]) + 1
+        if conditional_hit:
+            observation["conditional_hit_count"] = (
+                int(observation.get("conditional_hit_count") or 0) + 1
+            )
+        if rate_limit_exempt:
+            observation["rate_limit_exempt_count"] = (
+                int(observation.get("rate_limit_exempt_count") or 0) + 1
+            )
         observation["example_operation"] = operation
         if status is not None:
             observation["latest_status"] = status
@@ -19,12 +19,23 @@ Tables used
 * ``repo_metrics_daily``        — rework ratio, p75 PR cycle time
 * ``repo_complexity_daily``     — cyclomatic complexity
 * ``file_hotspot_daily``        — high-risk hotspot files
+* ``compounding_risk_daily``    — persisted Compounding Risk per team
+
+Org-wide runs
+~~~~~~~~~~~~~
+Given the run's ``team_ids``, the loader answers the first snapshot request
+for any of those teams by loading *all* of them with one set of
+``GROUP BY team_id`` queries (``load_teams_metrics_window``), so an org
+refresh issues a fixed number of queries instead of nine per team. The repo
+and file-level signals are not team-scoped and are read once for the batch.
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import math
+from collections.abc import Sequence
 from datetime import date, timedelta
 from typing import Any, Protocol, runtime_checkable
 
@@ -33,6 +44,8 @@ from dev_health_ops.recommendations.snapshot import (
     RecommendationRecord,
 )
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # MetricsLoader protocol
 # ---------------------------------------------------------------------------
@@ -96,13 +109,20 @@ class ClickHouseMetricsLoader:
     """Production ``MetricsLoader`` backed by ClickHouse.
 
     Args:
-        client:  Synchronous ``clickhouse_connect`` client.
-        org_id:  Organisation ID for multi-tenant scoping.
+        client:   Synchronous ``clickhouse_connect`` client.
+        org_id:   Organisation ID for multi-tenant scoping.
+        team_ids: Teams this run will evaluate.  When given, their snapshots
+                  are loaded together on the first request for any of them.
     """
 
-    def __init__(self, client: Any, org_id: str = "") -> None:
+    def __init__(
+        self, client: Any, org_id: str = "", team_ids: Sequence[str] | None = None
+    ) -> None:
         self._client = client
         self._org_id = org_id
+        self._team_ids = list(dict.fromkeys(team_ids or ()))
+        self._batch_key: tuple[str, date, date] | None = None
+        self._batch: dict[str, MetricsSnapshot] = {}
 
     # ------------------------------------------------------------------
     # Helpers
@@ -120,7 +140,10 @@ class ClickHouseMetricsLoader:
         return "AND org_id = %(org_id)s" if self._org_id else ""
 
     def _p(self, team_id: str, ws: date, we: date) -> dict[str, Any]:
-        p: dict[str, Any] = {"team_id": team_id, "start": ws, "end": we}
+        return {"team_id": team_id, **self._window_p(ws, we)}
+
+    def _window_p(self, ws: date, we: date) -> dict[str, Any]:
+        p: dict[str, Any] = {"start": ws, "end": we}
         if self._org_id:
             p["org_id"] = self._org_id
         return p
@@ -151,13 +174,9 @@ class ClickHouseMetricsLoader:
         tp = [float(r.get("tp_total") or 0.0) for r in rows]
         return wip, tp
 
-    def _load_review_signals(
-        self, team_id: str, ws: date, we: date
-    ) -> tuple[float | None, float | None]:
+    def _load_review_latency(self, ws: date, we: date) -> float | None:
+        """p75 PR cycle time across repos (not team-scoped)."""
         oc = self._oc()
-        params = self._p(team_id, ws, we)
-
-        # p75 PR cycle time across repos
         q_lat = f"""
             SELECT avg(p75) AS avg_p75
             FROM (
@@ -167,8 +186,15 @@ class ClickHouseMetricsLoader:
                 GROUP BY repo_id
             )
         """
-        lat_rows = self._qd(q_lat, params)
-        review_latency = _safe_float(lat_rows[0].get("avg_p75") if lat_rows else None)
+        lat_rows = self._qd(q_lat, self._window_p(ws, we))
+        return _safe_float(lat_rows[0].get("avg_p75") if lat_rows else None)
+
+    def _load_review_signals(
+        self, team_id: str, ws: date, we: date
+    ) -> tuple[float | None, float | None]:
+        oc = self._oc()
+        params = self._p(team_id, ws, we)
+        review_latency = self._load_review_latency(ws, we)
 
         # Reviewer Gini from user_metrics_daily
         q_gini = f"""
@@ -187,7 +213,8 @@ class ClickHouseMetricsLoader:
         loads = [float(r.get("total_reviews") or 0.0) for r in gini_rows]
         return review_latency, _gini(loads)
 
-    def _load_rework_ratio(self, team_id: str, ws: date, we: date) -> float | None:
+    def _load_rework_ratio(self, ws: date, we: date) -> float | None:
+        """Average PR rework ratio across repos (not team-scoped)."""
         oc = self._oc()
         q = f"""
             SELECT avg(rework) AS avg_rework
@@ -198,7 +225,7 @@ class ClickHouseMetricsLoader:
                 GROUP BY repo_id
             )
         """
-        rows = self._qd(q, self._p(team_id, ws, we))
+        rows = self._qd(q, self._window_p(ws, we))
         return _safe_float(rows[0].get("avg_rework") if rows else None)
 
     def _load_sustainability_signals(
@@ -241,11 +268,12 @@ class ClickHouseMetricsLoader:
         return after_hours, cycle_times
 
     def _load_compounding_signals(
-        self, team_id: str, ws: date, we: date
+        self, ws: date, we: date
     ) -> tuple[float | None, float | None]:
+        """Repo complexity trend and hotspot overlap (not team-scoped)."""
         oc = self._oc()
         mid = ws + timedelta(days=max(1, (we - ws).days // 2))
-        params = {**self._p(team_id, ws, we), "mid": mid}
+        params = {**self._window_p(ws, we), "mid": mid}
 
         # Complexity delta: second half avg vs first half avg
         q_cpx = f"""
@@ -326,10 +354,206 @@ class ClickHouseMetricsLoader:
         severity = rows[0].get("severity")
         return score, (str(severity) if severity else None)
 
+    # ------------------------------------------------------------------
+    # Batched (GROUP BY team_id) signal loaders
+    # ------------------------------------------------------------------
+
+    def _load_work_item_series_by_team(
+        self, params: dict[str, Any]
+    ) -> dict[str, tuple[list[float], list[float], list[float]]]:
+        """Per team: ``(wip_by_day, throughput_by_day, cycle_time_by_day)``."""
+        oc = self._oc()
+        q = f"""
+            SELECT team_id, day,
+                   sum(wip) AS wip_total,
+                   sum(completed) AS tp_total,
+                   avg(ct) AS avg_ct
+            FROM (
+                SELECT team_id, day,
+                       argMax(wip_count_end_of_day, computed_at) AS wip,
+                       argMax(items_completed, computed_at) AS completed,
+                       argMax(cycle_time_p50_hours, computed_at) AS ct
+                FROM work_item_metrics_daily
+                WHERE team_id IN %(team_ids)s
+                  AND day >= %(start)s AND day < %(end)s {oc}
+                GROUP BY team_id, day, provider, work_scope_id
+            )
+            GROUP BY team_id, day ORDER BY team_id, day
+        """
+        series: dict[str, tuple[list[float], list[float], list[float]]] = {}
+        for r in self._qd(q, params):
+            wip, tp, cycle_times = series.setdefault(str(r["team_id"]), ([], [], []))
+            wip.append(float(r.get("wip_total") or 0.0))
+            tp.append(float(r.get("tp_total") or 0.0))
+            if r.get("avg_ct") is not None:
+                cycle_times.append(float(r["avg_ct"]))
+        return series
+
+    def _load_reviewer_gini_by_team(
+        self, params: dict[str, Any]
+    ) -> dict[str, float | None]:
+        oc = self._oc()
+        q = f"""
+            SELECT team_id, author_email, sum(rev) AS total_reviews
+            FROM (
+                SELECT team_id, repo_id, author_email, day,
+                       argMax(reviews_given, computed_at) AS rev
+                FROM user_metrics_daily
+                WHERE team_id IN %(team_ids)s
+                  AND day >= %(start)s AND day < %(end)s {oc}
+                GROUP BY team_id, repo_id, author_email, day
+            )
+            GROUP BY team_id, author_email
+        """
+        loads: dict[str, list[float]] = {}
+        for r in self._qd(q, params):
+            loads.setdefault(str(r["team_id"]), []).append(
+                float(r.get("total_reviews") or 0.0)
+            )
+        return {tid: _gini(values) for tid, values in loads.items()}
+
+    def _load_after_hours_by_team(
+        self, params: dict[str, Any]
+    ) -> dict[str, float | None]:
+        oc = self._oc()
+        q = f"""
+            SELECT team_id, avg(ratio) AS avg_ratio
+            FROM (
+                SELECT team_id, day,
+                       argMax(after_hours_commit_ratio, computed_at) AS ratio
+                FROM team_metrics_daily
+                WHERE team_id IN %(team_ids)s
+                  AND day >= %(start)s AND day < %(end)s {oc}
+                GROUP BY team_id, day
+            )
+            GROUP BY team_id
+        """
+        return {
+            str(r["team_id"]): _safe_float(r.get("avg_ratio"))
+            for r in self._qd(q, params)
+        }
+
+    def _load_compounding_risk_persisted_by_team(
+        self, params: dict[str, Any]
+    ) -> dict[str, tuple[float | None, str | None]]:
+        """Latest team-scope Compounding Risk row per team (see the per-team
+        ``_load_compounding_risk_persisted``)."""
+        oc = self._oc()
+        query = f"""
+            SELECT
+                scope_id AS team_id,
+                tupleElement(latest_row, 1) AS score,
+                tupleElement(latest_row, 2) AS severity
+            FROM (
+                SELECT scope_id,
+                       argMax(tuple(compounding_risk, severity), computed_at) AS latest_row
+                FROM compounding_risk_daily
+                WHERE scope = 'team'
+                  AND scope_id IN %(team_ids)s
+                  AND day >= %(start)s AND day < %(end)s {oc}
+                GROUP BY scope_id
+            )
+        """
+        persisted: dict[str, tuple[float | None, str | None]] = {}
+        for r in self._qd(query, params):
+            severity = r.get("severity")
+            persisted[str(r["team_id"])] = (
+                _safe_float(r.get("score")),
+                str(severity) if severity else None,
+            )
+        return persisted
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def load_teams_metrics_window(
+        self,
+        team_ids: Sequence[str],
+        org_id: str,
+        window_start: date,
+        window_end: date,
+    ) -> dict[str, MetricsSnapshot]:
+        """Load snapshots for every team in *team_ids* with grouped queries.
+
+        Returns one snapshot per requested team; a team with no rows gets the
+        same empty/``None`` signals ``load_team_metrics_window`` would give it.
+        """
+        teams = list(dict.fromkeys(team_ids))
+        if not teams:
+            return {}
+        prev_org = self._org_id
+        if org_id:
+            self._org_id = org_id
+        try:
+            params = {
+                **self._window_p(window_start, window_end),
+                "team_ids": teams,
+            }
+            work_items = self._load_work_item_series_by_team(params)
+            gini = self._load_reviewer_gini_by_team(params)
+            after_hours = self._load_after_hours_by_team(params)
+            compounding = self._load_compounding_risk_persisted_by_team(params)
+            rev_lat = self._load_review_latency(window_start, window_end)
+            rework = self._load_rework_ratio(window_start, window_end)
+            complexity_delta, churn_overlap = self._load_compounding_signals(
+                window_start, window_end
+            )
+        finally:
+            self._org_id = prev_org
+
+        snapshots: dict[str, MetricsSnapshot] = {}
+        for team_id in teams:
+            wip, throughput, cycle_times = work_items.get(team_id, ([], [], []))
+            compounding_score, compounding_severity = compounding.get(
+                team_id, (None, None)
+            )
+            snapshots[team_id] = MetricsSnapshot(
+                team_id=team_id,
+                org_id=org_id,
+                window_start=window_start,
+                window_end=window_end,
+                wip_by_day=wip,
+                throughput_by_cycle=throughput,
+                review_latency_p75_hours=rev_lat,
+                reviewer_gini=gini.get(team_id),
+                rework_churn_ratio=rework,
+                after_hours_ratio=after_hours.get(team_id),
+                cycle_time_by_day=cycle_times,
+                hotspot_complexity_delta=complexity_delta,
+                hotspot_churn_overlap=churn_overlap,
+                compounding_risk_score=compounding_score,
+                compounding_risk_severity=compounding_severity,
+            )
+        return snapshots
+
+    def _batched_snapshot(
+        self, team_id: str, org_id: str, window_start: date, window_end: date
+    ) -> MetricsSnapshot | None:
+        """Snapshot from the run's batch, loading the batch on first use.
+
+        A failed batch load is logged once and not retried; its teams fall
+        back to the per-team queries so one bad batch does not fail them all.
+        """
+        if team_id not in self._team_ids:
+            return None
+        key = (org_id, window_start, window_end)
+        if self._batch_key != key:
+            self._batch_key = key
+            try:
+                self._batch = self.load_teams_metrics_window(
+                    self._team_ids, org_id, window_start, window_end
+                )
+            except Exception:
+                logger.exception(
+                    "Batched metrics load failed for org=%s (%d teams); "
+                    "falling back to per-team queries",
+                    org_id,
+                    len(self._team_ids),
+                )
+                self._batch = {}
+        return self._batch.get(team_id)
+
     def load_team_metrics_window(
         self,
         team_id: str,
@@ -338,6 +562,9 @@ class ClickHouseMetricsLoader:
         window_end: date,
     ) -> MetricsSnapshot:
         """Load all signals for *team_id* in ``[window_start, window_end)``."""
+        batched = self._batched_snapshot(team_id, org_id, window_start, window_end)
+        if batched is not None:
+            return batched
         prev_org = self._org_id
         if org_id:
             self._org_id = org_id
@@ -348,12 +575,12 @@ class ClickHouseMetricsLoader:
             rev_lat, rev_gini = self._load_review_signals(
                 team_id, window_start, window_end
             )
-            rework = self._load_rework_ratio(team_id, window_start, window_end)
+            rework = self._load_rework_ratio(window_start, window_end)
             after_hours, cycle_times = self._load_sustainability_signals(
                 team_id, window_start, window_end
             )
             complexity_delta, churn_overlap = self._load_compounding_signals(
-                team_id, window_start, window_end
+                window_start, window_end
             )
             compounding_score, compounding_severity = (
                 self._load_compounding_risk_persisted(team_id, window_start, window_end)
@@ -6,12 +6,16 @@ import json
 import logging
 import os
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import asdict, fields
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    instrument_clickhouse_client,
+)
 from dev_health_ops.metrics.schemas import (
     FileComplexitySnapshot,
     WorkItemUserMetricsDailyRecord,
@@ -25,6 +29,7 @@ from dev_health_ops.models.git import (
     CiPipelineRun,
     Deployment,
     GitBlame,
+    GitBlameHunk,
     GitCommit,
     GitCommitStat,
     GitFile,
@@ -65,6 +70,17 @@ from .utils import _parse_date_value, _parse_datetime_value
 logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=CanonicalOperationalEntity)
 
+_INSERT_CONCURRENCY_ENV = "CLICKHOUSE_INSERT_CONCURRENCY"
+_DEFAULT_INSERT_CONCURRENCY = 4
+
+
+def _insert_concurrency_from_env() -> int:
+    raw = os.getenv(_INSERT_CONCURRENCY_ENV, "")
+    try:
+        return max(1, int(raw)) if raw.strip() else _DEFAULT_INSERT_CONCURRENCY
+    except ValueError:
+        return _DEFAULT_INSERT_CONCURRENCY
+
 
 def _canonical_operational_datetime(value: Any) -> Any:
     """Restore ClickHouse DateTime64 values to the canonical UTC shape."""
@@ -108,6 +124,7 @@ class ClickHouseStore:
         settings: dict | None = None,
         *,
         operational_ordering_contract: OperationalOrderingContract | None = None,
+        insert_concurrency: int | None = None,
     ) -> None:
         if not conn_string:
             raise ValueError("ClickHouse connection string is required")
@@ -122,6 +139,17 @@ class ClickHouseStore:
         self.org_id: str | None = None
         self._lock = asyncio.Lock()
         self._settings = settings or {}
+        # Inserts use ``self.client`` when it is free; while it is busy they
+        # borrow one of up to ``insert_concurrency - 1`` extra clients, so
+        # independent inserts no longer queue behind a single session.
+        self._insert_concurrency = (
+            max(1, insert_concurrency)
+            if insert_concurrency is not None
+            else _insert_concurrency_from_env()
+        )
+        self._insert_clients: list[Any] = []
+        self._insert_slots_used = 0
+        self._idle_insert_clients: asyncio.Queue[Any] = asyncio.Queue()
         self._operational_ordering_contract_is_explicit = (
             operational_ordering_contract is not None
             or operational_ordering_contract_is_explicit()
@@ -135,8 +163,11 @@ class ClickHouseStore:
     async def __aenter__(self) -> ClickHouseStore:
         import clickhouse_connect
 
-        client = await asyncio.to_thread(
-            clickhouse_connect.get_client, dsn=self.conn_string
+        client = instrument_clickhouse_client(
+            await asyncio.to_thread(
+                clickhouse_connect.get_client, dsn=self.conn_string
+            ),
+            component="store",
         )
         self.client = client
         await self._ensure_tables()
@@ -151,9 +182,55 @@ class ClickHouseStore:
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
+        extra_clients, self._insert_clients = self._insert_clients, []
+        self._insert_slots_used = 0
+        self._idle_insert_clients = asyncio.Queue()
+        for client in extra_clients:
+            await asyncio.to_thread(client.close)
         if self.client is not None:
             await asyncio.to_thread(self.client.close)
 
+    async def _checkout_insert_client(self) -> Any:
+        if not self._idle_insert_clients.empty():
+            return self._idle_insert_clients.get_nowait()
+        if self._insert_slots_used < self._insert_concurrency - 1:
+            import clickhouse_connect
+
+            # Reserve the slot before the blocking connect so concurrent
+            # callers cannot overshoot the bound.
+            self._insert_slots_used += 1
+            try:
+                client = instrument_clickhouse_client(
+                    await asyncio.to_thread(
+                        clickhouse_connect.get_client, dsn=self.conn_string
+                    ),
+                    component="store",
+                )
+            except BaseException:
+                self._insert_slots_used -= 1
+                raise
+            self._insert_clients.append(client)
+            return client
+        return await self._idle_insert_clients.get()
+
+    @asynccontextmanager
+    async def _insert_client(self) -> AsyncIterator[Any]:
+        """Lend a client for one insert.
+
+        The primary client is used when nothing else holds it (the common,
+        sequential case). Otherwise the insert runs on a pooled extra client
+        instead of waiting for the primary one.
+        """
+        if self._insert_concurrency > 1 and self._lock.locked():
+            client = await self._checkout_insert_client()
+            try:
+                yield client
+            finally:
+                self._idle_insert_clients.put_nowait(client)
+            return
+        async with self._lock:
+            yield self.client
+
     @staticmethod
     def _normalize_uuid(value: Any) -> uuid.UUID:
         if value is None:
@@ -318,15 +395,51 @@ class ClickHouseStore:
             for row in rows:
                 row.setdefault("org_id", org_id)
         matrix = [[row.get(col) for col in columns] for row in rows]
-        async with self._lock:
+        async with self._insert_client() as client:
             await asyncio.to_thread(
-                self.client.insert,
+                client.insert,
                 table,
                 matrix,
                 column_names=columns,
                 settings=self._settings,
             )
 
+    async def _insert_columns(
+        self, table: str, columns: Mapping[str, Sequence[Any]]
+    ) -> None:
+        """Insert column-oriented buffers without materializing per-row records.
+
+        ``columns`` maps column name to an equal-length sequence (a list or a
+        NumPy array). The data is handed to clickhouse-connect's columnar
+        insert as-is, apart from converting arrays to lists.
+        """
+        if not columns:
+            return
+        names = list(columns)
+        data = [
+            values.tolist() if hasattr(values, "tolist") else values
+            for values in columns.values()
+        ]
+        row_count = len(data[0])
+        if not row_count:
+            return
+        if any(len(values) != row_count for values in data):
+            raise ValueError(f"Column lengths differ for columnar insert into {table}")
+        assert self.client is not None
+        org_id = getattr(self, "org_id", None) or ""
+        if "org_id" not in names and org_id:
+            names.append("org_id")
+            data.append([org_id] * row_count)
+        async with self._insert_client() as client:
+            await asyncio.to_thread(
+                client.insert,
+                table,
+                data,
+                column_names=names,
+                column_oriented=True,
+                settings=self._settings,
+            )
+
     async def _has_any(self, table: str, repo_id: uuid.UUID) -> bool:
         assert self.client is not None
         query = f"SELECT 1 FROM {table} WHERE repo_id = {{repo_id:UUID}} LIMIT 1"
@@ -743,37 +856,30 @@ class ClickHouseStore:
         if not file_data:
             return
         synced_at_default = self._normalize_datetime(datetime.now(timezone.utc))
-        rows: list[dict[str, Any]] = []
+        repo_ids: list[uuid.UUID] = []
+        paths: list[Any] = []
+        executables: list[int] = []
+        contents: list[Any] = []
+        last_synced: list[Any] = []
         for item in file_data:
-            if isinstance(item, dict):
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.get("repo_id")),
-                        "path": item.get("path"),
-                        "executable": 1 if item.get("executable") else 0,
-                        "contents": item.get("contents"),
-                        "last_synced": self._normalize_datetime(
-                            item.get("last_synced") or synced_at_default
-                        ),
-                    }
-                )
-            else:
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.repo_id),
-                        "path": item.path,
-                        "executable": 1 if item.executable else 0,
-                        "contents": item.contents,
-                        "last_synced": self._normalize_datetime(
-                            getattr(item, "last_synced", None) or synced_at_default
-                        ),
-                    }
-                )
+            get = self._item_getter(item)
+            repo_ids.append(self._normalize_uuid(get("repo_id")))
+            paths.append(get("path"))
+            executables.append(1 if get("executable") else 0)
+            contents.append(get("contents"))
+            last_synced.append(
+                self._normalize_datetime(get("last_synced") or synced_at_default)
+            )
 
-        await self._insert_rows(
+        await self._insert_columns(
             "git_files",
-            ["repo_id", "path", "executable", "contents", "last_synced"],
-            rows,
+            {
+                "repo_id": repo_ids,
+                "path": paths,
+                "executable": executables,
+                "contents": contents,
+                "last_synced": last_synced,
+            },
         )
 
     async def insert_git_commit_data(
@@ -782,58 +888,9 @@ class ClickHouseStore:
         if not commit_data:
             return
         synced_at_default = self._normalize_datetime(datetime.now(timezone.utc))
-        rows: list[dict[str, Any]] = []
-        for item in commit_data:
-            if isinstance(item, dict):
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.get("repo_id")),
-                        "hash": item.get("hash"),
-                        "message": item.get("message"),
-                        "author_name": item.get("author_name"),
-                        "author_email": item.get("author_email"),
-                        "author_when": self._normalize_datetime(
-                            item.get("author_when")
-                        ),
-                        "committer_name": item.get("committer_name"),
-                        "committer_email": item.get("committer_email"),
-                        "committer_when": self._normalize_datetime(
-                            item.get("committer_when")
-                        ),
-                        "parents": int(item.get("parents") or 0),
-                        "last_synced": self._normalize_datetime(
-                            item.get("last_synced") or synced_at_default
-                        ),
-                        "source_id": self._normalize_uuid_or_none(
-                            item.get("source_id")
-                        ),
-                    }
-                )
-            else:
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.repo_id),
-                        "hash": item.hash,
-                        "message": item.message,
-                        "author_name": item.author_name,
-                        "author_email": item.author_email,
-                        "author_when": self._normalize_datetime(item.author_when),
-                        "committer_name": item.committer_name,
-                        "committer_email": item.committer_email,
-                        "committer_when": self._normalize_datetime(item.committer_when),
-                        "parents": int(item.parents or 0),
-                        "last_synced": self._normalize_datetime(
-                            getattr(item, "last_synced", None) or synced_at_default
-                        ),
-                        "source_id": self._normalize_uuid_or_none(
-                            getattr(item, "source_id", None)
-                        ),
-                    }
-                )
-
-        await self._insert_rows(
-            "git_commits",
-            [
+        columns: dict[str, list[Any]] = {
+            name: []
+            for name in (
                 "repo_id",
                 "hash",
                 "message",
@@ -846,52 +903,36 @@ class ClickHouseStore:
                 "parents",
                 "last_synced",
                 "source_id",
-            ],
-            rows,
-        )
+            )
+        }
+        for item in commit_data:
+            get = self._item_getter(item)
+            columns["repo_id"].append(self._normalize_uuid(get("repo_id")))
+            columns["hash"].append(get("hash"))
+            columns["message"].append(get("message"))
+            columns["author_name"].append(get("author_name"))
+            columns["author_email"].append(get("author_email"))
+            columns["author_when"].append(self._normalize_datetime(get("author_when")))
+            columns["committer_name"].append(get("committer_name"))
+            columns["committer_email"].append(get("committer_email"))
+            columns["committer_when"].append(
+                self._normalize_datetime(get("committer_when"))
+            )
+            columns["parents"].append(int(get("parents") or 0))
+            columns["last_synced"].append(
+                self._normalize_datetime(get("last_synced") or synced_at_default)
+            )
+            columns["source_id"].append(self._normalize_uuid_or_none(get("source_id")))
+
+        await self._insert_columns("git_commits", columns)
 
     async def insert_git_commit_stats(self, commit_stats: list[GitCommitStat]) -> None:
         if not commit_stats:
             return
         synced_at_default = self._normalize_datetime(datetime.now(timezone.utc))
-        rows: list[dict[str, Any]] = []
-        for item in commit_stats:
-            if isinstance(item, dict):
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.get("repo_id")),
-                        "commit_hash": item.get("commit_hash"),
-                        "file_path": item.get("file_path"),
-                        "additions": int(item.get("additions") or 0),
-                        "deletions": int(item.get("deletions") or 0),
-                        "old_file_mode": item.get("old_file_mode") or "unknown",
-                        "new_file_mode": item.get("new_file_mode") or "unknown",
-                        "last_synced": self._normalize_datetime(
-                            item.get("last_synced") or synced_at_default
-                        ),
-                    }
-                )
-            else:
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.repo_id),
-                        "commit_hash": item.commit_hash,
-                        "file_path": item.file_path,
-                        "additions": int(item.additions or 0),
-                        "deletions": int(item.deletions or 0),
-                        "old_file_mode": getattr(item, "old_file_mode", None)
-                        or "unknown",
-                        "new_file_mode": getattr(item, "new_file_mode", None)
-                        or "unknown",
-                        "last_synced": self._normalize_datetime(
-                            getattr(item, "last_synced", None) or synced_at_default
-                        ),
-                    }
-                )
-
-        await self._insert_rows(
-            "git_commit_stats",
-            [
+        columns: dict[str, list[Any]] = {
+            name: []
+            for name in (
                 "repo_id",
                 "commit_hash",
                 "file_path",
@@ -900,54 +941,30 @@ class ClickHouseStore:
                 "old_file_mode",
                 "new_file_mode",
                 "last_synced",
-            ],
-            rows,
-        )
+            )
+        }
+        for item in commit_stats:
+            get = self._item_getter(item)
+            columns["repo_id"].append(self._normalize_uuid(get("repo_id")))
+            columns["commit_hash"].append(get("commit_hash"))
+            columns["file_path"].append(get("file_path"))
+            columns["additions"].append(int(get("additions") or 0))
+            columns["deletions"].append(int(get("deletions") or 0))
+            columns["old_file_mode"].append(get("old_file_mode") or "unknown")
+            columns["new_file_mode"].append(get("new_file_mode") or "unknown")
+            columns["last_synced"].append(
+                self._normalize_datetime(get("last_synced") or synced_at_default)
+            )
+
+        await self._insert_columns("git_commit_stats", columns)
 
     async def insert_blame_data(self, data_batch: list[GitBlame]) -> None:
         if not data_batch:
             return
         synced_at_default = self._normalize_datetime(datetime.now(timezone.utc))
-        rows: list[dict[str, Any]] = []
-        for item in data_batch:
-            if isinstance(item, dict):
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.get("repo_id")),
-                        "path": item.get("path"),
-                        "line_no": int(item.get("line_no") or 0),
-                        "author_email": item.get("author_email"),
-                        "author_name": item.get("author_name"),
-                        "author_when": self._normalize_datetime(
-                            item.get("author_when")
-                        ),
-                        "commit_hash": item.get("commit_hash"),
-                        "line": item.get("line"),
-                        "last_synced": self._normalize_datetime(
-                            item.get("last_synced") or synced_at_default
-                        ),
-                    }
-                )
-            else:
-                rows.append(
-                    {
-                        "repo_id": self._normalize_uuid(item.repo_id),
-                        "path": item.path,
-                        "line_no": int(item.line_no or 0),
-                        "author_email": item.author_email,
-                        "author_name": item.author_name,
-                        "author_when": self._normalize_datetime(item.author_when),
-                        "commit_hash": item.commit_hash,
-                        "line": item.line,
-                        "last_synced": self._normalize_datetime(
-                            getattr(item, "last_synced", None) or synced_at_default
-                        ),
-                    }
-                )
-
-        await self._insert_rows(
-            "git_blame",
-            [
+        columns: dict[str, list[Any]] = {
+            name: []
+            for name in (
                 "repo_id",
                 "path",
                 "line_no",
@@ -957,9 +974,116 @@ class ClickHouseStore:
                 "commit_hash",
                 "line",
                 "last_synced",
-            ],
-            rows,
+            )
+        }
+        for item in data_batch:
+            get = self._item_getter(item)
+            columns["repo_id"].append(self._normalize_uuid(get("repo_id")))
+            columns["path"].append(get("path"))
+            columns["line_no"].append(int(get("line_no") or 0))
+            columns["author_email"].append(get("author_email"))
+            columns["author_name"].append(get("author_name"))
+            columns["author_when"].append(self._normalize_datetime(get("author_when")))
+            columns["commit_hash"].append(get("commit_hash"))
+            columns["line"].append(get("line"))
+            columns["last_synced"].append(
+                self._normalize_datetime(get("last_synced") or synced_at_default)
+            )
+
+        await self._insert_columns("git_blame", columns)
+
+    async def get_blame_hunk_blobs(self, repo_id) -> dict[str, str]:
+        """Blob SHA of the latest compact blame generation per path.
+
+        Tombstoned (deleted) paths map to an empty string. The local sync
+        compares this with the HEAD tree to re-blame only changed files.
+        """
+        assert self.client is not None
+        org_id = getattr(self, "org_id", None) or ""
+        query = """
+            SELECT path, argMax(blob_sha, last_synced)
+            FROM git_blame_hunks
+            WHERE repo_id = {repo_id:UUID}
+        """
+        params: dict[str, Any] = {"repo_id": str(self._normalize_uuid(repo_id))}
+        if org_id:
+            query += " AND org_id = {org_id:String}"
+            params["org_id"] = org_id
+        query += " GROUP BY path"
+        async with self._lock:
+            result = await asyncio.to_thread(
+                self.client.query, query, parameters=params
+            )
+        rows = getattr(result, "result_rows", None) or []
+        return {str(row[0]): str(row[1] or "") for row in rows if row}
+
+    async def prune_blame_hunks(
+        self, repo_id, paths: Sequence[str], synced_at: datetime
+    ) -> None:
+        """Drop compact blame generations older than ``synced_at`` for ``paths``.
+
+        Re-blaming a file writes a new generation whose hunks rarely share
+        every ``start_line`` with the old one, so the replacing engine alone
+        would keep the superseded ranges forever. Each call is one mutation,
+        so callers pass every re-blamed path of a sync at once.
+        """
+        if not paths:
+            return
+        assert self.client is not None
+        org_id = getattr(self, "org_id", None) or ""
+        where = (
+            "repo_id = {repo_id:UUID} AND path IN {paths:Array(String)} "
+            "AND last_synced < {synced_at:DateTime64(3, 'UTC')}"
         )
+        params: dict[str, Any] = {
+            "repo_id": str(self._normalize_uuid(repo_id)),
+            "paths": list(paths),
+            "synced_at": self._normalize_datetime(synced_at),
+        }
+        if org_id:
+            where += " AND org_id = {org_id:String}"
+            params["org_id"] = org_id
+        async with self._lock:
+            await asyncio.to_thread(
+                self.client.command,
+                f"ALTER TABLE git_blame_hunks DELETE WHERE {where}",
+                parameters=params,
+            )
+
+    async def insert_blame_hunks(self, hunks: list[GitBlameHunk]) -> None:
+        if not hunks:
+            return
+        synced_at_default = self._normalize_datetime(datetime.now(timezone.utc))
+        columns: dict[str, list[Any]] = {
+            name: []
+            for name in (
+                "repo_id",
+                "path",
+                "start_line",
+                "line_count",
+                "commit_hash",
+                "author_email",
+                "author_name",
+                "author_when",
+                "blob_sha",
+                "last_synced",
+            )
+        }
+        for hunk in hunks:
+            columns["repo_id"].append(self._normalize_uuid(hunk.repo_id))
+            columns["path"].append(hunk.path)
+            columns["start_line"].append(int(hunk.start_line))
+            columns["line_count"].append(int(hunk.line_count))
+            columns["commit_hash"].append(hunk.commit_hash or "")
+            columns["author_email"].append(hunk.author_email)
+            columns["author_name"].append(hunk.author_name)
+            columns["author_when"].append(self._normalize_datetime(hunk.author_when))
+            columns["blob_sha"].append(hunk.blob_sha or "")
+            columns["last_synced"].append(
+                self._normalize_datetime(hunk.last_synced or synced_at_default)
+            )
+
+        await self._insert_columns("git_blame_hunks", columns)
 
     async def insert_git_pull_requests(
         self, pr_data: Sequence[GitPullRequest | dict[str, Any]]
@@ -21,6 +21,7 @@ from dev_health_ops.models import (
     SyncRunUnitStatus,
 )
 from dev_health_ops.sync.budget import BudgetEstimate, estimate_provider_budget
+from dev_health_ops.sync.cost_model import CostModel, load_cost_model
 from dev_health_ops.workers.rate_limit_defer import (
     RATE_LIMIT_DEFAULT_COUNTDOWN_SECONDS,
     RATE_LIMIT_MAX_TOTAL_WAIT_SECONDS,
@@ -202,6 +203,12 @@ class BudgetGuard:
         deferral_seconds = _env_int("SYNC_BUDGET_DRY_RUN_DEFERRAL_SECONDS", 60)
         consumed_by_bucket: dict[str, int] = defaultdict(int)
         observations: list[dict[str, Any]] = []
+        cost_model = load_cost_model(
+            session,
+            org_ids={str(unit.org_id) for unit in units},
+            now=observed_at,
+            cache_key=sync_run_id,
+        )
 
         for unit in units:
             log_ctx = {
@@ -214,7 +221,7 @@ class BudgetGuard:
             }
             try:
                 ctx = SyncTaskBootstrap.load(session, str(unit.id))
-                estimates = estimate_provider_budget(ctx)
+                estimates = _unit_estimates(ctx, unit, cost_model)
             except Exception as exc:
                 logger.warning(
                     "dispatch_sync_run.budget_guard_dry_run_failed",
@@ -286,6 +293,14 @@ class BudgetGuard:
         estimates_by_unit: dict[str, tuple[BudgetEstimate, ...]] = {}
         budget_keys: set[str] = set()
         observations: list[dict[str, Any]] = []
+        # One learned-cost read per run (reused across its passes), covering
+        # every org this pass can touch; None leaves every estimate static.
+        cost_model = load_cost_model(
+            session,
+            org_ids={str(unit.org_id) for unit in (*units, *surplus_candidates)},
+            now=enforced_at,
+            cache_key=sync_run_id,
+        )
 
         # Surplus candidates are estimated HERE, alongside the real candidates,
         # rather than after admission: their budget keys have to join the same
@@ -297,7 +312,7 @@ class BudgetGuard:
             log_ctx = _unit_log_context(sync_run_id, unit)
             try:
                 ctx = SyncTaskBootstrap.load(session, str(unit.id))
-                estimates = estimate_provider_budget(ctx)
+                estimates = _unit_estimates(ctx, unit, cost_model)
             except Exception as exc:
                 logger.warning(
                     "dispatch_sync_run.budget_guard_enforce_failed",
@@ -392,6 +407,7 @@ class BudgetGuard:
             session,
             now=enforced_at,
             budget_keys=budget_keys,
+            cost_model=cost_model,
         )
         # The DURABLE baseline (review round 2, R2-F1): consumption from work
         # already dispatching/running, captured BEFORE the admission loop
@@ -1174,6 +1190,21 @@ def _withdraw_surplus_admission(
     return True
 
 
+def _unit_estimates(
+    ctx: Any, unit: SyncRunUnit, cost_model: CostModel | None
+) -> tuple[BudgetEstimate, ...]:
+    """Static estimates for ``unit``, calibrated by the learned cost model.
+
+    Admission, active consumption and the dry run all price units through
+    here, so a running unit and a candidate in the same bucket are always
+    measured in the same units.
+    """
+    estimates = estimate_provider_budget(ctx)
+    if cost_model is None:
+        return estimates
+    return cost_model.calibrate_unit(unit, estimates)
+
+
 def _observe_estimate(
     estimate: BudgetEstimate,
     *,
@@ -2485,6 +2516,7 @@ def _active_budget_consumption(
     *,
     now: datetime,
     budget_keys: set[str],
+    cost_model: CostModel | None = None,
 ) -> dict[str, int]:
     consumed_by_bucket: dict[str, int] = defaultdict(int)
     if not budget_keys:
@@ -2513,7 +2545,7 @@ def _active_budget_consumption(
     for unit in units:
         try:
             ctx = SyncTaskBootstrap.load(session, str(unit.id))
-            estimates = estimate_provider_budget(ctx)
+            estimates = _unit_estimates(ctx, unit, cost_model)
         except Exception as exc:
             logger.warning(
                 "dispatch_sync_run.budget_guard_active_estimate_failed",
@@ -2591,6 +2623,22 @@ def _parse_budget_limits(raw_limits: str | None) -> dict[str, int]:
     return limits
 
 
+def configured_bucket_limit(
+    bucket: Mapping[str, str], *, route_family: str, default_limit: int = 0
+) -> int:
+    """Configured ``SYNC_BUDGET_BUCKET_LIMITS`` entry for a bucket's route family.
+
+    Resolves the same most-specific-first keys the guard enforces, returning
+    ``default_limit`` when no entry matches.
+    """
+    return _limit_for_bucket(
+        bucket,
+        route_family=route_family,
+        limits=_enforced_budget_limits(),
+        default_limit=default_limit,
+    )
+
+
 def _limit_for_bucket(
     bucket: Mapping[str, str],
     *,
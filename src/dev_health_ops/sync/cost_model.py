@@ -0,0 +1,465 @@
+"""Learned per-dataset request cost model.
+
+Why this exists
+---------------
+Every provider estimator (``providers/*/budget.py``) prices a unit as a fixed
+floor scaled by window span. Those floors are deliberately conservative, so
+the budget guard reserves far more of a bucket than a typical unit spends and
+the HEAVY incremental ratchet advances at a fixed
+``SYNC_INCREMENTAL_HEAVY_MAX_WINDOW_DAYS`` regardless of what a window
+actually costs.
+
+The unit worker already persists what each unit really cost: every SUCCESS
+unit's ``result.observations.budget_comparison`` holds the CHAOS-2759 join of
+its estimate against the drained request counts, per ``(route_family,
+dimension)``. This module learns from those rows. No new table, no new write
+path.
+
+Model
+-----
+For each ``(org_id, source_id, dataset_key, route_family, dimension)`` the
+observed cost per window-day (``rate_limited_requests / span_days``, with the
+same whole-day, floor-one span the estimators use) is averaged with an
+exponential decay on the unit's age (``SYNC_COST_MODEL_HALF_LIFE_DAYS``).
+Estimates use the upper prediction bound ``mean + z * stddev * sqrt(1 +
+1/n_eff)``, which bounds the cost of the *next* unit rather than the mean:
+the guard reserves per unit, so a bound on the mean alone would
+under-reserve for roughly half of the units it admits. A key with
+fewer effective samples than ``SYNC_COST_MODEL_MIN_SAMPLES`` is not learned,
+and its static estimate stands.
+
+Only request-count dimensions are learned (``rest_core`` and ``search``).
+For abstract reservation units such as GraphQL cost points, a request count
+says nothing about the estimate. Rows marked ``incomplete``, because the
+recorder overflowed and undercounted, are skipped as well.
+
+The model is opt-in (``SYNC_COST_MODEL_ENABLED``). When it is off,
+:func:`load_cost_model` returns ``None`` without touching the session, and
+both consumers behave exactly as before.
+
+The budget guard runs on every dispatch pass, so it loads with a
+``cache_key`` (the sync run id): a run reuses its model for
+``SYNC_COST_MODEL_CACHE_SECONDS`` instead of re-reading history each pass.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from dev_health_ops.models import SyncRunUnit, SyncRunUnitStatus
+from dev_health_ops.sync.budget_types import BudgetEstimate
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+COST_MODEL_ENABLED_ENV = "SYNC_COST_MODEL_ENABLED"
+COST_MODEL_HALF_LIFE_DAYS_ENV = "SYNC_COST_MODEL_HALF_LIFE_DAYS"
+COST_MODEL_LOOKBACK_DAYS_ENV = "SYNC_COST_MODEL_LOOKBACK_DAYS"
+COST_MODEL_MIN_SAMPLES_ENV = "SYNC_COST_MODEL_MIN_SAMPLES"
+COST_MODEL_CONFIDENCE_Z_ENV = "SYNC_COST_MODEL_CONFIDENCE_Z"
+COST_MODEL_MAX_UNITS_ENV = "SYNC_COST_MODEL_MAX_UNITS"
+COST_MODEL_CACHE_SECONDS_ENV = "SYNC_COST_MODEL_CACHE_SECONDS"
+
+DEFAULT_HALF_LIFE_DAYS = 7.0
+DEFAULT_LOOKBACK_DAYS = 30
+DEFAULT_MIN_SAMPLES = 3.0
+#: One-sided 95% bound.
+DEFAULT_CONFIDENCE_Z = 1.645
+#: Most recent SUCCESS units read per load. Bounds the per-pass query.
+DEFAULT_MAX_UNITS = 5_000
+#: How long a run reuses the model it loaded on an earlier pass.
+DEFAULT_CACHE_SECONDS = 300.0
+
+#: Confidence label stamped on calibrated estimates.
+LEARNED_CONFIDENCE = "learned"
+
+# Mirrors ``workers/sync_units.py::_REQUEST_COUNT_COMPARABLE_DIMENSIONS``.
+# Duplicated rather than imported for the same reverse-import-cycle reason
+# budget_guard duplicates its constants: sync_units imports the guard.
+_REQUEST_COUNT_DIMENSIONS = frozenset({"rest_core", "search"})
+
+_SECONDS_PER_DAY = 86_400
+
+_CACHE_MAX_ENTRIES = 256
+# (cache_key, org_ids) -> (monotonic expiry, model), least recently used first.
+_model_cache: OrderedDict[tuple[str, tuple[str, ...]], tuple[float, CostModel]] = (
+    OrderedDict()
+)
+
+
+@dataclass(frozen=True)
+class CostModelKey:
+    org_id: str
+    source_id: str
+    dataset_key: str
+    route_family: str
+    dimension: str
+
+
+@dataclass(frozen=True)
+class CostSample:
+    """One unit's observed cost for one route family."""
+
+    key: CostModelKey
+    cost_per_day: float
+    observed_at: datetime
+    bucket: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class LearnedCost:
+    """Decayed cost statistics for one :class:`CostModelKey`."""
+
+    mean_per_day: float
+    stddev_per_day: float
+    effective_samples: float
+    upper_per_day: float
+    #: Most recent bucket the route family was charged to, so callers can
+    #: look up the bucket's configured limit without re-running an estimator.
+    bucket: Mapping[str, Any]
+
+    def units_for_span(self, span_days: int) -> int:
+        return max(1, math.ceil(self.upper_per_day * max(1, span_days)))
+
+
+def learn_costs(
+    samples: Iterable[CostSample],
+    *,
+    now: datetime,
+    half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+    min_samples: float = DEFAULT_MIN_SAMPLES,
+    confidence_z: float = DEFAULT_CONFIDENCE_Z,
+) -> dict[CostModelKey, LearnedCost]:
+    """Fold samples into per-key decayed statistics.
+
+    Keys whose decayed effective sample size (``(sum w)^2 / sum w^2``) is
+    below ``min_samples`` are omitted.
+    """
+    grouped: dict[CostModelKey, list[CostSample]] = defaultdict(list)
+    for sample in samples:
+        grouped[sample.key].append(sample)
+
+    learned: dict[CostModelKey, LearnedCost] = {}
+    for key, key_samples in grouped.items():
+        weights = [
+            _decay_weight(sample.observed_at, now=now, half_life_days=half_life_days)
+            for sample in key_samples
+        ]
+        weight_sum = sum(weights)
+        if weight_sum <= 0:
+            continue
+        effective = weight_sum**2 / sum(weight**2 for weight in weights)
+        # n identical-age samples give n_eff == n up to float rounding.
+        if effective + 1e-9 < min_samples:
+            continue
+        mean = (
+            sum(w * s.cost_per_day for w, s in zip(weights, key_samples, strict=True))
+            / weight_sum
+        )
+        variance = (
+            sum(
+                w * (s.cost_per_day - mean) ** 2
+                for w, s in zip(weights, key_samples, strict=True)
+            )
+            / weight_sum
+        )
+        stddev = math.sqrt(variance)
+        latest = max(key_samples, key=lambda sample: sample.observed_at)
+        learned[key] = LearnedCost(
+            mean_per_day=mean,
+            stddev_per_day=stddev,
+            effective_samples=effective,
+            upper_per_day=mean
+            + confidence_z * stddev * math.sqrt(1.0 + 1.0 / effective),
+            bucket=dict(latest.bucket),
+        )
+    return learned
+
+
+def cost_samples_from_unit(unit: SyncRunUnit) -> list[CostSample]:
+    """Extract learnable samples from a SUCCESS unit's persisted comparison."""
+    result = unit.result if isinstance(unit.result, Mapping) else {}
+    observations = result.get("observations")
+    if not isinstance(observations, Mapping):
+        return []
+    return _cost_samples(unit, observations.get("budget_comparison"))
+
+
+def _cost_samples(unit: Any, comparisons: Any) -> list[CostSample]:
+    """Samples from ``comparisons`` for a unit-shaped row (ORM or column row)."""
+    if not isinstance(comparisons, list):
+        return []
+    observed_at = _as_aware(unit.updated_at or unit.created_at)
+    span_days = span_days_between(unit.since_at, unit.before_at)
+    samples: list[CostSample] = []
+    for row in comparisons:
+        if not isinstance(row, Mapping) or row.get("incomplete"):
+            continue
+        dimension = str(row.get("dimension") or "")
+        route_family = str(row.get("route_family") or "")
+        if dimension not in _REQUEST_COUNT_DIMENSIONS or not route_family:
+            continue
+        requests = row.get("rate_limited_requests", row.get("actual_requests"))
+        try:
+            requests = int(requests)
+        except (TypeError, ValueError):
+            continue
+        bucket = row.get("bucket")
+        samples.append(
+            CostSample(
+                key=CostModelKey(
+                    org_id=str(unit.org_id),
+                    source_id=str(unit.source_id),
+                    dataset_key=str(unit.dataset_key),
+                    route_family=route_family,
+                    dimension=dimension,
+                ),
+                cost_per_day=max(0, requests) / span_days,
+                observed_at=observed_at,
+                bucket=bucket if isinstance(bucket, Mapping) else {},
+            )
+        )
+    return samples
+
+
+class CostModel:
+    """Learned costs for a set of orgs, loaded once per planner/guard pass."""
+
+    def __init__(self, learned: Mapping[CostModelKey, LearnedCost]) -> None:
+        self._learned = dict(learned)
+        self._by_dataset: dict[tuple[str, str, str], dict[tuple[str, str], Any]] = (
+            defaultdict(dict)
+        )
+        for key, cost in self._learned.items():
+            self._by_dataset[(key.org_id, key.source_id, key.dataset_key)][
+                (key.route_family, key.dimension)
+            ] = cost
+
+    def __len__(self) -> int:
+        return len(self._learned)
+
+    def lookup(self, key: CostModelKey) -> LearnedCost | None:
+        return self._learned.get(key)
+
+    def for_dataset(
+        self, *, org_id: str, source_id: str, dataset_key: str
+    ) -> Mapping[tuple[str, str], LearnedCost]:
+        """Learned costs by ``(route_family, dimension)`` for one dataset."""
+        return self._by_dataset.get((org_id, source_id, dataset_key), {})
+
+    def calibrate(
+        self,
+        estimates: tuple[BudgetEstimate, ...],
+        *,
+        org_id: str,
+        source_id: str,
+        dataset_key: str,
+        span_days: int,
+    ) -> tuple[BudgetEstimate, ...]:
+        """Replace static estimates with learned upper bounds where known.
+
+        Route families without a learned cost keep their static estimate, so
+        a partially-learned dataset is never under-reserved on the rest.
+        """
+        learned = self.for_dataset(
+            org_id=org_id, source_id=source_id, dataset_key=dataset_key
+        )
+        if not learned:
+            return estimates
+        calibrated: list[BudgetEstimate] = []
+        for estimate in estimates:
+            cost = learned.get((estimate.route_family, estimate.bucket.dimension.value))
+            if cost is None:
+                calibrated.append(estimate)
+                continue
+            calibrated.append(
+                replace(
+                    estimate,
+                    estimated_units=cost.units_for_span(span_days),
+                    confidence=LEARNED_CONFIDENCE,
+                    notes=(
+                        *estimate.notes,
+                        (
+                            f"learned {cost.upper_per_day:.1f}/day upper bound "
+                            f"(mean {cost.mean_per_day:.1f}, "
+                            f"n_eff {cost.effective_samples:.1f}); "
+                            f"static estimate was {estimate.estimated_units}"
+                        ),
+                    ),
+                )
+            )
+        return tuple(calibrated)
+
+    def calibrate_unit(
+        self, unit: SyncRunUnit, estimates: tuple[BudgetEstimate, ...]
+    ) -> tuple[BudgetEstimate, ...]:
+        return self.calibrate(
+            estimates,
+            org_id=str(unit.org_id),
+            source_id=str(unit.source_id),
+            dataset_key=str(unit.dataset_key),
+            span_days=span_days_between(unit.since_at, unit.before_at),
+        )
+
+
+def cost_model_enabled() -> bool:
+    return (os.getenv(COST_MODEL_ENABLED_ENV) or "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def load_cost_model(
+    session: Session,
+    *,
+    org_ids: Iterable[str],
+    now: datetime | None = None,
+    cache_key: str | None = None,
+) -> CostModel | None:
+    """Learn costs for ``org_ids`` from their recent SUCCESS units.
+
+    Returns ``None`` when ``SYNC_COST_MODEL_ENABLED`` is off. A failed read
+    is logged and also yields ``None``: the static estimates are always a
+    safe fallback. The read runs in a SAVEPOINT so a failure leaves the
+    caller's transaction usable. With ``cache_key`` a model loaded for the
+    same key and orgs within ``SYNC_COST_MODEL_CACHE_SECONDS`` is reused.
+    """
+    if not cost_model_enabled():
+        return None
+    org_ids = sorted({str(org_id) for org_id in org_ids})
+    if not org_ids:
+        return CostModel({})
+    cache_entry = (cache_key, tuple(org_ids)) if cache_key is not None else None
+    if cache_entry is not None:
+        cached = _model_cache.get(cache_entry)
+        if cached is not None and cached[0] > time.monotonic():
+            _model_cache.move_to_end(cache_entry)
+            return cached[1]
+    loaded_at = now or datetime.now(timezone.utc)
+    cutoff = loaded_at - timedelta(
+        days=_env_float(COST_MODEL_LOOKBACK_DAYS_ENV, DEFAULT_LOOKBACK_DAYS)
+    )
+    try:
+        # Only the columns the samples need; ``result`` can be large, so just
+        # its comparison list is read.
+        with session.begin_nested():
+            units = (
+                session.query(
+                    SyncRunUnit.org_id,
+                    SyncRunUnit.source_id,
+                    SyncRunUnit.dataset_key,
+                    SyncRunUnit.since_at,
+                    SyncRunUnit.before_at,
+                    SyncRunUnit.created_at,
+                    SyncRunUnit.updated_at,
+                    SyncRunUnit.result["observations"]["budget_comparison"].label(
+                        "budget_comparison"
+                    ),
+                )
+                .filter(
+                    SyncRunUnit.org_id.in_(org_ids),
+                    SyncRunUnit.status == SyncRunUnitStatus.SUCCESS.value,
+                    SyncRunUnit.updated_at >= cutoff,
+                )
+                .order_by(SyncRunUnit.updated_at.desc())
+                .limit(int(_env_float(COST_MODEL_MAX_UNITS_ENV, DEFAULT_MAX_UNITS)))
+                .all()
+            )
+    except Exception as exc:
+        logger.warning(
+            "sync.cost_model.load_failed",
+            extra={"org_ids": org_ids, "error": str(exc)},
+        )
+        return None
+    samples = [
+        sample
+        for unit in units
+        for sample in _cost_samples(unit, unit.budget_comparison)
+    ]
+    model = CostModel(
+        learn_costs(
+            samples,
+            now=loaded_at,
+            half_life_days=_env_float(
+                COST_MODEL_HALF_LIFE_DAYS_ENV, DEFAULT_HALF_LIFE_DAYS
+            ),
+            min_samples=_env_float(COST_MODEL_MIN_SAMPLES_ENV, DEFAULT_MIN_SAMPLES),
+            confidence_z=_env_float(COST_MODEL_CONFIDENCE_Z_ENV, DEFAULT_CONFIDENCE_Z),
+        )
+    )
+    logger.debug(
+        "sync.cost_model.loaded",
+        extra={
+            "org_ids": org_ids,
+            "units_read": len(units),
+            "samples": len(samples),
+            "learned_keys": len(model),
+        },
+    )
+    if cache_entry is not None:
+        ttl = _env_float(COST_MODEL_CACHE_SECONDS_ENV, DEFAULT_CACHE_SECONDS)
+        _model_cache[cache_entry] = (time.monotonic() + ttl, model)
+        _model_cache.move_to_end(cache_entry)
+        while len(_model_cache) > _CACHE_MAX_ENTRIES:
+            _model_cache.popitem(last=False)
+    return model
+
+
+def span_days_between(since_at: datetime | None, before_at: datetime | None) -> int:
+    """Whole-day window span floored at one, as ``window_span_days`` counts it."""
+    if since_at is None or before_at is None:
+        return 1
+    days = (_as_aware(before_at) - _as_aware(since_at)).days
+    return max(1, days)
+
+
+def _decay_weight(
+    observed_at: datetime, *, now: datetime, half_life_days: float
+) -> float:
+    if half_life_days <= 0:
+        return 1.0
+    age_days = max(0.0, (now - _as_aware(observed_at)).total_seconds())
+    age_days /= _SECONDS_PER_DAY
+    return 0.5 ** (age_days / half_life_days)
+
+
+def _as_aware(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+__all__ = [
+    "CostModel",
+    "CostModelKey",
+    "CostSample",
+    "LearnedCost",
+    "cost_model_enabled",
+    "cost_samples_from_unit",
+    "learn_costs",
+    "load_cost_model",
+    "span_days_between",
+]
@@ -45,6 +45,12 @@ Invariants:
     reports success. ``_effective_heavy_max_window_days`` clamps the cap above
     the overlap and logs a warning naming both values.
     See docs/operate/run/ingestion-and-backfills.md.
+    With ``SYNC_COST_MODEL_ENABLED`` the cap is instead sized from the learned
+    per-window-day cost (``sync.cost_model``): the widest window whose learned
+    upper-bound cost fits ``SYNC_COST_MODEL_WINDOW_BUDGET_FRACTION`` of every
+    configured bucket limit the dataset draws on, still above the overlap
+    floor and at most ``SYNC_COST_MODEL_MAX_WINDOW_DAYS``. With no learned
+    cost, or no configured limit to fill, the static cap applies.
   * Watermark-stamping window rules (CHAOS-3412), enforced once in
     ``_watermark_stamping_window`` for BOTH modes whose success path stamps a
     watermark (INCREMENTAL and FULL_RESYNC — ``sync_units`` gates on exactly
@@ -104,10 +110,12 @@ from dev_health_ops.models import (
 from dev_health_ops.providers.github.work_item_options import (
     snapshot_github_work_item_runtime_options,
 )
+from dev_health_ops.sync.budget_guard import configured_bucket_limit
 from dev_health_ops.sync.canonical_incident_gate import (
     require_canonical_incident_feature_sync,
     sync_datasets_require_canonical_incident_feature,
 )
+from dev_health_ops.sync.cost_model import CostModel, load_cost_model
 from dev_health_ops.sync.datasets import (
     CostClass,
     DatasetKey,
@@ -285,6 +293,11 @@ def plan_sync_run(session: Session, request: SyncPlanRequest) -> SyncRunPlan:
     sources = _load_enabled_sources(session, integration, request.source_ids)
     datasets = _load_enabled_datasets(session, integration, request.dataset_keys)
     now = datetime.now(timezone.utc)
+    cost_model = (
+        load_cost_model(session, org_ids=[integration.org_id], now=now)
+        if mode == SyncRunMode.INCREMENTAL.value
+        else None
+    )
 
     planned_units = _build_planned_units(
         session=session,
@@ -294,6 +307,7 @@ def plan_sync_run(session: Session, request: SyncPlanRequest) -> SyncRunPlan:
         datasets=datasets,
         mode=mode,
         now=now,
+        cost_model=cost_model,
     )
 
     # Plan-time mirror of DispatchGuard's total-unit cap (CHAOS-2512): deny
@@ -698,6 +712,7 @@ def _build_planned_units(
     datasets: list[IntegrationDataset],
     mode: str,
     now: datetime,
+    cost_model: CostModel | None = None,
 ) -> list[PlannedUnit]:
     planned_units: list[PlannedUnit] = []
     for source in sources:
@@ -750,6 +765,8 @@ def _build_planned_units(
                 now=now,
                 integration=integration,
                 dataset=dataset,
+                source_id=str(source.id),
+                cost_model=cost_model,
             )
             for window_start, window_end in windows:
                 planned_units.append(
@@ -777,6 +794,7 @@ def _build_planned_units(
             now=now,
             family_specs=family_specs,
             prs_enabled=prs_enabled,
+            cost_model=cost_model,
         )
         # Individual family ALIASES are deliberately unchecked above -- their
         # admission is the atomic-family collapse's business. The CANONICAL
@@ -891,6 +909,71 @@ def _effective_heavy_max_window_days() -> int:
     return min_cap_days
 
 
+_DEFAULT_COST_MODEL_WINDOW_BUDGET_FRACTION = 0.5
+_DEFAULT_COST_MODEL_MAX_WINDOW_DAYS = 30
+
+
+def _learned_heavy_window_days(
+    cost_model: CostModel,
+    *,
+    org_id: str,
+    source_id: str,
+    dataset_key: str,
+) -> int | None:
+    """HEAVY window span sized from learned cost, or ``None`` to keep the cap.
+
+    For every learned route family of the dataset whose bucket has a
+    configured ``SYNC_BUDGET_BUCKET_LIMITS`` entry, the affordable span is
+    ``fraction * limit / upper_cost_per_day``; the narrowest one wins, since
+    a unit is admitted only when all its buckets fit. The default limit is
+    deliberately not "filled": it is a ceiling for unconfigured buckets, not a
+    measured provider budget. The result is clamped to the same overlap floor
+    as :func:`_effective_heavy_max_window_days` so the ratchet always
+    advances.
+    """
+    learned = cost_model.for_dataset(
+        org_id=org_id, source_id=source_id, dataset_key=dataset_key
+    )
+    if not learned:
+        return None
+    fraction = _env_fraction(
+        "SYNC_COST_MODEL_WINDOW_BUDGET_FRACTION",
+        _DEFAULT_COST_MODEL_WINDOW_BUDGET_FRACTION,
+    )
+    affordable: list[int] = []
+    for (route_family, _dimension), cost in learned.items():
+        limit = configured_bucket_limit(
+            {str(k): str(v) for k, v in cost.bucket.items()},
+            route_family=route_family,
+        )
+        if limit <= 0 or cost.upper_per_day <= 0:
+            continue
+        affordable.append(int(fraction * limit // cost.upper_per_day))
+    if not affordable:
+        return None
+    floor_days = _watermark_overlap_seconds() // _SECONDS_PER_DAY + 1
+    max_days = _DEFAULT_COST_MODEL_MAX_WINDOW_DAYS
+    raw_max = os.getenv("SYNC_COST_MODEL_MAX_WINDOW_DAYS")
+    if raw_max is not None:
+        try:
+            max_days = max(1, int(raw_max))
+        except ValueError:
+            # Non-integer env override: keep the default.
+            pass
+    return max(floor_days, min(max_days, min(affordable)))
+
+
+def _env_fraction(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value if 0 < value <= 1 else default
+
+
 def heavy_ratchet_net_advance_seconds() -> int:
     """How far a successful capped HEAVY tick moves the watermark, in seconds.
 
@@ -1068,6 +1151,7 @@ def _build_work_item_family_units(
     now: datetime,
     family_specs: list[tuple[IntegrationDataset, DatasetSpec]],
     prs_enabled: bool,
+    cost_model: CostModel | None = None,
 ) -> list[PlannedUnit]:
     """Collapse the enabled work-item-family datasets into ONE composite unit
     per (source, window) (CHAOS-2721, AD-3)."""
@@ -1100,6 +1184,8 @@ def _build_work_item_family_units(
                 now=now,
                 integration=integration,
                 dataset=dataset,
+                source_id=str(source.id),
+                cost_model=cost_model,
             ),
         )
         for dataset, spec in family_specs
@@ -1279,6 +1365,8 @@ def _resolve_windows(
     now: datetime,
     integration: Integration,
     dataset: IntegrationDataset,
+    source_id: str | None = None,
+    cost_model: CostModel | None = None,
 ) -> tuple[tuple[datetime | None, datetime | None], ...]:
     if mode == SyncRunMode.INCREMENTAL.value:
         window_start: datetime | None = None
@@ -1301,9 +1389,18 @@ def _resolve_windows(
             # ``window_start`` may be naive when it came straight off a stored
             # watermark row; normalize for the comparison only — the value
             # persisted as ``since_at`` is left exactly as resolved.
-            capped_end = _as_utc(window_start) + timedelta(
-                days=_effective_heavy_max_window_days()
-            )
+            cap_days = _effective_heavy_max_window_days()
+            if cost_model is not None and source_id is not None:
+                cap_days = (
+                    _learned_heavy_window_days(
+                        cost_model,
+                        org_id=org_id,
+                        source_id=source_id,
+                        dataset_key=dataset_key,
+                    )
+                    or cap_days
+                )
+            capped_end = _as_utc(window_start) + timedelta(days=cap_days)
             window_end = min(window_end, capped_end)
         return _watermark_stamping_window(window_start, window_end, now)
 
@@ -15,10 +15,13 @@ import uuid
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any
 
 from dev_health_ops.metrics.schemas import (
     FeatureFlagLinkRecord,
     WorkGraphEdgeRecord,
+    WorkGraphEdgeRemovalRecord,
     WorkGraphIssuePRRecord,
     WorkGraphPRCommitRecord,
     WorkGraphProjectionRunRecord,
@@ -41,6 +44,23 @@ from dev_health_ops.work_graph.ids import (
     generate_pr_id,
     generate_release_id,
 )
+from dev_health_ops.work_graph.incremental import (
+    KEY_LOOKUP_BATCH_SIZE,
+    NEEDLE_BATCH_SIZE,
+    SOURCE_COMMITS,
+    SOURCE_ISSUE_PR_LINKS,
+    SOURCE_PR_COMMIT_LINKS,
+    SOURCE_PULL_REQUESTS,
+    SOURCE_WORK_ITEMS,
+    IssueKey,
+    IssueKeyLookups,
+    WatermarkTracker,
+    as_utc,
+    issue_key_for_work_item,
+    issue_key_records,
+    pr_key_for_row,
+    referenced_issue_keys,
+)
 from dev_health_ops.work_graph.models import (
     EdgeType,
     NodeType,
@@ -83,6 +103,18 @@ BLOCKER_PROJECTION_RULE_VERSION = "canonical-blocks.v2"
 _BLOCKER_TYPES = {"blocks", "blocked_by", "is_blocked_by"}
 
 
+def _edge_key(row: Any) -> tuple[str, str, str, str, str]:
+    """Identity of an edge row or record (the work_graph_edges sort key)."""
+    get = row.get if isinstance(row, dict) else partial(getattr, row)
+    return (
+        str(get("source_type")),
+        str(get("source_id")),
+        str(get("edge_type")),
+        str(get("target_type")),
+        str(get("target_id")),
+    )
+
+
 def _canonical_dependency(
     row: dict,
 ) -> tuple[str, str, EdgeType]:
@@ -131,6 +163,10 @@ class BuildConfig:
     heuristic_days_window: int = 7
     heuristic_confidence: float = 0.3
     org_id: str = ""
+    # Parse only commits/PRs/work items and fast-path links synced since the
+    # previous incremental build of this org (see work_graph.incremental).
+    # Those delta reads ignore from_date/to_date. Requires org_id.
+    incremental: bool = False
 
 
 class WorkGraphBuilder:
@@ -153,7 +189,14 @@ class WorkGraphBuilder:
         Args:
             config: Build configuration
         """
+        if config.incremental and not config.org_id:
+            raise ValueError("incremental work graph builds require an org_id")
         self.config = config
+        self._watermarks: WatermarkTracker | None = None
+        # Work item and PR rows read by the incremental text pass; they seed
+        # the incremental heuristic pass.
+        self._changed_work_items: list[dict] = []
+        self._changed_prs: list[dict] = []
         # Canonical pattern: a single sink owns the backend client + migrations.
         self.sink = create_sink(config.dsn)
         self._now = datetime.now(timezone.utc)
@@ -170,6 +213,27 @@ class WorkGraphBuilder:
         qualifier = f"{alias}." if alias else ""
         return f"AND {qualifier}org_id = '{self.config.org_id}'"
 
+    def _scope_clauses(self, time_column: str, *, windowed: bool = True) -> list[str]:
+        """WHERE clauses for the configured date window, repo and org.
+
+        Incremental delta reads pass ``windowed=False``: their watermark is
+        the lower bound, and a date window would hide rows from it.
+        """
+        clauses = []
+        if windowed and self.config.from_date:
+            clauses.append(
+                f"{time_column} >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
+            )
+        if windowed and self.config.to_date:
+            clauses.append(
+                f"{time_column} <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
+            )
+        if self.config.repo_id:
+            clauses.append(f"repo_id = '{self.config.repo_id}'")
+        if self.config.org_id:
+            clauses.append(f"org_id = '{self.config.org_id}'")
+        return clauses
+
     def _edge_to_record(self, edge: WorkGraphEdge) -> WorkGraphEdgeRecord:
         """Convert WorkGraphEdge to WorkGraphEdgeRecord for sink."""
         return WorkGraphEdgeRecord(
@@ -218,13 +282,107 @@ class WorkGraphBuilder:
         )
 
     def _write_edges(self, edges: list[WorkGraphEdge]) -> int:
-        """Write edges via the sink."""
+        """Write new or changed edges via the sink; return the edges built.
+
+        An edge whose stored version has the same content keeps its row and
+        ``last_synced``, so readers that track ``last_synced`` (the investment
+        component index) only see edges that actually changed.
+        """
         if not edges:
             return 0
         records = [self._edge_to_record(e) for e in edges]
-        self.sink.write_work_graph_edges(records)
+        changed = self._changed_edge_records(records)
+        if changed:
+            self.sink.write_work_graph_edges(changed)
         return len(records)
 
+    @staticmethod
+    def _edge_content(row: Any) -> tuple:
+        get = row.get if isinstance(row, dict) else partial(getattr, row)
+        event_ts = get("event_ts")
+        if isinstance(event_ts, datetime):
+            # Stored as DateTime64(3).
+            event_ts = as_utc(
+                event_ts.replace(microsecond=event_ts.microsecond // 1000 * 1000)
+            )
+        return (
+            str(get("repo_id") or ""),
+            str(get("provider") or ""),
+            str(get("provenance") or ""),
+            round(float(get("confidence") or 0.0), 4),
+            str(get("evidence") or ""),
+            event_ts,
+        )
+
+    def _changed_edge_records(
+        self, records: list[WorkGraphEdgeRecord]
+    ) -> list[WorkGraphEdgeRecord]:
+        """Records whose identity is new or whose latest stored content differs."""
+        stored: dict[tuple[str, ...], tuple] = {}
+        for offset in range(0, len(records), KEY_LOOKUP_BATCH_SIZE):
+            batch = records[offset : offset + KEY_LOOKUP_BATCH_SIZE]
+            query = """
+            SELECT
+                source_type, source_id, edge_type, target_type, target_id,
+                argMax(repo_id, last_synced) AS repo_id,
+                argMax(provider, last_synced) AS provider,
+                argMax(provenance, last_synced) AS provenance,
+                argMax(confidence, last_synced) AS confidence,
+                argMax(evidence, last_synced) AS evidence,
+                argMax(event_ts, last_synced) AS event_ts
+            FROM work_graph_edges
+            WHERE (source_type, source_id, edge_type, target_type, target_id)
+                IN {edge_keys:Array(Tuple(String, String, String, String, String))}
+            """
+            params: dict[str, object] = {
+                "edge_keys": [_edge_key(record) for record in batch]
+            }
+            if self.config.org_id:
+                query += " AND org_id = {org_id:String}"
+                params["org_id"] = self.config.org_id
+            query += (
+                " GROUP BY source_type, source_id, edge_type, target_type, target_id"
+            )
+            for row in self.sink.query_dicts(query, params):
+                stored[_edge_key(row)] = self._edge_content(row)
+        return [
+            record
+            for record in records
+            if stored.get(_edge_key(record)) != self._edge_content(record)
+        ]
+
+    def _record_edge_removals(self, where: str, params: dict[str, Any]) -> None:
+        """Record the endpoints of the edges matching ``where`` before a delete.
+
+        ``ALTER TABLE ... DELETE`` leaves no ``last_synced`` trace, so the
+        investment component index reads these rows to find the components a
+        removed edge split.
+        """
+        rows = self.sink.query_dicts(
+            "SELECT DISTINCT source_type, source_id, target_type, target_id "
+            f"FROM work_graph_edges WHERE {where}",
+            params,
+        )
+        if not rows:
+            return
+        writer = getattr(self.sink, "write_work_graph_edge_removals", None)
+        if not callable(writer):
+            raise RuntimeError("work graph edge removal sink is unavailable")
+        removed_at = datetime.now(timezone.utc)
+        writer(
+            [
+                WorkGraphEdgeRemovalRecord(
+                    source_type=str(row.get("source_type")),
+                    source_id=str(row.get("source_id")),
+                    target_type=str(row.get("target_type")),
+                    target_id=str(row.get("target_id")),
+                    removed_at=removed_at,
+                    org_id=self.config.org_id,
+                )
+                for row in rows
+            ]
+        )
+
     def _write_issue_pr_links(self, links: list[WorkGraphIssuePR]) -> None:
         """Write issue-PR links via the sink."""
         if not links:
@@ -456,7 +614,13 @@ class WorkGraphBuilder:
             "operational_incident_edges": 0,
         }
 
-        logger.info("Starting work graph build...")
+        logger.info(
+            "Starting %s work graph build...",
+            "incremental" if self.config.incremental else "full",
+        )
+        self._watermarks = None
+        self._changed_work_items = []
+        self._changed_prs = []
 
         self._delete_stale_pr_dependency_issue_edges()
 
@@ -470,14 +634,23 @@ class WorkGraphBuilder:
             self._build_issue_pr_edges_from_fast_path()
         )
 
-        # 3. Build issue->PR edges from PR title/body text parsing (fills fast path)
-        issue_pr_explicit, parsed_count = self._build_issue_pr_edges()
+        if self.config.incremental:
+            # 3/3b/4b. Text-derived links from rows synced since the last run.
+            issue_pr_explicit, parsed_count, stats["issue_commit_edges"] = (
+                self._build_text_links_incremental()
+            )
+        else:
+            # 3. Build issue->PR edges from PR title/body text parsing (fills
+            # fast path)
+            issue_pr_explicit, parsed_count = self._build_issue_pr_edges()
+
+            # 3b. Build issue->commit edges from commit message parsing
+            stats["issue_commit_edges"] = (
+                self._build_issue_commit_edges_from_text_parsing()
+            )
         stats["issue_pr_edges"] += parsed_count
         issue_pr_explicit |= issue_pr_existing
 
-        # 3b. Build issue->commit edges from commit message parsing
-        stats["issue_commit_edges"] = self._build_issue_commit_edges_from_text_parsing()
-
         # 4. Build heuristic issue->PR edges for items not linked explicitly
         stats["heuristic_edges"] = self._build_heuristic_issue_pr_edges(
             issue_pr_explicit
@@ -486,7 +659,8 @@ class WorkGraphBuilder:
         # 4b. Derive PR->commit links from commit messages (fills fast path).
         # Without this, work_graph_pr_commit is only ever written by fixtures, so
         # real orgs see no commits under PRs in the /work GraphView.
-        self._derive_pr_commit_links()
+        if not self.config.incremental:
+            self._derive_pr_commit_links()
 
         # 5. Build PR->commit edges from fast-path table (prerequisite)
         stats["pr_commit_edges"] = self._build_pr_commit_edges_from_fast_path()
@@ -501,6 +675,8 @@ class WorkGraphBuilder:
 
         stats["operational_incident_edges"] = self._build_operational_incident_edges()
 
+        self._publish_watermarks()
+
         logger.info(
             "Work graph build complete: %s",
             ", ".join(f"{k}={v}" for k, v in stats.items()),
@@ -508,6 +684,32 @@ class WorkGraphBuilder:
 
         return stats
 
+    def _tracker(self) -> WatermarkTracker:
+        """Watermarks of this incremental build, loaded on first use."""
+        if self._watermarks is None:
+            self._watermarks = WatermarkTracker.load(
+                self.sink, self.config.org_id, self.config.repo_id
+            )
+        return self._watermarks
+
+    def _publish_watermarks(self) -> None:
+        """Advance incremental watermarks after every write of the build."""
+        tracker = self._watermarks
+        if tracker is None:
+            return
+        records = tracker.records(self._now)
+        if records:
+            self._require_projection_writer()(records)
+        logger.info(
+            "Published incremental watermarks: %s",
+            ", ".join(
+                f"{r.projection_name}={r.input_watermark.isoformat()}"
+                for r in records
+                if r.input_watermark
+            )
+            or "unchanged",
+        )
+
     def _build_operational_incident_edges(self) -> int:
         if not self.config.org_id:
             return 0
@@ -813,14 +1015,16 @@ class WorkGraphBuilder:
             "startsWith(target_id, 'linear:')",
             "(startsWith(source_id, 'ghpr:') OR startsWith(source_id, 'gitlab:'))",
         ]
-        params: dict[str, str] = {}
+        params: dict[str, Any] = {}
         if self.config.org_id:
             where_parts.append("org_id = {org_id:String}")
             params["org_id"] = self.config.org_id
 
+        where = " AND ".join(where_parts)
+        self._record_edge_removals(where, params)
         command(
             "ALTER TABLE work_graph_edges DELETE WHERE "
-            + " AND ".join(where_parts)
+            + where
             + " SETTINGS mutations_sync=2",
             parameters=params or None,
         )
@@ -993,15 +1197,17 @@ class WorkGraphBuilder:
                         )
                     )
         ordered = sorted(candidate_ids)
+        where = "org_id = {org_id:String} AND edge_id IN {edge_ids:Array(String)}"
         for offset in range(0, len(ordered), 1_000):
+            params: dict[str, Any] = {
+                "org_id": self.config.org_id,
+                "edge_ids": ordered[offset : offset + 1_000],
+            }
+            self._record_edge_removals(where, params)
             command(
-                "ALTER TABLE work_graph_edges DELETE WHERE "
-                "org_id = {org_id:String} AND edge_id IN {edge_ids:Array(String)} "
+                f"ALTER TABLE work_graph_edges DELETE WHERE {where} "
                 "SETTINGS mutations_sync=2",
-                parameters={
-                    "org_id": self.config.org_id,
-                    "edge_ids": ordered[offset : offset + 1_000],
-                },
+                parameters=params,
             )
         logger.info("Removed %d candidate legacy blocker edge ids", len(ordered))
 
@@ -1063,19 +1269,7 @@ class WorkGraphBuilder:
             created_at
         FROM git_pull_requests
         """
-        where_clauses = []
-        if self.config.from_date:
-            where_clauses.append(
-                f"created_at >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-            )
-        if self.config.to_date:
-            where_clauses.append(
-                f"created_at <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
-            )
-        if self.config.repo_id:
-            where_clauses.append(f"repo_id = '{self.config.repo_id}'")
-        if self.config.org_id:
-            where_clauses.append(f"org_id = '{self.config.org_id}'")
+        where_clauses = self._scope_clauses("created_at")
 
         if where_clauses:
             pr_query += " WHERE " + " AND ".join(where_clauses)
@@ -1102,39 +1296,16 @@ class WorkGraphBuilder:
         wi_rows = self.sink.query_dicts(wi_query, {})
         logger.info("Found %d work items for lookup", len(wi_rows))
 
-        # Build work item lookups
-        # For Jira: key -> work_item_id
-        jira_key_lookup: dict[str, str] = {}
-        # For GitHub/GitLab: (repo_id, issue_number) -> work_item_id
-        gh_issue_lookup: dict[tuple[str, str], str] = {}
-        gl_issue_lookup: dict[tuple[str, str], str] = {}
+        lookups = IssueKeyLookups.from_work_item_rows(wi_rows)
 
         # Providers not covered by PR text parsing (notably Linear): their
         # issue<->PR links arrive as native attachments and become edges via
         # the work_item_dependencies pass (_build_issue_issue_edges), not here.
         # Counted so this log does not imply they were silently dropped.
         non_text_path_counts: dict[str, int] = {}
-
         for wi_row in wi_rows:
-            repo_id = wi_row.get("repo_id")
-            work_item_id = wi_row.get("work_item_id")
             provider = wi_row.get("provider")
-
-            if provider == "jira" and work_item_id:
-                # Extract key from work_item_id (format: "jira:ABC-123")
-                if str(work_item_id).startswith("jira:"):
-                    jira_key = str(work_item_id)[5:]  # Remove "jira:" prefix
-                    jira_key_lookup[jira_key.upper()] = str(work_item_id)
-            elif provider == "github" and repo_id and work_item_id:
-                # Extract issue number from work_item_id (format: "gh:owner/repo#123")
-                if "#" in str(work_item_id):
-                    issue_num = str(work_item_id).split("#")[-1]
-                    gh_issue_lookup[(str(repo_id), issue_num)] = str(work_item_id)
-            elif provider == "gitlab" and repo_id and work_item_id:
-                if "#" in str(work_item_id):
-                    issue_num = str(work_item_id).split("#")[-1]
-                    gl_issue_lookup[(str(repo_id), issue_num)] = str(work_item_id)
-            elif provider and provider not in ("jira", "github", "gitlab"):
+            if provider and provider not in ("jira", "github", "gitlab"):
                 non_text_path_counts[str(provider)] = (
                     non_text_path_counts.get(str(provider), 0) + 1
                 )
@@ -1142,9 +1313,9 @@ class WorkGraphBuilder:
         logger.info(
             "Built text-parse lookups: jira=%d, github=%d, gitlab=%d; "
             "non-text-path providers (edges via dependency pass): %s",
-            len(jira_key_lookup),
-            len(gh_issue_lookup),
-            len(gl_issue_lookup),
+            len(lookups.jira),
+            len(lookups.github),
+            len(lookups.gitlab),
             non_text_path_counts or "none",
         )
 
@@ -1159,7 +1330,18 @@ class WorkGraphBuilder:
         logger.debug("Work item repo_ids (GitHub): %s", wi_repo_ids)
         logger.debug("Repo ID overlap: %s", pr_repo_ids & wi_repo_ids)
 
-        # Process PRs and extract references
+        edges, fast_path_links, explicit_links = self._issue_pr_edges_from_rows(
+            pr_rows, lookups
+        )
+        edge_count = self._write_edges(edges)
+        self._write_issue_pr_links(fast_path_links)
+        logger.info("Created %d issue->PR edges from text parsing", edge_count)
+        return explicit_links, edge_count
+
+    def _issue_pr_edges_from_rows(
+        self, pr_rows: list[dict], lookups: IssueKeyLookups
+    ) -> tuple[list[WorkGraphEdge], list[WorkGraphIssuePR], set[tuple[str, int]]]:
+        """Parse PR title/body/branch text into issue->PR edges and links."""
         edges: list[WorkGraphEdge] = []
         fast_path_links: list[WorkGraphIssuePR] = []
         explicit_links: set[tuple[str, int]] = set()
@@ -1197,7 +1379,7 @@ class WorkGraphBuilder:
             jira_refs = extract_jira_keys(text_to_parse)
             jira_refs_found += len(jira_refs)
             for ref in jira_refs:
-                work_item_id = jira_key_lookup.get(ref.issue_key.upper())
+                work_item_id = lookups.jira.get(ref.issue_key.upper())
                 if work_item_id:
                     edge_type = (
                         EdgeType.IMPLEMENTS
@@ -1248,7 +1430,7 @@ class WorkGraphBuilder:
             gh_refs = extract_github_issue_refs(text_to_parse)
             gh_refs_found += len(gh_refs)
             for ref in gh_refs:
-                work_item_id = gh_issue_lookup.get((repo_id_str, ref.issue_key))
+                work_item_id = lookups.github.get((repo_id_str, ref.issue_key))
                 if work_item_id:
                     edge_type = (
                         EdgeType.IMPLEMENTS
@@ -1299,7 +1481,7 @@ class WorkGraphBuilder:
             gl_refs = extract_gitlab_issue_refs(text_to_parse)
             gl_refs_found += len(gl_refs)
             for ref in gl_refs:
-                work_item_id = gl_issue_lookup.get((repo_id_str, ref.issue_key))
+                work_item_id = lookups.gitlab.get((repo_id_str, ref.issue_key))
                 if work_item_id:
                     edge_type = (
                         EdgeType.IMPLEMENTS
@@ -1347,18 +1529,13 @@ class WorkGraphBuilder:
                     )
                     explicit_links.add((work_item_id, pr_number_int))
 
-        # Write edges
-        edge_count = self._write_edges(edges)
-        self._write_issue_pr_links(fast_path_links)
-
         logger.info(
             "Extracted refs: jira=%d, github=%d, gitlab=%d",
             jira_refs_found,
             gh_refs_found,
             gl_refs_found,
         )
-        logger.info("Created %d issue->PR edges from text parsing", edge_count)
-        return explicit_links, edge_count
+        return edges, fast_path_links, explicit_links
 
     def _build_issue_commit_edges_from_text_parsing(self) -> int:
         """Build issue->commit edges by parsing commit messages for issue refs."""
@@ -1373,19 +1550,7 @@ class WorkGraphBuilder:
         FROM git_commits
         WHERE message IS NOT NULL AND message != ''
         """
-        where_clauses = []
-        if self.config.from_date:
-            where_clauses.append(
-                f"author_when >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-            )
-        if self.config.to_date:
-            where_clauses.append(
-                f"author_when <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
-            )
-        if self.config.repo_id:
-            where_clauses.append(f"repo_id = '{self.config.repo_id}'")
-        if self.config.org_id:
-            where_clauses.append(f"org_id = '{self.config.org_id}'")
+        where_clauses = self._scope_clauses("author_when")
 
         if where_clauses:
             commit_query += " AND " + " AND ".join(where_clauses)
@@ -1409,35 +1574,23 @@ class WorkGraphBuilder:
             wi_query += f" WHERE org_id = '{self.config.org_id}'"
         wi_rows = self.sink.query_dicts(wi_query, {})
 
-        jira_key_lookup: dict[str, str] = {}
-        gh_issue_lookup: dict[tuple[str, str], str] = {}
-        gl_issue_lookup: dict[tuple[str, str], str] = {}
-
-        for wi_row in wi_rows:
-            repo_id = wi_row.get("repo_id")
-            work_item_id = wi_row.get("work_item_id")
-            provider = wi_row.get("provider")
-
-            if provider == "jira" and work_item_id:
-                if str(work_item_id).startswith("jira:"):
-                    jira_key = str(work_item_id)[5:]
-                    jira_key_lookup[jira_key.upper()] = str(work_item_id)
-            elif provider == "github" and repo_id and work_item_id:
-                if "#" in str(work_item_id):
-                    issue_num = str(work_item_id).split("#")[-1]
-                    gh_issue_lookup[(str(repo_id), issue_num)] = str(work_item_id)
-            elif provider == "gitlab" and repo_id and work_item_id:
-                if "#" in str(work_item_id):
-                    issue_num = str(work_item_id).split("#")[-1]
-                    gl_issue_lookup[(str(repo_id), issue_num)] = str(work_item_id)
-
+        lookups = IssueKeyLookups.from_work_item_rows(wi_rows)
         logger.info(
             "Built lookups for commits: jira=%d, github=%d, gitlab=%d",
-            len(jira_key_lookup),
-            len(gh_issue_lookup),
-            len(gl_issue_lookup),
+            len(lookups.jira),
+            len(lookups.github),
+            len(lookups.gitlab),
         )
 
+        edges = self._issue_commit_edges_from_rows(commit_rows, lookups)
+        edge_count = self._write_edges(edges)
+        logger.info("Created %d issue->commit edges from commit messages", edge_count)
+        return edge_count
+
+    def _issue_commit_edges_from_rows(
+        self, commit_rows: list[dict], lookups: IssueKeyLookups
+    ) -> list[WorkGraphEdge]:
+        """Parse commit messages into issue->commit edges."""
         edges: list[WorkGraphEdge] = []
         jira_refs_found = 0
         gh_refs_found = 0
@@ -1471,7 +1624,7 @@ class WorkGraphBuilder:
             jira_refs = extract_jira_keys(message)
             jira_refs_found += len(jira_refs)
             for ref in jira_refs:
-                work_item_id = jira_key_lookup.get(ref.issue_key.upper())
+                work_item_id = lookups.jira.get(ref.issue_key.upper())
                 if work_item_id:
                     edge_type = (
                         EdgeType.IMPLEMENTS
@@ -1511,7 +1664,7 @@ class WorkGraphBuilder:
             gh_refs = extract_github_issue_refs(message)
             gh_refs_found += len(gh_refs)
             for ref in gh_refs:
-                work_item_id = gh_issue_lookup.get((repo_id_str, ref.issue_key))
+                work_item_id = lookups.github.get((repo_id_str, ref.issue_key))
                 if work_item_id:
                     edge_type = (
                         EdgeType.IMPLEMENTS
@@ -1551,7 +1704,7 @@ class WorkGraphBuilder:
             gl_refs = extract_gitlab_issue_refs(message)
             gl_refs_found += len(gl_refs)
             for ref in gl_refs:
-                work_item_id = gl_issue_lookup.get((repo_id_str, ref.issue_key))
+                work_item_id = lookups.gitlab.get((repo_id_str, ref.issue_key))
                 if work_item_id:
                     edge_type = (
                         EdgeType.IMPLEMENTS
@@ -1588,15 +1741,281 @@ class WorkGraphBuilder:
                         )
                     )
 
-        edge_count = self._write_edges(edges)
         logger.info(
             "Commit message refs: jira=%d, github=%d, gitlab=%d",
             jira_refs_found,
             gh_refs_found,
             gl_refs_found,
         )
-        logger.info("Created %d issue->commit edges from commit messages", edge_count)
-        return edge_count
+        return edges
+
+    def _build_text_links_incremental(self) -> tuple[set[tuple[str, int]], int, int]:
+        """Parse only text synced since the last incremental build.
+
+        Covers the three text-parsing passes of a full build: issue->PR edges
+        from PR text, issue->commit edges and PR->commit links from commit
+        messages. Lookups read back only the keys that the parsed text
+        references. Older PRs and commits are re-scanned only when they
+        mention an issue key or PR number that the issue-key index did not
+        hold before this run. Those keys are added to the index after the
+        links are written, and the watermarks observed here are published by
+        :meth:`build` once every write has succeeded, so a failed run retries
+        the same re-scan.
+
+        Returns:
+            Tuple of (explicit (work_item_id, pr_number) pairs, issue->PR
+            edge count, issue->commit edge count)
+        """
+        logger.info("Building text-derived links incrementally...")
+        tracker = self._tracker()
+
+        # 1. Work items synced since the last run.
+        wi_query = f"""
+        SELECT repo_id, work_item_id, provider, updated_at, last_synced
+        FROM work_items
+        WHERE org_id = '{self.config.org_id}'
+        """
+        wi_rows = self._rows_since(wi_query, tracker.since(SOURCE_WORK_ITEMS))
+        tracker.observe(SOURCE_WORK_ITEMS, wi_rows)
+        changed_keys = {
+            key for row in wi_rows if (key := issue_key_for_work_item(row)) is not None
+        }
+
+        # 2. PRs and commits synced since the last run.
+        pr_query = """
+        SELECT repo_id, number, title, body, head_branch, created_at, last_synced
+        FROM git_pull_requests
+        WHERE """ + " AND ".join(self._scope_clauses("created_at", windowed=False))
+        commit_query = """
+        SELECT org_id, repo_id, hash, message, author_when, last_synced
+        FROM git_commits
+        WHERE message IS NOT NULL AND message != ''
+          AND """ + " AND ".join(self._scope_clauses("author_when", windowed=False))
+        pr_since = tracker.since(SOURCE_PULL_REQUESTS)
+        commit_since = tracker.since(SOURCE_COMMITS)
+        pr_rows = self._rows_since(pr_query, pr_since)
+        commit_rows = self._rows_since(commit_query, commit_since)
+        tracker.observe(SOURCE_PULL_REQUESTS, pr_rows)
+        tracker.observe(SOURCE_COMMITS, commit_rows)
+        changed_pr_keys = {
+            key for row in pr_rows if (key := pr_key_for_row(row)) is not None
+        }
+        self._changed_work_items = wi_rows
+        self._changed_prs = list(pr_rows)
+
+        # Only keys the index has not recorded yet are new; updates of known
+        # issues and PRs re-resolve through their own delta rows.
+        indexed = set(
+            self._load_indexed_keys(
+                {key.issue_key for key in changed_keys | changed_pr_keys}
+            )
+        )
+        new_keys = changed_keys - indexed
+        new_pr_keys = changed_pr_keys - indexed
+
+        # 3. Older text that mentions a key or PR number new in this run. On
+        # the first run every row is already in the delta.
+        jira_needles = {k.issue_key for k in new_keys if k.provider == "jira"}
+        issue_needles: dict[str, set[str]] = {}
+        for key in new_keys:
+            if key.provider != "jira":
+                issue_needles.setdefault(key.repo_id, set()).add(f"#{key.issue_key}")
+        if pr_since is not None:
+            pr_text = (
+                "concat(ifNull(title, ''), ' ', ifNull(body, ''), ' ', "
+                "ifNull(head_branch, ''))"
+            )
+            pr_rows += self._rescan_rows(pr_query, pr_text, {"": jira_needles})
+            pr_rows += self._rescan_rows(pr_query, pr_text, issue_needles)
+        if commit_since is not None:
+            commit_needles = {
+                repo: set(needles) for repo, needles in issue_needles.items()
+            }
+            for pr_key in new_pr_keys:
+                commit_needles.setdefault(pr_key.repo_id, set()).update(
+                    (f"#{pr_key.issue_key}", f"!{pr_key.issue_key}")
+                )
+            commit_rows += self._rescan_rows(
+                commit_query, "message", {"": jira_needles}
+            )
+            commit_rows += self._rescan_rows(commit_query, "message", commit_needles)
+        pr_rows = list(
+            {(str(r.get("repo_id")), r.get("number")): r for r in pr_rows}.values()
+        )
+        commit_rows = list(
+            {(str(r.get("repo_id")), r.get("hash")): r for r in commit_rows}.values()
+        )
+        logger.info(
+            "Incremental delta: work_items=%d (new keys=%d), prs=%d (new=%d), "
+            "commits=%d",
+            len(wi_rows),
+            len(new_keys),
+            len(pr_rows),
+            len(new_pr_keys),
+            len(commit_rows),
+        )
+
+        # 4. Resolve only the keys the parsed text references.
+        referenced: set[str] = set()
+        for row in pr_rows:
+            referenced |= referenced_issue_keys(
+                f"{row.get('title') or ''}\n{row.get('body') or ''}\n"
+                f"{row.get('head_branch') or ''}"
+            )
+        for row in commit_rows:
+            referenced |= referenced_issue_keys(str(row.get("message") or ""))
+        lookups = self._load_issue_key_lookups(referenced)
+        for key in changed_keys:
+            lookups.add(key)
+
+        edges, fast_path_links, explicit_links = self._issue_pr_edges_from_rows(
+            pr_rows, lookups
+        )
+        issue_pr_count = self._write_edges(edges)
+        self._write_issue_pr_links(fast_path_links)
+        issue_commit_count = self._write_edges(
+            self._issue_commit_edges_from_rows(commit_rows, lookups)
+        )
+        pr_commit_links = self._pr_commit_links_from_rows(
+            commit_rows, self._load_known_prs(commit_rows)
+        )
+        self._write_pr_commit_links(pr_commit_links)
+        if new_keys or new_pr_keys:
+            self.sink.write_work_graph_issue_keys(
+                issue_key_records(new_keys | new_pr_keys, self.config.org_id, self._now)
+            )
+        logger.info(
+            "Incremental text links: issue_pr=%d, issue_commit=%d, pr_commit=%d",
+            issue_pr_count,
+            issue_commit_count,
+            len(pr_commit_links),
+        )
+        return explicit_links, issue_pr_count, issue_commit_count
+
+    def _rows_since(self, query: str, since: datetime | None) -> list[dict]:
+        """Run ``query`` limited to rows synced after ``since`` (all when None)."""
+        if since is None:
+            return self.sink.query_dicts(query, {})
+        return self.sink.query_dicts(
+            query + " AND last_synced > {since:DateTime64(3, 'UTC')}",
+            {"since": since},
+        )
+
+    def _fast_path_delta(
+        self, source: str, joined_alias: str, joined_source: str
+    ) -> tuple[str, dict[str, object]]:
+        """WHERE clause limiting a fast-path join to rows changed since the marks.
+
+        A link row is re-read when it changed itself or when the row it joins
+        to changed, so a link written before its PR or commit was synced
+        still becomes an edge once that row arrives. Returns an empty clause
+        when either side has no watermark yet (the first run reads all).
+        """
+        tracker = self._tracker()
+        link_since = tracker.since(source)
+        joined_since = tracker.since(joined_source)
+        if link_since is None or joined_since is None:
+            return "", {}
+        return (
+            "(p.last_synced > {link_since:DateTime64(3, 'UTC')} OR "
+            f"{joined_alias}.last_synced > "
+            "{joined_since:DateTime64(3, 'UTC')})",
+            {"link_since": link_since, "joined_since": joined_since},
+        )
+
+    def _rescan_rows(
+        self, query: str, text_expr: str, needles_by_repo: dict[str, set[str]]
+    ) -> list[dict]:
+        """Rows whose ``text_expr`` contains any needle; ``""`` means any repo."""
+        rows: list[dict] = []
+        for repo_key, needles in needles_by_repo.items():
+            ordered = sorted(needles)
+            for offset in range(0, len(ordered), NEEDLE_BATCH_SIZE):
+                scoped = (
+                    query
+                    + f" AND multiSearchAnyCaseInsensitive({text_expr}, "
+                    + "{needles:Array(String)})"
+                )
+                params: dict[str, object] = {
+                    "needles": ordered[offset : offset + NEEDLE_BATCH_SIZE]
+                }
+                if repo_key:
+                    scoped += " AND toString(repo_id) = {rescan_repo_id:String}"
+                    params["rescan_repo_id"] = repo_key
+                rows.extend(self.sink.query_dicts(scoped, params))
+        return rows
+
+    def _load_issue_key_lookups(self, issue_keys: set[str]) -> IssueKeyLookups:
+        lookups = IssueKeyLookups()
+        for key in self._load_indexed_keys(issue_keys):
+            lookups.add(key)
+        return lookups
+
+    def _load_indexed_keys(self, issue_keys: set[str]) -> list[IssueKey]:
+        """Index rows (issue keys and recorded PRs) for the given key strings."""
+        keys: list[IssueKey] = []
+        ordered = sorted(issue_keys)
+        for offset in range(0, len(ordered), KEY_LOOKUP_BATCH_SIZE):
+            rows = self.sink.query_dicts(
+                """
+                SELECT provider, repo_id, issue_key, work_item_id
+                FROM work_graph_issue_key_index FINAL
+                WHERE org_id = {org_id:String}
+                  AND issue_key IN {issue_keys:Array(String)}
+                """,
+                {
+                    "org_id": self.config.org_id,
+                    "issue_keys": ordered[offset : offset + KEY_LOOKUP_BATCH_SIZE],
+                },
+            )
+            for row in rows:
+                keys.append(
+                    IssueKey(
+                        provider=str(row.get("provider") or ""),
+                        repo_id=str(row.get("repo_id") or ""),
+                        issue_key=str(row.get("issue_key") or ""),
+                        work_item_id=str(row.get("work_item_id") or ""),
+                    )
+                )
+        return keys
+
+    def _load_known_prs(
+        self, commit_rows: list[dict]
+    ) -> dict[tuple[str, str], set[int]]:
+        """Known PRs among the numbers the given commit messages reference."""
+        repo_ids: set[str] = set()
+        numbers: set[int] = set()
+        for row in commit_rows:
+            message = str(row.get("message") or "")
+            refs = extract_pr_refs(message) + extract_squash_pr_refs(message)
+            if refs and row.get("repo_id") is not None:
+                repo_ids.add(str(row["repo_id"]))
+                numbers.update(refs)
+        if not numbers:
+            return {}
+        rows = self.sink.query_dicts(
+            """
+            SELECT org_id, repo_id, number
+            FROM git_pull_requests
+            WHERE org_id = {org_id:String}
+              AND toString(repo_id) IN {repo_ids:Array(String)}
+              AND number IN {numbers:Array(UInt32)}
+            """,
+            {
+                "org_id": self.config.org_id,
+                "repo_ids": sorted(repo_ids),
+                "numbers": sorted(numbers),
+            },
+        )
+        known_prs: dict[tuple[str, str], set[int]] = {}
+        for row in rows:
+            if row.get("repo_id") is None or row.get("number") is None:
+                continue
+            org_key = str(row.get("org_id") or "")
+            known_prs.setdefault((org_key, str(row["repo_id"])), set()).add(
+                int(row["number"])
+            )
+        return known_prs
 
     def _build_heuristic_issue_pr_edges(
         self, explicit_links: set[tuple[str, int]]
@@ -1605,6 +2024,9 @@ class WorkGraphBuilder:
         Build heuristic issue->PR edges for items not linked explicitly.
 
         Uses time-window matching: PR created within N days of issue updated_at.
+        Incremental builds match only work items that changed since the last
+        build or sit within the window of a changed PR (see
+        :meth:`_heuristic_rows_incremental`).
 
         Args:
             explicit_links: Set of (work_item_id, pr_number) pairs already linked
@@ -1632,18 +2054,9 @@ class WorkGraphBuilder:
         org_id_clause = self._org_id_clause()
         if org_id_clause:
             wi_query += f" {org_id_clause}"
-        if self.config.from_date:
-            wi_query += f" AND updated_at >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-        if self.config.to_date:
-            wi_query += f" AND updated_at <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
         if self.config.repo_id:
             wi_query += f" AND repo_id = '{self.config.repo_id}'"
 
-        wi_rows = self.sink.query_dicts(wi_query, {})
-
-        if not wi_rows:
-            return 0
-
         # Query PRs with timestamps
         pr_query = """
         SELECT
@@ -1652,27 +2065,33 @@ class WorkGraphBuilder:
             created_at
         FROM git_pull_requests
         """
-        where_clauses = []
-        if self.config.from_date:
-            where_clauses.append(
-                f"created_at >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-            )
-        if self.config.to_date:
-            where_clauses.append(
-                f"created_at <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
+
+        if self.config.incremental:
+            wi_rows, pr_rows, explicit_links = self._heuristic_rows_incremental(
+                wi_query, pr_query, explicit_links
             )
-        if self.config.repo_id:
-            where_clauses.append(f"repo_id = '{self.config.repo_id}'")
-        if self.config.org_id:
-            where_clauses.append(f"org_id = '{self.config.org_id}'")
+            if not wi_rows or not pr_rows:
+                return 0
+        else:
+            if self.config.from_date:
+                wi_query += f" AND updated_at >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
+            if self.config.to_date:
+                wi_query += f" AND updated_at <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
 
-        if where_clauses:
-            pr_query += " WHERE " + " AND ".join(where_clauses)
+            wi_rows = self.sink.query_dicts(wi_query, {})
 
-        pr_rows = self.sink.query_dicts(pr_query, {})
+            if not wi_rows:
+                return 0
 
-        if not pr_rows:
-            return 0
+            where_clauses = self._scope_clauses("created_at")
+
+            if where_clauses:
+                pr_query += " WHERE " + " AND ".join(where_clauses)
+
+            pr_rows = self.sink.query_dicts(pr_query, {})
+
+            if not pr_rows:
+                return 0
 
         # Group PRs by repo with sorted timestamps for O(log n) binary search
         # Data structure: {repo_key: (sorted_timestamps, [(pr_number, created_at), ...])}
@@ -1796,6 +2215,101 @@ class WorkGraphBuilder:
         logger.info("Created %d heuristic issue->PR edges", count)
         return count
 
+    def _heuristic_rows_incremental(
+        self,
+        wi_query: str,
+        pr_query: str,
+        explicit_links: set[tuple[str, int]],
+    ) -> tuple[list[dict], list[dict], set[tuple[str, int]]]:
+        """Work items, PRs and explicit links for an incremental heuristic pass.
+
+        Candidates are the work items read by the incremental text pass plus
+        the items updated within the window of a PR it read. PRs are loaded
+        per repo only around those candidates, and the explicit links of the
+        candidates are read back from ``work_graph_issue_pr`` because this
+        run's fast-path pass only saw the changed links.
+        """
+        window = timedelta(days=self.config.heuristic_days_window)
+        repo_filter = str(self.config.repo_id) if self.config.repo_id else ""
+
+        wi_rows: dict[str, dict] = {}
+        for row in self._changed_work_items:
+            repo_key = str(row.get("repo_id") or "")
+            if not repo_key or (repo_filter and repo_key != repo_filter):
+                continue
+            if as_utc(row.get("updated_at")) is not None:
+                wi_rows[str(row.get("work_item_id"))] = row
+        pr_anchors: dict[str, list[datetime]] = {}
+        for row in self._changed_prs:
+            created_at = as_utc(row.get("created_at"))
+            if row.get("repo_id") is not None and created_at is not None:
+                pr_anchors.setdefault(str(row["repo_id"]), []).append(created_at)
+        for row in self._rows_near(wi_query, "updated_at", pr_anchors, window):
+            wi_rows.setdefault(str(row.get("work_item_id")), row)
+        if not wi_rows:
+            return [], [], explicit_links
+
+        wi_anchors: dict[str, list[datetime]] = {}
+        for row in wi_rows.values():
+            updated_at = as_utc(row.get("updated_at"))
+            if updated_at is not None:
+                wi_anchors.setdefault(str(row.get("repo_id")), []).append(updated_at)
+        pr_query += " WHERE " + " AND ".join(
+            self._scope_clauses("created_at", windowed=False)
+        )
+        pr_rows = self._rows_near(pr_query, "created_at", wi_anchors, window)
+        if not pr_rows:
+            return list(wi_rows.values()), [], explicit_links
+
+        explicit_links = set(explicit_links)
+        ordered = sorted(wi_rows)
+        for offset in range(0, len(ordered), KEY_LOOKUP_BATCH_SIZE):
+            rows = self.sink.query_dicts(
+                """
+                SELECT work_item_id, pr_number
+                FROM work_graph_issue_pr FINAL
+                WHERE org_id = {org_id:String}
+                  AND work_item_id IN {work_item_ids:Array(String)}
+                """,
+                {
+                    "org_id": self.config.org_id,
+                    "work_item_ids": ordered[offset : offset + KEY_LOOKUP_BATCH_SIZE],
+                },
+            )
+            explicit_links.update(
+                (str(row.get("work_item_id")), int(row.get("pr_number") or 0))
+                for row in rows
+            )
+        return list(wi_rows.values()), pr_rows, explicit_links
+
+    def _rows_near(
+        self,
+        query: str,
+        time_column: str,
+        anchors_by_repo: dict[str, list[datetime]],
+        window: timedelta,
+    ) -> list[dict]:
+        """Rows of ``query`` whose ``time_column`` lies within ``window`` of
+        the anchors of the same repo (one query per repo)."""
+        rows: list[dict] = []
+        for repo_key, anchors in anchors_by_repo.items():
+            rows.extend(
+                self.sink.query_dicts(
+                    query
+                    + " AND toString(repo_id) = {near_repo_id:String}"
+                    + f" AND {time_column} >= "
+                    + "{near_from:DateTime64(3, 'UTC')}"
+                    + f" AND {time_column} <= "
+                    + "{near_to:DateTime64(3, 'UTC')}",
+                    {
+                        "near_repo_id": repo_key,
+                        "near_from": min(anchors) - window,
+                        "near_to": max(anchors) + window,
+                    },
+                )
+            )
+        return rows
+
     def _build_issue_pr_edges_from_fast_path(self) -> tuple[set[tuple[str, int]], int]:
         logger.info(
             "Building issue->PR edges from dev_health_ops.work_graph_issue_pr..."
@@ -1823,18 +2337,28 @@ class WorkGraphBuilder:
             where_parts.append(f"p.repo_id = '{self.config.repo_id}'")
         if self.config.org_id:
             where_parts.append(f"p.org_id = '{self.config.org_id}'")
-        if self.config.from_date:
-            where_parts.append(
-                f"pr.created_at >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-            )
-        if self.config.to_date:
-            where_parts.append(
-                f"pr.created_at <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
+        params: dict[str, object] = {}
+        if self.config.incremental:
+            delta, params = self._fast_path_delta(
+                SOURCE_ISSUE_PR_LINKS, "pr", SOURCE_PULL_REQUESTS
             )
+            if delta:
+                where_parts.append(delta)
+        else:
+            if self.config.from_date:
+                where_parts.append(
+                    f"pr.created_at >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
+                )
+            if self.config.to_date:
+                where_parts.append(
+                    f"pr.created_at <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
+                )
         if where_parts:
             query += " WHERE " + " AND ".join(where_parts)
 
-        rows = self.sink.query_dicts(query, {})
+        rows = self.sink.query_dicts(query, params)
+        if self.config.incremental:
+            self._tracker().observe(SOURCE_ISSUE_PR_LINKS, rows)
         logger.info("Found %d rows in work_graph_issue_pr", len(rows))
         if not rows:
             return set(), 0
@@ -1972,19 +2496,7 @@ class WorkGraphBuilder:
         FROM git_commits
         WHERE message IS NOT NULL AND message != ''
         """
-        where_clauses = []
-        if self.config.from_date:
-            where_clauses.append(
-                f"author_when >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-            )
-        if self.config.to_date:
-            where_clauses.append(
-                f"author_when <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
-            )
-        if self.config.repo_id:
-            where_clauses.append(f"repo_id = '{self.config.repo_id}'")
-        if self.config.org_id:
-            where_clauses.append(f"org_id = '{self.config.org_id}'")
+        where_clauses = self._scope_clauses("author_when")
         if where_clauses:
             commit_query += " AND " + " AND ".join(where_clauses)
 
@@ -1993,6 +2505,15 @@ class WorkGraphBuilder:
         if not commit_rows:
             return 0
 
+        links = self._pr_commit_links_from_rows(commit_rows, known_prs)
+        self._write_pr_commit_links(links)
+        logger.info("Derived %d PR->commit links from commit messages", len(links))
+        return len(links)
+
+    def _pr_commit_links_from_rows(
+        self, commit_rows: list[dict], known_prs: dict[tuple[str, str], set[int]]
+    ) -> list[WorkGraphPRCommit]:
+        """Link commits to known PRs in their own (org, repo) by message refs."""
         # Two extraction tiers, processed in order so the higher-confidence
         # explicit-merge link wins the (org, repo, pr, hash) dedup over a squash
         # match for the same pair:
@@ -2049,10 +2570,7 @@ class WorkGraphBuilder:
                             last_synced=self._now,
                         )
                     )
-
-        self._write_pr_commit_links(links)
-        logger.info("Derived %d PR->commit links from commit messages", len(links))
-        return len(links)
+        return links
 
     def _build_pr_commit_edges_from_fast_path(self) -> int:
         logger.info(
@@ -2089,18 +2607,28 @@ class WorkGraphBuilder:
             where_parts.append(f"p.repo_id = '{self.config.repo_id}'")
         if self.config.org_id:
             where_parts.append(f"p.org_id = '{self.config.org_id}'")
-        if self.config.from_date:
-            where_parts.append(
-                f"c.author_when >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
-            )
-        if self.config.to_date:
-            where_parts.append(
-                f"c.author_when <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
+        params: dict[str, object] = {}
+        if self.config.incremental:
+            delta, params = self._fast_path_delta(
+                SOURCE_PR_COMMIT_LINKS, "c", SOURCE_COMMITS
             )
+            if delta:
+                where_parts.append(delta)
+        else:
+            if self.config.from_date:
+                where_parts.append(
+                    f"c.author_when >= '{_format_datetime_for_clickhouse(self.config.from_date)}'"
+                )
+            if self.config.to_date:
+                where_parts.append(
+                    f"c.author_when <= '{_format_datetime_for_clickhouse(self.config.to_date)}'"
+                )
         if where_parts:
             query += " WHERE " + " AND ".join(where_parts)
 
-        rows = self.sink.query_dicts(query, {})
+        rows = self.sink.query_dicts(query, params)
+        if self.config.incremental:
+            self._tracker().observe(SOURCE_PR_COMMIT_LINKS, rows)
         logger.info("Found %d rows in work_graph_pr_commit", len(rows))
         if not rows:
             return 0
@@ -2190,6 +2718,9 @@ Examples:
 
   # Rebuild for specific repo
   python -m work_graph.builder --repo <uuid> --db ...
+
+  # Only parse rows synced since the previous incremental build
+  python -m work_graph.builder --org-id <org> --incremental --db ...
         """,
     )
 
@@ -2235,6 +2766,11 @@ Examples:
         default=0.3,
         help="Confidence score for heuristic matches (default: 0.3)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only parse rows synced since the last incremental build (needs --org-id)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -2271,6 +2807,7 @@ Examples:
         heuristic_days_window=args.heuristic_window,
         heuristic_confidence=args.heuristic_confidence,
         org_id=args.org_id,
+        incremental=args.incremental,
     )
 
     builder = WorkGraphBuilder(config)
@@ -0,0 +1,280 @@
+"""
+Incremental work graph build state.
+
+A full build re-reads every commit message, PR and work item in scope and
+re-parses all of them on each run. An incremental build keeps two pieces of
+per-org state instead:
+
+- A high-water mark of ``last_synced`` for each source table
+  (``work_items``, ``git_pull_requests``, ``git_commits`` and the
+  ``work_graph_issue_pr`` / ``work_graph_pr_commit`` fast-path tables). Marks
+  are stored as ``work_graph_projection_runs`` rows named
+  ``incremental:<table>``.
+- ``work_graph_issue_key_index`` maps issue keys to work_item_id values and
+  records the PR numbers already seen (``provider = 'pr'``). Each run adds
+  only the keys of changed rows that the index does not hold yet.
+
+Only rows past a watermark are parsed. Older text is re-scanned only when it
+mentions an issue key or PR number missing from the index before this run,
+so a reference that dangled on the previous run still resolves once its
+target is synced, while an ordinary update of a known issue or PR costs no
+re-scan.
+
+Delta reads ignore the build's from/to date window: the marks are keyed only
+by org and repo, so a windowed read would advance them past rows it never
+saw. The window still bounds the passes that are not incremental.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from dev_health_ops.metrics.schemas import (
+    WorkGraphIssueKeyRecord,
+    WorkGraphProjectionRunRecord,
+)
+from dev_health_ops.work_graph.extractors.text_parser import (
+    extract_github_issue_refs,
+    extract_gitlab_issue_refs,
+    extract_jira_keys,
+)
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_RULE_VERSION = "incremental.v1"
+PROJECTION_PREFIX = "incremental:"
+
+SOURCE_WORK_ITEMS = "work_items"
+SOURCE_PULL_REQUESTS = "git_pull_requests"
+SOURCE_COMMITS = "git_commits"
+SOURCE_ISSUE_PR_LINKS = "work_graph_issue_pr"
+SOURCE_PR_COMMIT_LINKS = "work_graph_pr_commit"
+INCREMENTAL_SOURCES = (
+    SOURCE_WORK_ITEMS,
+    SOURCE_PULL_REQUESTS,
+    SOURCE_COMMITS,
+    SOURCE_ISSUE_PR_LINKS,
+    SOURCE_PR_COMMIT_LINKS,
+)
+
+# Rows are re-read from a little before each watermark. A sync stamps
+# last_synced when it builds a batch, so a batch inserted while the previous
+# build was running can carry a timestamp just below that build's watermark.
+WATERMARK_LOOKBACK = timedelta(minutes=15)
+
+# ClickHouse multiSearchAny* accepts at most 255 needles per call.
+NEEDLE_BATCH_SIZE = 200
+KEY_LOOKUP_BATCH_SIZE = 1000
+
+
+def as_utc(value: object) -> datetime | None:
+    """Coerce a ClickHouse timestamp (datetime or ISO string) to aware UTC."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class IssueKey:
+    """A work item's key as it appears in PR and commit text."""
+
+    provider: str
+    repo_id: str
+    issue_key: str
+    work_item_id: str
+
+
+# Index provider for PR numbers. IssueKeyLookups ignores it, so recorded PRs
+# never resolve an issue reference.
+PR_KEY_PROVIDER = "pr"
+
+
+def pr_key_for_row(row: Mapping[str, Any]) -> IssueKey | None:
+    """Index key recording that a PR number has been seen in its repo."""
+    repo_id = row.get("repo_id")
+    number = row.get("number")
+    if repo_id is None or number is None:
+        return None
+    return IssueKey(PR_KEY_PROVIDER, str(repo_id), str(number), "")
+
+
+def issue_key_for_work_item(row: Mapping[str, Any]) -> IssueKey | None:
+    """Derive the text-reference key of a work item row, if it has one.
+
+    Jira items are keyed org-wide by their upper-cased key
+    (``jira:ABC-123`` -> ``ABC-123``). GitHub and GitLab issues are keyed by
+    (repo_id, issue number). Other providers are not linked through text.
+    """
+    work_item_id = str(row.get("work_item_id") or "")
+    provider = row.get("provider")
+    repo_id = row.get("repo_id")
+    if not work_item_id:
+        return None
+    if provider == "jira":
+        if work_item_id.startswith("jira:"):
+            return IssueKey("jira", "", work_item_id[5:].upper(), work_item_id)
+        return None
+    if provider in ("github", "gitlab") and repo_id and "#" in work_item_id:
+        return IssueKey(
+            str(provider), str(repo_id), work_item_id.split("#")[-1], work_item_id
+        )
+    return None
+
+
+@dataclass
+class IssueKeyLookups:
+    """Resolve parsed issue references to work_item_id values."""
+
+    jira: dict[str, str] = field(default_factory=dict)
+    github: dict[tuple[str, str], str] = field(default_factory=dict)
+    gitlab: dict[tuple[str, str], str] = field(default_factory=dict)
+
+    def add(self, key: IssueKey) -> None:
+        if key.provider == "jira":
+            self.jira[key.issue_key] = key.work_item_id
+        elif key.provider == "github":
+            self.github[(key.repo_id, key.issue_key)] = key.work_item_id
+        elif key.provider == "gitlab":
+            self.gitlab[(key.repo_id, key.issue_key)] = key.work_item_id
+
+    @classmethod
+    def from_work_item_rows(cls, rows: Iterable[Mapping[str, Any]]) -> IssueKeyLookups:
+        lookups = cls()
+        for row in rows:
+            key = issue_key_for_work_item(row)
+            if key is not None:
+                lookups.add(key)
+        return lookups
+
+
+def referenced_issue_keys(text: str) -> set[str]:
+    """Index keys that references in ``text`` could resolve to."""
+    if not text:
+        return set()
+    keys = {ref.issue_key.upper() for ref in extract_jira_keys(text)}
+    keys.update(ref.issue_key for ref in extract_github_issue_refs(text))
+    keys.update(ref.issue_key for ref in extract_gitlab_issue_refs(text))
+    return keys
+
+
+def issue_key_records(
+    keys: Iterable[IssueKey], org_id: str, synced_at: datetime
+) -> list[WorkGraphIssueKeyRecord]:
+    return [
+        WorkGraphIssueKeyRecord(
+            provider=key.provider,
+            repo_id=key.repo_id,
+            issue_key=key.issue_key,
+            work_item_id=key.work_item_id,
+            last_synced=synced_at,
+            org_id=org_id,
+        )
+        for key in keys
+    ]
+
+
+class WatermarkTracker:
+    """Previous and newly observed ``last_synced`` marks for one build.
+
+    ``work_items`` marks are org-wide because the issue-key index is org-wide.
+    The other marks are scoped to the build's repo filter, if any.
+    """
+
+    def __init__(
+        self,
+        org_id: str,
+        repo_id: UUID | None,
+        previous: Mapping[str, datetime] | None = None,
+    ) -> None:
+        self.org_id = org_id
+        self.repo_id = repo_id
+        self.previous: dict[str, datetime] = dict(previous or {})
+        self.observed: dict[str, datetime] = {}
+        self.row_counts: dict[str, int] = dict.fromkeys(INCREMENTAL_SOURCES, 0)
+
+    def _scope(self, source: str) -> UUID | None:
+        return None if source == SOURCE_WORK_ITEMS else self.repo_id
+
+    @classmethod
+    def load(cls, sink: Any, org_id: str, repo_id: UUID | None) -> WatermarkTracker:
+        tracker = cls(org_id, repo_id)
+        rows = sink.query_dicts(
+            """
+            SELECT
+                projection_name,
+                scope_repo_id,
+                max(input_watermark) AS watermark
+            FROM work_graph_projection_runs
+            WHERE org_id = {org_id:String}
+              AND rule_version = {rule_version:String}
+              AND startsWith(projection_name, {prefix:String})
+            GROUP BY projection_name, scope_repo_id
+            """,
+            {
+                "org_id": org_id,
+                "rule_version": INCREMENTAL_RULE_VERSION,
+                "prefix": PROJECTION_PREFIX,
+            },
+        )
+        for row in rows:
+            source = str(row.get("projection_name") or "").removeprefix(
+                PROJECTION_PREFIX
+            )
+            if source not in INCREMENTAL_SOURCES:
+                continue
+            if str(row.get("scope_repo_id") or "") != str(tracker._scope(source) or ""):
+                continue
+            watermark = as_utc(row.get("watermark"))
+            if watermark is not None:
+                tracker.previous[source] = watermark
+        return tracker
+
+    def since(self, source: str) -> datetime | None:
+        """Lower ``last_synced`` bound for this run, or None to read everything."""
+        previous = self.previous.get(source)
+        if previous is None:
+            return None
+        return previous - WATERMARK_LOOKBACK
+
+    def observe(self, source: str, rows: Iterable[Mapping[str, Any]]) -> None:
+        for row in rows:
+            self.row_counts[source] += 1
+            synced = as_utc(row.get("last_synced"))
+            if synced is None:
+                continue
+            current = self.observed.get(source)
+            if current is None or synced > current:
+                self.observed[source] = synced
+
+    def records(self, completed_at: datetime) -> list[WorkGraphProjectionRunRecord]:
+        """Projection rows advancing every source that saw new rows."""
+        records: list[WorkGraphProjectionRunRecord] = []
+        for source in INCREMENTAL_SOURCES:
+            observed = self.observed.get(source)
+            if observed is None:
+                continue
+            previous = self.previous.get(source)
+            records.append(
+                WorkGraphProjectionRunRecord(
+                    org_id=self.org_id,
+                    projection_name=f"{PROJECTION_PREFIX}{source}",
+                    scope_repo_id=self._scope(source),
+                    rule_version=INCREMENTAL_RULE_VERSION,
+                    input_watermark=max(observed, previous) if previous else observed,
+                    row_count=self.row_counts[source],
+                    completed_at=completed_at,
+                )
+            )
+        return records
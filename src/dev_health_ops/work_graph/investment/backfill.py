@@ -27,6 +27,18 @@ Per org, with NO categorizer/LLM call:
    publishes the org-wide marker (it would blank other repos for unscoped
    reads); it relies on the org-wide daily run to publish.
 
+INCREMENTAL PROJECTION:
+  With ``incremental=True`` (org-wide runs only) the components come from the
+  persisted component index (``component_index``), updated from edges synced
+  since its last run, instead of a full rebuild. Only DIRTY units are
+  re-projected in Python: units whose work_unit_id appeared since the index
+  was last updated, plus units with a ``work_unit_investments`` row computed
+  since the previous complete run (minus ``REPROJECT_LOOKBACK``). Every other
+  row of the previous complete run is copied into the new run server-side,
+  restricted to (node, unit) pairs still current in the index, so the new run
+  is still full-coverage and the protocol below is unchanged. Without a
+  previous complete run the backfill falls back to a full projection.
+
 RUN_ID PROTOCOL (CHAOS-2433):
   Every backfill run generates its own ``run_id`` (uuid hex). ALL membership rows
   written in this run carry that run_id. The completion marker is written to
@@ -66,7 +78,7 @@ from __future__ import annotations
 import logging
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from dev_health_ops.metrics.schemas import (
@@ -75,6 +87,10 @@ from dev_health_ops.metrics.schemas import (
 )
 from dev_health_ops.metrics.sinks.base import BaseMetricsSink
 from dev_health_ops.metrics.sinks.factory import create_sink
+from dev_health_ops.work_graph.investment.component_index import (
+    indexed_unit_nodes,
+    update_component_index,
+)
 from dev_health_ops.work_graph.investment.components import (
     ComponentBuildStats,
     build_components,
@@ -88,12 +104,24 @@ from dev_health_ops.work_graph.investment.utils import work_unit_id
 
 logger = logging.getLogger(__name__)
 
+# Materializer rows carry the dispatch time as computed_at, which can precede
+# the previous projection's completion when a materialize and a projection
+# overlap. Re-project every unit categorized within this window of it; it
+# covers the provider-batch timeout with room to spare.
+REPROJECT_LOOKBACK = timedelta(hours=6)
+
+# Reserved run_id of the seeded legacy completion marker (migration 048); its
+# rows carry run_id=''. MUST match metrics/sinks/clickhouse/investment.py.
+_LEGACY_RUN_ID = "__legacy__"
+
 
 @dataclass(frozen=True)
 class MembershipBackfillConfig:
     dsn: str
     org_id: str | None = None
     repo_ids: list[str] | None = None
+    incremental: bool = False
+    verify_components: bool = False
 
     @property
     def is_org_wide(self) -> bool:
@@ -166,6 +194,44 @@ def _fetch_latest_distributions(
     return result
 
 
+def _latest_complete_run(
+    sink: BaseMetricsSink, *, org_id: str
+) -> tuple[str, datetime] | None:
+    rows = sink.query_dicts(
+        """
+        SELECT run_id, completed_at
+        FROM work_unit_membership_runs
+        WHERE org_id = %(org_id)s
+        ORDER BY completed_at DESC, run_id DESC
+        LIMIT 1
+        """,
+        {"org_id": org_id},
+    )
+    if not rows:
+        return None
+    completed_at = rows[0].get("completed_at")
+    if not isinstance(completed_at, datetime):
+        return None
+    if completed_at.tzinfo is None:
+        completed_at = completed_at.replace(tzinfo=timezone.utc)
+    return str(rows[0].get("run_id") or ""), completed_at
+
+
+def _recently_categorized_unit_ids(
+    sink: BaseMetricsSink, *, org_id: str, since: datetime
+) -> set[str]:
+    rows = sink.query_dicts(
+        """
+        SELECT DISTINCT work_unit_id
+        FROM work_unit_investments
+        WHERE org_id = %(org_id)s
+          AND computed_at > %(since)s
+        """,
+        {"org_id": org_id, "since": since},
+    )
+    return {str(row.get("work_unit_id")) for row in rows if row.get("work_unit_id")}
+
+
 def _as_distribution(value: Any) -> dict[str, float]:
     """Coerce a ClickHouse Map(String, Float64) cell into a plain dict."""
     if isinstance(value, dict):
@@ -191,27 +257,59 @@ def backfill_memberships(config: MembershipBackfillConfig) -> dict[str, int]:
     try:
         sink.ensure_schema()
 
-        edges = fetch_work_graph_edges(sink, repo_ids=config.repo_ids, org_id=org_id)
+        previous_run: tuple[str, datetime] | None = None
+        if config.incremental:
+            if config.is_org_wide and org_id:
+                previous_run = _latest_complete_run(sink, org_id=org_id)
+                if previous_run is not None and previous_run[0] == _LEGACY_RUN_ID:
+                    previous_run = None
+            if previous_run is None:
+                logger.info(
+                    "Membership backfill org=%s: no previous complete org-wide "
+                    "run to carry forward; projecting in full",
+                    org_id,
+                )
+
         component_stats = ComponentBuildStats()
-        components = _build_components_for_backfill(edges, stats=component_stats)
-        if not components:
-            logger.info(
-                "Membership backfill: no work graph components for org=%s", org_id
-            )
-            return {
-                "components": 0,
-                "matched": 0,
-                "skipped": 0,
-                "memberships": 0,
-                **component_stats.as_dict(),
-            }
-
-        # Map each current work_unit_id -> its node list.
+        index_stats: dict[str, Any] = {}
+        dirty_unit_ids: set[str] = set()
         unit_nodes_by_id: dict[str, list[NodeKey]] = {}
-        for nodes in components:
-            unit_nodes = list(dict.fromkeys(nodes))
-            uid = work_unit_id(unit_nodes)
-            unit_nodes_by_id[uid] = unit_nodes
+        if previous_run is not None:
+            update = update_component_index(
+                sink, org_id=org_id, verify=config.verify_components
+            )
+            component_stats = update.stats
+            index_stats = update.as_dict()
+            dirty_unit_ids = update.added_unit_ids | _recently_categorized_unit_ids(
+                sink, org_id=org_id, since=previous_run[1] - REPROJECT_LOOKBACK
+            )
+            unit_nodes_by_id = indexed_unit_nodes(
+                sink, org_id=org_id, work_unit_ids=dirty_unit_ids
+            )
+            component_count = len(unit_nodes_by_id)
+        else:
+            edges = fetch_work_graph_edges(
+                sink, repo_ids=config.repo_ids, org_id=org_id
+            )
+            components = _build_components_for_backfill(edges, stats=component_stats)
+            if not components:
+                logger.info(
+                    "Membership backfill: no work graph components for org=%s", org_id
+                )
+                return {
+                    "components": 0,
+                    "matched": 0,
+                    "skipped": 0,
+                    "memberships": 0,
+                    **component_stats.as_dict(),
+                }
+
+            # Map each current work_unit_id -> its node list.
+            for nodes in components:
+                unit_nodes = list(dict.fromkeys(nodes))
+                uid = work_unit_id(unit_nodes)
+                unit_nodes_by_id[uid] = unit_nodes
+            component_count = len(components)
 
         distributions = _fetch_latest_distributions(
             sink,
@@ -264,6 +362,16 @@ def backfill_memberships(config: MembershipBackfillConfig) -> dict[str, int]:
         # to readers.
         if membership_records:
             sink.write_work_unit_memberships(membership_records)
+        if previous_run is not None:
+            # Carry every clean unit's rows forward so this run is still
+            # full-coverage before its marker is published.
+            sink.copy_work_unit_memberships(
+                org_id,
+                from_run_id=previous_run[0],
+                to_run_id=backfill_run_id,
+                exclude_work_unit_ids=sorted(dirty_unit_ids),
+                computed_at=computed_at,
+            )
 
         # Publish the completion marker (CHAOS-2433).
         #
@@ -352,18 +460,19 @@ def backfill_memberships(config: MembershipBackfillConfig) -> dict[str, int]:
             "Membership backfill org=%s: components=%d matched=%d skipped=%d "
             "memberships=%d run_id=%s (no LLM)",
             org_id,
-            len(components),
+            component_count,
             matched,
             skipped,
             len(membership_records),
             backfill_run_id,
         )
         return {
-            "components": len(components),
+            "components": component_count,
             "matched": matched,
             "skipped": skipped,
             "memberships": len(membership_records),
             **component_stats.as_dict(),
+            **index_stats,
         }
     finally:
         sink.close()
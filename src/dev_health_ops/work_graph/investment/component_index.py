@@ -0,0 +1,536 @@
+"""Persisted connected-component index for investment work units.
+
+``materialize_investments`` and ``backfill_memberships`` group
+``work_graph_edges`` into work units with :func:`components.build_components`.
+Rebuilding that grouping from every edge on every run is the dominant cost of
+both paths on a large org, and it hides which units actually changed. This
+module keeps the grouping in ``work_unit_component_index`` (one row per node:
+its unsplit component key and its work unit) and maintains it from the edges
+synced since the previous run:
+
+1. Nodes touched by an edge with ``last_synced`` past the watermark or by an
+   edge removal recorded since then (``work_graph_edge_removals``), plus every
+   node of the indexed components those nodes belonged to, form the dirty
+   region. The builder rewrites only edges whose content changed, so this
+   seed stays proportional to the actual change. The region is grown until no current edge leaves it, so it is a
+   union of whole connected components.
+2. The region's edges are read through ``fetch_work_graph_edges`` (same
+   dedup, heuristic filter and ordering as a full read) and regrouped with the
+   shared :func:`components.build_raw_components`. A component's grouping and
+   oversized split depend only on its own nodes and edges, so the result is the
+   one a full rebuild would produce for those components.
+3. Only nodes whose component or work unit changed are rewritten; nodes that
+   lost every edge get an empty tombstone row.
+
+The watermark is stored in ``work_graph_projection_runs`` under
+``investment_components`` with the component-size cap in the rule version, so
+a cap change forces a full rebuild. ``verify=True`` compares the index against
+a full rebuild and repairs any drift, for example removals that expired before
+the index caught up.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from dev_health_ops.metrics.schemas import (
+    WorkGraphProjectionRunRecord,
+    WorkUnitComponentIndexRecord,
+)
+from dev_health_ops.metrics.sinks.base import BaseMetricsSink
+from dev_health_ops.work_graph.incremental import WATERMARK_LOOKBACK, as_utc
+from dev_health_ops.work_graph.investment.components import (
+    Component,
+    ComponentBuildStats,
+    Edge,
+    NodeKey,
+    build_raw_components,
+)
+from dev_health_ops.work_graph.investment.constants import (
+    resolve_max_component_nodes,
+)
+from dev_health_ops.work_graph.investment.queries import (
+    fetch_work_graph_edges,
+    query_dicts,
+)
+from dev_health_ops.work_graph.investment.utils import work_unit_id
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_INDEX_PROJECTION = "investment_components"
+NODE_LOOKUP_BATCH_SIZE = 1000
+
+# (component_key, work_unit_id) per node. Both are empty for a tombstone.
+Assignment = tuple[str, str]
+
+
+def component_index_rule_version(max_component_nodes: int) -> str:
+    return f"components.v1;cap={max_component_nodes}"
+
+
+def _node_token(node: NodeKey) -> str:
+    return f"{node[0]}:{node[1]}"
+
+
+def _edge_identity(edge: Edge) -> tuple[str, str, str, str, str]:
+    # Mirrors the ORDER BY of fetch_work_graph_edges.
+    return (
+        str(edge.get("source_type")),
+        str(edge.get("source_id")),
+        str(edge.get("edge_type")),
+        str(edge.get("target_type")),
+        str(edge.get("target_id")),
+    )
+
+
+def _batches(items: Sequence[str], size: int) -> Iterable[list[str]]:
+    for offset in range(0, len(items), size):
+        yield list(items[offset : offset + size])
+
+
+@dataclass
+class ComponentIndexUpdate:
+    """Result of one :func:`update_component_index` call.
+
+    ``components`` are the work units of every component in the dirty region,
+    in full-rebuild order — the units whose membership or evidence can have
+    changed. ``added_unit_ids`` / ``removed_unit_ids`` are the work_unit_id
+    hashes that appeared or disappeared. In incremental mode ``stats`` counts
+    only the splits inside the dirty region.
+    """
+
+    mode: str
+    components: list[Component] = field(default_factory=list)
+    added_unit_ids: set[str] = field(default_factory=set)
+    removed_unit_ids: set[str] = field(default_factory=set)
+    touched_nodes: int = 0
+    index_rows: int = 0
+    verify_mismatches: int | None = None
+    stats: ComponentBuildStats = field(default_factory=ComponentBuildStats)
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "component_index_mode": self.mode,
+            "dirty_components": len(self.components),
+            "added_units": len(self.added_unit_ids),
+            "removed_units": len(self.removed_unit_ids),
+            "touched_nodes": self.touched_nodes,
+            "index_rows": self.index_rows,
+        }
+        if self.verify_mismatches is not None:
+            result["verify_mismatches"] = self.verify_mismatches
+        return result
+
+
+def _load_watermark(
+    sink: BaseMetricsSink, *, org_id: str, rule_version: str
+) -> datetime | None:
+    rows = query_dicts(
+        sink,
+        """
+        SELECT max(input_watermark) AS watermark
+        FROM work_graph_projection_runs
+        WHERE org_id = %(org_id)s
+          AND projection_name = %(projection_name)s
+          AND rule_version = %(rule_version)s
+        HAVING count() > 0
+        """,
+        {
+            "org_id": org_id,
+            "projection_name": COMPONENT_INDEX_PROJECTION,
+            "rule_version": rule_version,
+        },
+    )
+    return as_utc(rows[0].get("watermark")) if rows else None
+
+
+def _edge_watermark(sink: BaseMetricsSink, *, org_id: str) -> datetime | None:
+    """Newest edge write or removal — read BEFORE the changes it will cover."""
+    marks: list[datetime] = []
+    for column, table in (
+        ("last_synced", "work_graph_edges"),
+        ("removed_at", "work_graph_edge_removals"),
+    ):
+        rows = query_dicts(
+            sink,
+            f"""
+            SELECT max({column}) AS watermark
+            FROM {table}
+            WHERE org_id = %(org_id)s
+            HAVING count() > 0
+            """,
+            {"org_id": org_id},
+        )
+        mark = as_utc(rows[0].get("watermark")) if rows else None
+        if mark is not None:
+            marks.append(mark)
+    return max(marks) if marks else None
+
+
+def _touched_nodes(
+    sink: BaseMetricsSink, *, org_id: str, since: datetime
+) -> set[NodeKey]:
+    # Heuristic edges are included on purpose: an edge re-emitted as (or
+    # demoted to) heuristic changes grouping just like an added or removed one.
+    rows = query_dicts(
+        sink,
+        """
+        SELECT DISTINCT source_type, source_id, target_type, target_id
+        FROM work_graph_edges
+        WHERE org_id = %(org_id)s
+          AND last_synced > %(since)s
+        """,
+        {"org_id": org_id, "since": since},
+    )
+    # Deleted edges leave no row above; the builder records their endpoints.
+    rows += query_dicts(
+        sink,
+        """
+        SELECT DISTINCT source_type, source_id, target_type, target_id
+        FROM work_graph_edge_removals
+        WHERE org_id = %(org_id)s
+          AND removed_at > %(since)s
+        """,
+        {"org_id": org_id, "since": since},
+    )
+    nodes: set[NodeKey] = set()
+    for row in rows:
+        nodes.add((str(row.get("source_type")), str(row.get("source_id"))))
+        nodes.add((str(row.get("target_type")), str(row.get("target_id"))))
+    return nodes
+
+
+def _read_index(
+    sink: BaseMetricsSink, *, org_id: str, column: str, values: Iterable[str]
+) -> dict[NodeKey, Assignment]:
+    """Current index rows whose ``column`` is one of ``values``.
+
+    ``column`` is one of ``node`` (``"<type>:<id>"`` tokens), ``component_key``
+    or ``work_unit_id``.
+    """
+    column_sql = {
+        "node": "concat(node_type, ':', node_id)",
+        "component_key": "component_key",
+        "work_unit_id": "work_unit_id",
+    }[column]
+    result: dict[NodeKey, Assignment] = {}
+    for batch in _batches(sorted(set(values)), NODE_LOOKUP_BATCH_SIZE):
+        rows = query_dicts(
+            sink,
+            f"""
+            SELECT node_type, node_id, component_key, work_unit_id
+            FROM work_unit_component_index FINAL
+            WHERE org_id = %(org_id)s
+              AND {column_sql} IN %(values)s
+            """,
+            {"org_id": org_id, "values": batch},
+        )
+        for row in rows:
+            node = (str(row.get("node_type")), str(row.get("node_id")))
+            result[node] = (
+                str(row.get("component_key") or ""),
+                str(row.get("work_unit_id") or ""),
+            )
+    return result
+
+
+def _read_full_index(
+    sink: BaseMetricsSink, *, org_id: str
+) -> dict[NodeKey, Assignment]:
+    rows = query_dicts(
+        sink,
+        """
+        SELECT node_type, node_id, component_key, work_unit_id
+        FROM work_unit_component_index FINAL
+        WHERE org_id = %(org_id)s
+          AND component_key != ''
+        """,
+        {"org_id": org_id},
+    )
+    return {
+        (str(row.get("node_type")), str(row.get("node_id"))): (
+            str(row.get("component_key") or ""),
+            str(row.get("work_unit_id") or ""),
+        )
+        for row in rows
+    }
+
+
+def _collect_region(
+    sink: BaseMetricsSink, *, org_id: str, seeds: set[NodeKey]
+) -> tuple[list[Edge], set[NodeKey], dict[NodeKey, Assignment]]:
+    """Grow ``seeds`` into whole components and return their current edges.
+
+    Returns ``(edges, region_nodes, previous_assignments)``. Edges come back in
+    the ``fetch_work_graph_edges`` order so component discovery inside the
+    region matches a full rebuild.
+    """
+    region: set[NodeKey] = set()
+    previous: dict[NodeKey, Assignment] = {}
+    known_keys: set[str] = set()
+    edges_by_identity: dict[tuple[str, str, str, str, str], Edge] = {}
+    pending = set(seeds)
+    while pending:
+        region |= pending
+        indexed = _read_index(
+            sink, org_id=org_id, column="node", values=map(_node_token, pending)
+        )
+        previous.update(indexed)
+        new_keys = {key for key, _unit in indexed.values() if key} - known_keys
+        known_keys |= new_keys
+        if new_keys:
+            members = _read_index(
+                sink, org_id=org_id, column="component_key", values=new_keys
+            )
+            previous.update(members)
+            pending |= set(members) - region
+            region |= pending
+        tokens = sorted(map(_node_token, pending))
+        endpoints: set[NodeKey] = set()
+        for batch in _batches(tokens, NODE_LOOKUP_BATCH_SIZE):
+            for edge in fetch_work_graph_edges(sink, org_id=org_id, node_tokens=batch):
+                edges_by_identity[_edge_identity(edge)] = edge
+                endpoints.add(
+                    (str(edge.get("source_type")), str(edge.get("source_id")))
+                )
+                endpoints.add(
+                    (str(edge.get("target_type")), str(edge.get("target_id")))
+                )
+        pending = endpoints - region
+    edges = [edges_by_identity[key] for key in sorted(edges_by_identity)]
+    return edges, region, previous
+
+
+def _assign(
+    raw_components: list[tuple[list[NodeKey], list[Component]]],
+) -> tuple[dict[NodeKey, Assignment], list[tuple[str, Component]]]:
+    assignments: dict[NodeKey, Assignment] = {}
+    units: list[tuple[str, Component]] = []
+    for raw_nodes, raw_units in raw_components:
+        component_key = work_unit_id(raw_nodes)
+        for node in raw_nodes:
+            assignments[node] = (component_key, "")
+        for unit in raw_units:
+            unit_nodes = list(dict.fromkeys(unit[0]))
+            unit_id = work_unit_id(unit_nodes)
+            units.append((unit_id, unit))
+            for node in unit_nodes:
+                assignments[node] = (component_key, unit_id)
+    return assignments, units
+
+
+def _diff_rows(
+    *,
+    org_id: str,
+    region: Iterable[NodeKey],
+    current: dict[NodeKey, Assignment],
+    previous: dict[NodeKey, Assignment],
+    synced_at: datetime,
+) -> list[WorkUnitComponentIndexRecord]:
+    rows: list[WorkUnitComponentIndexRecord] = []
+    for node in sorted(region):
+        assignment = current.get(node, ("", ""))
+        if previous.get(node, ("", "")) == assignment:
+            continue
+        rows.append(
+            WorkUnitComponentIndexRecord(
+                org_id=org_id,
+                node_type=node[0],
+                node_id=node[1],
+                component_key=assignment[0],
+                work_unit_id=assignment[1],
+                last_synced=synced_at,
+            )
+        )
+    return rows
+
+
+def _unit_ids(assignments: Iterable[Assignment]) -> set[str]:
+    return {unit for _key, unit in assignments if unit}
+
+
+def _verify(
+    sink: BaseMetricsSink,
+    *,
+    org_id: str,
+    cap: int,
+    update: ComponentIndexUpdate,
+) -> list[WorkUnitComponentIndexRecord]:
+    """Compare the (just updated) index with a full rebuild; return repairs."""
+    edges = fetch_work_graph_edges(sink, org_id=org_id)
+    expected, units = _assign(build_raw_components(edges, max_component_nodes=cap))
+    indexed = _read_full_index(sink, org_id=org_id)
+    repairs = _diff_rows(
+        org_id=org_id,
+        region=set(expected) | set(indexed),
+        current=expected,
+        previous=indexed,
+        synced_at=datetime.now(timezone.utc),
+    )
+    update.verify_mismatches = len(repairs)
+    if repairs:
+        logger.error(
+            "Investment component index for org=%s drifted from a full rebuild "
+            "on %d node(s); repairing",
+            org_id,
+            len(repairs),
+        )
+        missing = _unit_ids(expected.values()) - _unit_ids(indexed.values())
+        stale = _unit_ids(indexed.values()) - _unit_ids(expected.values())
+        update.added_unit_ids |= missing
+        update.removed_unit_ids |= stale
+        present = {
+            work_unit_id(list(dict.fromkeys(unit[0]))) for unit in update.components
+        }
+        update.components.extend(
+            unit for unit_id, unit in units if unit_id in missing - present
+        )
+    return repairs
+
+
+def update_component_index(
+    sink: BaseMetricsSink,
+    *,
+    org_id: str,
+    max_component_nodes: int | None = None,
+    verify: bool = False,
+) -> ComponentIndexUpdate:
+    """Bring ``work_unit_component_index`` up to date with ``work_graph_edges``.
+
+    Incremental when a watermark for this org and cap exists, otherwise a full
+    rebuild that also tombstones nodes no longer in the graph. ``verify``
+    additionally rebuilds every component from scratch, compares it with the
+    index and repairs (and reports) any difference.
+    """
+    if not org_id:
+        raise ValueError("the investment component index requires an org_id")
+    write_watermark = getattr(sink, "write_work_graph_projection_runs", None)
+    if not callable(write_watermark):
+        raise RuntimeError("investment component index watermark sink is unavailable")
+    cap = resolve_max_component_nodes(max_component_nodes)
+    rule_version = component_index_rule_version(cap)
+    previous_mark = _load_watermark(sink, org_id=org_id, rule_version=rule_version)
+    edge_mark = _edge_watermark(sink, org_id=org_id)
+    synced_at = datetime.now(timezone.utc)
+
+    if previous_mark is None:
+        update = ComponentIndexUpdate(mode="full")
+        edges = fetch_work_graph_edges(sink, org_id=org_id)
+        previous = _read_full_index(sink, org_id=org_id)
+        current, units = _assign(
+            build_raw_components(edges, max_component_nodes=cap, stats=update.stats)
+        )
+        region: set[NodeKey] = set(current) | set(previous)
+        update.touched_nodes = len(region)
+    else:
+        update = ComponentIndexUpdate(mode="incremental")
+        seeds = _touched_nodes(
+            sink, org_id=org_id, since=previous_mark - WATERMARK_LOOKBACK
+        )
+        update.touched_nodes = len(seeds)
+        edges, region, previous = (
+            _collect_region(sink, org_id=org_id, seeds=seeds)
+            if seeds
+            else ([], set(), {})
+        )
+        current, units = _assign(
+            build_raw_components(edges, max_component_nodes=cap, stats=update.stats)
+        )
+
+    update.components = [unit for _unit_id, unit in units]
+    previous_units = _unit_ids(previous.values())
+    current_units = _unit_ids(current.values())
+    update.added_unit_ids = current_units - previous_units
+    update.removed_unit_ids = previous_units - current_units
+    rows = _diff_rows(
+        org_id=org_id,
+        region=region,
+        current=current,
+        previous=previous,
+        synced_at=synced_at,
+    )
+    if verify:
+        sink.write_work_unit_component_index(rows)
+        repairs = _verify(sink, org_id=org_id, cap=cap, update=update)
+        sink.write_work_unit_component_index(repairs)
+        rows.extend(repairs)
+    else:
+        sink.write_work_unit_component_index(rows)
+    update.index_rows = len(rows)
+
+    if edge_mark is not None:
+        write_watermark(
+            [
+                WorkGraphProjectionRunRecord(
+                    org_id=org_id,
+                    projection_name=COMPONENT_INDEX_PROJECTION,
+                    scope_repo_id=None,
+                    rule_version=rule_version,
+                    input_watermark=max(edge_mark, previous_mark)
+                    if previous_mark
+                    else edge_mark,
+                    row_count=len(rows),
+                    completed_at=datetime.now(timezone.utc),
+                )
+            ]
+        )
+    logger.info(
+        "Investment component index org=%s mode=%s touched=%d dirty_units=%d "
+        "added=%d removed=%d rows=%d",
+        org_id,
+        update.mode,
+        update.touched_nodes,
+        len(update.components),
+        len(update.added_unit_ids),
+        len(update.removed_unit_ids),
+        update.index_rows,
+    )
+    return update
+
+
+def load_indexed_components(
+    sink: BaseMetricsSink,
+    *,
+    org_id: str,
+    work_unit_ids: Sequence[str],
+    max_component_nodes: int | None = None,
+) -> list[Component]:
+    """Rebuild the named work units from the index and their current edges.
+
+    Partitioned incremental materialization dispatches work_unit_id lists
+    instead of positional component indexes; each chunk worker rebuilds just
+    the components holding its units. Units that no longer exist (the graph
+    moved on after dispatch) are omitted. Result order follows
+    ``work_unit_ids``.
+    """
+    if not work_unit_ids:
+        return []
+    cap = resolve_max_component_nodes(max_component_nodes)
+    members = _read_index(
+        sink, org_id=org_id, column="work_unit_id", values=work_unit_ids
+    )
+    edges, _region, _previous = _collect_region(sink, org_id=org_id, seeds=set(members))
+    _assignments, units = _assign(build_raw_components(edges, max_component_nodes=cap))
+    by_id = dict(units)
+    return [by_id[unit_id] for unit_id in work_unit_ids if unit_id in by_id]
+
+
+def indexed_unit_nodes(
+    sink: BaseMetricsSink, *, org_id: str, work_unit_ids: Iterable[str]
+) -> dict[str, list[NodeKey]]:
+    """Current node lists of the named work units, read from the index.
+
+    Units that no longer exist are absent from the result.
+    """
+    members = _read_index(
+        sink, org_id=org_id, column="work_unit_id", values=work_unit_ids
+    )
+    result: dict[str, list[NodeKey]] = {}
+    for node, (_key, unit_id) in sorted(members.items()):
+        if unit_id:
+            result.setdefault(unit_id, []).append(node)
+    return result
@@ -304,31 +304,27 @@ def _split_oversized_component(
     return result
 
 
-def build_components(
+def build_raw_components(
     edges: list[Edge],
     *,
     max_component_nodes: int | None = None,
     stats: ComponentBuildStats | None = None,
-) -> list[Component]:
-    """Build investment work-unit components from ``work_graph_edges`` rows.
-
-    Returns ``(node_list, edge_list)`` per component. Components exceeding
-    ``max_component_nodes`` (defaulting to
-    :func:`constants.resolve_max_component_nodes`, env-overridable via
-    ``INVESTMENT_MAX_COMPONENT_NODES``) are deterministically split; the split's
-    drop counts are accumulated into ``stats`` when provided.
-
-    This is the SINGLE implementation shared by the materializer and the
-    membership backfill so their component sets — and therefore ``work_unit_id``
-    hashes — stay identical for identical edge input.
+) -> list[tuple[list[NodeKey], list[Component]]]:
+    """:func:`build_components`, grouped by unsplit connected component.
+
+    Returns ``(raw_node_list, units)`` per connected component, where ``units``
+    is the component itself or, for an oversized one, its split fragments. A
+    hub node dropped by the split appears in ``raw_node_list`` but in no unit.
+    The persisted component index (``component_index``) keys nodes by their
+    raw component so it can tell which fragments a changed edge can affect.
     """
     cap = resolve_max_component_nodes(max_component_nodes)
 
-    result: list[Component] = []
+    result: list[tuple[list[NodeKey], list[Component]]] = []
     for component_nodes, component_edges in _discover_components(edges):
         unit_nodes = list(dict.fromkeys(component_nodes))
         if len(unit_nodes) <= cap:
-            result.append((unit_nodes, component_edges))
+            result.append((unit_nodes, [(unit_nodes, component_edges)]))
             continue
         if stats is not None:
             stats.oversized_components += 1
@@ -338,7 +334,37 @@ def build_components(
             len(unit_nodes),
             cap,
         )
-        result.extend(
-            _split_oversized_component(unit_nodes, component_edges, cap, stats)
+        result.append(
+            (
+                unit_nodes,
+                _split_oversized_component(unit_nodes, component_edges, cap, stats),
+            )
         )
     return result
+
+
+def build_components(
+    edges: list[Edge],
+    *,
+    max_component_nodes: int | None = None,
+    stats: ComponentBuildStats | None = None,
+) -> list[Component]:
+    """Build investment work-unit components from ``work_graph_edges`` rows.
+
+    Returns ``(node_list, edge_list)`` per component. Components exceeding
+    ``max_component_nodes`` (defaulting to
+    :func:`constants.resolve_max_component_nodes`, env-overridable via
+    ``INVESTMENT_MAX_COMPONENT_NODES``) are deterministically split; the split's
+    drop counts are accumulated into ``stats`` when provided.
+
+    This is the SINGLE implementation shared by the materializer and the
+    membership backfill so their component sets — and therefore ``work_unit_id``
+    hashes — stay identical for identical edge input.
+    """
+    return [
+        unit
+        for _raw_nodes, units in build_raw_components(
+            edges, max_component_nodes=max_component_nodes, stats=stats
+        )
+        for unit in units
+    ]
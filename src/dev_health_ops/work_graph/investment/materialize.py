@@ -58,6 +58,11 @@ from dev_health_ops.work_graph.investment.categorize import (
     categorize_text_bundle_completion,
     fallback_outcome,
 )
+from dev_health_ops.work_graph.investment.component_index import (
+    ComponentIndexUpdate,
+    load_indexed_components,
+    update_component_index,
+)
 from dev_health_ops.work_graph.investment.components import (
     ComponentBuildStats,
     build_components,
@@ -891,8 +896,29 @@ class MaterializeConfig:
     # differently and index N would name a different work unit). None = resolve
     # from env/default locally (single-process runs).
     max_component_nodes: int | None = None
+    # Incremental mode maintains the persisted component index
+    # (``component_index``) from edges synced since the last run and
+    # categorizes only the components that delta touched. ``work_unit_ids`` is
+    # the partitioned form: chunk workers receive unit ids from an incremental
+    # dispatcher instead of positional component_indexes. Both are org-wide.
+    incremental: bool = False
+    work_unit_ids: list[str] | None = None
+    verify_components: bool = False
 
     def __post_init__(self) -> None:
+        if self.incremental or self.work_unit_ids is not None:
+            if not (self.org_id or "").strip():
+                raise ValueError("incremental materialization requires an org_id")
+            if self.repo_ids or self.team_ids:
+                raise ValueError(
+                    "incremental materialization is org-wide; "
+                    "drop repo_ids/team_ids or run a full materialization"
+                )
+            if self.component_indexes is not None:
+                raise ValueError(
+                    "component_indexes are positional over a full rebuild and "
+                    "cannot be combined with incremental materialization"
+                )
         if self.llm_batch_mode not in _LLM_BATCH_MODES:
             raise ValueError(
                 "llm_batch_mode must be one of: sync, auto, provider_batch"
@@ -1204,15 +1230,34 @@ async def materialize_investments(config: MaterializeConfig) -> dict[str, Any]:
         repo_ids = _resolve_repo_ids(
             sink, config.repo_ids, config.team_ids, config_org_id=config.org_id or ""
         )
-        edges = fetch_work_graph_edges(
-            sink, repo_ids=repo_ids, org_id=config.org_id or ""
-        )
         component_stats = ComponentBuildStats()
-        components = _build_components(
-            edges,
-            stats=component_stats,
-            max_component_nodes=config.max_component_nodes,
-        )
+        index_update: ComponentIndexUpdate | None = None
+        if config.work_unit_ids is not None:
+            components = load_indexed_components(
+                sink,
+                org_id=config.org_id or "",
+                work_unit_ids=config.work_unit_ids,
+                max_component_nodes=config.max_component_nodes,
+            )
+        elif config.incremental:
+            index_update = update_component_index(
+                sink,
+                org_id=config.org_id or "",
+                max_component_nodes=config.max_component_nodes,
+                verify=config.verify_components,
+            )
+            component_stats = index_update.stats
+            components = index_update.components
+        else:
+            edges = fetch_work_graph_edges(
+                sink, repo_ids=repo_ids, org_id=config.org_id or ""
+            )
+            components = _build_components(
+                edges,
+                stats=component_stats,
+                max_component_nodes=config.max_component_nodes,
+            )
+        index_stats = index_update.as_dict() if index_update is not None else {}
         total_components = len(components)
         if not components:
             logger.info(
@@ -1223,6 +1268,7 @@ async def materialize_investments(config: MaterializeConfig) -> dict[str, Any]:
                 "records": 0,
                 "quotes": 0,
                 **component_stats.as_dict(),
+                **index_stats,
             }
         if config.component_indexes is not None:
             wanted_indexes = set(config.component_indexes)
@@ -1849,6 +1895,7 @@ async def materialize_investments(config: MaterializeConfig) -> dict[str, Any]:
             "llm_failures": sum(llm_failure_counts.values()),
             "llm_failure_counts": dict(llm_failure_counts),
             **component_stats.as_dict(),
+            **index_stats,
         }
     finally:
         sink.close()
@@ -21,6 +21,7 @@ def fetch_work_graph_edges(
     repo_ids: list[str] | None = None,
     org_id: str = "",
     exclude_heuristic: bool = True,
+    node_tokens: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch work-graph edges for investment work-unit component building.
 
@@ -49,6 +50,11 @@ def fetch_work_graph_edges(
       query ORDERs BY the full identity key — without it, ClickHouse physical
       row order could differ between dispatcher and chunk workers and index N
       would name a different component (skipped / double-categorized units).
+
+    ``node_tokens`` (``"<node_type>:<node_id>"``) restricts the read to edges
+    incident to those nodes; the persisted component index uses it to rebuild
+    only the components a delta touched. The filter is on identity columns, so
+    it does not change the dedup above.
     """
     conditions: list[str] = []
     params: dict[str, Any] = {}
@@ -59,6 +65,12 @@ def fetch_work_graph_edges(
     if org_id:
         params["org_id"] = org_id
         conditions.append("org_id = %(org_id)s")
+    if node_tokens is not None:
+        params["node_tokens"] = node_tokens
+        conditions.append(
+            "(concat(source_type, ':', source_id) IN %(node_tokens)s"
+            " OR concat(target_type, ':', target_id) IN %(node_tokens)s)"
+        )
     where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     having_sql = ""
     if exclude_heuristic:
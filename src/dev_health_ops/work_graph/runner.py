@@ -102,6 +102,7 @@ def run_work_graph_build(ns: argparse.Namespace) -> int:
         heuristic_days_window=ns.heuristic_window,
         heuristic_confidence=ns.heuristic_confidence,
         org_id=org_id or "",
+        incremental=bool(getattr(ns, "incremental", False)),
     )
 
     logging.info(f"Building work graph from {config.from_date} to {config.to_date}")
@@ -221,6 +222,7 @@ def run_investment_materialization(ns: argparse.Namespace) -> int:
     team_ids = [team_id for team_id in (ns.team_id or []) if team_id]
 
     org_id = getattr(ns, "org", None) or None
+    incremental = bool(getattr(ns, "incremental", False))
 
     config = MaterializeConfig(
         dsn=analytics_db,
@@ -247,6 +249,8 @@ def run_investment_materialization(ns: argparse.Namespace) -> int:
         llm_batch_timeout_seconds=resolve_llm_batch_timeout_seconds(
             getattr(ns, "llm_batch_timeout_seconds", None)
         ),
+        incremental=incremental,
+        verify_components=bool(getattr(ns, "verify_components", False)),
     )
 
     # CHAOS-2433 round-4 finding #1: the materializer writes work_unit_investments
@@ -305,7 +309,12 @@ def run_investment_materialization(ns: argparse.Namespace) -> int:
         )
         try:
             mstats = backfill_memberships(
-                MembershipBackfillConfig(dsn=analytics_db, org_id=org_id, repo_ids=None)
+                MembershipBackfillConfig(
+                    dsn=analytics_db,
+                    org_id=org_id,
+                    repo_ids=None,
+                    incremental=incremental,
+                )
             )
             logging.info(
                 "Membership projection complete. Components=%d Matched=%d "
@@ -418,6 +427,14 @@ def register_commands(subparsers: argparse._SubParsersAction) -> None:
         default=0.3,
         help="Confidence score for heuristic matches (default: 0.3).",
     )
+    wg_build.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Parse only commits, PRs and work items synced since the previous "
+            "incremental build of the org (requires --org)."
+        ),
+    )
     wg_build.add_argument(
         "--allow-degenerate",
         action="store_true",
@@ -535,4 +552,17 @@ def register_commands(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Allow real LLM materialization without --org, writing empty-org rows.",
     )
+    investment_materialize.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Update the persisted component index from edges synced since the "
+        "last run and categorize/project only the components that changed. "
+        "Requires --org; not combinable with --repo-id/--team-id.",
+    )
+    investment_materialize.add_argument(
+        "--verify-components",
+        action="store_true",
+        help="With --incremental, compare the component index against a full "
+        "rebuild and repair any drift.",
+    )
     investment_materialize.set_defaults(func=run_investment_materialization)
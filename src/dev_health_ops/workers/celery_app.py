@@ -2,6 +2,7 @@
 
 import logging
 import time
+from contextvars import Token
 from datetime import datetime, timezone
 from typing import Any
 
@@ -15,6 +16,10 @@ from celery.signals import (
 )
 
 from dev_health_ops.logging_config import configure_logging
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    reset_clickhouse_caller,
+    set_clickhouse_caller,
+)
 from dev_health_ops.sentry import init_sentry
 from dev_health_ops.tracing import (
     init_metrics,
@@ -31,6 +36,8 @@ instrument_celery()
 
 # Per-task start-time registry for duration tracking
 _task_start: dict[str, float] = {}
+# Per-task ClickHouse caller scopes, reset when the task finishes
+_task_clickhouse_callers: dict[str, Token[str]] = {}
 
 
 @worker_process_init.connect
@@ -58,6 +65,7 @@ def _stamp_enqueued_at(headers: Any = None, **kwargs: Any) -> None:
 @task_prerun.connect
 def _task_started(task_id: str, task: Any, **kwargs: Any) -> None:
     _task_start[task_id] = time.perf_counter()
+    _task_clickhouse_callers[task_id] = set_clickhouse_caller(f"task:{task.name}")
 
 
 @task_postrun.connect
@@ -68,6 +76,13 @@ def _task_finished(
     **kwargs: Any,
 ) -> None:
     start = _task_start.pop(task_id, None)
+    caller_token = _task_clickhouse_callers.pop(task_id, None)
+    if caller_token is not None:
+        try:
+            reset_clickhouse_caller(caller_token)
+        except ValueError:
+            # prerun fired in another context; nothing to unwind here.
+            pass
     duration = (time.perf_counter() - start) if start is not None else 0.0
     try:
         from dev_health_ops.metrics.prometheus import record_celery_task
@@ -223,7 +223,10 @@ def _dispatch_post_sync_tasks(
             )
 
     if has_git or has_work_items:
-        build_kwargs: dict[str, Any] = {"org_id": org_id}
+        # Incremental builds parse only the text, fast-path links and work
+        # items synced since the org's previous build. The window still bounds
+        # the dependency, flag and incident passes.
+        build_kwargs: dict[str, Any] = {"org_id": org_id, "incremental": True}
         graph_from_date = work_graph_from_date or from_date
         if graph_from_date is not None:
             build_kwargs["from_date"] = graph_from_date
@@ -231,7 +234,7 @@ def _dispatch_post_sync_tasks(
         if graph_to_date is not None:
             build_kwargs["to_date"] = graph_to_date
 
-        materialize_kwargs: dict[str, Any] = {"org_id": org_id}
+        materialize_kwargs: dict[str, Any] = {"org_id": org_id, "incremental": True}
         if from_date is not None:
             materialize_kwargs["from_date"] = from_date
         if to_date is not None:
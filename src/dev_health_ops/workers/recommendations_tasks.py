@@ -345,7 +345,11 @@ def _compute_recommendations_for_org(
             logger.info("No teams with recent activity for org_id=%s", org_id)
             return 0
 
-        loader = ClickHouseMetricsLoader(client=sink.client, org_id=org_id)
+        # Passing the run's teams lets the loader fetch every team's snapshot
+        # in one set of grouped queries on the first evaluation.
+        loader = ClickHouseMetricsLoader(
+            client=sink.client, org_id=org_id, team_ids=team_ids
+        )
         engine = RuleEngine(registry=recommendations_registry, loader=loader, now=now)
 
         records: list[RecommendationRecord] = []
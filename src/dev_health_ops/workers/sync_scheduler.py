@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import time
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
+from dev_health_ops.metrics.prometheus import (
+    record_sync_scheduler_dispatch_lag,
+    record_sync_scheduler_tick,
+)
 from dev_health_ops.sync.canonical_incident_gate import (
     CANONICAL_INCIDENT_FEATURE_KEY,
     CanonicalIncidentFeatureDisabledError,
@@ -24,7 +30,7 @@ from dev_health_ops.workers.task_utils import (
 )
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import Session, SessionTransaction
 
     from dev_health_ops.models.settings import (
         ScheduledJob,
@@ -40,6 +46,21 @@ STALE_RUNNING_TTL_SECONDS = 2 * 60 * 60  # 2 hours
 
 DEFAULT_SYNC_CRON = "0 * * * *"
 
+# Due-time index mode. Instead of loading every active config each tick, the
+# scheduler claims only configs whose ``SyncConfiguration.next_due_at`` has
+# passed (NULL = not yet indexed) in one ``SKIP LOCKED`` batch, and every
+# evaluation stamps the config's next due time. The stamp is always a lower
+# bound on when the config can next dispatch -- never later -- and is capped
+# at ``SYNC_SCHEDULER_DUE_RECHECK_SECONDS`` ahead, so a config edited by a path
+# that does not reset the index is re-evaluated within that horizon.
+SYNC_SCHEDULER_DUE_INDEX_ENV = "SYNC_SCHEDULER_DUE_INDEX_ENABLED"
+SYNC_SCHEDULER_DUE_BATCH_SIZE_ENV = "SYNC_SCHEDULER_DUE_BATCH_SIZE"
+SYNC_SCHEDULER_DUE_RECHECK_ENV = "SYNC_SCHEDULER_DUE_RECHECK_SECONDS"
+SYNC_SCHEDULER_DUE_FAILURE_BACKOFF_ENV = "SYNC_SCHEDULER_DUE_FAILURE_BACKOFF_SECONDS"
+DEFAULT_DUE_BATCH_SIZE = 500
+DEFAULT_DUE_RECHECK_SECONDS = 60 * 60
+DEFAULT_DUE_FAILURE_BACKOFF_SECONDS = 5 * 60
+
 
 def _ensure_utc(value: datetime | None) -> datetime | None:
     """Coerce a DB timestamp to an aware UTC datetime (SQLite returns naive)."""
@@ -70,6 +91,116 @@ def _session_dialect_name(session: Session) -> str:
     return getattr(getattr(bind, "dialect", None), "name", "")
 
 
+def _due_index_enabled() -> bool:
+    return (os.getenv(SYNC_SCHEDULER_DUE_INDEX_ENV) or "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", name, raw)
+        return default
+    return value if value > 0 else default
+
+
+def _stamp_next_due(
+    session: Session,
+    config: SyncConfiguration,
+    *,
+    now: datetime,
+    when: datetime | None,
+) -> None:
+    """Record when ``config`` next needs evaluating (``None`` = recheck horizon).
+
+    Written with a Core UPDATE that pins ``updated_at``: the index is scheduler
+    bookkeeping, and bumping the config's user-visible modification time on
+    every tick would be wrong.
+    """
+    from sqlalchemy import update
+    from sqlalchemy.orm.attributes import set_committed_value
+
+    from dev_health_ops.models.settings import SyncConfiguration
+
+    horizon = now + timedelta(
+        seconds=_positive_int_env(
+            SYNC_SCHEDULER_DUE_RECHECK_ENV, DEFAULT_DUE_RECHECK_SECONDS
+        )
+    )
+    due = _ensure_utc(when)
+    next_due = horizon if due is None else min(due, horizon)
+    session.execute(
+        update(SyncConfiguration)
+        .where(SyncConfiguration.id == _as_uuid(config.id))
+        .values(next_due_at=next_due, updated_at=SyncConfiguration.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(config, "next_due_at", next_due)
+
+
+def _stamp_failure_backoff(
+    session: Session, config: SyncConfiguration, now: datetime
+) -> None:
+    """Park a config whose evaluation failed (bad cron, planner error).
+
+    Without a stamp its ``next_due_at`` stays in the past and the config is
+    re-claimed, and fails again, on every tick.
+    """
+    _stamp_next_due(
+        session,
+        config,
+        now=now,
+        when=now
+        + timedelta(
+            seconds=_positive_int_env(
+                SYNC_SCHEDULER_DUE_FAILURE_BACKOFF_ENV,
+                DEFAULT_DUE_FAILURE_BACKOFF_SECONDS,
+            )
+        ),
+    )
+
+
+def _claim_due_configs(
+    session: Session, now: datetime, batch_size: int
+) -> list[SyncConfiguration]:
+    """One indexed batch of active configs whose due time has passed.
+
+    On Postgres the rows are claimed ``FOR UPDATE SKIP LOCKED`` so concurrent
+    scheduler replicas split the due set instead of evaluating it twice.
+    Oldest-due first, so a backlog drains in order.
+    """
+    from sqlalchemy import or_
+
+    from dev_health_ops.models.settings import SyncConfiguration
+
+    query = (
+        session.query(SyncConfiguration)
+        .filter(
+            SyncConfiguration.is_active.is_(True),
+            or_(
+                SyncConfiguration.next_due_at.is_(None),
+                SyncConfiguration.next_due_at <= now,
+            ),
+        )
+        .order_by(
+            SyncConfiguration.next_due_at.asc().nulls_first(),
+            SyncConfiguration.id,
+        )
+        .limit(batch_size)
+    )
+    if _session_dialect_name(session) == "postgresql":
+        query = query.with_for_update(skip_locked=True)
+    return query.all()
+
+
 def _new_sync_scheduled_job(config: SyncConfiguration, cron_expr: str) -> ScheduledJob:
     from dev_health_ops.models.settings import JobStatus, ScheduledJob
 
@@ -163,7 +294,12 @@ def _ensure_due_job_marker(
 
 
 def _maybe_dispatch_config(
-    session: Session, config: SyncConfiguration, now: datetime
+    session: Session,
+    config: SyncConfiguration,
+    now: datetime,
+    *,
+    due_index: bool = False,
+    commit: bool = True,
 ) -> bool:
     """Dispatch a single sync config if due. Returns True when dispatched.
 
@@ -175,7 +311,49 @@ def _maybe_dispatch_config(
     marker is self-expiring: if the dispatched task is lost (worker crash,
     queue purge), the config becomes dispatchable again at the next cron
     occurrence -- at most one cron interval of delay, no manual cleanup.
+
+    With ``due_index`` every decision also stamps
+    ``SyncConfiguration.next_due_at`` (see :func:`_stamp_next_due`); skips
+    whose outcome cannot change before a known time stamp that time, the rest
+    stamp the recheck horizon.
+
+    The evaluation runs in a SAVEPOINT, so a failure discards only this
+    config's writes. With ``commit=False`` (the due-index tick) the savepoint is
+    released into the caller's transaction, which keeps the rows the tick
+    claimed locked and the earlier configs' stamps intact until it commits
+    once. A failed evaluation is stamped
+    ``SYNC_SCHEDULER_DUE_FAILURE_BACKOFF_SECONDS`` ahead so it is not
+    re-claimed on every tick.
     """
+    savepoint = session.begin_nested()
+    try:
+        dispatched = _evaluate_config(
+            session, savepoint, config, now, due_index=due_index
+        )
+    except Exception:
+        if savepoint.is_active:
+            savepoint.rollback()
+        if due_index:
+            _stamp_failure_backoff(session, config, now)
+            if commit:
+                session.commit()
+        raise
+    if savepoint.is_active:
+        savepoint.commit()
+    if commit:
+        session.commit()
+    return dispatched
+
+
+def _evaluate_config(
+    session: Session,
+    savepoint: SessionTransaction,
+    config: SyncConfiguration,
+    now: datetime,
+    *,
+    due_index: bool,
+) -> bool:
+    """Body of :func:`_maybe_dispatch_config`, run inside ``savepoint``."""
 
     from dev_health_ops.models.settings import (
         JobStatus,
@@ -201,7 +379,16 @@ def _maybe_dispatch_config(
             return False
     config = locked_config
 
+    def _next_due(when: datetime | None = None) -> None:
+        if due_index:
+            _stamp_next_due(session, config, now=now, when=when)
+
+    def _next_due_after_failure() -> None:
+        if due_index:
+            _stamp_failure_backoff(session, config, now)
+
     if not organization_exists_sync(session, config.org_id):
+        _next_due()
         return False
     sync_targets = [str(target) for target in (config.sync_targets or [])]
     if sync_targets_require_canonical_incident_feature(
@@ -215,6 +402,7 @@ def _maybe_dispatch_config(
                 "feature_key": CANONICAL_INCIDENT_FEATURE_KEY,
             },
         )
+        _next_due()
         return False
 
     # Manual-only configs (no explicit schedule_cron in sync_options) are
@@ -223,6 +411,7 @@ def _maybe_dispatch_config(
     # placeholder, and legacy rows may still be marked ACTIVE.
     config_cron = str(_as_dict(config.sync_options).get("schedule_cron") or "")
     if not config_cron:
+        _next_due()
         return False
 
     sync_config_id = _as_uuid(config.id)
@@ -241,10 +430,12 @@ def _maybe_dispatch_config(
 
     # PAUSED/DISABLED jobs (manual-only, org teardown) are never dispatched.
     if job is not None and int(job.status) != JobStatus.ACTIVE.value:
+        _next_due()
         return False
 
     if job is not None and bool(job.is_running):
         if not _running_marker_is_stale(job, now):
+            _next_due()
             return False
         logger.warning(
             "Sync job %s for config %s has is_running set for more than %ss; "
@@ -259,6 +450,7 @@ def _maybe_dispatch_config(
     if job is not None:
         next_allowed = _ensure_utc(_as_datetime_or_none(job.next_run_at))
         if next_allowed is not None and next_allowed > now:
+            _next_due(next_allowed)
             return False
 
     cron_expr = _as_str(job.schedule_cron) if job is not None else config_cron
@@ -275,6 +467,7 @@ def _maybe_dispatch_config(
     next_run = cron_next_run(cron_expr, last_sync, tz_name)
 
     if not next_run <= now:
+        _next_due(next_run)
         return False
 
     if job is None:
@@ -284,13 +477,16 @@ def _maybe_dispatch_config(
 
         next_allowed = _ensure_utc(_as_datetime_or_none(job.next_run_at))
         if next_allowed is not None and next_allowed > now:
+            _next_due(next_allowed)
             return False
 
         if int(job.status) != JobStatus.ACTIVE.value:
+            _next_due()
             return False
 
         if bool(job.is_running):
             if not _running_marker_is_stale(job, now):
+                _next_due()
                 return False
             logger.warning(
                 "Sync job %s for config %s has is_running set for more than %ss; "
@@ -303,6 +499,9 @@ def _maybe_dispatch_config(
     marker = cron_next_run(cron_expr, now, tz_name)
     if isinstance(marker, datetime):
         job.next_run_at = marker
+    # Recompute the next occurrence at dispatch. Released with the trigger;
+    # a rollback below replaces it with the failure backoff.
+    _next_due(marker if isinstance(marker, datetime) else None)
     session.flush()
 
     from dev_health_ops.sync.execution_trigger import (
@@ -325,7 +524,7 @@ def _maybe_dispatch_config(
             mode="incremental",
         )
         if not trigger.dispatch_required:
-            session.commit()
+            savepoint.commit()
             logger.warning(
                 "sync_scheduler.pagerduty_sync_disabled",
                 extra={
@@ -339,11 +538,13 @@ def _maybe_dispatch_config(
             return False
     except ScheduledSyncOccurrenceIneligibleError as exc:
         logger.warning("Skipping sync config %s: %s", config.id, exc)
-        session.rollback()
+        savepoint.rollback()
+        _next_due_after_failure()
         return False
     except Exception:
         logger.exception("Fan-out planner failed for config %s", config.id)
-        session.rollback()
+        savepoint.rollback()
+        _next_due_after_failure()
         return False
 
     try:
@@ -356,9 +557,9 @@ def _maybe_dispatch_config(
                 trigger.sync_run_id,
                 exc,
             )
-            session.commit()
+            savepoint.commit()
         except Exception:
-            session.rollback()
+            savepoint.rollback()
             logger.exception(
                 "sync_scheduler.feature_denial_terminalization_failed",
                 extra={
@@ -382,12 +583,19 @@ def _maybe_dispatch_config(
         return False
 
     try:
-        session.commit()
+        savepoint.commit()
     except Exception:
         logger.exception("Fan-out planner commit failed for config %s", config.id)
-        session.rollback()
+        savepoint.rollback()
+        _next_due_after_failure()
         return False
 
+    scheduled_for = _ensure_utc(_as_datetime_or_none(next_run))
+    if scheduled_for is not None:
+        record_sync_scheduler_dispatch_lag(
+            mode="due_index" if due_index else "scan",
+            lag_seconds=(now - scheduled_for).total_seconds(),
+        )
     return True
 
 
@@ -395,26 +603,67 @@ def _maybe_dispatch_config(
     bind=True, name="dev_health_ops.workers.tasks.dispatch_scheduled_syncs"
 )
 def dispatch_scheduled_syncs(self) -> dict:
-    """Check active sync configs and dispatch any that are due."""
+    """Check active sync configs and dispatch any that are due.
+
+    By default every active config is evaluated. With
+    ``SYNC_SCHEDULER_DUE_INDEX_ENABLED`` only the configs whose indexed
+    ``next_due_at`` has passed are claimed, at most
+    ``SYNC_SCHEDULER_DUE_BATCH_SIZE`` per tick.
+    """
     from dev_health_ops.db import get_postgres_session_sync
     from dev_health_ops.models.settings import SyncConfiguration
 
+    started = time.perf_counter()
     now = datetime.now(timezone.utc)
+    due_index = _due_index_enabled()
+    mode = "due_index" if due_index else "scan"
     dispatched: list[str] = []
     skipped = 0
     errors = 0
+    evaluated = 0
+    oldest_due_lag: float | None = None
 
     try:
         with get_postgres_session_sync() as session:
-            configs = (
-                session.query(SyncConfiguration)
-                .filter(SyncConfiguration.is_active.is_(True))
-                .all()
-            )
+            if due_index:
+                configs = _claim_due_configs(
+                    session,
+                    now,
+                    _positive_int_env(
+                        SYNC_SCHEDULER_DUE_BATCH_SIZE_ENV, DEFAULT_DUE_BATCH_SIZE
+                    ),
+                )
+                indexed = [
+                    due
+                    for due in (
+                        _ensure_utc(_as_datetime_or_none(config.next_due_at))
+                        for config in configs
+                    )
+                    if due is not None
+                ]
+                oldest_due_lag = (
+                    (now - min(indexed)).total_seconds() if indexed else 0.0
+                )
+            else:
+                configs = (
+                    session.query(SyncConfiguration)
+                    .filter(SyncConfiguration.is_active.is_(True))
+                    .all()
+                )
+            evaluated = len(configs)
 
             for config in configs:
                 try:
-                    if _maybe_dispatch_config(session, config, now):
+                    # Scan mode commits per config so each dispatch (and its
+                    # outbox row) lands independently; the due-index tick
+                    # holds its claimed rows until the single final commit.
+                    if _maybe_dispatch_config(
+                        session,
+                        config,
+                        now,
+                        due_index=due_index,
+                        commit=not due_index,
+                    ):
                         dispatched.append(str(config.id))
                     else:
                         skipped += 1
@@ -430,8 +679,17 @@ def dispatch_scheduled_syncs(self) -> dict:
     except Exception:
         logger.exception("dispatch_scheduled_syncs failed")
 
+    record_sync_scheduler_tick(
+        mode=mode,
+        evaluated=evaluated,
+        duration_seconds=time.perf_counter() - started,
+        oldest_due_lag_seconds=oldest_due_lag,
+    )
     logger.info(
-        "Scheduled sync dispatch: dispatched=%d skipped=%d errors=%d",
+        "Scheduled sync dispatch: mode=%s evaluated=%d dispatched=%d skipped=%d "
+        "errors=%d",
+        mode,
+        evaluated,
         len(dispatched),
         skipped,
         errors,
@@ -56,6 +56,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, SessionTransactionOrigin
 
 from dev_health_ops.api.services.sync_coverage import (
+    apply_sync_run_to_coverage_intervals_sync,
     invalidate_sync_coverage_projection_sync,
 )
 from dev_health_ops.exceptions import PaginationException, RateLimitException
@@ -374,6 +375,12 @@ def _join_budget_estimates_with_actuals(
     ``underestimated: False``) with a ``underestimation_assessable_reason``
     explaining why, and no warning is logged for that row.
 
+    ``actual_requests`` stays a physical round-trip count. Revalidated reads
+    answered from the conditional-request cache are reported as
+    ``conditional_hits``; those the provider does not charge against its rate
+    limit (GitHub 304s) are excluded from ``rate_limited_requests``, which is
+    what ``ratio`` / ``underestimated`` compare against the estimate.
+
     When the CHAOS-2754 recorder's 50-key overflow marker is present, dropped
     operations could belong to any route_family (the recorder never learns
     which family a dropped operation would have joined), so every row for this
@@ -390,6 +397,8 @@ def _join_budget_estimates_with_actuals(
     )
 
     actual_requests_by_key: dict[tuple[str, str], int] = defaultdict(int)
+    conditional_hits_by_key: dict[tuple[str, str], int] = defaultdict(int)
+    exempt_requests_by_key: dict[tuple[str, str], int] = defaultdict(int)
     for entry in provider_usage:
         if not isinstance(entry, Mapping) or "dropped_operation_count" in entry:
             continue
@@ -400,6 +409,12 @@ def _join_budget_estimates_with_actuals(
         actual_requests_by_key[(route_family, dimension)] += int(
             entry.get("request_count") or 0
         )
+        conditional_hits_by_key[(route_family, dimension)] += int(
+            entry.get("conditional_hit_count") or 0
+        )
+        exempt_requests_by_key[(route_family, dimension)] += int(
+            entry.get("rate_limit_exempt_count") or 0
+        )
 
     if not actual_requests_by_key:
         return []
@@ -429,6 +444,7 @@ def _join_budget_estimates_with_actuals(
     for key in sorted(actual_requests_by_key):
         route_family, dimension = key
         actual_requests = actual_requests_by_key[key]
+        rate_limited_requests = actual_requests - exempt_requests_by_key[key]
         unbudgeted_actual = key not in estimated_units_by_key
         estimated_units = 0 if unbudgeted_actual else estimated_units_by_key[key]
         bucket = bucket_by_key.get(key)
@@ -439,8 +455,8 @@ def _join_budget_estimates_with_actuals(
             unbudgeted_actual or dimension in _REQUEST_COUNT_COMPARABLE_DIMENSIONS
         )
         if assessable:
-            ratio = actual_requests / estimated_units if estimated_units else None
-            underestimated = actual_requests > estimated_units
+            ratio = rate_limited_requests / estimated_units if estimated_units else None
+            underestimated = rate_limited_requests > estimated_units
             assessable_reason = None
         else:
             ratio = None
@@ -457,6 +473,8 @@ def _join_budget_estimates_with_actuals(
                 "dimension": dimension,
                 "estimated_units": estimated_units,
                 "actual_requests": actual_requests,
+                "rate_limited_requests": rate_limited_requests,
+                "conditional_hits": conditional_hits_by_key[key],
                 "ratio": ratio,
                 "underestimated": underestimated,
                 "underestimation_assessable": assessable,
@@ -2141,6 +2159,7 @@ def finalize_sync_run(sync_run_id: str) -> dict[str, Any]:
             nested.rollback()
             return {"status": "already_dispatched", "sync_run_id": sync_run_id}
         else:
+            apply_sync_run_to_coverage_intervals_sync(session, run, units)
             invalidate_sync_coverage_projection_sync(
                 session,
                 str(run.org_id),
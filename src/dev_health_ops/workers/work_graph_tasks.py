@@ -102,6 +102,7 @@ def run_work_graph_build(
     heuristic_window: int = 7,
     heuristic_confidence: float = 0.3,
     org_id: str = "",
+    incremental: bool = False,
 ) -> dict:
     """Build work graph from evidence.
 
@@ -112,6 +113,8 @@ def run_work_graph_build(
         repo_id: Optional repository UUID to filter
         heuristic_window: Days window for heuristics
         heuristic_confidence: Confidence threshold for heuristics
+        incremental: Parse only rows synced since the org's previous
+            incremental build (requires org_id)
 
     Returns:
         dict with build status and edge count
@@ -151,6 +154,7 @@ def run_work_graph_build(
             heuristic_days_window=heuristic_window,
             heuristic_confidence=heuristic_confidence,
             org_id=org_id,
+            incremental=incremental,
         )
         builder = WorkGraphBuilder(config)
         try:
@@ -307,6 +311,7 @@ def run_investment_materialize_chunk(
     llm_batch_poll_interval_seconds: float | None = None,
     llm_batch_timeout_seconds: float | None = None,
     max_component_nodes: int | None = None,
+    work_unit_ids: list[str] | None = None,
 ) -> dict:
     from dev_health_ops.db import get_postgres_session_sync
     from dev_health_ops.llm import LLMAuthError, LLMError, resolve_provider_name
@@ -400,6 +405,7 @@ def run_investment_materialize_chunk(
             # the SAME cap the dispatcher enumerated with, or component_indexes
             # would name different work units (CHAOS-2775 codex round 2).
             max_component_nodes=max_component_nodes,
+            work_unit_ids=work_unit_ids,
         )
         stats = run_async(materialize_investments(config))
 
@@ -439,6 +445,7 @@ def finalize_investment_materialize_partitioned(
     org_id: str = "",
     run_id: str = "",
     run_membership_backfill_after: bool = False,
+    incremental: bool = False,
 ) -> dict:
     db_url = db_url or _get_db_url()
     totals: dict[str, Any] = {
@@ -491,7 +498,10 @@ def finalize_investment_materialize_partitioned(
 
             totals["membership"] = backfill_memberships(
                 MembershipBackfillConfig(
-                    dsn=db_url, org_id=org_id or None, repo_ids=None
+                    dsn=db_url,
+                    org_id=org_id or None,
+                    repo_ids=None,
+                    incremental=incremental,
                 )
             )
         return totals
@@ -524,8 +534,12 @@ def dispatch_investment_materialize_partitioned(
     llm_batch_min_items: int | None = None,
     llm_batch_poll_interval_seconds: float | None = None,
     llm_batch_timeout_seconds: float | None = None,
+    incremental: bool = False,
 ) -> dict:
     from dev_health_ops.metrics.sinks.factory import create_sink
+    from dev_health_ops.work_graph.investment.component_index import (
+        update_component_index,
+    )
     from dev_health_ops.work_graph.investment.constants import (
         resolve_max_component_nodes,
     )
@@ -538,6 +552,7 @@ def dispatch_investment_materialize_partitioned(
         resolve_llm_batch_timeout_seconds,
     )
     from dev_health_ops.work_graph.investment.queries import fetch_work_graph_edges
+    from dev_health_ops.work_graph.investment.utils import work_unit_id
 
     # Hoisted to guarantee definite assignment on every return path (CodeQL).
     #
@@ -566,6 +581,10 @@ def dispatch_investment_materialize_partitioned(
     # scoped projection would only cover in-scope units and blank every other
     # repo's membership for unscoped reads.
     run_membership = not (repo_ids or team_ids)
+    # Incremental runs categorize only the components touched since the last
+    # run (persisted component index) and hand chunks work_unit_ids, which stay
+    # valid however the rest of the graph is grouped. The index is org-wide.
+    incremental = incremental and run_membership and bool(org_id)
 
     # Resolve the component-size cap ONCE and freeze it for the whole
     # partitioned run: chunk workers rebuild the component list from a fresh
@@ -582,12 +601,17 @@ def dispatch_investment_materialize_partitioned(
         resolved_repo_ids = _resolve_repo_ids(
             sink, repo_ids, team_ids, config_org_id=org_id or ""
         )
-        edges = fetch_work_graph_edges(
-            sink, repo_ids=resolved_repo_ids, org_id=org_id or ""
-        )
-        components = _build_components(
-            edges, max_component_nodes=frozen_max_component_nodes
-        )
+        if incremental:
+            components = update_component_index(
+                sink, org_id=org_id, max_component_nodes=frozen_max_component_nodes
+            ).components
+        else:
+            edges = fetch_work_graph_edges(
+                sink, repo_ids=resolved_repo_ids, org_id=org_id or ""
+            )
+            components = _build_components(
+                edges, max_component_nodes=frozen_max_component_nodes
+            )
     finally:
         sink.close()
 
@@ -632,6 +656,12 @@ def dispatch_investment_materialize_partitioned(
             "chunk_index": chunk_index,
             "max_component_nodes": frozen_max_component_nodes,
         }
+        if incremental:
+            chunk_kwargs["component_indexes"] = None
+            chunk_kwargs["work_unit_ids"] = [
+                work_unit_id(list(dict.fromkeys(components[index][0])))
+                for index in chunk_indexes
+            ]
         if allow_unscoped:
             chunk_kwargs["allow_unscoped"] = True
         header.append(
@@ -648,6 +678,7 @@ def dispatch_investment_materialize_partitioned(
             "org_id": org_id,
             "run_id": run_id,
             "run_membership_backfill_after": run_membership,
+            "incremental": incremental,
         },
         queue="metrics",
     )
@@ -659,6 +690,7 @@ def dispatch_investment_materialize_partitioned(
         "run_id": run_id,
         "computed_at": computed_at,
         "membership_in_finalizer": run_membership,
+        "incremental": incremental,
     }
 
 
@@ -673,6 +705,7 @@ def run_membership_backfill(
     db_url: str | None = None,
     org_id: str = "",
     repo_ids: list[str] | None = None,
+    incremental: bool = False,
 ) -> dict:
     """Project work_unit_membership from EXISTING work_unit_investments — NO LLM.
 
@@ -702,6 +735,8 @@ def run_membership_backfill(
         db_url: Database connection string (defaults to env).
         org_id: Organization scope for work-graph/investment queries.
         repo_ids: Optional repo filter.
+        incremental: Re-project only units changed since the previous complete
+            run and carry the rest forward (org-wide runs only).
 
     Returns:
         dict with backfill status and stats.
@@ -717,6 +752,7 @@ def run_membership_backfill(
             dsn=db_url,
             org_id=org_id or None,
             repo_ids=repo_ids,
+            incremental=incremental,
         )
         stats = backfill_memberships(config)
         return {"status": "success", "stats": stats}
@@ -0,0 +1,195 @@
+"""Coverage reads served from the incrementally maintained interval store.
+
+The store must reproduce ``_stream_compact_unit_windows`` exactly: the same
+payload for any lookback, with units of runs finalized after the last rebuild
+replayed on top, and a fallback to the scan whenever replay order would differ.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from dev_health_ops.api.services import sync_coverage as sync_coverage_module
+from dev_health_ops.api.services.sync_coverage import (
+    SYNC_COVERAGE_INTERVAL_STORE_ENV,
+    rebuild_sync_coverage_intervals_sync,
+    rebuild_sync_coverage_projection,
+)
+from dev_health_ops.models.git import Base
+from dev_health_ops.models.settings import SyncConfiguration
+from dev_health_ops.models.sync_coverage import SyncCoverageIntervalState
+from tests.api.admin.test_sync_coverage_api import (
+    _TABLES,
+    _seed_run,
+    _seed_run_unit,
+    _seed_scope,
+    _seed_unit,
+)
+
+GENERATED_AT = datetime(2026, 1, 20, tzinfo=timezone.utc)
+
+
+def _day(day: int) -> datetime:
+    return datetime(2026, 1, day, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def store_db(tmp_path: Path):
+    db_path = tmp_path / "sync-coverage-intervals.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(
+                sync_conn, tables=[*_TABLES, SyncCoverageIntervalState.__table__]
+            )
+        )
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        yield maker, sync_engine
+    finally:
+        sync_engine.dispose()
+        await engine.dispose()
+
+
+async def _seed_history(maker) -> dict:
+    scope = await _seed_scope(maker, str(uuid.uuid4()))
+    await _seed_unit(maker, scope, since=_day(1), before=_day(3))
+    await _seed_unit(maker, scope, since=_day(3), before=_day(5), status="failed")
+    await _seed_unit(maker, scope, since=_day(5), before=_day(6), status="failed")
+    await _seed_unit(maker, scope, since=_day(4), before=_day(7))
+    await _seed_unit(maker, scope, since=_day(7), before=_day(8), status="failed")
+    running = await _seed_run(maker, scope, status="running")
+    await _seed_run_unit(
+        maker, scope, running, since=_day(8), before=_day(9), status="planned"
+    )
+    return scope
+
+
+def _rebuild(sync_engine, scope: dict, *, apply: bool = True):
+    with Session(sync_engine) as session:
+        report = rebuild_sync_coverage_intervals_sync(
+            session,
+            scope["org_id"],
+            uuid.UUID(scope["integration_id"]),
+            apply=apply,
+        )
+        session.commit()
+    return report
+
+
+async def _payload(maker, scope: dict, *, lookback_days: int) -> dict:
+    async with maker() as session:
+        config = await session.get(SyncConfiguration, uuid.UUID(scope["config_id"]))
+        assert config is not None
+        payload = await rebuild_sync_coverage_projection(
+            session,
+            scope["org_id"],
+            config,
+            generated_at=GENERATED_AT,
+            lookback_days=lookback_days,
+        )
+        await session.commit()
+        return payload
+
+
+async def _scan_and_store_payloads(
+    maker, scope: dict, monkeypatch, *, lookback_days: int = 3650
+) -> tuple[dict, dict, int]:
+    monkeypatch.delenv(SYNC_COVERAGE_INTERVAL_STORE_ENV, raising=False)
+    scanned = await _payload(maker, scope, lookback_days=lookback_days)
+
+    scan = sync_coverage_module._stream_compact_unit_windows
+    scan_calls = []
+
+    async def _counting_scan(*args, **kwargs):
+        scan_calls.append(args)
+        return await scan(*args, **kwargs)
+
+    monkeypatch.setenv(SYNC_COVERAGE_INTERVAL_STORE_ENV, "true")
+    monkeypatch.setattr(
+        sync_coverage_module, "_stream_compact_unit_windows", _counting_scan
+    )
+    stored = await _payload(maker, scope, lookback_days=lookback_days)
+    return scanned, stored, len(scan_calls)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lookback_days", [3650, 16])
+async def test_store_reads_match_the_from_scratch_scan(
+    store_db, monkeypatch, lookback_days
+):
+    maker, sync_engine = store_db
+    scope = await _seed_history(maker)
+    report = _rebuild(sync_engine, scope)
+    assert report.pair_count == 1
+    assert report.rewritten is True
+
+    scanned, stored, scan_calls = await _scan_and_store_payloads(
+        maker, scope, monkeypatch, lookback_days=lookback_days
+    )
+
+    assert scan_calls == 0
+    assert stored == scanned
+    assert scanned["overall"]["failed_range_count"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_store_replays_runs_finalized_after_the_rebuild(store_db, monkeypatch):
+    maker, sync_engine = store_db
+    scope = await _seed_history(maker)
+    _rebuild(sync_engine, scope)
+    await _seed_unit(maker, scope, since=_day(9), before=_day(11), status="failed")
+    await _seed_unit(maker, scope, since=_day(7), before=_day(10))
+
+    scanned, stored, scan_calls = await _scan_and_store_payloads(
+        maker, scope, monkeypatch
+    )
+
+    assert scan_calls == 0
+    assert stored == scanned
+
+
+@pytest.mark.asyncio
+async def test_store_falls_back_when_an_unstamped_run_sorts_before_it(
+    store_db, monkeypatch
+):
+    maker, sync_engine = store_db
+    scope = await _seed_history(maker)
+    _rebuild(sync_engine, scope)
+    # Completed before the last folded run, so replaying it on top of the
+    # store would reorder a failure against later successes.
+    await _seed_unit(maker, scope, since=_day(1), before=_day(2), status="failed")
+
+    scanned, stored, scan_calls = await _scan_and_store_payloads(
+        maker, scope, monkeypatch
+    )
+
+    assert scan_calls == 1
+    assert stored == scanned
+
+
+@pytest.mark.asyncio
+async def test_stale_store_row_falls_back_to_the_scan(store_db, monkeypatch):
+    maker, sync_engine = store_db
+    scope = await _seed_history(maker)
+    _rebuild(sync_engine, scope)
+    with Session(sync_engine) as session:
+        session.query(SyncCoverageIntervalState).update({"is_stale": True})
+        session.commit()
+
+    scanned, stored, scan_calls = await _scan_and_store_payloads(
+        maker, scope, monkeypatch
+    )
+
+    assert scan_calls == 1
+    assert stored == scanned
+    assert [drift.reason for drift in _rebuild(sync_engine, scope).drift] == ["stale"]
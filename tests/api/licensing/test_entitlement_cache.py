@@ -0,0 +1,281 @@
+"""Org entitlement snapshots served from the entitlement cache.
+
+Cached reads must return exactly what ``get_org_entitlements_from_db``
+computes from Postgres, skip the queries on a hit, and be dropped by any
+committed licensing, organization-tier, subscription or feature write.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from dev_health_ops.core.generation_cache import LocalTier
+from dev_health_ops.licensing import entitlement_cache as cache
+from dev_health_ops.licensing import gating
+from dev_health_ops.licensing.entitlement_cache import (
+    ENTITLEMENT_CACHE_ENABLED_ENV,
+    cached_org_entitlements,
+)
+from dev_health_ops.licensing.feature_decisions import (
+    evaluate_org_features_until_async,
+)
+from dev_health_ops.models.git import Base
+from dev_health_ops.models.licensing import FeatureFlag, OrgFeatureOverride, OrgLicense
+from dev_health_ops.models.subscriptions import Subscription
+from dev_health_ops.models.users import Organization
+from tests._helpers import tables_of
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path, monkeypatch):
+    monkeypatch.delenv(ENTITLEMENT_CACHE_ENABLED_ENV, raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    monkeypatch.setattr(cache._cache, "local", LocalTier(16))
+    monkeypatch.setattr(cache._cache, "client", None)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ent.db'}")
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(
+                sync_conn,
+                tables=tables_of(
+                    Organization,
+                    OrgLicense,
+                    Subscription,
+                    FeatureFlag,
+                    OrgFeatureOverride,
+                ),
+            )
+        )
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        yield maker, statements
+    finally:
+        await engine.dispose()
+
+
+async def _seed_org(maker, *, tier: str = "community") -> uuid.UUID:
+    async with maker() as session:
+        org = Organization(slug=f"org-{uuid.uuid4().hex[:8]}", name="Org", tier=tier)
+        session.add(org)
+        await session.commit()
+        return org.id
+
+
+async def _entitlements(maker, org_id: uuid.UUID) -> dict:
+    async with maker() as session:
+        return await gating.get_org_entitlements_from_db(org_id, session)
+
+
+@pytest.mark.asyncio
+async def test_hit_matches_the_uncached_result_without_queries(db, monkeypatch):
+    maker, statements = db
+    org_id = await _seed_org(maker, tier="team")
+    uncached = await _entitlements(maker, org_id)
+
+    monkeypatch.setenv(ENTITLEMENT_CACHE_ENABLED_ENV, "true")
+    first = await _entitlements(maker, org_id)
+    statements.clear()
+    second = await _entitlements(maker, org_id)
+
+    assert first == uncached
+    assert second == uncached
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_committed_writes_invalidate_the_org(db, monkeypatch):
+    maker, _ = db
+    monkeypatch.setenv(ENTITLEMENT_CACHE_ENABLED_ENV, "true")
+    org_id = await _seed_org(maker)
+    other_org_id = await _seed_org(maker)
+    assert (await _entitlements(maker, org_id))["tier"] == "community"
+    await _entitlements(maker, other_org_id)
+    other_generation = cache._cache.local.generation(str(other_org_id))
+
+    async with maker() as session:
+        session.add(OrgLicense(org_id=org_id, tier="enterprise", license_type="saas"))
+        await session.commit()
+    assert (await _entitlements(maker, org_id))["tier"] == "enterprise"
+
+    async with maker() as session:
+        session.add(
+            Subscription(
+                org_id=org_id,
+                billing_plan_id=uuid.uuid4(),
+                billing_price_id=uuid.uuid4(),
+                stripe_subscription_id="sub-1",
+                stripe_customer_id="cus-1",
+                status="trialing",
+                current_period_start=datetime.now(UTC),
+                current_period_end=datetime.now(UTC) + timedelta(days=14),
+                trial_end=datetime.now(UTC) + timedelta(days=14),
+            )
+        )
+        await session.rollback()
+    assert (await _entitlements(maker, org_id))["is_trialing"] is False
+
+    async with maker() as session:
+        license_row = await session.get(OrgLicense, (await _license_id(maker, org_id)))
+        license_row.is_valid = False
+        await session.commit()
+    assert (await _entitlements(maker, org_id))["is_licensed"] is False
+    assert cache._cache.local.generation(str(other_org_id)) == other_generation
+
+
+async def _license_id(maker, org_id: uuid.UUID) -> uuid.UUID:
+    from sqlalchemy import select
+
+    async with maker() as session:
+        return (
+            await session.execute(select(OrgLicense.id).filter_by(org_id=org_id))
+        ).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_feature_flag_writes_invalidate_every_org(db, monkeypatch):
+    maker, statements = db
+    monkeypatch.setenv(ENTITLEMENT_CACHE_ENABLED_ENV, "true")
+    org_id = await _seed_org(maker)
+    await _entitlements(maker, org_id)
+
+    async with maker() as session:
+        session.add(FeatureFlag(key="customer_push_ingest", name="Customer push"))
+        await session.commit()
+
+    statements.clear()
+    await _entitlements(maker, org_id)
+    assert statements
+
+
+@pytest.mark.asyncio
+async def test_override_expiry_bounds_the_snapshot(db):
+    maker, _ = db
+    org_id = await _seed_org(maker)
+    expires_at = datetime.now(UTC) + timedelta(minutes=5)
+    async with maker() as session:
+        flag = FeatureFlag(key="customer_push_ingest", name="Customer push")
+        session.add(flag)
+        await session.flush()
+        session.add(OrgFeatureOverride(org_id, flag.id, expires_at=expires_at))
+        await session.commit()
+
+    async with maker() as session:
+        decisions, valid_until = await evaluate_org_features_until_async(
+            session, org_id, ["customer_push_ingest"]
+        )
+    assert decisions["customer_push_ingest"].allowed is True
+    assert valid_until == expires_at
+
+
+@pytest.mark.asyncio
+async def test_license_expiry_bounds_the_snapshot(db):
+    maker, _ = db
+    org_id = await _seed_org(maker)
+    license_expiry = datetime.now(UTC) + timedelta(minutes=10)
+    async with maker() as session:
+        session.add(
+            OrgLicense(
+                org_id=org_id,
+                tier="team",
+                license_type="saas",
+                expires_at=license_expiry,
+            )
+        )
+        await session.commit()
+
+    async with maker() as session:
+        snapshot, valid_until = await gating._load_org_entitlement_snapshot(
+            org_id, session
+        )
+
+    assert snapshot.is_licensed is True
+    assert valid_until == license_expiry
+
+
+def test_earliest_expiry_takes_the_next_future_instant():
+    now = datetime.now(UTC)
+    override_expiry = now + timedelta(minutes=30)
+    trial_end = now + timedelta(minutes=3)
+
+    assert gating._earliest_expiry(override_expiry, None, trial_end) == trial_end
+    # Naive timestamps (SQLite) are UTC; past ones never bound the snapshot.
+    assert (
+        gating._earliest_expiry(
+            None, now - timedelta(days=1), trial_end.replace(tzinfo=None)
+        )
+        == trial_end
+    )
+    assert gating._earliest_expiry(None, now - timedelta(days=1), None) is None
+    # A past valid_until (storage error) still prevents caching.
+    assert gating._earliest_expiry(now, trial_end) == now
+
+
+@pytest.mark.asyncio
+async def test_snapshot_past_its_validity_is_not_cached(db, monkeypatch):
+    monkeypatch.setenv(ENTITLEMENT_CACHE_ENABLED_ENV, "true")
+    org_id = uuid.uuid4()
+    snapshot = cache.OrgEntitlementSnapshot(
+        tier="community", tier_source="none", raw_tier=None, features={}, limits={}
+    )
+    loads = []
+
+    async def _load():
+        loads.append(1)
+        return snapshot, datetime.now(UTC) - timedelta(seconds=1)
+
+    await cached_org_entitlements(org_id, _load)
+    await cached_org_entitlements(org_id, _load)
+
+    assert len(loads) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("license_tier", "org_tier", "override", "expected"),
+    [
+        ("enterprise", "community", None, True),
+        ("community", "community", None, False),
+        ("community", "community", {"work_graph": True}, True),
+        ("not-a-tier", "community", {"work_graph": True}, False),
+        (None, "enterprise", None, True),
+        (None, "bogus", None, False),
+    ],
+)
+async def test_cached_feature_check_matches_the_uncached_check(
+    db, monkeypatch, license_tier, org_tier, override, expected
+):
+    maker, _ = db
+    org_id = await _seed_org(maker, tier=org_tier)
+    if license_tier is not None:
+        async with maker() as session:
+            session.add(
+                OrgLicense(
+                    org_id=org_id,
+                    tier=license_tier,
+                    license_type="saas",
+                    features_override=override,
+                )
+            )
+            await session.commit()
+
+    async with maker() as session:
+        kwargs = {"session": session, "org_id": str(org_id)}
+        uncached = await gating._check_org_feature_async("work_graph", kwargs)
+        monkeypatch.setenv(ENTITLEMENT_CACHE_ENABLED_ENV, "true")
+        cached = await gating._check_org_feature_async("work_graph", kwargs)
+
+    assert uncached is expected
+    assert cached is expected
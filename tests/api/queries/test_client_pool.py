@@ -0,0 +1,182 @@
+"""Pooled ClickHouse clients for ``query_dicts`` worker threads."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from dev_health_ops.api.queries.client_pool import (
+    ClickHousePool,
+    ClickHousePoolTimeout,
+)
+
+DSN = "clickhouse://localhost:8123/default"
+
+
+class _FakeClient:
+    def __init__(self, key: tuple[str, dict[str, int]]) -> None:
+        self.key = key
+        self.closed = False
+        self.healthy = True
+        self.pings = 0
+
+    def ping(self) -> bool:
+        self.pings += 1
+        return self.healthy
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pool(clock: _Clock, **kwargs: Any) -> tuple[ClickHousePool, list[_FakeClient]]:
+    created: list[_FakeClient] = []
+
+    def factory(dsn: str, settings: dict[str, int]) -> _FakeClient:
+        client = _FakeClient((dsn, settings))
+        created.append(client)
+        return client
+
+    options: dict[str, Any] = {
+        "max_size": 4,
+        "idle_timeout": 300.0,
+        "max_lifetime": 1800.0,
+        "health_check_after": 30.0,
+        **kwargs,
+    }
+    return ClickHousePool(factory=factory, clock=clock, **options), created
+
+
+def test_returned_client_is_reused_per_key() -> None:
+    clock = _Clock()
+    pool, created = _pool(clock)
+
+    with pool.checkout(DSN, {"max_query_size": 1}) as first:
+        pass
+    with pool.checkout(DSN, {"max_query_size": 1}) as second:
+        pass
+    with pool.checkout(DSN, {"max_query_size": 2}) as other:
+        pass
+
+    assert second is first
+    assert other is not first
+    assert len(created) == 2
+    assert pool.idle_count() == 2
+
+
+def test_concurrent_checkouts_never_share_a_client() -> None:
+    clock = _Clock()
+    pool, created = _pool(clock)
+
+    with pool.checkout(DSN) as a, pool.checkout(DSN) as b:
+        assert a is not b
+    assert len(created) == 2
+
+
+def test_failed_query_discards_the_client() -> None:
+    clock = _Clock()
+    pool, created = _pool(clock)
+
+    with pytest.raises(RuntimeError):
+        with pool.checkout(DSN):
+            raise RuntimeError("session broken")
+
+    assert created[0].closed
+    assert pool.idle_count() == 0
+
+
+def test_idle_health_check_and_lifetime_recycling() -> None:
+    clock = _Clock()
+    pool, created = _pool(clock)
+
+    with pool.checkout(DSN):
+        pass
+    # Recently returned clients are reused without a ping.
+    clock.now = 10.0
+    with pool.checkout(DSN):
+        pass
+    assert created[0].pings == 0
+
+    # After the health-check threshold an unhealthy client is replaced.
+    clock.now = 60.0
+    created[0].healthy = False
+    with pool.checkout(DSN) as client:
+        assert client is created[1]
+    assert created[0].closed and created[0].pings == 1
+
+    # Idle past the timeout: closed on the next checkout without a ping.
+    clock.now = 400.0
+    with pool.checkout(DSN) as client:
+        assert client is created[2]
+    assert created[1].closed and created[1].pings == 0
+
+    # Past max lifetime: recycled even when recently used.
+    for step in range(1, 13):
+        clock.now = 400.0 + step * 150.0
+        with pool.checkout(DSN):
+            pass
+    assert created[2].closed
+    assert not created[-1].closed
+
+
+def test_periodic_sweep_closes_surplus_idle_clients() -> None:
+    clock = _Clock()
+    pool, created = _pool(clock)
+
+    with pool.checkout(DSN), pool.checkout(DSN), pool.checkout(DSN):
+        pass
+    assert pool.idle_count() == 3
+
+    clock.now = 301.0
+    assert pool.evict_idle() == 3
+    assert all(c.closed for c in created)
+
+
+def test_checkout_is_bounded_by_max_size() -> None:
+    clock = _Clock()
+    pool, _ = _pool(clock, max_size=1, checkout_timeout=0.05)
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with pool.checkout(DSN):
+            held.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=hold)
+    worker.start()
+    try:
+        assert held.wait(5)
+        with pytest.raises(ClickHousePoolTimeout):
+            with pool.checkout(DSN):
+                pass
+    finally:
+        release.set()
+        worker.join()
+
+    with pool.checkout(DSN):
+        pass
+
+
+def test_close_releases_idle_and_late_returns() -> None:
+    clock = _Clock()
+    pool, created = _pool(clock)
+
+    with pool.checkout(DSN):
+        pass
+    with pool.checkout(DSN) as in_flight:
+        with pool.checkout(DSN):
+            pass
+        pool.close()
+        assert created[1].closed
+    assert in_flight.closed
+    assert pool.idle_count() == 0
@@ -0,0 +1,253 @@
+"""Tests for the authenticated-principal / org-membership cache.
+
+The local tier is exercised directly; the shared tier runs against fakeredis
+so an invalidation issued by one replica can be observed by another.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import time
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from dev_health_ops.api.services import auth_cache as cache
+from dev_health_ops.api.services.auth import AuthenticatedUser
+from dev_health_ops.api.services.auth_cache import (
+    AUTH_CACHE_ENABLED_ENV,
+    cached_membership,
+    cached_principal,
+    invalidate_user,
+    invalidate_user_on_commit,
+)
+from dev_health_ops.core.generation_cache import LocalTier
+from dev_health_ops.models.git import Base
+from dev_health_ops.models.users import Membership, Organization, User
+
+
+def _token(user_id: str, *, exp: float | None = None) -> str:
+    claims = {"sub": user_id, "exp": exp or time.time() + 900}
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+def _user(user_id: str) -> AuthenticatedUser:
+    return AuthenticatedUser(
+        user_id=user_id,
+        email="dev@example.com",
+        org_id=str(uuid.uuid4()),
+        role="member",
+        is_superuser_verified=True,
+    )
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    monkeypatch.setenv(AUTH_CACHE_ENABLED_ENV, "true")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    monkeypatch.setattr(cache._cache, "local", LocalTier(16))
+    monkeypatch.setattr(cache._cache, "client", None)
+    monkeypatch.setattr(cache._cache, "circuit_open_until", 0.0)
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'auth-cache.db'}")
+    Base.metadata.create_all(
+        engine,
+        tables=[User.__table__, Organization.__table__, Membership.__table__],
+    )
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_principal_is_served_from_cache_until_invalidated():
+    user_id = str(uuid.uuid4())
+    token = _token(user_id)
+    loader = AsyncMock(return_value=_user(user_id))
+
+    first = await cached_principal(token, loader)
+    second = await cached_principal(token, loader)
+
+    assert first == second
+    assert second is not first
+    loader.assert_awaited_once()
+
+    await invalidate_user(user_id, reason="logout")
+    await cached_principal(token, loader)
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_loads(monkeypatch):
+    monkeypatch.delenv(AUTH_CACHE_ENABLED_ENV)
+    user_id = str(uuid.uuid4())
+    loader = AsyncMock(return_value=_user(user_id))
+
+    await cached_principal(_token(user_id), loader)
+    await cached_principal(_token(user_id), loader)
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rejections_and_mismatched_subjects_are_not_cached():
+    user_id = str(uuid.uuid4())
+    rejected = AsyncMock(return_value=None)
+    await cached_principal(_token(user_id), rejected)
+    await cached_principal(_token(user_id), rejected)
+    assert rejected.await_count == 2
+
+    # A token whose unverified subject disagrees with the validated user is
+    # never written under that subject.
+    other = AsyncMock(return_value=_user(str(uuid.uuid4())))
+    await cached_principal(_token(user_id), other)
+    await cached_principal(_token(user_id), other)
+    assert other.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entry_never_outlives_the_token():
+    user_id = str(uuid.uuid4())
+    token = _token(user_id, exp=time.time() - 1)
+    loader = AsyncMock(return_value=_user(user_id))
+
+    await cached_principal(token, loader)
+    await cached_principal(token, loader)
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_is_not_overwritten():
+    user_id = str(uuid.uuid4())
+    token = _token(user_id)
+
+    async def _racing_load():
+        # Deactivation commits while this request is reading Postgres.
+        await invalidate_user(user_id, reason="user")
+        return _user(user_id)
+
+    await cached_principal(token, _racing_load)
+    loader = AsyncMock(return_value=None)
+    assert await cached_principal(token, loader) is None
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_committed_orm_changes_invalidate_principals_and_memberships(
+    db_engine,
+):
+    with Session(db_engine) as session:
+        user = User(email="dev@example.com")
+        org = Organization(slug="acme", name="Acme")
+        session.add_all([user, org])
+        session.commit()
+        user_id, org_id = str(user.id), str(org.id)
+
+    token = _token(user_id)
+    principal_loader = AsyncMock(return_value=_user(user_id))
+    member_loader = AsyncMock(return_value=False)
+    await cached_principal(token, principal_loader)
+    assert await cached_membership(user_id, org_id, member_loader) is False
+
+    with Session(db_engine) as session:
+        session.add(Membership(user_id=uuid.UUID(user_id), org_id=uuid.UUID(org_id)))
+        session.commit()
+
+    member_loader.return_value = True
+    assert await cached_membership(user_id, org_id, member_loader) is True
+    assert member_loader.await_count == 2
+    # Generations are per user, so the principal was dropped as well.
+    await cached_principal(token, principal_loader)
+    assert principal_loader.await_count == 2
+
+    # Untracked columns and rolled-back changes leave entries alone.
+    with Session(db_engine) as session:
+        db_user = session.get(User, uuid.UUID(user_id))
+        db_user.full_name = "Dev"
+        session.commit()
+        db_user.token_version = 7
+        session.flush()
+        session.rollback()
+    await cached_principal(token, principal_loader)
+    assert principal_loader.await_count == 2
+
+    with Session(db_engine) as session:
+        session.get(User, uuid.UUID(user_id)).is_active = False
+        session.commit()
+    await cached_principal(token, principal_loader)
+    assert principal_loader.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_statement_invalidation_waits_for_commit(db_engine):
+    user_id = str(uuid.uuid4())
+    token = _token(user_id)
+    loader = AsyncMock(return_value=_user(user_id))
+    await cached_principal(token, loader)
+
+    with Session(db_engine) as session:
+        invalidate_user_on_commit(session, user_id, reason="revoke_all")
+        session.rollback()
+    await cached_principal(token, loader)
+    loader.assert_awaited_once()
+
+    with Session(db_engine) as session:
+        invalidate_user_on_commit(session, user_id, reason="revoke_all")
+        session.commit()
+    await cached_principal(token, loader)
+    assert loader.await_count == 2
+
+
+@pytest.fixture
+def shared_tier(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    monkeypatch.setenv("REDIS_URL", "redis://auth-cache-test")
+    monkeypatch.setattr(
+        cache._cache, "client", fakeredis.FakeAsyncValkey(server=server)
+    )
+    return server
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_serves_other_replicas_and_sees_their_invalidations(
+    shared_tier, monkeypatch
+):
+    user_id = str(uuid.uuid4())
+    token = _token(user_id)
+    loader = AsyncMock(return_value=_user(user_id))
+    await cached_principal(token, loader)
+
+    # A second replica: empty local tier, same Valkey.
+    monkeypatch.setattr(cache._cache, "local", LocalTier(16))
+    assert (await cached_principal(token, loader)).user_id == user_id
+    loader.assert_awaited_once()
+
+    # The first replica logs the user out; the second must miss.
+    await cache._cache.bump_shared([user_id])
+    await cached_principal(token, loader)
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_outage_bypasses_the_cache(shared_tier, monkeypatch):
+    user_id = str(uuid.uuid4())
+    token = _token(user_id)
+    loader = AsyncMock(return_value=_user(user_id))
+    await cached_principal(token, loader)
+
+    monkeypatch.setattr(cache._cache, "circuit_open_until", time.monotonic() + 60)
+    await cached_principal(token, loader)
+    await cached_principal(token, loader)
+
+    assert loader.await_count == 3
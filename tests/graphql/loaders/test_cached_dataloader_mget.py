@@ -79,3 +79,30 @@ async def test_falls_back_to_get_when_no_mget():
     out = await loader._load_with_cache(["a", "b"])
     assert cache.get_calls == 2
     assert out == ["v:a", "v:b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loaders_share_in_flight_keys_through_ttl_cache():
+    import asyncio
+
+    from dev_health_ops.core.cache import MemoryBackend, TTLCache
+
+    class _SlowLoader(_Loader):
+        async def batch_load(self, keys):
+            self.load_calls.append(list(keys))
+            await asyncio.sleep(0.01)
+            return [f"v:{k}" for k in keys]
+
+    cache = TTLCache(ttl_seconds=60, backend=MemoryBackend())
+    first, second = _SlowLoader(cache), _SlowLoader(cache)
+
+    out_a, out_b = await asyncio.gather(
+        first._load_with_cache(["k1", "k2"]),
+        second._load_with_cache(["k2", "k3"]),
+    )
+
+    assert out_a == ["v:k1", "v:k2"]
+    assert out_b == ["v:k2", "v:k3"]
+    assert first.load_calls == [["k1", "k2"]]
+    assert second.load_calls == [["k3"]]
+    assert cache.stats.coalesced == 1
@@ -20,8 +20,11 @@ from dev_health_ops.api.graphql.sql.compiler import (
     TimeseriesRequest,
     compile_breakdown,
     compile_catalog_values,
+    compile_fused_breakdown,
+    compile_fused_timeseries,
     compile_sankey,
     compile_timeseries,
+    fusion_key,
 )
 from dev_health_ops.api.graphql.sql.validate import (
     Dimension,
@@ -277,6 +280,99 @@ class TestCompileBreakdown:
         assert params["org_id"] == "different-org"
 
 
+class TestFusedCompilation:
+    """Tests for compiling several measures into one scan."""
+
+    def _timeseries(self, measure: str, **overrides) -> TimeseriesRequest:
+        fields = {
+            "dimension": "team",
+            "measure": measure,
+            "interval": "week",
+            "start_date": date(2025, 1, 1),
+            "end_date": date(2025, 3, 31),
+        }
+        fields.update(overrides)
+        return TimeseriesRequest(**fields)
+
+    def test_fusion_key_separates_incompatible_requests(self):
+        base = fusion_key(self._timeseries("count"))
+
+        assert fusion_key(self._timeseries("churn_loc")) == base
+        assert fusion_key(self._timeseries("count", dimension="repo")) != base
+        assert fusion_key(self._timeseries("count", interval="day")) != base
+        assert fusion_key(self._timeseries("count", end_date=date(2025, 2, 1))) != base
+        assert fusion_key(self._timeseries("pr_rework_ratio")) != base
+
+    def test_fused_timeseries_computes_each_measure_once(self):
+        sql, params, columns = compile_fused_timeseries(
+            [
+                self._timeseries("count"),
+                self._timeseries("churn_loc"),
+                self._timeseries("count"),
+            ],
+            org_id="org1",
+        )
+
+        assert columns == {"count": "value_0", "churn_loc": "value_1"}
+        assert "SUM(work_items_completed) AS value_0" in sql
+        assert "SUM(churn_loc) AS value_1" in sql
+        assert sql.count("AS value_") == 2
+        assert "date_trunc('week', day) AS bucket" in sql
+        assert "argMax(delivery_units, computed_at)" in sql
+        assert params["org_id"] == "org1"
+
+    def test_fused_breakdown_dedups_testops_measures(self):
+        requests = [
+            BreakdownRequest(
+                dimension="repo",
+                measure=measure,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 31),
+                top_n=top_n,
+            )
+            for measure, top_n in (("pr_rework_ratio", 5), ("pr_rework_ratio", 10))
+        ]
+
+        sql, params, columns = compile_fused_breakdown(requests, org_id="org1")
+
+        assert columns == {"pr_rework_ratio": "value_0"}
+        assert "FROM repo_metrics_daily" in sql
+        assert "LIMIT 1 BY org_id, repo_id, day" in sql
+        assert "ARRAY JOIN range(1) AS measure_index" in sql
+        assert params["top_n"] == 10
+
+    def test_fused_breakdown_limits_each_measure(self):
+        requests = [
+            BreakdownRequest(
+                dimension="repo",
+                measure=measure,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 31),
+                top_n=top_n,
+            )
+            for measure, top_n in (("count", 3), ("churn_loc", 7))
+        ]
+
+        sql, params, columns = compile_fused_breakdown(requests, org_id="org1")
+
+        assert columns == {"count": "value_0", "churn_loc": "value_1"}
+        assert "ARRAY JOIN range(2) AS measure_index" in sql
+        assert (
+            "ORDER BY measure_index, "
+            "[toFloat64(value_0), toFloat64(value_1)][measure_index + 1] DESC"
+        ) in sql
+        assert "LIMIT %(top_n)s BY measure_index" in sql
+        assert params["top_n"] == 7
+        assert params["org_id"] == "org1"
+
+    def test_mismatched_requests_are_rejected(self):
+        with pytest.raises(ValueError):
+            compile_fused_timeseries(
+                [self._timeseries("count"), self._timeseries("count", interval="day")],
+                org_id="org1",
+            )
+
+
 class TestCompileSankey:
     """Tests for compile_sankey."""
 
@@ -519,3 +519,140 @@ class TestResolveAnalytics:
         )
         assert recorded == []
         assert len(result.items) == 1
+
+
+class TestAnalyticsQueryFusion:
+    """Compatible sub-requests share one scan and split back per request."""
+
+    @staticmethod
+    def _range() -> DateRangeInput:
+        return DateRangeInput(start_date=date(2025, 1, 1), end_date=date(2025, 1, 31))
+
+    @pytest.mark.asyncio
+    async def test_timeseries_measures_share_one_query(self, monkeypatch):
+        from dev_health_ops.api.graphql.models.inputs import (
+            BucketIntervalInput,
+            TimeseriesRequestInput,
+        )
+
+        captured: list[str] = []
+
+        async def fake_query_dicts(_client, sql, _params):
+            captured.append(sql)
+            if "value_1" not in sql:
+                return [
+                    {"dimension_value": "r", "bucket": date(2025, 1, 6), "value": 1}
+                ]
+            return [
+                {
+                    "dimension_value": "a",
+                    "bucket": date(2025, 1, 6),
+                    "value_0": 1,
+                    "value_1": 9,
+                },
+                {
+                    "dimension_value": "b",
+                    "bucket": date(2025, 1, 6),
+                    "value_0": 3,
+                    "value_1": None,
+                },
+                {
+                    "dimension_value": "a",
+                    "bucket": date(2024, 12, 30),
+                    "value_0": 2,
+                    "value_1": 4,
+                },
+            ]
+
+        monkeypatch.setattr(
+            "dev_health_ops.api.queries.client.query_dicts", fake_query_dicts
+        )
+
+        def _ts(dimension, measure):
+            return TimeseriesRequestInput(
+                dimension=dimension,
+                measure=measure,
+                interval=BucketIntervalInput.WEEK,
+                date_range=self._range(),
+            )
+
+        result = await resolve_analytics(
+            GraphQLContext(org_id="org-1", db_url="clickhouse://test", client=object()),
+            AnalyticsRequestInput(
+                timeseries=[
+                    _ts(DimensionInput.TEAM, MeasureInput.COUNT),
+                    _ts(DimensionInput.REPO, MeasureInput.COUNT),
+                    _ts(DimensionInput.TEAM, MeasureInput.CHURN_LOC),
+                ],
+                breakdowns=[],
+            ),
+        )
+
+        assert len(captured) == 2
+        by_measure = [
+            (series.measure, series.dimension_value, [b.value for b in series.buckets])
+            for series in result.timeseries
+        ]
+        assert by_measure == [
+            ("COUNT", "a", [2.0, 1.0]),
+            ("COUNT", "b", [3.0]),
+            ("COUNT", "r", [1.0]),
+            ("CHURN_LOC", "a", [4.0, 9.0]),
+            ("CHURN_LOC", "b", [0.0]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_breakdowns_keep_their_own_top_n(self, monkeypatch):
+        from dev_health_ops.api.graphql.models.inputs import BreakdownRequestInput
+
+        captured: list[tuple[str, dict]] = []
+        grouped = [
+            {"dimension_value": "alpha", "value_0": 1, "value_1": 30},
+            {"dimension_value": "beta", "value_0": 5, "value_1": 10},
+            {"dimension_value": "gamma", "value_0": 3, "value_1": 20},
+        ]
+
+        async def fake_query_dicts(_client, sql, params):
+            captured.append((sql, params))
+            # Mimic ARRAY JOIN + LIMIT n BY measure_index over the grouped rows.
+            return [
+                {"measure_index": index, **row}
+                for index in range(2)
+                for row in sorted(grouped, key=lambda row: -row[f"value_{index}"])[
+                    : params["top_n"]
+                ]
+            ]
+
+        monkeypatch.setattr(
+            "dev_health_ops.api.queries.client.query_dicts", fake_query_dicts
+        )
+
+        result = await resolve_analytics(
+            GraphQLContext(org_id="org-1", db_url="clickhouse://test", client=object()),
+            AnalyticsRequestInput(
+                timeseries=[],
+                breakdowns=[
+                    BreakdownRequestInput(
+                        dimension=DimensionInput.THEME,
+                        measure=MeasureInput.COUNT,
+                        date_range=self._range(),
+                        top_n=2,
+                    ),
+                    BreakdownRequestInput(
+                        dimension=DimensionInput.THEME,
+                        measure=MeasureInput.CHURN_LOC,
+                        date_range=self._range(),
+                        top_n=1,
+                    ),
+                ],
+            ),
+        )
+
+        assert len(captured) == 1
+        sql, params = captured[0]
+        assert "LIMIT %(top_n)s BY measure_index" in sql
+        assert params["top_n"] == 2
+        assert [
+            [(item.key, item.value) for item in breakdown.items]
+            for breakdown in result.breakdowns
+        ] == [[("beta", 5.0), ("gamma", 3.0)], [("alpha", 30.0)]]
@@ -0,0 +1,207 @@
+"""Every ClickHouse call is fingerprinted, tagged with its caller and measured."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import strawberry
+
+from dev_health_ops.api.graphql.extensions import ClickHouseCallerExtension
+from dev_health_ops.metrics import clickhouse_instrumentation as instrumentation
+from dev_health_ops.metrics.clickhouse_instrumentation import (
+    InstrumentedClickHouseClient,
+    clickhouse_caller,
+    current_clickhouse_caller,
+    instrument_clickhouse_client,
+    normalize_query,
+    query_fingerprint,
+)
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    calls: list[dict] = []
+    monkeypatch.setattr(
+        instrumentation,
+        "record_clickhouse_query_cost",
+        lambda **kwargs: calls.append(kwargs),
+    )
+    return calls
+
+
+def _client(**attrs) -> MagicMock:
+    client = MagicMock()
+    client.server_settings = {}
+    for name, value in attrs.items():
+        setattr(client, name, value)
+    return client
+
+
+def test_queries_differing_only_in_literals_share_a_fingerprint():
+    first = "SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'a' -- note"
+    second = "select *  from t\nwhere id in (42) and name = 'it''s'"
+
+    assert normalize_query(first) == "select * from t where id in (?) and name = ?"
+    assert query_fingerprint(first) == query_fingerprint(second)
+    assert query_fingerprint(first) != query_fingerprint("SELECT * FROM u")
+    # Server-side placeholders are part of the shape, not literals.
+    assert "{org_id:string}" in normalize_query("WHERE org_id = {org_id:String}")
+
+
+def test_query_is_tagged_with_caller_and_fingerprint(recorded):
+    result = SimpleNamespace(
+        row_count=3,
+        summary={"read_rows": "120", "read_bytes": "4096"},
+    )
+    raw = _client(query=MagicMock(return_value=result))
+    client = instrument_clickhouse_client(raw, component="api")
+
+    with clickhouse_caller("task:metrics.daily"), clickhouse_caller("read"):
+        assert client.query("SELECT 1", parameters={"a": 1}) is result
+
+    _, kwargs = raw.query.call_args
+    assert kwargs["parameters"] == {"a": 1}
+    settings = kwargs["settings"]
+    fingerprint = query_fingerprint("SELECT 1")
+    assert settings["query_id"].startswith(f"dho-{fingerprint}-")
+    assert json.loads(settings["log_comment"]) == {
+        "source": "dev-health-ops",
+        "caller": "task:metrics.daily/read",
+        "component": "api",
+        "fingerprint": fingerprint,
+    }
+    [cost] = recorded
+    assert cost["caller"] == "task:metrics.daily/read"
+    assert cost["query_type"] == "select"
+    assert (cost["result_rows"], cost["read_rows"], cost["read_bytes"]) == (
+        3,
+        120,
+        4096,
+    )
+    assert current_clickhouse_caller() == "unknown"
+
+
+def test_insert_records_written_rows_and_keeps_caller_settings(recorded):
+    summary = SimpleNamespace(summary={"written_rows": "2", "written_bytes": "64"})
+    raw = _client(insert=MagicMock(return_value=summary))
+    client = InstrumentedClickHouseClient(raw, component="store")
+
+    client.insert(
+        "teams",
+        [[1], [2]],
+        column_names=["id"],
+        settings={"async_insert": 1, "query_id": "mine"},
+    )
+
+    args, kwargs = raw.insert.call_args
+    assert args == ("teams", [[1], [2]])
+    assert kwargs["column_names"] == ["id"]
+    assert kwargs["settings"]["async_insert"] == 1
+    assert kwargs["settings"]["query_id"] == "mine"
+    assert json.loads(kwargs["settings"]["log_comment"])["fingerprint"] == (
+        query_fingerprint("INSERT INTO teams (id)")
+    )
+    assert recorded[0]["query_type"] == "insert"
+    assert recorded[0]["written_rows"] == 2
+
+
+def test_positional_settings_are_tagged_in_place(recorded):
+    raw = _client()
+    client = InstrumentedClickHouseClient(raw, component="store")
+
+    client.command("OPTIMIZE TABLE t", None, None, {"mutations_sync": 1})
+
+    args, kwargs = raw.command.call_args
+    assert "settings" not in kwargs
+    assert args[3]["mutations_sync"] == 1
+    assert args[3]["query_id"].startswith("dho-")
+
+
+def test_failed_queries_are_still_measured(recorded):
+    raw = _client(query=MagicMock(side_effect=RuntimeError("boom")))
+    client = InstrumentedClickHouseClient(raw, component="api")
+
+    with pytest.raises(RuntimeError):
+        client.query("SELECT 1")
+
+    assert recorded[0]["caller"] == "unknown"
+    assert "read_rows" not in recorded[0]
+
+
+def test_readonly_profiles_are_not_sent_log_comment(recorded):
+    raw = _client(server_settings={"log_comment": SimpleNamespace(readonly=1)})
+    client = InstrumentedClickHouseClient(raw, component="api")
+
+    client.query("SELECT 1")
+
+    settings = raw.query.call_args.kwargs["settings"]
+    assert "log_comment" not in settings
+    assert settings["query_id"].startswith("dho-")
+
+
+def test_instrumenting_is_idempotent_and_delegates_other_calls():
+    raw = _client()
+    client = instrument_clickhouse_client(raw, component="api")
+
+    assert instrument_clickhouse_client(client, component="store") is client
+    assert client.wrapped is raw
+    client.ping()
+    raw.ping.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_caller_follows_queries_onto_worker_threads(recorded):
+    raw = _client()
+    client = InstrumentedClickHouseClient(raw, component="api")
+
+    with clickhouse_caller("daily_metrics.read"):
+        await asyncio.gather(
+            asyncio.to_thread(client.query, "SELECT 1"),
+            asyncio.to_thread(client.query, "SELECT 2"),
+        )
+
+    assert {cost["caller"] for cost in recorded} == {"daily_metrics.read"}
+
+
+_seen_callers: list[str] = []
+
+
+@strawberry.type
+class _Child:
+    @strawberry.field
+    async def value(self) -> str:
+        _seen_callers.append(current_clickhouse_caller())
+        return "x"
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    async def dashboard(self) -> _Child:
+        await asyncio.sleep(0)
+        _seen_callers.append(current_clickhouse_caller())
+        return _Child()
+
+    @strawberry.field
+    def ping(self) -> str:
+        _seen_callers.append(current_clickhouse_caller())
+        return "pong"
+
+
+@pytest.mark.asyncio
+async def test_graphql_root_fields_open_a_caller_scope():
+    _seen_callers.clear()
+    schema = strawberry.Schema(query=_Query, extensions=[ClickHouseCallerExtension])
+    result = await schema.execute("{ dashboard { value } ping }")
+
+    assert result.errors is None
+    assert sorted(_seen_callers) == [
+        "graphql:Query.dashboard",
+        "graphql:Query.dashboard",
+        "graphql:Query.ping",
+    ]
+    assert current_clickhouse_caller() == "unknown"
@@ -0,0 +1,171 @@
+"""Columnar commit-stat window rollups must match the list-based helpers."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from dev_health_ops.metrics.commit_window import CommitStatWindow
+from dev_health_ops.metrics.hotspots import (
+    compute_file_churn_by_repo,
+    compute_file_hotspots,
+    compute_file_hotspots_by_repo,
+    compute_file_risk_hotspots,
+    compute_file_risk_hotspots_from_churn,
+)
+from dev_health_ops.metrics.knowledge import (
+    compute_bus_factor,
+    compute_bus_factor_by_repo,
+    compute_code_ownership_gini,
+    compute_code_ownership_gini_by_repo,
+)
+from dev_health_ops.metrics.quality import (
+    compute_rework_churn_ratio,
+    compute_rework_churn_ratio_by_repo,
+    compute_single_owner_file_ratio,
+    compute_single_owner_file_ratio_by_repo,
+)
+from dev_health_ops.metrics.schemas import CommitStatRow
+from dev_health_ops.utils import AGGREGATE_STATS_MARKER
+
+DAY = date(2026, 3, 31)
+NOW = datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+
+def _random_rows(seed: int, day: date, count: int) -> list[CommitStatRow]:
+    rng = random.Random(seed)
+    repos = [uuid.UUID(int=i + 1) for i in range(4)]
+    paths = [None, "", AGGREGATE_STATS_MARKER] + [f"src/f{i}.py" for i in range(12)]
+    authors = [
+        ("a@ex.com", "A"),
+        (None, "B"),
+        ("", " C "),
+        (None, None),
+        (" d@ex.com ", "D"),
+    ]
+    rows: list[CommitStatRow] = []
+    for _ in range(count):
+        email, name = rng.choice(authors)
+        rows.append(
+            {
+                "repo_id": rng.choice(repos),
+                "commit_hash": f"c{rng.randrange(40)}",
+                "author_email": email,
+                "author_name": name,
+                "committer_when": datetime.combine(
+                    day, datetime.min.time(), tzinfo=timezone.utc
+                ),
+                "file_path": rng.choice(paths),
+                "additions": rng.choice([0, 1, 5, 40, -3]),
+                "deletions": rng.choice([0, 2, 9]),
+            }
+        )
+    return rows
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_window_rollups_match_list_helpers(seed: int) -> None:
+    rows = _random_rows(seed, DAY, 400)
+    window = CommitStatWindow.from_rows(rows)
+    repos = {r["repo_id"] for r in rows}
+
+    rework = compute_rework_churn_ratio_by_repo(window)
+    single_owner = compute_single_owner_file_ratio_by_repo(window)
+    bus_factor = compute_bus_factor_by_repo(window)
+    gini = compute_code_ownership_gini_by_repo(window)
+    hotspots = compute_file_hotspots_by_repo(window=window, day=DAY, computed_at=NOW)
+    churn = compute_file_churn_by_repo(window)
+
+    for repo_id in repos:
+        assert rework.get(repo_id, 0.0) == compute_rework_churn_ratio(
+            repo_id=str(repo_id), window_stats=rows
+        )
+        assert single_owner.get(repo_id, 0.0) == compute_single_owner_file_ratio(
+            repo_id=str(repo_id), window_stats=rows
+        )
+        assert bus_factor[repo_id] == compute_bus_factor(str(repo_id), rows)
+        assert gini[repo_id] == compute_code_ownership_gini(str(repo_id), rows)
+        assert hotspots.get(repo_id, []) == compute_file_hotspots(
+            repo_id=repo_id, day=DAY, window_stats=rows, computed_at=NOW
+        )
+
+        from_rows = compute_file_risk_hotspots(
+            repo_id=repo_id,
+            day=DAY,
+            window_stats=rows,
+            complexity_map={},
+            computed_at=NOW,
+        )
+        from_window = compute_file_risk_hotspots_from_churn(
+            repo_id=repo_id,
+            day=DAY,
+            churn_map=churn.get(repo_id, {}),
+            complexity_map={},
+            computed_at=NOW,
+        )
+        assert sorted(from_rows, key=lambda r: r.file_path) == sorted(
+            from_window, key=lambda r: r.file_path
+        )
+
+
+def test_sliding_window_matches_rebuilt_window() -> None:
+    days = [DAY - timedelta(days=i) for i in range(6, -1, -1)]
+    rows_by_day = {d: _random_rows(i, d, 60) for i, d in enumerate(days)}
+
+    sliding = CommitStatWindow()
+    for d in days:
+        sliding.evict_before(d - timedelta(days=2))
+        sliding.add_day(d, rows_by_day[d])
+
+    assert sliding.days == days[-3:]
+    expected_rows = [row for d in days[-3:] for row in rows_by_day[d]]
+    rebuilt = CommitStatWindow.from_rows(expected_rows)
+    assert len(sliding) == len(expected_rows)
+
+    assert compute_file_hotspots_by_repo(
+        window=sliding, day=DAY, computed_at=NOW
+    ) == compute_file_hotspots_by_repo(window=rebuilt, day=DAY, computed_at=NOW)
+    assert compute_bus_factor_by_repo(sliding) == compute_bus_factor_by_repo(rebuilt)
+    assert compute_rework_churn_ratio_by_repo(
+        sliding
+    ) == compute_rework_churn_ratio_by_repo(rebuilt)
+
+
+def test_sliding_window_forgets_values_of_evicted_days() -> None:
+    days = [DAY - timedelta(days=i) for i in range(9, -1, -1)]
+    window = CommitStatWindow()
+    for i, d in enumerate(days):
+        window.evict_before(d - timedelta(days=2))
+        rows = _random_rows(i, d, 40)
+        for row in rows:
+            row["commit_hash"] = f"{d.isoformat()}-{row['commit_hash']}"
+        window.add_day(d, rows)
+
+    cols = window.columns()
+    assert len(window._commits.values) == len(set(cols.commit.tolist()))
+    assert all(
+        value.startswith(tuple(str(d) for d in days[-3:]))
+        for value in (window._commits.values)
+    )
+    assert int(cols.commit.max()) < len(window._commits.values)
+    assert int(cols.repo.max()) < len(window._repos.values)
+
+
+def test_evicting_every_day_resets_the_window() -> None:
+    window = CommitStatWindow()
+    window.add_day(DAY, _random_rows(0, DAY, 20))
+    window.evict_before(DAY + timedelta(days=1))
+
+    assert len(window) == 0
+    assert window._commits.values == []
+    assert compute_bus_factor_by_repo(window) == {}
+
+
+def test_empty_window_yields_no_repos() -> None:
+    window = CommitStatWindow()
+    assert compute_bus_factor_by_repo(window) == {}
+    assert compute_single_owner_file_ratio_by_repo(window) == {}
+    assert compute_file_hotspots_by_repo(window=window, day=DAY, computed_at=NOW) == {}
@@ -1,15 +1,22 @@
+import random
 from datetime import date, datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from dev_health_ops.metrics.compute_capacity import (
+    CapacityForecastRequest,
     ForecastResult,
     ThroughputHistory,
     ThroughputSample,
+    _row_percentiles,
     compute_percentiles,
     forecast_capacity,
+    forecast_capacity_batch,
     monte_carlo_forecast_days,
+    monte_carlo_forecast_days_batch,
     monte_carlo_forecast_items,
+    monte_carlo_forecast_items_batch,
 )
 
 
@@ -143,6 +150,103 @@ class TestMonteCarloForecasts:
         assert all(i == 50 for i in items)
 
 
+def _reference_days(throughputs, target, simulations, max_days, seed):
+    """The original per-day ``random.choice`` simulation."""
+    rng = random.Random(seed)
+    days_list = []
+    for _ in range(simulations):
+        remaining, days = target, 0
+        while remaining > 0 and days < max_days:
+            remaining -= rng.choice(throughputs)
+            days += 1
+        days_list.append(days)
+    return days_list
+
+
+def _reference_items(throughputs, days_available, simulations, seed):
+    rng = random.Random(seed)
+    return [
+        sum(rng.choice(throughputs) for _ in range(days_available))
+        for _ in range(simulations)
+    ]
+
+
+class TestBatchedMonteCarlo:
+    def test_days_percentiles_match_reference(self):
+        throughputs = [0, 1, 2, 3, 8, 0, 4]
+        days, _ = monte_carlo_forecast_days(
+            throughputs, target_items=60, simulations=10000, seed=7
+        )
+        reference = _reference_days(throughputs, 60, 10000, 365, seed=7)
+
+        ours = compute_percentiles(days, [50, 85, 95])
+        expected = compute_percentiles(reference, [50, 85, 95])
+        for got, want in zip(ours, expected, strict=True):
+            assert abs(got - want) <= 1
+
+    def test_items_percentiles_match_reference(self):
+        throughputs = [0, 1, 2, 3, 8, 0, 4]
+        items = monte_carlo_forecast_items(
+            throughputs, days_available=30, simulations=10000, seed=7
+        )
+        reference = _reference_items(throughputs, 30, 10000, seed=7)
+
+        ours = compute_percentiles(items, [50, 15, 5])
+        expected = compute_percentiles(reference, [50, 15, 5])
+        for got, want in zip(ours, expected, strict=True):
+            assert abs(got - want) <= max(2, 0.03 * want)
+
+    def test_days_batch_keeps_teams_independent(self):
+        days, hit_max = monte_carlo_forecast_days_batch(
+            [[5] * 10, [0, 0], [1, 3]],
+            [50, 10, 0],
+            simulations=200,
+            max_days=30,
+            seed=1,
+        )
+
+        assert days.shape == (3, 200)
+        assert (days[0] == 10).all()
+        assert (days[1] == 30).all()
+        assert (days[2] == 0).all()
+        assert hit_max.tolist() == [False, True, False]
+
+    def test_days_batch_crosses_block_boundaries(self, monkeypatch):
+        monkeypatch.setattr(
+            "dev_health_ops.metrics.compute_capacity._DRAW_BLOCK_SAMPLES", 64
+        )
+        days, hit_max = monte_carlo_forecast_days_batch(
+            [[1], [2, 2]], [70, 9], simulations=16, seed=3
+        )
+
+        assert (days[0] == 70).all()
+        assert (days[1] == 5).all()
+        assert not hit_max.any()
+
+    def test_items_batch_respects_each_horizon(self, monkeypatch):
+        monkeypatch.setattr(
+            "dev_health_ops.metrics.compute_capacity._DRAW_BLOCK_SAMPLES", 64
+        )
+        items = monte_carlo_forecast_items_batch(
+            [[5], [2, 2], [7]], [10, 3, 0], simulations=16, seed=3
+        )
+
+        assert (items[0] == 50).all()
+        assert (items[1] == 6).all()
+        assert (items[2] == 0).all()
+
+    def test_batch_rejects_empty_history(self):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            monte_carlo_forecast_days_batch([[1], []], [5, 5])
+
+    def test_row_percentiles_match_compute_percentiles(self):
+        values = np.random.default_rng(0).integers(0, 50, size=(4, 101))
+        rows = _row_percentiles(values, [0, 5, 15, 50, 85, 95, 100])
+
+        for row, got in zip(values.tolist(), rows.tolist(), strict=True):
+            assert got == compute_percentiles(row, [0, 5, 15, 50, 85, 95, 100])
+
+
 class TestComputePercentiles:
     def test_empty_list(self):
         result = compute_percentiles([], [50, 85, 95])
@@ -284,6 +388,50 @@ class TestForecastCapacity:
         assert result.p85_items == 0
         assert result.p95_items == 0
 
+    def test_batch_preserves_request_order(self):
+        reference = date.today()
+        requests = [
+            CapacityForecastRequest(
+                history=ThroughputHistory(_make_samples([5] * 30)),
+                target_items=50,
+                team_id="team-a",
+            ),
+            CapacityForecastRequest(
+                history=ThroughputHistory(_make_samples([2] * 30)),
+                target_date=reference + timedelta(days=10),
+                team_id="team-b",
+            ),
+            CapacityForecastRequest(
+                history=ThroughputHistory(_make_samples([1] * 30)),
+                target_items=5,
+                target_date=reference - timedelta(days=1),
+                team_id="team-c",
+            ),
+        ]
+
+        results = forecast_capacity_batch(
+            requests, simulations=500, seed=42, today=reference
+        )
+
+        assert [r.team_id for r in results] == ["team-a", "team-b", "team-c"]
+        assert results[0].p50_days == 10
+        assert results[0].p50_items is None
+        assert results[1].p50_days is None
+        assert results[1].p95_items == 20
+        assert results[2].p85_days == 5
+        assert results[2].p50_items == 0
+        assert len({r.forecast_id for r in results}) == 3
+
+    def test_batch_validates_every_request(self):
+        history = ThroughputHistory(_make_samples([5] * 30))
+        with pytest.raises(ValueError, match="Must provide either"):
+            forecast_capacity_batch(
+                [
+                    CapacityForecastRequest(history=history, target_items=5),
+                    CapacityForecastRequest(history=history),
+                ]
+            )
+
 
 class TestForecastResultDataclass:
     def test_forecast_result_is_frozen(self):
@@ -0,0 +1,130 @@
+"""Day-level read concurrency for ``run_daily_metrics_job``.
+
+Pins the three parts of the concurrent read mode: a day's independent loader
+reads are awaited together, upcoming days are prefetched while the current
+day is consumed, and no more than ``max_inflight_days`` days are in flight.
+Sequential mode keeps the historical one-read-at-a-time behaviour.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+import dev_health_ops.connectors  # noqa: F401  # break providers<->connectors cycle
+from dev_health_ops.metrics import job_daily
+
+DAY = date(2026, 2, 10)
+
+
+class _TrackingLoader:
+    """Loader whose reads block briefly and record peak concurrency."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+
+    async def _read(self, name: str, result: Any) -> Any:
+        self.calls.append(name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return result
+
+    async def load_git_rows(self, *a: Any, **k: Any) -> Any:
+        return await self._read("git", ([], [], []))
+
+    async def load_cicd_data(self, *a: Any, **k: Any) -> Any:
+        return await self._read("cicd", ([], []))
+
+    async def load_testops_pipeline_data(self, *a: Any, **k: Any) -> Any:
+        return await self._read("testops_pipeline", ([], []))
+
+    async def load_testops_test_data(self, *a: Any, **k: Any) -> Any:
+        return await self._read("testops_test", ([], []))
+
+    async def load_testops_coverage_data(self, *a: Any, **k: Any) -> Any:
+        return await self._read("coverage", [])
+
+    async def load_incidents(self, *a: Any, **k: Any) -> Any:
+        return await self._read("incidents", [])
+
+    async def load_work_items(self, *a: Any, **k: Any) -> Any:
+        return await self._read("work_items", (["wi"], ["tr"]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrent, expected_peak", [(True, 8), (False, 1)])
+async def test_day_reads_fan_out_only_in_concurrent_mode(
+    concurrent: bool, expected_peak: int
+) -> None:
+    loader = _TrackingLoader()
+
+    inputs = await job_daily._load_day_inputs(
+        loader,
+        DAY,
+        repo_id=None,
+        repo_name=None,
+        load_work_items=True,
+        concurrent=concurrent,
+    )
+
+    assert loader.peak == expected_peak
+    assert inputs.work_items == ["wi"]
+    assert inputs.work_item_transitions == ["tr"]
+    assert inputs.ai_attribution_rows == []
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_read_pipeline_prefetches_a_bounded_window_of_days() -> None:
+    days = [DAY + timedelta(days=i) for i in range(5)]
+    started: list[date] = []
+    release = {d: asyncio.Event() for d in days}
+
+    async def load(d: date) -> Any:
+        started.append(d)
+        await release[d].wait()
+        return d
+
+    pipeline = job_daily._DayReadPipeline(days, load, max_inflight_days=3)
+    try:
+        first = asyncio.create_task(pipeline.get(days[0]))
+        await _settle()
+        # The current day plus two prefetched days, never the whole backfill.
+        assert started == days[:3]
+        release[days[0]].set()
+        assert await first == days[0]
+
+        release[days[1]].set()
+        assert await pipeline.get(days[1]) == days[1]
+        await _settle()
+        assert started == days[:4]
+    finally:
+        await pipeline.aclose()
+    # Unconsumed prefetches are cancelled rather than left pending.
+    assert not pipeline._tasks
+
+
+def test_resolve_read_concurrency_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DAILY_METRICS_CONCURRENT_READS", raising=False)
+    monkeypatch.delenv("DAILY_METRICS_MAX_INFLIGHT_DAYS", raising=False)
+    assert job_daily._resolve_read_concurrency(None, None) == (True, 2)
+
+    monkeypatch.setenv("DAILY_METRICS_MAX_INFLIGHT_DAYS", "4")
+    assert job_daily._resolve_read_concurrency(None, None) == (True, 4)
+
+    monkeypatch.setenv("DAILY_METRICS_CONCURRENT_READS", "false")
+    assert job_daily._resolve_read_concurrency(None, None) == (False, 1)
+
+    # Explicit arguments win over the environment.
+    assert job_daily._resolve_read_concurrency(True, 0) == (True, 1)
@@ -0,0 +1,162 @@
+"""Day-bucketed loader window cache for overlapping testops lookbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from dev_health_ops.metrics.loaders import DayWindowCache, WindowCachedTestOpsLoader
+
+DAY = date(2026, 1, 31)
+REPO = uuid.UUID(int=7)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+class _DayRowLoader:
+    """Returns one suite/case/coverage row per UTC day in the requested range."""
+
+    def __init__(self) -> None:
+        self.test_calls: list[tuple[datetime, datetime]] = []
+        self.coverage_calls: list[tuple[datetime, datetime]] = []
+
+    @staticmethod
+    def _days(start: datetime, end: datetime) -> list[date]:
+        first = start.date()
+        return [
+            first + timedelta(days=i)
+            for i in range((end.date() - first).days)
+            if _midnight(first + timedelta(days=i)) >= start
+        ]
+
+    async def load_testops_test_data(
+        self, start: datetime, end: datetime, repo_id: Any
+    ) -> tuple[list[Any], list[Any]]:
+        self.test_calls.append((start, end))
+        days = self._days(start, end)
+        return (
+            [{"suite_day": d, "repo_id": repo_id} for d in days],
+            [{"case_day": d} for d in days],
+        )
+
+    async def load_testops_coverage_data(
+        self, start: datetime, end: datetime, repo_id: Any
+    ) -> list[Any]:
+        self.coverage_calls.append((start, end))
+        return [{"coverage_day": d} for d in self._days(start, end)]
+
+    async def load_incidents(self, *a: Any, **k: Any) -> list[Any]:
+        return ["passthrough"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_windows_read_each_day_slice_once() -> None:
+    inner = _DayRowLoader()
+    loader = WindowCachedTestOpsLoader(inner)
+    backfill = [DAY - timedelta(days=i) for i in range(4, -1, -1)]
+
+    for d in backfill:
+        loader.evict_before(d - timedelta(days=30))
+        suites, cases = await loader.load_testops_test_data(
+            _midnight(d - timedelta(days=29)), _midnight(d + timedelta(days=1)), REPO
+        )
+        prior = await loader.load_testops_coverage_data(
+            _midnight(d - timedelta(days=30)), _midnight(d), REPO
+        )
+        current = await loader.load_testops_coverage_data(
+            _midnight(d), _midnight(d + timedelta(days=1)), REPO
+        )
+        assert [r["suite_day"] for r in suites] == [
+            d - timedelta(days=29 - i) for i in range(30)
+        ]
+        assert len(cases) == 30
+        assert [r["coverage_day"] for r in prior] == [
+            d - timedelta(days=30 - i) for i in range(30)
+        ]
+        assert [r["coverage_day"] for r in current] == [d]
+
+    # 30 slices for the first window plus one new slice per later day.
+    assert len(inner.test_calls) == 30 + 4
+    assert len(inner.coverage_calls) == 31 + 4
+    assert all(end - start == timedelta(days=1) for start, end in inner.test_calls)
+    assert loader.test_data.stats.misses == 34
+    assert loader.test_data.stats.hits == 5 * 30 - 34
+    # Slices behind the earliest window still needed were evicted.
+    assert loader.coverage.stats.evictions == 4
+    assert len(loader.coverage) == 31
+    # Untouched loader methods are delegated.
+    assert await loader.load_incidents() == ["passthrough"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_slice_load() -> None:
+    loads: list[date] = []
+
+    async def load_slice(
+        start: datetime, end: datetime, scope: Any
+    ) -> tuple[list[Any], ...]:
+        loads.append(start.date())
+        await asyncio.sleep(0.01)
+        return ([start.date()],)
+
+    cache = DayWindowCache("t", load_slice)
+    a, b = await asyncio.gather(
+        cache.window(_midnight(DAY - timedelta(days=2)), _midnight(DAY)),
+        cache.window(_midnight(DAY - timedelta(days=1)), _midnight(DAY)),
+    )
+
+    assert a == ([DAY - timedelta(days=2), DAY - timedelta(days=1)],)
+    assert b == ([DAY - timedelta(days=1)],)
+    assert sorted(loads) == [DAY - timedelta(days=2), DAY - timedelta(days=1)]
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_slice_is_refetched() -> None:
+    loads: list[date] = []
+    never = asyncio.Event()
+
+    async def load_slice(
+        start: datetime, end: datetime, scope: Any
+    ) -> tuple[list[Any], ...]:
+        loads.append(start.date())
+        if len(loads) == 1:
+            await never.wait()
+        return ([start.date()],)
+
+    cache = DayWindowCache("t", load_slice)
+    start, end = _midnight(DAY - timedelta(days=1)), _midnight(DAY)
+    first = asyncio.ensure_future(cache.window(start, end))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert await cache.window(start, end) == ([DAY - timedelta(days=1)],)
+    assert loads == [DAY - timedelta(days=1), DAY - timedelta(days=1)]
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_unaligned_window_bypasses_cache() -> None:
+    calls: list[tuple[datetime, datetime]] = []
+
+    async def load_slice(
+        start: datetime, end: datetime, scope: Any
+    ) -> tuple[list[Any], ...]:
+        calls.append((start, end))
+        return (["row"],)
+
+    cache = DayWindowCache("t", load_slice)
+    start = _midnight(DAY) + timedelta(hours=6)
+    assert await cache.window(start, _midnight(DAY + timedelta(days=1))) == (["row"],)
+    assert calls == [(start, _midnight(DAY + timedelta(days=1)))]
+    assert cache.stats.uncached_windows == 1
+    assert len(cache) == 0
@@ -0,0 +1,132 @@
+"""TeamAttributionEngine resolves each work item once per run."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+
+from dev_health_ops.metrics import compute_work_items
+from dev_health_ops.metrics.compute_work_item_state_durations import (
+    compute_work_item_state_durations_daily,
+)
+from dev_health_ops.metrics.compute_work_items import (
+    TeamAttributionEngine,
+    compute_estimate_coverage_metrics_daily,
+    compute_work_item_metrics_daily,
+    compute_work_item_team_attributions,
+    resolve_team_attribution,
+)
+from dev_health_ops.models.work_items import WorkItem, WorkItemStatusTransition
+from dev_health_ops.providers.teams import TeamResolver
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _team_resolver() -> TeamResolver:
+    return TeamResolver(member_to_team={"alice@example.com": ("team-a", "Team A")})
+
+
+def _item(index: int, *, assignee: str | None = "alice@example.com") -> WorkItem:
+    created = BASE + timedelta(days=index % 5)
+    return WorkItem(
+        work_item_id=f"jira:ABC-{index}",
+        provider="jira",
+        title=f"Item {index}",
+        type="task",
+        status="in_progress",
+        status_raw=None,
+        created_at=created,
+        updated_at=created,
+        started_at=created + timedelta(hours=1),
+        completed_at=None,
+        closed_at=None,
+        assignees=[assignee] if assignee else [],
+        project_key="ABC",
+    )
+
+
+def _transition(item: WorkItem) -> WorkItemStatusTransition:
+    return WorkItemStatusTransition(
+        work_item_id=item.work_item_id,
+        provider="jira",
+        occurred_at=item.created_at + timedelta(hours=1),
+        from_status_raw="To Do",
+        to_status_raw="In Progress",
+        from_status="todo",
+        to_status="in_progress",
+        actor=None,
+    )
+
+
+def test_results_match_the_uncached_cascade():
+    engine = TeamAttributionEngine(_team_resolver(), None)
+    items = [_item(1), _item(2, assignee=None), _item(3, assignee="bob@example.com")]
+
+    for item in items:
+        expected = resolve_team_attribution(item, _team_resolver(), None)
+        assert engine.resolve(item) == expected
+        assert engine.resolve(item) == expected
+
+    assert (engine.resolutions, engine.hits) == (3, 3)
+
+
+def test_reloaded_items_hit_and_attribution_changes_miss():
+    engine = TeamAttributionEngine(_team_resolver(), None)
+    item = _item(1)
+    engine.resolve(item)
+
+    # Same fields on a freshly loaded object (e.g. the next day's window).
+    reloaded = replace(item, title="Renamed", updated_at=BASE + timedelta(days=9))
+    assert engine.resolve(reloaded)[0] == "team-a"
+    reassigned = replace(item, assignees=["bob@example.com"])
+    assert engine.resolve(reassigned)[0] is None
+
+    assert (engine.resolutions, engine.hits) == (2, 1)
+
+
+def test_shared_engine_resolves_each_item_once_across_days(monkeypatch):
+    resolved: list[str] = []
+    real_resolve = compute_work_items.resolve_team_attribution
+
+    def _counting_resolve(item, *args, **kwargs):
+        resolved.append(item.work_item_id)
+        return real_resolve(item, *args, **kwargs)
+
+    monkeypatch.setattr(
+        compute_work_items, "resolve_team_attribution", _counting_resolve
+    )
+    items = [_item(i) for i in range(10)]
+    transitions = [_transition(item) for item in items]
+    engine = TeamAttributionEngine(_team_resolver(), None)
+    computed_at = BASE + timedelta(days=30)
+
+    compute_work_item_team_attributions(
+        work_items=items, computed_at=computed_at, attribution_engine=engine
+    )
+    for offset in range(7):
+        day = date(2025, 1, 1) + timedelta(days=offset)
+        groups, _, _ = compute_work_item_metrics_daily(
+            day=day,
+            work_items=items,
+            transitions=transitions,
+            computed_at=computed_at,
+            attribution_engine=engine,
+        )
+        compute_estimate_coverage_metrics_daily(
+            day=day,
+            work_items=items,
+            computed_at=computed_at,
+            attribution_engine=engine,
+        )
+        compute_work_item_state_durations_daily(
+            day=day,
+            work_items=items,
+            transitions=transitions,
+            computed_at=computed_at,
+            attribution_engine=engine,
+        )
+        assert {group.team_id for group in groups} == {"team-a"}
+
+    assert sorted(resolved) == sorted(item.work_item_id for item in items)
+    assert engine.resolutions == len(items)
+    assert engine.hits > 0
@@ -0,0 +1,195 @@
+"""WorkItemTimeline answers per-day queries without rescanning the history."""
+
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta, timezone
+
+from dev_health_ops.metrics import compute_work_items
+from dev_health_ops.metrics.compute_work_item_state_durations import (
+    compute_work_item_state_durations_daily,
+)
+from dev_health_ops.metrics.compute_work_items import compute_work_item_metrics_daily
+from dev_health_ops.metrics.work_item_timeline import WorkItemTimeline
+from dev_health_ops.models.work_items import WorkItem, WorkItemStatusTransition
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _item(
+    index: int,
+    created: datetime,
+    *,
+    started: datetime | None = None,
+    completed: datetime | None = None,
+    closed: datetime | None = None,
+) -> WorkItem:
+    return WorkItem(
+        work_item_id=f"jira:ABC-{index}",
+        provider="jira",
+        title=f"Item {index}",
+        type="task",
+        status="done" if completed else "in_progress",
+        status_raw=None,
+        created_at=created,
+        updated_at=created,
+        started_at=started,
+        completed_at=completed,
+        closed_at=closed,
+    )
+
+
+def _transition(work_item_id: str, at: datetime) -> WorkItemStatusTransition:
+    return WorkItemStatusTransition(
+        work_item_id=work_item_id,
+        provider="jira",
+        occurred_at=at,
+        from_status_raw="To Do",
+        to_status_raw="In Progress",
+        from_status="todo",
+        to_status="in_progress",
+        actor=None,
+    )
+
+
+def _random_history(seed: int) -> tuple[list[WorkItem], list[WorkItemStatusTransition]]:
+    rng = random.Random(seed)
+
+    def _after(at: datetime) -> datetime | None:
+        if rng.random() < 0.3:
+            return None
+        return at + timedelta(hours=rng.randint(0, 24 * 20))
+
+    items: list[WorkItem] = []
+    transitions: list[WorkItemStatusTransition] = []
+    for index in range(300):
+        created = BASE + timedelta(hours=rng.randint(0, 24 * 60))
+        started = _after(created)
+        completed = _after(started) if started else None
+        closed = completed if rng.random() < 0.5 else _after(created)
+        item = _item(
+            index, created, started=started, completed=completed, closed=closed
+        )
+        items.append(item)
+        for _ in range(rng.randint(0, 3)):
+            at = created + timedelta(hours=rng.randint(-12, 24 * 30))
+            transitions.append(_transition(item.work_item_id, at))
+    return items, transitions
+
+
+def _terminal(item: WorkItem) -> datetime | None:
+    ends = [at for at in (item.completed_at, item.closed_at) if at is not None]
+    return min(ends, default=None)
+
+
+def test_interval_queries_match_a_full_scan():
+    items, transitions = _random_history(seed=7)
+    timeline = WorkItemTimeline(items, transitions)
+
+    for offset in range(0, 90, 3):
+        start = BASE + timedelta(days=offset)
+        end = start + timedelta(days=1)
+
+        def scan(predicate):
+            return [item for item in items if predicate(item)]
+
+        assert timeline.created_between(start, end) == scan(
+            lambda i: start <= i.created_at < end
+        )
+        assert timeline.completed_between(start, end) == scan(
+            lambda i: i.completed_at is not None and start <= i.completed_at < end
+        )
+        assert timeline.open_at(end) == scan(
+            lambda i: (
+                i.created_at < end and (_terminal(i) is None or _terminal(i) >= end)
+            )
+        )
+        assert timeline.in_progress_at(end) == scan(
+            lambda i: (
+                i.started_at is not None
+                and i.started_at < end
+                and (_terminal(i) is None or _terminal(i) >= end)
+            )
+        )
+        assert timeline.active_during(start, end) == scan(
+            lambda i: (
+                i.created_at < end
+                and (i.completed_at is None or i.completed_at >= start)
+            )
+        )
+        touched = {
+            tr.work_item_id for tr in transitions if start <= tr.occurred_at < end
+        }
+        assert timeline.transitioned_between(start, end) == scan(
+            lambda i: i.work_item_id in touched
+        )
+
+
+def test_shared_timeline_matches_per_day_results():
+    items, transitions = _random_history(seed=11)
+    timeline = WorkItemTimeline(items, transitions)
+    computed_at = BASE + timedelta(days=100)
+
+    for offset in range(0, 80, 5):
+        day = (BASE + timedelta(days=offset)).date()
+        shared = compute_work_item_state_durations_daily(
+            day=day,
+            work_items=items,
+            transitions=transitions,
+            computed_at=computed_at,
+            timeline=timeline,
+        )
+        # A one-item timeline per item is the exhaustive reference.
+        reference_hours: dict[tuple[str, str], float] = {}
+        for item in items:
+            item_transitions = [
+                tr for tr in transitions if tr.work_item_id == item.work_item_id
+            ]
+            for row in compute_work_item_state_durations_daily(
+                day=day,
+                work_items=[item],
+                transitions=item_transitions,
+                computed_at=computed_at,
+            ):
+                key = (row.team_id, row.status)
+                reference_hours[key] = (
+                    reference_hours.get(key, 0.0) + row.duration_hours
+                )
+        assert {
+            (row.team_id, row.status): row.duration_hours for row in shared
+        } == reference_hours
+
+
+def test_daily_metrics_only_attribute_the_days_items(monkeypatch):
+    resolved: list[str] = []
+    real_resolve = compute_work_items.resolve_team_attribution
+
+    def _counting_resolve(item, *args, **kwargs):
+        resolved.append(item.work_item_id)
+        return real_resolve(item, *args, **kwargs)
+
+    monkeypatch.setattr(
+        compute_work_items, "resolve_team_attribution", _counting_resolve
+    )
+    day = date(2025, 3, 1)
+    old = [
+        _item(i, BASE, started=BASE, completed=BASE + timedelta(days=1))
+        for i in range(50)
+    ]
+    today = _item(
+        99,
+        datetime(2025, 3, 1, 9, tzinfo=timezone.utc),
+        started=datetime(2025, 3, 1, 10, tzinfo=timezone.utc),
+    )
+    timeline = WorkItemTimeline([*old, today])
+
+    groups, _, _ = compute_work_item_metrics_daily(
+        day=day,
+        work_items=timeline.items,
+        transitions=[],
+        computed_at=datetime(2025, 3, 2, tzinfo=timezone.utc),
+        timeline=timeline,
+    )
+
+    assert resolved == ["jira:ABC-99"]
+    assert [(g.items_started, g.wip_count_end_of_day) for g in groups] == [(1, 1)]
@@ -12,13 +12,15 @@ from __future__ import annotations
 
 import pytest
 
-from dev_health_ops.exceptions import APIException
+from dev_health_ops.exceptions import APIException, RateLimitException
 from dev_health_ops.providers.github.graphql import (
     blame_variables,
     build_blob_texts_query,
+    build_commit_totals_query,
     github_graphql_url,
     parse_blame_response,
     parse_blob_texts_response,
+    parse_commit_totals_response,
     raise_for_graphql_errors,
 )
 
@@ -68,6 +70,26 @@ def test_build_blob_texts_query_json_escapes_path_special_characters() -> None:
     assert '\\"path.py' in query
 
 
+def test_build_commit_totals_query_aliases_one_commit_per_sha() -> None:
+    query = build_commit_totals_query(["abc", "def"])
+    assert 'c0: object(oid: "abc") { ... on Commit { additions deletions } }' in query
+    assert 'c1: object(oid: "def") { ... on Commit { additions deletions } }' in query
+
+
+def test_parse_commit_totals_response_omits_unresolved_commits() -> None:
+    payload = {
+        "repository": {
+            "c0": {"additions": 3, "deletions": 1},
+            "c1": None,
+            "c2": {"additions": 0, "deletions": 7},
+        }
+    }
+    assert parse_commit_totals_response(payload, ["a", "b", "c"]) == {
+        "a": (3, 1),
+        "c": (0, 7),
+    }
+
+
 def test_raise_for_graphql_errors_noop_when_no_errors_key() -> None:
     raise_for_graphql_errors({"data": {}}, operation="files:test")
     raise_for_graphql_errors({}, operation="files:test")
@@ -84,6 +106,21 @@ def test_raise_for_graphql_errors_raises_api_exception_with_joined_messages() ->
     assert "blame:POST /graphql" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(
+    "error",
+    [
+        {"type": "RATE_LIMITED", "message": "API rate limit exceeded for user"},
+        {"message": "You have exceeded a secondary rate limit. Please wait."},
+    ],
+)
+def test_raise_for_graphql_errors_maps_rate_limits(error: dict) -> None:
+    with pytest.raises(RateLimitException) as exc_info:
+        raise_for_graphql_errors(
+            {"errors": [error]}, operation="commit_stats:POST /graphql"
+        )
+    assert "commit_stats:POST /graphql" in str(exc_info.value)
+
+
 def test_parse_blob_texts_response_omits_binary_truncated_and_missing() -> None:
     payload = {
         "repository": {
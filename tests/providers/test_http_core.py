@@ -11,12 +11,14 @@ GHE / self-hosted-GitLab base-URL joining.
 
 from __future__ import annotations
 
+import threading
 import time
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
+from dev_health_ops.core.cache import FileBackend, MemoryBackend
 from dev_health_ops.exceptions import (
     APIException,
     AuthenticationException,
@@ -24,6 +26,7 @@ from dev_health_ops.exceptions import (
     PaginationException,
     RateLimitException,
 )
+from dev_health_ops.providers._conditional import ValidatorCache
 from dev_health_ops.providers._http import (
     GITHUB_DEFAULT_BASE_URL,
     GITHUB_DIAGNOSTIC_HEADER_NAMES,
@@ -1035,3 +1038,206 @@ class TestUnauthenticatedFollow:
         await core.close()
         assert core._client is None
         assert core._bare_client is None
+
+
+# ---------------------------------------------------------------------------
+# Conditional requests (validator cache)
+# ---------------------------------------------------------------------------
+
+
+def _etag_server(pages: dict[str, httpx.Response]) -> httpx.MockTransport:
+    """Serve ``pages`` by URL and answer a matching If-None-Match with 304."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        page = pages[str(request.url)]
+        if request.headers.get("If-None-Match") == page.headers.get("ETag"):
+            return httpx.Response(
+                304,
+                headers={"ETag": page.headers["ETag"], "X-RateLimit-Remaining": "7"},
+            )
+        return page
+
+    transport = httpx.MockTransport(handler)
+    transport.seen = seen  # type: ignore[attr-defined]
+    return transport
+
+
+class TestConditionalRequests:
+    @pytest.mark.asyncio
+    async def test_304_is_replayed_as_cached_200(self) -> None:
+        transport = _etag_server(
+            {
+                "https://api.github.com/repos/a/b": httpx.Response(
+                    200, json={"id": 1}, headers={"ETag": '"v1"'}
+                )
+            }
+        )
+        cache = ValidatorCache(MemoryBackend())
+        core = _core(
+            transport=transport,
+            validator_cache=cache,
+            not_modified_is_rate_limited=False,
+        )
+
+        first = await core.request("GET", "/repos/a/b", operation="git:GET repo")
+        second = await core.request("GET", "/repos/a/b", operation="git:GET repo")
+
+        assert first.json() == second.json() == {"id": 1}
+        assert second.status_code == 200
+        assert second.headers["X-RateLimit-Remaining"] == "7"
+        seen = transport.seen  # type: ignore[attr-defined]
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        (observation,) = core.drain_usage_observations()
+        assert observation["request_count"] == 2
+        assert observation["conditional_hit_count"] == 1
+        assert observation["rate_limit_exempt_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_charged_304_is_not_marked_rate_limit_exempt(self) -> None:
+        transport = _etag_server(
+            {
+                "https://api.github.com/repos/a/b": httpx.Response(
+                    200, json={"id": 1}, headers={"ETag": '"v1"'}
+                )
+            }
+        )
+        core = _core(
+            transport=transport, validator_cache=ValidatorCache(MemoryBackend())
+        )
+
+        await core.request("GET", "/repos/a/b", operation="git:GET repo")
+        await core.request("GET", "/repos/a/b", operation="git:GET repo")
+
+        (observation,) = core.drain_usage_observations()
+        assert observation["conditional_hit_count"] == 1
+        assert "rate_limit_exempt_count" not in observation
+
+    @pytest.mark.asyncio
+    async def test_cache_is_isolated_by_scope_and_credential(self) -> None:
+        transport = _etag_server(
+            {
+                "https://api.github.com/repos/a/b": httpx.Response(
+                    200, json={"id": 1}, headers={"ETag": '"v1"'}
+                )
+            }
+        )
+        cache = ValidatorCache(MemoryBackend())
+        warm = _core(
+            transport=transport,
+            validator_cache=cache,
+            validator_scope="org-1",
+            headers={"Authorization": "token one"},
+        )
+        await warm.request("GET", "/repos/a/b", operation="git:GET repo")
+
+        for scope, token in (("org-2", "token one"), ("org-1", "token two")):
+            other = _core(
+                transport=transport,
+                validator_cache=cache,
+                validator_scope=scope,
+                headers={"Authorization": token},
+            )
+            await other.request("GET", "/repos/a/b", operation="git:GET repo")
+
+        seen = transport.seen  # type: ignore[attr-defined]
+        assert [r.headers.get("If-None-Match") for r in seen] == [None, None, None]
+
+    @pytest.mark.asyncio
+    async def test_responses_without_validators_are_not_cached(self) -> None:
+        backend = MemoryBackend()
+        core = _core(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json=[])),
+            validator_cache=ValidatorCache(backend),
+        )
+        await core.request("GET", "/repos/a/b", operation="git:GET repo")
+        assert len(backend._store) == 0
+
+    @pytest.mark.asyncio
+    async def test_paginated_replay_keeps_link_header(self) -> None:
+        page1_url = "https://api.github.com/repos/a/b/actions/runs"
+        page2_url = "https://api.github.com/repos/a/b/actions/runs?page=2"
+        transport = _etag_server(
+            {
+                page1_url: httpx.Response(
+                    200,
+                    json=[{"id": 1}],
+                    headers={"ETag": '"p1"', "Link": f'<{page2_url}>; rel="next"'},
+                ),
+                page2_url: httpx.Response(
+                    200, json=[{"id": 2}], headers={"ETag": '"p2"'}
+                ),
+            }
+        )
+        core = _core(
+            transport=transport, validator_cache=ValidatorCache(MemoryBackend())
+        )
+
+        first = await core.paginate_link_header(
+            "/repos/a/b/actions/runs", operation="git:GET runs"
+        )
+        second = await core.paginate_link_header(
+            "/repos/a/b/actions/runs", operation="git:GET runs"
+        )
+
+        assert first == second == [{"id": 1}, {"id": 2}]
+        seen = transport.seen  # type: ignore[attr-defined]
+        assert [r.headers.get("If-None-Match") for r in seen] == [
+            None,
+            None,
+            '"p1"',
+            '"p2"',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_file_backend_io_runs_off_the_event_loop(self, tmp_path) -> None:
+        loop_thread = threading.get_ident()
+        io_threads: list[int] = []
+
+        class _RecordingFileBackend(FileBackend):
+            def get(self, key):
+                io_threads.append(threading.get_ident())
+                return super().get(key)
+
+            def set(self, key, value, ttl_seconds):
+                io_threads.append(threading.get_ident())
+                super().set(key, value, ttl_seconds)
+
+        transport = _etag_server(
+            {
+                "https://api.github.com/repos/a/b": httpx.Response(
+                    200, json={"id": 1}, headers={"ETag": '"v1"'}
+                )
+            }
+        )
+        core = _core(
+            transport=transport,
+            validator_cache=ValidatorCache(_RecordingFileBackend(str(tmp_path))),
+        )
+
+        await core.request("GET", "/repos/a/b", operation="git:GET repo")
+        second = await core.request("GET", "/repos/a/b", operation="git:GET repo")
+
+        assert second.json() == {"id": 1}
+        assert len(io_threads) == 3
+        assert loop_thread not in io_threads
+
+    def test_code_client_factories_scope_the_cache_by_the_sync_org(self) -> None:
+        from types import SimpleNamespace
+
+        from dev_health_ops.processors.github import _github_code_client_from_connector
+        from dev_health_ops.processors.gitlab import _gitlab_code_client_from_connector
+
+        github = _github_code_client_from_connector(
+            SimpleNamespace(token="t", validator_scope="org-1")
+        )
+        gitlab = _gitlab_code_client_from_connector(
+            SimpleNamespace(
+                private_token="t", url="https://gitlab.com", validator_scope="org-2"
+            )
+        )
+
+        assert github._core.validator_scope == "org-1"
+        assert gitlab._core.validator_scope == "org-2"
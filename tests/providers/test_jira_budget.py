@@ -236,6 +236,21 @@ def test_jira_budget_estimator_reads_worklog_and_gql_env_flags(monkeypatch) -> N
     assert "jira_gql_enrichment" in {estimate.route_family for estimate in estimates}
 
 
+def test_jira_budget_estimator_reserves_extra_search_for_slices(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("JIRA_SEARCH_SLICES", "4")
+
+    estimates = JiraBudgetEstimator().estimate(_context(dataset_key="work-items"))
+
+    jql = next(
+        estimate for estimate in estimates if estimate.route_family == "jira_jql"
+    )
+    # Three extra slice first pages plus the created-range probe.
+    assert jql.estimated_units == 4 + 4
+    assert any("JIRA_SEARCH_SLICES" in note for note in jql.notes)
+
+
 def test_jira_budget_route_family_limits_override_dimension_defaults() -> None:
     jql = next(
         estimate
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from dev_health_ops.connectors.utils.rate_limit_queue import RateLimitGate
+from dev_health_ops.providers.jira.client import (
+    JiraAuth,
+    JiraClient,
+    slice_jql_by_field,
+    slice_jql_by_updated,
+    updated_slice_bounds,
+)
+
+
+def _make_client(**kwargs: Any) -> JiraClient:
+    return JiraClient(
+        auth=JiraAuth(
+            base_url="https://example.atlassian.net",
+            email="bot@example.com",
+            api_token="token",
+        ),
+        gate=MagicMock(spec=RateLimitGate),
+        **kwargs,
+    )
+
+
+def _issue(number: int, **extra: Any) -> dict[str, Any]:
+    return {"id": str(number), "key": f"ENG-{number}", "fields": {}, **extra}
+
+
+class _OffsetSearch:
+    """search_issues_page stand-in serving ``total`` issues by startAt."""
+
+    def __init__(self, total: int, *, delay: float = 0.01) -> None:
+        self.total = total
+        self.delay = delay
+        self.calls: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs: Any) -> dict[str, Any]:
+        with self._lock:
+            self.calls.append(kwargs)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            start = kwargs["start_at"]
+            end = min(self.total, start + kwargs["max_results"])
+            return {
+                "startAt": start,
+                "total": self.total,
+                "issues": [_issue(n) for n in range(start, end)],
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _collect(client: JiraClient, **kwargs: Any) -> list[dict[str, Any]]:
+    async def _run() -> list[dict[str, Any]]:
+        return [issue async for issue in client.iter_issues_async(**kwargs)]
+
+    return asyncio.run(_run())
+
+
+def test_slice_jql_by_updated_partitions_the_window_and_keeps_order_by() -> None:
+    bounds = updated_slice_bounds(
+        datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 1, 4, tzinfo=UTC), 3
+    )
+
+    slices = slice_jql_by_updated(
+        "project = 'ENG' AND updated >= '2025-01-01' ORDER BY updated DESC", bounds
+    )
+
+    assert slices == [
+        "(project = 'ENG' AND updated >= '2025-01-01') "
+        'AND updated < "2025-01-02 00:00" ORDER BY updated DESC',
+        "(project = 'ENG' AND updated >= '2025-01-01') "
+        'AND updated >= "2025-01-02 00:00" AND updated < "2025-01-03 00:00" '
+        "ORDER BY updated DESC",
+        "(project = 'ENG' AND updated >= '2025-01-01') "
+        'AND updated >= "2025-01-03 00:00" ORDER BY updated DESC',
+    ]
+    assert slice_jql_by_updated("ORDER BY updated DESC", bounds[:1]) == [
+        'updated < "2025-01-02 00:00" ORDER BY updated DESC',
+        'updated >= "2025-01-02 00:00" ORDER BY updated DESC',
+    ]
+    assert slice_jql_by_updated("project = ENG", []) == ["project = ENG"]
+
+
+def test_iter_issues_async_fetches_remaining_offsets_concurrently() -> None:
+    client = _make_client(per_page=10, search_fan_out=3)
+    search = _OffsetSearch(total=45)
+    client.search_issues_page = search  # type: ignore[method-assign]
+
+    issues = _collect(client, jql="project = ENG", expand_changelog=False)
+
+    assert sorted(int(issue["id"]) for issue in issues) == list(range(45))
+    assert sorted(call["start_at"] for call in search.calls) == [0, 10, 20, 30, 40]
+    assert 1 < search.max_in_flight <= 3
+
+
+def test_iter_issues_async_slices_by_updated_and_dedupes_across_slices() -> None:
+    client = _make_client(search_fan_out=4, search_slices=2)
+    jqls: list[str] = []
+
+    def search(**kwargs: Any) -> dict[str, Any]:
+        jqls.append(kwargs["jql"])
+        token = kwargs.get("next_page_token")
+        if "updated <" in kwargs["jql"] and "updated >=" not in kwargs["jql"]:
+            if token is None:
+                return {"issues": [_issue(1), _issue(2)], "nextPageToken": "p2"}
+            assert token == "p2"
+            return {"issues": [_issue(3)], "isLast": True}
+        # An issue updated mid-sync can surface in both slices.
+        return {"issues": [_issue(3), _issue(4)], "isLast": True}
+
+    client.search_issues_page = search  # type: ignore[method-assign]
+
+    issues = _collect(
+        client,
+        jql="project = ENG ORDER BY updated DESC",
+        expand_changelog=False,
+        updated_since=datetime(2025, 1, 1, tzinfo=UTC),
+        updated_until=datetime(2025, 1, 3, tzinfo=UTC),
+    )
+
+    assert sorted(issue["key"] for issue in issues) == [
+        "ENG-1",
+        "ENG-2",
+        "ENG-3",
+        "ENG-4",
+    ]
+    assert len(set(jqls)) == 2
+
+
+def test_iter_issues_async_slices_full_resync_by_created_range() -> None:
+    client = _make_client(search_fan_out=3, search_slices=3)
+    jqls: list[str] = []
+    slices: dict[str, int] = {}
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def search(**kwargs: Any) -> dict[str, Any]:
+        nonlocal in_flight, max_in_flight
+        jql = kwargs["jql"]
+        if jql.endswith("ORDER BY created ASC"):
+            assert kwargs["max_results"] == 1
+            return {"issues": [{"fields": {"created": "2025-01-01T00:00:00.000+0000"}}]}
+        with lock:
+            jqls.append(jql)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            time.sleep(0.02)
+            # Enhanced search: token pages only, never a ``total``.
+            base = 10 * slices.setdefault(jql, len(slices))
+            if kwargs.get("next_page_token") is None:
+                return {"issues": [_issue(base + 1)], "nextPageToken": "next"}
+            return {"issues": [_issue(base + 2)], "isLast": True}
+        finally:
+            with lock:
+                in_flight -= 1
+
+    client.search_issues_page = search  # type: ignore[method-assign]
+
+    issues = _collect(
+        client,
+        jql="project = ENG ORDER BY updated DESC",
+        expand_changelog=False,
+        updated_until=datetime(2025, 1, 4, tzinfo=UTC),
+    )
+
+    assert sorted(set(jqls)) == sorted(
+        slice_jql_by_field(
+            "project = ENG ORDER BY updated DESC",
+            "created",
+            [datetime(2025, 1, 2, tzinfo=UTC), datetime(2025, 1, 3, tzinfo=UTC)],
+        )
+    )
+    assert len(jqls) == 6
+    assert max_in_flight > 1
+    assert len({issue["id"] for issue in issues}) == 6
+
+
+def test_iter_issues_async_fetches_full_changelog_only_when_truncated() -> None:
+    client = _make_client()
+    truncated = _issue(
+        1, changelog={"total": 3, "maxResults": 1, "histories": [{"id": "h0"}]}
+    )
+    complete = _issue(2, changelog={"total": 1, "histories": [{"id": "x"}]})
+    client.search_issues_page = MagicMock(  # type: ignore[method-assign]
+        return_value={"issues": [truncated, complete], "isLast": True}
+    )
+    responses = [
+        {"values": [{"id": "h0"}, {"id": "h1"}], "isLast": False},
+        {"values": [{"id": "h2"}], "isLast": True},
+    ]
+    requested: list[tuple[str, Any]] = []
+
+    def request_json(*, path: str, params: Any = None, **_kw: Any) -> Any:
+        requested.append((path, params))
+        client._record_rest_usage(f"GET {path}", headers={}, status=200)
+        return responses.pop(0)
+
+    client._request_json = request_json  # type: ignore[method-assign]
+
+    issues = {issue["key"]: issue for issue in _collect(client, jql="project = ENG")}
+
+    assert [path for path, _ in requested] == [
+        "/rest/api/3/issue/ENG-1/changelog",
+        "/rest/api/3/issue/ENG-1/changelog",
+    ]
+    assert requested[1][1]["startAt"] == 2
+    assert [h["id"] for h in issues["ENG-1"]["changelog"]["histories"]] == [
+        "h0",
+        "h1",
+        "h2",
+    ]
+    assert issues["ENG-2"] is complete
+    usage = client.drain_usage_observations()
+    assert [(row["route_family"], row["request_count"]) for row in usage] == [
+        ("jira_issue_enrichment", 2)
+    ]
+
+
+def test_iter_issues_bridges_concurrent_search_for_sync_callers() -> None:
+    client = _make_client(per_page=5, search_fan_out=2)
+    client.search_issues_page = _OffsetSearch(total=30, delay=0)  # type: ignore[method-assign]
+
+    issues = list(client.iter_issues(jql="project = ENG", limit=12))
+
+    assert len(issues) == 12
+    assert len({issue["id"] for issue in issues}) == 12
+
+
+def test_iter_issues_async_surfaces_search_errors() -> None:
+    client = _make_client(search_fan_out=2)
+    client.search_issues_page = MagicMock(  # type: ignore[method-assign]
+        side_effect=RuntimeError("boom")
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        _collect(client, jql="project = ENG")
@@ -47,3 +47,110 @@ def test_compounding_risk_loader_preserves_latest_null_score_same_row_severity()
         "end": date(2026, 5, 31),
         "org_id": "org-1",
     }
+
+
+class _TableClient:
+    """Answers each query from canned rows keyed by the table it reads."""
+
+    def __init__(self, rows: dict[str, list[dict[str, Any]]]) -> None:
+        self._rows = rows
+        self.queries: list[tuple[str, dict[str, Any]]] = []
+
+    def query(self, query: str, parameters: dict[str, Any]) -> _QueryResult:
+        self.queries.append((query, parameters))
+        grouped = "%(team_ids)s" in query
+        table = next(t for t in self._rows if f"FROM {t}\n" in query)
+        rows = [
+            r
+            for r in self._rows[table]
+            if not grouped or r.get("team_id") in parameters["team_ids"]
+        ]
+        if not grouped and "%(team_id)s" in query:
+            rows = [r for r in rows if r.get("team_id") == parameters["team_id"]]
+        rows = [{k: v for k, v in r.items() if k != "team_id" or grouped} for r in rows]
+        columns = list(rows[0]) if rows else []
+        return _QueryResult(
+            column_names=columns,
+            result_rows=[tuple(r[c] for c in columns) for r in rows],
+        )
+
+
+_WS, _WE = date(2026, 5, 1), date(2026, 5, 29)
+
+
+def _team_rows() -> dict[str, list[dict[str, Any]]]:
+    return {
+        "work_item_metrics_daily": [
+            {
+                "team_id": "team-a",
+                "day": _WS,
+                "wip_total": 4,
+                "tp_total": 2,
+                "avg_ct": 10.0,
+            },
+            {
+                "team_id": "team-b",
+                "day": _WS,
+                "wip_total": 9,
+                "tp_total": 1,
+                "avg_ct": None,
+            },
+        ],
+        "user_metrics_daily": [
+            {"team_id": "team-a", "author_email": "a@x", "total_reviews": 1},
+            {"team_id": "team-a", "author_email": "b@x", "total_reviews": 3},
+        ],
+        "team_metrics_daily": [{"team_id": "team-b", "avg_ratio": 0.4}],
+        "compounding_risk_daily": [
+            {"team_id": "team-a", "score": 0.8, "severity": "high"}
+        ],
+        "repo_metrics_daily": [{"avg_p75": 30.0, "avg_rework": 0.2}],
+        "repo_complexity_daily": [{"first_half": 10.0, "second_half": 12.0}],
+        "file_hotspot_daily": [{"total": 3}],
+    }
+
+
+def test_team_batch_issues_fixed_query_count_and_matches_per_team_snapshots() -> None:
+    teams = ["team-a", "team-b", "team-c"]
+    client = _TableClient(_team_rows())
+    loader = ClickHouseMetricsLoader(client=client, org_id="org-1", team_ids=teams)
+
+    batched = {t: loader.load_team_metrics_window(t, "org-1", _WS, _WE) for t in teams}
+
+    assert len(client.queries) == 8
+    assert all(p["team_ids"] == teams for q, p in client.queries if "team_ids" in p)
+    assert all(p["org_id"] == "org-1" for _, p in client.queries)
+
+    reference = ClickHouseMetricsLoader(client=_TableClient(_team_rows()))
+    for team_id in teams:
+        expected = reference.load_team_metrics_window(team_id, "org-1", _WS, _WE)
+        assert batched[team_id] == expected
+    assert batched["team-a"].reviewer_gini == 0.25
+    assert batched["team-b"].wip_by_day == [9.0]
+    assert batched["team-b"].cycle_time_by_day == []
+    assert batched["team-c"].after_hours_ratio is None
+
+
+def test_team_batch_failure_falls_back_to_per_team_queries() -> None:
+    client = _TableClient(_team_rows())
+    real_query = client.query
+    batch_attempts: list[str] = []
+
+    def _query(query: str, parameters: dict[str, Any]) -> _QueryResult:
+        if "%(team_ids)s" in query:
+            batch_attempts.append(query)
+            raise RuntimeError("boom")
+        return real_query(query, parameters)
+
+    client.query = _query  # type: ignore[method-assign]
+    loader = ClickHouseMetricsLoader(
+        client=client, org_id="org-1", team_ids=["team-a", "team-b"]
+    )
+
+    first = loader.load_team_metrics_window("team-a", "org-1", _WS, _WE)
+    second = loader.load_team_metrics_window("team-b", "org-1", _WS, _WE)
+
+    assert first.wip_by_day == [4.0]
+    assert second.after_hours_ratio == 0.4
+    # The batch is attempted once, not once per team.
+    assert len(batch_attempts) == 1
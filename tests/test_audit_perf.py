@@ -1,3 +1,7 @@
+from types import SimpleNamespace
+
+import clickhouse_connect
+
 from dev_health_ops.audit.perf import format_perf_report, run_perf_audit
 
 
@@ -22,3 +26,82 @@ def test_format_perf_report_unchecked() -> None:
     output = format_perf_report(report)
     assert "status: unchecked" in output
     assert "db_error: connection failed" in output
+
+
+class _QueryLogClient:
+    """Answers the handful of queries ``run_perf_audit`` issues."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def query(self, sql, parameters=None):
+        self.queries.append(sql)
+        if sql.startswith("DESCRIBE"):
+            columns = [
+                "event_time",
+                "type",
+                "query_duration_ms",
+                "query",
+                "read_rows",
+                "read_bytes",
+                "log_comment",
+            ]
+            return SimpleNamespace(
+                column_names=["name"], result_rows=[[c] for c in columns]
+            )
+        if "system.settings" in sql:
+            return SimpleNamespace(column_names=["value"], result_rows=[["1"]])
+        if "GROUP BY caller" in sql:
+            return SimpleNamespace(
+                column_names=[
+                    "caller",
+                    "fingerprint",
+                    "queries",
+                    "total_duration_ms",
+                    "max_duration_ms",
+                    "read_rows",
+                    "read_bytes",
+                    "sample_query",
+                ],
+                result_rows=[
+                    [
+                        "graphql:Query.home",
+                        "ab12",
+                        40,
+                        9000,
+                        1200,
+                        10**7,
+                        10**9,
+                        "SELECT 1",
+                    ]
+                ],
+            )
+        comment = (
+            '{"source":"dev-health-ops","caller":"task:metrics.daily",'
+            '"component":"metrics_sink","fingerprint":"cd34"}'
+        )
+        return SimpleNamespace(
+            column_names=["event_time", "query_duration_ms", "query", "log_comment"],
+            result_rows=[["2026-01-01 00:00:00", 2500, "SELECT 2", comment]],
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def test_perf_audit_attributes_queries_to_callers(monkeypatch) -> None:
+    client = _QueryLogClient()
+    monkeypatch.setattr(clickhouse_connect, "get_client", lambda **_: client)
+
+    report = run_perf_audit("clickhouse://localhost:8123/default", org_id=None)
+
+    assert report["status"] == "slow"
+    assert report["slow_queries"][0]["caller"] == "task:metrics.daily"
+    assert report["slow_queries"][0]["fingerprint"] == "cd34"
+    assert report["callers"][0]["caller"] == "graphql:Query.home"
+    assert report["callers"][0]["total_duration_ms"] == 9000
+    assert "JSONExtractString(log_comment, 'source')" in client.queries[-1]
+
+    output = format_perf_report(report)
+    assert "[task:metrics.daily] SELECT 2" in output
+    assert "- graphql:Query.home ab12 queries=40 total_ms=9000" in output
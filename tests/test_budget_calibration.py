@@ -517,3 +517,35 @@ def test_attach_budget_comparison_does_not_log_for_over_estimated_rows(caplog):
     assert not [
         r for r in caplog.records if r.message == "run_sync_unit.budget_underestimated"
     ]
+
+
+def test_rate_limit_exempt_conditional_hits_do_not_count_as_underestimation():
+    budget_audit = [
+        _estimate(route_family="git", dimension="rest_core", estimated_units=4),
+    ]
+    actual = _actual(route_family="git", dimension="rest_core", request_count=10)
+    actual["conditional_hit_count"] = 7
+    actual["rate_limit_exempt_count"] = 7
+
+    (row,) = _join_budget_estimates_with_actuals(budget_audit, [actual])
+
+    # Physical round trips stay visible; only the charged ones are compared.
+    assert row["actual_requests"] == 10
+    assert row["conditional_hits"] == 7
+    assert row["rate_limited_requests"] == 3
+    assert row["ratio"] == 0.75
+    assert row["underestimated"] is False
+
+
+def test_conditional_hits_charged_by_the_provider_still_count():
+    budget_audit = [
+        _estimate(route_family="git", dimension="rest_core", estimated_units=4),
+    ]
+    actual = _actual(route_family="git", dimension="rest_core", request_count=6)
+    actual["conditional_hit_count"] = 5
+
+    (row,) = _join_budget_estimates_with_actuals(budget_audit, [actual])
+
+    assert row["conditional_hits"] == 5
+    assert row["rate_limited_requests"] == 6
+    assert row["underestimated"] is True
@@ -0,0 +1,73 @@
+"""FileBackend: on-disk CacheBackend semantics (get/set/ttl/mget)."""
+
+from __future__ import annotations
+
+import os
+import stat
+
+from dev_health_ops.core.cache import FileBackend
+
+
+def test_file_backend_round_trips_json_values(tmp_path):
+    be = FileBackend(str(tmp_path))
+    be.set("org:1:key", {"etag": '"abc"', "n": [1, 2]}, ttl_seconds=60)
+
+    assert be.get("org:1:key") == {"etag": '"abc"', "n": [1, 2]}
+    assert be.get("missing") is None
+    assert be.mget(["org:1:key", "missing"]) == [
+        {"etag": '"abc"', "n": [1, 2]},
+        None,
+    ]
+
+
+def test_file_backend_entries_survive_a_new_instance(tmp_path):
+    FileBackend(str(tmp_path)).set("k", "v", ttl_seconds=60)
+    assert FileBackend(str(tmp_path)).get("k") == "v"
+
+
+def test_file_backend_expired_entry_is_removed(tmp_path):
+    be = FileBackend(str(tmp_path))
+    be.set("k", "v", ttl_seconds=-1)
+
+    assert be.get("k") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_file_backend_file_names_do_not_leak_keys(tmp_path):
+    be = FileBackend(str(tmp_path))
+    be.set("tenant-secret:repo", 1, ttl_seconds=60)
+
+    (name,) = os.listdir(tmp_path)
+    assert "tenant-secret" not in name
+    assert be.status() == "ok"
+
+
+def test_file_backend_unserializable_value_is_not_written(tmp_path):
+    be = FileBackend(str(tmp_path))
+    be.set("k", object(), ttl_seconds=60)
+
+    assert be.get("k") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_file_backend_entries_are_private_to_the_owner(tmp_path):
+    directory = tmp_path / "validators"
+    be = FileBackend(str(directory))
+    be.set("k", {"body": "private"}, ttl_seconds=60)
+
+    (name,) = os.listdir(directory)
+    assert stat.S_IMODE(os.stat(directory).st_mode) & 0o077 == 0
+    assert stat.S_IMODE(os.stat(directory / name).st_mode) == 0o600
+
+
+def test_file_backend_sweep_drops_expired_then_soonest_expiring(tmp_path):
+    be = FileBackend(str(tmp_path), max_entries=2, sweep_interval_seconds=0)
+    be.set("expired", 0, ttl_seconds=-1)
+    be.set("soon", 1, ttl_seconds=60)
+    be.set("later", 2, ttl_seconds=600)
+    be.set("latest", 3, ttl_seconds=6000)
+
+    assert len(os.listdir(tmp_path)) == 2
+    assert [be.get(k) for k in ("soon", "later", "latest")] == [None, 2, 3]
+    assert be.expirations == 1
+    assert be.evictions == 1
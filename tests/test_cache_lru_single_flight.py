@@ -0,0 +1,139 @@
+"""Bounded MemoryBackend eviction and TTLCache single-flight coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from dev_health_ops.api.graphql.caching import cached_resolver
+from dev_health_ops.api.graphql.context import GraphQLContext
+from dev_health_ops.core.cache import MemoryBackend, TTLCache
+
+
+def test_memory_backend_evicts_least_recently_used():
+    be = MemoryBackend(max_entries=2)
+    be.set("a", 1, ttl_seconds=60)
+    be.set("b", 2, ttl_seconds=60)
+    assert be.get("a") == 1  # "b" is now least recently used
+    be.set("c", 3, ttl_seconds=60)
+
+    assert be.mget(["a", "b", "c"]) == [1, None, 3]
+    assert be.evictions == 1
+    assert len(be) == 2
+
+
+def test_memory_backend_byte_budget():
+    be = MemoryBackend(max_entries=100, max_bytes=30)
+    be.set("a", "x" * 10, ttl_seconds=60)
+    be.set("b", "y" * 10, ttl_seconds=60)
+    be.set("c", "z" * 10, ttl_seconds=60)
+
+    assert be.get("a") is None
+    assert be.get("c") == "z" * 10
+    # A value larger than the whole budget is not retained.
+    be.set("big", "w" * 100, ttl_seconds=60)
+    assert len(be) == 0
+
+
+def test_memory_backend_sweeps_expired_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("dev_health_ops.core.cache.time.time", lambda: now[0])
+    monkeypatch.setattr("dev_health_ops.core.cache.time.monotonic", lambda: now[0])
+    be = MemoryBackend(sweep_interval_seconds=10)
+    be.set("short", 1, ttl_seconds=1)
+    be.set("long", 2, ttl_seconds=600)
+
+    now[0] += 20
+    be.set("fresh", 3, ttl_seconds=60)
+
+    assert len(be) == 2
+    assert be.expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_coalesces_concurrent_misses():
+    cache = TTLCache(ttl_seconds=60, backend=MemoryBackend())
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"v": calls}
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute("k", compute) for _ in range(5))
+    )
+    assert results == [{"v": 1}] * 5
+    assert await cache.get_or_compute("k", compute) == {"v": 1}
+    assert calls == 1
+
+    stats = cache.stats
+    assert (stats.misses, stats.coalesced, stats.hits) == (1, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_shares_errors_and_does_not_cache_them():
+    cache = TTLCache(ttl_seconds=60, backend=MemoryBackend())
+    calls = 0
+
+    async def boom():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("query failed")
+
+    results = await asyncio.gather(
+        cache.get_or_compute("k", boom),
+        cache.get_or_compute("k", boom),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert calls == 1
+    assert cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_waiter_recomputes_when_leader_is_cancelled():
+    cache = TTLCache(ttl_seconds=60, backend=MemoryBackend())
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+        return "slow"
+
+    async def fast():
+        return "fast"
+
+    leader = asyncio.create_task(cache.get_or_compute("k", slow))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_compute("k", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == "fast"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_cached_resolver_coalesces_through_ttl_cache():
+    cache = TTLCache(ttl_seconds=60, backend=MemoryBackend())
+    context = GraphQLContext(
+        org_id="org-1", db_url="clickhouse://localhost", cache=cache
+    )
+    calls = 0
+
+    @cached_resolver(ttl_seconds=60)
+    async def resolve_value(ctx: GraphQLContext, x: int) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"x": x}
+
+    results = await asyncio.gather(*(resolve_value(context, 7) for _ in range(3)))
+    assert results == [{"x": 7}] * 3
+    assert calls == 1
+    assert cache.stats.coalesced == 2
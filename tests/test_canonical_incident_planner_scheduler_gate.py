@@ -235,7 +235,7 @@ def test_scheduler_rechecks_feature_immediately_before_enqueue(
 
     def create_then_disable(*args, **kwargs):
         trigger = real_trigger(*args, **kwargs)
-        disable_feature_for_org(state, state.enabled_org_id)
+        disable_feature_for_org(state, state.enabled_org_id, commit=False)
         return trigger
 
     monkeypatch.setattr(sync_scheduler, "organization_exists_sync", lambda *_args: True)
@@ -118,8 +118,8 @@ async def test_run_capacity_forecast_persists_rows_with_requested_org_id() -> No
             "dev_health_ops.metrics.job_capacity.get_backlog_from_sink", return_value=7
         ),
         patch(
-            "dev_health_ops.metrics.job_capacity.forecast_capacity",
-            return_value=forecast,
+            "dev_health_ops.metrics.job_capacity.forecast_capacity_batch",
+            return_value=[forecast],
         ) as mock_forecast,
     ):
         results = await job_capacity.run_capacity_forecast(
@@ -137,6 +137,9 @@ async def test_run_capacity_forecast_persists_rows_with_requested_org_id() -> No
     assert [row.org_id for row in sink.written] == ["org-1"]
     assert sink.closed is True
     assert mock_forecast.call_args.kwargs["seed"] == 1234
+    [request] = mock_forecast.call_args.args[0]
+    assert (request.team_id, request.work_scope_id) == ("team-a", "scope-a")
+    assert request.target_items == 7
 
 
 @pytest.mark.asyncio
@@ -16,11 +16,14 @@ from typing import Any, cast
 # pre-existing providers._base <-> connectors circular import when this file
 # is collected in isolation.
 import dev_health_ops.connectors  # noqa: F401
+from dev_health_ops.connectors.utils import RateLimitGate
 from dev_health_ops.exceptions import RateLimitException
 from dev_health_ops.metrics.sinks.ingestion import IngestionSink
 from dev_health_ops.models.git import Repo
 from dev_health_ops.processors import github
 from dev_health_ops.processors.base_git import resolve_commit_stats_limit
+from dev_health_ops.processors.fetch_utils import AsyncBatchCollector
+from dev_health_ops.utils import AGGREGATE_STATS_MARKER
 
 SINCE = datetime(2026, 5, 13, tzinfo=timezone.utc)
 
@@ -78,7 +81,15 @@ def _run_sync_commit_stats(monkeypatch, *, raw_commits, since):
     fetch_calls: list[int] = []
 
     async def _fake_fetch(
-        connector, owner, repo_name, raw, repo_id, max_stats, window, usage_sink
+        connector,
+        owner,
+        repo_name,
+        raw,
+        repo_id,
+        max_stats,
+        window,
+        usage_sink,
+        **_kwargs,
     ):
         fetch_calls.append(max_stats)
         return [
@@ -217,3 +228,176 @@ def test_fetch_commit_stats_skips_non_rate_commit_failure(monkeypatch):
 
     assert [stat.commit_hash for stat in stats] == ["good-1", "good-2"]
     assert usage_sink == [{"route_family": "commit_stats", "request_count": 3}]
+
+
+class _ConcurrentFakeClient:
+    """Per-commit detail fake that tracks how many calls overlap."""
+
+    def __init__(self, fail_sha: str | None = None) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_sha = fail_sha
+        self.totals_calls: list[list[str]] = []
+
+    async def get_commit_file_stats(self, owner, repo_name, sha):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if sha == self.fail_sha:
+                raise RateLimitException("secondary", retry_after_seconds=30.0)
+            return [
+                SimpleNamespace(
+                    commit_hash=sha,
+                    file_path=f"src/{sha}.py",
+                    additions=1,
+                    deletions=0,
+                    old_file_mode="unknown",
+                    new_file_mode="unknown",
+                )
+            ]
+        finally:
+            self.in_flight -= 1
+
+    async def get_commit_totals(self, owner, repo_name, shas, *, batch_size):
+        self.totals_calls.append(list(shas))
+        return [
+            SimpleNamespace(commit_hash=sha, additions=4, deletions=2)
+            for sha in shas
+            if sha != "gone"
+        ]
+
+    def drain_usage_observations(self):
+        return []
+
+    async def close(self):
+        return None
+
+
+def _fetch_with(monkeypatch, client, shas, **kwargs):
+    monkeypatch.setattr(
+        github, "_github_code_client_from_connector", lambda connector: client
+    )
+    return github._fetch_github_commit_stats_async(
+        connector=object(),
+        owner="acme",
+        repo_name="widgets",
+        raw_commits=[SimpleNamespace(sha=sha) for sha in shas],
+        repo_id="repo-1",
+        max_stats=len(shas),
+        **kwargs,
+    )
+
+
+def test_fetch_commit_stats_runs_a_bounded_pool_in_commit_order(monkeypatch):
+    client = _ConcurrentFakeClient()
+    shas = [f"sha-{i}" for i in range(12)]
+
+    stats = asyncio.run(
+        _fetch_with(monkeypatch, client, shas, gate=RateLimitGate(), concurrency=3)
+    )
+
+    assert client.max_in_flight == 3
+    assert [stat.commit_hash for stat in stats] == shas
+
+
+def test_fetch_commit_stats_streams_into_collector_in_batches(monkeypatch):
+    client = _ConcurrentFakeClient()
+    shas = [f"sha-{i}" for i in range(10)]
+    flushed: list[list[Any]] = []
+
+    async def _flush(batch):
+        flushed.append(batch)
+
+    async def _drive():
+        async with AsyncBatchCollector(_flush, batch_size=4) as collector:
+            returned = await _fetch_with(
+                monkeypatch, client, shas, gate=RateLimitGate(), collector=collector
+            )
+        return returned, collector.total
+
+    returned, total = asyncio.run(_drive())
+
+    assert returned == []
+    assert total == 10
+    assert [len(batch) for batch in flushed] == [4, 4, 2]
+    assert sorted(stat.commit_hash for batch in flushed for stat in batch) == sorted(
+        shas
+    )
+
+
+def test_fetch_commit_stats_rate_limit_penalizes_gate_and_stops_pool(monkeypatch):
+    client = _ConcurrentFakeClient(fail_sha="sha-1")
+    gate = RateLimitGate()
+
+    try:
+        asyncio.run(
+            _fetch_with(
+                monkeypatch,
+                client,
+                [f"sha-{i}" for i in range(40)],
+                gate=gate,
+                concurrency=4,
+            )
+        )
+    except RateLimitException as exc:
+        assert exc.retry_after_seconds == 30.0
+    else:
+        raise AssertionError("expected RateLimitException")
+
+    assert gate._sleep_seconds() > 25.0
+    assert client.in_flight == 0
+
+
+def test_fetch_commit_totals_batches_shas_into_aggregate_rows(monkeypatch):
+    client = _ConcurrentFakeClient()
+    shas = [f"sha-{i}" for i in range(120)] + ["gone"]
+
+    stats = asyncio.run(
+        _fetch_with(
+            monkeypatch,
+            client,
+            shas,
+            gate=RateLimitGate(),
+            detail=github.GitHubCommitStatDetail.TOTALS,
+        )
+    )
+
+    assert sorted(len(call) for call in client.totals_calls) == [21, 50, 50]
+    assert [stat.commit_hash for stat in stats] == shas[:-1]
+    assert {stat.file_path for stat in stats} == {AGGREGATE_STATS_MARKER}
+    assert {(stat.additions, stat.deletions) for stat in stats} == {(4, 2)}
+
+
+def test_fetch_commit_totals_graphql_rate_limit_penalizes_gate(monkeypatch):
+    from dev_health_ops.providers.github.graphql import raise_for_graphql_errors
+
+    class _RateLimitedTotalsClient(_ConcurrentFakeClient):
+        async def get_commit_totals(self, owner, repo_name, shas, *, batch_size):
+            self.totals_calls.append(list(shas))
+            raise_for_graphql_errors(
+                {"errors": [{"type": "RATE_LIMITED", "message": "rate limited"}]},
+                operation="commit_stats:POST /graphql",
+            )
+
+    client = _RateLimitedTotalsClient()
+    gate = RateLimitGate()
+
+    try:
+        asyncio.run(
+            _fetch_with(
+                monkeypatch,
+                client,
+                [f"sha-{i}" for i in range(120)],
+                gate=gate,
+                concurrency=1,
+                detail=github.GitHubCommitStatDetail.TOTALS,
+            )
+        )
+    except RateLimitException:
+        pass
+    else:
+        raise AssertionError("expected RateLimitException")
+
+    assert len(client.totals_calls) == 1
+    assert gate._sleep_seconds() > 0
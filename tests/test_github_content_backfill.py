@@ -607,6 +607,7 @@ class TestCommitStatsBackfill:
             max_stats,
             since_arg,
             usage_sink,
+            **_kwargs,
         ):
             stats_args.append((owner, repo_name, max_stats, since_arg))
             return [
@@ -980,6 +981,7 @@ class TestCommitStatsBackfill:
             max_stats,
             since_arg,
             usage_sink,
+            **_kwargs,
         ):
             stats_args.append(max_stats)
             return [
@@ -393,3 +393,41 @@ def test_jira_comments_error_handling() -> None:
         assert len(work_items) == 1
         # But no interactions due to error
         assert len(interactions) == 0
+
+
+def test_jira_iterator_yields_bounded_batches() -> None:
+    """Issues are yielded in ``batch_size`` slices, sprints in the last batch."""
+    from unittest.mock import MagicMock
+
+    from dev_health_ops.metrics.work_items import iter_jira_work_items_with_extras
+    from dev_health_ops.providers.status_mapping import StatusMapping
+
+    client = MagicMock()
+    client.iter_issues.return_value = [
+        {"key": f"TEST-{index}", "fields": {}} for index in range(5)
+    ]
+    client.iter_issue_comments.return_value = []
+
+    batches = list(
+        iter_jira_work_items_with_extras(
+            identity=IdentityResolver(alias_to_canonical={}),
+            status_mapping=StatusMapping(
+                status_by_provider={},
+                label_status_by_provider={},
+                type_by_provider={},
+                label_type_by_provider={},
+            ),
+            since=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            client=client,
+            use_env_query_options=False,
+            batch_size=2,
+        )
+    )
+
+    assert [len(batch.work_items) for batch in batches] == [2, 2, 1]
+    assert [batch.work_items[0].work_item_id for batch in batches] == [
+        "jira:TEST-0",
+        "jira:TEST-2",
+        "jira:TEST-4",
+    ]
+    client.close.assert_called_once_with()
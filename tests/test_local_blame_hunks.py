@@ -0,0 +1,179 @@
+"""Compact line-range blame and incremental re-blame for local repos."""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+from git import Actor
+from git import Repo as GitPythonRepo
+
+from dev_health_ops.models.git import GitBlame, GitBlameHunk, GitFile, Repo
+from dev_health_ops.processors.local import (
+    BLAME_MODE_HUNKS,
+    BLAME_MODE_LINES,
+    process_blame_hunks,
+    process_local_blame,
+    resolve_blame_mode,
+)
+
+ALICE = Actor("Alice", "alice@example.com")
+BOB = Actor("Bob", "bob@example.com")
+
+
+def _commit(repo: GitPythonRepo, files: dict[str, str | None], author: Actor) -> None:
+    root = Path(repo.working_tree_dir or "")
+    for name, content in files.items():
+        if content is None:
+            repo.index.remove([name], working_tree=True)
+            continue
+        (root / name).write_text(content)
+        repo.index.add([name])
+    repo.index.commit("change", author=author, committer=author)
+
+
+@pytest.fixture
+def local_repo(tmp_path: Path) -> GitPythonRepo:
+    repo = GitPythonRepo.init(tmp_path)
+    _commit(repo, {"a.py": "1\n2\n3\n4\n", "b.py": "x\n", "empty.txt": ""}, ALICE)
+    return repo
+
+
+class _HunkSink:
+    supports_blame_hunks = True
+
+    def __init__(self) -> None:
+        self.rows: list[GitBlameHunk] = []
+        self.prunes: list[list[str]] = []
+
+    async def get_blame_hunk_blobs(self, repo_id: Any) -> dict[str, str]:
+        # Rows are appended in sync order, so the last one per path wins.
+        return {hunk.path: hunk.blob_sha for hunk in self.rows}
+
+    async def insert_blame_hunks(self, hunks: list[GitBlameHunk]) -> None:
+        self.rows.extend(hunks)
+
+    async def prune_blame_hunks(
+        self, repo_id: Any, paths: list[str], synced_at: Any
+    ) -> None:
+        self.prunes.append(list(paths))
+        self.rows = [
+            hunk
+            for hunk in self.rows
+            if hunk.path not in paths or hunk.last_synced >= synced_at
+        ]
+
+
+class _LocalStore(_HunkSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.files: list[GitFile] = []
+        self.blame_lines: list[GitBlame] = []
+
+    async def insert_repo(self, repo: Repo) -> None:
+        return None
+
+    async def insert_git_file_data(self, files: list[GitFile]) -> None:
+        self.files.extend(files)
+
+    async def insert_blame_data(self, blame_data: list[GitBlame]) -> None:
+        self.blame_lines.extend(blame_data)
+
+
+def test_fetch_blame_hunks_merges_lines_by_commit(local_repo: GitPythonRepo) -> None:
+    _commit(local_repo, {"a.py": "1\nB\nC\n4\n"}, BOB)
+    root = str(local_repo.working_tree_dir)
+    repo_id = uuid.uuid4()
+
+    hunks = GitBlame.fetch_blame_hunks(root, f"{root}/a.py", repo_id, "sha-a")
+
+    assert [(h.start_line, h.line_count, h.author_name) for h in hunks] == [
+        (1, 1, "Alice"),
+        (2, 2, "Bob"),
+        (4, 1, "Alice"),
+    ]
+    assert all(h.blob_sha == "sha-a" and h.path == "a.py" for h in hunks)
+
+
+@pytest.mark.asyncio
+async def test_process_blame_hunks_reblames_only_changed_blobs(
+    local_repo: GitPythonRepo,
+) -> None:
+    root = str(local_repo.working_tree_dir)
+    repo = Repo(repo_path=root, repo="local", provider="local")
+    sink = _HunkSink()
+
+    await process_blame_hunks(repo, local_repo, sink, root)  # type: ignore[arg-type]
+    first = {h.path for h in sink.rows}
+    assert first == {"a.py", "b.py", "empty.txt"}
+    empty = [h for h in sink.rows if h.path == "empty.txt"]
+    assert [(h.line_count, bool(h.blob_sha)) for h in empty] == [(0, True)]
+
+    # Nothing changed: no rows are written.
+    written = len(sink.rows)
+    await process_blame_hunks(repo, local_repo, sink, root)  # type: ignore[arg-type]
+    assert len(sink.rows) == written
+
+    _commit(local_repo, {"a.py": "1\n2\n3\n4\n5\n", "b.py": None}, BOB)
+    await process_blame_hunks(repo, local_repo, sink, root)  # type: ignore[arg-type]
+    latest = [h for h in sink.rows if h.path in {"a.py", "b.py"}]
+    tombstone = [h for h in latest if h.path == "b.py"]
+    assert [(h.line_count, h.blob_sha) for h in tombstone] == [(0, "")]
+    # The previous generations of the rewritten files were pruned.
+    assert len({h.last_synced for h in latest}) == 1
+    assert [
+        (h.start_line, h.line_count, h.author_name) for h in latest if h.path == "a.py"
+    ] == [
+        (1, 4, "Alice"),
+        (5, 1, "Bob"),
+    ]
+    assert {h.path for h in sink.rows} == {"a.py", "b.py", "empty.txt"}
+
+
+@pytest.mark.asyncio
+async def test_process_blame_hunks_prunes_once_per_sync(
+    local_repo: GitPythonRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import dev_health_ops.processors.local as local_processor
+
+    monkeypatch.setattr(local_processor, "BATCH_SIZE", 1)
+    root = str(local_repo.working_tree_dir)
+    repo = Repo(repo_path=root, repo="local", provider="local")
+    sink = _HunkSink()
+
+    # A first sync has no older generations to delete.
+    await process_blame_hunks(repo, local_repo, sink, root)  # type: ignore[arg-type]
+    assert sink.prunes == []
+
+    _commit(local_repo, {"a.py": "0\n", "b.py": None, "c.py": "c\n"}, BOB)
+    await process_blame_hunks(repo, local_repo, sink, root)  # type: ignore[arg-type]
+    assert sink.prunes == [["b.py", "a.py"]]
+
+
+@pytest.mark.asyncio
+async def test_blame_only_compact_sync_writes_file_contents(
+    local_repo: GitPythonRepo,
+) -> None:
+    store = _LocalStore()
+
+    await process_local_blame(
+        store, str(local_repo.working_tree_dir), blame_mode=BLAME_MODE_HUNKS
+    )
+
+    contents = {f.path: f.contents for f in store.files}
+    assert contents["a.py"] == "1\n2\n3\n4\n"
+    assert not store.blame_lines
+    assert {h.path for h in store.rows} == {"a.py", "b.py", "empty.txt"}
+
+
+def test_resolve_blame_mode_falls_back_without_store_support(monkeypatch) -> None:
+    class _LinesOnly:
+        supports_blame_hunks = False
+
+    monkeypatch.setenv("LOCAL_BLAME_MODE", "hunks")
+    assert resolve_blame_mode(None, _HunkSink()) == BLAME_MODE_HUNKS  # type: ignore[arg-type]
+    assert resolve_blame_mode(None, _LinesOnly()) == BLAME_MODE_LINES  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        resolve_blame_mode("words", _HunkSink())  # type: ignore[arg-type]
@@ -0,0 +1,191 @@
+"""Tests for ``dev-hops maintenance sync-coverage-intervals``.
+
+Covers: verify-only reports unseeded history without writing, ``--apply``
+seeds the store and stamps folded runs, a hand-edited row is reported as a
+mismatch and repaired, and ``--org`` scoping.
+"""
+
+from __future__ import annotations
+
+import argparse
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from dev_health_ops.maintenance.sync_coverage_intervals import (
+    collect_reports,
+    run_sync_coverage_intervals,
+)
+from dev_health_ops.models import (
+    Base,
+    SyncCoverageIntervalState,
+    SyncRun,
+    SyncRunStatus,
+    SyncRunUnit,
+    SyncRunUnitStatus,
+)
+
+
+def _day(day: int) -> datetime:
+    return datetime(2026, 1, day, tzinfo=timezone.utc)
+
+
+def _new_db(tmp_path) -> str:
+    db_path = tmp_path / f"coverage-intervals-{uuid.uuid4().hex}.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return f"sqlite:///{db_path}"
+
+
+def _ns(db_uri: str, *, apply: bool, org: str | None = None) -> argparse.Namespace:
+    return argparse.Namespace(
+        db=db_uri, apply=apply, org=org, org_explicit=org is not None
+    )
+
+
+def _seed_run(
+    session: Session,
+    *,
+    org_id: str,
+    integration_id: uuid.UUID,
+    source_id: uuid.UUID,
+    units: list[tuple[int, int, str]],
+) -> SyncRun:
+    run = SyncRun(
+        org_id=org_id,
+        integration_id=integration_id,
+        triggered_by="manual",
+        mode="incremental",
+        status=SyncRunStatus.SUCCESS.value,
+        total_units=len(units),
+        completed_at=_day(max(before for _, before, _ in units)),
+    )
+    session.add(run)
+    session.flush()
+    for since, before, status in units:
+        session.add(
+            SyncRunUnit(
+                org_id=org_id,
+                sync_run_id=run.id,
+                integration_id=integration_id,
+                source_id=source_id,
+                provider="github",
+                dataset_key="commits",
+                cost_class="standard",
+                mode="incremental",
+                since_at=_day(since),
+                before_at=_day(before),
+                status=status,
+                attempts=1,
+            )
+        )
+    session.flush()
+    return run
+
+
+def _seed_org(db_uri: str) -> tuple[str, uuid.UUID]:
+    org_id = str(uuid.uuid4())
+    integration_id = uuid.uuid4()
+    source_id = uuid.uuid4()
+    engine = create_engine(db_uri)
+    with Session(engine) as session:
+        _seed_run(
+            session,
+            org_id=org_id,
+            integration_id=integration_id,
+            source_id=source_id,
+            units=[(1, 3, SyncRunUnitStatus.SUCCESS.value)],
+        )
+        _seed_run(
+            session,
+            org_id=org_id,
+            integration_id=integration_id,
+            source_id=source_id,
+            units=[(3, 5, SyncRunUnitStatus.FAILED.value)],
+        )
+        session.commit()
+    engine.dispose()
+    return org_id, integration_id
+
+
+def _stamped_runs(db_uri: str, org_id: str) -> int:
+    engine = create_engine(db_uri)
+    with Session(engine) as session:
+        count = (
+            session.query(SyncRun)
+            .filter(SyncRun.org_id == org_id, SyncRun.coverage_applied_at.is_not(None))
+            .count()
+        )
+    engine.dispose()
+    return count
+
+
+def test_verify_only_reports_unseeded_history_without_writing(tmp_path, capsys):
+    db_uri = _new_db(tmp_path)
+    org_id, _ = _seed_org(db_uri)
+
+    assert run_sync_coverage_intervals(_ns(db_uri, apply=False)) == 0
+    assert _stamped_runs(db_uri, org_id) == 0
+
+    # Verify folds only stamped runs; nothing is stamped yet, so nothing is
+    # claimed and nothing drifts.
+    assert "drifted" in capsys.readouterr().out
+
+
+def test_apply_seeds_the_store_and_verify_then_matches(tmp_path):
+    db_uri = _new_db(tmp_path)
+    org_id, _ = _seed_org(db_uri)
+
+    reports, had_failure = collect_reports(_ns(db_uri, apply=True))
+    assert had_failure is False
+    assert reports is not None
+    assert [drift.reason for drift in reports[0].drift] == ["missing"]
+    assert reports[0].rewritten is True
+    assert _stamped_runs(db_uri, org_id) == 2
+
+    engine = create_engine(db_uri)
+    with Session(engine) as session:
+        state = session.query(SyncCoverageIntervalState).one()
+        assert len(state.covered) == 1
+        assert len(state.failed) == 1
+        assert state.unit_count == 2
+    engine.dispose()
+
+    assert run_sync_coverage_intervals(_ns(db_uri, apply=False)) == 0
+
+
+def test_edited_row_is_reported_and_repaired(tmp_path):
+    db_uri = _new_db(tmp_path)
+    org_id, _ = _seed_org(db_uri)
+    collect_reports(_ns(db_uri, apply=True))
+    engine = create_engine(db_uri)
+    with Session(engine) as session:
+        session.query(SyncCoverageIntervalState).update({"failed": []})
+        session.commit()
+
+    reports, _ = collect_reports(_ns(db_uri, apply=False))
+    assert reports is not None
+    assert [drift.reason for drift in reports[0].drift] == ["mismatch"]
+    assert run_sync_coverage_intervals(_ns(db_uri, apply=False)) == 1
+
+    collect_reports(_ns(db_uri, apply=True))
+    with Session(engine) as session:
+        assert len(session.query(SyncCoverageIntervalState).one().failed) == 1
+    engine.dispose()
+    assert run_sync_coverage_intervals(_ns(db_uri, apply=False)) == 0
+
+
+def test_org_scope_limits_the_rebuild(tmp_path):
+    db_uri = _new_db(tmp_path)
+    org_a, _ = _seed_org(db_uri)
+    org_b, _ = _seed_org(db_uri)
+
+    reports, _ = collect_reports(_ns(db_uri, apply=True, org=org_a))
+
+    assert reports is not None
+    assert [report.org_id for report in reports] == [org_a]
+    assert _stamped_runs(db_uri, org_a) == 2
+    assert _stamped_runs(db_uri, org_b) == 0
@@ -172,8 +172,8 @@ class TestPostgresUpgrade:
         )
         scripts = ScriptDirectory.from_config(cfg)
 
-        assert set(scripts.get_heads()) == {"0066", "0107"}
-        assert scripts.get_revision("application_schema@head").revision == "0107"
+        assert set(scripts.get_heads()) == {"0066", "0109"}
+        assert scripts.get_revision("application_schema@head").revision == "0109"
         assert _database_has_revision(cfg, ("0096",), "0065")
         assert not _database_has_revision(cfg, ("0096",), "0066")
 
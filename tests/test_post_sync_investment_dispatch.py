@@ -94,9 +94,15 @@ def test_investment_chain_dispatched_with_git_and_work_items() -> None:
     assert daily_sig.sig_kwargs["kwargs"] == {"org_id": "org-123"}
     assert daily_sig.sig_kwargs["queue"] == "metrics"
     assert daily_sig.sig_kwargs.get("immutable") is True
-    assert build_sig.sig_kwargs["kwargs"] == {"org_id": "org-123"}
+    assert build_sig.sig_kwargs["kwargs"] == {
+        "org_id": "org-123",
+        "incremental": True,
+    }
     assert build_sig.sig_kwargs["queue"] == "metrics"
-    assert materialize_sig.sig_kwargs["kwargs"] == {"org_id": "org-123"}
+    assert materialize_sig.sig_kwargs["kwargs"] == {
+        "org_id": "org-123",
+        "incremental": True,
+    }
     assert materialize_sig.sig_kwargs["queue"] == "default"
 
     # Downstream steps are linked IMMUTABLE so a parent's return dict is not
@@ -149,7 +155,10 @@ def test_investment_chain_dispatched_with_work_items_only_jira() -> None:
     assert materialize_sig.task_name == _INVESTMENT_TASK
     assert daily_sig.sig_kwargs["kwargs"] == {"org_id": "org-123"}
     assert daily_sig.sig_kwargs.get("immutable") is True
-    assert materialize_sig.sig_kwargs["kwargs"] == {"org_id": "org-123"}
+    assert materialize_sig.sig_kwargs["kwargs"] == {
+        "org_id": "org-123",
+        "incremental": True,
+    }
     chain_instance.apply_async.assert_called_once_with()
 
 
@@ -212,11 +221,13 @@ def test_post_sync_dispatch_forwards_backfill_window() -> None:
 
     assert build_sig.sig_kwargs["kwargs"] == {
         "org_id": "org-123",
+        "incremental": True,
         "from_date": "2026-01-01T00:00:00+00:00",
         "to_date": "2026-01-15T00:00:00+00:00",
     }
     assert materialize_sig.sig_kwargs["kwargs"] == {
         "org_id": "org-123",
+        "incremental": True,
         "from_date": "2026-01-01",
         "to_date": "2026-01-14",
     }
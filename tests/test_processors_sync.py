@@ -32,6 +32,7 @@ def _ns(**overrides):
         max_repos=None,
         use_async=False,
         max_commits_per_repo=None,
+        commit_stats_detail="files",
         since=None,
         before=None,
         backfill=1,
@@ -132,6 +133,47 @@ async def test_sync_github_target_batch_mode_calls_batch_processor(monkeypatch):
     batch.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search", [None, "org/*"])
+async def test_sync_github_target_forwards_commit_stats_detail(monkeypatch, search):
+    ns = _ns(search=search, group="org", commit_stats_detail="totals")
+    single = AsyncMock()
+    batch = AsyncMock()
+
+    async def fake_run_with_store(_db_uri, _db_type, handler, org_id):
+        await handler(SimpleNamespace())
+
+    monkeypatch.setattr(sync_mod, "validate_sink", lambda _ns: None)
+    monkeypatch.setattr(sync_mod, "resolve_sink_uri", lambda _ns: "db-uri")
+    monkeypatch.setattr(sync_mod, "detect_db_type", lambda _uri: "clickhouse")
+    monkeypatch.setattr(sync_mod, "resolve_since_datetime", lambda _ns: None)
+    monkeypatch.setattr(sync_mod, "resolve_max_commits", lambda _ns: None)
+    monkeypatch.setattr(sync_mod, "run_with_store", fake_run_with_store)
+    monkeypatch.setattr(sync_mod, "process_github_repo", single)
+    monkeypatch.setattr(sync_mod, "process_github_repos_batch", batch)
+
+    await sync_mod.sync_github_target(ns, "git")
+
+    called = batch if search else single
+    assert (
+        called.await_args.kwargs["commit_stats_detail"]
+        is sync_mod.GitHubCommitStatDetail.TOTALS
+    )
+
+
+def test_commit_stats_detail_flag_defaults_to_files():
+    parser = argparse.ArgumentParser()
+    sync_mod._add_sync_target_args(parser)
+
+    default = parser.parse_args(["--provider", "github"])
+    totals = parser.parse_args(
+        ["--provider", "github", "--commit-stats-detail", "totals"]
+    )
+
+    assert default.commit_stats_detail == "files"
+    assert totals.commit_stats_detail == "totals"
+
+
 @pytest.mark.asyncio
 async def test_sync_github_target_requires_owner_repo_without_search(monkeypatch):
     ns = _ns(owner=None, repo=None, search=None)
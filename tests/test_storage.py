@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from datetime import date, datetime, timezone
 from typing import Any
@@ -838,7 +839,7 @@ async def test_clickhouse_store_context_manager_initializes_and_creates_tables()
 
         store = ClickHouseStore("clickhouse://localhost:8123/default")
         async with store as s:
-            assert s.client is mock_client
+            assert s.client.wrapped is mock_client
 
     get_client.assert_called_once_with(dsn="clickhouse://localhost:8123/default")
     # Expect 4 calls:
@@ -980,6 +981,70 @@ async def test_clickhouse_store_insert_repo_writes_under_self_org_id():
     assert matrix[0][org_id_idx] == "acme-corp"
 
 
+@pytest.mark.asyncio
+async def test_clickhouse_store_insert_blame_data_is_column_oriented():
+    repo_id = uuid.uuid4()
+    blame = [
+        {"repo_id": repo_id, "path": "a.py", "line_no": 1, "line": "x = 1"},
+        GitBlame(
+            repo_id=repo_id,
+            path="a.py",
+            line_no=2,
+            author_email="dev@example.com",
+            author_name="Dev",
+            author_when=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            commit_hash="abc",
+            line="y = 2",
+        ),
+    ]
+    store = ClickHouseStore("clickhouse://localhost:8123/default")
+    store.client = MagicMock()
+    store.org_id = "acme"
+
+    await store.insert_blame_data(blame)
+
+    args, kwargs = store.client.insert.call_args
+    assert args[0] == "git_blame"
+    assert kwargs["column_oriented"] is True
+    columns = dict(zip(kwargs["column_names"], args[1]))
+    assert columns["line_no"] == [1, 2]
+    assert columns["line"] == ["x = 1", "y = 2"]
+    assert columns["author_when"] == [None, datetime(2026, 1, 1)]
+    assert columns["org_id"] == ["acme", "acme"]
+
+
+@pytest.mark.asyncio
+async def test_clickhouse_store_concurrent_inserts_use_extra_clients():
+    import sys
+    import threading
+    from types import SimpleNamespace
+
+    started = threading.Barrier(2, timeout=5)
+
+    def _slow_insert(*_args, **_kwargs):
+        # Both inserts must be in flight at once to pass the barrier.
+        started.wait()
+
+    primary = MagicMock()
+    primary.insert = MagicMock(side_effect=_slow_insert)
+    extra = MagicMock()
+    extra.insert = MagicMock(side_effect=_slow_insert)
+    fake_clickhouse_connect = SimpleNamespace(get_client=MagicMock(return_value=extra))
+
+    store = ClickHouseStore("clickhouse://localhost:8123/default", insert_concurrency=2)
+    store.client = primary
+    with patch.dict(sys.modules, {"clickhouse_connect": fake_clickhouse_connect}):
+        await asyncio.gather(
+            store._insert_columns("t", {"a": [1]}),
+            store._insert_columns("t", {"a": [2]}),
+        )
+        await store.__aexit__(None, None, None)
+
+    assert primary.insert.call_count == 1
+    assert extra.insert.call_count == 1
+    extra.close.assert_called_once()
+
+
 # SQLite-specific Tests
 
 
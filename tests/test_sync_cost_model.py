@@ -0,0 +1,305 @@
+"""Learned per-dataset request cost model.
+
+Covers:
+  * decayed statistics: recent samples dominate, the upper bound is a
+    prediction bound on a single unit's cost, and thin keys are not learned.
+  * sample extraction from persisted ``budget_comparison`` rows: incomplete
+    and non-request dimensions are skipped, cost is per window-day.
+  * calibration replaces only learned route families.
+  * ``load_cost_model`` is inert when disabled and learns from SUCCESS units.
+  * the budget guard admits a unit on its learned cost that the static floor
+    would have deferred.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from dev_health_ops.models import Base, SyncRunUnitStatus
+from dev_health_ops.sync.budget_types import (
+    BudgetBucketKey,
+    BudgetDimension,
+    BudgetEstimate,
+)
+from dev_health_ops.sync.cost_model import (
+    LEARNED_CONFIDENCE,
+    CostModel,
+    CostModelKey,
+    CostSample,
+    LearnedCost,
+    cost_samples_from_unit,
+    learn_costs,
+    load_cost_model,
+)
+from tests._helpers import (
+    pin_provider_unit_routability,
+    seed_sync_dispatch_transport_routes,
+)
+from tests.test_budget_guard_cooldown import _sibling_unit
+from tests.test_sync_units import (
+    _patch_db_session,
+    _patch_worker_enqueues,
+    _seed_run,
+)
+
+NOW = datetime(2026, 6, 17, 12, 0, tzinfo=timezone.utc)
+KEY = CostModelKey(
+    org_id="org",
+    source_id="source",
+    dataset_key="commits",
+    route_family="git",
+    dimension="rest_core",
+)
+
+
+@pytest.fixture(autouse=True)
+def _routable_synthetic_pairs(monkeypatch):
+    pin_provider_unit_routability(monkeypatch)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed_sync_dispatch_transport_routes(session)
+        yield session
+    engine.dispose()
+
+
+def _sample(cost: float, *, age_days: float) -> CostSample:
+    return CostSample(
+        key=KEY,
+        cost_per_day=cost,
+        observed_at=NOW - timedelta(days=age_days),
+        bucket={"provider": "github", "dimension": "rest_core"},
+    )
+
+
+def _comparison(
+    requests: int, *, dimension: str = "rest_core", incomplete: bool = False
+) -> dict:
+    return {
+        "route_family": "git",
+        "dimension": dimension,
+        "estimated_units": 500,
+        "actual_requests": requests,
+        "rate_limited_requests": requests,
+        "incomplete": incomplete,
+        "bucket": {"provider": "github", "dimension": dimension},
+    }
+
+
+def _estimate(org_id: str, units: int) -> BudgetEstimate:
+    return BudgetEstimate(
+        bucket=BudgetBucketKey(
+            provider="github",
+            org_id=str(org_id),
+            host="api.github.com",
+            credential_fingerprint="fp",
+            dimension=BudgetDimension.REST_CORE,
+        ),
+        estimated_units=units,
+        confidence="high",
+        route_family="git",
+    )
+
+
+def test_learn_costs_weights_recent_samples_and_bounds_above_the_mean():
+    learned = learn_costs(
+        [_sample(100.0, age_days=70), *(_sample(10.0, age_days=0) for _ in range(4))],
+        now=NOW,
+        half_life_days=7,
+        min_samples=3,
+    )
+
+    cost = learned[KEY]
+    # Ten half-lives old: the stale expensive sample barely moves the mean.
+    assert 10.0 < cost.mean_per_day < 10.1
+    assert cost.upper_per_day > cost.mean_per_day
+    assert cost.effective_samples == pytest.approx(4.0, abs=0.01)
+    assert cost.units_for_span(3) == pytest.approx(3 * cost.upper_per_day, abs=1)
+
+
+def test_learn_costs_upper_bound_covers_single_units_of_a_noisy_history():
+    # Units alternate between nearly free and expensive: the mean is tightly
+    # known after 40 samples, but half of the units cost twice the mean.
+    history = [_sample(0.0 if i % 2 else 100.0, age_days=0) for i in range(40)]
+
+    cost = learn_costs(history, now=NOW, half_life_days=7, min_samples=3)[KEY]
+
+    assert cost.mean_per_day == pytest.approx(50.0)
+    assert cost.stddev_per_day == pytest.approx(50.0)
+    assert cost.upper_per_day == pytest.approx(50.0 + 1.645 * 50.0 * (1.025**0.5))
+    over = [s for s in history if s.cost_per_day > cost.upper_per_day]
+    assert over == []
+
+
+def test_learn_costs_skips_keys_below_min_effective_samples():
+    samples = [_sample(10.0, age_days=0), _sample(12.0, age_days=0)]
+
+    assert learn_costs(samples, now=NOW, min_samples=3) == {}
+    assert KEY in learn_costs(samples, now=NOW, min_samples=2)
+
+
+def test_cost_samples_skip_incomplete_and_non_request_dimensions(db_session):
+    run, unit = _seed_run(db_session)
+    unit.since_at = NOW - timedelta(days=4)
+    unit.before_at = NOW
+    unit.result = {
+        "observations": {
+            "budget_comparison": [
+                _comparison(40),
+                _comparison(999, incomplete=True),
+                _comparison(999, dimension="graphql"),
+            ]
+        }
+    }
+
+    samples = cost_samples_from_unit(unit)
+
+    assert [(s.key.route_family, s.cost_per_day) for s in samples] == [("git", 10.0)]
+    assert samples[0].key.source_id == str(unit.source_id)
+
+
+def test_calibrate_replaces_only_learned_route_families():
+    model = CostModel(
+        {
+            KEY: LearnedCost(
+                mean_per_day=4.0,
+                stddev_per_day=1.0,
+                effective_samples=4.0,
+                upper_per_day=5.0,
+                bucket={},
+            )
+        }
+    )
+    learned = _estimate("org", 500)
+    untouched = BudgetEstimate(
+        bucket=learned.bucket,
+        estimated_units=50,
+        confidence="medium",
+        route_family="pull_requests",
+    )
+
+    calibrated = model.calibrate(
+        (learned, untouched),
+        org_id="org",
+        source_id="source",
+        dataset_key="commits",
+        span_days=3,
+    )
+
+    assert calibrated[0].estimated_units == 15
+    assert calibrated[0].confidence == LEARNED_CONFIDENCE
+    assert "static estimate was 500" in calibrated[0].notes[-1]
+    assert calibrated[1] is untouched
+
+
+def test_load_cost_model_is_inert_when_disabled(monkeypatch):
+    monkeypatch.delenv("SYNC_COST_MODEL_ENABLED", raising=False)
+
+    # No session is needed: a disabled model never queries.
+    assert load_cost_model(None, org_ids=["org"]) is None  # type: ignore[arg-type]
+
+
+def _seed_history(db_session, run, template, *, dataset_key: str, requests: int):
+    for _ in range(3):
+        db_session.add(
+            _sibling_unit(
+                run,
+                template,
+                dataset_key=dataset_key,
+                status=SyncRunUnitStatus.SUCCESS.value,
+                result={"observations": {"budget_comparison": [_comparison(requests)]}},
+            )
+        )
+    db_session.flush()
+
+
+def test_load_cost_model_learns_from_success_units(db_session, monkeypatch):
+    monkeypatch.setenv("SYNC_COST_MODEL_ENABLED", "true")
+    run, unit = _seed_run(db_session)
+    _seed_history(db_session, run, unit, dataset_key="commits", requests=6)
+
+    model = load_cost_model(db_session, org_ids=[run.org_id])
+
+    assert model is not None
+    learned = model.for_dataset(
+        org_id=str(run.org_id), source_id=str(unit.source_id), dataset_key="commits"
+    )
+    assert learned[("git", "rest_core")].upper_per_day == pytest.approx(6.0)
+
+
+def test_load_cost_model_reuses_the_run_model_until_it_expires(db_session, monkeypatch):
+    monkeypatch.setenv("SYNC_COST_MODEL_ENABLED", "true")
+    run, unit = _seed_run(db_session)
+    _seed_history(db_session, run, unit, dataset_key="commits", requests=6)
+
+    first = load_cost_model(db_session, org_ids=[run.org_id], cache_key=str(run.id))
+    _seed_history(db_session, run, unit, dataset_key="tags", requests=6)
+    second = load_cost_model(db_session, org_ids=[run.org_id], cache_key=str(run.id))
+    uncached = load_cost_model(db_session, org_ids=[run.org_id])
+
+    assert first is not None and second is first
+    assert uncached is not None and uncached is not first
+    assert uncached.for_dataset(
+        org_id=str(run.org_id), source_id=str(unit.source_id), dataset_key="tags"
+    )
+
+    monkeypatch.setenv("SYNC_COST_MODEL_CACHE_SECONDS", "0")
+    expiring = load_cost_model(db_session, org_ids=[run.org_id], cache_key="other")
+    assert (
+        load_cost_model(db_session, org_ids=[run.org_id], cache_key="other")
+        is not expiring
+    )
+
+
+def test_failed_load_leaves_the_session_usable(db_session, monkeypatch):
+    monkeypatch.setenv("SYNC_COST_MODEL_ENABLED", "true")
+    run, _unit = _seed_run(db_session)
+    db_session.execute(text("DROP TABLE sync_run_units"))
+
+    assert load_cost_model(db_session, org_ids=[run.org_id]) is None
+    assert db_session.execute(text("SELECT 1")).scalar() == 1
+
+
+@pytest.mark.parametrize("enabled,queued", [("false", 1), ("true", 2)])
+def test_guard_admits_on_learned_cost(db_session, monkeypatch, enabled, queued):
+    """Two units whose static floors (60 each) overfill a 100-unit bucket.
+
+    History shows each actually spends about 6 requests a day, so with the
+    model on both fit; with it off the second is deferred exactly as before.
+    """
+    from dev_health_ops.sync import budget_guard
+    from dev_health_ops.workers import sync_units
+
+    run, alpha = _seed_run(db_session)
+    alpha.dataset_key = "alpha"
+    beta = _sibling_unit(
+        run, alpha, dataset_key="beta", processor_flags={"sync_git": True}
+    )
+    run.total_units = 2
+    db_session.add(beta)
+    db_session.flush()
+    _seed_history(db_session, run, alpha, dataset_key="alpha", requests=6)
+    _seed_history(db_session, run, alpha, dataset_key="beta", requests=6)
+
+    monkeypatch.setattr(
+        budget_guard,
+        "estimate_provider_budget",
+        lambda ctx: (_estimate(run.org_id, 60),),
+    )
+    monkeypatch.setenv("SYNC_COST_MODEL_ENABLED", enabled)
+    monkeypatch.setenv("SYNC_BUDGET_BUCKET_LIMITS", '{"github:rest_core": 100}')
+    monkeypatch.setenv("SYNC_BUDGET_DEFERRAL_JITTER_SECONDS", "0")
+    _patch_db_session(monkeypatch, db_session)
+    _patch_worker_enqueues(monkeypatch)
+
+    result = sync_units.dispatch_sync_run(str(run.id))
+
+    assert result == {"status": "dispatched", "queued_units": queued}
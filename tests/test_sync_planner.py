@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import create_engine, event, text
@@ -26,6 +26,7 @@ from dev_health_ops.models import (
 from dev_health_ops.models.licensing import OrgLicense
 from dev_health_ops.models.users import Organization
 from dev_health_ops.sync import planner
+from dev_health_ops.sync.cost_model import CostModel, CostModelKey, LearnedCost
 from dev_health_ops.sync.dispatch_outbox import (
     OUTBOX_KIND_DISCOVERY,
     OUTBOX_STATUS_PENDING,
@@ -2328,6 +2329,109 @@ def test_open_start_window_is_never_capped_even_when_heavy(db_session, monkeypat
     )
 
 
+def _learned_commit_stats_model(source_id: str, *, per_day: float) -> CostModel:
+    key = CostModelKey(
+        org_id=ORG_ID,
+        source_id=source_id,
+        dataset_key=_HEAVY_DATASET,
+        route_family="git",
+        dimension="rest_core",
+    )
+    return CostModel(
+        {
+            key: LearnedCost(
+                mean_per_day=per_day,
+                stddev_per_day=0.0,
+                effective_samples=5.0,
+                upper_per_day=per_day,
+                bucket={"provider": "github", "dimension": "rest_core"},
+            )
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "per_day,expected_days",
+    [
+        # 0.5 * 1000 / 25 = 20 days: a cheap dataset ratchets past the cap.
+        (25.0, 20),
+        # 0.5 * 1000 / 250 = 2 days: an expensive one gets a narrower window.
+        (250.0, 2),
+        # 0.5 * 1000 / 5 = 100 days, clamped to the 30-day learned ceiling.
+        (5.0, 30),
+    ],
+)
+def test_learned_cost_sizes_the_heavy_window(
+    db_session, monkeypatch, per_day, expected_days
+):
+    monkeypatch.delenv("SYNC_INCREMENTAL_HEAVY_MAX_WINDOW_DAYS", raising=False)
+    monkeypatch.delenv("SYNC_COST_MODEL_WINDOW_BUDGET_FRACTION", raising=False)
+    monkeypatch.delenv("SYNC_COST_MODEL_MAX_WINDOW_DAYS", raising=False)
+    monkeypatch.setenv("SYNC_WATERMARK_OVERLAP", "0")
+    monkeypatch.setenv("SYNC_BUDGET_BUCKET_LIMITS", '{"github:rest_core": 1000}')
+
+    integration = _create_integration(db_session)
+    integration.config = {"initial_sync_depth": _ORACLE_DEPTH_DAYS}
+    db_session.flush()
+    source = _create_source(
+        db_session, integration, external_id="full-chaos/dev-health"
+    )
+    dataset = _create_dataset(db_session, integration, _HEAVY_DATASET)
+
+    from dev_health_ops.sync.datasets import get_dataset_spec
+
+    windows = planner._resolve_windows(
+        session=db_session,
+        request=SyncPlanRequest(
+            integration_id=str(integration.id),
+            org_id=ORG_ID,
+            mode=SyncRunMode.INCREMENTAL.value,
+            triggered_by="scheduled",
+        ),
+        mode=SyncRunMode.INCREMENTAL.value,
+        org_id=ORG_ID,
+        source_provider="github",
+        watermark_source_key=source.external_id,
+        dataset_key=_HEAVY_DATASET,
+        watermark_behavior=get_dataset_spec(
+            "github", _HEAVY_DATASET
+        ).watermark_behavior,
+        now=_ORACLE_NOW,
+        integration=integration,
+        dataset=dataset,
+        cost_model=_learned_commit_stats_model(str(source.id), per_day=per_day),
+        source_id=str(source.id),
+    )
+
+    assert windows == (
+        (
+            _ORACLE_COLD_START,
+            min(_ORACLE_NOW, _ORACLE_COLD_START + timedelta(days=expected_days)),
+        ),
+    )
+
+
+def test_learned_cost_without_a_configured_limit_keeps_the_static_cap(
+    monkeypatch,
+):
+    """The default limit is a ceiling, not a measured budget: never fill it."""
+    monkeypatch.delenv("SYNC_BUDGET_BUCKET_LIMITS", raising=False)
+    model = _learned_commit_stats_model("source-1", per_day=1.0)
+
+    assert (
+        planner._learned_heavy_window_days(
+            model, org_id=ORG_ID, source_id="source-1", dataset_key=_HEAVY_DATASET
+        )
+        is None
+    )
+    assert (
+        planner._learned_heavy_window_days(
+            model, org_id=ORG_ID, source_id="other", dataset_key=_HEAVY_DATASET
+        )
+        is None
+    )
+
+
 def test_ratchet_contract_table_covers_every_heavy_dataset_key(db_session):
     """The cap is a COST-CLASS rule, not a per-key list.
 
@@ -529,6 +529,192 @@ class TestDispatchErrorIsolation:
         dispatch_mock.apply_async.assert_not_called()
         assert db_session.query(SyncDispatchOutbox).count() == 1
 
+    def test_scan_mode_commits_each_dispatch(self, monkeypatch, db_session):
+        monkeypatch.delenv("SYNC_SCHEDULER_DUE_INDEX_ENABLED", raising=False)
+        now = datetime.now(timezone.utc)
+        for name in ("first-config", "second-config"):
+            config = _make_config(db_session, name=name, last_sync_at=now - 2 * HOUR)
+            db_session.add(_make_job(config))
+        db_session.flush()
+
+        outbox_at_commit: list[int] = []
+        real_commit = db_session.commit
+
+        def commit() -> None:
+            outbox_at_commit.append(db_session.query(SyncDispatchOutbox).count())
+            real_commit()
+
+        monkeypatch.setattr(db_session, "commit", commit)
+        task, _dispatch_mock = _run_dispatch(monkeypatch, db_session)
+
+        result = _call(task)
+
+        assert len(result["dispatched"]) == 2
+        assert outbox_at_commit[:2] == [1, 2]
+
+
+class TestDueIndex:
+    """``SYNC_SCHEDULER_DUE_INDEX_ENABLED``: only configs whose indexed
+    ``next_due_at`` has passed are evaluated, and every evaluation stamps the
+    next one."""
+
+    @pytest.fixture(autouse=True)
+    def _enable(self, monkeypatch):
+        monkeypatch.setenv("SYNC_SCHEDULER_DUE_INDEX_ENABLED", "true")
+        monkeypatch.delenv("SYNC_SCHEDULER_DUE_BATCH_SIZE", raising=False)
+        monkeypatch.delenv("SYNC_SCHEDULER_DUE_RECHECK_SECONDS", raising=False)
+
+    @staticmethod
+    def _evaluated(result: dict) -> int:
+        return len(result["dispatched"]) + result["skipped"] + result["errors"]
+
+    def test_dispatch_stamps_next_occurrence_and_next_tick_skips_the_scan(
+        self, monkeypatch, db_session
+    ):
+        now = datetime.now(timezone.utc)
+        due = _make_config(db_session, name="due", last_sync_at=now - 2 * HOUR)
+        later = _make_config(
+            db_session, name="later", last_sync_at=now - timedelta(minutes=30)
+        )
+        db_session.add_all([_make_job(due), _make_job(later)])
+        db_session.flush()
+        updated_at = later.updated_at
+
+        task, _ = _run_dispatch(monkeypatch, db_session)
+
+        first = _call(task)
+        assert first["dispatched"] == [str(due.id)]
+        db_session.refresh(due)
+        db_session.refresh(later)
+        assert _aware(due.next_due_at) > now
+        # Not due yet: indexed at its own next cron occurrence.
+        assert _aware(later.next_due_at) == _aware(later.last_sync_at) + HOUR
+        # Index bookkeeping is not a user-visible modification.
+        assert _aware(later.updated_at) == _aware(updated_at)
+
+        second = _call(task)
+        assert self._evaluated(second) == 0
+        assert db_session.query(SyncDispatchOutbox).count() == 1
+
+    def test_config_due_by_its_index_is_evaluated_again(self, monkeypatch, db_session):
+        now = datetime.now(timezone.utc)
+        config = _make_config(db_session, last_sync_at=now - 2 * HOUR)
+        db_session.add(_make_job(config))
+        db_session.flush()
+        task, _ = _run_dispatch(monkeypatch, db_session)
+        _call(task)
+
+        # A run completed and the next occurrence arrived.
+        job = db_session.query(ScheduledJob).one()
+        job.next_run_at = now - timedelta(seconds=1)
+        config.last_sync_at = now - HOUR - timedelta(seconds=10)
+        config.next_due_at = now - timedelta(seconds=1)
+        db_session.flush()
+
+        result = _call(task)
+        assert result["dispatched"] == [str(config.id)]
+
+    def test_manual_only_config_is_parked_until_the_recheck_horizon(
+        self, monkeypatch, db_session
+    ):
+        monkeypatch.setenv("SYNC_SCHEDULER_DUE_RECHECK_SECONDS", "600")
+        now = datetime.now(timezone.utc)
+        config = _make_config(
+            db_session,
+            last_sync_at=now - 2 * HOUR,
+            sync_options={"owner": "org", "repo": "repo"},
+        )
+        task, _ = _run_dispatch(monkeypatch, db_session)
+
+        result = _call(task)
+
+        assert result["dispatched"] == []
+        db_session.refresh(config)
+        horizon = _aware(config.next_due_at) - now
+        assert timedelta(seconds=590) < horizon < timedelta(seconds=610)
+
+    def test_batch_size_bounds_each_tick_oldest_first(self, monkeypatch, db_session):
+        monkeypatch.setenv("SYNC_SCHEDULER_DUE_BATCH_SIZE", "2")
+        now = datetime.now(timezone.utc)
+        configs = [
+            _make_config(
+                db_session,
+                name=f"config-{index}",
+                last_sync_at=now - timedelta(minutes=30),
+            )
+            for index in range(3)
+        ]
+        configs[2].next_due_at = now - timedelta(minutes=5)
+        db_session.flush()
+        task, _ = _run_dispatch(monkeypatch, db_session)
+
+        first = _call(task)
+        assert self._evaluated(first) == 2
+        db_session.expire_all()
+        # Unindexed (NULL) rows sort first; the indexed one waits its turn.
+        assert _aware(configs[2].next_due_at) < now
+
+        second = _call(task)
+        assert self._evaluated(second) == 1
+        db_session.expire_all()
+        assert all(_aware(config.next_due_at) > now for config in configs)
+
+    def test_failed_config_keeps_earlier_stamps_and_backs_off(
+        self, monkeypatch, db_session
+    ):
+        from dev_health_ops.sync import execution_trigger
+
+        monkeypatch.setenv("SYNC_SCHEDULER_DUE_FAILURE_BACKOFF_SECONDS", "300")
+        now = datetime.now(timezone.utc)
+        waiting = _make_config(
+            db_session, name="waiting", last_sync_at=now - timedelta(minutes=30)
+        )
+        failing = _make_config(db_session, name="failing", last_sync_at=now - 2 * HOUR)
+        waiting.next_due_at = now - timedelta(minutes=10)
+        failing.next_due_at = now - timedelta(minutes=5)
+        db_session.add_all([_make_job(waiting), _make_job(failing)])
+        db_session.flush()
+        task, _ = _run_dispatch(monkeypatch, db_session)
+
+        def fail_plan(*_args, **_kwargs):
+            raise RuntimeError("injected planner failure")
+
+        monkeypatch.setattr(execution_trigger, "plan_sync_run", fail_plan)
+        first = _call(task)
+
+        assert first["skipped"] == 2
+        db_session.expire_all()
+        # The failure rolled back only its own savepoint.
+        assert _aware(waiting.next_due_at) == _aware(waiting.last_sync_at) + HOUR
+        backoff = _aware(failing.next_due_at) - now
+        assert timedelta(seconds=290) < backoff < timedelta(seconds=310)
+        assert db_session.query(ScheduledSyncOccurrence).count() == 0
+
+        second = _call(task)
+        assert self._evaluated(second) == 0
+
+    def test_config_that_raises_is_backed_off(self, monkeypatch, db_session):
+        now = datetime.now(timezone.utc)
+        bad = _make_config(db_session, name="bad", last_sync_at=now - 2 * HOUR)
+        good = _make_config(db_session, name="good", last_sync_at=now - 2 * HOUR)
+        bad.next_due_at = now - timedelta(minutes=10)
+        good.next_due_at = now - timedelta(minutes=5)
+        db_session.add_all([_make_job(bad, schedule_cron="BAD"), _make_job(good)])
+        db_session.flush()
+        task, _ = _run_dispatch(monkeypatch, db_session)
+
+        first = _call(task)
+
+        assert first["errors"] == 1
+        assert first["dispatched"] == [str(good.id)]
+        db_session.expire_all()
+        backoff = _aware(bad.next_due_at) - now
+        assert timedelta(seconds=290) < backoff < timedelta(seconds=310)
+        assert db_session.query(SyncDispatchOutbox).count() == 1
+
+        second = _call(task)
+        assert self._evaluated(second) == 0
+
 
 def test_scheduled_occurrence_identity_matches_go_golden() -> None:
     occurrence_id = scheduled_sync_occurrence_identity(
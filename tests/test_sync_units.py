@@ -30,6 +30,7 @@ from dev_health_ops.models import (
     SyncComputeCheckpointStatus,
     SyncComputeType,
     SyncConfiguration,
+    SyncCoverageIntervalState,
     SyncCoverageProjection,
     SyncDispatchOutbox,
     SyncRun,
@@ -2051,6 +2052,29 @@ def test_finalize_once_only_dispatches_metrics_once(db_session, monkeypatch):
     assert projection.invalidated_at is not None
 
 
+def test_finalize_folds_units_into_coverage_interval_store(db_session, monkeypatch):
+    from dev_health_ops.workers import sync_units
+
+    run, unit = _seed_run(db_session)
+    unit.since_at = unit.before_at - timedelta(days=2)
+    unit.status = SyncRunUnitStatus.SUCCESS.value
+    db_session.flush()
+    _patch_db_session(monkeypatch, db_session)
+
+    assert sync_units.finalize_sync_run(str(run.id))["status"] == "finalized"
+    assert sync_units.finalize_sync_run(str(run.id))["status"] == ("already_dispatched")
+
+    db_session.refresh(run)
+    state = db_session.query(SyncCoverageIntervalState).one()
+    assert run.coverage_applied_at is not None
+    assert (state.source_id, state.dataset_key) == (unit.source_id, "commits")
+    assert state.covered == state.requested
+    assert len(state.covered) == 1
+    assert state.failed == []
+    assert state.last_unit_id == unit.id
+    assert state.unit_count == 1
+
+
 def test_finalize_aggregates_partial_failed(db_session, monkeypatch):
     from dev_health_ops.workers import sync_units
 
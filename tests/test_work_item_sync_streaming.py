@@ -0,0 +1,169 @@
+"""``run_work_items_sync_job`` writes raw provider rows in bounded chunks.
+
+Provider batches are stamped with the org and written as they arrive; only
+description-free item summaries, transitions and dependency edges reach the
+derived-table computes.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+import dev_health_ops.metrics.job_work_items as job
+from dev_health_ops.models.work_items import (
+    WorkItem,
+    WorkItemDependency,
+    WorkItemInteractionEvent,
+    WorkItemStatusTransition,
+)
+from dev_health_ops.providers.base import ProviderBatch
+
+BASE = datetime(2026, 5, 1, 9, tzinfo=timezone.utc)
+
+
+class _Classifier:
+    def __init__(self, *_args: object, **_kwargs: object) -> None:
+        pass
+
+
+class _RecordingSink:
+    def __init__(self, _dsn: str) -> None:
+        self.org_id = ""
+        self.writes: dict[str, list[list[Any]]] = {}
+
+    def ensure_tables(self) -> None:
+        return None
+
+    def query_dicts(self, _query: str, _params: dict[str, object]) -> list[Any]:
+        return []
+
+    def close(self) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("write_"):
+            return lambda rows: self.writes.setdefault(name, []).append(list(rows))
+        raise AttributeError(name)
+
+
+def _batch(start: int, count: int) -> ProviderBatch:
+    batch = ProviderBatch()
+    for index in range(start, start + count):
+        work_item_id = f"jira:ABC-{index}"
+        batch.work_items.append(
+            WorkItem(
+                work_item_id=work_item_id,
+                provider="jira",
+                title=f"Item {index}",
+                type="task",
+                status="in_progress",
+                status_raw="In Progress",
+                description="x" * 1000,
+                project_key="ABC",
+                created_at=BASE,
+                updated_at=BASE,
+                started_at=BASE + timedelta(hours=1),
+            )
+        )
+        batch.status_transitions.append(
+            WorkItemStatusTransition(
+                work_item_id=work_item_id,
+                provider="jira",
+                occurred_at=BASE + timedelta(hours=1),
+                from_status_raw="To Do",
+                to_status_raw="In Progress",
+                from_status="todo",
+                to_status="in_progress",
+                actor=None,
+            )
+        )
+        batch.dependencies.append(
+            WorkItemDependency(
+                source_work_item_id=work_item_id,
+                target_work_item_id="jira:ABC-0",
+                relationship_type="relates_to",
+                relationship_type_raw="relates to",
+            )
+        )
+        batch.interactions.append(
+            WorkItemInteractionEvent(
+                work_item_id=work_item_id,
+                provider="jira",
+                interaction_type="comment",
+                occurred_at=BASE,
+                actor=None,
+                body_length=12,
+            )
+        )
+    return batch
+
+
+def test_provider_batches_are_written_in_stamped_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    org_id = str(uuid.uuid4())
+    sink = _RecordingSink("clickhouse://test")
+    computed: list[list[WorkItem]] = []
+
+    def _compute_metrics(**kwargs: Any) -> tuple[list, list, list]:
+        computed.append(list(kwargs["work_items"]))
+        return [], [], []
+
+    monkeypatch.setattr(job, "ClickHouseMetricsSink", lambda _dsn: sink)
+    monkeypatch.setattr(job, "InvestmentClassifier", _Classifier)
+    monkeypatch.setattr(job, "_discover_repos", lambda **_kwargs: [])
+    monkeypatch.setattr(job, "_build_jira_work_client", lambda **_kwargs: object())
+    monkeypatch.setattr(
+        job,
+        "iter_jira_work_items_with_extras",
+        lambda **_kwargs: iter([_batch(0, 7), _batch(7, 7), _batch(14, 3)]),
+    )
+    monkeypatch.setattr(job, "compute_work_item_metrics_daily", _compute_metrics)
+    monkeypatch.setattr(
+        job, "compute_estimate_coverage_metrics_daily", lambda **_kwargs: []
+    )
+    monkeypatch.setattr(
+        job, "compute_work_item_team_attributions", lambda **_kwargs: []
+    )
+    monkeypatch.setattr(
+        job, "compute_work_item_state_durations_daily", lambda **_kwargs: []
+    )
+    monkeypatch.setattr(
+        job,
+        "compute_work_item_engine_destinations_daily",
+        lambda **_kwargs: ([], [], []),
+    )
+
+    run_job: Any = job.run_work_items_sync_job
+    run_job(
+        db_url="clickhouse://test",
+        day=date(2026, 5, 2),
+        backfill_days=2,
+        provider="jira",
+        org_id=org_id,
+        chunk_size=5,
+    )
+
+    for writer in (
+        "write_work_items",
+        "write_work_item_transitions",
+        "write_work_item_dependencies",
+        "write_work_item_interactions",
+    ):
+        chunks = sink.writes[writer]
+        assert [len(chunk) for chunk in chunks] == [5, 5, 5, 2]
+        assert {row.org_id for chunk in chunks for row in chunk} == {org_id}
+    written = [row for chunk in sink.writes["write_work_items"] for row in chunk]
+    assert all(row.description == "x" * 1000 for row in written)
+
+    assert len(computed) == 2
+    summaries = computed[0]
+    assert [item.work_item_id for item in summaries] == [
+        f"jira:ABC-{index}" for index in range(17)
+    ]
+    assert {item.description for item in summaries} == {None}
+    assert {item.org_id for item in summaries} == {org_id}
@@ -18,9 +18,12 @@ from uuid import uuid4
 
 import pytest
 
-from dev_health_ops.connectors.utils.safe_archive import iter_zip_members
+from dev_health_ops.connectors.utils.safe_archive import (
+    iter_zip_member_files,
+    iter_zip_members,
+)
 from dev_health_ops.parsers import junit as junit_parser
-from dev_health_ops.parsers.junit import parse_junit_xml
+from dev_health_ops.parsers.junit import iter_junit_suites, parse_junit_xml
 from dev_health_ops.processors.testops_ingest import (
     _coverage_is_coherent,
     classify_report,
@@ -62,6 +65,37 @@ def test_junit_enforces_size_cap(monkeypatch: pytest.MonkeyPatch) -> None:
         parse_junit_xml('<testsuite name="way-too-long-to-fit"/>')
 
 
+def test_junit_streams_suites_in_document_order() -> None:
+    report = io.BytesIO(
+        b'<testsuites><testsuite name="outer"><testcase name="a"/>'
+        b'<testsuite name="inner"><testcase name="b"><error/></testcase>'
+        b"</testsuite></testsuite>"
+        b'<testsuite name="empty"/>'
+        b'<testsuite name="last"><testcase name="c"/></testsuite></testsuites>'
+    )
+    suites = iter_junit_suites(report)
+
+    first = next(suites)
+    assert (first.suite_name, [case.case_name for case in first.cases]) == (
+        "outer",
+        ["a"],
+    )
+    assert [(suite.suite_name, suite.error_count) for suite in suites] == [
+        ("inner", 1),
+        ("last", 0),
+    ]
+
+
+def test_junit_stream_rejects_dtd() -> None:
+    xxe = (
+        b'<?xml version="1.0"?>'
+        b'<!DOCTYPE t [<!ENTITY x SYSTEM "file:///etc/passwd">]>'
+        b'<testsuite name="s"><testcase name="a">&x;</testcase></testsuite>'
+    )
+    with pytest.raises(Exception):
+        list(iter_junit_suites(io.BytesIO(xxe)))
+
+
 # --------------------------------------------------------------------------- #
 # Safe ZIP reading                                                            #
 # --------------------------------------------------------------------------- #
@@ -99,6 +133,20 @@ def test_zip_reader_skips_oversized_members() -> None:
     assert members == []
 
 
+def test_zip_member_files_are_spooled_and_capped() -> None:
+    data = _zip({"ok.xml": "<testsuite/>", "big.xml": "A" * 5000})
+    members = list(
+        iter_zip_member_files(
+            io.BytesIO(data),
+            name_filter=lambda n: n.endswith(".xml"),
+            max_file_bytes=100,
+        )
+    )
+    assert [name for name, _ in members] == ["ok.xml"]
+    assert members[0][1].read() == b"<testsuite/>"
+    members[0][1].close()
+
+
 # --------------------------------------------------------------------------- #
 # GitLab native test_report JSON                                              #
 # --------------------------------------------------------------------------- #
@@ -228,6 +276,158 @@ async def test_ingest_report_members_routes_junit_and_coverage() -> None:
     assert len(coverage) == 1
 
 
+@pytest.mark.asyncio
+async def test_ingest_report_members_streams_and_closes_member_files() -> None:
+    data = _zip(
+        {
+            "junit.xml": '<testsuite name="s"><testcase name="a"/></testsuite>',
+            "lcov.info": "TN:\nSF:services/api/app.py\nDA:1,1\nend_of_record\n",
+        }
+    )
+    members = list(iter_zip_member_files(data, name_filter=lambda n: True))
+    suites, cases, coverage = await ingest_report_members(
+        members, repo_id=uuid4(), run_id="7", org_id="org-1"
+    )
+    assert [suite["suite_name"] for suite in suites] == ["s"]
+    assert len(cases) == 1
+    assert [row["report_format"] for row in coverage] == ["lcov"]
+    assert all(member.closed for _, member in members)
+
+
+class _RecordingSink:
+    def __init__(self) -> None:
+        self.suites: list[Any] = []
+
+    async def insert_test_suite_results(self, rows: list[Any]) -> None:
+        self.suites.extend(rows)
+
+    async def insert_test_case_results(self, rows: list[Any]) -> None:
+        return None
+
+    async def insert_coverage_snapshots(self, rows: list[Any]) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_github_test_runs_are_fetched_after_the_previous_run_is_closed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+    from types import SimpleNamespace
+
+    from dev_health_ops.processors import github as github_processor
+
+    fetched: list[Any] = []
+    events: list[str] = []
+
+    class _Connector:
+        def list_run_artifacts(self, owner, repo, run_id, max_items):
+            return [{"id": run_id}]
+
+        def download_artifact_zip(self, owner, repo, artifact_id):
+            # Every earlier run's spooled files are closed before the next
+            # run is downloaded.
+            assert all(member.closed for _, member in fetched)
+            events.append(f"download {artifact_id}")
+            return _zip(
+                {
+                    f"junit-{artifact_id}.xml": (
+                        f'<testsuite name="s{artifact_id}">'
+                        '<testcase name="a"/></testsuite>'
+                    )
+                }
+            )
+
+    runs = [
+        SimpleNamespace(id=i, run_started_at=None, created_at=None, updated_at=None)
+        for i in (1, 2, 3)
+    ]
+    gh_repo = SimpleNamespace(
+        default_branch="main", get_workflow_runs=lambda **kwargs: runs
+    )
+    sink = _RecordingSink()
+    real_ingest = github_processor.ingest_report_members
+
+    async def _ingest(members, **kwargs):
+        fetched.extend(members)
+        events.append(f"ingest {members[0][0]}")
+        return await real_ingest(members, **kwargs)
+
+    monkeypatch.setattr(github_processor, "ingest_report_members", _ingest)
+    await github_processor._sync_github_test_reports(
+        connector=_Connector(),
+        gh_repo=gh_repo,
+        owner="o",
+        repo_name="r",
+        repo_id=uuid4(),
+        org_id="org-1",
+        ingestion_sink=sink,  # type: ignore[arg-type]
+        loop=asyncio.get_running_loop(),
+        since=None,
+    )
+
+    assert events == [
+        "download 1",
+        "ingest junit-1.xml",
+        "download 2",
+        "ingest junit-2.xml",
+        "download 3",
+        "ingest junit-3.xml",
+    ]
+    assert [row["suite_name"] for row in sink.suites] == ["s1", "s2", "s3"]
+    assert len(fetched) == 3 and all(member.closed for _, member in fetched)
+
+
+@pytest.mark.asyncio
+async def test_gitlab_failed_ingest_closes_every_pipelines_members(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+    from types import SimpleNamespace
+
+    from dev_health_ops.processors import gitlab as gitlab_processor
+
+    coverage_members = [
+        (
+            str(run_id),
+            list(
+                iter_zip_member_files(
+                    _zip({"lcov.info": "TN:\nSF:a.py\nDA:1,1\nend_of_record\n"}),
+                    name_filter=lambda n: True,
+                )
+            ),
+        )
+        for run_id in (1, 2)
+    ]
+
+    async def _failing_ingest(members, **kwargs):
+        raise RuntimeError("sink down")
+
+    monkeypatch.setattr(
+        gitlab_processor,
+        "_fetch_gitlab_test_reports_sync",
+        lambda *args: ([], coverage_members),
+    )
+    monkeypatch.setattr(gitlab_processor, "ingest_report_members", _failing_ingest)
+
+    with pytest.raises(RuntimeError, match="sink down"):
+        await gitlab_processor._sync_gitlab_test_reports(
+            connector=SimpleNamespace(),
+            gl_project=SimpleNamespace(default_branch="main"),
+            project_id=1,
+            token="t",
+            repo_id=uuid4(),
+            org_id="org-1",
+            ingestion_sink=_RecordingSink(),  # type: ignore[arg-type]
+            loop=asyncio.get_running_loop(),
+            since=None,
+        )
+
+    assert all(
+        member.closed for _, members in coverage_members for _, member in members
+    )
+
+
 # --------------------------------------------------------------------------- #
 # `tests` sync-target wiring                                                   #
 # --------------------------------------------------------------------------- #
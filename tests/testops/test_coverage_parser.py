@@ -7,7 +7,10 @@ from uuid import uuid4
 import pytest
 
 from dev_health_ops.parsers.coverage import (
+    iter_cobertura_files,
+    iter_lcov_files,
     parse_cobertura_xml,
+    parse_coverage_report,
     parse_lcov_report,
 )
 from dev_health_ops.processors.testops_coverage import (
@@ -44,6 +47,23 @@ def test_parse_cobertura_xml_extracts_totals() -> None:
     }
 
 
+def test_coverage_files_stream_from_open_binary_files() -> None:
+    with (FIXTURES_DIR / "sample_cobertura.xml").open("rb") as handle:
+        streamed = list(iter_cobertura_files(handle))
+        handle.seek(0)
+        report = parse_coverage_report(handle)
+        assert not handle.closed  # callers keep ownership of their files
+    assert [record.file_path for record in streamed] == [
+        record.file_path for record in report.files
+    ]
+    assert report.lines_total == 8
+
+    with (FIXTURES_DIR / "sample_lcov.info").open("rb") as handle:
+        assert list(iter_lcov_files(handle)) == (
+            parse_lcov_report(FIXTURES_DIR / "sample_lcov.info").files
+        )
+
+
 @pytest.mark.asyncio
 async def test_process_coverage_report_maps_snapshot() -> None:
     repo_id = uuid4()
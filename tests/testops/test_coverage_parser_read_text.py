@@ -1,7 +1,7 @@
 """Regression coverage for CHAOS-3406.
 
-``parsers/coverage.py::_read_text`` accepted either a filesystem path or the
-full report body inline. A realistically-sized inline report (well over
+The coverage parser accepts either a filesystem path or the full report body
+inline. A realistically-sized inline report (well over
 PATH_MAX/NAME_MAX) made the unguarded ``Path(source).exists()`` call raise
 ``OSError(ENAMETOOLONG)`` instead of returning ``False``. That exception
 propagated out of ``process_coverage_report`` and was swallowed by
@@ -10,8 +10,9 @@ propagated out of ``process_coverage_report`` and was swallowed by
 every artifact-sized report -- exactly the failure mode that left
 ``coverage_snapshots`` empty.
 
-``parsers/junit.py::_read_text`` already carries the correct guard
-(added for CHAOS-2412); this file mirrors its
+Both parsers now resolve sources through ``parsers/_source.py``, whose
+``_is_existing_path`` carries the guard added for CHAOS-2412; this file
+mirrors its
 ``tests/testops/test_junit_parser_read_text.py`` companion, sized so the
 regression test cannot pass by accident: a short fixture stays under
 PATH_MAX and would never have triggered the bug in the first place (that
@@ -22,16 +23,15 @@ on macOS) and NAME_MAX (255) on any platform CI runs on.
 
 from __future__ import annotations
 
+import errno
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from dev_health_ops.parsers.coverage import (
-    _read_text,
-    parse_cobertura_xml,
-    parse_coverage_report,
-)
+from dev_health_ops.parsers import _source
+from dev_health_ops.parsers._source import _is_existing_path, open_report_text
+from dev_health_ops.parsers.coverage import parse_cobertura_xml, parse_coverage_report
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -80,13 +80,12 @@ def test_long_cobertura_xml_exceeds_path_max() -> None:
     assert len(long_xml) > 4096
 
 
-def test_read_text_returns_short_xml_string_as_content() -> None:
-    result = _read_text(_MINIMAL_COBERTURA_XML)
-
-    assert result == _MINIMAL_COBERTURA_XML
+def test_open_report_text_returns_short_xml_string_as_content() -> None:
+    with open_report_text(_MINIMAL_COBERTURA_XML) as stream:
+        assert stream.read() == _MINIMAL_COBERTURA_XML
 
 
-def test_read_text_long_xml_string_does_not_raise() -> None:
+def test_open_report_text_long_xml_string_does_not_raise() -> None:
     """The load-bearing regression test for CHAOS-3406.
 
     Before the fix, this raised ``OSError(ENAMETOOLONG)`` instead of
@@ -96,28 +95,38 @@ def test_read_text_long_xml_string_does_not_raise() -> None:
     """
     long_xml = _make_long_cobertura_xml()
 
-    result = _read_text(long_xml)
+    assert not _is_existing_path(long_xml)
+    with open_report_text(long_xml) as stream:
+        assert stream.read() == long_xml
 
-    assert result == long_xml
 
+def test_is_existing_path_preserves_other_os_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail_exists(self: Path) -> bool:
+        raise OSError(errno.EACCES, "permission denied")
+
+    monkeypatch.setattr(Path, "exists", fail_exists)
 
-def test_read_text_preserves_existing_path_read_errors(
+    with pytest.raises(PermissionError):
+        _is_existing_path("coverage.xml")
+
+
+def test_open_report_text_preserves_existing_path_read_errors(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     path = tmp_path / "coverage.xml"
     path.write_text(_MINIMAL_COBERTURA_XML, encoding="utf-8")
 
-    original_read_text = Path.read_text
-
-    def fail_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
-        if self == path:
-            raise PermissionError("cannot read report")
-        return original_read_text(self, *args, **kwargs)
+    def fail_open(file: Any, *args: Any, **kwargs: Any) -> Any:
+        raise PermissionError("cannot read report")
 
-    monkeypatch.setattr(Path, "read_text", fail_read_text)
+    monkeypatch.setattr(_source, "open", fail_open, raising=False)
 
+    assert _is_existing_path(str(path))
     with pytest.raises(PermissionError, match="cannot read report"):
-        _read_text(str(path))
+        with open_report_text(str(path)):
+            pass
 
 
 def test_parse_cobertura_xml_accepts_long_xml_content_string() -> None:
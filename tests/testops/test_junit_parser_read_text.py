@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import errno
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from dev_health_ops.parsers.junit import _read_text, parse_junit_xml
+from dev_health_ops.parsers import _source
+from dev_health_ops.parsers._source import _is_existing_path, open_report_text
+from dev_health_ops.parsers.junit import parse_junit_xml
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -32,36 +35,54 @@ def _make_long_junit_xml(extra_chars: int = 300) -> str:
 """
 
 
-def test_read_text_returns_short_xml_string_as_content() -> None:
-    result = _read_text(_MINIMAL_JUNIT_XML)
+def test_open_report_text_returns_short_xml_string_as_content() -> None:
+    with open_report_text(_MINIMAL_JUNIT_XML) as stream:
+        assert stream.read() == _MINIMAL_JUNIT_XML
 
-    assert result == _MINIMAL_JUNIT_XML
 
-
-def test_read_text_long_xml_string_does_not_raise() -> None:
+def test_open_report_text_long_xml_string_does_not_raise() -> None:
     long_xml = _make_long_junit_xml(extra_chars=500)
-    result = _read_text(long_xml)
 
-    assert result == long_xml
+    assert not _is_existing_path(long_xml)
+    with open_report_text(long_xml) as stream:
+        assert stream.read() == long_xml
+
+
+def test_is_existing_path_finds_report_file(tmp_path: Path) -> None:
+    path = tmp_path / "report.xml"
+    path.write_text(_MINIMAL_JUNIT_XML, encoding="utf-8")
+
+    assert _is_existing_path(str(path))
+    with open_report_text(str(path)) as stream:
+        assert stream.read() == _MINIMAL_JUNIT_XML
 
 
-def test_read_text_preserves_existing_path_read_errors(
+def test_is_existing_path_preserves_other_os_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail_exists(self: Path) -> bool:
+        raise OSError(errno.EACCES, "permission denied")
+
+    monkeypatch.setattr(Path, "exists", fail_exists)
+
+    with pytest.raises(PermissionError):
+        _is_existing_path("report.xml")
+
+
+def test_open_report_text_preserves_existing_path_read_errors(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     path = tmp_path / "report.xml"
     path.write_text(_MINIMAL_JUNIT_XML, encoding="utf-8")
 
-    original_read_text = Path.read_text
-
-    def fail_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
-        if self == path:
-            raise PermissionError("cannot read report")
-        return original_read_text(self, *args, **kwargs)
+    def fail_open(file: Any, *args: Any, **kwargs: Any) -> Any:
+        raise PermissionError("cannot read report")
 
-    monkeypatch.setattr(Path, "read_text", fail_read_text)
+    monkeypatch.setattr(_source, "open", fail_open, raising=False)
 
     with pytest.raises(PermissionError, match="cannot read report"):
-        _read_text(str(path))
+        with open_report_text(str(path)):
+            pass
 
 
 def test_parse_junit_xml_accepts_long_xml_content_string() -> None:
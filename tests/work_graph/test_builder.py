@@ -10,6 +10,13 @@ from dev_health_ops.work_graph.builder import (
     BuildConfig,
     WorkGraphBuilder,
 )
+from dev_health_ops.work_graph.ids import generate_pr_id
+from dev_health_ops.work_graph.models import (
+    EdgeType,
+    NodeType,
+    Provenance,
+    WorkGraphEdge,
+)
 
 
 @pytest.fixture
@@ -362,6 +369,14 @@ class TestDependencyIssuePrLinks:
         fake_sink.query_dicts.side_effect = [
             [],
             [{"edge_id": "stale-blocker-edge"}],
+            [
+                {
+                    "source_type": "issue",
+                    "source_id": "jira:A-1",
+                    "target_type": "issue",
+                    "target_id": "jira:A-2",
+                }
+            ],
         ]
         config = BuildConfig(dsn="clickhouse://localhost:9000/default", org_id="org-a")
 
@@ -373,6 +388,13 @@ class TestDependencyIssuePrLinks:
             builder.close()
 
         fake_sink.write_work_graph_edges.assert_not_called()
+        # The removed edge's endpoints are recorded for the component index.
+        [removal] = fake_sink.write_work_graph_edge_removals.call_args.args[0]
+        assert (removal.source_id, removal.target_id, removal.org_id) == (
+            "jira:A-1",
+            "jira:A-2",
+            "org-a",
+        )
         marker_delete, delete = fake_sink.client.command.call_args_list
         assert "work_graph_projection_runs" in marker_delete.args[0]
         assert delete.kwargs["parameters"] == {
@@ -1314,6 +1336,335 @@ class TestFastPathTenantIsolation:
         assert edge_records[0].org_id == "org-a"
 
 
+class TestIncrementalBuild:
+    """Watermark-driven incremental parsing of commits, PRs and work items."""
+
+    ORG = "org-a"
+
+    def _run(
+        self, *, watermarks, work_items, prs, commits, index, rescans=None, **config
+    ):
+        fake_sink = MagicMock()
+        fake_sink.backend_type = "clickhouse"
+        queries: list[tuple[str, dict]] = []
+
+        def mock_query(query, params):
+            queries.append((query, params))
+            if "work_graph_projection_runs" in query:
+                return watermarks
+            if "work_graph_issue_key_index" in query:
+                return [r for r in index if r["issue_key"] in params["issue_keys"]]
+            if "multiSearchAny" in query:
+                return (rescans or {}).get(tuple(params["needles"]), [])
+            if "number IN {numbers" in query:
+                return [
+                    {"org_id": self.ORG, "repo_id": r["repo_id"], "number": r["number"]}
+                    for r in prs
+                    if r["number"] in params["numbers"]
+                ]
+            if "FROM work_items\n" in query:
+                return work_items
+            if "FROM git_pull_requests\n" in query:
+                return prs
+            if "FROM git_commits\n" in query:
+                return commits
+            return []
+
+        fake_sink.query_dicts.side_effect = mock_query
+        config = BuildConfig(
+            dsn="clickhouse://localhost:9000/default",
+            org_id=self.ORG,
+            incremental=True,
+            **config,
+        )
+        with patch(
+            "dev_health_ops.work_graph.builder.create_sink", return_value=fake_sink
+        ):
+            builder = WorkGraphBuilder(config)
+            result = builder._build_text_links_incremental()
+            builder._publish_watermarks()
+            builder.close()
+        return result, fake_sink, queries
+
+    def test_requires_org_scope(self):
+        with pytest.raises(ValueError, match="org_id"):
+            WorkGraphBuilder(
+                BuildConfig(dsn="clickhouse://localhost:9000/default", incremental=True)
+            )
+
+    def test_first_run_parses_delta_and_publishes_watermarks(self):
+        repo_id = uuid.uuid4()
+        synced = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        work_items = [
+            {
+                "repo_id": repo_id,
+                "work_item_id": "jira:ABC-1",
+                "provider": "jira",
+                "last_synced": synced,
+            }
+        ]
+        prs = [
+            {
+                "repo_id": repo_id,
+                "number": 3,
+                "title": "ABC-1 add retries",
+                "body": "",
+                "head_branch": "",
+                "created_at": synced,
+                "last_synced": synced + timedelta(minutes=1),
+            }
+        ]
+        commits = [
+            {
+                "org_id": self.ORG,
+                "repo_id": repo_id,
+                "hash": "abc123",
+                "message": "Merge pull request #3 from team/ABC-1",
+                "author_when": synced,
+                "last_synced": synced + timedelta(minutes=2),
+            }
+        ]
+        (explicit, issue_pr, issue_commit), sink, queries = self._run(
+            watermarks=[], work_items=work_items, prs=prs, commits=commits, index=[]
+        )
+
+        assert explicit == {("jira:ABC-1", 3)}
+        assert (issue_pr, issue_commit) == (1, 1)
+        keys = sink.write_work_graph_issue_keys.call_args[0][0]
+        assert sorted((k.provider, k.issue_key, k.work_item_id) for k in keys) == [
+            ("jira", "ABC-1", "jira:ABC-1"),
+            ("pr", "3", ""),
+        ]
+        assert {k.org_id for k in keys} == {self.ORG}
+        links = sink.write_work_graph_pr_commit.call_args[0][0]
+        assert [(lnk.pr_number, lnk.commit_hash) for lnk in links] == [(3, "abc123")]
+        # No watermark yet: nothing is bounded by last_synced or re-scanned,
+        # and no lookup reads work_items FINAL.
+        assert not any("last_synced >" in q for q, _ in queries)
+        assert not any("multiSearchAny" in q for q, _ in queries)
+        assert not any("work_items FINAL" in q for q, _ in queries)
+
+        runs = sink.write_work_graph_projection_runs.call_args[0][0]
+        assert {r.projection_name: r.input_watermark for r in runs} == {
+            "incremental:work_items": synced,
+            "incremental:git_pull_requests": synced + timedelta(minutes=1),
+            "incremental:git_commits": synced + timedelta(minutes=2),
+        }
+        assert all(r.rule_version == "incremental.v1" for r in runs)
+
+    def test_new_issue_rescans_older_text_that_referenced_it(self):
+        repo_id = uuid.uuid4()
+        watermark = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        watermarks = [
+            {"projection_name": f"incremental:{source}", "watermark": watermark}
+            for source in ("work_items", "git_pull_requests", "git_commits")
+        ]
+        new_issue = {
+            "repo_id": repo_id,
+            "work_item_id": "gh:org/repo#5",
+            "provider": "github",
+            "last_synced": watermark + timedelta(hours=1),
+        }
+        old_pr = {
+            "repo_id": repo_id,
+            "number": 9,
+            "title": "Retry flaky uploads",
+            "body": "fixes #5",
+            "head_branch": "",
+            "created_at": watermark - timedelta(days=3),
+            "last_synced": watermark - timedelta(days=3),
+        }
+
+        (explicit, issue_pr, _), sink, queries = self._run(
+            watermarks=watermarks,
+            work_items=[new_issue],
+            prs=[],
+            commits=[],
+            index=[],
+            rescans={("#5",): [old_pr]},
+        )
+
+        assert explicit == {("gh:org/repo#5", 9)}
+        assert issue_pr == 1
+        bounded = [p for q, p in queries if "last_synced >" in q]
+        assert len(bounded) == 3
+        assert all(p["since"] == watermark - timedelta(minutes=15) for p in bounded)
+        runs = sink.write_work_graph_projection_runs.call_args[0][0]
+        # Only the source that saw new rows advances.
+        assert [(r.projection_name, r.input_watermark) for r in runs] == [
+            ("incremental:work_items", watermark + timedelta(hours=1))
+        ]
+
+    def test_updates_of_indexed_issues_and_prs_do_not_rescan(self):
+        repo_id = uuid.uuid4()
+        watermark = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        watermarks = [
+            {"projection_name": f"incremental:{source}", "watermark": watermark}
+            for source in ("work_items", "git_pull_requests", "git_commits")
+        ]
+        updated_issue = {
+            "repo_id": repo_id,
+            "work_item_id": "jira:ABC-1",
+            "provider": "jira",
+            "last_synced": watermark + timedelta(hours=1),
+        }
+        updated_pr = {
+            "repo_id": repo_id,
+            "number": 3,
+            "title": "ABC-1 add retries",
+            "body": "",
+            "head_branch": "",
+            "created_at": watermark - timedelta(days=30),
+            "last_synced": watermark + timedelta(hours=1),
+        }
+        index = [
+            {
+                "provider": "jira",
+                "repo_id": "",
+                "issue_key": "ABC-1",
+                "work_item_id": "jira:ABC-1",
+            },
+            {
+                "provider": "pr",
+                "repo_id": str(repo_id),
+                "issue_key": "3",
+                "work_item_id": "",
+            },
+        ]
+
+        (explicit, issue_pr, _), sink, queries = self._run(
+            watermarks=watermarks,
+            work_items=[updated_issue],
+            prs=[updated_pr],
+            commits=[],
+            index=index,
+        )
+
+        # The updated PR still re-links through its own delta row.
+        assert explicit == {("jira:ABC-1", 3)}
+        assert issue_pr == 1
+        assert not any("multiSearchAny" in q for q, _ in queries)
+        sink.write_work_graph_issue_keys.assert_not_called()
+
+    def test_date_window_does_not_bound_the_delta(self):
+        watermark = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        watermarks = [
+            {"projection_name": f"incremental:{source}", "watermark": watermark}
+            for source in ("work_items", "git_pull_requests", "git_commits")
+        ]
+
+        _, _, queries = self._run(
+            watermarks=watermarks,
+            work_items=[],
+            prs=[],
+            commits=[],
+            index=[],
+            from_date=watermark - timedelta(days=1),
+            to_date=watermark,
+        )
+
+        # A windowed read would let the watermark pass rows outside the
+        # window, which later runs would then never parse.
+        delta = [q for q, _ in queries if "last_synced >" in q]
+        assert len(delta) == 3
+        assert not any("created_at >=" in q or "author_when >=" in q for q in delta)
+
+    def _builder(self, mock_query, **config):
+        fake_sink = MagicMock()
+        fake_sink.backend_type = "clickhouse"
+        fake_sink.query_dicts.side_effect = mock_query
+        with patch(
+            "dev_health_ops.work_graph.builder.create_sink", return_value=fake_sink
+        ):
+            builder = WorkGraphBuilder(
+                BuildConfig(
+                    dsn="clickhouse://localhost:9000/default",
+                    org_id=self.ORG,
+                    incremental=True,
+                    **config,
+                )
+            )
+        return builder, fake_sink
+
+    def test_fast_path_reads_links_changed_on_either_side(self):
+        repo_id = uuid.uuid4()
+        watermark = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        queries: list[tuple[str, dict]] = []
+        link = {
+            "repo_id": repo_id,
+            "work_item_id": "jira:ABC-1",
+            "pr_number": 3,
+            "confidence": 1.0,
+            "provenance": "explicit_text",
+            "evidence": "ABC-1",
+            "last_synced": watermark + timedelta(hours=1),
+            "created_at": watermark - timedelta(days=60),
+        }
+
+        def mock_query(query, params):
+            queries.append((query, params))
+            if "work_graph_projection_runs" in query:
+                return [
+                    {"projection_name": f"incremental:{source}", "watermark": watermark}
+                    for source in ("git_pull_requests", "work_graph_issue_pr")
+                ]
+            if "FROM work_graph_issue_pr" in query:
+                return [link]
+            return []
+
+        builder, sink = self._builder(
+            mock_query, from_date=watermark - timedelta(days=1), to_date=watermark
+        )
+        links, count = builder._build_issue_pr_edges_from_fast_path()
+        builder._publish_watermarks()
+
+        assert (links, count) == ({("jira:ABC-1", 3)}, 1)
+        query, params = next(q for q in queries if "work_graph_issue_pr" in q[0])
+        assert "p.last_synced > {link_since" in query
+        assert "pr.last_synced > {joined_since" in query
+        assert "pr.created_at >=" not in query
+        since = watermark - timedelta(minutes=15)
+        assert params == {"link_since": since, "joined_since": since}
+        runs = sink.write_work_graph_projection_runs.call_args[0][0]
+        assert [(r.projection_name, r.input_watermark) for r in runs] == [
+            ("incremental:work_graph_issue_pr", watermark + timedelta(hours=1))
+        ]
+
+    def test_heuristic_matches_only_around_changed_rows(self):
+        repo_id = uuid.uuid4()
+        updated = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        queries: list[tuple[str, dict]] = []
+
+        def mock_query(query, params):
+            queries.append((query, params))
+            if "FROM git_pull_requests" in query:
+                return [{"repo_id": repo_id, "number": 7, "created_at": updated}]
+            if "FROM work_graph_issue_pr" in query:
+                return [{"work_item_id": "jira:ABC-2", "pr_number": 8}]
+            return []
+
+        builder, sink = self._builder(mock_query)
+        builder._changed_work_items = [
+            {"repo_id": repo_id, "work_item_id": "jira:ABC-1", "updated_at": updated},
+            {"repo_id": repo_id, "work_item_id": "jira:ABC-2", "updated_at": updated},
+            {"repo_id": None, "work_item_id": "jira:ABC-3", "updated_at": updated},
+        ]
+        builder._changed_prs = []
+
+        assert builder._build_heuristic_issue_pr_edges(set()) == 1
+
+        edges = sink.write_work_graph_edges.call_args[0][0]
+        # ABC-2 is already linked explicitly by an earlier build.
+        assert [(e.source_id, e.target_id) for e in edges] == [
+            (str(generate_pr_id(repo_id, 7)), "jira:ABC-1")
+        ]
+        pr_query, pr_params = next(q for q in queries if "git_pull_requests" in q[0])
+        assert pr_params["near_repo_id"] == str(repo_id)
+        assert pr_params["near_from"] == updated - timedelta(days=7)
+        assert pr_params["near_to"] == updated + timedelta(days=7)
+        assert not any("work_items FINAL" in q for q, _ in queries)
+
+
 class TestWorkGraphBuilderIntegration:
     """Integration tests for WorkGraphBuilder.
 
@@ -1460,3 +1811,68 @@ class TestFlagGuardsEdges:
         count, sink = self._run(flag_rows, wi_rows)
         assert count == 0
         sink.write_work_graph_edges.assert_not_called()
+
+
+class TestChangedEdgeWrites:
+    """Rebuilt edges are only rewritten (and re-stamped) when their content moved."""
+
+    def _edge(self, target_id: str, confidence: float):
+        return WorkGraphEdge(
+            edge_id=f"edge-{target_id}",
+            source_type=NodeType.PR,
+            source_id="pr:1",
+            target_type=NodeType.COMMIT,
+            target_id=target_id,
+            edge_type=EdgeType.IMPLEMENTS,
+            provenance=Provenance.EXPLICIT_TEXT,
+            confidence=confidence,
+            evidence="#1",
+            event_ts=datetime(2026, 3, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        )
+
+    def test_unchanged_edges_keep_their_stored_row(self):
+        fake_sink = MagicMock()
+        fake_sink.backend_type = "clickhouse"
+        stored_event_ts = datetime(2026, 3, 1, 12, 0, 0, 123000)
+
+        def stored(target_id: str, confidence: float) -> dict:
+            return {
+                "source_type": "pr",
+                "source_id": "pr:1",
+                "edge_type": "implements",
+                "target_type": "commit",
+                "target_id": target_id,
+                "repo_id": "",
+                "provider": "",
+                "provenance": "explicit_text",
+                "confidence": confidence,
+                "evidence": "#1",
+                "event_ts": stored_event_ts,
+            }
+
+        fake_sink.query_dicts.return_value = [
+            stored("commit:same", 0.9),
+            stored("commit:moved", 0.5),
+        ]
+        config = BuildConfig(dsn="clickhouse://localhost:9000/default", org_id="org-a")
+
+        with patch(
+            "dev_health_ops.work_graph.builder.create_sink", return_value=fake_sink
+        ):
+            builder = WorkGraphBuilder(config)
+            written = builder._write_edges(
+                [
+                    self._edge("commit:same", 0.9),
+                    self._edge("commit:moved", 0.9),
+                    self._edge("commit:new", 0.9),
+                ]
+            )
+            builder.close()
+
+        assert written == 3
+        records = fake_sink.write_work_graph_edges.call_args.args[0]
+        assert [r.target_id for r in records] == ["commit:moved", "commit:new"]
+        query, params = fake_sink.query_dicts.call_args.args
+        assert "argMax(confidence, last_synced)" in query
+        assert params["org_id"] == "org-a"
+        assert len(params["edge_keys"]) == 3
@@ -0,0 +1,334 @@
+"""Incremental maintenance of the persisted investment component index."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dev_health_ops.work_graph.investment.backfill import (
+    MembershipBackfillConfig,
+    backfill_memberships,
+)
+from dev_health_ops.work_graph.investment.component_index import (
+    load_indexed_components,
+    update_component_index,
+)
+from dev_health_ops.work_graph.investment.components import build_components
+from dev_health_ops.work_graph.investment.utils import work_unit_id
+
+ORG = "org-1"
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _identity(edge: dict[str, Any]) -> tuple[str, ...]:
+    return tuple(
+        str(edge[key])
+        for key in ("source_type", "source_id", "edge_type", "target_type", "target_id")
+    )
+
+
+class _GraphSink:
+    """In-memory stand-in for the tables the component index reads and writes."""
+
+    backend_type = "clickhouse"
+
+    def __init__(self) -> None:
+        self.edges: dict[tuple[str, ...], dict[str, Any]] = {}
+        self.removals: list[dict[str, Any]] = []
+        self.index: dict[tuple[str, str], tuple[str, str]] = {}
+        self.runs: list[Any] = []
+        self.investments: list[dict[str, Any]] = []
+        self.membership_runs: list[dict[str, Any]] = []
+        self.memberships: list[Any] = []
+        self.copies: list[dict[str, Any]] = []
+        self.clock = T0
+
+    def link(
+        self, source: str, target: str, *, provenance: str = "native", conf=1.0
+    ) -> None:
+        self.clock += timedelta(hours=1)
+        edge = {
+            "org_id": ORG,
+            "edge_id": f"{source}->{target}",
+            "source_type": source.split(":")[0],
+            "source_id": source.split(":", 1)[1],
+            "edge_type": "references",
+            "target_type": target.split(":")[0],
+            "target_id": target.split(":", 1)[1],
+            "provenance": provenance,
+            "confidence": conf,
+            "last_synced": self.clock,
+        }
+        self.edges[_identity(edge)] = edge
+
+    def unlink(self, source: str, target: str) -> None:
+        """Delete an edge the way the builder does: record it, then drop it."""
+        self.clock += timedelta(hours=1)
+        edge = self.edges.pop(
+            (*source.split(":", 1), "references", *target.split(":", 1))
+        )
+        self.removals.append({**edge, "removed_at": self.clock})
+
+    def current_edges(self) -> list[dict[str, Any]]:
+        return [
+            edge
+            for _key, edge in sorted(self.edges.items())
+            if edge["provenance"] != "heuristic"
+        ]
+
+    def query_dicts(self, query: str, params: dict[str, Any]) -> list[dict]:
+        if "FROM work_graph_projection_runs" in query:
+            marks = [
+                r.input_watermark
+                for r in self.runs
+                if r.projection_name == params["projection_name"]
+                and r.rule_version == params["rule_version"]
+            ]
+            return [{"watermark": max(marks)}] if marks else []
+        if "max(last_synced)" in query:
+            stamps = [e["last_synced"] for e in self.edges.values()]
+            return [{"watermark": max(stamps)}] if stamps else []
+        if "max(removed_at)" in query:
+            stamps = [r["removed_at"] for r in self.removals]
+            return [{"watermark": max(stamps)}] if stamps else []
+        if "FROM work_graph_edge_removals" in query:
+            return [r for r in self.removals if r["removed_at"] > params["since"]]
+        if "SELECT DISTINCT source_type" in query:
+            return [
+                e for e in self.edges.values() if e["last_synced"] > params["since"]
+            ]
+        if "FROM work_graph_edges" in query:
+            edges = self.current_edges()
+            tokens = params.get("node_tokens")
+            if tokens is not None:
+                edges = [
+                    e
+                    for e in edges
+                    if f"{e['source_type']}:{e['source_id']}" in tokens
+                    or f"{e['target_type']}:{e['target_id']}" in tokens
+                ]
+            return edges
+        if "FROM work_unit_component_index" in query:
+            rows = [
+                {
+                    "node_type": node[0],
+                    "node_id": node[1],
+                    "component_key": key,
+                    "work_unit_id": unit,
+                }
+                for node, (key, unit) in self.index.items()
+            ]
+            if "concat(node_type" in query:
+                wanted = set(params["values"])
+                return [r for r in rows if f"{r['node_type']}:{r['node_id']}" in wanted]
+            if "component_key IN" in query:
+                return [r for r in rows if r["component_key"] in params["values"]]
+            if "work_unit_id IN" in query:
+                return [r for r in rows if r["work_unit_id"] in params["values"]]
+            return [r for r in rows if r["component_key"]]
+        if "FROM work_unit_membership_runs" in query:
+            runs = sorted(self.membership_runs, key=lambda r: r["completed_at"])
+            return runs[-1:]
+        if "DISTINCT work_unit_id" in query:
+            return [r for r in self.investments if r["computed_at"] > params["since"]]
+        if "FROM work_unit_investments" in query:
+            wanted = set(params["work_unit_ids"])
+            return [r for r in self.investments if r["work_unit_id"] in wanted]
+        raise AssertionError(query)
+
+    def write_work_unit_component_index(self, rows) -> None:
+        for row in rows:
+            self.index[(row.node_type, row.node_id)] = (
+                row.component_key,
+                row.work_unit_id,
+            )
+
+    def write_work_graph_projection_runs(self, rows) -> None:
+        self.runs.extend(rows)
+
+    def write_work_unit_memberships(self, rows) -> None:
+        self.memberships.extend(rows)
+
+    def copy_work_unit_memberships(self, org_id: str, **kwargs: Any) -> None:
+        self.copies.append({"org_id": org_id, **kwargs})
+
+    def write_membership_run(self, record) -> None:
+        self.membership_runs.append(
+            {"run_id": record.run_id, "completed_at": record.completed_at}
+        )
+
+    def prune_membership_runs(self, org_id: str, *, keep: int = 2) -> int:
+        return 0
+
+    def ensure_schema(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _indexed_units(sink: _GraphSink) -> set[str]:
+    return {unit for _key, unit in sink.index.values() if unit}
+
+
+def _rebuilt_units(sink: _GraphSink, cap: int) -> set[str]:
+    return {
+        work_unit_id(list(dict.fromkeys(nodes)))
+        for nodes, _edges in build_components(
+            sink.current_edges(), max_component_nodes=cap
+        )
+    }
+
+
+def test_incremental_update_touches_only_changed_components() -> None:
+    sink = _GraphSink()
+    sink.link("issue:C", "pr:3")
+    sink.link("issue:A", "pr:1")
+    sink.link("issue:B", "pr:2")
+
+    first = update_component_index(sink, org_id=ORG, max_component_nodes=50)
+    assert first.mode == "full"
+    assert len(first.components) == 3
+    assert _indexed_units(sink) == _rebuilt_units(sink, 50)
+
+    old_a = work_unit_id([("issue", "A"), ("pr", "1")])
+    old_b = work_unit_id([("issue", "B"), ("pr", "2")])
+    sink.link("pr:1", "issue:B")
+
+    second = update_component_index(
+        sink, org_id=ORG, max_component_nodes=50, verify=True
+    )
+    merged = work_unit_id([("issue", "A"), ("pr", "1"), ("issue", "B"), ("pr", "2")])
+    assert second.mode == "incremental"
+    assert second.verify_mismatches == 0
+    assert [work_unit_id(nodes) for nodes, _edges in second.components] == [merged]
+    assert second.added_unit_ids == {merged}
+    assert second.removed_unit_ids == {old_a, old_b}
+    assert _indexed_units(sink) == _rebuilt_units(sink, 50)
+    # Nothing synced since: the lookback re-reads the newest edge's component
+    # but no unit changes and nothing is rewritten.
+    third = update_component_index(sink, org_id=ORG, max_component_nodes=50)
+    assert (third.added_unit_ids, third.removed_unit_ids) == (set(), set())
+    assert third.index_rows == 0
+
+
+def test_oversized_split_matches_full_rebuild() -> None:
+    sink = _GraphSink()
+    sink.link("issue:A", "pr:1", conf=1.0)
+    sink.link("pr:1", "commit:a", conf=1.0)
+    update_component_index(sink, org_id=ORG, max_component_nodes=3)
+
+    sink.link("commit:a", "issue:B", conf=0.5)
+    sink.link("issue:B", "pr:2", conf=1.0)
+    update = update_component_index(
+        sink, org_id=ORG, max_component_nodes=3, verify=True
+    )
+
+    assert update.stats.oversized_components == 1
+    assert update.verify_mismatches == 0
+    assert _indexed_units(sink) == _rebuilt_units(sink, 3)
+    assert len(_indexed_units(sink)) == 2
+    components = load_indexed_components(
+        sink,
+        org_id=ORG,
+        work_unit_ids=sorted(_indexed_units(sink)),
+        max_component_nodes=3,
+    )
+    assert {work_unit_id(nodes) for nodes, _edges in components} == _indexed_units(sink)
+
+
+def test_demoted_edge_tombstones_isolated_node() -> None:
+    sink = _GraphSink()
+    sink.link("issue:A", "pr:1")
+    sink.link("pr:1", "commit:a")
+    update_component_index(sink, org_id=ORG, max_component_nodes=50)
+
+    sink.link("pr:1", "commit:a", provenance="heuristic")
+    update = update_component_index(sink, org_id=ORG, max_component_nodes=50)
+
+    assert sink.index[("commit", "a")] == ("", "")
+    assert update.added_unit_ids == {work_unit_id([("issue", "A"), ("pr", "1")])}
+    assert _indexed_units(sink) == _rebuilt_units(sink, 50)
+
+
+def test_recorded_edge_removal_splits_its_component() -> None:
+    sink = _GraphSink()
+    sink.link("issue:Z", "pr:9")
+    sink.link("issue:A", "pr:1")
+    sink.link("pr:1", "commit:a")
+    update_component_index(sink, org_id=ORG, max_component_nodes=50)
+
+    sink.unlink("pr:1", "commit:a")
+    update = update_component_index(
+        sink, org_id=ORG, max_component_nodes=50, verify=True
+    )
+
+    assert update.verify_mismatches == 0
+    assert sink.index[("commit", "a")] == ("", "")
+    assert update.added_unit_ids == {work_unit_id([("issue", "A"), ("pr", "1")])}
+    # The untouched component is not part of the dirty region.
+    assert update.touched_nodes == 2
+    assert _indexed_units(sink) == _rebuilt_units(sink, 50)
+
+
+def test_verify_repairs_hard_deleted_edges() -> None:
+    sink = _GraphSink()
+    sink.link("issue:A", "pr:1")
+    sink.link("pr:1", "commit:a")
+    update_component_index(sink, org_id=ORG, max_component_nodes=50)
+
+    # A delete whose removal record is gone (expired) leaves no trace for
+    # the delta scan.
+    del sink.edges[("pr", "1", "references", "commit", "a")]
+    sink.link("issue:Z", "pr:9")
+    update = update_component_index(
+        sink, org_id=ORG, max_component_nodes=50, verify=True
+    )
+
+    assert update.verify_mismatches == 3
+    assert _indexed_units(sink) == _rebuilt_units(sink, 50)
+    assert work_unit_id([("issue", "A"), ("pr", "1")]) in update.added_unit_ids
+
+
+def test_incremental_requires_org() -> None:
+    with pytest.raises(ValueError):
+        update_component_index(_GraphSink(), org_id="")
+
+
+def test_incremental_backfill_projects_dirty_units_and_carries_the_rest() -> None:
+    sink = _GraphSink()
+    sink.link("issue:A", "pr:1")
+    sink.link("issue:B", "pr:2")
+    update_component_index(sink, org_id=ORG)
+    unit_a = work_unit_id([("issue", "A"), ("pr", "1")])
+    unit_b = work_unit_id([("issue", "B"), ("pr", "2")])
+    sink.membership_runs.append({"run_id": "prev", "completed_at": sink.clock})
+    distribution = {
+        "theme_distribution_json": {"feature_delivery": 1.0},
+        "subcategory_distribution_json": {"feature_delivery.roadmap": 1.0},
+        "categorization_status": "ok",
+    }
+    sink.investments = [
+        {"work_unit_id": unit_a, "computed_at": sink.clock - timedelta(days=2)},
+        {"work_unit_id": unit_b, "computed_at": sink.clock + timedelta(minutes=5)},
+    ]
+    for row in sink.investments:
+        row.update(distribution)
+
+    with patch(
+        "dev_health_ops.work_graph.investment.backfill.create_sink",
+        return_value=sink,
+    ):
+        stats = backfill_memberships(
+            MembershipBackfillConfig(dsn="clickhouse://x", org_id=ORG, incremental=True)
+        )
+
+    assert stats["matched"] == 1
+    assert {row.work_unit_id for row in sink.memberships} == {unit_b}
+    [copy] = sink.copies
+    assert copy["from_run_id"] == "prev"
+    assert copy["exclude_work_unit_ids"] == [unit_b]
+    assert copy["to_run_id"] == sink.membership_runs[-1]["run_id"]